@@ -1,3 +1,6 @@
 export const headTypes = [{"name":"Gaunt","graphicPath":"Things/Pawn/Humanlike/Heads/Genes/None_Gaunt_Average","gender":"None","randomChosen":"false","hairMeshSize":[1.5,1.5],"beardMeshSize":[1.5,1.5]},{"name":"Male_HeavyJawNormal","graphicPath":"Things/Pawn/Humanlike/Heads/Male/Male_HeavyJaw_Normal","gender":"Male","randomChosen":"false","hairMeshSize":[1.5,1.5],"beardMeshSize":[1.7,1.5]},{"name":"Female_HeavyJawNormal","graphicPath":"Things/Pawn/Humanlike/Heads/Female/Female_HeavyJaw_Normal","gender":"Female","randomChosen":"false","hairMeshSize":[1.5,1.5],"beardMeshSize":[1.7,1.5]},{"name":"Furskin_Average1","graphicPath":"Things/Pawn/Humanlike/Heads/FurCovered_Average1_Normal","gender":"None","randomChosen":"false"},{"name":"Furskin_Average2","graphicPath":"Things/Pawn/Humanlike/Heads/FurCovered_Average2_Normal","gender":"None","randomChosen":"false"},{"name":"Furskin_Average3","graphicPath":"Things/Pawn/Humanlike/Heads/FurCovered_Average3_Normal","gender":"None","randomChosen":"false"},{"name":"Furskin_Gaunt","graphicPath":"Things/Pawn/Humanlike/Heads/FurCovered_Gaunt_Normal","gender":"None","randomChosen":"false","hairMeshSize":[1.5,1.5],"beardMeshSize":[1.5,1.5]},{"name":"Furskin_Narrow1","graphicPath":"Things/Pawn/Humanlike/Heads/FurCovered_Narrow1_Normal","gender":"None","randomChosen":"false"},{"name":"Furskin_Narrow2","graphicPath":"Things/Pawn/Humanlike/Heads/FurCovered_Narrow2_Normal","gender":"None","randomChosen":"false"},{"name":"Furskin_Narrow3","graphicPath":"Things/Pawn/Humanlike/Heads/FurCovered_Narrow3_Normal","gender":"None","randomChosen":"false"},{"name":"Furskin_Heavy1","graphicPath":"Things/Pawn/Humanlike/Heads/FurCovered_Wide1_Normal","gender":"None","randomChosen":"false"},{"name":"Furskin_Heavy2","graphicPath":"Things/Pawn/Humanlike/Heads/FurCovered_Wide2_Normal","gender":"None","randomChosen":"false"},{"name":"Furskin_Heavy3","graphicPath":"Things/Pawn/Humanlike/Heads/FurCovered_Wide3_Normal","gender":"None","randomChosen":"false"},{"name":"Skull","graphicPath":"Things/Pawn/Humanlike/Heads/None_Average_Skull","gender":"None","randomChosen":"false","hairMeshSize":[1.5,1.5],"beardMeshSize":[1.5,1.5]},{"name":"Stump","graphicPath":"Things/Pawn/Humanlike/Heads/None_Average_Stump","gender":"None","randomChosen":"false","hairMeshSize":[1.5,1.5],"beardMeshSize":[1.5,1.5]},{"name":"Male_AverageNormal","graphicPath":"Things/Pawn/Humanlike/Heads/Male/Male_Average_Normal","gender":"Male","hairMeshSize":[1.5,1.5],"beardMeshSize":[1.5,1.5]},{"name":"Male_AveragePointy","graphicPath":"Things/Pawn/Humanlike/Heads/Male/Male_Average_Pointy","gender":"Male","hairMeshSize":[1.5,1.5],"beardMeshSize":[1.5,1.5],"eyeOffsetEastWest":[0.175,0.0,0.18]},{"name":"Male_AverageWide","graphicPath":"Things/Pawn/Humanlike/Heads/Male/Male_Average_Wide","gender":"Male","hairMeshSize":[1.5,1.5],"beardMeshSize":[1.5,1.5]},{"name":"Male_NarrowNormal","graphicPath":"Things/Pawn/Humanlike/Heads/Male/Male_Narrow_Normal","gender":"Male","hairMeshSize":[1.3,1.5],"beardMeshSize":[1.5,1.5],"beardOffset":[0.0,0.0,-0.05],"beardOffsetXEast":-0.05,"eyeOffsetEastWest":[0.1,0.0,0.18],"narrow":"true"},{"name":"Male_NarrowPointy","graphicPath":"Things/Pawn/Humanlike/Heads/Male/Male_Narrow_Pointy","gender":"Male","hairMeshSize":[1.3,1.5],"beardMeshSize":[1.5,1.5],"beardOffset":[0.0,0.0,-0.05],"beardOffsetXEast":-0.05,"eyeOffsetEastWest":[0.1,0.0,0.18],"narrow":"true"},{"name":"Male_NarrowWide","graphicPath":"Things/Pawn/Humanlike/Heads/Male/Male_Narrow_Wide","gender":"Male","hairMeshSize":[1.3,1.5],"beardMeshSize":[1.5,1.5],"beardOffset":[0.0,0.0,-0.05],"beardOffsetXEast":-0.05,"eyeOffsetEastWest":[0.1,0.0,0.18],"narrow":"true"},{"name":"Female_AverageNormal","graphicPath":"Things/Pawn/Humanlike/Heads/Female/Female_Average_Normal","gender":"Female","hairMeshSize":[1.5,1.5],"beardMeshSize":[1.5,1.5]},{"name":"Female_AveragePointy","graphicPath":"Things/Pawn/Humanlike/Heads/Female/Female_Average_Pointy","gender":"Female","hairMeshSize":[1.5,1.5],"beardMeshSize":[1.5,1.5]},{"name":"Female_AverageWide","graphicPath":"Things/Pawn/Humanlike/Heads/Female/Female_Average_Wide","gender":"Female","hairMeshSize":[1.5,1.5],"beardMeshSize":[1.5,1.5]},{"name":"Female_NarrowNormal","graphicPath":"Things/Pawn/Humanlike/Heads/Female/Female_Narrow_Normal","gender":"Female","hairMeshSize":[1.3,1.5],"beardMeshSize":[1.5,1.5],"beardOffset":[0.0,0.0,-0.05],"beardOffsetXEast":-0.05,"eyeOffsetEastWest":[0.1,0.0,0.18],"narrow":"true"},{"name":"Female_NarrowPointy","graphicPath":"Things/Pawn/Humanlike/Heads/Female/Female_Narrow_Pointy","gender":"Female","hairMeshSize":[1.3,1.5],"beardMeshSize":[1.5,1.5],"beardOffset":[0.0,0.0,-0.05],"beardOffsetXEast":-0.05,"eyeOffsetEastWest":[0.1,0.0,0.18],"narrow":"true"},{"name":"Female_NarrowWide","graphicPath":"Things/Pawn/Humanlike/Heads/Female/Female_Narrow_Wide","gender":"Female","hairMeshSize":[1.3,1.5],"beardMeshSize":[1.5,1.5],"beardOffset":[0.0,0.0,-0.05],"beardOffsetXEast":-0.05,"eyeOffsetEastWest":[0.1,0.0,0.18],"narrow":"true"}];
-export const hairTypes = [{"name":"BriefPonytail","label":"brief ponytail","graphicPath":"Things/Pawn/Humanlike/Hairs/Gaston","category":"Rural","styleTags":["Rural","HairShort","HairLong"]},{"name":"Princess","label":"princess","graphicPath":"Things/Pawn/Humanlike/Hairs/Princess","category":"Rural","styleTags":["Rural","HairLong"]},{"name":"Scatman","label":"scatman","graphicPath":"Things/Pawn/Humanlike/Hairs/Scat","category":"Rural","styleTags":["Soldier","Balding"]},{"name":"Lackland","label":"lackland","graphicPath":"Things/Pawn/Humanlike/Hairs/Lackland","category":"Urban","styleTags":["Urban"]},{"name":"Revolt","label":"revolt","graphicPath":"Things/Pawn/Humanlike/Hairs/Revolt","category":"Urban","styleTags":["Urban"]},{"name":"Pigtails","label":"pigtails","graphicPath":"Things/Pawn/Humanlike/Hairs/Pigtails","category":"Urban","styleTags":["Urban"]},{"name":"Afro","label":"afro","graphicPath":"Things/Pawn/Humanlike/Hairs/Afro","category":"Urban","styleTags":["Urban"]},{"name":"Bob","label":"bob","graphicPath":"Things/Pawn/Humanlike/Hairs/Bob","category":"Urban","styleTags":["Soldier"]},{"name":"Burgundy","label":"burgundy","graphicPath":"Things/Pawn/Humanlike/Hairs/Burgundy","category":"Urban","styleTags":["Urban"]},{"name":"Troubadour","label":"troubadour","graphicPath":"Things/Pawn/Humanlike/Hairs/Troubadour","category":"Urban","styleTags":["Urban"]},{"name":"GreasySwoop","label":"greasy swoop","graphicPath":"Things/Pawn/Humanlike/Hairs/GreasySwoop","category":"Urban","styleTags":["Urban"]},{"name":"Cleopatra","label":"cleopatra","graphicPath":"Things/Pawn/Humanlike/Hairs/Cleopatra","category":"Urban","styleTags":["Soldier"]},{"name":"Cute","label":"cute","graphicPath":"Things/Pawn/Humanlike/Hairs/Cute","category":"Urban","styleTags":["Urban","HairLong"]},{"name":"Decent","label":"decent","graphicPath":"Things/Pawn/Humanlike/Hairs/Decent","category":"Urban","styleTags":["Urban","HairLong"]},{"name":"FancyBun","label":"fancy bun","graphicPath":"Things/Pawn/Humanlike/Hairs/FancyBun","category":"Urban","styleTags":["Urban","HairLong"]},{"name":"Senorita","label":"senorita","graphicPath":"Things/Pawn/Humanlike/Hairs/Senorita","category":"Urban","styleTags":["Urban","Rural","HairLong"]},{"name":"Flowy","label":"flowy","graphicPath":"Things/Pawn/Humanlike/Hairs/Flowy","category":"Rural","styleTags":["Urban","Rural","HairLong"]},{"name":"Long","label":"long","graphicPath":"Things/Pawn/Humanlike/Hairs/Long","category":"Rural","styleTags":["Urban","Rural","HairLong"]},{"name":"Mop","label":"mop","graphicPath":"Things/Pawn/Humanlike/Hairs/Mop","category":"Rural","styleTags":["Urban","Rural"]},{"name":"Wavy","label":"wavy","graphicPath":"Things/Pawn/Humanlike/Hairs/Wavy","category":"Rural","styleTags":["Urban","Rural"]},{"name":"Messy","label":"messy","graphicPath":"Things/Pawn/Humanlike/Hairs/Mess","category":"Rural","styleTags":["Urban","Rural","HairShort"]},{"name":"Curly","label":"curly","graphicPath":"Things/Pawn/Humanlike/Hairs/Curly","category":"Rural","styleTags":["Urban","Rural","HairShort","HairLong"]},{"name":"Fringe","label":"fringe","graphicPath":"Things/Pawn/Humanlike/Hairs/Fringe","category":"Urban","styleTags":["Urban","Rural","HairShort"]},{"name":"Frozen","label":"frozen","graphicPath":"Things/Pawn/Humanlike/Hairs/Frozen","category":"Urban","styleTags":["Urban","HairLong"]},{"name":"Ponytails","label":"ponytails","graphicPath":"Things/Pawn/Humanlike/Hairs/Ponytails","category":"Urban","styleTags":["Urban","Rural","HairLong"]},{"name":"Bowlcut","label":"bowlcut","graphicPath":"Things/Pawn/Humanlike/Hairs/Bowlcut","category":"Urban","styleTags":["Urban","Rural"]},{"name":"Bravo","label":"bravo","graphicPath":"Things/Pawn/Humanlike/Hairs/Bravo","category":"Urban","styleTags":["Urban","Rural"]},{"name":"Recruit","label":"recruit","graphicPath":"Things/Pawn/Humanlike/Hairs/Recruit","category":"Soldier","styleTags":["Soldier","HairShort"]},{"name":"Rockstar","label":"rockstar","graphicPath":"Things/Pawn/Humanlike/Hairs/Rockstar","category":"Urban","styleTags":["Urban","Rural","HairLong"]},{"name":"Snazzy","label":"snazzy","graphicPath":"Things/Pawn/Humanlike/Hairs/Snazzy","category":"Urban","styleTags":["Urban","Rural","HairLong"]},{"name":"Firestarter","label":"firestarter","graphicPath":"Things/Pawn/Humanlike/Hairs/Firestarter","category":"Punk","styleTags":["Punk"]},{"name":"Junkie","label":"junkie","graphicPath":"Things/Pawn/Humanlike/Hairs/Junkie","category":"Punk","styleTags":["Punk"]},{"name":"Scrapper","label":"scrapper","graphicPath":"Things/Pawn/Humanlike/Hairs/Scrapper","category":"Punk","styleTags":["Punk","Wild"]},{"name":"Randy","label":"randy","graphicPath":"Things/Pawn/Humanlike/Hairs/Randy","category":"Punk","styleTags":["Punk","HairShort","Wild"]},{"name":"Rookie","label":"rookie","graphicPath":"Things/Pawn/Humanlike/Hairs/Rookie","category":"Punk","styleTags":["Punk","HairShort"]},{"name":"Spikes","label":"spikes","graphicPath":"Things/Pawn/Humanlike/Hairs/Spikes","category":"Punk","styleTags":["Punk","Wild"]},{"name":"ShaveTopBraid","label":"shave top braid","graphicPath":"Things/Pawn/Humanlike/Hairs/ShaveTopBraid","category":"Tribal","styleTags":["Tribal"]},{"name":"BraidedKnot","label":"braided knot","graphicPath":"Things/Pawn/Humanlike/Hairs/Braidbun","category":"Tribal","styleTags":["Tribal","HairShort","HairLong"]},{"name":"Keeper","label":"keeper","graphicPath":"Things/Pawn/Humanlike/Hairs/Keeper","category":"Tribal","styleTags":["Tribal"]},{"name":"Primal","label":"primal","graphicPath":"Things/Pawn/Humanlike/Hairs/Primal","category":"Tribal","styleTags":["Tribal"]},{"name":"Warden","label":"warden","graphicPath":"Things/Pawn/Humanlike/Hairs/Warden","category":"Tribal","styleTags":["Tribal","HairShort"]},{"name":"Elder","label":"elder","graphicPath":"Things/Pawn/Humanlike/Hairs/Elder","category":"Tribal","styleTags":["Tribal","HairShort","Balding"]},{"name":"Locks","label":"locks","graphicPath":"Things/Pawn/Humanlike/Hairs/Locks","category":"Tribal","styleTags":["Tribal","HairLong"]},{"name":"Savage","label":"savage","graphicPath":"Things/Pawn/Humanlike/Hairs/Savage","category":"Tribal","styleTags":["Tribal","HairLong"]},{"name":"Sticky","label":"sticky","graphicPath":"Things/Pawn/Humanlike/Hairs/Sticky","category":"Tribal","styleTags":["Tribal","HairLong"]},{"name":"Bald","label":"bald","category":"Minimal","styleTags":["Bald","HairShort"]},{"name":"Shaved","label":"shaved","graphicPath":"Things/Pawn/Humanlike/Hairs/Shaved","category":"Minimal","styleTags":["Shaved","Urban","Punk","Rural","Tribal","Soldier","HairShort"]},{"name":"Tuft","label":"tuft","graphicPath":"Things/Pawn/Humanlike/Hairs/Tuft","category":"Tribal","styleTags":["Punk","Tribal","HairShort"]},{"name":"ScorpionTail","label":"scorpion tail","graphicPath":"Things/Pawn/Humanlike/Hairs/Scorpiontail","category":"Tribal","styleTags":["Punk","Tribal","Wild"]},{"name":"Topdog","label":"topdog","graphicPath":"Things/Pawn/Humanlike/Hairs/Topdog","category":"Soldier","styleTags":["Soldier","HairShort"]},{"name":"Mohawk","label":"mohawk","graphicPath":"Things/Pawn/Humanlike/Hairs/Mohawk","category":"Punk","styleTags":["Urban","Punk","Wild"]},{"name":"Artist","label":"artist","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Artist","category":"Royal","styleTags":["Urban"]},{"name":"Mary","label":"mary","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Mary","category":"Royal","styleTags":["Soldier"]},{"name":"Anne","label":"anne","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Anne","category":"Royal","styleTags":["Royalty","Urban","HairLong"]},{"name":"Elisabeth","label":"elisabeth","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Elisabeth","category":"Royal","styleTags":["Royalty","Urban"]},{"name":"Jane","label":"jane","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Jane","category":"Royal","styleTags":["Royalty","Urban","HairLong"]},{"name":"Lisa","label":"lisa","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Lisa","category":"Royal","styleTags":["Royalty","Urban"]},{"name":"Victoria","label":"victoria","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Victoria","category":"Royal","styleTags":["Royalty","Urban","Rural","HairLong"]},{"name":"Henry","label":"henry","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Henry","category":"Royal","styleTags":["Royalty","Urban"]},{"name":"Richard","label":"richard","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Richard","category":"Royal","styleTags":["Royalty","Urban"]},{"name":"Stephen","label":"stephen","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Stephen","category":"Royal","styleTags":["Royalty","Punk"]},{"name":"William","label":"william","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/William","category":"Royal","styleTags":["Royalty","Rural"]}];
-export const beardTypes = [{"name":"FurskinCurlyMoustache","label":"curly moustache","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinCurlyMoustache","category":"Furskin","styleTags":["Furskin"]},{"name":"BeardFurskinKnots","label":"knots","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinKnots","category":"Furskin","styleTags":["Furskin"]},{"name":"BeardFurskinMegabraid","label":"megabraid","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinMegabraid","category":"Furskin","styleTags":["Furskin"]},{"name":"BeardFurskinMonkey","label":"monkey","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinMonkey","category":"Furskin","styleTags":["Furskin"]},{"name":"BeardFurskinMoustache","label":"long stache","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinMoustache","category":"Furskin","styleTags":["Furskin"]},{"name":"BeardFurskinScruffy","label":"scruffy","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinScruffy","category":"Furskin","styleTags":["Furskin"]},{"name":"BeardFurskinSenile","label":"senile","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinSenile","category":"Furskin","styleTags":["Furskin"]},{"name":"BeardFurskinSideChops","label":"thick chops","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinSideChops","category":"Furskin","styleTags":["Furskin"]},{"name":"BeardFurskinSideTufts","label":"tufts","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinSideTufts","category":"Furskin","styleTags":["Furskin"]},{"name":"BeardFurskinStrongChops","label":"strong chops","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinStrongChops","category":"Furskin","styleTags":["Furskin"]},{"name":"NoBeard","label":"no beard","category":"Minimal","styleTags":["NoBeard"]},{"name":"Anchor","label":"anchor","graphicPath":"Things/Pawn/Humanlike/Beards/BeardAnchor","category":"Punk","styleTags":["BeardPunk","BeardShort"]},{"name":"Bushy","label":"bushy","graphicPath":"Things/Pawn/Humanlike/Beards/BeardBalin","category":"Tribal","styleTags":["BeardTribal","Bushy","BeardLong"]},{"name":"Norse","label":"norse","graphicPath":"Things/Pawn/Humanlike/Beards/BeardBifur","category":"Tribal","styleTags":["BeardTribal","BeardLong"]},{"name":"Boxed","label":"boxed","graphicPath":"Things/Pawn/Humanlike/Beards/BeardBoxed","category":"Urban","styleTags":["BeardUrban","BeardRural","BeardLong"]},{"name":"Circle","label":"circle","graphicPath":"Things/Pawn/Humanlike/Beards/BeardCircle","category":"Urban","styleTags":["BeardUrban","BeardRural"]},{"name":"BeardCurly","label":"curly","graphicPath":"Things/Pawn/Humanlike/Beards/BeardCurly","category":"Tribal","styleTags":["BeardTribal","BeardBushy","BeardLong"]},{"name":"Curtain","label":"curtain","graphicPath":"Things/Pawn/Humanlike/Beards/BeardCurtain","category":"Urban","styleTags":["BeardUrban","BeardRural"]},{"name":"BushyStyled","label":"bushy styled","graphicPath":"Things/Pawn/Humanlike/Beards/BeardDori","category":"Urban","styleTags":["BeardUrban","BeardRural","BeardTribal","BeardBushy","BeardLong"]},{"name":"Ducktail","label":"ducktail","graphicPath":"Things/Pawn/Humanlike/Beards/BeardDucktail","category":"Urban","styleTags":["BeardUrban","BeardRural","BeardLong"]},{"name":"StacheAndChops","label":"stache and chops","graphicPath":"Things/Pawn/Humanlike/Beards/BeardDwalin","category":"Tribal","styleTags":["BeardTribal","BeardLong"]},{"name":"Fork","label":"fork","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFork","category":"Punk","styleTags":["BeardPunk","BeardLong"]},{"name":"French","label":"french","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFrench","category":"Urban","styleTags":["BeardUrban"]},{"name":"Full","label":"full","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFull","category":"Urban","styleTags":["BeardUrban"]},{"name":"Goatee","label":"goatee","graphicPath":"Things/Pawn/Humanlike/Beards/BeardGoatee","category":"Urban","styleTags":["BeardUrban","BeardShort"],"offsetNarrowEast":[-0.01,0.0,0.03],"offsetNarrowSouth":[0.0,0.0,0.05]},{"name":"Classy","label":"classy","graphicPath":"Things/Pawn/Humanlike/Beards/BeardImperial","category":"Urban","styleTags":["BeardUrban"]},{"name":"Braided","label":"braided","graphicPath":"Things/Pawn/Humanlike/Beards/BeardKhal","category":"Tribal","styleTags":["BeardTribal","BeardLong"]},{"name":"Lincoln","label":"lincoln","graphicPath":"Things/Pawn/Humanlike/Beards/BeardLincoln","category":"Rural","styleTags":["BeardRural"],"offsetNarrowEast":[-0.05,0.0,0.0]},{"name":"LongDutch","label":"long dutch","graphicPath":"Things/Pawn/Humanlike/Beards/BeardLongDutch","category":"Rural","styleTags":["BeardRural","BeardBushy","BeardLong"]},{"name":"Machete","label":"machete","graphicPath":"Things/Pawn/Humanlike/Beards/BeardMachete","category":"Moustache","styleTags":["BeardPunk","MoustacheOnly"]},{"name":"Moustache","label":"moustache","graphicPath":"Things/Pawn/Humanlike/Beards/BeardMoustache","category":"Moustache","styleTags":["BeardUrban","MoustacheOnly"]},{"name":"MuttonChops","label":"mutton chops","graphicPath":"Things/Pawn/Humanlike/Beards/BeardMuttonChops","category":"Rural","styleTags":["BeardRural"]},{"name":"TriBraid","label":"tri-braid","graphicPath":"Things/Pawn/Humanlike/Beards/BeardNori","category":"Tribal","styleTags":["BeardTribal","BeardBushy","BeardLong"]},{"name":"OldDutch","label":"old dutch","graphicPath":"Things/Pawn/Humanlike/Beards/BeardOldDutch","category":"Rural","styleTags":["BeardRural"],"offsetNarrowEast":[-0.05,0.0,0.0]},{"name":"Seer","label":"seer","graphicPath":"Things/Pawn/Humanlike/Beards/BeardSeer","category":"Tribal","styleTags":["BeardTribal","BeardBushy","BeardLong"]},{"name":"SideWhiskers","label":"side whiskers","graphicPath":"Things/Pawn/Humanlike/Beards/BeardSideWhiskers","category":"Rural","styleTags":["BeardRural"]},{"name":"SoulPatch","label":"soul patch","graphicPath":"Things/Pawn/Humanlike/Beards/BeardSoulPatch","category":"Punk","styleTags":["BeardPunk"],"offsetNarrowEast":[-0.04,0.0,0.0],"offsetNarrowSouth":[0.0,0.0,0.02]},{"name":"Stubble","label":"stubble","graphicPath":"Things/Pawn/Humanlike/Beards/BeardStubble","category":"Minimal","styleTags":["BeardPunk","BeardUrban","BeardRural"],"offsetNarrowSouth":[0.0,0.0,0.02]},{"name":"Urist","label":"urist","graphicPath":"Things/Pawn/Humanlike/Beards/BeardUrist","category":"Tribal","styleTags":["BeardTribal","BeardBushy","BeardLong"]},{"name":"VanDyke","label":"VanDyke","graphicPath":"Things/Pawn/Humanlike/Beards/BeardVanDyke","category":"Urban","styleTags":["BeardUrban","BeardLong"]},{"name":"Wizard","label":"wizard","graphicPath":"Things/Pawn/Humanlike/Beards/BeardWizard","category":"Rural","styleTags":["BeardRural","BeardBushy","BeardLong"]}]
\ No newline at end of file
+export const hairTypes = [{"name":"BriefPonytail","graphicPath":"Things/Pawn/Humanlike/Hairs/Gaston","category":"Rural","styleTags":["Rural","HairShort","HairLong"]},{"name":"Princess","graphicPath":"Things/Pawn/Humanlike/Hairs/Princess","category":"Rural","styleTags":["Rural","HairLong"]},{"name":"Scatman","graphicPath":"Things/Pawn/Humanlike/Hairs/Scat","category":"Rural","styleTags":["Soldier","Balding"]},{"name":"Lackland","graphicPath":"Things/Pawn/Humanlike/Hairs/Lackland","category":"Urban","styleTags":["Urban"]},{"name":"Revolt","graphicPath":"Things/Pawn/Humanlike/Hairs/Revolt","category":"Urban","styleTags":["Urban"]},{"name":"Pigtails","graphicPath":"Things/Pawn/Humanlike/Hairs/Pigtails","category":"Urban","styleTags":["Urban"]},{"name":"Afro","graphicPath":"Things/Pawn/Humanlike/Hairs/Afro","category":"Urban","styleTags":["Urban"]},{"name":"Bob","graphicPath":"Things/Pawn/Humanlike/Hairs/Bob","category":"Urban","styleTags":["Soldier"]},{"name":"Burgundy","graphicPath":"Things/Pawn/Humanlike/Hairs/Burgundy","category":"Urban","styleTags":["Urban"]},{"name":"Troubadour","graphicPath":"Things/Pawn/Humanlike/Hairs/Troubadour","category":"Urban","styleTags":["Urban"]},{"name":"GreasySwoop","graphicPath":"Things/Pawn/Humanlike/Hairs/GreasySwoop","category":"Urban","styleTags":["Urban"]},{"name":"Cleopatra","graphicPath":"Things/Pawn/Humanlike/Hairs/Cleopatra","category":"Urban","styleTags":["Soldier"]},{"name":"Cute","graphicPath":"Things/Pawn/Humanlike/Hairs/Cute","category":"Urban","styleTags":["Urban","HairLong"]},{"name":"Decent","graphicPath":"Things/Pawn/Humanlike/Hairs/Decent","category":"Urban","styleTags":["Urban","HairLong"]},{"name":"FancyBun","graphicPath":"Things/Pawn/Humanlike/Hairs/FancyBun","category":"Urban","styleTags":["Urban","HairLong"]},{"name":"Senorita","graphicPath":"Things/Pawn/Humanlike/Hairs/Senorita","category":"Urban","styleTags":["Urban","Rural","HairLong"]},{"name":"Flowy","graphicPath":"Things/Pawn/Humanlike/Hairs/Flowy","category":"Rural","styleTags":["Urban","Rural","HairLong"]},{"name":"Long","graphicPath":"Things/Pawn/Humanlike/Hairs/Long","category":"Rural","styleTags":["Urban","Rural","HairLong"]},{"name":"Mop","graphicPath":"Things/Pawn/Humanlike/Hairs/Mop","category":"Rural","styleTags":["Urban","Rural"]},{"name":"Wavy","graphicPath":"Things/Pawn/Humanlike/Hairs/Wavy","category":"Rural","styleTags":["Urban","Rural"]},{"name":"Messy","graphicPath":"Things/Pawn/Humanlike/Hairs/Mess","category":"Rural","styleTags":["Urban","Rural","HairShort"]},{"name":"Curly","graphicPath":"Things/Pawn/Humanlike/Hairs/Curly","category":"Rural","styleTags":["Urban","Rural","HairShort","HairLong"]},{"name":"Fringe","graphicPath":"Things/Pawn/Humanlike/Hairs/Fringe","category":"Urban","styleTags":["Urban","Rural","HairShort"]},{"name":"Frozen","graphicPath":"Things/Pawn/Humanlike/Hairs/Frozen","category":"Urban","styleTags":["Urban","HairLong"]},{"name":"Ponytails","graphicPath":"Things/Pawn/Humanlike/Hairs/Ponytails","category":"Urban","styleTags":["Urban","Rural","HairLong"]},{"name":"Bowlcut","graphicPath":"Things/Pawn/Humanlike/Hairs/Bowlcut","category":"Urban","styleTags":["Urban","Rural"]},{"name":"Bravo","graphicPath":"Things/Pawn/Humanlike/Hairs/Bravo","category":"Urban","styleTags":["Urban","Rural"]},{"name":"Recruit","graphicPath":"Things/Pawn/Humanlike/Hairs/Recruit","category":"Soldier","styleTags":["Soldier","HairShort"]},{"name":"Rockstar","graphicPath":"Things/Pawn/Humanlike/Hairs/Rockstar","category":"Urban","styleTags":["Urban","Rural","HairLong"]},{"name":"Snazzy","graphicPath":"Things/Pawn/Humanlike/Hairs/Snazzy","category":"Urban","styleTags":["Urban","Rural","HairLong"]},{"name":"Firestarter","graphicPath":"Things/Pawn/Humanlike/Hairs/Firestarter","category":"Punk","styleTags":["Punk"]},{"name":"Junkie","graphicPath":"Things/Pawn/Humanlike/Hairs/Junkie","category":"Punk","styleTags":["Punk"]},{"name":"Scrapper","graphicPath":"Things/Pawn/Humanlike/Hairs/Scrapper","category":"Punk","styleTags":["Punk","Wild"]},{"name":"Randy","graphicPath":"Things/Pawn/Humanlike/Hairs/Randy","category":"Punk","styleTags":["Punk","HairShort","Wild"]},{"name":"Rookie","graphicPath":"Things/Pawn/Humanlike/Hairs/Rookie","category":"Punk","styleTags":["Punk","HairShort"]},{"name":"Spikes","graphicPath":"Things/Pawn/Humanlike/Hairs/Spikes","category":"Punk","styleTags":["Punk","Wild"]},{"name":"ShaveTopBraid","graphicPath":"Things/Pawn/Humanlike/Hairs/ShaveTopBraid","category":"Tribal","styleTags":["Tribal"]},{"name":"BraidedKnot","graphicPath":"Things/Pawn/Humanlike/Hairs/Braidbun","category":"Tribal","styleTags":["Tribal","HairShort","HairLong"]},{"name":"Keeper","graphicPath":"Things/Pawn/Humanlike/Hairs/Keeper","category":"Tribal","styleTags":["Tribal"]},{"name":"Primal","graphicPath":"Things/Pawn/Humanlike/Hairs/Primal","category":"Tribal","styleTags":["Tribal"]},{"name":"Warden","graphicPath":"Things/Pawn/Humanlike/Hairs/Warden","category":"Tribal","styleTags":["Tribal","HairShort"]},{"name":"Elder","graphicPath":"Things/Pawn/Humanlike/Hairs/Elder","category":"Tribal","styleTags":["Tribal","HairShort","Balding"]},{"name":"Locks","graphicPath":"Things/Pawn/Humanlike/Hairs/Locks","category":"Tribal","styleTags":["Tribal","HairLong"]},{"name":"Savage","graphicPath":"Things/Pawn/Humanlike/Hairs/Savage","category":"Tribal","styleTags":["Tribal","HairLong"]},{"name":"Sticky","graphicPath":"Things/Pawn/Humanlike/Hairs/Sticky","category":"Tribal","styleTags":["Tribal","HairLong"]},{"name":"Bald","category":"Minimal","styleTags":["Bald","HairShort"]},{"name":"Shaved","graphicPath":"Things/Pawn/Humanlike/Hairs/Shaved","category":"Minimal","styleTags":["Shaved","Urban","Punk","Rural","Tribal","Soldier","HairShort"]},{"name":"Tuft","graphicPath":"Things/Pawn/Humanlike/Hairs/Tuft","category":"Tribal","styleTags":["Punk","Tribal","HairShort"]},{"name":"ScorpionTail","graphicPath":"Things/Pawn/Humanlike/Hairs/Scorpiontail","category":"Tribal","styleTags":["Punk","Tribal","Wild"]},{"name":"Topdog","graphicPath":"Things/Pawn/Humanlike/Hairs/Topdog","category":"Soldier","styleTags":["Soldier","HairShort"]},{"name":"Mohawk","graphicPath":"Things/Pawn/Humanlike/Hairs/Mohawk","category":"Punk","styleTags":["Urban","Punk","Wild"]},{"name":"Artist","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Artist","category":"Royal","styleTags":["Urban"]},{"name":"Mary","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Mary","category":"Royal","styleTags":["Soldier"]},{"name":"Anne","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Anne","category":"Royal","styleTags":["Royalty","Urban","HairLong"]},{"name":"Elisabeth","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Elisabeth","category":"Royal","styleTags":["Royalty","Urban"]},{"name":"Jane","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Jane","category":"Royal","styleTags":["Royalty","Urban","HairLong"]},{"name":"Lisa","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Lisa","category":"Royal","styleTags":["Royalty","Urban"]},{"name":"Victoria","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Victoria","category":"Royal","styleTags":["Royalty","Urban","Rural","HairLong"]},{"name":"Henry","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Henry","category":"Royal","styleTags":["Royalty","Urban"]},{"name":"Richard","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Richard","category":"Royal","styleTags":["Royalty","Urban"]},{"name":"Stephen","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/Stephen","category":"Royal","styleTags":["Royalty","Punk"]},{"name":"William","graphicPath":"Things/Pawn/Humanlike/Hairs/Royalty/William","category":"Royal","styleTags":["Royalty","Rural"]}];
+export const beardTypes = [{"name":"FurskinCurlyMoustache","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinCurlyMoustache","category":"Furskin","styleTags":["Furskin"]},{"name":"BeardFurskinKnots","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinKnots","category":"Furskin","styleTags":["Furskin"]},{"name":"BeardFurskinMegabraid","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinMegabraid","category":"Furskin","styleTags":["Furskin"]},{"name":"BeardFurskinMonkey","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinMonkey","category":"Furskin","styleTags":["Furskin"]},{"name":"BeardFurskinMoustache","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinMoustache","category":"Furskin","styleTags":["Furskin"]},{"name":"BeardFurskinScruffy","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinScruffy","category":"Furskin","styleTags":["Furskin"]},{"name":"BeardFurskinSenile","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinSenile","category":"Furskin","styleTags":["Furskin"]},{"name":"BeardFurskinSideChops","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinSideChops","category":"Furskin","styleTags":["Furskin"]},{"name":"BeardFurskinSideTufts","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinSideTufts","category":"Furskin","styleTags":["Furskin"]},{"name":"BeardFurskinStrongChops","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFurskinStrongChops","category":"Furskin","styleTags":["Furskin"]},{"name":"NoBeard","category":"Minimal","styleTags":["NoBeard"]},{"name":"Anchor","graphicPath":"Things/Pawn/Humanlike/Beards/BeardAnchor","category":"Punk","styleTags":["BeardPunk","BeardShort"]},{"name":"Bushy","graphicPath":"Things/Pawn/Humanlike/Beards/BeardBalin","category":"Tribal","styleTags":["BeardTribal","Bushy","BeardLong"]},{"name":"Norse","graphicPath":"Things/Pawn/Humanlike/Beards/BeardBifur","category":"Tribal","styleTags":["BeardTribal","BeardLong"]},{"name":"Boxed","graphicPath":"Things/Pawn/Humanlike/Beards/BeardBoxed","category":"Urban","styleTags":["BeardUrban","BeardRural","BeardLong"]},{"name":"Circle","graphicPath":"Things/Pawn/Humanlike/Beards/BeardCircle","category":"Urban","styleTags":["BeardUrban","BeardRural"]},{"name":"BeardCurly","graphicPath":"Things/Pawn/Humanlike/Beards/BeardCurly","category":"Tribal","styleTags":["BeardTribal","BeardBushy","BeardLong"]},{"name":"Curtain","graphicPath":"Things/Pawn/Humanlike/Beards/BeardCurtain","category":"Urban","styleTags":["BeardUrban","BeardRural"]},{"name":"BushyStyled","graphicPath":"Things/Pawn/Humanlike/Beards/BeardDori","category":"Urban","styleTags":["BeardUrban","BeardRural","BeardTribal","BeardBushy","BeardLong"]},{"name":"Ducktail","graphicPath":"Things/Pawn/Humanlike/Beards/BeardDucktail","category":"Urban","styleTags":["BeardUrban","BeardRural","BeardLong"]},{"name":"StacheAndChops","graphicPath":"Things/Pawn/Humanlike/Beards/BeardDwalin","category":"Tribal","styleTags":["BeardTribal","BeardLong"]},{"name":"Fork","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFork","category":"Punk","styleTags":["BeardPunk","BeardLong"]},{"name":"French","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFrench","category":"Urban","styleTags":["BeardUrban"]},{"name":"Full","graphicPath":"Things/Pawn/Humanlike/Beards/BeardFull","category":"Urban","styleTags":["BeardUrban"]},{"name":"Goatee","graphicPath":"Things/Pawn/Humanlike/Beards/BeardGoatee","category":"Urban","styleTags":["BeardUrban","BeardShort"],"offsetNarrowEast":[-0.01,0.0,0.03],"offsetNarrowSouth":[0.0,0.0,0.05]},{"name":"Classy","graphicPath":"Things/Pawn/Humanlike/Beards/BeardImperial","category":"Urban","styleTags":["BeardUrban"]},{"name":"Braided","graphicPath":"Things/Pawn/Humanlike/Beards/BeardKhal","category":"Tribal","styleTags":["BeardTribal","BeardLong"]},{"name":"Lincoln","graphicPath":"Things/Pawn/Humanlike/Beards/BeardLincoln","category":"Rural","styleTags":["BeardRural"],"offsetNarrowEast":[-0.05,0.0,0.0]},{"name":"LongDutch","graphicPath":"Things/Pawn/Humanlike/Beards/BeardLongDutch","category":"Rural","styleTags":["BeardRural","BeardBushy","BeardLong"]},{"name":"Machete","graphicPath":"Things/Pawn/Humanlike/Beards/BeardMachete","category":"Moustache","styleTags":["BeardPunk","MoustacheOnly"]},{"name":"Moustache","graphicPath":"Things/Pawn/Humanlike/Beards/BeardMoustache","category":"Moustache","styleTags":["BeardUrban","MoustacheOnly"]},{"name":"MuttonChops","graphicPath":"Things/Pawn/Humanlike/Beards/BeardMuttonChops","category":"Rural","styleTags":["BeardRural"]},{"name":"TriBraid","graphicPath":"Things/Pawn/Humanlike/Beards/BeardNori","category":"Tribal","styleTags":["BeardTribal","BeardBushy","BeardLong"]},{"name":"OldDutch","graphicPath":"Things/Pawn/Humanlike/Beards/BeardOldDutch","category":"Rural","styleTags":["BeardRural"],"offsetNarrowEast":[-0.05,0.0,0.0]},{"name":"Seer","graphicPath":"Things/Pawn/Humanlike/Beards/BeardSeer","category":"Tribal","styleTags":["BeardTribal","BeardBushy","BeardLong"]},{"name":"SideWhiskers","graphicPath":"Things/Pawn/Humanlike/Beards/BeardSideWhiskers","category":"Rural","styleTags":["BeardRural"]},{"name":"SoulPatch","graphicPath":"Things/Pawn/Humanlike/Beards/BeardSoulPatch","category":"Punk","styleTags":["BeardPunk"],"offsetNarrowEast":[-0.04,0.0,0.0],"offsetNarrowSouth":[0.0,0.0,0.02]},{"name":"Stubble","graphicPath":"Things/Pawn/Humanlike/Beards/BeardStubble","category":"Minimal","styleTags":["BeardPunk","BeardUrban","BeardRural"],"offsetNarrowSouth":[0.0,0.0,0.02]},{"name":"Urist","graphicPath":"Things/Pawn/Humanlike/Beards/BeardUrist","category":"Tribal","styleTags":["BeardTribal","BeardBushy","BeardLong"]},{"name":"VanDyke","graphicPath":"Things/Pawn/Humanlike/Beards/BeardVanDyke","category":"Urban","styleTags":["BeardUrban","BeardLong"]},{"name":"Wizard","graphicPath":"Things/Pawn/Humanlike/Beards/BeardWizard","category":"Rural","styleTags":["BeardRural","BeardBushy","BeardLong"]}];
+export var headTypeIndex = {"Gaunt":0,"Male_HeavyJawNormal":1,"Female_HeavyJawNormal":2,"Furskin_Average1":3,"Furskin_Average2":4,"Furskin_Average3":5,"Furskin_Gaunt":6,"Furskin_Narrow1":7,"Furskin_Narrow2":8,"Furskin_Narrow3":9,"Furskin_Heavy1":10,"Furskin_Heavy2":11,"Furskin_Heavy3":12,"Skull":13,"Stump":14,"Male_AverageNormal":15,"Male_AveragePointy":16,"Male_AverageWide":17,"Male_NarrowNormal":18,"Male_NarrowPointy":19,"Male_NarrowWide":20,"Female_AverageNormal":21,"Female_AveragePointy":22,"Female_AverageWide":23,"Female_NarrowNormal":24,"Female_NarrowPointy":25,"Female_NarrowWide":26};
+export var hairTypeIndex = {"BriefPonytail":0,"Princess":1,"Scatman":2,"Lackland":3,"Revolt":4,"Pigtails":5,"Afro":6,"Bob":7,"Burgundy":8,"Troubadour":9,"GreasySwoop":10,"Cleopatra":11,"Cute":12,"Decent":13,"FancyBun":14,"Senorita":15,"Flowy":16,"Long":17,"Mop":18,"Wavy":19,"Messy":20,"Curly":21,"Fringe":22,"Frozen":23,"Ponytails":24,"Bowlcut":25,"Bravo":26,"Recruit":27,"Rockstar":28,"Snazzy":29,"Firestarter":30,"Junkie":31,"Scrapper":32,"Randy":33,"Rookie":34,"Spikes":35,"ShaveTopBraid":36,"BraidedKnot":37,"Keeper":38,"Primal":39,"Warden":40,"Elder":41,"Locks":42,"Savage":43,"Sticky":44,"Bald":45,"Shaved":46,"Tuft":47,"ScorpionTail":48,"Topdog":49,"Mohawk":50,"Artist":51,"Mary":52,"Anne":53,"Elisabeth":54,"Jane":55,"Lisa":56,"Victoria":57,"Henry":58,"Richard":59,"Stephen":60,"William":61};
+export var beardTypeIndex = {"FurskinCurlyMoustache":0,"BeardFurskinKnots":1,"BeardFurskinMegabraid":2,"BeardFurskinMonkey":3,"BeardFurskinMoustache":4,"BeardFurskinScruffy":5,"BeardFurskinSenile":6,"BeardFurskinSideChops":7,"BeardFurskinSideTufts":8,"BeardFurskinStrongChops":9,"NoBeard":10,"Anchor":11,"Bushy":12,"Norse":13,"Boxed":14,"Circle":15,"BeardCurly":16,"Curtain":17,"BushyStyled":18,"Ducktail":19,"StacheAndChops":20,"Fork":21,"French":22,"Full":23,"Goatee":24,"Classy":25,"Braided":26,"Lincoln":27,"LongDutch":28,"Machete":29,"Moustache":30,"MuttonChops":31,"TriBraid":32,"OldDutch":33,"Seer":34,"SideWhiskers":35,"SoulPatch":36,"Stubble":37,"Urist":38,"VanDyke":39,"Wizard":40};
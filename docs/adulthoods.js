@@ -1,2 +1,4 @@
 /** @type { Backstory[] } */
-var adulthoods = [{"name":"AIProgrammer22","title":"AI programmer","titleShort":"programmer","desc":"This pawn enlisted in the military's robotics division, developing smarter combat AI.\nThe whole time This pawn was there, This pawn never spoke with another human. This pawn spent all their time conversing with the AI This pawn was developing.","skills":{"Intellectual":7,"Crafting":6},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"AIResearcher94","title":"AI researcher","titleShort":"researcher","desc":"This pawn was a renowned researcher in artificial intelligence, robotics, and interactive holography. their friendships with the artificial minds This pawn created gave them the confidence to interact with real people, and This pawn soon excelled at personal communication.","skills":{"Intellectual":6,"Mining":-2,"Melee":-2,"Social":4,"Crafting":1},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"AWOLSoldier49","title":"AWOL soldier","titleShort":"soldier","desc":"This pawn was an infantryman.\nWhen This pawn was informed of their assignment to the Xennoa-Zartza War, This pawn decided This pawn did not want to be a soldier. This pawn was able to escape via military spacejet.","skills":{"Shooting":6,"Melee":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CivilServant25","title":"Civil servant","titleShort":"Bureaucrat","desc":"This pawn was bureaucrat in the civil service.\nAlthough their family connections took them far, their vocal opposition to their bosses' plans hindered their advancement. Called a \"red prince\" by some, This pawn sympathized with the poor, leading ultimately to disgrace in their career.","skills":{"Intellectual":3,"Social":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"RimworldExile32","title":"Rimworld exile","titleShort":"Exile","desc":"After their planet was technologically uplifted by a benevolent glitterworld charity, This pawn saw an opportunity to make some money by defrauding the wealthy glitterworld visitors.\nAfter This pawn was caught, This pawn was exiled to the rim, where This pawn targeted rich trading companies to continue their life of crime.","skills":{"Intellectual":6,"Shooting":-2,"Social":5,"Cooking":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Streamer52","title":"Streamer","titleShort":"Streamer","desc":"This pawn worked as a videogame streamer, and was known for their monkey-related impressions and jokes.\nA pandemic forced them to go into cryptosleep for several years. During their sleep, This pawn was launched on an interstellar diplomatic mission. Nothing was heard of them ever again.","skills":{"Social":6,"Animals":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"TravelingBard93","title":"Traveling bard","titleShort":"Musician","desc":"This pawn joined the famous Star Pilots On Channel K (aka S.P.O.C.K) and toured the star system, but eventually the band split up and their fame faded away.\nThis pawn ended up as a travelling bard playing on their portable synthesizer as This pawn traveled from spaceport to spaceport.","skills":{"Social":5,"Artistic":4,"Crafting":2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"VRDesigner87","title":"VR designer","titleShort":"game dev","desc":"This pawn designed virtual reality simulations for glitterworld citizens. This pawn paid great attention to the details of their worlds, including learning all This pawn could about plant life to make their landscapes more realistic.","skills":{"Construction":3,"Plants":4,"Artistic":5},"disabledWork":["ManualDumb"],"requiredWork":["Artistic"],"traits":{}},{"name":"AceFighterPilot54","title":"ace fighter pilot","titleShort":"ace","desc":"This pawn graduated from the Star Academy with honors and distinguished themself as an ace fighter pilot in three campaigns against more advanced aggressor cultures. \nHowever, after one vicious battle, This pawn found themself stranded and their carrier ship destroyed. With nowhere to go, This pawn entered their escape pod and prayed.","skills":{"Intellectual":2,"Mining":-3,"Shooting":3,"Melee":2,"Social":3,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"AcolyteOfStars6","title":"acolyte of stars","titleShort":"priest","desc":"Ever the dreamer, This pawn traveled across the universe to find the thing This pawn felt was calling to him.\nThis pawn became poorer and poorer, but used every means possible to carry on.","skills":{"Intellectual":-3,"Social":-3,"Medicine":4,"Artistic":7},"disabledWork":["ManualDumb","Violent"],"requiredWork":[],"traits":{}},{"name":"Actor72","title":"actor","titleShort":"actor","desc":"This pawn travelled with a company of actors, playing to packed theatres and loving audiences everywhere. This pawn was a perfectionist, and made their own props and costumes rather than use the ones This pawn was given.","skills":{"Social":8,"Crafting":3},"disabledWork":["ManualDumb"],"requiredWork":["Social"],"traits":{}},{"name":"AddictionCounsel60","title":"addiction counsel","titleShort":"counselor","desc":"After recovering from a joywire addiction, This pawn adopted a non-violent way of life and vowed to help others.\nTravelling between communities, This pawn used medicine, arts, and crafts to aid others who struggled with their own addictions.","skills":{"Social":8,"Medicine":3,"Artistic":3,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Adventurer19","title":"adventurer","titleShort":"adventurer","desc":"This pawn's thirst for adventure took them to many planets. This pawn visited the brightest glitterworlds and the darkest war-torn toxic planets in their quest to find novelty and excitement.\nThis pawn worked as little as possible, often skirting ethical boundaries to make a quick buck. Among all jobs, This pawn hated cooking the most.","skills":{"Shooting":3,"Melee":3,"Social":3,"Medicine":3,"Crafting":3,"Animals":2},"disabledWork":["Cooking"],"requiredWork":[],"traits":{}},{"name":"AdventurousWeirdo55","title":"adventurous weirdo","titleShort":"weirdo","desc":"A creative but strange individual, This pawn dedicated their life to their twin passions of medieval world history and high technology.\nThis pawn was fascinated by the idea of becoming a 'skyknight' with glittering armor and a giant sword.","skills":{"Shooting":-2,"Melee":6,"Cooking":2,"Artistic":2,"Crafting":2},"disabledWork":["Mining"],"requiredWork":[],"traits":{}},{"name":"AerospaceEngineer44","title":"aerospace engineer","titleShort":"engineer","desc":"This pawn was an engineer responsible for the production of aircraft and spaceships. This pawn focused on improving production lines, and was known for their mastery of technical and research issues.","skills":{"Construction":2,"Intellectual":4,"Mining":2,"Shooting":2,"Social":2},"disabledWork":["Cleaning","PlantWork"],"requiredWork":[],"traits":{}},{"name":"AlcoholicTrucker93","title":"alcoholic trucker","titleShort":"alcoholic","desc":"This pawn was a space trucker working for Arcknight Industries when This pawn killed their wife and daughter in a crash.\ntheir body was repaired with an experimental nano-genetic therapy. Now their muscles continually regenerate and harden, and every movement tears the tissue anew. This pawn bears the pain in silence.","skills":{"Mining":4,"Shooting":2,"Melee":2},"disabledWork":["Caring","Social","Intellectual","Artistic","Cleaning"],"requiredWork":[],"traits":{}},{"name":"AnarchistRebel77","title":"anarchist rebel","titleShort":"anarchist","desc":"After being abandoned on a special operation, This pawn swore vengeance upon the state. This pawn formed an anarchist group dedicated to bringing down coreworld governments.\nAfter too many close calls, and too few successes, This pawn fled to the outer rim.","skills":{"Shooting":6,"Melee":2,"Social":6},"disabledWork":["Crafting","Cleaning"],"requiredWork":[],"traits":{}},{"name":"AnimalFarmer21","title":"animal farmer","titleShort":"animal farmer","desc":"This pawn raised a variety of animals to provide meat, milk, eggs, and leather.","skills":{"Animals":5},"disabledWork":[],"requiredWork":["Violent","Animals"],"traits":{}},{"name":"Archaeologist85","title":"archaeologist","titleShort":"explorer","desc":"This pawn was trapped in an uninspired life. One day, This pawn jumped on a ship to learn archaeology and see the universe.\nThis pawn learned how to survive. This pawn also learned about people - although This pawn understood the dead better than the living.","skills":{"Construction":4,"Intellectual":5,"Shooting":2,"Social":-2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Archer25","title":"archer","titleShort":"archer","desc":"This pawn fought for their tribe. This pawn and specialized in the use of bows, pila, and other ranged weapons.","skills":{"Melee":2,"Shooting":7},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"Architect28","title":"architect","titleShort":"architect","desc":"This pawn designed and constructed buildings. On their glitterworld home, most of the technical aspects of architecture were handled by an AI. This enabled them to push the artistic limits of the craft, but also meant This pawn never had to get their hands dirty at building sites.","skills":{"Construction":5,"Artistic":7,"Crafting":-3},"disabledWork":["ManualDumb"],"requiredWork":["Intellectual"],"traits":{}},{"name":"ArchotechSpy75","title":"archotech spy","titleShort":"AI spy","desc":"This pawn was a cybernetic researcher. Studying a transcended world, This pawn became too involved with their subjects. Over time, the archotech recruited them into its service, and used them as a spy.\nWhen This pawn later rebelled against their inhuman master, it sent mechanoids across space to hunt them down.","skills":{"Construction":4,"Intellectual":4,"Shooting":8,"Melee":2,"Cooking":-2,"Crafting":2},"disabledWork":["Mining"],"requiredWork":[],"traits":{}},{"name":"ArmyCook0","title":"army cook","titleShort":"cook","desc":"This pawn joined the army as a worker and spent most of their time cooking and repairing. While This pawn was stationed on a dangerous planet, This pawn underwent basic shooting and survival training.","skills":{"Construction":2,"Intellectual":-2,"Shooting":2,"Melee":2,"Cooking":3,"Crafting":1},"disabledWork":["Caring","Social","Firefighting"],"requiredWork":[],"traits":{}},{"name":"ArmyScientist35","title":"army scientist","titleShort":"scientist","desc":"This pawn did scientific research for a planetary army. This pawn studied war scenarios and designed weapon systems to help win battles with a minimum of fuss.","skills":{"Intellectual":8,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ArmySergeant16","title":"army sergeant","titleShort":"sergeant","desc":"This pawn served in their country's military, commanding small units as a non-commissioned officer.\nThis pawn excelled creating tactically sound plans despite difficult circumstances.","skills":{"Construction":2,"Shooting":8,"Melee":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Aromatherapist80","title":"aromatherapist","titleShort":"therapist","desc":"This pawn practiced aromatherapy, using essences extracted from home-grown plants.","skills":{"Plants":6,"Shooting":-3,"Melee":-3,"Cooking":4,"Medicine":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ArtStudent79","title":"art student","titleShort":"artist","desc":"After years of practice, Freya was able to enrol into an art university and take her skills further. She sought art industry work after graduating with good grades. She made some progress with private commissions, managing to make a decent living from heart.","skills":{"Construction":-2,"Plants":-1,"Cooking":-1,"Medicine":1,"Artistic":8,"Crafting":2},"disabledWork":["Mining"],"requiredWork":[],"traits":{}},{"name":"ArtifactHunter48","title":"artifact hunter","titleShort":"artifacter","desc":"This pawn became depressed and lost interest in life. This pawn travelled from planet to planet, searching for psychic artifacts amid mechanoid ruins in the hope that they would cure the pain in their soul.\nA steady trigger finger and careful planning kept This pawn alive.","skills":{"Construction":4,"Shooting":8},"disabledWork":["Social"],"requiredWork":[],"traits":{"ShootingAccuracy":1}},{"name":"ArtificerRampant95","title":"artificer rampant","titleShort":"artificer","desc":"Fuelled by the thrill of discovery and their own megalomania, This pawn set out to invent new devices and improve existing ones, breaking laws and customs as necessary.\nThis pawn formed a crew to gather materials for their work - and to deal with outsiders who might interfere.","skills":{"Construction":2,"Intellectual":6,"Medicine":2,"Crafting":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Artilleryman28","title":"artilleryman","titleShort":"artilleer","desc":"This pawn loaded shells and aimed artillery to pound their army's enemies from afar.","skills":{"Shooting":6,"Melee":1},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"ArtsPatron54","title":"arts patron","titleShort":"patron","desc":"This pawn managed their family's investments in the arts.\nThis pawn chose artists to patronize and worked with them to produce the expressions that most glorify their family, the Imperial church, and the Empire itself.","skills":{"Social":5,"Artistic":5},"disabledWork":[],"requiredWork":["Social"],"traits":{"Nimble":0}},{"name":"AsceticPriest84","title":"ascetic priest","titleShort":"priest","desc":"After taking a vow of silence, This pawn joined a monastery to spend their days in quiet contemplation.\nThis pawn found happiness growing vegetables in the garden and making cheese in the monastery cellars.","skills":{"Plants":4,"Medicine":2,"Cooking":2},"disabledWork":["Violent","Social"],"requiredWork":["PlantWork","ManualDumb"],"traits":{"Ascetic":0}},{"name":"Assassin20","title":"assassin","titleShort":"assassin","desc":"This pawn was a professional assassin. This pawn was cold, calculating, and made a good profit. In this business, an utter lack of empathy was an asset.","skills":{"Melee":10,"Shooting":10},"disabledWork":["Intellectual","ManualDumb","ManualSkilled","Social","Caring"],"requiredWork":["Violent"],"traits":{"Psychopath":0}},{"name":"Assassin7","title":"assassin","titleShort":"assassin","desc":"This pawn was specially trained as an operative to be used for high-risk assassinations. their skill with a rifle was unrivalled.\nThis pawn was eventually betrayed by their superiors when a target found out about the hit and offered to fund their future projects. This pawn swore to never trust anyone again.","skills":{"Shooting":7,"Melee":4},"disabledWork":["Caring","Artistic","Crafting","Cooking","Cleaning","PlantWork"],"requiredWork":[],"traits":{}},{"name":"Assembler69","title":"assembler","titleShort":"assembler","desc":"This pawn worked on factory assembly lines, putting together products with the help of robots.","skills":{"Crafting":7},"disabledWork":[],"requiredWork":["ManualSkilled"],"traits":{}},{"name":"BalletDancer81","title":"ballet dancer","titleShort":"dancer","desc":"This pawn was a dancer in a traditional ballet troupe. This pawn mastered the ancient motions and entertained thousands.","skills":{"Social":3,"Melee":3},"disabledWork":[],"requiredWork":["Social"],"traits":{"Nimble":0}},{"name":"BanditLeader74","title":"bandit leader","titleShort":"bandit","desc":"This pawn rose up the ranks of the crime organization, eventually becoming the leader of one of their most remote cells of bandits. their dog Rest never left their side.","skills":{"Shooting":5,"Melee":5,"Social":2},"disabledWork":["Intellectual","Cleaning"],"requiredWork":[],"traits":{}},{"name":"Banished68","title":"banished","titleShort":"banished","desc":"This pawn's tribe banished them following a bloody dispute. This pawn survived in the wilds alone for a long time.","skills":{"Melee":3,"Shooting":2,"Plants":4},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"BanishedSoldier85","title":"banished soldier","titleShort":"outlaw","desc":"This pawn became the most physically intimidating of the slaves, spending their little free time obsessively sculpting their body. their efforts eventually paid off when the lord offered them a job as a personal bodyguard.\nLater, when This pawn plotted to use their position to kill the lord and free the slaves, This pawn was discovered and barely escaped with their life.","skills":{"Melee":7},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Bartender62","title":"bartender","titleShort":"barkeep","desc":"This pawn worked as a bartender in a seedy establishment. The job was one part drink-mixing, one part diplomacy, and one part head-bashing.","skills":{"Social":4,"Melee":2,"Cooking":2},"disabledWork":[],"requiredWork":["Social","Cooking"],"traits":{}},{"name":"BattleMechanic27","title":"battle mechanic","titleShort":"mechanic","desc":"This pawn was a tech-obsessed mercenary in an early fusion-era system.\nThis pawn was unusually obsessed with gathering the right gear, and often customized their own equipment with original modifications.","skills":{"Shooting":5,"Melee":3,"Crafting":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BattlefieldTech52","title":"battlefield tech","titleShort":"technician","desc":"This pawn had received firearms training, but their work was focused on technical adaptation and manipulation of combat mechanoids on the battlefield.\nThis pawn developed PTSD after narrowly escaping a primitive firebomb attack in a wheat field. The army medically discharged them from service.","skills":{"Construction":4,"Intellectual":4,"Shooting":3,"Cooking":-3,"Crafting":4},"disabledWork":["Firefighting","PlantWork"],"requiredWork":[],"traits":{}},{"name":"BeastSlayer67","title":"beast slayer","titleShort":"slayer","desc":"This pawn traveled between planets, following news of animal attacks. This pawn would camp on the planet for weeks, learning about their prey before striking. This pawn most enjoyed hunting thrumbos.\nPreferring to work alone, This pawn enjoyed the thrill of the hunt, and the meat from the kill.","skills":{"Plants":2,"Shooting":4,"Melee":4,"Cooking":3},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"Beastmaster67","title":"beastmaster","titleShort":"beastmaster","desc":"This pawn's family had more children than they had proper titles to inherit. Being of low rank in the birth order, This pawn was given the honorary title of beastmaster.\nThis pawn managed the family's extensive menagerie. While This pawn never worked hands-on with the beasts, This pawn connected with them. Few others appreciated them the way they did.","skills":{"Animals":8},"disabledWork":[],"requiredWork":["Animals"],"traits":{}},{"name":"BehaviourResearch74","title":"behaviour research","titleShort":"scientist","desc":"Captured as a feral child, This pawn was forced into the ways of modern society. This pawn quickly adapted and became a behavioural researcher, eventually owning a private facility.\nThis pawn specialized in canines, but learned a great deal about all animals. This pawn never had interest in plants, however.","skills":{"Plants":-3,"Intellectual":8,"Melee":1,"Social":2,"Cooking":-2,"Medicine":6},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"BiosphereManager95","title":"biosphere manager","titleShort":"botanist","desc":"This pawn lived on a peaceful glitterworld where all menial work was done by robots and people devoted themselves to leisure. This pawn managed the plant and animal life of a sprawling park, where citizens came to admire the natural beauty.","skills":{"Shooting":-4,"Animals":6,"Plants":6},"disabledWork":["ManualDumb","Crafting","Cooking"],"requiredWork":["Artistic"],"traits":{}},{"name":"Blacksmith72","title":"blacksmith","titleShort":"blacksmith","desc":"As a smith on a medieval world, This pawn gained a reputation for the high quality of their work. This pawn wasn't bad at using the swords This pawn forged either.","skills":{"Shooting":-5,"Melee":4,"Crafting":6},"disabledWork":["Intellectual"],"requiredWork":["ManualDumb","ManualSkilled"],"traits":{}},{"name":"Blacksmith7","title":"blacksmith","titleShort":"blacksmith","desc":"As a blacksmith on a medieval world, This pawn gained a reputation for the high quality of their work. This pawn wasn't bad at using the swords This pawn forged either.","skills":{"Mining":2,"Melee":2,"Crafting":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BlacksmithShooter21","title":"blacksmith shooter","titleShort":"gunsmith","desc":"As a young blacksmith, This pawn's family shop was raided by the police. This pawn shot two officers before they knocked them out and arrested him.\nSentenced to life in prison, This pawn learned about traveling and raiding from other criminals.","skills":{"Construction":3,"Shooting":5,"Crafting":3},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"BloodgameSurvivor6","title":"bloodgame survivor","titleShort":"bloodgamer","desc":"This pawn was sold to the Corestars Entertainment Company and used as meat in one of the company's system-wide broadcast shows.\n \ntheir manipulative nature made them quite a nightmare, even to the audience. This pawn was kicked out and exiled to a planet full of deadly animals, criminals and armed camera-drones.","skills":{"Construction":2,"Melee":7,"Social":6},"disabledWork":["Crafting"],"requiredWork":[],"traits":{}},{"name":"BloodyDentist9","title":"bloody dentist","titleShort":"dentist","desc":"After studying at a famous college, This pawn's weak personality eventually snapped under the strain of angry administrators and whining patients. This pawn went on a secret murder spree, killing many of those under their care.\nAfter a pursuit, This pawn managed to escape their planet and travel to a new world.","skills":{"Intellectual":4,"Medicine":6,"Artistic":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BloodyWanderer28","title":"bloody wanderer","titleShort":"wanderer","desc":"This pawn was a wanderer, traveling from town to town, taking odd jobs and stealing to live.\nOne day, This pawn had a mental break and went on a long rampage, destroying several towns and killing many. This pawn eventually calmed, but their bloodlust never left them.","skills":{"Construction":2,"Intellectual":-2,"Shooting":3,"Melee":4,"Crafting":2},"disabledWork":["Social","Firefighting"],"requiredWork":[],"traits":{"Bloodlust":0}},{"name":"Bodyguard58","title":"bodyguard","titleShort":"bodyguard","desc":"This pawn protected whoever paid them. This pawn gained proficiency in many different combat forms, and was known for their ruthlessness against those who crossed them.","skills":{"Shooting":4,"Melee":4},"disabledWork":["Social"],"requiredWork":["Violent"],"traits":{}},{"name":"BountyHunter93","title":"bounty hunter","titleShort":"hunter","desc":"When the civil war ended, This pawn had to find a new way to use their fighting skills. This pawn decided to hunt down war criminals and soon realized that This pawn enjoyed capturing bad guys by any means necessary.","skills":{"Shooting":5,"Melee":3,"Social":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BountyHunter17","title":"bounty hunter","titleShort":"hunter","desc":"This pawn was a self-employed bounty hunter. This pawn spent their days hunting space pirates and collecting cash bounties.","skills":{"Shooting":6,"Melee":4,"Medicine":2},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"BountyHunter41","title":"bounty hunter","titleShort":"hunter","desc":"This pawn was a bounty hunter on a massive glitterworld. This pawn worked sensitive assignments for extremely wealthy clients, and was known for quiet execution and total discretion.","skills":{"Shooting":8,"Melee":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Brave88","title":"brave","titleShort":"brave","desc":"This pawn wielded ikwa, axes, clubs, and other close-ranged weapons in battles for their tribe.","skills":{"Melee":7,"Shooting":2},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"Brigand68","title":"brigand","titleShort":"brigand","desc":"This pawn flew with a band of brigands This pawn called friends. This pawn even had a ship of their own - The Dung Mucker 2000.","skills":{"Construction":2,"Shooting":2,"Melee":3,"Cooking":2,"Medicine":1,"Crafting":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BrokenSoldier29","title":"broken soldier","titleShort":"soldier","desc":"This pawn was a strong soldier in a long war of succession. In their final battle, their unit was sacrified to cover a retreat. This pawn watched their comrades die and was the only survivor.\nThe experience broke them inside, leaving them without the coping strategies to moderate their emotions.\nThis pawn learned to draw in the hospital.","skills":{"Artistic":2},"disabledWork":["Violent"],"requiredWork":["Violent"],"traits":{"Nerves":-2}},{"name":"Builder96","title":"builder","titleShort":"builder","desc":"This pawn worked on construction sites, building everyday structures according to their boss' instructions.","skills":{"Construction":7},"disabledWork":[],"requiredWork":["ManualDumb","ManualSkilled"],"traits":{}},{"name":"BushSniper94","title":"bush sniper","titleShort":"sniper","desc":"This pawn's peaceful life was cut short when their country was brutally invaded.\nThis pawn was drafted into service as soon as This pawn was of legal age, and quickly showed an aptitude for rifles. This pawn spent months living in the forests picking off soldiers who dared cross the border.","skills":{"Plants":-3,"Shooting":6,"Cooking":2,"Artistic":-2,"Animals":4},"disabledWork":["Caring"],"requiredWork":[],"traits":{"ShootingAccuracy":1}},{"name":"BusinessGangster58","title":"business gangster","titleShort":"gangster","desc":"Staying one step ahead of the law, This pawn became a legitimate businessman and silenced anyone who dared say otherwise. As proprietor of brothels, speakeasies and eateries, This pawn's good fortune continued while their competition suffered a series of unfortunate and unexplained accidents.","skills":{"Shooting":3,"Melee":5,"Social":7,"Artistic":2},"disabledWork":["Caring","Cleaning","PlantWork"],"requiredWork":[],"traits":{"Greedy":0}},{"name":"Butcher40","title":"butcher","titleShort":"butcher","desc":"This pawn's main job in the hunting party was the butchering of animals. This pawn became a master with the knife, able to extract every bit of value from a carcass in a short time.","skills":{"Cooking":6,"Animals":3},"disabledWork":[],"requiredWork":["Violent","Animals"],"traits":{}},{"name":"Caravaneer53","title":"caravaneer","titleShort":"caravaneer","desc":"This pawn was the leader of a caravan. This pawn was responsible for the safety of their caravan and was the head negotiator in countless trade deals.\nThis pawn and their people prospered, but their wealth made them a target for brigands. They often had to take up arms to fend off bandits and highwaymen.","skills":{"Shooting":4,"Social":7},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CargoPilot58","title":"cargo pilot","titleShort":"pilot","desc":"This pawn was brought up by cargo hands on a long-haul ore transport ship. This pawn perfected their skills at trading and manipulation of people while running weapons between systems.","skills":{"Construction":2,"Mining":1,"Shooting":4,"Melee":2,"Social":1},"disabledWork":["Cooking","Cleaning"],"requiredWork":[],"traits":{}},{"name":"Carver1","title":"carver","titleShort":"carver","desc":"This pawn carved artworks for their tribe from wood, stone, and occasionally, more exotic materials. The work was sometimes sold, and sometimes kept to beautify settlements and provide a focus for rituals.","skills":{"Artistic":7},"disabledWork":[],"requiredWork":["Artistic"],"traits":{}},{"name":"CasketBuilder52","title":"casket builder","titleShort":"builder","desc":"This pawn was fascinated with cryptosleep, and spent their life learning about the mysterious technology.\nWorking as an assembler on a midworld, This pawn built an experimental prototype casket from discarded parts. Unfortunately, while This pawn was searching for the final component, their home was leveled by a bomb.","skills":{"Construction":4,"Intellectual":4,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Castaway57","title":"castaway","titleShort":"castaway","desc":"This pawn was the only survivor of a ship crash on an unhabited animal world. For many years until their rescue This pawn scrounged an existence out of whatever This pawn could find.\ntheir survival skills became razor-sharp, but spending so long alone severely dampened their conversatial abilities.","skills":{"Melee":5,"Animals":3,"Construction":4},"disabledWork":["Intellectual","Social","Artistic"],"requiredWork":["ManualDumb","PlantWork"],"traits":{}},{"name":"Castaway81","title":"castaway","titleShort":"castaway","desc":"This pawn was a passenger on a routine interstellar transit. When their ship was destroyed, This pawn lived as a castaway on an uninhabited planet for several years.","skills":{"Construction":2,"Plants":3,"Mining":2,"Cooking":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CaveBuilder81","title":"cave builder","titleShort":"cave builder","desc":"This pawn specialized in cave complex excavation and construction.","skills":{"Mining":8,"Construction":2},"disabledWork":[],"requiredWork":["Mining","Constructing"],"traits":{}},{"name":"CaveExplorer45","title":"cave explorer","titleShort":"cave explorer","desc":"This pawn made a living mapping out dark tunnels and near-inaccessible crevices in search of valuable minerals. their work was very dangerous, but the pay was good.","skills":{"Mining":8},"disabledWork":[],"requiredWork":["Mining"],"traits":{}},{"name":"CaveworldIlluminator95","title":"caveworld illuminator","titleShort":"illuminator","desc":"Among tunnel-dwellers, those with vision as strong as This pawn's are revered as sages. This pawn would lead the way, marking spots to dig with bioluminescent fungus and warning others of impending danger.","skills":{"Mining":3,"Social":2},"disabledWork":[],"requiredWork":["Mining","ManualSkilled"],"traits":{"Undergrounder":0}},{"name":"CharityWorker36","title":"charity worker","titleShort":"altruist","desc":"Glitterworlds are havens of safety and comfort for those lucky enough to live there, but This pawn could not ignore nearby planets where people suffered in poverty. This pawn spent their working life appealing for donations and supporting those in need.","skills":{"Social":6,"Mining":-3},"disabledWork":["Violent"],"requiredWork":["Caring","Social"],"traits":{}},{"name":"Chef52","title":"chef","titleShort":"chef","desc":"This pawn ran a high-class restaurant. This pawn was famous among patrons for their creative culinary specialties, and infamous among kitchen workers for their casual disdain for grunt work.","skills":{"Cooking":6,"Social":2},"disabledWork":["Cleaning","ManualDumb"],"requiredWork":["Cooking"],"traits":{}},{"name":"Chemist78","title":"chemist","titleShort":"chemist","desc":"This pawn was a renowned chemist on a thriving midworld.\nAfter performing inhumane experiments that turned men into beasts, This pawn was arrested and banished to a far-off rimworld.","skills":{"Intellectual":6,"Social":-3,"Crafting":6},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"Chemist73","title":"chemist","titleShort":"chemist","desc":"This pawn was a research chemist. This pawn worked with chemicals, from pharmaceuticals to explosives, to develop new substances and treatments.","skills":{"Intellectual":6,"Social":2,"Medicine":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ChiefEngineer62","title":"chief engineer","titleShort":"engineer","desc":"As chief engineer on board a large spaceship, This pawn was an expert in all things fiddly and complex.\nThis pawn relied on other members of the crew for some of the basic necessities of life. This pawn and their ship eventually disappeared into a longsleep voyage of exploration.","skills":{"Construction":3,"Intellectual":3,"Mining":2,"Social":-2,"Crafting":3},"disabledWork":["Animals"],"requiredWork":[],"traits":{}},{"name":"ChurchPsychic98","title":"church psychic","titleShort":"psychic","desc":"This pawn was a psychic in the imperial church's psychic school.\nThis pawn trained their mind to sense the collective emotions and impressions of the people. It was a way to touch the spirit of the empire. It was also a way to root out heretical trends in thought.","skills":{"Social":3,"Intellectual":5},"disabledWork":[],"requiredWork":["Social","Intellectual"],"traits":{"PsychicSensitivity":2}},{"name":"CivilEngineer2","title":"civil engineer","titleShort":"engineer","desc":"This pawn was a well-known civil engineer. their job involved designing and maintaining rock fortification structures. This pawn did enough statistical analysis to keep their mind sharp.","skills":{"Construction":7,"Intellectual":3,"Mining":2,"Social":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CivilServant2","title":"civil servant","titleShort":"bureaucrat","desc":"This pawn worked as a low-ranking administrator for a moribund government bureaucracy. This pawn is most at home filling out complicated paperwork and playing office politics.","skills":{"Social":3,"Intellectual":3,"Construction":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ClanChief14","title":"clan chief","titleShort":"chief","desc":"This pawn managed a small criminal clan on an outlying trade hub world.","skills":{"Shooting":6,"Social":7},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"CloneFarmer58","title":"clone farmer","titleShort":"cloner","desc":"Harvesting the products of clone farms is mostly done by the clones themselves - particularly to those whose sims tended towards the social. This clone was one such, who escaped from the farms and headed out to the stars.","skills":{"Social":6,"Medicine":4,"Crafting":2},"disabledWork":["Cooking","Firefighting","Mining"],"requiredWork":[],"traits":{}},{"name":"ColiseumFighter22","title":"coliseum fighter","titleShort":"fighter","desc":"Applying the knowledge that This pawn gained from years around fighters, This pawn became a successful gladiator in the coliseum that This pawn once cleaned.","skills":{"Intellectual":2,"Shooting":5,"Social":-1,"Crafting":3},"disabledWork":["Caring","Artistic","PlantWork","Mining"],"requiredWork":[],"traits":{"Brawler":0}},{"name":"ColonialGovernor78","title":"colonial governor","titleShort":"governor","desc":"Disillusioned by rampant government corruption, This pawn ran for governor and won. However, the local gangs and their pet officials soon forced them out of power.\nThis pawn left the community to return to their life as a marshal.","skills":{"Construction":3,"Shooting":1,"Social":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ColonyEngineer7","title":"colony engineer","titleShort":"engineer","desc":"The children took over the facility, and they declared independence from the corporation.\nThis pawn had used the VR system to become a master engineer, and This pawn worked diligently to prepare the colony for the corporation's inevitable return.","skills":{"Construction":7,"Intellectual":4,"Medicine":-3,"Crafting":4},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"ColonySettler53","title":"colony settler","titleShort":"settler","desc":"This pawn was a settler on a new colony world.\nSuch a life requires a jack-of-all trades at basic hands-on tasks.","skills":{"Construction":4,"Plants":4,"Mining":4},"disabledWork":[],"requiredWork":["ManualDumb","ManualSkilled"],"traits":{}},{"name":"CombatEngineer30","title":"combat engineer","titleShort":"engineer","desc":"This pawn was recruited by the military as an engineer and set to work improving the navy's space shuttles. The harsh training taught them how to build and repair military vehicles and structures.\nOne mission left This pawn with pyrophobia and a strong desire to avoid plants.","skills":{"Construction":6,"Intellectual":3,"Shooting":4,"Social":-3,"Cooking":-2,"Medicine":2,"Crafting":2},"disabledWork":["Artistic","Firefighting","PlantWork"],"requiredWork":[],"traits":{}},{"name":"CombatEngineer4","title":"combat engineer","titleShort":"engineer","desc":"This pawn became a combat engineer. This pawn built bases, fixed guns, and repaired vehicles for the army - when This pawn wasn't shooting at people, that is.","skills":{"Construction":2,"Shooting":5,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CombatMedic82","title":"combat medic","titleShort":"medic","desc":"After their home country entered a large-scale war, This pawn was drafted into the army as a combat medic.\ntheir few years in the trenches trying to keep their fellow soldiers alive gave them an acute sense for first aid. Losing many friend has made them stoic and reserved.","skills":{"Shooting":2,"Melee":1,"Medicine":6,"Artistic":-2},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"CombatMedtech59","title":"combat medtech","titleShort":"medic","desc":"As a military medtech, This pawn's job was to fix and build anything This pawn could get their hands on, from living people to machines and mechs.\nSent into dangerous areas, This pawn never had a problem saving soldiers' lives and building the technology and machines needed to win.","skills":{"Construction":3,"Intellectual":1,"Medicine":5,"Crafting":5},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"CombatNegotiator31","title":"combat negotiator","titleShort":"negotiator","desc":"After escaping their homeworld, This pawn took their skills to the stars.\nThis pawn chose to operate as a hired gun, working for various rebel organizations, enslaved groups, and merchant enclaves. their specialty was negotiation in combat situations.","skills":{"Shooting":4,"Melee":3,"Social":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CommonerLord45","title":"commoner lord","titleShort":"lord","desc":"After years of training in martial arts and diplomacy, This pawn was eventually given land and subjects of their own to rule.\n        Because of This pawn's commoner heritage, the other lords disapproved. They framed them for a heinous crime, and the emperor had no choice but to exile them.","skills":{"Melee":7,"Social":6},"disabledWork":["Cooking","Cleaning"],"requiredWork":[],"traits":{}},{"name":"ComputerEngineer10","title":"computer engineer","titleShort":"tech head","desc":"Bored of their code-monkey office job and missing the glory days of the Academy, This pawn saw a commercial about the frontier where \"only the strong survive\".\nWith their wife Morgan, This pawn undertook a journey into the unknown.","skills":{"Intellectual":8,"Social":4,"Crafting":2},"disabledWork":["ManualDumb","Violent"],"requiredWork":[],"traits":{}},{"name":"ComputerEngineer36","title":"computer engineer","titleShort":"engineer","desc":"Leveraging their childhood experience, This pawn became a computer engineer. This pawn also learned to craft delicate sculptures and random electronics for fun.\n        This pawn became fond of technology and mostly gave up on talking to people. Using computers as friends has left This pawn unable to care for others.","skills":{"Intellectual":6,"Social":-2,"Artistic":2,"Crafting":5},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"ConArtist80","title":"con artist","titleShort":"con artist","desc":"This pawn never created anything in their life. This pawn did, however, prove to be a natural at getting others to give them what they had created.","skills":{"Social":10},"disabledWork":["Violent"],"requiredWork":["Social"],"traits":{}},{"name":"ConceptualArtist39","title":"conceptual artist","titleShort":"artist","desc":"This pawn was well-known in art circles on their home world for their unique and creative conceptual artworks.\nNobody was sure exactly what This pawn was trying to communicate, but their pieces were highly valued by collectors.","skills":{"Artistic":8,"Crafting":1},"disabledWork":["Social","Caring","Hauling"],"requiredWork":["Artistic"],"traits":{}},{"name":"ConstructionEngineer32","title":"construction engineer","titleShort":"builder","desc":"This pawn was a construction worker. This pawn lead a team which built everything from office blocks to cathedrals.\ntheir busy job and numerous nearby fast-food outlets meant This pawn never cooked for themself.","skills":{"Construction":8,"Plants":-3},"disabledWork":["Intellectual","Cooking"],"requiredWork":["ManualSkilled"],"traits":{}},{"name":"ContractMiner86","title":"contract miner","titleShort":"contract miner","desc":"This pawn moved from job to job, extracting minerals and ancient valuables in tunnels and strip-mines. The work was tough and dirty, but This pawn found it rewarding.","skills":{"Mining":8},"disabledWork":[],"requiredWork":["Mining"],"traits":{}},{"name":"CoreworldJeweler19","title":"coreworld jeweler","titleShort":"jeweler","desc":"After This pawn had completed all of their surgeries, This pawn found that This pawn had a lot of time and energy to dedicate to their passion: trinket crafting. This pawn spent years perfecting their art as a jeweler, then left their home world to sell their wares across the galaxy.","skills":{"Construction":3,"Shooting":-3,"Artistic":5,"Crafting":7},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CorpResearcher93","title":"corp researcher","titleShort":"researcher","desc":"This pawn was a leading researcher for a massive space exploration corporation.","skills":{"Intellectual":8,"Social":3,"Cooking":-2,"Medicine":6,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CorpResearcher71","title":"corp researcher","titleShort":"researcher","desc":"This pawn was sold to a corporation and put to work as a corporate slave doing scientific research.\nUnable to adapt to the social politics of their workplace, This pawn buried themself in their work and failed to progress up the corporate ladder. Every day, This pawn yearned to be left alone.","skills":{"Intellectual":8,"Shooting":-3,"Melee":-3,"Medicine":4,"Crafting":4},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"CorporateBuilder58","title":"corporate builder","titleShort":"builder","desc":"Even as This pawn stewed in their own wasted potential, This pawn found This pawn had a knack for moving objects quickly. It was just what the planetary mega-corps wanted in their construction divisions.\nUnfortunately, the monotonous work erased their remaining creative impulses.","skills":{"Construction":7,"Mining":4},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"CorporateDrone10","title":"corporate drone","titleShort":"drone","desc":"This pawn worked in a very large office complex along with thousands of other suited drones.\nThe work itself consisted of endless organizational drudgery and pointless meetings, punctuated by the occasional performance review.","skills":{"Social":2,"Intellectual":4},"disabledWork":[],"requiredWork":["Intellectual"],"traits":{}},{"name":"CorporateFixer36","title":"corporate fixer","titleShort":"fixer","desc":"This pawn was a fixer for an energy corporation. This pawn work required knowing when to push, when to pull, when to back down and when to strike. The job fit their natural lack of empathy.\nWhile violence was unusual, This pawn stayed prepared for anything.","skills":{"Social":4,"Shooting":3,"Melee":3},"disabledWork":[],"requiredWork":["Social","Violent"],"traits":{"Psychopath":0}},{"name":"CorporateManager76","title":"corporate manager","titleShort":"manager","desc":"This pawn worked in a massive open-plan office, ensuring that their assigned team of workers stayed mostly on-task.\nThe job was intensely political. In order to advance, This pawn learned how to arrange things so This pawn could take credit for work done by almost anyone.","skills":{"Social":6,"Intellectual":2},"disabledWork":[],"requiredWork":["Social"],"traits":{}},{"name":"CosmeticReject64","title":"cosmetic reject","titleShort":"reject","desc":"Living on the streets, This pawn submitted themself to an unethical cosmetics lab in exchange for food and shelter.\nAfter some painful cosmetic modification, This pawn barely resembles their former self. Having been forced to work for the lab until This pawn was rescued, This pawn is now too afraid to lash out at anyone.","skills":{"Construction":4,"Cooking":5},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"CosmeticSurgeon36","title":"cosmetic surgeon","titleShort":"surgeon","desc":"This pawn had a terrible bedside manner due to their abrasiveness. This pawn often bullied their patients into getting cosmetic surgery. This pawn made a lot of money this way.\nWhile very studious and careful in their work, This pawn never had to lift a finger doing domestic chores.","skills":{"Intellectual":3,"Medicine":8,"Artistic":6},"disabledWork":["Cooking"],"requiredWork":[],"traits":{"Abrasive":0}},{"name":"CostumeCrafter41","title":"costume crafter","titleShort":"costumer","desc":"By day, This pawn was an office worker on a midworld. At night, This pawn designed and built elaborate monster costumes for science fiction conventions.\nThis pawn learned a great deal about sewing. Unfortunately this came at the cost of being able to cook anything more complex than an instant meal.","skills":{"Intellectual":4,"Crafting":8},"disabledWork":["Cooking"],"requiredWork":[],"traits":{}},{"name":"Counselor26","title":"counselor","titleShort":"counselor","desc":"A terrifying trauma when This pawn was a young adult caused them to develop a serious eating disorder. With counseling This pawn learned to have a healthier relationship with food, and decided to put their new skills to use helping others overcome their emotional problems.","skills":{"Social":9},"disabledWork":["Cooking"],"requiredWork":["Social"],"traits":{}},{"name":"CraftShaper37","title":"craft shaper","titleShort":"shaper","desc":"This pawn locked themself in their studio for years, ordering delivery food to save time on cooking.\nEventually, their creations brought them the highest honor on Semantic World: Permission to materialize any design in minutes using the most advanced technologies.","skills":{"Construction":4,"Social":-3,"Artistic":5,"Crafting":8},"disabledWork":["Cooking","Cleaning"],"requiredWork":[],"traits":{}},{"name":"CrimeLord10","title":"crime lord","titleShort":"crime lord","desc":"Through brutality and cruelty, This pawn rose to become a crime lord.\nThis pawn relied less on their fists and more on their guns. their reputation spread quickly due to their cold-bloodedness and ruthless methods.","skills":{"Intellectual":2,"Shooting":6,"Melee":2,"Social":3},"disabledWork":["Caring","Artistic","Cleaning"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"CriminalKingpin36","title":"criminal kingpin","titleShort":"kingpin","desc":"This pawn discovered their gift - people did what This pawn said, when This pawn said it. Taking advantage of this, This pawn set off for the rimworlds to make a name for themself in the criminal underworld.\nHaving people do things for them taught them to avoid manual labor at all costs.","skills":{"Shooting":2,"Melee":2,"Social":5},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"CriminalSurgeon99","title":"criminal surgeon","titleShort":"surgeon","desc":"Being near many injured fellow criminals, This pawn took it upon themself to work on them.\nAlthough many people died, This pawn did get better at using knives.","skills":{"Intellectual":-3,"Melee":6,"Social":-2,"Medicine":5,"Artistic":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CropFarmer17","title":"crop farmer","titleShort":"farmer","desc":"This pawn ran a crop farm. This pawn analyzed soil, agricultural equipment, weather patterns, and price trends to optimize the planting and harvesting of massive crop fields.","skills":{"Plants":8},"disabledWork":[],"requiredWork":["PlantWork"],"traits":{}},{"name":"DeepSpaceMiner3","title":"deep space miner","titleShort":"miner","desc":"This pawn did the sweaty, grimy work of pulling metal out of asteroids on a deep space rig. This pawn used their hands-on industrial skills daily - and wasn't bad in a bar fight either.","skills":{"Mining":7,"Construction":3,"Melee":2},"disabledWork":[],"requiredWork":["ManualDumb","ManualSkilled"],"traits":{}},{"name":"DeepSpaceSurveyor1","title":"deep space surveyor","titleShort":"surveyor","desc":"This pawn was a deep space surveyor. This pawn studied which worlds were the most suitable for colonization.\ntheir expeditions were met by hostile natives, green-painted space-women, and wannabe Greek gods. Surviving many firefights, This pawn learned to build rudimentary lathes and rock cannons to fend off enemies.","skills":{"Construction":4,"Plants":-3,"Intellectual":6,"Shooting":4,"Social":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Defector78","title":"defector","titleShort":"defector","desc":"Early in their adulthood, This pawn decided to leave the oppressive dictatorship where This pawn lived. their defection was not well-received, and agents were sent out after them.\nThis pawn spent years on the run, treating their own wounds so no doctor could betray them. The ordeal made them bitter and untrusting.","skills":{"Shooting":5,"Social":-4,"Medicine":3},"disabledWork":["Artistic"],"requiredWork":["Violent","Caring"],"traits":{}},{"name":"Defector95","title":"defector","titleShort":"defector","desc":"This pawn decided to leave the oppressive dictatorship where This pawn lived. their defection was not well-received, and agents were sent after them.\nThis pawn spent years on the run. Since This pawn could trust no doctor, This pawn treated their own wounds. The ordeal made them bitter and untrusting.","skills":{"Construction":3,"Shooting":4,"Melee":2,"Social":-2,"Medicine":4,"Crafting":3},"disabledWork":["Animals","Artistic"],"requiredWork":[],"traits":{}},{"name":"DefenseLawyer71","title":"defense lawyer","titleShort":"lawyer","desc":"This pawn found that This pawn could make more money with a quick word than a blaster. Seeking a job where their silver tongue could be useful, This pawn turned to the law.\nThis pawn often defended the illegal speeder racers This pawn grew up with.","skills":{"Intellectual":5,"Shooting":3,"Social":8},"disabledWork":["ManualDumb","ManualSkilled","Caring"],"requiredWork":[],"traits":{}},{"name":"Demolitionist39","title":"demolitionist","titleShort":"demolitionist","desc":"This pawn manufactured and planted explosives used to breach enemy defenses. Dealing with explosives every day taught them to keep a level head and steady hand.","skills":{"Shooting":4,"Crafting":4},"disabledWork":[],"requiredWork":["Violent"],"traits":{"Nerves":1}},{"name":"Deserter65","title":"deserter","titleShort":"deserter","desc":"After countless battles for a cause This pawn did not believe in, This pawn threw down their arms and deserted. This pawn lived in isolation, hunted by those This pawn had deserted.","skills":{"Shooting":4,"Melee":2,"Crafting":2},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"DestroyerGeneral26","title":"destroyer-general","titleShort":"general","desc":"This pawn held the rank of Destroyer-General in a powerful midworld military.\nThis pawn was known for their mastery of weapons, and was also a good ship pilot.","skills":{"Shooting":6,"Melee":3,"Social":6,"Artistic":-3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"Digger66","title":"digger","titleShort":"digger","desc":"This pawn carved living spaces and mined minerals from the sides of hills and mountains. This pawn learned to feel at home picking through rock and shoring up cave walls.","skills":{"Mining":6,"Construction":2},"disabledWork":[],"requiredWork":["Mining"],"traits":{"Undergrounder":0}},{"name":"Digger31","title":"digger","titleShort":"digger","desc":"This pawn labored in mines and caves, digging out spaces for storing items and hiding from threats. their work provided hiding spots for their friends on many occasions.","skills":{"Mining":8},"disabledWork":[],"requiredWork":["Mining"],"traits":{}},{"name":"DischargedSoldier53","title":"discharged soldier","titleShort":"soldier","desc":"This pawn prostituted themself to fund their drug habits. As an escape, This pawn joined the military and learned to fight.\nToo smart for the army, This pawn questioned and often disagreed with their superiors' decisions. This eventually led to their dishonorable discharge and left them with a chip on their shoulder.","skills":{"Shooting":6,"Melee":4,"Cooking":2},"disabledWork":[],"requiredWork":[],"traits":{"DrugDesire":2,"TooSmart":0}},{"name":"DisgracedOfficer19","title":"disgraced officer","titleShort":"officer","desc":"This pawn was an officer in an imperial battalion. This pawn developed the social and combat skills to do their job well and was respected by the men.\nWhen their unit came under direct fire for the first time, This pawn fled to a bunker and hid. This pawn was demoted and never escaped the disgrace.","skills":{"Social":4,"Shooting":5},"disabledWork":[],"requiredWork":["Violent"],"traits":{"Wimp":0}},{"name":"DoomsdayPariah18","title":"doomsday pariah","titleShort":"pariah","desc":"This pawn managed to open a vault of otherworldly technology while scavenging a dig site. This pawn unwittingly triggered a doomsday device that cleansed the planet of all life. More interested in the tech than human life, This pawn boarded the vault's spacecraft and departed to find more relics to abuse.","skills":{"Construction":2,"Intellectual":3,"Shooting":2,"Melee":2,"Crafting":2},"disabledWork":["Caring","Artistic"],"requiredWork":[],"traits":{}},{"name":"DreadedDude58","title":"dreaded dude","titleShort":"dude","desc":"Some followers say that This pawn and their crew of misfits found the fountain of youth, many, many centuries ago, and that they caused the extinction of the dinosaurs on many planets.\nThere's even a religion about them, somewhere, involving noodles and meatballs.","skills":{"Intellectual":6,"Mining":-3,"Medicine":2,"Artistic":8,"Crafting":4},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"Drifter67","title":"drifter","titleShort":"drifter","desc":"This pawn never figured out what to do with their life. This pawn travelled often, taking up casual work wherever This pawn found it.\nThis pawn also occasionally worked on a novel that This pawn knew would be a bestseller - just as soon as This pawn could find a publisher who was interested.","skills":{"Cooking":3,"Construction":3,"Artistic":-4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"DromedaryKnight37","title":"dromedary knight","titleShort":"knight","desc":"Having caught the eye of their people's Sand King, This pawn was trained in the Sandy Boomrat fighting technique.\nAlways with a camel to carry their things, This pawn served their sand people faithfully.","skills":{"Shooting":-3,"Melee":4,"Social":4,"Animals":4},"disabledWork":["Hauling"],"requiredWork":[],"traits":{}},{"name":"DrugLieutenant98","title":"drug lieutenant","titleShort":"drugman","desc":"This pawn worked the drug trade under kingpin Grady Loughman. This pawn had their men sell drugs when it was profitable, and fight the other cartels when the government came around.\ntheir social skills kept them on top of the political game, and This pawn always had servants to cook and clean.","skills":{"Plants":4,"Social":7,"Medicine":7},"disabledWork":["Artistic","Cooking","Cleaning"],"requiredWork":[],"traits":{}},{"name":"EnergyResearcher89","title":"energy researcher","titleShort":"researcher","desc":"This pawn was working on an idea for rapid communication over long distances. This pawn made an error which destroyed their lab and several nearby buildings. This pawn fled the planet to escape the authorities.","skills":{"Intellectual":8,"Social":-2,"Artistic":-1,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Engineer40","title":"engineer","titleShort":"engineer","desc":"This pawn found a job as a tinkering engineer on the trading hub planet Irithir. Tough local traders forced them to learn negotiation skills, and This pawn made good profits selling refurbished weapons and tools.","skills":{"Construction":2,"Intellectual":1,"Social":2,"Cooking":-2,"Crafting":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"EngineeredPilot75","title":"engineered pilot","titleShort":"pilot","desc":"After their province was besieged by one of its neighbors, This pawn volunteered for a generic modification program that created pilots for the very fighter craft that This pawn had helped develop. The modifications allowed them to pilot the ship, but also made them less able to focus on the people around him.\nBy this time, people were calling them \"Squirrel.\"","skills":{"Shooting":5,"Melee":2,"Social":-2,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"EnvoyOfTheStars19","title":"envoy of the stars","titleShort":"envoy","desc":"This pawn entered the diplomatic corps. Honor and tradition were the values This pawn took with them on every mission.\ntheir prestigious position distanced them from backbreaking manual labor, allowing them to focus on their wordsmithing abilities. This pawn left the blacksmithing to others.","skills":{"Shooting":1,"Social":8,"Medicine":2,"Artistic":2},"disabledWork":["ManualDumb","ManualSkilled"],"requiredWork":[],"traits":{}},{"name":"EscapedConvict90","title":"escaped convict","titleShort":"escapee","desc":"This pawn denies involvement in the crimes that brought about their incarceration in a brutal penal colony. This pawn escaped by tunneling beneath the perimeter using modified cutlery.","skills":{"Mining":4,"Crafting":2},"disabledWork":["Caring"],"requiredWork":["Violent"],"traits":{}},{"name":"Evangelist39","title":"evangelist","titleShort":"evangelist","desc":"As a youth, This pawn experienced a religious awakening. This pawn decided to spend the rest of their life spreading the word of their deity, the beauty of its culture, and its unusual medical tradition.","skills":{"Social":4,"Artistic":4,"Medicine":-3},"disabledWork":[],"requiredWork":["Social","Caring"],"traits":{}},{"name":"Excavator55","title":"excavator","titleShort":"excavator","desc":"This pawn worked at dig sites, extracting valuable items and materials from ancient compacted ruins. This pawn learned how to spot valuables in the ground and use a variety of excavating tools.","skills":{"Mining":8},"disabledWork":[],"requiredWork":["Mining"],"traits":{}},{"name":"ExecutiveOfficer5","title":"executive officer","titleShort":"executive","desc":"This pawn was an executive officer for a large space trading corporation. After a failed attempt at manipulating their way up the corporate ladder, This pawn was framed for the rape and murder of another executive and their family.\nThis pawn was found guilty. However, because of their family's influence, This pawn was exiled instead of put to death.","skills":{"Construction":3,"Intellectual":4,"Melee":2,"Social":7},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"ExiledResearcher44","title":"exiled researcher","titleShort":"exile","desc":"This pawn's love of robotics was not appreciated in their technophobic empire. The High Cardinal of the system excommunicated her, and This pawn was never allowed to return.","skills":{"Intellectual":8,"Shooting":2,"Medicine":4,"Artistic":2,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ExoticChef96","title":"exotic chef","titleShort":"chef","desc":"This pawn has always gone overboard when it comes to food. This pawn is always seeking new and exotic ingredients.\ntheir quest for ingredients has brought them into some close calls with local flora and fauna.","skills":{"Cooking":6,"Artistic":2,"Crafting":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ExpertHandyman8","title":"expert handyman","titleShort":"handyman","desc":"This pawn worked as a traveling engineer. This pawn fixed things ranging from a simple communications array to the intricate software harness enveloping their ship's AI persona. Nothing is beyond repair for them.","skills":{"Construction":7,"Intellectual":4,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Explorer49","title":"explorer","titleShort":"explorer","desc":"This pawn traveled from planet to planet, gathering samples, stories, and research. This pawn hoped one day to compile a record of every animal, plant, mineral, and machine and device in known space: The Complete Traveler's Guide to the RimWorlds.","skills":{"Intellectual":3,"Mining":3,"Shooting":2,"Melee":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ExplorerWriter10","title":"explorer-writer","titleShort":"explorer","desc":"This pawn traveled from planet to planet, gathering samples, stories, and research. \ntheir goal was to bring together enough knowledge to make a survival guide for future generations.","skills":{"Construction":3,"Plants":3,"Intellectual":4,"Cooking":2,"Medicine":3,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ExplosivesExpert26","title":"explosives expert","titleShort":"blaster","desc":"This pawn was an explosive engineer employed in mines. This pawn took their job very seriously and was well-versed in the technicalities - so much so that This pawn refused to demean themself by helping with the clean-up once their carefully-calculated explosion was complete.","skills":{"Mining":5,"Intellectual":5},"disabledWork":["ManualDumb"],"requiredWork":["Violent"],"traits":{}},{"name":"FactionLeader74","title":"faction leader","titleShort":"leader","desc":"Early in their adulthood, This pawn found themself surrounded by a gaggle of low-lifes. \nFor fun, This pawn gathered them and lead them to a certain death. This pawn knew then that This pawn had the talent to realize their ambitions of leadership.","skills":{"Intellectual":3,"Melee":2,"Social":8,"Medicine":2},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"FactoryWorker58","title":"factory worker","titleShort":"worker","desc":"This pawn did menial, unskilled work in an industrial factory. their job also included caring for the mules and horses which transported the goods.","skills":{"Animals":3,"Construction":3,"Crafting":2},"disabledWork":["Intellectual","Artistic","Cooking"],"requiredWork":["ManualDumb","ManualSkilled","Animals"],"traits":{}},{"name":"FallenOfficial12","title":"fallen official","titleShort":"official","desc":"This pawn was an official for an autocratic government.\nWhen their superiors demanded This pawn participate in atrocities, This pawn resigned and escaped from their homeworld with nothing but the clothes on their back.","skills":{"Melee":2,"Social":5,"Medicine":2},"disabledWork":["ManualSkilled"],"requiredWork":[],"traits":{}},{"name":"FearfulChef49","title":"fearful chef","titleShort":"chef","desc":"This pawn was a excellent chef who worked in a high-end restaurant.\nOne day, This pawn left the stove on, and accidentally burned down the whole building. This event shook them so much that This pawn swore to never touch a stove again.","skills":{"Plants":2,"Intellectual":2,"Medicine":2},"disabledWork":["Cooking","Firefighting"],"requiredWork":[],"traits":{}},{"name":"FelineScientist76","title":"feline scientist","titleShort":"scientist","desc":"This pawn became a renowned scientist in the field of felines. Wanting the best for their animals and specializing in selective breeding, This pawn set out on a journey to find the perfect breeding grounds for their cats.","skills":{"Intellectual":4,"Social":2,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"FerventResearcher72","title":"fervent researcher","titleShort":"researcher","desc":"As a young adult, This pawn was sure that their planet and its people were nearing their time of transcendence.\nA firm belief that their research would be the catalyst drove them to increasingly alarming acts as bureaucrats and bioethics committees worked to stall their progress.","skills":{"Intellectual":6,"Shooting":2,"Medicine":8},"disabledWork":["ManualDumb","ManualSkilled"],"requiredWork":[],"traits":{"Transhumanist":0}},{"name":"FighterController67","title":"fighter controller","titleShort":"controller","desc":"During the Zartha crisis, This pawn fought across many worlds, providing the vital link between the ground and the air as a fighter controller. During the campaign, This pawn saw friends injured and killed. This mental trauma haunts their dreams to this day, but their aim remains sharp.","skills":{"Shooting":5,"Melee":5,"Social":2,"Cooking":1,"Medicine":3},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"Firebomber51","title":"firebomber","titleShort":"firebomber","desc":"This pawn piloted a small fighter-bomber design specialized in spreading incendiary gel on flammable targets.\nConditioned to love the sight of a target lighting up, This pawn grew to love fire in all its forms - war, cooking, and even for cauterizing wounds in the hospital.","skills":{"Shooting":3,"Cooking":3,"Medicine":2},"disabledWork":[],"requiredWork":["Violent"],"traits":{"Pyromaniac":0}},{"name":"Flaneur30","title":"flaneur","titleShort":"flaneur","desc":"This pawn strolled and sipped their way through the streets and cafes of their world, pursuing freedom at every turn, never becoming attached.\nThrough all this time, This pawn remained distrustful of others. And never took an order from anyone.","skills":{"Intellectual":3,"Social":6,"Cooking":3,"Artistic":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ForestProwler15","title":"forest prowler","titleShort":"prowler","desc":"This pawn led a band of wild men in the forest. They foraged for food, hunted, and sometimes murdered more civilized people to steal their shiny objects.","skills":{"Melee":3,"Social":4,"Crafting":2},"disabledWork":["Mining"],"requiredWork":[],"traits":{}},{"name":"Forester96","title":"forester","titleShort":"forester","desc":"This pawn grew and harvested forests. This pawn understood both the practical challenges of soil types, wind, and rain, as well as the long-term planning of forest growth.","skills":{"Plants":6},"disabledWork":[],"requiredWork":["PlantWork"],"traits":{}},{"name":"Framer37","title":"framer","titleShort":"framer","desc":"This pawn was responsible for erecting structures for their fellow tribespeople to live in. This included both temporary structures for nomadic travel, and permanent settlements. Gathering building materials from local plant life was part of the job.","skills":{"Construction":6,"Plants":2},"disabledWork":[],"requiredWork":["ManualSkilled"],"traits":{}},{"name":"FrontierMarshal27","title":"frontier marshal","titleShort":"marshal","desc":"This pawn was the marshal of their colony. This pawn tried to honorably uphold the law, but the corrupt local mayor killed their family and left them for dead.\nAfter regaining their health, This pawn arrested the mayor. This pawn left their homeworld and started a new life working to make a difference in the universe.","skills":{"Shooting":5,"Social":4,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Fugitive4","title":"fugitive","titleShort":"fugitive","desc":"This pawn rebelled against the corporation This pawn worked for. This pawn failed, and was forced them to go on the run.\nThis pawn was always on the move, always leaving everything behind. This pawn tried to gain supporters for their cause, but failed due to their poor social skills.","skills":{"Plants":3,"Social":-2,"Cooking":4,"Medicine":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"FurnitureBuilder83","title":"furniture builder","titleShort":"builder","desc":"This pawn grew up near forests. This pawn spent their time building beautiful furniture for wealthy glitterworld clients.","skills":{"Construction":4,"Plants":3},"disabledWork":[],"requiredWork":["PlantWork","Constructing"],"traits":{}},{"name":"GameDeveloper95","title":"game developer","titleShort":"game dev","desc":"This pawn was an independent game developer.\nAfter an early success, their career quickly degenerated into a circus of misguided ideas, deals gone wrong, and desperate, failed PR stunts.","skills":{"Construction":-2,"Mining":-2},"disabledWork":[],"requiredWork":[],"traits":{"Industriousness":-2}},{"name":"GameTester77","title":"game tester","titleShort":"tester","desc":"Making a new life on a barely-livable planet after nuclear war, This pawn was able to fulfill their desires with money borrowed from their father.\nThis pawn loved playing a particular colony simulator. their favorite thing to do in the game was to build elaborate hospitals. Spending most of their time playing, This pawn forgot horrors of war and their need for revenge.","skills":{"Intellectual":5,"Shooting":4,"Melee":4,"Social":-2,"Medicine":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"GangBoss49","title":"gang boss","titleShort":"boss","desc":"To survive, This pawn's gang often had to rob trade ships for food and supplies. Sometimes This pawn had to kill the guards. Sometimes This pawn had to kill the police who arrived to stop him.\nAfter years of this, This pawn became one of the most-wanted criminals in the local empire.","skills":{"Construction":4,"Shooting":8,"Melee":6,"Social":-3,"Medicine":3},"disabledWork":["Animals"],"requiredWork":[],"traits":{}},{"name":"GangSoldier39","title":"gang soldier","titleShort":"soldier","desc":"Living for many years between three raider settlements, This pawn persevered through many challenges: a spacecraft implosion, cryptostasis, crashlanding on a miserable dustball of a planet, and nursing an old man back to health, and many of battles.\nThis pawn eventually took control of a violent gang.","skills":{"Construction":2,"Shooting":6,"Melee":3,"Cooking":2,"Medicine":2},"disabledWork":["Artistic","Hauling"],"requiredWork":[],"traits":{}},{"name":"Gardener99","title":"gardener","titleShort":"gardener","desc":"This pawn worked at the mansion of a powerful family, tending the lavish gardens as part of a team of servants.","skills":{"Plants":8},"disabledWork":["Intellectual","Crafting"],"requiredWork":["ManualDumb","PlantWork"],"traits":{}},{"name":"Gatherer70","title":"gatherer","titleShort":"gatherer","desc":"Using their knowledge of plants, roots, and berries, This pawn could find food in even the most barren landscapes. This pawn stayed away from animals.","skills":{"Plants":8,"Animals":-2},"disabledWork":[],"requiredWork":["PlantWork"],"traits":{}},{"name":"GeneticEngineer89","title":"genetic engineer","titleShort":"geneticist","desc":"This pawn carried out their first genetic experiments on farm animals. This pawn soon grew to become quite skilled in all forms of genetic engineering.\nA horrifying lab accident left them with a mortal fear of rodents.","skills":{"Plants":1,"Intellectual":6,"Medicine":2},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"GeneticScientist66","title":"genetic scientist","titleShort":"geneticist","desc":"After the war This pawn joined a genetic engineering firm. This pawn worked on enhancements for humans and livestock. their experience in inflicting and healing wounds was very beneficial to their work, but This pawn developed a black sense of humor. This made social gatherings awkward.","skills":{"Intellectual":4,"Shooting":2,"Medicine":3},"disabledWork":["Social","Artistic","Crafting","Cooking"],"requiredWork":[],"traits":{"Abrasive":0}},{"name":"Geologist66","title":"geologist","titleShort":"geologist","desc":"This pawn worked with miners and cave-diggers, identifying rock types and natural formations.\nDuring their years underground This pawn also gained experience repairing drilling machines and other technical equipment.","skills":{"Mining":8,"Crafting":3},"disabledWork":[],"requiredWork":["Intellectual"],"traits":{}},{"name":"Gigolo30","title":"gigolo","titleShort":"courtesean","desc":"This pawn was used for their body by hundreds of customers in brothels on several planets. This pawn gained some mental marks and a special kind of street smarts.","skills":{"Social":8,"Melee":3},"disabledWork":["ManualDumb","ManualSkilled"],"requiredWork":["Social"],"traits":{"Beauty":2}},{"name":"Gigolo68","title":"gigolo","titleShort":"gigolo","desc":"This pawn sold themself into slavery for money to purchase boomrat pizza. This pawn was then traded to the Zeglar colonies, where This pawn worked as a male prostitute.\nIn a fluke event, This pawn managed to join other escaping slaves as they hijacked a ship. After fighting with the captain of the slave crew over the last piece of boomrat pizza, This pawn was sent off the ship in an escape pod.","skills":{"Shooting":3,"Melee":6,"Cooking":7},"disabledWork":[],"requiredWork":[],"traits":{"Beauty":1}},{"name":"GlitterworldEmpath26","title":"glitterworld empath","titleShort":"empath","desc":"This pawn had an amazing ability to relate to others and mediate conflict. This pawn was selected to train as an empath. The training intensified their natural abilities, but This pawn became unable to harm others.","skills":{"Social":8,"Medicine":2},"disabledWork":["Violent"],"requiredWork":["Social"],"traits":{}},{"name":"GlitterworldOfficer60","title":"glitterworld officer","titleShort":"officer","desc":"Though glitterworlds are peaceful places, they often remain prepared for war. This pawn's unit rarely saw any real action.\nThough This pawn pursued their artistic hobbies, their subordinates preferred to entertain themselves by brawling, so This pawn got good at breaking up fights.","skills":{"Melee":6,"Artistic":4},"disabledWork":["ManualDumb"],"requiredWork":["Violent"],"traits":{}},{"name":"GlitterworldSurgeon15","title":"glitterworld surgeon","titleShort":"surgeon","desc":"This pawn worked as a surgeon on a world mostly free of disease and human suffering.\ntheir job mostly involved elaborate and creative cosmetic surgeries. This pawn has a good understanding of human biology, but never had to remove a cancer \u2014 or a bullet.","skills":{"Artistic":5,"Medicine":3,"Social":1},"disabledWork":[],"requiredWork":["Caring","Artistic"],"traits":{}},{"name":"Gnomebiologist96","title":"gnomebiologist","titleShort":"biologist","desc":"This pawn was a xenobiology professor in a glitterworld university. This pawn went to conferences and managed an art gallery.\nHowever, This pawn never stopped sculpting yard gnomes, and considers this to be their true profession.","skills":{"Intellectual":4,"Social":4,"Artistic":7,"Crafting":4},"disabledWork":["Cooking","Firefighting","Cleaning"],"requiredWork":[],"traits":{}},{"name":"GovernmentAgent61","title":"government agent","titleShort":"agent","desc":"This pawn worked for the government against rebel groups and excelled in this capacity. During their training This pawn was taught firearms, melee combat and medical skills.\nHaving grown up in a war-ravaged city, dirt, blood and dead bodies don't bother them and This pawn sees no reason to clean them up.","skills":{"Shooting":4,"Melee":4,"Medicine":3},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"GraphicDesigner33","title":"graphic designer","titleShort":"designer","desc":"This pawn' interest in artistic expression led them to become a designer. their eye for detail made them a reasonably well-known artist on their planet, though their meticulousness often led them to spend too much time perfecting a single project.","skills":{"Artistic":7,"Crafting":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Guardian55","title":"guardian","titleShort":"guardian","desc":"After This pawn learned what truly matters in life, This pawn changed for the better. This pawn learned to work hard and protect the things that matter - not money or material things, but friends and loved ones.\nThis pawn became a professional guardian.","skills":{"Shooting":4,"Melee":4,"Medicine":4},"disabledWork":[],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"GunDealer14","title":"gun dealer","titleShort":"gun dealer","desc":"This pawn traded high-tech firearms between warring factions.\nOver time, This pawn became very skilled at conducting product demonstrations and negotiating profitable deals.","skills":{"Shooting":4,"Social":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Gunfighter51","title":"gunfighter","titleShort":"gunfighter","desc":"This pawn was a deadly shot. Peace wasn't for him. This pawn found their family among the brothers and sisters that This pawn spent years fighting alongside.\nAfter most of those close to them died, This pawn once again set off to lend their gun to those who needed it - or those who could pay.","skills":{"Shooting":8,"Melee":2,"Medicine":6},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"HeadButler50","title":"head butler","titleShort":"butler","desc":"This pawn was the head servant in a royal house.\nThis pawn managed the other servants to ensure the lord's will was done, even before the lord knew what it was.","skills":{"Social":4,"Cooking":3,"Crafting":2},"disabledWork":[],"requiredWork":["ManualDumb","ManualSkilled","Social"],"traits":{}},{"name":"Healer46","title":"healer","titleShort":"healer","desc":"After their tribe's elder healer was killed in a raid, This pawn took on the role. This pawn spent their days scrounging up herbs and mineral compounds from the nearby area to use in surprisingly effective remedies.","skills":{"Medicine":5,"Plants":3},"disabledWork":[],"requiredWork":["Caring"],"traits":{}},{"name":"Healer35","title":"healer","titleShort":"healer","desc":"This pawn took the time to admire the beauty of the world. \ntheir passive-aggressiveness surfaced once in a while, but This pawn tried to adapt to their changing life.","skills":{"Plants":5,"Medicine":7},"disabledWork":["ManualDumb","Mining"],"requiredWork":[],"traits":{}},{"name":"HearthTender66","title":"hearth tender","titleShort":"tender","desc":"While the others were out hunting and foraging, This pawn would stay at home to cook and take care of the young and sick.","skills":{"Cooking":4,"Medicine":3,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{"Undergrounder":0}},{"name":"HedgeFundManager54","title":"hedge fund manager","titleShort":"banker","desc":"A top hedge fund manager on a teeming urbworld, This pawn's portfolio grew rapidly as This pawn charmed clients with a sweet voice and devious intent. When the deal turned out too good to be true, This pawn was forced to flee the planet with a bounty on their head.\nAs This pawn travelled the stars This pawn found a passion in the arts, making masterpieces fit for high society customers.","skills":{"Construction":-2,"Plants":-2,"Intellectual":3,"Social":4,"Artistic":7},"disabledWork":[],"requiredWork":[],"traits":{"Greedy":0}},{"name":"Herbalist54","title":"herbalist","titleShort":"herbalist","desc":"This pawn lived in the forest near a village. Though many of the villagers feared them, sick villagers would come to them to purchase salves and poultices made from the herbs This pawn grew in their garden. This pawn was happy to help them \u2014 for a price.","skills":{"Plants":4,"Medicine":4,"Social":-2},"disabledWork":[],"requiredWork":["Caring","PlantWork"],"traits":{}},{"name":"Herder33","title":"herder","titleShort":"herder","desc":"This pawn herded a variety of animals to help feed and clothe their tribe while on the move. This pawn learned how to calm and direct the beasts, and how to hunt their own meals on the trail.","skills":{"Shooting":3,"Animals":5},"disabledWork":[],"requiredWork":["Violent","Animals"],"traits":{}},{"name":"Hermit82","title":"hermit","titleShort":"hermit","desc":"Worn out by the pressures of social interaction, This pawn left their crowded city to live a simple life in the wilderness. There, This pawn spent their days alone, tending their garden and crafting the simple tools This pawn needed to survive.","skills":{"Plants":4,"Crafting":3,"Construction":1},"disabledWork":["Social"],"requiredWork":["PlantWork","ManualDumb","Crafting"],"traits":{"Ascetic":0}},{"name":"Herpetologist3","title":"herpetologist","titleShort":"herper","desc":"After a terrible mining accident, This pawn set off into space in search of exotic new animal species.\nThis pawn hoped to leave their past behind and find long-lived companions. This pawn knew the pain of loss too well.","skills":{"Plants":2,"Intellectual":2,"Medicine":4,"Animals":6},"disabledWork":["Mining"],"requiredWork":[],"traits":{}},{"name":"HiredAssassin37","title":"hired assassin","titleShort":"assassin","desc":"This pawn was a master thief, working mostly for organized crime. Over time, This pawn made a name for themself and shifted their business into the paid \"removal\" of human threats.","skills":{"Shooting":4,"Melee":5,"Social":3},"disabledWork":[],"requiredWork":[],"traits":{"Nimble":0}},{"name":"HiredGun70","title":"hired gun","titleShort":"hired gun","desc":"This pawn always wanted to prove This pawn could make a living without their parents' help. This pawn did shady jobs that often involved pointing guns at innocent people.\nThis pawn eventually made enough money to board a cheap freighter. This pawn discovered why it was so cheap when it crashed.","skills":{"Shooting":6,"Melee":2,"Cooking":2,"Medicine":3},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"HiredMuscle5","title":"hired muscle","titleShort":"hired thug","desc":"Knowing what life on the streets was truly like, This pawn slipped into police work. However, a particularly disturbing case ended with them beating the perpetrator to death.\nDishonorably discharged from their duties, This pawn used their contacts and skills to find work as a thug for hire.","skills":{"Shooting":5,"Melee":3,"Social":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"HouseServant63","title":"house servant","titleShort":"servant","desc":"This pawn was a domestic servant to wealthy homeowners.\nThis pawn got to know the kitchens and basements of their master's mansion well, but never did any work outside.","skills":{"Cooking":4,"Plants":-3,"Mining":-3},"disabledWork":["Intellectual"],"requiredWork":["ManualDumb","Cleaning"],"traits":{}},{"name":"HouseServant86","title":"house servant","titleShort":"servant","desc":"This pawn was a low-level servant in a royal house.\nThis pawn cleaned rooms and moved items as directed by the senior staff, while attempting to remain invisible to the lords and ladies of the house.","skills":{"Cooking":3,"Construction":3,"Mining":4},"disabledWork":[],"requiredWork":["ManualDumb"],"traits":{}},{"name":"Housemate8","title":"housemate","titleShort":"housemate","desc":"As an adult, This pawn kept house and cared for children while their spouse worked.","skills":{"Cooking":3,"Medicine":3,"Crafting":2},"disabledWork":[],"requiredWork":["ManualDumb"],"traits":{}},{"name":"HumanComputer83","title":"human computer","titleShort":"computer","desc":"This pawn turned out to have an excellent memory and a gift for performing complex calculations in their head. An industrial-world dictator decided to employ This pawn to keep track of their state's finances and expenditure.","skills":{"Shooting":3,"Intellectual":7},"disabledWork":["Artistic"],"requiredWork":["Intellectual"],"traits":{}},{"name":"HumanTrafficker35","title":"human trafficker","titleShort":"trafficker","desc":"This pawn stole children from their homes to sell them to interested buyers.\nOver time, This pawn lost what little moral sense This pawn had left.","skills":{"Melee":4,"Social":3,"Crafting":2},"disabledWork":["Caring","Artistic","PlantWork"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"Hunter89","title":"hunter","titleShort":"hunter","desc":"This pawn hunted wild animals to help feed their community. When times became tough, others looked to them as the one to help people through a tough season.","skills":{"Animals":3},"disabledWork":[],"requiredWork":["Violent","Animals"],"traits":{}},{"name":"Hunter74","title":"hunter","titleShort":"hunter","desc":"This pawn tracked, trapped and killed animals for their meat and leather.\nThis pawn used both ranged and melee weapons. Sometimes, This pawn hunted alongside animals.","skills":{"Shooting":4,"Melee":3,"Animals":2},"disabledWork":[],"requiredWork":["Violent","Animals"],"traits":{}},{"name":"Hunter73","title":"hunter","titleShort":"hunter","desc":"This pawn was a master hunter.\nThis pawn learned to track and trap any animal in the most dangerous of places, and had deep knowledge of many ingenious methods for taking down specific large animals.","skills":{"Plants":2,"Shooting":6,"Medicine":4},"disabledWork":["Mining"],"requiredWork":[],"traits":{}},{"name":"HunterOfTheKing53","title":"hunter of the king","titleShort":"pest guard","desc":"This pawn was forced to protect their colony in the name of the king after a mysterious outbreak of murderous genetically-modified wildlife.\nDespite their best efforts, their kingdom was destroyed. This pawn developed PTSD, a hatred of animals and a bad case of technophobia. This pawn was named for the place they found him.","skills":{"Intellectual":-2,"Shooting":6,"Melee":4,"Medicine":3,"Crafting":-3},"disabledWork":["Animals","Artistic","PlantWork"],"requiredWork":[],"traits":{"BodyPurist":0}},{"name":"HypnocultLeader61","title":"hypnocult leader","titleShort":"cultist","desc":"Desiring to understand people, This pawn learned hypnotism and discovered their talent for the art.\n        This pawn gathered followers and formed a cult around their vibrant personality. The authorities discovered their illegal operations, and This pawn fled before This pawn could be arrested.","skills":{"Intellectual":5,"Social":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"IllegalShipwright76","title":"illegal shipwright","titleShort":"shipwright","desc":"There is a law that says that you're not allowed to put terawatt-range grasers on a cargo scow. Especially if you hide them under what looks like a communications dish for better ambush potential. This pawn discovered that there is great profit to be made, however, from those who are uninterested in these laws.","skills":{"Construction":7},"disabledWork":[],"requiredWork":["ManualSkilled"],"traits":{}},{"name":"ImperialGeneral27","title":"imperial general","titleShort":"general","desc":"This pawn's thirst for power defined them. This pawn quickly rose through the military ranks and soon attained the rank of general.\nThis pawn was given the most challenging task - conquering distant and unexplored rimworlds. Victory here could even position them as a successor to the emperor.","skills":{"Construction":-2,"Intellectual":4,"Mining":-3,"Shooting":4,"Melee":4,"Social":5,"Medicine":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"ImperialInquisitor53","title":"imperial inquisitor","titleShort":"inquisitor","desc":"This pawn was an inquisitor in the imperial church's anti-heresy school.\nThis pawn hunted unorthodox thoughts wherever they could be found - art, music, code, even private conversations. Upon finding deviance, This pawn exposed it to bring on the punishment of the collective. And This pawn could always find the deviance if This pawn looked hard enough.","skills":{"Social":4,"Intellectual":4},"disabledWork":[],"requiredWork":["Social","Intellectual"],"traits":{"Abrasive":0}},{"name":"ImperialPriest24","title":"imperial priest","titleShort":"priest","desc":"This pawn was a priest in the imperial church.\nThis pawn spent half their time studying books to understand the relationship between God's aspects and the facets of their society. The other half was spent preaching the evils of sloth and drink.","skills":{"Social":5,"Intellectual":5},"disabledWork":[],"requiredWork":["Social","Intellectual"],"traits":{"DrugDesire":-1}},{"name":"InfantryEngineer46","title":"infantry engineer","titleShort":"engineer","desc":"Despite being in an infantry battalion, This pawn rarely fired a gun. their specialty was the rapid construction of defenses, traps, defensive installations, and sapping tunnels.","skills":{"Construction":6,"Mining":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"InfantryMedic6","title":"infantry medic","titleShort":"medic","desc":"This pawn treated the combat wounds of their fallen comrades.","skills":{"Medicine":7},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"InfantryOfficer49","title":"infantry officer","titleShort":"officer","desc":"This pawn was an officer in an imperial battalion. This pawn developed the social and combat skills to do their job well and was respected by the men.","skills":{"Social":4,"Shooting":5},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"InformationBroker77","title":"information broker","titleShort":"broker","desc":"This pawn caught a ship to the next star system and began a life of travel and learning, quickly collecting a massive bank of knowledge from people of all shapes and sizes.\nThis pawn learned to sell this knowledge for great profit, and became a powerful broker of information.","skills":{"Intellectual":4,"Shooting":-1,"Melee":-2,"Social":5},"disabledWork":[],"requiredWork":[],"traits":{"FastLearner":0}},{"name":"IntelligenceAgent10","title":"intelligence agent","titleShort":"agent","desc":"Because of their hacking skills, This pawn was recruited by their home planet's governing body to serve as an intelligence agent. The government trained them in combat, but This pawn prefers psychological warfare.\nGovernment rules proved too strict for them, so This pawn went rogue. their current activities are unknown.","skills":{"Shooting":7,"Melee":4,"Social":8},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"IntelligenceAgent21","title":"intelligence agent","titleShort":"intel","desc":"This pawn was a high-ranking counterintelligence agent tasked with thwarting enemy spies.","skills":{"Intellectual":6,"Social":3},"disabledWork":[],"requiredWork":["Social","Intellectual"],"traits":{}},{"name":"IntimateAssassin35","title":"intimate assassin","titleShort":"assassin","desc":"This pawn was a professional assassin. This pawn was sadistic, calculating, and appeared utterly harmless.\nThis pawn preferred using intimate means to dispatch their targets. This fulfilled both their contracts and their own personal desire for control.","skills":{"Melee":8,"Social":4},"disabledWork":["Caring","Animals"],"requiredWork":[],"traits":{"Beauty":1}},{"name":"Inventor6","title":"inventor","titleShort":"inventor","desc":"On their homeworld, This pawn worked as a moderately successful inventor. This pawn developed several minor technologies.","skills":{"Crafting":5,"Intellectual":2},"disabledWork":[],"requiredWork":["Intellectual","Crafting"],"traits":{}},{"name":"InvoluntaryHermit38","title":"involuntary hermit","titleShort":"hermit","desc":"This pawn's escape pod was jettisoned onto an unexplored region of a frontier world. This pawn eked out a lonely existence with only a herd of muffalo for company.\n \nLater, This pawn was spotted clad in pygmy wombat furs, discussing the importance of hoof hygiene with a group of elderly muffalo.","skills":{"Construction":1,"Plants":3,"Melee":4,"Crafting":3},"disabledWork":["Caring","Artistic","Cleaning"],"requiredWork":[],"traits":{}},{"name":"Jailbird40","title":"jailbird","titleShort":"jailbird","desc":"This pawn spent most of their life in prisons, where This pawn was put to work in the kitchens. This pawn had a habit of getting into fights, and developed an aggressive way of speaking.","skills":{"Melee":5,"Cooking":3},"disabledWork":["Social","Caring"],"requiredWork":["Violent"],"traits":{}},{"name":"JoywireArtist8","title":"joywire artist","titleShort":"joywirer","desc":"This pawn worked in an urbworld lab developing cutting-edge joywire software to maximize user pleasure.\nWhen the local government imposed harsh restrictions on joywire manufacturing, This pawn began selling their products on the black market.","skills":{"Artistic":3,"Intellectual":2,"Medicine":2},"disabledWork":["ManualDumb"],"requiredWork":["Intellectual"],"traits":{}},{"name":"KingOfPirates25","title":"king of pirates","titleShort":"pirate","desc":"As a self-proclaimed king of pirates, This pawn was ruthless. Manipulative in nature, This pawn was not afraid to sacrifice the people around them in service of their own goals. This pawn was a good shot, but even more skilled with a sword, and This pawn loved the adrenaline rush of close combat.","skills":{"Shooting":5,"Melee":8,"Social":4,"Animals":3},"disabledWork":["Artistic","Cooking","Firefighting"],"requiredWork":[],"traits":{}},{"name":"Landworker98","title":"landworker","titleShort":"landworker","desc":"This pawn held the position of landworker in their royal house. This pawn managed the family's lands and all the resources on them - both agricultural and mineral.\nThough This pawn would never work the machines themself, managing these enterprises required learning the methods of farming and mining in detail.","skills":{"Plants":6,"Mining":6},"disabledWork":[],"requiredWork":["PlantWork","Mining"],"traits":{}},{"name":"LanguageAnalyst27","title":"language analyst","titleShort":"linguist","desc":"After war broke out on their homeworld, This pawn was conscripted as a linguist. This pawn spent their days in a space station, decoding enemy communications and tending the hydroponic crops.\nAfter a meteorite damaged the station, This pawn was forced to enter cryptosleep and hope for rescue.","skills":{"Plants":4,"Intellectual":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"LazyProgrammer3","title":"lazy programmer","titleShort":"programmer","desc":"This pawn independently developed software that had a competitive edge against local urbworld corporations.\ntheir legally questionable methods lead to a growing number in unsolved claims of intellectual property theft.","skills":{"Intellectual":8},"disabledWork":["PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"LineInfanteer20","title":"line infanteer","titleShort":"infanteer","desc":"This pawn was an ordinary infanteer in an imperial battalion.\nConscripted at a young age to add bodies the army, This pawn learned the methods of fighting well enough to satisfy their officers. However, This pawn never quite understood what was going on around them enough to really believe in it.","skills":{"Shooting":4,"Melee":3},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"LivestockFarmer8","title":"livestock farmer","titleShort":"farmer","desc":"This pawn ran a livestock farm. This pawn analyzed animal genetics, feed types, birth and slaughter methods, and price trends to optimize the raising of huge animal herds.","skills":{"Animals":7},"disabledWork":[],"requiredWork":["Animals"],"traits":{}},{"name":"Logger95","title":"logger","titleShort":"logger","desc":"This pawn took down trees and collected wood in hilly passes and ravines. This pawn learned both how to fell the trees safely, and how to manage the forest to keep it healthy.","skills":{"Plants":8},"disabledWork":[],"requiredWork":["PlantWork"],"traits":{}},{"name":"Logger16","title":"logger","titleShort":"logger","desc":"This pawn chopped trees and hauled their lumber back to the tribe. This pawn wielded their axe with the finesse of an artist and the force of a charging muffalo.","skills":{"Plants":6,"Melee":3},"disabledWork":[],"requiredWork":["PlantWork"],"traits":{}},{"name":"LoneTraveler95","title":"lone traveler","titleShort":"traveler","desc":"After escaping their homeworld on a jury-rigged ship, This pawn traveled to new worlds to experience their beauty.\nThis pawn joined resistance groups and applied the skills This pawn cultivated on their homeworld. This pawn often warned of the nuclear horror This pawn saw as a child.","skills":{"Plants":3,"Shooting":4,"Medicine":3,"Artistic":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Loner61","title":"loner","titleShort":"loner","desc":"This pawn never much liked the tribal council or the yearly festivals. This pawn preferred the open plain and the whistle of wind through the rocks.\nThis pawn visited their tribe from time to time, but mostly took care of themself using their own survival skills.","skills":{"Shooting":3,"Melee":2,"Plants":5,"Construction":1},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"LoreKeeper51","title":"lore keeper","titleShort":"keeper","desc":"This pawn was one of a long line of lore keepers in their tribe. Every night around the fire, This pawn would pass on ancient knowledge and helpful wisdom through stories.","skills":{"Intellectual":2,"Social":3,"Artistic":2},"disabledWork":[],"requiredWork":["Intellectual"],"traits":{}},{"name":"LostMarine81","title":"lost marine","titleShort":"traitor","desc":"Shortly after being promoted to a respected position in their planet's military, This pawn disappeared without a trace.\nLater, This pawn reappeared at the head of their own military force. No one knows why This pawn became who This pawn was.","skills":{"Shooting":7,"Melee":5,"Medicine":2,"Crafting":6},"disabledWork":["ManualDumb","Mining"],"requiredWork":[],"traits":{}},{"name":"LostSoldier13","title":"lost soldier","titleShort":"lost","desc":"This pawn's childhood soldier conditioning failed, and the experiment was shut down. This pawn was abandoned, purposeless, friendless.\nThis pawn eventually found solace in physically demanding work. This pawn especially liked building houses and crafting heavy armor.","skills":{"Construction":5,"Intellectual":-3,"Social":-2,"Crafting":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"LowWageWorker7","title":"low-wage worker","titleShort":"grunt","desc":"This pawn worked a variety of casual jobs to support their family, gaining a set of basic hands-on skills.","skills":{"Cooking":4,"Plants":3,"Crafting":3},"disabledWork":[],"requiredWork":["ManualDumb","Cleaning"],"traits":{}},{"name":"LoyalJanissary59","title":"loyal janissary","titleShort":"janissary","desc":"This pawn was a janissary in a great lord's army. Even more than the other troops, This pawn felt a sense of duty, and This pawn drew their life's meaning from the effort This pawn put to fulfilling their duty.","skills":{"Shooting":7,"Melee":4},"disabledWork":[],"requiredWork":["Violent"],"traits":{"Industriousness":2}},{"name":"MachineCollector55","title":"machine collector","titleShort":"collector","desc":"This pawn was obsessed with old machines and arcane pieces of technology. This pawn obtained them wherever This pawn could, and loved taking them apart to see how they worked.\nThis pawn had a habit of talking about their collection long after people around them had stopped listening.","skills":{"Social":-3,"Crafting":6,"Intellectual":6},"disabledWork":[],"requiredWork":["Crafting"],"traits":{}},{"name":"MachineFixer31","title":"machine fixer","titleShort":"fixer","desc":"This pawn was adept at dealing with mechanical problems, as long as the problem didn't involve the kitchen.\nAfter a life spent around dangerous machinery and flammable chemicals, This pawn learned how to patch themself up pretty well. Despite the pain, This pawn never learned to dislike fire.","skills":{"Construction":5,"Medicine":5,"Crafting":3},"disabledWork":["Cooking","Firefighting"],"requiredWork":[],"traits":{}},{"name":"MadAccountant61","title":"mad accountant","titleShort":"accountant","desc":"As an accountant, This pawn often socialized with colleagues, and made many friends in upper management.\nOne day, This pawn discovered a corruption racket run by some of their bosses. After reporting this, This pawn was fired. Wishing to hunt down those responsible, This pawn went on a mass murder spree.","skills":{"Intellectual":6,"Shooting":4,"Social":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MadScientist22","title":"mad scientist","titleShort":"scientist","desc":"Stripped of their life's work and exiled after their unethical experiments on the survivors of the Callos IX incident were published, This pawn learned the skills necessary to survive in the outer rim.\nContinuing their research with nothing left to lose, This pawn made minions to carry out the tasks that bored him.","skills":{"Intellectual":5,"Shooting":5,"Medicine":4,"Crafting":2},"disabledWork":["Hauling","Mining"],"requiredWork":[],"traits":{}},{"name":"MadScientist2","title":"mad scientist","titleShort":"scientist","desc":"This pawn's lust for knowledge was only matched by their disdain for anyone who would stand in the way of their research.\nTraveling from world to world, This pawn sought answers to questions few dared to ask.","skills":{"Construction":3,"Intellectual":7,"Social":-2},"disabledWork":["Caring","Animals","Artistic"],"requiredWork":[],"traits":{}},{"name":"MadScientist31","title":"mad scientist","titleShort":"scientist","desc":"After finishing their education, This pawn was hired by the planet's leading genetic researcher. Later, This pawn was caught running illegal, inhumane experiments.\nDespite their family's influence, This pawn was convicted and sentenced to hard labor on a penal colony.","skills":{"Intellectual":8,"Mining":3,"Medicine":3,"Artistic":-3,"Animals":-2},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"MafiaBoss17","title":"mafia boss","titleShort":"boss","desc":"This pawn was a high-ranking member of an urbworld crime syndicate.\nThis pawn bribed officials, maintained the loyalty of their subordinates, and extracted overdue payments - by any means necessary.","skills":{"Shooting":4,"Melee":3,"Social":4},"disabledWork":["ManualDumb","Caring","Cooking"],"requiredWork":["Social"],"traits":{}},{"name":"Mailman2","title":"mailman","titleShort":"mailman","desc":"This pawn carried mail on their assigned routes. Sometimes This pawn was even sent to deliver special packages to stylish corporate offices or mansions.\nThis pawn got pretty good at avoiding and fighting off angry dogs.","skills":{"Melee":4},"disabledWork":[],"requiredWork":[],"traits":{"Nimble":0}},{"name":"Malingerer28","title":"malingerer","titleShort":"malingerer","desc":"This pawn often feigned sickness in order to avoid their responsibilities. While resting in the sick hut, This pawn told stories to the children.","skills":{"Intellectual":2,"Social":5},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"MarbleDoctor99","title":"marble doctor","titleShort":"doctor","desc":"On a bomb-blasted world, first aid is often the only aid.\nThis pawn used their medical skills to help the injured and the sick. This pawn believed that while guns and machines may be powerful, a doctor is even more so.","skills":{"Intellectual":4,"Medicine":8},"disabledWork":["Crafting"],"requiredWork":[],"traits":{}},{"name":"MasterChef48","title":"master chef","titleShort":"chef","desc":"On a glitterworld, This pawn found a job washing dishes at a famous restaurant and worked their way up the ranks.\nA few years later, their career came to an end when someone poisoned the meal This pawn was preparing for the mayor. Jobless, This pawn and left to explore the stars once again.","skills":{"Cooking":8,"Artistic":4},"disabledWork":[],"requiredWork":[],"traits":{"Gourmand":0}},{"name":"MasterTrader65","title":"master trader","titleShort":"trader","desc":"This pawn was a master at trading. This pawn earned their nickname by helping a village through a trying time.","skills":{"Social":8,"Cooking":2,"Artistic":4},"disabledWork":["Mining"],"requiredWork":[],"traits":{}},{"name":"Mathematician6","title":"mathematician","titleShort":"math prof","desc":"This pawn did mathematical research at a university.\nThis pawn spent much of their spare time immersed in shooting simulations, though This pawn was frequently ridiculed by other players for their terrible aim.","skills":{"Shooting":-3,"Intellectual":8},"disabledWork":["ManualDumb"],"requiredWork":["Intellectual"],"traits":{}},{"name":"MechWarVeteran77","title":"mech war veteran","titleShort":"veteran","desc":"This pawn fought against swarms of rogue mechanoids since This pawn was old enough to enlist. This pawn has bled on half a dozen worlds and has lost more than This pawn cares to recall. These experiences left them hardened, both mentally and physically.","skills":{"Shooting":7,"Melee":4},"disabledWork":["Caring","Artistic"],"requiredWork":[],"traits":{"Tough":0}},{"name":"MechanicsEngineer64","title":"mechanics engineer","titleShort":"engineer","desc":"This pawn loved solving problems and, with their steady hands and a reputation for quality work, earned a job as a mechanical engineer. This pawn built and redesigned devices of all shapes and sizes.\nEventually, This pawn was able to pick and choose their corporate clients. This pawn made several wealthy friends, as well as a few powerful enemies.","skills":{"Construction":5,"Plants":-2,"Intellectual":2,"Crafting":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MedicSoldier54","title":"medic soldier","titleShort":"medic","desc":"This pawn enrolled in their planetary army as a frontline medic. This pawn soon knew the horrors of war and was deeply marked by them.\nThis pawn left the military and their homeworld and began researching medicine and helping those This pawn came across.","skills":{"Intellectual":5,"Medicine":7},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"MedicalScientist16","title":"medical scientist","titleShort":"scientist","desc":"This pawn enlisted as a doctor on a passing science vessel. Roaming the stars with a large crew of xenohumans and transbirds, This pawn did genetic research on encountered species. This pawn developed a deep friendship with one transbird but was forced to leave the ship when the captain dismissed all non-avians.","skills":{"Intellectual":8,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MedievalDoctor40","title":"medieval doctor","titleShort":"quack","desc":"This pawn worked as a doctor on a medieval planet. This pawn firmly believes that most ailments can be cured with a little bloodletting.\nThis pawn was also a master anaesthetist, developing a specialty technique that involved a heavy blow to the head.","skills":{"Melee":6,"Medicine":1},"disabledWork":[],"requiredWork":["Caring"],"traits":{}},{"name":"MedievalFarmOaf58","title":"medieval farm oaf","titleShort":"oaf","desc":"Tilling, hoeing, guiding ox carts, pushing wheelbarrows. Digging ditches, planting seeds, predicting the harvest.\nMedieval-level farmers aren't educated in the usual sense, but they know a lot about growing plants without technology. That said, such a life leaves one essentially incapable of participating in intellectual, technology-driven activities.","skills":{"Plants":8,"Mining":3},"disabledWork":["Intellectual"],"requiredWork":["ManualDumb","PlantWork","Mining"],"traits":{}},{"name":"MedievalKnight26","title":"medieval knight","titleShort":"knight","desc":"This pawn fought for king and country on the battlefield, where This pawn further honed their skill as a swordsman. their greatest glory was leading a charge into an enemy courtroom and capturing the king at sword point.","skills":{"Shooting":2,"Melee":6},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"MedievalLord57","title":"medieval lord","titleShort":"noble","desc":"This pawn was a lord on a preindustrial planet. This pawn went to parties, managed the underlings, and even learned some swordplay.\ntheir soft hands did not hold a work tool during that entire time. This pawn considers manual labor to be beneath them.","skills":{"Social":7,"Melee":5,"Shooting":5},"disabledWork":["ManualDumb","ManualSkilled"],"requiredWork":["Social"],"traits":{}},{"name":"MedievalMinstrel95","title":"medieval minstrel","titleShort":"minstrel","desc":"This pawn was a traveling entertainer on a medieval world.\nThis pawn could always be found telling stories or singing songs, and is capable of protecting themself from the dangers of the road. However, This pawn was always conspicuously absent whenever there was hard labour to be done.","skills":{"Social":4,"Artistic":3,"Melee":2},"disabledWork":["ManualSkilled","Hauling"],"requiredWork":[],"traits":{}},{"name":"MedievalSailor97","title":"medieval sailor","titleShort":"sailor","desc":"This pawn explored the oceans on a wooden ship, seeking out plant and animal specimens from exotic places, and occasionally fending off pirates. This pawn loved the sea so much This pawn refused to do all but the barest minimum of work on land, except to sell the treasures This pawn collected.","skills":{"Melee":4,"Social":4,"Animals":4},"disabledWork":["ManualSkilled"],"requiredWork":["ManualDumb"],"traits":{}},{"name":"MenagerieKeeper1","title":"menagerie keeper","titleShort":"zookeeper","desc":"This pawn managed the royal menagerie of a powerful family at their estate.\nThis pawn's job saw This pawn feeding elephants, tranquilizing lions, and training birds to display their plumage to titled visitors.","skills":{"Animals":8},"disabledWork":[],"requiredWork":["Animals"],"traits":{"Beauty":2}},{"name":"MentalPatient69","title":"mental patient","titleShort":"patient","desc":"This pawn was placed in a psychiatric hospital. There, This pawn spent their time engaged in the calming activities of the asylum.\nThis pawn was eventually released, but This pawn retained their emotional distance, their curiosity about human anatomy, and their namesake manic giggling.","skills":{"Plants":3,"Intellectual":2,"Shooting":-2,"Artistic":3,"Crafting":3},"disabledWork":["Cooking","Firefighting","Mining"],"requiredWork":[],"traits":{}},{"name":"Mercenary55","title":"mercenary","titleShort":"merc","desc":"This pawn spent their teenage years as a mercenary, being hired to kill and maim others. This pawn was tall, menacing, and frightening. This pawn could instill fear into the hearts of any man who crossed them, and kill anyone This pawn wanted.","skills":{"Construction":3,"Mining":2,"Shooting":4,"Melee":3},"disabledWork":[],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"Mercenary4","title":"mercenary","titleShort":"mercenary","desc":"After escaping a crew of rimworld slavers, This pawn developed a lack of respect for life. This pawn proceeded to sign on to a mercenary group where This pawn developed skills using guns and survival techniques. This pawn did dirty work where This pawn found it, and traveled to many worlds.","skills":{"Construction":3,"Mining":2,"Shooting":5,"Artistic":-2},"disabledWork":[],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"Mercenary20","title":"mercenary","titleShort":"mercenary","desc":"After escaping their home planet, This pawn fell in with a band of mercenaries. This pawn fought alongside their brothers and sisters in arms for many years.\nOne day, they were caught in a fight they couldn't win. Refusing to retreat, This pawn was shot down by their enemies. This pawn was alarmed to awake in a heap of corpses, mysteriously unharmed.","skills":{"Construction":2,"Shooting":6,"Melee":6,"Social":2,"Crafting":2},"disabledWork":["Animals"],"requiredWork":[],"traits":{}},{"name":"MercenaryCaptain98","title":"mercenary captain","titleShort":"captain","desc":"This pawn was in the crew of a mercenary ship. Disciplined and confident, This pawn quickly rose through the ranks and gained friends.\nIn their time as a mercenary captain, This pawn was known for being gregarious and calm - possibly thanks to the joywires.","skills":{"Intellectual":2,"Shooting":5,"Social":5},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"MercenaryChef44","title":"mercenary chef","titleShort":"mercenary","desc":"Following in their family's footsteps, This pawn was a soldier for hire.\nThis pawn was a naturally gifted sharpshooter. However, their real passion is in perfecting a new recipe or dissecting a new gadget.","skills":{"Construction":-3,"Mining":-3,"Shooting":4,"Cooking":5,"Crafting":5},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{"ShootingAccuracy":1}},{"name":"MercenaryLeader28","title":"mercenary leader","titleShort":"mercenary","desc":"Alone, This pawn set out to rebuild their father's life's work. This pawn challenged the leader of a small band of mercenaries and took control, then led the band as they hijacked trade ships and stole valuable cargo.\ntheir men mutinied. This pawn was abandoned, arrested, and sentenced to death.","skills":{"Shooting":4,"Melee":4,"Social":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MercenaryLord13","title":"mercenary lord","titleShort":"merc lord","desc":"This pawn formed a mercenary company out of freelancers who wanted to make good money while also making slightly better-than-average moral choices. This pawn called it the Ashmarines.\nTo avoid the coreworlds' military forces, This pawn moved their company to the rimworlds. There, This pawn established bases and communities. In ruling, This pawn maintained a form of order among the raiders and madmen of deep space.","skills":{"Intellectual":4,"Shooting":2,"Social":7,"Medicine":3,"Artistic":2},"disabledWork":["Animals","Mining"],"requiredWork":[],"traits":{}},{"name":"MercenaryPilot63","title":"mercenary pilot","titleShort":"mercenary","desc":"This pawn convinced their squadron to abscond with their ships and make a course for the rimworlds. There they could fight for the causes they believed in.\ntheir men were loyal and fought hard, but their ideals soon faded away and their cause became that of the highest bidder.","skills":{"Construction":3,"Shooting":6,"Melee":4,"Social":-1},"disabledWork":["Caring","Artistic"],"requiredWork":[],"traits":{}},{"name":"MessageCarrier77","title":"message carrier","titleShort":"messenger","desc":"On a medieval world, the fastest way to send a message is to give it to somebody on a horse and hope they survive the journey. This pawn was that somebody.","skills":{"Melee":3,"Animals":4},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"Microbiologist12","title":"microbiologist","titleShort":"biologist","desc":"A plague struck This pawn's native urbworld. This pawn and other researchers revealed that the illness was a bioweapon, but the people turned on them, blaming them for the sickness.\nThis pawn barely escaped their homeworld as it fell into chaos.","skills":{"Intellectual":5,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MidworldSailor91","title":"midworld sailor","titleShort":"sailor","desc":"This pawn joined their country's Royal Navy. After years as a non-commissioned officer, This pawn eventually cracked and used the skills This pawn had acquired to start a mutiny on their ship.\nIn the end, This pawn was the leader of a large group of trained and dangerous pirates. This pawn henceforth always had chefs to cook for him.","skills":{"Construction":3,"Shooting":4,"Melee":3,"Social":4},"disabledWork":["Cooking"],"requiredWork":[],"traits":{"Gourmand":0}},{"name":"MilitaryChaplain10","title":"military chaplain","titleShort":"chaplain","desc":"This pawn stayed with the troops in training and in combat, administering to the dying and reinforcing the faith of the living.\nLike all imperial chaplains, This pawn vowed never to fight themself. However, This pawn acted as a medic and treated the wounded.","skills":{"Medicine":6,"Intellectual":2},"disabledWork":["Violent"],"requiredWork":["Caring","Intellectual"],"traits":{}},{"name":"MilitaryCommissar71","title":"military commissar","titleShort":"commissar","desc":"This pawn was an internal spymaster in an imperial army battalion. This pawn made sure that the men were loyal, and did not fall back unless ordered. This made them unpopular, but This pawn gained great skill at detecting the slightest dishonesty.","skills":{"Shooting":3,"Social":6},"disabledWork":[],"requiredWork":["Social","Violent"],"traits":{}},{"name":"MilitaryCook18","title":"military cook","titleShort":"army cook","desc":"They say an army marches on its stomach. This pawn's job was to prepared chow to keep their unit marching, no matter the conditions.\nThe job required them to pay attention to both the nutritional and psychological needs of the troops.","skills":{"Cooking":7,"Shooting":2},"disabledWork":[],"requiredWork":["Cooking"],"traits":{}},{"name":"MilitaryEngineer45","title":"military engineer","titleShort":"engineer","desc":"This pawn worked as an engineer for a colonial military. This pawn got to play with weapons, murder-drones, and other 'fun' stuff.\nThis pawn specialized in repairing and modifying mechanoids' tools. Sometimes This pawn tested them themself.","skills":{"Construction":3,"Shooting":3,"Melee":1,"Crafting":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MilitaryGunsmith27","title":"military gunsmith","titleShort":"gunsmith","desc":"When their world was thrown into conflict, This pawn was conscripted along with many of their peers into the war machine that tore across the planet.\nWith their particular expertise, This pawn was lucky enough to find a position serving as small arms mechanic rather than on the front line.","skills":{"Construction":2,"Shooting":5,"Melee":4,"Cooking":1,"Medicine":2,"Crafting":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MilitaryInventor35","title":"military inventor","titleShort":"inventor","desc":"Jackson, in a final act of rebellion, left their father's lab and joined the local Imperial military.\nThis pawn used their laboratory skills to design machines of war. At this This pawn was one of the best on their planet.","skills":{"Construction":3,"Intellectual":3,"Shooting":1,"Social":2,"Crafting":3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"MilitaryOfficer17","title":"military officer","titleShort":"officer","desc":"Obsessed with interstellar travel, This pawn left their desolate life behind to join a military academy in hopes of becoming a pilot.\nThis pawn was trained in advanced combat and survival skills. While This pawn excelled in their studies, This pawn was a loner and never cared about their crewmates.","skills":{"Construction":2,"Intellectual":2,"Shooting":8,"Social":-3},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"MilitiaSoldier79","title":"militia soldier","titleShort":"soldier","desc":"This pawn joined the militia forces and fought for rights and peace.\nAfter their homeworld was unexpectedly destroyed in the wars, This pawn traveled great distances, seeking a refuge where This pawn could build a new, free way of life.","skills":{"Construction":3,"Melee":3,"Social":4,"Medicine":-3,"Artistic":4,"Crafting":3},"disabledWork":["Cooking","Cleaning"],"requiredWork":[],"traits":{}},{"name":"MindwipedAssassin50","title":"mindwiped assassin","titleShort":"mindwipe","desc":"The corporation took and remade This pawn. They trained them into an tool of destruction and subversion. This pawn took to their new life, finding satisfaction in the jobs they sent them on.\nWhen This pawn learned that they planned on disposing of them, This pawn turned on their masters, killing several and fleeing the planet.","skills":{"Shooting":8,"Melee":4,"Cooking":-2},"disabledWork":["Caring","Artistic"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"Minister88","title":"minister","titleShort":"minister","desc":"This pawn managed to secure an important position in the government of a minor glitterworld. This pawn got used to the opulence, while attempting to keep their citizens content. This pawn had ample time for pleasure and indulgence \u2013 though This pawn never forgot how to do hard work.","skills":{"Intellectual":3,"Shooting":2,"Social":4,"Crafting":3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"Missionary99","title":"missionary","titleShort":"missionary","desc":"This pawn decided to devote their life to religious service. This pawn made a vow of peace and spent several years preaching and serving food in soup kitchens for the homeless.","skills":{"Social":6,"Cooking":4,"Medicine":2},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"MobHenchman53","title":"mob henchman","titleShort":"henchman","desc":"After being \"saved\" from their home world by a slaver ship, This pawn was sold to an urbworld crime lord, where This pawn was used as a henchman. This pawn specialized in low-tech beat-downs and intimidation.","skills":{"Shooting":3,"Melee":7,"Social":-2,"Medicine":2,"Crafting":2},"disabledWork":["Artistic","Cleaning"],"requiredWork":[],"traits":{}},{"name":"ModDesigner85","title":"mod designer","titleShort":"modder","desc":"This pawn designed combat modifications for frontline soldiers.\nOne night, in a nightmare, This pawn was confronted by all the men and women killed by their work. This pawn decided to travel to the rimworlds and use their skills for good.","skills":{"Intellectual":5,"Crafting":5,"Medicine":2},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"Model99","title":"model","titleShort":"model","desc":"This pawn modelled clothes and jewellery for advertisers, and was also used as a physical blueprint for characters in virtual reality simulations.","skills":{"Social":5,"Artistic":6},"disabledWork":["ManualDumb","Intellectual","ManualSkilled","Caring"],"requiredWork":["Social","Artistic"],"traits":{"Beauty":2}},{"name":"MuffaloResearcher67","title":"muffalo researcher","titleShort":"researcher","desc":"This pawn specialized in studying and manipulating the genetic code of the muffalo.\ntheir work left little time to develop an appreciation for the arts or other people's company.","skills":{"Intellectual":5,"Melee":-3,"Medicine":4,"Animals":4},"disabledWork":["Social","Artistic"],"requiredWork":[],"traits":{}},{"name":"MuffaloShaman95","title":"muffalo shaman","titleShort":"shaman","desc":"Because of their quiet wisdom and great strength, This pawn became the spiritual guide for their tribe. This pawn had a special connection with the great spirit of the muffalo.","skills":{"Melee":5,"Social":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MutinousCaptain52","title":"mutinous captain","titleShort":"captain","desc":"This pawn was taken to the stars by slavers after their tribe was decimated in a raid. Over the years This pawn learned the language of their captors, eventually working for them as an interpreter and diplomat.\nThe captain only learned of This pawn's true cunning when revenge was taken by form of mutiny.","skills":{"Shooting":4,"Social":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"NavyScientist52","title":"navy scientist","titleShort":"scientist","desc":"Interstellar warfare is won by technology, so glitterworld navies are always on the peak of modern research. Even better, they have first access to archotechnological artifacts because they find them in space.\nThis pawn worked in a navy lab.","skills":{"Intellectual":8},"disabledWork":[],"requiredWork":["Intellectual"],"traits":{}},{"name":"NavyTechOfficer0","title":"navy tech officer","titleShort":"navy tech","desc":"After repairing a fleet admiral's holoscreen with nothing but a pair of rusty pliers and scrap wire, This pawn was invited to the Federation Naval Academy.\nThis pawn received an excellent technical education and extensive firearms training, but had no interest in studying more menial skills.","skills":{"Intellectual":6,"Shooting":4,"Cooking":-2,"Crafting":5,"Animals":-2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"NetworkEngineer34","title":"network engineer","titleShort":"engineer","desc":"This pawn spent all their time working on computer networking systems.\nThis pawn lived without a care in the world - other than uptime and dropped packets.","skills":{"Construction":4,"Intellectual":4,"Shooting":4,"Crafting":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"NeuroScientist19","title":"neuro scientist","titleShort":"scientist","desc":"This pawn worked for a long time to improve mankind's understanding of the human brain.\nAfter succeeding in mapping the whole brain, This pawn joined a team of scientists on a quest to map the brains of the most exotic altered humans.","skills":{"Intellectual":8,"Social":2,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"NinjaAssassin31","title":"ninja assassin","titleShort":"ninja","desc":"This pawn performed stiletto-precise assassinations for an interplanetary conglomerate. This pawn was assigned the most complex missions involving disguise, deception, subterfuge, and efficient violence.\nA nasty incident with a potted plant and an assassination gone wrong left them with an aversion to plant life.","skills":{"Shooting":4,"Melee":3,"Social":2,"Crafting":2},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"Novelist7","title":"novelist","titleShort":"novelist","desc":"This pawn lived on a glitterworld, penning wildly successful novels. This pawn lived a carefree lifestyle, spending their days writing and their nights partying - and never did a day's manual labour in their life.","skills":{"Construction":-5,"Mining":-5,"Artistic":8},"disabledWork":["ManualDumb","Social"],"requiredWork":["Intellectual"],"traits":{}},{"name":"Nurse61","title":"nurse","titleShort":"nurse","desc":"This pawn worked in a hospital, doing routine work such as changing bandages and taking temperatures.\nIt was a busy job, but This pawn could always find time for a chat with a patient.","skills":{"Social":4,"Medicine":5},"disabledWork":["Violent"],"requiredWork":["Caring"],"traits":{}},{"name":"OrbitalReservist22","title":"orbital reservist","titleShort":"reservist","desc":"When the government declared that it would strengthen its military defenses, This pawn was drafted and trained.\nThis pawn was stationed on an orbital base, manning the defense systems and, in dire situations, descending in a dropship to the surface.","skills":{"Shooting":7,"Melee":5,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"OrnamentMaker56","title":"ornament maker","titleShort":"ornamenter","desc":"This pawn crafted watches, medals, machined jewelry and other complex curios for royal patrons.","skills":{"Crafting":5,"Artistic":5},"disabledWork":[],"requiredWork":["Artistic","ManualSkilled"],"traits":{}},{"name":"Osteologist74","title":"osteologist","titleShort":"scholar","desc":"After graduating university at the top of their class, This pawn quickly became a well-known and athletic college professor.\nWith their new found fame and fitness came a sudden reluctance to preform menial labor - such tasks are better left to graduate students.","skills":{"Intellectual":7,"Mining":-3,"Melee":3,"Social":3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"OverwatchSniper42","title":"overwatch sniper","titleShort":"sniper","desc":"This pawn didn't know why This pawn joined the military, but This pawn stayed to protect their fellow soldiers.\nArmy life broke them down and built them back up. It taught them marksmanship, hand to hand combat and how to patch a bullet wound in a hurry.","skills":{"Shooting":5,"Melee":3,"Medicine":3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"Paramedic45","title":"paramedic","titleShort":"paramedic","desc":"This pawn's job was to respond rapidly to medical emergencies. This pawn is used to dealing with severe injuries with only limited medical supplies.\nThis pawn treated so many gunshot wounds over the years that even seeing a gun made them uncomfortable.","skills":{"Shooting":-5,"Medicine":6},"disabledWork":[],"requiredWork":["Caring","Violent"],"traits":{}},{"name":"ParamilitaryAgent11","title":"paramilitary agent","titleShort":"agent","desc":"After scraping by on assorted shady jobs, This pawn joined with a large paramilitary group to fight a war on their homeworld. their role was infiltration and intelligence gathering","skills":{"Shooting":5,"Melee":2,"Social":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ParticlePhysicist44","title":"particle physicist","titleShort":"physicist","desc":"This pawn performed cutting-edge physics research. This pawn wanted to help build a better and more peaceful future.","skills":{"Plants":2,"Intellectual":8,"Medicine":3,"Artistic":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Philosopher97","title":"philosopher","titleShort":"sage","desc":"This pawn's thirst for archaeo-technological knowledge drove them to spend years surveying abandoned data centers and studying ancient coding languages.\nThis pawn claimed to be one of the few who could piece together the tragedy of the past - and offer a path to the future.","skills":{"Intellectual":4,"Social":2,"Medicine":3,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"PiousSoldier67","title":"pious soldier","titleShort":"pious soldier","desc":"When not training or combat, This pawn was often at the chaplain's side. This pawn dedicated their life to serving both their lord and their religion.","skills":{"Shooting":6,"Melee":4},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"Pirate56","title":"pirate","titleShort":"pirate","desc":"As a pirate leader, This pawn was well-known for their cunning plans and chess-like traps. This pawn was never afraid to sacrifice a few pawns to capture an important target.\ntheir name has been linked more then once to strategies that overcame overwhelming odds.","skills":{"Shooting":4,"Melee":2,"Social":8},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"PirateCaptain69","title":"pirate captain","titleShort":"captain","desc":"This pawn worked their way up through the ranks of a pirate ship, eventually becoming captain. This pawn leads their crew between worlds, making a name to remember.","skills":{"Shooting":5,"Melee":5,"Social":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"PirateDoctor0","title":"pirate doctor","titleShort":"bad doc","desc":"This pawn had a passion for medicine, but never bothered to get a medical degree. Only underfunded pirates and terrorists were desperate enough to hire their services, and their surgical patients had about a 50% survival rate.\nDespite this, their optimistic attitude drove them to keep trying to heal those in need. As long as they paid up front.","skills":{"Intellectual":3,"Mining":-3,"Social":-2,"Medicine":4,"Artistic":-3},"disabledWork":[],"requiredWork":[],"traits":{"NaturalMood":1}},{"name":"PirateKing69","title":"pirate king","titleShort":"pirate","desc":"With no real care for other people, This pawn fit in perfectly with the pirate crew that had once held them captive. Shortly after joining the crew, This pawn began to kill anyone or anything that got in their way\u2014including their crewmates.","skills":{"Shooting":7,"Melee":5,"Artistic":-2},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{"Bloodlust":0}},{"name":"PirateSympathizer24","title":"pirate sympathizer","titleShort":"pirate","desc":"From their youth, This pawn developed connections in the underworld. There This pawn trained in melee combat and became a trusted underworld advisor.\nAfter participating in a failed rebellion, This pawn fled their homeworld to travel with a pirate band.","skills":{"Shooting":4,"Melee":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"PirateTrooper73","title":"pirate trooper","titleShort":"trooper","desc":"This pawn joined a renowned interstellar criminal organization, and was often part of shock-assault boarding parties during starship raids.\nThough their combat experience made them a good fighter, the ruthlessness of the job left them cold-hearted and unenthusiastic about social interaction.","skills":{"Shooting":6,"Melee":5},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{}},{"name":"PitBrawler76","title":"pit brawler","titleShort":"brawler","desc":"This pawn was nine years old when This pawn got in their first fight. This pawn won, but more important was the enjoyment of their audience. Pit fighting turned out to be a lucrative career for those who could survive it. And it was even mostly legal.","skills":{"Melee":8},"disabledWork":["Intellectual","Caring"],"requiredWork":["Violent"],"traits":{"Brawler":0}},{"name":"PlagueDoctor31","title":"plague doctor","titleShort":"doctor","desc":"This pawn provided medical care on multiple plague-wracked worlds, always working under the Hippocratic oath. This pawn improved conditions for those under quarantine while administering complex medical treatments and developing medicines.\nThis pawn never had time to enjoy a normal life outside of work.","skills":{"Intellectual":4,"Social":-2,"Medicine":8},"disabledWork":["Violent","Animals","Artistic","Cooking"],"requiredWork":[],"traits":{}},{"name":"PlanetaryDiplomat7","title":"planetary diplomat","titleShort":"diplomat","desc":"This pawn's passion and profession was interplanetary politics. This pawn was a master of social manipulation and negotiation and devoted themself to working towards peace, compromise and mutual benefit.","skills":{"Construction":-2,"Intellectual":3,"Social":8,"Artistic":2},"disabledWork":["ManualDumb","Violent","Hauling","PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"PlanetaryMiner64","title":"planetary miner","titleShort":"miner","desc":"This pawn was a mining engineer for a major planetary mining corporation. This pawn work kept them underground for weeks at a time, and This pawn grew to appreciate the darkness.","skills":{"Mining":8},"disabledWork":[],"requiredWork":["Mining"],"traits":{"Undergrounder":0}},{"name":"PlankCutter72","title":"plank cutter","titleShort":"plank cutter","desc":"This pawn helped their tribe build huge wooden structures by cutting trees into sturdy planks. This pawn developed a fine understanding of how wood grows and splits.","skills":{"Plants":6,"Melee":3},"disabledWork":[],"requiredWork":["PlantWork"],"traits":{}},{"name":"PoisonGardener29","title":"poison gardener","titleShort":"botanist","desc":"This pawn spent almost all their time tending to a poison garden and became withdrawn from society.\nIn that time This pawn learnt a few safe culinary and medicinal uses for the otherwise deadly plants.","skills":{"Plants":4,"Intellectual":1,"Cooking":2,"Medicine":2},"disabledWork":["Social","Hauling","Mining"],"requiredWork":[],"traits":{}},{"name":"Policeman45","title":"policeman","titleShort":"policeman","desc":"This pawn kept the peace as a line officer in a municipal police force.\nThis pawn was trained in de-escalation, physical control, shooting, and other police skills.","skills":{"Social":3,"Shooting":4,"Melee":3},"disabledWork":[],"requiredWork":["Social","Violent"],"traits":{}},{"name":"PoliticalActivist20","title":"political activist","titleShort":"activist","desc":"This pawn was involved with a radical political faction which worked against their homeworld's government.\nThe guerilla tactics training that This pawn received from their associates gave them the skills to fight, but also drove them to compromise their own beliefs.","skills":{"Intellectual":2,"Shooting":5,"Melee":3,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"PoliticalAssassin46","title":"political assassin","titleShort":"deathjack","desc":"This pawn realized that their true calling was in physical solutions to diplomatic problems. This pawn sought training from the assassins guild on Ceti V.\nThis pawn was a quick study at the arts of subterfuge and death. This pawn soon earned the guild rank of Deathjack.","skills":{"Shooting":8,"Melee":8},"disabledWork":["ManualDumb","Caring","Social","Artistic"],"requiredWork":[],"traits":{}},{"name":"Politician57","title":"politician","titleShort":"politician","desc":"This pawn was an activist in a powerful political faction. There This pawn learned the art of persuasion and speech.\nThis pawn had many enemies, so This pawn took secret courses in shooting and hand-to-hand combat.","skills":{"Shooting":2,"Melee":2,"Social":5},"disabledWork":["PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"PopIdol59","title":"pop idol","titleShort":"pop idol","desc":"This pawn performed and did interviews constantly. This pawn refined their skills in dancing and singing, and became a master of social presentation.","skills":{"Shooting":-4,"Melee":-4,"Social":8,"Artistic":8},"disabledWork":["ManualDumb","Cleaning","Hauling","PlantWork","Mining"],"requiredWork":[],"traits":{"Beauty":2}},{"name":"PopIdolPirate39","title":"pop idol pirate","titleShort":"pirate","desc":"This pawn and their fans set out as a space pirate crew. This pawn raided corporations for money and staged performances to spread their name.\nThis pawn became afraid of fire when a rival burned their stage down. This pawn relied on their fans to do the work This pawn found unappealing.","skills":{"Plants":-2,"Shooting":5,"Melee":7,"Social":4,"Cooking":-2},"disabledWork":["ManualDumb","Caring","Firefighting"],"requiredWork":[],"traits":{"Beauty":2,"Greedy":0}},{"name":"PrisonerOfWar2","title":"prisoner of war","titleShort":"prisoner","desc":"This pawn was captured and put on death row for war crimes.\nFortunately for them, someone cut the power to their cell block. Riots ignited. Guards and trained wargs were deployed to quell the uprising. Organizing a few other inmates, This pawn escaped in a small spacecraft.","skills":{"Shooting":4,"Melee":4,"Social":4},"disabledWork":["Animals"],"requiredWork":[],"traits":{}},{"name":"PrivateDetective66","title":"private detective","titleShort":"detective","desc":"As a private eye, sharp wits and a silver tongue were This pawn's greatest tools. This pawn often spent their nights working cases that ranged from uncovering affairs and learning trade secrets to solving murder cases and infiltrating criminal organizations. There wasn't a case This pawn wouldn't accept for the right price.","skills":{"Intellectual":4,"Social":7},"disabledWork":["PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"Propagandist86","title":"propagandist","titleShort":"propagandist","desc":"This pawn was a skilled artist and military propagandist. This pawn created works of art depicting their lords and armies fovourably.","skills":{"Artistic":6,"Social":2},"disabledWork":[],"requiredWork":["Artistic"],"traits":{}},{"name":"ProstheticSurgeon0","title":"prosthetic surgeon","titleShort":"surgeon","desc":"This pawn used their talent for prosthetics to 'advance' others by replacing limbs and organs with metal and electronics.","skills":{"Plants":-2,"Intellectual":4,"Medicine":6,"Crafting":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ProstituteIdol28","title":"prostitute idol","titleShort":"prostitute","desc":"After their father was deposed, This pawn's beauty led them to be forced into pornography to survive.\nOver years of difficult treatments, their body was remodeled to appear temporarily ageless. Sold to an orbital brothel, This pawn became popular, with a steady stream of clients from all over the planet.","skills":{"Social":7,"Cooking":3,"Artistic":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"PsychiatricPatient94","title":"psychiatric patient","titleShort":"patient","desc":"This pawn spent most of their adult life in an insane asylum. their industrial homeworld had a poor understanding of mental illness, and This pawn was treated more like an animal than a person.\nThough This pawn eventually recovered and was released, their experience dampened many of their basic life skills.","skills":{"Cooking":-2,"Crafting":-2},"disabledWork":["Social","Caring","Violent"],"requiredWork":[],"traits":{}},{"name":"QuarryWorker29","title":"quarry worker","titleShort":"quarry worker","desc":"This pawn worked in a quarry helping to extract valuable stone from the hillside. This pawn learned to sense opportunities and dangers in the stone by sight, touch, and intuition.","skills":{"Mining":8},"disabledWork":[],"requiredWork":["Mining"],"traits":{}},{"name":"RaiderKing38","title":"raider king","titleShort":"Pirate","desc":"Starting as nothing more than a slave, This pawn rose quickly among the raider ranks until all knew their name and their ruthlessness.","skills":{"Mining":3,"Shooting":5,"Melee":5},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"Rancher43","title":"rancher","titleShort":"rancher","desc":"This pawn owned and operated a successful ranch where This pawn raised animals for meat and wool.\nThis pawn refused to do any dumb labour This pawn could pay someone else to do for them.","skills":{"Animals":8,"Cooking":-4,"Mining":-4},"disabledWork":["ManualDumb"],"requiredWork":["Animals"],"traits":{}},{"name":"Ranger96","title":"ranger","titleShort":"ranger","desc":"This pawn tracked animals and people for a wide range of clients. This pawn became adept at reading spoor, finding food in the wild, and stalking prey.","skills":{"Plants":6},"disabledWork":[],"requiredWork":["PlantWork"],"traits":{}},{"name":"Ranger6","title":"ranger","titleShort":"ranger","desc":"This pawn lived alone, deep in a forest. This pawn protected the wildlife against poachers, and learned to satisfy their own material needs without outside help.","skills":{"Construction":2,"Plants":2,"Shooting":4,"Cooking":2,"Medicine":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"RebelFighter39","title":"rebel fighter","titleShort":"rebel","desc":"When civil war broke out This pawn remained neutral, until their home was firebombed by a loyalist militia.\nLater, their unit gave them the nickname \"Rare\" after This pawn burnt down the luxury villa of a loyalist leader, with them still inside it.","skills":{"Shooting":4,"Melee":2},"disabledWork":["Caring","Artistic"],"requiredWork":[],"traits":{}},{"name":"ReconSniper89","title":"recon sniper","titleShort":"sniper","desc":"This pawn was a professional military sniper. This pawn was trained to rapidly reach into unexpected firing positions, snipe key targets, and escape before enemies could pinpoint their location.","skills":{"Shooting":9},"disabledWork":[],"requiredWork":["Violent"],"traits":{"SpeedOffset":2}},{"name":"Recruiter14","title":"recruiter","titleShort":"recruiter","desc":"This pawn was part of a revered order of martial artists, infamous both for their skill in combat and for their practice of refusing to treat their wounded.\nThis pawn travelled their homeworld, judging the young people This pawn met to determine if they might be suitable for training.","skills":{"Melee":5,"Social":5},"disabledWork":["Caring"],"requiredWork":["Social"],"traits":{}},{"name":"Regent9","title":"regent","titleShort":"regent","desc":"When This pawn's family's ally was killed, and their young son inherited his throne, This pawn was appointed as regent to rule in the child's stead.\nThis pawn oversaw diverse matters of house and title, from finances to war to greedy relatives intent on usurping the throne. This pawn never abused their position.","skills":{"Social":5,"Intellectual":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ReligiousHierarch16","title":"religious hierarch","titleShort":"hierarch","desc":"Ordained as a priest in their local community, This pawn used intrigue and diplomacy to rise to the higher echelon of the clergy. This pawn held numerous titles and lands.\nOne day, a merchant landed their spaceship near This pawn's home. This pawn decided to accompany the merchant in search for new worlds and challenges.","skills":{"Construction":-3,"Mining":-3,"Shooting":-2,"Melee":-2,"Social":8,"Cooking":4,"Medicine":5},"disabledWork":["ManualDumb","Artistic"],"requiredWork":[],"traits":{}},{"name":"RenegadeEngineer43","title":"renegade engineer","titleShort":"engineer","desc":"After a daring escape from the prison planet with a small crew of fellow inmates, This pawn set their gaze on their homeworld.\nThis pawn travelled there, recruited more followers, hijacked a space cruiser, and launched into the void.","skills":{"Intellectual":3,"Shooting":3,"Melee":3,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"RenownedProfessor51","title":"renowned professor","titleShort":"professor","desc":"This pawn's bottomless compassion and love of knowledge drove them to a life of teaching. This pawn became one of the best-known names in academia throughout the urbworld bubble.\ntheir holo-lectures were revered by all that watched, and the few students This pawn accepted into their seminars spoke widely of their kindness and patience.","skills":{"Intellectual":5,"Social":6},"disabledWork":[],"requiredWork":[],"traits":{"Kind":0}},{"name":"Reporter71","title":"reporter","titleShort":"reporter","desc":"This pawn spent many years as an investigative reporter. This pawn was notorious for making chaotic reports from exotic locations.\nAlthough seen as a lightweight by their critics, This pawn managed to break several high-profile stories after lengthy investigations.","skills":{"Intellectual":2,"Social":4,"Artistic":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ReptileResearcher37","title":"reptile researcher","titleShort":"researcher","desc":"After leaving their parents' vineyard, This pawn traveled across much of known space, and learned many skills along the way.\nThis pawn spent most of their time researching and interacting with reptile species. This pawn was renowned for making several breakthroughs, and for discovering the \"Thorny Devil\".","skills":{"Intellectual":7,"Cooking":2,"Medicine":3,"Artistic":3,"Crafting":2},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"Restorer70","title":"restorer","titleShort":"restorer","desc":"This pawn traveled the world, always looking for old and forgotten things to repair for the good of others, working to see the true beauty in all things.","skills":{"Construction":5,"Crafting":9,"Social":-2},"disabledWork":[],"requiredWork":[],"traits":{"NaturalMood":1}},{"name":"Roboticist1","title":"roboticist","titleShort":"roboticist","desc":"Sailors often died on the dangerous waters of This pawn's ocean planet. This pawn created robots to replace them.\nOver time, This pawn collected a small crew of robots to do their bidding. This pawn became proficient at mechanics and engineering, but lost the taste for manual labor.","skills":{"Construction":3,"Intellectual":7,"Crafting":3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"Roboticist41","title":"roboticist","titleShort":"roboticist","desc":"This pawn felt more comfortable with robots and artificial intelligences than with organic people, so This pawn worked as a roboticist. This pawn took a particular interest in mechanites and ancient technology.  \nThis pawn relied on other people for their basic needs.","skills":{"Construction":3,"Intellectual":4,"Crafting":6},"disabledWork":["Cooking","PlantWork"],"requiredWork":[],"traits":{}},{"name":"RocketEngineer53","title":"rocket engineer","titleShort":"engineer","desc":"This pawn won a grant to a top school and earned a degree in rocket engineering. After several years working for a space mining company This pawn left to travel and see the universe.","skills":{"Construction":4,"Intellectual":5,"Mining":3,"Social":-1,"Cooking":-4,"Medicine":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"RocketPioneer19","title":"rocket pioneer","titleShort":"rocketeer","desc":"As a self-taught engineer, This pawn escaped their dying homeworld on a rocket This pawn built themself. \nThis pawn later spent years of their life on several worlds, helping less-developed planets develop rocket technology.","skills":{"Construction":8,"Plants":-3,"Intellectual":5},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"RoyalCook18","title":"royal cook","titleShort":"cook","desc":"This pawn made meals for their aristocratic patrons.\nOnly the finest food was acceptable, so This pawn tended a small garden on the mansion grounds to get the freshest herbs and vegetables. This pawn fell in love with the food themself.","skills":{"Cooking":7,"Plants":2},"disabledWork":[],"requiredWork":["Cooking","PlantWork"],"traits":{"Gourmand":0}},{"name":"RoyalGuard51","title":"royal guard","titleShort":"guard","desc":"This pawn guarded the personal palace of a powerful lord.\nWhile violence was rare, palace intrigue was constant. This pawn's work taught This pawn to handle both words and guns.","skills":{"Shooting":4,"Melee":3,"Social":3},"disabledWork":[],"requiredWork":["Violent","Social"],"traits":{}},{"name":"RoyalMasseuse43","title":"royal masseuse","titleShort":"masseuse","desc":"This pawn was a massage artist for an extended royal house. This pawn serviced many members of the royal family, and their guests.\nThis pawn occasionally offered something extra, if the lord or lady was in the mood. Advancing in this line of work meant having refined social skills.","skills":{"Social":6},"disabledWork":[],"requiredWork":[],"traits":{"Beauty":2}},{"name":"RugbyPlayer71","title":"rugby player","titleShort":"winger","desc":"After years of addiction to virtual reality games, This pawn was saved when the doctors unplugged him.\nUnfortunately, they unplugged them during a match of Rugby Rampage 4. The mental backlash merged their real identity and their virtual identity, leaving them with the personality and skills of a rugby player.","skills":{"Construction":4,"Mining":3,"Melee":5},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{"Brawler":0}},{"name":"RunawayDancer35","title":"runaway dancer","titleShort":"dancer","desc":"Grown by and for science, This pawn gave it up. Instead, This pawn wanted to dance for crowds across many worlds, from the glamor of the glitterworlds to the dangers of the rim.\nSuch work required wearing a smile on their face and a pistol under their costume.","skills":{"Shooting":2,"Social":6,"Artistic":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SanitationCaptain29","title":"sanitation captain","titleShort":"janitor","desc":"After graduating officer training school, This pawn was assigned to main battle deck on the Thunder-Child. This pawn served there for a year before their \"gallant\" actions saw them reassigned to the maintenance corps.\nIt was with the maintenance corps This pawn was dubbed This pawn on account of their legs.","skills":{"Construction":5,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Scout59","title":"scout","titleShort":"scout","desc":"Since their tribe made contact with local outlanders, This pawn contracted their services out as a guide. Frequent contact with ancient technology made them comfortable with the lost machines.","skills":{"Shooting":2,"Intellectual":2,"Social":2},"disabledWork":[],"requiredWork":["Violent"],"traits":{"SpeedOffset":2}},{"name":"Sculptor63","title":"sculptor","titleShort":"sculptor","desc":"This pawn started off sculpting person-sized chunks of stone, but This pawn soon began to think bigger. With the help of mining robots, This pawn learned how to carve huge monuments out of cliffsides. Soon the nature parks of the glitterworld where This pawn lived were full of giant rock figures.","skills":{"Plants":-4,"Mining":4,"Artistic":9},"disabledWork":["ManualDumb","Crafting","Cooking"],"requiredWork":["Artistic"],"traits":{}},{"name":"SelflessHunter61","title":"selfless hunter","titleShort":"hunter","desc":"This pawn was a hunter of mysterious creatures that many didn't even believe existed. Sometimes the people were right - and sometimes they were wrong.\nAlong the way, This pawn helped people in need.","skills":{"Shooting":5,"Social":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SerialMurderer47","title":"serial murderer","titleShort":"murderer","desc":"This pawn started to enjoy killing people, so This pawn did more often and perfected their methods. This pawn lurked in the darkest streets, stalking prey for hours.\nThis pawn enjoyed making artworks of their victims, and was known for leaving their signature on the bodies of those This pawn killed.","skills":{"Shooting":4,"Melee":4,"Artistic":4},"disabledWork":["Animals"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"ShadowMarine63","title":"shadow marine","titleShort":"marine","desc":"After perfecting their skills as a pathfinder, This pawn left their unit to put their skills to use on the planets This pawn helped chart.\nFamiliar with orbital trade routes, This pawn was able to get onto and off any planet without being detected.","skills":{"Intellectual":4,"Shooting":4,"Melee":2,"Medicine":3,"Animals":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ShamanOfShadows47","title":"shaman of shadows","titleShort":"shaman","desc":"When the monsters of fire came from the sky, This pawn was called upon by their tribe to guide them into battle.\nThis pawn made use of medicines and rituals to inspire and lead the warriors of many tribes against the invaders. The pirates were forced to retreat without capturing a single slave.","skills":{"Construction":-2,"Plants":2,"Intellectual":2,"Social":6,"Medicine":4},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"Sheriff52","title":"sheriff","titleShort":"sheriff","desc":"This pawn was the law enforcer in an isolated industrial town. This pawn dealt with petty crime, dispute resolution, and the occasional drunken saloon shootout.","skills":{"Shooting":4,"Melee":4,"Social":4},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"Shipcracker37","title":"shipcracker","titleShort":"shipcracker","desc":"This pawn's role was to launch through the vacuum of space, land on the enemy ship's hull, punch holes to the interior, and conquer it in room-to-room combat. This pawn became very good at wielding heavy cataphract weapons to cut both steel and flesh.\nThis pawn also developed a taste for the drugs This pawn used to cope with the overwhelming stress.","skills":{"Shooting":3,"Melee":5,"Mining":4},"disabledWork":[],"requiredWork":["Violent"],"traits":{"DrugDesire":1}},{"name":"ShockTrooper15","title":"shock trooper","titleShort":"shocktroop","desc":"This pawn was in a deep space shock troop unit deployed on multiple planets in various wars.\nDuring a risky assault, their whole unit was wiped out. Nobody else knew what happened on the field that day, but This pawn will carry the burden forever.","skills":{"Shooting":7,"Melee":5,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SicklyLawyer49","title":"sickly lawyer","titleShort":"lawyer","desc":"As a lawyer, This pawn could convict a deaf man for stealing music. their sharp mind and lack of empathy let them say anything to get the other person to talk. With the right amount of money, This pawn knew, any case can be won.\ntheir childhood cough never went away.","skills":{"Social":8},"disabledWork":["ManualDumb","Mining"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"Sightseer70","title":"sightseer","titleShort":"sightseer","desc":"This pawn traveled the stars. This pawn could barely scrape together travel costs doing odd-jobs, but it was all worth it.\nThis pawn loved camping in exotic places and learning the patterns of strange wildlife. This pawn never could focus on intellectual endeavors, as their sightseeing distracted them far too much.","skills":{"Plants":2,"Shooting":2,"Melee":2,"Medicine":2,"Artistic":2,"Animals":2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"Slaughterer58","title":"slaughterer","titleShort":"slaughterer","desc":"This pawn slaughtered animals for a living. Others looked down on this work as filthy, but the skills required to manage and cleanly slaughter large numbers of animals were never simple.","skills":{"Animals":5},"disabledWork":[],"requiredWork":["Violent","Animals"],"traits":{}},{"name":"SlaveChemist84","title":"slave chemist","titleShort":"chemist","desc":"This pawn became a gifted pharmaceutical scientist, but was captured by slavers. This pawn was sold to a warlord and forced to create drugs to test on other slaves. This left them with deep and troubling questions on the ethics of scientific research and medicine.","skills":{"Construction":-1,"Intellectual":4,"Mining":-2,"Melee":-1,"Medicine":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Smuggler23","title":"smuggler","titleShort":"smuggler","desc":"As a contract pilot, This pawn had a knack for stealing goods and trafficking contraband without getting caught.\nThis pawn eventually saved up enough to buy their own ship, and used it to travel from world to world dealing their goods in person.","skills":{"Intellectual":-2,"Shooting":2,"Melee":2,"Social":5,"Medicine":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"SoftwareDeveloper84","title":"software developer","titleShort":"developer","desc":"After This pawn gained the ability to use automation to remove tedium, This pawn could no longer tolerate traditional education and employment.","skills":{"Plants":-3,"Intellectual":7,"Social":-3,"Artistic":3,"Crafting":5},"disabledWork":["ManualDumb","Cleaning","Hauling"],"requiredWork":[],"traits":{}},{"name":"SoleSurvivor85","title":"sole survivor","titleShort":"survivor","desc":"This pawn lived in a remote colony. When mechanoid centipedes attacked their home and killed their people, This pawn was the last survivor.","skills":{"Shooting":4,"Melee":5,"Social":-3},"disabledWork":["Animals","Artistic"],"requiredWork":[],"traits":{}},{"name":"SpaceBartender0","title":"space bartender","titleShort":"bartender","desc":"This pawn became a bartender on a space station. This pawn interacted with and befriended many strangers.\nAs time went on, This pawn used their knowledge of herbs to craft their own strange concoctions for their customers.","skills":{"Plants":4,"Social":4,"Cooking":5,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{"Kind":0}},{"name":"SpaceExplorer53","title":"space explorer","titleShort":"explorer","desc":"This pawn spent years trapped, alone on an unknown planet. This pawn quickly adapted to the local environment, and learned to communicate with their local enemies.\nThis long period alone left them without close friends. their heart is sensitive, but This pawn learned to hide their emotions very well.","skills":{"Construction":3,"Plants":3,"Mining":3,"Shooting":4,"Social":4},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"SpaceHumanitarian9","title":"space humanitarian","titleShort":"activist","desc":"After seeing the rampant poverty common on overcrowded urban worlds, This pawn decided to dedicate their life to helping the less fortunate. This crusade taught them how to care for the sick and the hungry.","skills":{"Plants":2,"Shooting":-2,"Cooking":4,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SpaceHunter79","title":"space hunter","titleShort":"huntsman","desc":"Now a man as well as proficient hunter and marksman, This pawn yearned for more. This pawn took leave from their birth world, traveling the great expanse in search of exotic game.","skills":{"Shooting":5,"Melee":1,"Cooking":1,"Medicine":2,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SpaceMarine16","title":"space marine","titleShort":"marine","desc":"This pawn was a warrior in an Imperial navy. their job was to punch into enemy starships, gun down the crew, and capture the ship intact. And This pawn was good at it.","skills":{"Melee":5,"Shooting":7},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"SpaceMarine51","title":"space marine","titleShort":"marine","desc":"This pawn was recruited into the security forces of an off-planet corporation.\nThis pawn defended their ships against pirates and engaged in private space warfare contracts.","skills":{"Shooting":6,"Melee":5,"Medicine":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"SpaceMarine19","title":"space marine","titleShort":"marine","desc":"This pawn joined a squad of space marines known for their brutal efficiency at killing. their last name and their lack of emotion during combat inspired their nickname.","skills":{"Shooting":6,"Melee":4,"Artistic":-3,"Crafting":-2},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{}},{"name":"SpaceMarine9","title":"space marine","titleShort":"marine","desc":"This pawn was a member of an elite imperial space warrior unit. Subjected to intense training, This pawn developed remarkable combat skills.\ntheir unit's quasi-religious ceremonies and beliefs helped them stay more-or-less sane through the horrors of the war.","skills":{"Shooting":6,"Melee":5,"Social":-2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"SpaceMarine94","title":"space marine","titleShort":"marine","desc":"This pawn was a warrior in an Imperial navy.\ntheir job was to punch into enemy starships, gun down the crew, and capture the ship intact. And This pawn was good at it.","skills":{"Shooting":7,"Melee":5},"disabledWork":["Cooking"],"requiredWork":[],"traits":{}},{"name":"SpaceMarine5","title":"space marine","titleShort":"marine","desc":"This pawn joined Interplanetary Marines to travel the stars fight for their planet. This pawn distinguished themself in several battles.\ntheir experiences desensitized them to people around them, and their social skills degraded. But, This pawn did learn how to fight.","skills":{"Shooting":8,"Melee":6},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{}},{"name":"SpaceMarineMedic10","title":"space marine medic","titleShort":"medic","desc":"This pawn joined a colony contact expeditionary force as a medic. The mission turned bad when the colonists turned out to be suffering from a zombifying disease. This pawn ran and fought for days.\nCornered with wounded men, This pawn sprayed enough ammunition to wear out four machine gun barrels, and learned the value of high-volume fire. But their nickname, Noob, stuck from that day forward.","skills":{"Shooting":6,"Melee":2,"Medicine":6},"disabledWork":[],"requiredWork":[],"traits":{"SpeedOffset":2,"ShootingAccuracy":-1}},{"name":"SpaceMerchant97","title":"space merchant","titleShort":"merchant","desc":"As part of a freelance interplanetary lifestyle, This pawn sought to dominate their romantic interests as much as their business adversaries. When This pawn didn't have their own ship to fly, This pawn worked charter ships for hire.","skills":{"Construction":4,"Shooting":2,"Social":5,"Crafting":2},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"SpaceNavyDoctor72","title":"space navy doctor","titleShort":"doctor","desc":"This pawn served several tours as a doctor on one of the few warships defending their homeworld. This pawn learned combat skills while fighting occasional pirate boarding parties, and became an expert at treating gruesome combat wounds.","skills":{"Construction":-2,"Plants":-2,"Mining":-2,"Shooting":3,"Melee":1,"Social":2,"Medicine":5,"Artistic":-1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SpaceNavyTech37","title":"space navy tech","titleShort":"navy tech","desc":"This pawn was in a space navy for the most powerful planet in the local star group. This pawn developed skills in maintenance, electronic systems, radar and imaging, and logistics management.\nThis pawn served with pride and patriotic love for their planet.","skills":{"Intellectual":8,"Shooting":4,"Melee":2,"Crafting":3},"disabledWork":["Mining"],"requiredWork":[],"traits":{}},{"name":"SpacePirate55","title":"space pirate","titleShort":"pirate","desc":"Piracy appears everywhere that governments are weak and society spread thin. This pawn was part of this age-old part of human existence, extorting and smashing peaceful trade ships for profit.","skills":{"Melee":4,"Shooting":4},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"SpaceRaider71","title":"space raider","titleShort":"Pirate","desc":"This pawn was the leader of a spaceborne pirate crew. Skipping between the rimworlds, This pawn became the feared enemy of many settlements.","skills":{"Shooting":8,"Melee":3,"Social":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SpaceResearcher25","title":"space researcher","titleShort":"researcher","desc":"This pawn inherited their parents' ship and carried on their research.\ntheir childhood experiences with diverse cultures allowed them to preserve their caring nature despite spending most of their life isolated in space.","skills":{"Plants":2,"Intellectual":6,"Mining":-1,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{"Kind":0}},{"name":"SpaceStationCook63","title":"space station cook","titleShort":"cook","desc":"The space station This pawn came from was far from any populated planets, and was in itself understaffed. For this reason, This pawn was forced to learn how to cook in order to keep the crew alive. While This pawn appreciated this learning opportunity, This pawn didn't appreciate the criticism which came with it, and has had self-esteem issues ever since.","skills":{"Melee":4,"Cooking":6},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{}},{"name":"SpaceTactician28","title":"space tactician","titleShort":"tactician","desc":"This pawn joined the space navy in an unstable system, fraught with large-scale interplanetary wars. This pawn turned out to have a sharp mind for battle, and became adept at commanding combat units to great effect.","skills":{"Shooting":4,"Intellectual":4},"disabledWork":["Social","Artistic"],"requiredWork":["Intellectual"],"traits":{}},{"name":"SpaceTechnician29","title":"space technician","titleShort":"technician","desc":"This pawn finally managed to flee their criminal life by getting a maintenance job on a nearby space station. This pawn performed multiple repairing and building operations. This pawn also used to participate in basic research activities and often defused co-workers' arguments. This pawn never liked doing art.","skills":{"Construction":5,"Intellectual":1,"Mining":2,"Social":1},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"SpaceTrafficker68","title":"space trafficker","titleShort":"trafficker","desc":"This pawn discovered This pawn was heir of their distant uncle's weapons-trading business.\nTo protect the future of the company This pawn went through extensive military training, in case of any \"unforeseen circumstances\".","skills":{"Shooting":5,"Melee":5,"Social":5,"Medicine":-2},"disabledWork":["Animals","Artistic","Crafting"],"requiredWork":[],"traits":{}},{"name":"SpaceshipChef41","title":"spaceship chef","titleShort":"chef","desc":"This pawn got a spot on a ship by becoming the ship's cook. This pawn enjoyed cooking and helping the doctor clean wounds, but This pawn never got used to cleaning the dishes.","skills":{"Cooking":7,"Medicine":5},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"SpaceshipSalesman34","title":"spaceship salesman","titleShort":"salesman","desc":"This pawn tried their hand at various jobs, including building space rabbit cages and working at a mutant wheat research project. Finally, This pawn found their true calling as a spacecraft salesman. Specializing in recreational spacecraft, their smooth talk and charming nature served them well.","skills":{"Construction":2,"Plants":1,"Intellectual":2,"Shooting":2,"Social":8,"Cooking":-1,"Medicine":-1,"Artistic":-2,"Crafting":-1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SpecialForces13","title":"special forces","titleShort":"specialist","desc":"Give me a reason to kill - a good reason!\nThis pawn was a soldier and a skilled one - so skilled that This pawn entered the special forces to battle militants and xenohuman raiders. This pawn never imagined themself as lone hero, but This pawn played their part in the group well.","skills":{"Shooting":7,"Melee":6,"Social":2},"disabledWork":["Intellectual","Animals","Artistic"],"requiredWork":[],"traits":{}},{"name":"Spiceminer81","title":"spiceminer","titleShort":"spiceminer","desc":"This pawn made their mark on the universe as a spice miner assigned to the lucrative mining colony of Rural Pen'The.\nLittle did This pawn know, This pawn was about to embark on a career path that would change their life.","skills":{"Construction":2,"Plants":-2,"Mining":8,"Social":2,"Medicine":-2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"Spy58","title":"spy","titleShort":"spy","desc":"This pawn was trained by their government in infiltration and espionage. This pawn learned to keep a cool head and to talk their way out of tight situations. When talking didn't work, This pawn was capable of more violent direct action.","skills":{"Shooting":2,"Melee":2,"Social":7},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Spymaster41","title":"spymaster","titleShort":"spymaster","desc":"As soon as This pawn was old enough, This pawn was given the post of spymaster for their house. their cold, calculating nature made them a natural at the arts of blade, poison, and betrayal.","skills":{"Social":4,"Shooting":3,"Melee":3},"disabledWork":[],"requiredWork":["Social","Violent"],"traits":{"Psychopath":0}},{"name":"StalwartFarmer21","title":"stalwart farmer","titleShort":"farmer","desc":"With the farm under constant threat from brigands, This pawn learned to defend themself with their father's hunting rifle. This pawn also mastered how to construct fences to keep livestock in and the local wildlife out. This pawn tried to paint a picture of their home and learned This pawn can only draw scribbles and ducks.","skills":{"Construction":3,"Plants":3,"Intellectual":-2,"Mining":2,"Shooting":5,"Melee":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"StalwartFarmer90","title":"stalwart farmer","titleShort":"farmer","desc":"With the farm under constant threat from brigands, This pawn learned to defend themself with their father's rifle. This pawn also mastered how to construct walls to keep livestock in and predators out.\nThis pawn once tried to paint a picture of their home, but discovered that This pawn could only draw scribbles and ducks.","skills":{"Construction":4,"Shooting":4,"Melee":2,"Crafting":2},"disabledWork":["Animals","Artistic","Cooking"],"requiredWork":[],"traits":{}},{"name":"StarKnight5","title":"star knight","titleShort":"knight","desc":"Abducted from their medieval homeworld, This pawn later escaped their captors via an impressive display of swordsmanship.\nFor a moment, as This pawn drifted in the escape pod, their childhood dream of becoming a knight among the stars felt so real. Then This pawn crash-landed.","skills":{"Shooting":2,"Melee":8,"Social":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"StarfighterPilot79","title":"starfighter pilot","titleShort":"pilot","desc":"After years of training and drilling, This pawn finally became a starfighter pilot.\nHundreds of combat missions later, This pawn grew bored and started seeking newer thrills. This pawn joined a band of space pirates, which eagerly welcomed them because of their piloting skill.","skills":{"Intellectual":4,"Mining":-3,"Shooting":7,"Melee":3,"Artistic":-3,"Animals":-3},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"StarshipDoctor37","title":"starship doctor","titleShort":"doctor","desc":"This pawn was a doctor on a starship. This pawn was a brilliant surgeon and dabbled in research of their own. However, This pawn was quite reclusive and never had the best bedside manner.","skills":{"Intellectual":5,"Melee":-2,"Social":-3,"Medicine":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"StarshipJanitor33","title":"starship janitor","titleShort":"janitor","desc":"While other passengers pass the years between star systems in cryptosleep sarcophagi, This pawn had to wake up at periodic intervals to perform inspections, check the navigation systems, and to oil the mechanoids.","skills":{"Construction":2,"Crafting":3},"disabledWork":[],"requiredWork":["ManualDumb","ManualSkilled"],"traits":{}},{"name":"StateEngineer60","title":"state engineer","titleShort":"engineer","desc":"This pawn enrolled in the state weapons research program.\nWhile brilliant in their work, This pawn was so enthusiastic in testing their creations that This pawn accidentally wounded some colleagues and was marked as unfit for service.","skills":{"Construction":2,"Intellectual":4,"Crafting":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"StationSecurity38","title":"station security","titleShort":"security","desc":"This pawn was commissioned as a special constable on a network of space stations. There This pawn prevented illegal human trafficking.\nOnce, fire broke out on the station, and This pawn saved many from the flames. Since then, This pawn has avoided fires.","skills":{"Shooting":4,"Melee":3,"Social":3,"Medicine":3,"Artistic":-3},"disabledWork":["Firefighting"],"requiredWork":[],"traits":{}},{"name":"StellarPirate10","title":"stellar pirate","titleShort":"pirate","desc":"This pawn was captain of a pirate ship. This pawn and their crew made their living capturing traders who wandered off-course.\nThis pawn was known for their balanced approach to problems, building, fighting, or negotiating as needed.","skills":{"Shooting":4,"Social":4,"Crafting":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"StewKeeper95","title":"stew keeper","titleShort":"stewkeeper","desc":"This pawn prepared meals from the plants and animals brought in by gatherers, farmers, and hunters of their tribe. This pawn had to make sure it was calorie-efficient, long-lasting, and healthy. This pawn often processed and sometime gathered plants themself.","skills":{"Cooking":6,"Plants":2},"disabledWork":[],"requiredWork":["Cooking"],"traits":{}},{"name":"StilettoAssassin34","title":"stiletto assassin","titleShort":"assassin","desc":"Because of their skills, This pawn developed a sense of superiority. In time, This pawn lost their sense of empathy. This pawn often got into fights, and discovered how easy it is to kill a person.\nAfter realizing their talents, This pawn became one of the most efficient assassins in the system.","skills":{"Construction":-3,"Mining":-3,"Shooting":6,"Melee":8,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Storyteller63","title":"storyteller","titleShort":"fabulist","desc":"This pawn traveled their world recounting the legends that This pawn had studied.\nObsessed with the legends of their people, This pawn seeks someone who can help them grow scales on their skin, so This pawn too can be as the ancients were.","skills":{"Intellectual":2,"Social":4,"Artistic":3,"Crafting":2},"disabledWork":["Cooking","Mining"],"requiredWork":[],"traits":{}},{"name":"SuperSoldier95","title":"super soldier","titleShort":"soldier","desc":"Product of a super-soldier program run by a now-deposed government, This pawn was lost. This pawn survived the final suicide attack on the enemy mothership. What now?\nFor the first time in their life, This pawn had no orders, no objectives. This pawn rose from wreckage and strove towards uncertainty, towards freedom.","skills":{"Shooting":8,"Melee":7,"Crafting":-3},"disabledWork":["Social","Animals","Artistic"],"requiredWork":[],"traits":{}},{"name":"SystemLord77","title":"system lord","titleShort":"lord","desc":"For This pawn, ruling a country, or even a planet, was not good enough. This pawn sought to expand their influence across the system - by legal or extralegal means.","skills":{"Shooting":6,"Melee":2,"Social":6},"disabledWork":["Caring"],"requiredWork":[],"traits":{"Greedy":0}},{"name":"SystemsEngineer1","title":"systems engineer","titleShort":"engineer","desc":"Like their father, This pawn was a systems engineer. This pawn was qualified in both colony and ship systems.\nWhen not working, This pawn would make mechanical figurines, read old books, or occasionally travel to uncharted worlds. Being introverted, This pawn did these things mostly alone.","skills":{"Construction":5,"Intellectual":7,"Crafting":4},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"Tamer79","title":"tamer","titleShort":"tamer","desc":"This pawn's role in their tribe was to connect with the natural world around - especially the world of animals. In addition to fulfilling a spiritual role, This pawn also tamed wild beasts and cared for them as they served the tribe.","skills":{"Animals":6,"Social":2},"disabledWork":[],"requiredWork":["Animals"],"traits":{}},{"name":"Taster16","title":"taster","titleShort":"taster","desc":"As the taster for a medieval king, any dish served at the royal table had to be sampled first by This pawn. This pawn lived a decadent lifestyle at court, getting fat and doing very little work.","skills":{"Cooking":7,"Construction":-4,"Crafting":-4},"disabledWork":["ManualDumb"],"requiredWork":["Cooking"],"traits":{}},{"name":"Taxonomist0","title":"taxonomist","titleShort":"taxonomist","desc":"This pawn travelled between star systems, studying and classifying the plant and animal life This pawn found in the hopes of creating a complete catalogue.","skills":{"Animals":5,"Plants":5},"disabledWork":["Violent"],"requiredWork":["Intellectual"],"traits":{}},{"name":"Teacher20","title":"teacher","titleShort":"teacher","desc":"This pawn was educated in the liberal arts and taught at a public school. This pawn was widely knowledgeable and well-liked by their students.","skills":{"Intellectual":3,"Social":4},"disabledWork":[],"requiredWork":["Intellectual","Social"],"traits":{}},{"name":"Technician9","title":"technician","titleShort":"techie","desc":"As an IT technician, This pawn didn't have much time to write code any more.\nThis pawn got called to work all the time to fix failures in the cryptosleep chamber and AI persuasion systems.","skills":{"Construction":2,"Intellectual":6,"Medicine":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"TechnologyDoctor35","title":"technology doctor","titleShort":"tech doc","desc":"This pawn performed research into propulsive fuels and energy generation.\nThis pawn loved technology research, and hoped to improve human life by doing it.","skills":{"Construction":3,"Intellectual":8,"Crafting":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"TestSubject90","title":"test subject","titleShort":"experiment","desc":"Kidnapped as a teenager, This pawn was an unwilling test subject in experimental gene therapies. Labs and scientists scare them.","skills":{"Shooting":6,"Melee":8,"Social":-4},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{"BodyPurist":0}},{"name":"TestSubject39","title":"test subject","titleShort":"subject","desc":"This pawn enrolled in a scientific study that promised it could make them smarter. Unfortunately, the side effects were very different than This pawn expected.This pawn went insane and killed a number of people before escaping.","skills":{"Shooting":4,"Melee":4},"disabledWork":["Caring","Social","Artistic","Cooking","Cleaning","PlantWork"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"TestSubject92","title":"test subject","titleShort":"subject","desc":"This pawn's tests went from geometry to quantum physics, and This pawn could run the grand gauntlet without a scratch.\nOne day, Mother said that their final test lay beyond the red door, and that even if This pawn couldn't hear her voice, Mother would always be there.","skills":{"Intellectual":5,"Melee":5,"Cooking":1},"disabledWork":["Caring","Social","PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"TheaterTechnician80","title":"theater technician","titleShort":"technician","desc":"This pawn spent countless hours behind the scenes of a famous theater. This pawn built scenery, programmed lights, and monitored the machines that moved the sets.\nOff duty, This pawn would talk with the cast members. Navigating the social drama of the actors helped them learn how to communicate well and manipulate others.","skills":{"Construction":3,"Social":3,"Artistic":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Tinkerer86","title":"tinkerer","titleShort":"tinkerer","desc":"\"How does this work?\nWhy does this move?\nMaybe if I change this... oops, I hope it works better... or maybe I broke it...\"","skills":{"Construction":4,"Intellectual":4,"Artistic":2,"Crafting":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ToasterRepairman22","title":"toaster repairman","titleShort":"repairman","desc":"Good with their hands and passionate about technology, This pawn aspired to invent gadgets and machines that would change their home world forever.\nA few failed and occasionally disastrous creations later, This pawn gave up on their dream and took a job more befitting their skill set.","skills":{"Construction":7,"Mining":-3,"Crafting":6},"disabledWork":["Intellectual","Artistic"],"requiredWork":[],"traits":{}},{"name":"ToolMechanic77","title":"tool mechanic","titleShort":"mechanic","desc":"This pawn was a famous tool mechanic on a dusty rimworld.\nAfter their firm closed due to scandal, This pawn joined a tribe to survive, crafting fine knives and hammers, traveling, and dealing their wares between settlements.","skills":{"Construction":5,"Artistic":2,"Crafting":8},"disabledWork":["Animals","PlantWork"],"requiredWork":[],"traits":{}},{"name":"Torturer37","title":"torturer","titleShort":"torturer","desc":"Working for a tyrannical dictator, This pawn earned a reputation as an expert in 'persuasion.' Any prisoner who went down into the dungeons left with no secrets - and with This pawn's smile scarred permanently into their nightmares.","skills":{"Melee":6},"disabledWork":["Social","Caring"],"requiredWork":["Violent"],"traits":{"Psychopath":0}},{"name":"TournamentFighter28","title":"tournament fighter","titleShort":"fighter","desc":"Motivated by the violence in their environment, This pawn studied martial arts, eventually signing up for an unarmed fighting tournament.\n        Unlike their opponents, This pawn looked to the ancient warriors for guidance. This pawn trained from dusk till dawn, perfecting their skills.","skills":{"Intellectual":2,"Melee":8,"Medicine":1},"disabledWork":["ManualSkilled"],"requiredWork":[],"traits":{}},{"name":"TreasureHunter82","title":"treasure hunter","titleShort":"adventurer","desc":"This pawn explored outlying rimworlds in hopes of finding rare treasures.\nAfter succeeding in finding one legendary sculpture, This pawn was betrayed by their men. This pawn survived their treasonous attack, but the sculpture was taken.\nThis pawn created the Anvil Mercenary Company to help them seek revenge.","skills":{"Shooting":5,"Melee":5,"Social":4,"Cooking":2,"Medicine":2},"disabledWork":["ManualDumb","Animals","Artistic"],"requiredWork":[],"traits":{}},{"name":"TreehouseBuilder86","title":"treehouse builder","titleShort":"treehouse builder","desc":"This pawn built houses among, and sometimes suspended in, the trees for their people to use while traveling or foraging. This pawn learned how to best find and use wild plants, and how to fight off wild animals.","skills":{"Plants":6,"Melee":3},"disabledWork":[],"requiredWork":["PlantWork"],"traits":{}},{"name":"Undertaker93","title":"undertaker","titleShort":"undertaker","desc":"This pawn roamed, offering grief assistance to those who've had a recent loss. While This pawn never shied away from physical confrontation, This pawn prefers to confront tough situations with a calm word.","skills":{"Intellectual":3,"Social":6,"Medicine":2},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"UnethicalDoctor29","title":"unethical doctor","titleShort":"doctor","desc":"This pawn became a doctor to save lives and research medicine. This pawn soon realized the only way to make progress on their research was to perform experiments on human patients.\nThis pawn often used patients for their experiments - whether they were willing or not.","skills":{"Intellectual":6,"Medicine":6},"disabledWork":["ManualDumb","Social"],"requiredWork":[],"traits":{}},{"name":"UnstableButcher31","title":"unstable butcher","titleShort":"butcher","desc":"This pawn began hearing voices. The animals were talking to them, insulting him. This pawn came to hate them, and eventually killed their furry former friends. This pawn started selling the meat just to get human interaction.","skills":{"Construction":4,"Intellectual":-4,"Mining":3,"Melee":6,"Social":2,"Medicine":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"UprightDiplomat49","title":"upright diplomat","titleShort":"diplomat","desc":"As a diplomat, This pawn was assigned to deal with diplomatic tasks in the blood-soaked outer rim sectors.\nThis pawn hoped to end the endless wars, until their consularship, the St. Anthem, was attacked by a raider fleet.","skills":{"Construction":-3,"Shooting":4,"Social":8,"Crafting":-3},"disabledWork":["Hauling"],"requiredWork":[],"traits":{}},{"name":"UrbworldDrone32","title":"urbworld drone","titleShort":"drone","desc":"This pawn worked as a mindless construction drone on a massive urbworld. Though This pawn is now freed from the brutal social experiments to which This pawn was subjected, This pawn remains incapable of creative thought and leadership.","skills":{"Construction":5,"Mining":4,"Social":-2},"disabledWork":["Artistic","Intellectual"],"requiredWork":["ManualDumb","ManualSkilled"],"traits":{}},{"name":"UrbworldEnforcer11","title":"urbworld enforcer","titleShort":"enforcer","desc":"This pawn was an enforcer of law on an ancient urbworld.\nThis pawn dealt with the worst of humanity, from protecting greedy urbworld nobility in their spire palaces to rooting out cannibal cults in the deepest reaches of the underground hive.","skills":{"Shooting":7,"Melee":4,"Social":3,"Medicine":2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{"Tough":0}},{"name":"UrbworldEntrepreneur14","title":"urbworld entrepreneur","titleShort":"entrepreneur","desc":"In the urbworlds, most suffer. But someone has to run the corporations.\nThis pawn learned the skills of the trade - greasing palms and technical analysis. This pawn is a sociointellectual machine.","skills":{"Social":6,"Intellectual":3},"disabledWork":[],"requiredWork":["Social"],"traits":{}},{"name":"UrbworldPimp93","title":"urbworld pimp","titleShort":"pimp","desc":"At first, This pawn made a small profit from selling drugs. Then, This pawn switched to selling women and made a fortune.\nThis pawn developed great skills with their fists. This pawn also learned to fix up the injuries This pawn inflicted on the girls.","skills":{"Melee":6,"Social":4,"Medicine":5},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"UrbworldPolitican92","title":"urbworld politican","titleShort":"politician","desc":"It's no secret that the Companies own much of the urbworlds, but someone has to take the bribes. This pawn was one such figurehead.\nThis pawn learned how to manipulate the hopes and dreams of the people while living comfortably in a penthouse.","skills":{"Social":8},"disabledWork":["ManualDumb","Crafting"],"requiredWork":[],"traits":{"Greedy":0}},{"name":"UrbworldRebel56","title":"urbworld rebel","titleShort":"rebel","desc":"Most of the people on This pawn's world gave up their individuality to join together in an online hivemind. This pawn joined a rebel faction that rejected technology entirely.","skills":{"Melee":3,"Construction":3,"Mining":2},"disabledWork":["Intellectual","Crafting"],"requiredWork":["ManualDumb"],"traits":{}},{"name":"UrbworldSergeant50","title":"urbworld sergeant","titleShort":"sergeant","desc":"This pawn's passion for all things militaristic kept with them all the way to adulthood.\nAfter enrolling as a local policeman, This pawn was soon promoted to sergeant.","skills":{"Shooting":4,"Melee":2,"Social":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"UrbworldSexSlave25","title":"urbworld sex slave","titleShort":"sex slave","desc":"This pawn was sold into sexual slavery. Having been designed to be inhumanly attractive and too weak to rebel against their masters, This pawn was passed between dozens of owners and knew nothing of freedom.","skills":{"Social":6,"Cooking":2,"Artistic":-2},"disabledWork":["Violent","Intellectual"],"requiredWork":[],"traits":{"Beauty":2}},{"name":"Vagabond73","title":"vagabond","titleShort":"vagabond","desc":"This pawn awoke on a dangerous planet with no resources and few survival skills. This pawn bounced between camps, doing whatever work needed to be done, just to see the sun rise once more.","skills":{"Construction":4,"Shooting":3,"Cooking":-2,"Crafting":4,"Animals":4},"disabledWork":["Intellectual","Artistic"],"requiredWork":[],"traits":{}},{"name":"VengefulExplorer54","title":"vengeful explorer","titleShort":"explorer","desc":"A violent drifter without a home, This pawn and their father fought many battles across hundreds of years. This pawn became a grizzled fighter and crack shot.\nAfter their father's death in battle, This pawn began exploring the stars alone, seeking their father's killer, on the hunt for revenge.","skills":{"Construction":4,"Shooting":6,"Melee":5},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"VengefulHunter32","title":"vengeful hunter","titleShort":"vengeful","desc":"Following the death of a close friend by animal attack, This pawn hunted the beast responsible. This pawn tracked it to a nearby village, only to find one of the villagers wearing its pelt.","skills":{"Shooting":4,"Melee":6},"disabledWork":["Animals"],"requiredWork":["Violent"],"traits":{}},{"name":"VengefulNomad67","title":"vengeful nomad","titleShort":"nomad","desc":"After refusing the wild demands of a tyrannical king, This pawn's nomad band was marked as an outlaw group and systematically hunted.\n        This pawn's family was eventually captured. Those who weren't killed were taken as slaves. Sold to the owner of a manufactory, This pawn swore that one day This pawn would have their revenge.","skills":{"Construction":5,"Mining":1,"Crafting":7},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"VersatileWorker13","title":"versatile worker","titleShort":"worker","desc":"Spending their later teenage years in a colony of settlers, This pawn offered what little skills This pawn had to anyone who would take him.\nBeing a quick learner, This pawn honed many of their skills and, apart from their crippling inability to understand fire, is now a fully functioning adult.","skills":{"Construction":1,"Plants":4,"Melee":5,"Medicine":-1,"Crafting":2},"disabledWork":["Social","Intellectual","Firefighting"],"requiredWork":[],"traits":{"FastLearner":0}},{"name":"Veterinarian99","title":"veterinarian","titleShort":"vet","desc":"This pawn treated sick and injured animals for a living. Seeing their suffering affected their stance on the practice of eating meat, and for many years This pawn lived as a vegetarian.","skills":{"Animals":4,"Medicine":4,"Cooking":-4},"disabledWork":[],"requiredWork":["Caring"],"traits":{}},{"name":"VideoProducer83","title":"video producer","titleShort":"producer","desc":"Too awkward to socialize, This pawn found comfort in the production of videos. Oddly, people enjoyed their videos, calling them \"perfect sitcom dramas\".\nThis pawn took advantage of this and broadcast more, ever hopeful that This pawn would be contacted by the Wizards.","skills":{"Intellectual":2,"Artistic":7,"Crafting":4},"disabledWork":["ManualDumb","Social"],"requiredWork":[],"traits":{}},{"name":"Villain89","title":"villain","titleShort":"villain","desc":"After rising to the top of their criminal band, This pawn was taught the arts of villainy, from handling firearms to developing new weapons technologies. This pawn excelled at bending others to their will.","skills":{"Intellectual":2,"Mining":-2,"Shooting":4,"Social":6},"disabledWork":["Hauling"],"requiredWork":[],"traits":{}},{"name":"VinhoKing98","title":"vinho king","titleShort":"booze king","desc":"After prohibition came to Aracena VI, This pawn expanded their underground liquor business until it dominated the market on two continents. They called them the Vinho King.\nThough This pawn mostly controlled their competition by masterful political maneuvering, This pawn was not above the occasional beat-down or stiletto assassination.","skills":{"Intellectual":3,"Shooting":3,"Social":7},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"VoidRaider74","title":"void raider","titleShort":"Pirate","desc":"Craving adventure and glory, This pawn set out across the void with a raider band, swearing their loyalty to their band and brothers, and spreading their glory through the stars with their blade and pistol in hand.","skills":{"Shooting":6,"Melee":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"VoidspaceRaider94","title":"voidspace raider","titleShort":"Pirate","desc":"After years of seeking the assassin that broke up their family, This pawn was offered a place with a group of space-faring raiders. This pawn accepted, hoping to find the killer This pawn sought.\nDue to their seemingly-unending ability to narrowly escape danger, This pawn earned the nickname 'Blackjack' in recognition of their luck.","skills":{"Mining":2,"Shooting":4,"Melee":2,"Medicine":2,"Crafting":3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"WanderingCrafter42","title":"wandering crafter","titleShort":"crafter","desc":"This pawn continued to follow their parents' nomadic ways, supporting themself with their crafting skills. But wandering is a hard life, and This pawn often thought of finding somewhere to settle down and put their skills to good use.","skills":{"Intellectual":2,"Shooting":3,"Crafting":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"WanderingHealer52","title":"wandering healer","titleShort":"healer","desc":"This pawn studied to be a doctor, but was dissatisfied with their practice on an otherwise peaceful midworld.\nInstead, This pawn chose to pull up roots and travel to the rimworlds in order to care for people who needed them most.","skills":{"Construction":-1,"Mining":-1,"Social":3,"Cooking":2,"Medicine":7},"disabledWork":["Violent"],"requiredWork":[],"traits":{"Kind":0}},{"name":"WarChief97","title":"war chief","titleShort":"chief","desc":"This pawn was a tribal gang leader on a rimworld. For them, the battlefield is a game, and there is nothing more fun than the fires of war.","skills":{"Shooting":7,"Melee":5,"Social":2},"disabledWork":["Hauling","PlantWork"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"Warlordess56","title":"warlordess","titleShort":"warlordess","desc":"This pawn was the tough leader of a pirate band.\nThis pawn would accept any challenge, no matter how violent or dangerous. Others called them a killing machine.","skills":{"Mining":-2,"Melee":-2,"Social":6,"Cooking":6,"Medicine":5,"Artistic":3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"Warmaster54","title":"warmaster","titleShort":"warmaster","desc":"This pawn was warmaster to a mid-level royal house. This pawn oversaw military aspects of the family's strategy.\nOn the rare occasion a battle occurred, This pawn directed the military commanders.","skills":{"Shooting":2,"Melee":2,"Social":4,"Intellectual":4},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"Warmonger35","title":"warmonger","titleShort":"warmonger","desc":"This pawn revelled in bloodshed. Soldiers who served with them were terrified of their ferocity. They rarely socialized with This pawn, and This pawn did not mind the isolation.","skills":{"Shooting":7,"Melee":4,"Social":-3},"disabledWork":["Caring"],"requiredWork":["Violent"],"traits":{"Bloodlust":0}},{"name":"Warrior94","title":"warrior","titleShort":"warrior","desc":"This pawn was a fearsome warrior, proficient with many weapons. This pawn participated in many battles.","skills":{"Melee":4,"Shooting":4},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"Warrior73","title":"warrior","titleShort":"warrior","desc":"This pawn was a war hero during their planet's third world war. This pawn helped prevent the launch of nuclear weapons during a particularly tense standoff.","skills":{"Shooting":5,"Melee":4,"Cooking":2,"Medicine":3},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"WarshipCaptain67","title":"warship captain","titleShort":"captain","desc":"Years of being commanding officer of an advanced corvette taught This pawn the art of leadership, the techniques of higher engineering, and how to stay calm while enemies try to kill you.\nUnfortunately, This pawn only very rarely had contact with nature.","skills":{"Construction":3,"Plants":-3,"Intellectual":5,"Shooting":3,"Melee":2,"Social":5,"Animals":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Weaver63","title":"weaver","titleShort":"weaver","desc":"This pawn was an expert at working wool, plant fibers and natural dyes into beautiful clothing for their kin. their handicrafts were traded frequently with other settlements.","skills":{"Crafting":6,"Plants":2},"disabledWork":[],"requiredWork":["Crafting"],"traits":{}},{"name":"WhiteHatHacker82","title":"white-hat hacker","titleShort":"hacker","desc":"From their computer, This pawn helped rid the online world of bad people.","skills":{"Intellectual":8,"Social":-2,"Crafting":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"WildlifeRanger99","title":"wildlife ranger","titleShort":"ranger","desc":"Dismayed at the poachers driving several animal species to near-extinction, This pawn became a wildlife ranger. This pawn cared for and protect the animals - by force if necessary.\nThis pawn grew to hate people slaughtering animals for luxury and profit.","skills":{"Shooting":2,"Medicine":2,"Animals":8},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}}];
\ No newline at end of file
+var adulthoods = [{"name":"AIProgrammer22","skills":{"Intellectual":7,"Crafting":6},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"AIResearcher94","skills":{"Intellectual":6,"Mining":-2,"Melee":-2,"Social":4,"Crafting":1},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"AWOLSoldier49","skills":{"Shooting":6,"Melee":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CivilServant25","skills":{"Intellectual":3,"Social":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"RimworldExile32","skills":{"Intellectual":6,"Shooting":-2,"Social":5,"Cooking":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Streamer52","skills":{"Social":6,"Animals":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"TravelingBard93","skills":{"Social":5,"Artistic":4,"Crafting":2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"VRDesigner87","skills":{"Construction":3,"Plants":4,"Artistic":5},"disabledWork":["ManualDumb"],"requiredWork":["Artistic"],"traits":{}},{"name":"AceFighterPilot54","skills":{"Intellectual":2,"Mining":-3,"Shooting":3,"Melee":2,"Social":3,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"AcolyteOfStars6","skills":{"Intellectual":-3,"Social":-3,"Medicine":4,"Artistic":7},"disabledWork":["ManualDumb","Violent"],"requiredWork":[],"traits":{}},{"name":"Actor72","skills":{"Social":8,"Crafting":3},"disabledWork":["ManualDumb"],"requiredWork":["Social"],"traits":{}},{"name":"AddictionCounsel60","skills":{"Social":8,"Medicine":3,"Artistic":3,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Adventurer19","skills":{"Shooting":3,"Melee":3,"Social":3,"Medicine":3,"Crafting":3,"Animals":2},"disabledWork":["Cooking"],"requiredWork":[],"traits":{}},{"name":"AdventurousWeirdo55","skills":{"Shooting":-2,"Melee":6,"Cooking":2,"Artistic":2,"Crafting":2},"disabledWork":["Mining"],"requiredWork":[],"traits":{}},{"name":"AerospaceEngineer44","skills":{"Construction":2,"Intellectual":4,"Mining":2,"Shooting":2,"Social":2},"disabledWork":["Cleaning","PlantWork"],"requiredWork":[],"traits":{}},{"name":"AlcoholicTrucker93","skills":{"Mining":4,"Shooting":2,"Melee":2},"disabledWork":["Caring","Social","Intellectual","Artistic","Cleaning"],"requiredWork":[],"traits":{}},{"name":"AnarchistRebel77","skills":{"Shooting":6,"Melee":2,"Social":6},"disabledWork":["Crafting","Cleaning"],"requiredWork":[],"traits":{}},{"name":"AnimalFarmer21","skills":{"Animals":5},"disabledWork":[],"requiredWork":["Violent","Animals"],"traits":{}},{"name":"Archaeologist85","skills":{"Construction":4,"Intellectual":5,"Shooting":2,"Social":-2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Archer25","skills":{"Melee":2,"Shooting":7},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"Architect28","skills":{"Construction":5,"Artistic":7,"Crafting":-3},"disabledWork":["ManualDumb"],"requiredWork":["Intellectual"],"traits":{}},{"name":"ArchotechSpy75","skills":{"Construction":4,"Intellectual":4,"Shooting":8,"Melee":2,"Cooking":-2,"Crafting":2},"disabledWork":["Mining"],"requiredWork":[],"traits":{}},{"name":"ArmyCook0","skills":{"Construction":2,"Intellectual":-2,"Shooting":2,"Melee":2,"Cooking":3,"Crafting":1},"disabledWork":["Caring","Social","Firefighting"],"requiredWork":[],"traits":{}},{"name":"ArmyScientist35","skills":{"Intellectual":8,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ArmySergeant16","skills":{"Construction":2,"Shooting":8,"Melee":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Aromatherapist80","skills":{"Plants":6,"Shooting":-3,"Melee":-3,"Cooking":4,"Medicine":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ArtStudent79","skills":{"Construction":-2,"Plants":-1,"Cooking":-1,"Medicine":1,"Artistic":8,"Crafting":2},"disabledWork":["Mining"],"requiredWork":[],"traits":{}},{"name":"ArtifactHunter48","skills":{"Construction":4,"Shooting":8},"disabledWork":["Social"],"requiredWork":[],"traits":{"ShootingAccuracy":1}},{"name":"ArtificerRampant95","skills":{"Construction":2,"Intellectual":6,"Medicine":2,"Crafting":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Artilleryman28","skills":{"Shooting":6,"Melee":1},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"ArtsPatron54","skills":{"Social":5,"Artistic":5},"disabledWork":[],"requiredWork":["Social"],"traits":{"Nimble":0}},{"name":"AsceticPriest84","skills":{"Plants":4,"Medicine":2,"Cooking":2},"disabledWork":["Violent","Social"],"requiredWork":["PlantWork","ManualDumb"],"traits":{"Ascetic":0}},{"name":"Assassin20","skills":{"Melee":10,"Shooting":10},"disabledWork":["Intellectual","ManualDumb","ManualSkilled","Social","Caring"],"requiredWork":["Violent"],"traits":{"Psychopath":0}},{"name":"Assassin7","skills":{"Shooting":7,"Melee":4},"disabledWork":["Caring","Artistic","Crafting","Cooking","Cleaning","PlantWork"],"requiredWork":[],"traits":{}},{"name":"Assembler69","skills":{"Crafting":7},"disabledWork":[],"requiredWork":["ManualSkilled"],"traits":{}},{"name":"BalletDancer81","skills":{"Social":3,"Melee":3},"disabledWork":[],"requiredWork":["Social"],"traits":{"Nimble":0}},{"name":"BanditLeader74","skills":{"Shooting":5,"Melee":5,"Social":2},"disabledWork":["Intellectual","Cleaning"],"requiredWork":[],"traits":{}},{"name":"Banished68","skills":{"Melee":3,"Shooting":2,"Plants":4},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"BanishedSoldier85","skills":{"Melee":7},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Bartender62","skills":{"Social":4,"Melee":2,"Cooking":2},"disabledWork":[],"requiredWork":["Social","Cooking"],"traits":{}},{"name":"BattleMechanic27","skills":{"Shooting":5,"Melee":3,"Crafting":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BattlefieldTech52","skills":{"Construction":4,"Intellectual":4,"Shooting":3,"Cooking":-3,"Crafting":4},"disabledWork":["Firefighting","PlantWork"],"requiredWork":[],"traits":{}},{"name":"BeastSlayer67","skills":{"Plants":2,"Shooting":4,"Melee":4,"Cooking":3},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"Beastmaster67","skills":{"Animals":8},"disabledWork":[],"requiredWork":["Animals"],"traits":{}},{"name":"BehaviourResearch74","skills":{"Plants":-3,"Intellectual":8,"Melee":1,"Social":2,"Cooking":-2,"Medicine":6},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"BiosphereManager95","skills":{"Shooting":-4,"Animals":6,"Plants":6},"disabledWork":["ManualDumb","Crafting","Cooking"],"requiredWork":["Artistic"],"traits":{}},{"name":"Blacksmith72","skills":{"Shooting":-5,"Melee":4,"Crafting":6},"disabledWork":["Intellectual"],"requiredWork":["ManualDumb","ManualSkilled"],"traits":{}},{"name":"Blacksmith7","skills":{"Mining":2,"Melee":2,"Crafting":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BlacksmithShooter21","skills":{"Construction":3,"Shooting":5,"Crafting":3},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"BloodgameSurvivor6","skills":{"Construction":2,"Melee":7,"Social":6},"disabledWork":["Crafting"],"requiredWork":[],"traits":{}},{"name":"BloodyDentist9","skills":{"Intellectual":4,"Medicine":6,"Artistic":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BloodyWanderer28","skills":{"Construction":2,"Intellectual":-2,"Shooting":3,"Melee":4,"Crafting":2},"disabledWork":["Social","Firefighting"],"requiredWork":[],"traits":{"Bloodlust":0}},{"name":"Bodyguard58","skills":{"Shooting":4,"Melee":4},"disabledWork":["Social"],"requiredWork":["Violent"],"traits":{}},{"name":"BountyHunter93","skills":{"Shooting":5,"Melee":3,"Social":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BountyHunter17","skills":{"Shooting":6,"Melee":4,"Medicine":2},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"BountyHunter41","skills":{"Shooting":8,"Melee":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Brave88","skills":{"Melee":7,"Shooting":2},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"Brigand68","skills":{"Construction":2,"Shooting":2,"Melee":3,"Cooking":2,"Medicine":1,"Crafting":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BrokenSoldier29","skills":{"Artistic":2},"disabledWork":["Violent"],"requiredWork":["Violent"],"traits":{"Nerves":-2}},{"name":"Builder96","skills":{"Construction":7},"disabledWork":[],"requiredWork":["ManualDumb","ManualSkilled"],"traits":{}},{"name":"BushSniper94","skills":{"Plants":-3,"Shooting":6,"Cooking":2,"Artistic":-2,"Animals":4},"disabledWork":["Caring"],"requiredWork":[],"traits":{"ShootingAccuracy":1}},{"name":"BusinessGangster58","skills":{"Shooting":3,"Melee":5,"Social":7,"Artistic":2},"disabledWork":["Caring","Cleaning","PlantWork"],"requiredWork":[],"traits":{"Greedy":0}},{"name":"Butcher40","skills":{"Cooking":6,"Animals":3},"disabledWork":[],"requiredWork":["Violent","Animals"],"traits":{}},{"name":"Caravaneer53","skills":{"Shooting":4,"Social":7},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CargoPilot58","skills":{"Construction":2,"Mining":1,"Shooting":4,"Melee":2,"Social":1},"disabledWork":["Cooking","Cleaning"],"requiredWork":[],"traits":{}},{"name":"Carver1","skills":{"Artistic":7},"disabledWork":[],"requiredWork":["Artistic"],"traits":{}},{"name":"CasketBuilder52","skills":{"Construction":4,"Intellectual":4,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Castaway57","skills":{"Melee":5,"Animals":3,"Construction":4},"disabledWork":["Intellectual","Social","Artistic"],"requiredWork":["ManualDumb","PlantWork"],"traits":{}},{"name":"Castaway81","skills":{"Construction":2,"Plants":3,"Mining":2,"Cooking":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CaveBuilder81","skills":{"Mining":8,"Construction":2},"disabledWork":[],"requiredWork":["Mining","Constructing"],"traits":{}},{"name":"CaveExplorer45","skills":{"Mining":8},"disabledWork":[],"requiredWork":["Mining"],"traits":{}},{"name":"CaveworldIlluminator95","skills":{"Mining":3,"Social":2},"disabledWork":[],"requiredWork":["Mining","ManualSkilled"],"traits":{"Undergrounder":0}},{"name":"CharityWorker36","skills":{"Social":6,"Mining":-3},"disabledWork":["Violent"],"requiredWork":["Caring","Social"],"traits":{}},{"name":"Chef52","skills":{"Cooking":6,"Social":2},"disabledWork":["Cleaning","ManualDumb"],"requiredWork":["Cooking"],"traits":{}},{"name":"Chemist78","skills":{"Intellectual":6,"Social":-3,"Crafting":6},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"Chemist73","skills":{"Intellectual":6,"Social":2,"Medicine":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ChiefEngineer62","skills":{"Construction":3,"Intellectual":3,"Mining":2,"Social":-2,"Crafting":3},"disabledWork":["Animals"],"requiredWork":[],"traits":{}},{"name":"ChurchPsychic98","skills":{"Social":3,"Intellectual":5},"disabledWork":[],"requiredWork":["Social","Intellectual"],"traits":{"PsychicSensitivity":2}},{"name":"CivilEngineer2","skills":{"Construction":7,"Intellectual":3,"Mining":2,"Social":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CivilServant2","skills":{"Social":3,"Intellectual":3,"Construction":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ClanChief14","skills":{"Shooting":6,"Social":7},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"CloneFarmer58","skills":{"Social":6,"Medicine":4,"Crafting":2},"disabledWork":["Cooking","Firefighting","Mining"],"requiredWork":[],"traits":{}},{"name":"ColiseumFighter22","skills":{"Intellectual":2,"Shooting":5,"Social":-1,"Crafting":3},"disabledWork":["Caring","Artistic","PlantWork","Mining"],"requiredWork":[],"traits":{"Brawler":0}},{"name":"ColonialGovernor78","skills":{"Construction":3,"Shooting":1,"Social":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ColonyEngineer7","skills":{"Construction":7,"Intellectual":4,"Medicine":-3,"Crafting":4},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"ColonySettler53","skills":{"Construction":4,"Plants":4,"Mining":4},"disabledWork":[],"requiredWork":["ManualDumb","ManualSkilled"],"traits":{}},{"name":"CombatEngineer30","skills":{"Construction":6,"Intellectual":3,"Shooting":4,"Social":-3,"Cooking":-2,"Medicine":2,"Crafting":2},"disabledWork":["Artistic","Firefighting","PlantWork"],"requiredWork":[],"traits":{}},{"name":"CombatEngineer4","skills":{"Construction":2,"Shooting":5,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CombatMedic82","skills":{"Shooting":2,"Melee":1,"Medicine":6,"Artistic":-2},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"CombatMedtech59","skills":{"Construction":3,"Intellectual":1,"Medicine":5,"Crafting":5},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"CombatNegotiator31","skills":{"Shooting":4,"Melee":3,"Social":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CommonerLord45","skills":{"Melee":7,"Social":6},"disabledWork":["Cooking","Cleaning"],"requiredWork":[],"traits":{}},{"name":"ComputerEngineer10","skills":{"Intellectual":8,"Social":4,"Crafting":2},"disabledWork":["ManualDumb","Violent"],"requiredWork":[],"traits":{}},{"name":"ComputerEngineer36","skills":{"Intellectual":6,"Social":-2,"Artistic":2,"Crafting":5},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"ConArtist80","skills":{"Social":10},"disabledWork":["Violent"],"requiredWork":["Social"],"traits":{}},{"name":"ConceptualArtist39","skills":{"Artistic":8,"Crafting":1},"disabledWork":["Social","Caring","Hauling"],"requiredWork":["Artistic"],"traits":{}},{"name":"ConstructionEngineer32","skills":{"Construction":8,"Plants":-3},"disabledWork":["Intellectual","Cooking"],"requiredWork":["ManualSkilled"],"traits":{}},{"name":"ContractMiner86","skills":{"Mining":8},"disabledWork":[],"requiredWork":["Mining"],"traits":{}},{"name":"CoreworldJeweler19","skills":{"Construction":3,"Shooting":-3,"Artistic":5,"Crafting":7},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CorpResearcher93","skills":{"Intellectual":8,"Social":3,"Cooking":-2,"Medicine":6,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CorpResearcher71","skills":{"Intellectual":8,"Shooting":-3,"Melee":-3,"Medicine":4,"Crafting":4},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"CorporateBuilder58","skills":{"Construction":7,"Mining":4},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"CorporateDrone10","skills":{"Social":2,"Intellectual":4},"disabledWork":[],"requiredWork":["Intellectual"],"traits":{}},{"name":"CorporateFixer36","skills":{"Social":4,"Shooting":3,"Melee":3},"disabledWork":[],"requiredWork":["Social","Violent"],"traits":{"Psychopath":0}},{"name":"CorporateManager76","skills":{"Social":6,"Intellectual":2},"disabledWork":[],"requiredWork":["Social"],"traits":{}},{"name":"CosmeticReject64","skills":{"Construction":4,"Cooking":5},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"CosmeticSurgeon36","skills":{"Intellectual":3,"Medicine":8,"Artistic":6},"disabledWork":["Cooking"],"requiredWork":[],"traits":{"Abrasive":0}},{"name":"CostumeCrafter41","skills":{"Intellectual":4,"Crafting":8},"disabledWork":["Cooking"],"requiredWork":[],"traits":{}},{"name":"Counselor26","skills":{"Social":9},"disabledWork":["Cooking"],"requiredWork":["Social"],"traits":{}},{"name":"CraftShaper37","skills":{"Construction":4,"Social":-3,"Artistic":5,"Crafting":8},"disabledWork":["Cooking","Cleaning"],"requiredWork":[],"traits":{}},{"name":"CrimeLord10","skills":{"Intellectual":2,"Shooting":6,"Melee":2,"Social":3},"disabledWork":["Caring","Artistic","Cleaning"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"CriminalKingpin36","skills":{"Shooting":2,"Melee":2,"Social":5},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"CriminalSurgeon99","skills":{"Intellectual":-3,"Melee":6,"Social":-2,"Medicine":5,"Artistic":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CropFarmer17","skills":{"Plants":8},"disabledWork":[],"requiredWork":["PlantWork"],"traits":{}},{"name":"DeepSpaceMiner3","skills":{"Mining":7,"Construction":3,"Melee":2},"disabledWork":[],"requiredWork":["ManualDumb","ManualSkilled"],"traits":{}},{"name":"DeepSpaceSurveyor1","skills":{"Construction":4,"Plants":-3,"Intellectual":6,"Shooting":4,"Social":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Defector78","skills":{"Shooting":5,"Social":-4,"Medicine":3},"disabledWork":["Artistic"],"requiredWork":["Violent","Caring"],"traits":{}},{"name":"Defector95","skills":{"Construction":3,"Shooting":4,"Melee":2,"Social":-2,"Medicine":4,"Crafting":3},"disabledWork":["Animals","Artistic"],"requiredWork":[],"traits":{}},{"name":"DefenseLawyer71","skills":{"Intellectual":5,"Shooting":3,"Social":8},"disabledWork":["ManualDumb","ManualSkilled","Caring"],"requiredWork":[],"traits":{}},{"name":"Demolitionist39","skills":{"Shooting":4,"Crafting":4},"disabledWork":[],"requiredWork":["Violent"],"traits":{"Nerves":1}},{"name":"Deserter65","skills":{"Shooting":4,"Melee":2,"Crafting":2},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"DestroyerGeneral26","skills":{"Shooting":6,"Melee":3,"Social":6,"Artistic":-3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"Digger66","skills":{"Mining":6,"Construction":2},"disabledWork":[],"requiredWork":["Mining"],"traits":{"Undergrounder":0}},{"name":"Digger31","skills":{"Mining":8},"disabledWork":[],"requiredWork":["Mining"],"traits":{}},{"name":"DischargedSoldier53","skills":{"Shooting":6,"Melee":4,"Cooking":2},"disabledWork":[],"requiredWork":[],"traits":{"DrugDesire":2,"TooSmart":0}},{"name":"DisgracedOfficer19","skills":{"Social":4,"Shooting":5},"disabledWork":[],"requiredWork":["Violent"],"traits":{"Wimp":0}},{"name":"DoomsdayPariah18","skills":{"Construction":2,"Intellectual":3,"Shooting":2,"Melee":2,"Crafting":2},"disabledWork":["Caring","Artistic"],"requiredWork":[],"traits":{}},{"name":"DreadedDude58","skills":{"Intellectual":6,"Mining":-3,"Medicine":2,"Artistic":8,"Crafting":4},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"Drifter67","skills":{"Cooking":3,"Construction":3,"Artistic":-4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"DromedaryKnight37","skills":{"Shooting":-3,"Melee":4,"Social":4,"Animals":4},"disabledWork":["Hauling"],"requiredWork":[],"traits":{}},{"name":"DrugLieutenant98","skills":{"Plants":4,"Social":7,"Medicine":7},"disabledWork":["Artistic","Cooking","Cleaning"],"requiredWork":[],"traits":{}},{"name":"EnergyResearcher89","skills":{"Intellectual":8,"Social":-2,"Artistic":-1,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Engineer40","skills":{"Construction":2,"Intellectual":1,"Social":2,"Cooking":-2,"Crafting":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"EngineeredPilot75","skills":{"Shooting":5,"Melee":2,"Social":-2,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"EnvoyOfTheStars19","skills":{"Shooting":1,"Social":8,"Medicine":2,"Artistic":2},"disabledWork":["ManualDumb","ManualSkilled"],"requiredWork":[],"traits":{}},{"name":"EscapedConvict90","skills":{"Mining":4,"Crafting":2},"disabledWork":["Caring"],"requiredWork":["Violent"],"traits":{}},{"name":"Evangelist39","skills":{"Social":4,"Artistic":4,"Medicine":-3},"disabledWork":[],"requiredWork":["Social","Caring"],"traits":{}},{"name":"Excavator55","skills":{"Mining":8},"disabledWork":[],"requiredWork":["Mining"],"traits":{}},{"name":"ExecutiveOfficer5","skills":{"Construction":3,"Intellectual":4,"Melee":2,"Social":7},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"ExiledResearcher44","skills":{"Intellectual":8,"Shooting":2,"Medicine":4,"Artistic":2,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ExoticChef96","skills":{"Cooking":6,"Artistic":2,"Crafting":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ExpertHandyman8","skills":{"Construction":7,"Intellectual":4,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Explorer49","skills":{"Intellectual":3,"Mining":3,"Shooting":2,"Melee":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ExplorerWriter10","skills":{"Construction":3,"Plants":3,"Intellectual":4,"Cooking":2,"Medicine":3,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ExplosivesExpert26","skills":{"Mining":5,"Intellectual":5},"disabledWork":["ManualDumb"],"requiredWork":["Violent"],"traits":{}},{"name":"FactionLeader74","skills":{"Intellectual":3,"Melee":2,"Social":8,"Medicine":2},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"FactoryWorker58","skills":{"Animals":3,"Construction":3,"Crafting":2},"disabledWork":["Intellectual","Artistic","Cooking"],"requiredWork":["ManualDumb","ManualSkilled","Animals"],"traits":{}},{"name":"FallenOfficial12","skills":{"Melee":2,"Social":5,"Medicine":2},"disabledWork":["ManualSkilled"],"requiredWork":[],"traits":{}},{"name":"FearfulChef49","skills":{"Plants":2,"Intellectual":2,"Medicine":2},"disabledWork":["Cooking","Firefighting"],"requiredWork":[],"traits":{}},{"name":"FelineScientist76","skills":{"Intellectual":4,"Social":2,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"FerventResearcher72","skills":{"Intellectual":6,"Shooting":2,"Medicine":8},"disabledWork":["ManualDumb","ManualSkilled"],"requiredWork":[],"traits":{"Transhumanist":0}},{"name":"FighterController67","skills":{"Shooting":5,"Melee":5,"Social":2,"Cooking":1,"Medicine":3},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"Firebomber51","skills":{"Shooting":3,"Cooking":3,"Medicine":2},"disabledWork":[],"requiredWork":["Violent"],"traits":{"Pyromaniac":0}},{"name":"Flaneur30","skills":{"Intellectual":3,"Social":6,"Cooking":3,"Artistic":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ForestProwler15","skills":{"Melee":3,"Social":4,"Crafting":2},"disabledWork":["Mining"],"requiredWork":[],"traits":{}},{"name":"Forester96","skills":{"Plants":6},"disabledWork":[],"requiredWork":["PlantWork"],"traits":{}},{"name":"Framer37","skills":{"Construction":6,"Plants":2},"disabledWork":[],"requiredWork":["ManualSkilled"],"traits":{}},{"name":"FrontierMarshal27","skills":{"Shooting":5,"Social":4,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Fugitive4","skills":{"Plants":3,"Social":-2,"Cooking":4,"Medicine":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"FurnitureBuilder83","skills":{"Construction":4,"Plants":3},"disabledWork":[],"requiredWork":["PlantWork","Constructing"],"traits":{}},{"name":"GameDeveloper95","skills":{"Construction":-2,"Mining":-2},"disabledWork":[],"requiredWork":[],"traits":{"Industriousness":-2}},{"name":"GameTester77","skills":{"Intellectual":5,"Shooting":4,"Melee":4,"Social":-2,"Medicine":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"GangBoss49","skills":{"Construction":4,"Shooting":8,"Melee":6,"Social":-3,"Medicine":3},"disabledWork":["Animals"],"requiredWork":[],"traits":{}},{"name":"GangSoldier39","skills":{"Construction":2,"Shooting":6,"Melee":3,"Cooking":2,"Medicine":2},"disabledWork":["Artistic","Hauling"],"requiredWork":[],"traits":{}},{"name":"Gardener99","skills":{"Plants":8},"disabledWork":["Intellectual","Crafting"],"requiredWork":["ManualDumb","PlantWork"],"traits":{}},{"name":"Gatherer70","skills":{"Plants":8,"Animals":-2},"disabledWork":[],"requiredWork":["PlantWork"],"traits":{}},{"name":"GeneticEngineer89","skills":{"Plants":1,"Intellectual":6,"Medicine":2},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"GeneticScientist66","skills":{"Intellectual":4,"Shooting":2,"Medicine":3},"disabledWork":["Social","Artistic","Crafting","Cooking"],"requiredWork":[],"traits":{"Abrasive":0}},{"name":"Geologist66","skills":{"Mining":8,"Crafting":3},"disabledWork":[],"requiredWork":["Intellectual"],"traits":{}},{"name":"Gigolo30","skills":{"Social":8,"Melee":3},"disabledWork":["ManualDumb","ManualSkilled"],"requiredWork":["Social"],"traits":{"Beauty":2}},{"name":"Gigolo68","skills":{"Shooting":3,"Melee":6,"Cooking":7},"disabledWork":[],"requiredWork":[],"traits":{"Beauty":1}},{"name":"GlitterworldEmpath26","skills":{"Social":8,"Medicine":2},"disabledWork":["Violent"],"requiredWork":["Social"],"traits":{}},{"name":"GlitterworldOfficer60","skills":{"Melee":6,"Artistic":4},"disabledWork":["ManualDumb"],"requiredWork":["Violent"],"traits":{}},{"name":"GlitterworldSurgeon15","skills":{"Artistic":5,"Medicine":3,"Social":1},"disabledWork":[],"requiredWork":["Caring","Artistic"],"traits":{}},{"name":"Gnomebiologist96","skills":{"Intellectual":4,"Social":4,"Artistic":7,"Crafting":4},"disabledWork":["Cooking","Firefighting","Cleaning"],"requiredWork":[],"traits":{}},{"name":"GovernmentAgent61","skills":{"Shooting":4,"Melee":4,"Medicine":3},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"GraphicDesigner33","skills":{"Artistic":7,"Crafting":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Guardian55","skills":{"Shooting":4,"Melee":4,"Medicine":4},"disabledWork":[],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"GunDealer14","skills":{"Shooting":4,"Social":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Gunfighter51","skills":{"Shooting":8,"Melee":2,"Medicine":6},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"HeadButler50","skills":{"Social":4,"Cooking":3,"Crafting":2},"disabledWork":[],"requiredWork":["ManualDumb","ManualSkilled","Social"],"traits":{}},{"name":"Healer46","skills":{"Medicine":5,"Plants":3},"disabledWork":[],"requiredWork":["Caring"],"traits":{}},{"name":"Healer35","skills":{"Plants":5,"Medicine":7},"disabledWork":["ManualDumb","Mining"],"requiredWork":[],"traits":{}},{"name":"HearthTender66","skills":{"Cooking":4,"Medicine":3,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{"Undergrounder":0}},{"name":"HedgeFundManager54","skills":{"Construction":-2,"Plants":-2,"Intellectual":3,"Social":4,"Artistic":7},"disabledWork":[],"requiredWork":[],"traits":{"Greedy":0}},{"name":"Herbalist54","skills":{"Plants":4,"Medicine":4,"Social":-2},"disabledWork":[],"requiredWork":["Caring","PlantWork"],"traits":{}},{"name":"Herder33","skills":{"Shooting":3,"Animals":5},"disabledWork":[],"requiredWork":["Violent","Animals"],"traits":{}},{"name":"Hermit82","skills":{"Plants":4,"Crafting":3,"Construction":1},"disabledWork":["Social"],"requiredWork":["PlantWork","ManualDumb","Crafting"],"traits":{"Ascetic":0}},{"name":"Herpetologist3","skills":{"Plants":2,"Intellectual":2,"Medicine":4,"Animals":6},"disabledWork":["Mining"],"requiredWork":[],"traits":{}},{"name":"HiredAssassin37","skills":{"Shooting":4,"Melee":5,"Social":3},"disabledWork":[],"requiredWork":[],"traits":{"Nimble":0}},{"name":"HiredGun70","skills":{"Shooting":6,"Melee":2,"Cooking":2,"Medicine":3},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"HiredMuscle5","skills":{"Shooting":5,"Melee":3,"Social":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"HouseServant63","skills":{"Cooking":4,"Plants":-3,"Mining":-3},"disabledWork":["Intellectual"],"requiredWork":["ManualDumb","Cleaning"],"traits":{}},{"name":"HouseServant86","skills":{"Cooking":3,"Construction":3,"Mining":4},"disabledWork":[],"requiredWork":["ManualDumb"],"traits":{}},{"name":"Housemate8","skills":{"Cooking":3,"Medicine":3,"Crafting":2},"disabledWork":[],"requiredWork":["ManualDumb"],"traits":{}},{"name":"HumanComputer83","skills":{"Shooting":3,"Intellectual":7},"disabledWork":["Artistic"],"requiredWork":["Intellectual"],"traits":{}},{"name":"HumanTrafficker35","skills":{"Melee":4,"Social":3,"Crafting":2},"disabledWork":["Caring","Artistic","PlantWork"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"Hunter89","skills":{"Animals":3},"disabledWork":[],"requiredWork":["Violent","Animals"],"traits":{}},{"name":"Hunter74","skills":{"Shooting":4,"Melee":3,"Animals":2},"disabledWork":[],"requiredWork":["Violent","Animals"],"traits":{}},{"name":"Hunter73","skills":{"Plants":2,"Shooting":6,"Medicine":4},"disabledWork":["Mining"],"requiredWork":[],"traits":{}},{"name":"HunterOfTheKing53","skills":{"Intellectual":-2,"Shooting":6,"Melee":4,"Medicine":3,"Crafting":-3},"disabledWork":["Animals","Artistic","PlantWork"],"requiredWork":[],"traits":{"BodyPurist":0}},{"name":"HypnocultLeader61","skills":{"Intellectual":5,"Social":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"IllegalShipwright76","skills":{"Construction":7},"disabledWork":[],"requiredWork":["ManualSkilled"],"traits":{}},{"name":"ImperialGeneral27","skills":{"Construction":-2,"Intellectual":4,"Mining":-3,"Shooting":4,"Melee":4,"Social":5,"Medicine":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"ImperialInquisitor53","skills":{"Social":4,"Intellectual":4},"disabledWork":[],"requiredWork":["Social","Intellectual"],"traits":{"Abrasive":0}},{"name":"ImperialPriest24","skills":{"Social":5,"Intellectual":5},"disabledWork":[],"requiredWork":["Social","Intellectual"],"traits":{"DrugDesire":-1}},{"name":"InfantryEngineer46","skills":{"Construction":6,"Mining":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"InfantryMedic6","skills":{"Medicine":7},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"InfantryOfficer49","skills":{"Social":4,"Shooting":5},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"InformationBroker77","skills":{"Intellectual":4,"Shooting":-1,"Melee":-2,"Social":5},"disabledWork":[],"requiredWork":[],"traits":{"FastLearner":0}},{"name":"IntelligenceAgent10","skills":{"Shooting":7,"Melee":4,"Social":8},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"IntelligenceAgent21","skills":{"Intellectual":6,"Social":3},"disabledWork":[],"requiredWork":["Social","Intellectual"],"traits":{}},{"name":"IntimateAssassin35","skills":{"Melee":8,"Social":4},"disabledWork":["Caring","Animals"],"requiredWork":[],"traits":{"Beauty":1}},{"name":"Inventor6","skills":{"Crafting":5,"Intellectual":2},"disabledWork":[],"requiredWork":["Intellectual","Crafting"],"traits":{}},{"name":"InvoluntaryHermit38","skills":{"Construction":1,"Plants":3,"Melee":4,"Crafting":3},"disabledWork":["Caring","Artistic","Cleaning"],"requiredWork":[],"traits":{}},{"name":"Jailbird40","skills":{"Melee":5,"Cooking":3},"disabledWork":["Social","Caring"],"requiredWork":["Violent"],"traits":{}},{"name":"JoywireArtist8","skills":{"Artistic":3,"Intellectual":2,"Medicine":2},"disabledWork":["ManualDumb"],"requiredWork":["Intellectual"],"traits":{}},{"name":"KingOfPirates25","skills":{"Shooting":5,"Melee":8,"Social":4,"Animals":3},"disabledWork":["Artistic","Cooking","Firefighting"],"requiredWork":[],"traits":{}},{"name":"Landworker98","skills":{"Plants":6,"Mining":6},"disabledWork":[],"requiredWork":["PlantWork","Mining"],"traits":{}},{"name":"LanguageAnalyst27","skills":{"Plants":4,"Intellectual":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"LazyProgrammer3","skills":{"Intellectual":8},"disabledWork":["PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"LineInfanteer20","skills":{"Shooting":4,"Melee":3},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"LivestockFarmer8","skills":{"Animals":7},"disabledWork":[],"requiredWork":["Animals"],"traits":{}},{"name":"Logger95","skills":{"Plants":8},"disabledWork":[],"requiredWork":["PlantWork"],"traits":{}},{"name":"Logger16","skills":{"Plants":6,"Melee":3},"disabledWork":[],"requiredWork":["PlantWork"],"traits":{}},{"name":"LoneTraveler95","skills":{"Plants":3,"Shooting":4,"Medicine":3,"Artistic":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Loner61","skills":{"Shooting":3,"Melee":2,"Plants":5,"Construction":1},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"LoreKeeper51","skills":{"Intellectual":2,"Social":3,"Artistic":2},"disabledWork":[],"requiredWork":["Intellectual"],"traits":{}},{"name":"LostMarine81","skills":{"Shooting":7,"Melee":5,"Medicine":2,"Crafting":6},"disabledWork":["ManualDumb","Mining"],"requiredWork":[],"traits":{}},{"name":"LostSoldier13","skills":{"Construction":5,"Intellectual":-3,"Social":-2,"Crafting":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"LowWageWorker7","skills":{"Cooking":4,"Plants":3,"Crafting":3},"disabledWork":[],"requiredWork":["ManualDumb","Cleaning"],"traits":{}},{"name":"LoyalJanissary59","skills":{"Shooting":7,"Melee":4},"disabledWork":[],"requiredWork":["Violent"],"traits":{"Industriousness":2}},{"name":"MachineCollector55","skills":{"Social":-3,"Crafting":6,"Intellectual":6},"disabledWork":[],"requiredWork":["Crafting"],"traits":{}},{"name":"MachineFixer31","skills":{"Construction":5,"Medicine":5,"Crafting":3},"disabledWork":["Cooking","Firefighting"],"requiredWork":[],"traits":{}},{"name":"MadAccountant61","skills":{"Intellectual":6,"Shooting":4,"Social":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MadScientist22","skills":{"Intellectual":5,"Shooting":5,"Medicine":4,"Crafting":2},"disabledWork":["Hauling","Mining"],"requiredWork":[],"traits":{}},{"name":"MadScientist2","skills":{"Construction":3,"Intellectual":7,"Social":-2},"disabledWork":["Caring","Animals","Artistic"],"requiredWork":[],"traits":{}},{"name":"MadScientist31","skills":{"Intellectual":8,"Mining":3,"Medicine":3,"Artistic":-3,"Animals":-2},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"MafiaBoss17","skills":{"Shooting":4,"Melee":3,"Social":4},"disabledWork":["ManualDumb","Caring","Cooking"],"requiredWork":["Social"],"traits":{}},{"name":"Mailman2","skills":{"Melee":4},"disabledWork":[],"requiredWork":[],"traits":{"Nimble":0}},{"name":"Malingerer28","skills":{"Intellectual":2,"Social":5},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"MarbleDoctor99","skills":{"Intellectual":4,"Medicine":8},"disabledWork":["Crafting"],"requiredWork":[],"traits":{}},{"name":"MasterChef48","skills":{"Cooking":8,"Artistic":4},"disabledWork":[],"requiredWork":[],"traits":{"Gourmand":0}},{"name":"MasterTrader65","skills":{"Social":8,"Cooking":2,"Artistic":4},"disabledWork":["Mining"],"requiredWork":[],"traits":{}},{"name":"Mathematician6","skills":{"Shooting":-3,"Intellectual":8},"disabledWork":["ManualDumb"],"requiredWork":["Intellectual"],"traits":{}},{"name":"MechWarVeteran77","skills":{"Shooting":7,"Melee":4},"disabledWork":["Caring","Artistic"],"requiredWork":[],"traits":{"Tough":0}},{"name":"MechanicsEngineer64","skills":{"Construction":5,"Plants":-2,"Intellectual":2,"Crafting":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MedicSoldier54","skills":{"Intellectual":5,"Medicine":7},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"MedicalScientist16","skills":{"Intellectual":8,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MedievalDoctor40","skills":{"Melee":6,"Medicine":1},"disabledWork":[],"requiredWork":["Caring"],"traits":{}},{"name":"MedievalFarmOaf58","skills":{"Plants":8,"Mining":3},"disabledWork":["Intellectual"],"requiredWork":["ManualDumb","PlantWork","Mining"],"traits":{}},{"name":"MedievalKnight26","skills":{"Shooting":2,"Melee":6},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"MedievalLord57","skills":{"Social":7,"Melee":5,"Shooting":5},"disabledWork":["ManualDumb","ManualSkilled"],"requiredWork":["Social"],"traits":{}},{"name":"MedievalMinstrel95","skills":{"Social":4,"Artistic":3,"Melee":2},"disabledWork":["ManualSkilled","Hauling"],"requiredWork":[],"traits":{}},{"name":"MedievalSailor97","skills":{"Melee":4,"Social":4,"Animals":4},"disabledWork":["ManualSkilled"],"requiredWork":["ManualDumb"],"traits":{}},{"name":"MenagerieKeeper1","skills":{"Animals":8},"disabledWork":[],"requiredWork":["Animals"],"traits":{"Beauty":2}},{"name":"MentalPatient69","skills":{"Plants":3,"Intellectual":2,"Shooting":-2,"Artistic":3,"Crafting":3},"disabledWork":["Cooking","Firefighting","Mining"],"requiredWork":[],"traits":{}},{"name":"Mercenary55","skills":{"Construction":3,"Mining":2,"Shooting":4,"Melee":3},"disabledWork":[],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"Mercenary4","skills":{"Construction":3,"Mining":2,"Shooting":5,"Artistic":-2},"disabledWork":[],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"Mercenary20","skills":{"Construction":2,"Shooting":6,"Melee":6,"Social":2,"Crafting":2},"disabledWork":["Animals"],"requiredWork":[],"traits":{}},{"name":"MercenaryCaptain98","skills":{"Intellectual":2,"Shooting":5,"Social":5},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"MercenaryChef44","skills":{"Construction":-3,"Mining":-3,"Shooting":4,"Cooking":5,"Crafting":5},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{"ShootingAccuracy":1}},{"name":"MercenaryLeader28","skills":{"Shooting":4,"Melee":4,"Social":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MercenaryLord13","skills":{"Intellectual":4,"Shooting":2,"Social":7,"Medicine":3,"Artistic":2},"disabledWork":["Animals","Mining"],"requiredWork":[],"traits":{}},{"name":"MercenaryPilot63","skills":{"Construction":3,"Shooting":6,"Melee":4,"Social":-1},"disabledWork":["Caring","Artistic"],"requiredWork":[],"traits":{}},{"name":"MessageCarrier77","skills":{"Melee":3,"Animals":4},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"Microbiologist12","skills":{"Intellectual":5,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MidworldSailor91","skills":{"Construction":3,"Shooting":4,"Melee":3,"Social":4},"disabledWork":["Cooking"],"requiredWork":[],"traits":{"Gourmand":0}},{"name":"MilitaryChaplain10","skills":{"Medicine":6,"Intellectual":2},"disabledWork":["Violent"],"requiredWork":["Caring","Intellectual"],"traits":{}},{"name":"MilitaryCommissar71","skills":{"Shooting":3,"Social":6},"disabledWork":[],"requiredWork":["Social","Violent"],"traits":{}},{"name":"MilitaryCook18","skills":{"Cooking":7,"Shooting":2},"disabledWork":[],"requiredWork":["Cooking"],"traits":{}},{"name":"MilitaryEngineer45","skills":{"Construction":3,"Shooting":3,"Melee":1,"Crafting":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MilitaryGunsmith27","skills":{"Construction":2,"Shooting":5,"Melee":4,"Cooking":1,"Medicine":2,"Crafting":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MilitaryInventor35","skills":{"Construction":3,"Intellectual":3,"Shooting":1,"Social":2,"Crafting":3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"MilitaryOfficer17","skills":{"Construction":2,"Intellectual":2,"Shooting":8,"Social":-3},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"MilitiaSoldier79","skills":{"Construction":3,"Melee":3,"Social":4,"Medicine":-3,"Artistic":4,"Crafting":3},"disabledWork":["Cooking","Cleaning"],"requiredWork":[],"traits":{}},{"name":"MindwipedAssassin50","skills":{"Shooting":8,"Melee":4,"Cooking":-2},"disabledWork":["Caring","Artistic"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"Minister88","skills":{"Intellectual":3,"Shooting":2,"Social":4,"Crafting":3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"Missionary99","skills":{"Social":6,"Cooking":4,"Medicine":2},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"MobHenchman53","skills":{"Shooting":3,"Melee":7,"Social":-2,"Medicine":2,"Crafting":2},"disabledWork":["Artistic","Cleaning"],"requiredWork":[],"traits":{}},{"name":"ModDesigner85","skills":{"Intellectual":5,"Crafting":5,"Medicine":2},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"Model99","skills":{"Social":5,"Artistic":6},"disabledWork":["ManualDumb","Intellectual","ManualSkilled","Caring"],"requiredWork":["Social","Artistic"],"traits":{"Beauty":2}},{"name":"MuffaloResearcher67","skills":{"Intellectual":5,"Melee":-3,"Medicine":4,"Animals":4},"disabledWork":["Social","Artistic"],"requiredWork":[],"traits":{}},{"name":"MuffaloShaman95","skills":{"Melee":5,"Social":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MutinousCaptain52","skills":{"Shooting":4,"Social":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"NavyScientist52","skills":{"Intellectual":8},"disabledWork":[],"requiredWork":["Intellectual"],"traits":{}},{"name":"NavyTechOfficer0","skills":{"Intellectual":6,"Shooting":4,"Cooking":-2,"Crafting":5,"Animals":-2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"NetworkEngineer34","skills":{"Construction":4,"Intellectual":4,"Shooting":4,"Crafting":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"NeuroScientist19","skills":{"Intellectual":8,"Social":2,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"NinjaAssassin31","skills":{"Shooting":4,"Melee":3,"Social":2,"Crafting":2},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"Novelist7","skills":{"Construction":-5,"Mining":-5,"Artistic":8},"disabledWork":["ManualDumb","Social"],"requiredWork":["Intellectual"],"traits":{}},{"name":"Nurse61","skills":{"Social":4,"Medicine":5},"disabledWork":["Violent"],"requiredWork":["Caring"],"traits":{}},{"name":"OrbitalReservist22","skills":{"Shooting":7,"Melee":5,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"OrnamentMaker56","skills":{"Crafting":5,"Artistic":5},"disabledWork":[],"requiredWork":["Artistic","ManualSkilled"],"traits":{}},{"name":"Osteologist74","skills":{"Intellectual":7,"Mining":-3,"Melee":3,"Social":3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"OverwatchSniper42","skills":{"Shooting":5,"Melee":3,"Medicine":3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"Paramedic45","skills":{"Shooting":-5,"Medicine":6},"disabledWork":[],"requiredWork":["Caring","Violent"],"traits":{}},{"name":"ParamilitaryAgent11","skills":{"Shooting":5,"Melee":2,"Social":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ParticlePhysicist44","skills":{"Plants":2,"Intellectual":8,"Medicine":3,"Artistic":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Philosopher97","skills":{"Intellectual":4,"Social":2,"Medicine":3,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"PiousSoldier67","skills":{"Shooting":6,"Melee":4},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"Pirate56","skills":{"Shooting":4,"Melee":2,"Social":8},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"PirateCaptain69","skills":{"Shooting":5,"Melee":5,"Social":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"PirateDoctor0","skills":{"Intellectual":3,"Mining":-3,"Social":-2,"Medicine":4,"Artistic":-3},"disabledWork":[],"requiredWork":[],"traits":{"NaturalMood":1}},{"name":"PirateKing69","skills":{"Shooting":7,"Melee":5,"Artistic":-2},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{"Bloodlust":0}},{"name":"PirateSympathizer24","skills":{"Shooting":4,"Melee":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"PirateTrooper73","skills":{"Shooting":6,"Melee":5},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{}},{"name":"PitBrawler76","skills":{"Melee":8},"disabledWork":["Intellectual","Caring"],"requiredWork":["Violent"],"traits":{"Brawler":0}},{"name":"PlagueDoctor31","skills":{"Intellectual":4,"Social":-2,"Medicine":8},"disabledWork":["Violent","Animals","Artistic","Cooking"],"requiredWork":[],"traits":{}},{"name":"PlanetaryDiplomat7","skills":{"Construction":-2,"Intellectual":3,"Social":8,"Artistic":2},"disabledWork":["ManualDumb","Violent","Hauling","PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"PlanetaryMiner64","skills":{"Mining":8},"disabledWork":[],"requiredWork":["Mining"],"traits":{"Undergrounder":0}},{"name":"PlankCutter72","skills":{"Plants":6,"Melee":3},"disabledWork":[],"requiredWork":["PlantWork"],"traits":{}},{"name":"PoisonGardener29","skills":{"Plants":4,"Intellectual":1,"Cooking":2,"Medicine":2},"disabledWork":["Social","Hauling","Mining"],"requiredWork":[],"traits":{}},{"name":"Policeman45","skills":{"Social":3,"Shooting":4,"Melee":3},"disabledWork":[],"requiredWork":["Social","Violent"],"traits":{}},{"name":"PoliticalActivist20","skills":{"Intellectual":2,"Shooting":5,"Melee":3,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"PoliticalAssassin46","skills":{"Shooting":8,"Melee":8},"disabledWork":["ManualDumb","Caring","Social","Artistic"],"requiredWork":[],"traits":{}},{"name":"Politician57","skills":{"Shooting":2,"Melee":2,"Social":5},"disabledWork":["PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"PopIdol59","skills":{"Shooting":-4,"Melee":-4,"Social":8,"Artistic":8},"disabledWork":["ManualDumb","Cleaning","Hauling","PlantWork","Mining"],"requiredWork":[],"traits":{"Beauty":2}},{"name":"PopIdolPirate39","skills":{"Plants":-2,"Shooting":5,"Melee":7,"Social":4,"Cooking":-2},"disabledWork":["ManualDumb","Caring","Firefighting"],"requiredWork":[],"traits":{"Beauty":2,"Greedy":0}},{"name":"PrisonerOfWar2","skills":{"Shooting":4,"Melee":4,"Social":4},"disabledWork":["Animals"],"requiredWork":[],"traits":{}},{"name":"PrivateDetective66","skills":{"Intellectual":4,"Social":7},"disabledWork":["PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"Propagandist86","skills":{"Artistic":6,"Social":2},"disabledWork":[],"requiredWork":["Artistic"],"traits":{}},{"name":"ProstheticSurgeon0","skills":{"Plants":-2,"Intellectual":4,"Medicine":6,"Crafting":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ProstituteIdol28","skills":{"Social":7,"Cooking":3,"Artistic":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"PsychiatricPatient94","skills":{"Cooking":-2,"Crafting":-2},"disabledWork":["Social","Caring","Violent"],"requiredWork":[],"traits":{}},{"name":"QuarryWorker29","skills":{"Mining":8},"disabledWork":[],"requiredWork":["Mining"],"traits":{}},{"name":"RaiderKing38","skills":{"Mining":3,"Shooting":5,"Melee":5},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"Rancher43","skills":{"Animals":8,"Cooking":-4,"Mining":-4},"disabledWork":["ManualDumb"],"requiredWork":["Animals"],"traits":{}},{"name":"Ranger96","skills":{"Plants":6},"disabledWork":[],"requiredWork":["PlantWork"],"traits":{}},{"name":"Ranger6","skills":{"Construction":2,"Plants":2,"Shooting":4,"Cooking":2,"Medicine":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"RebelFighter39","skills":{"Shooting":4,"Melee":2},"disabledWork":["Caring","Artistic"],"requiredWork":[],"traits":{}},{"name":"ReconSniper89","skills":{"Shooting":9},"disabledWork":[],"requiredWork":["Violent"],"traits":{"SpeedOffset":2}},{"name":"Recruiter14","skills":{"Melee":5,"Social":5},"disabledWork":["Caring"],"requiredWork":["Social"],"traits":{}},{"name":"Regent9","skills":{"Social":5,"Intellectual":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ReligiousHierarch16","skills":{"Construction":-3,"Mining":-3,"Shooting":-2,"Melee":-2,"Social":8,"Cooking":4,"Medicine":5},"disabledWork":["ManualDumb","Artistic"],"requiredWork":[],"traits":{}},{"name":"RenegadeEngineer43","skills":{"Intellectual":3,"Shooting":3,"Melee":3,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"RenownedProfessor51","skills":{"Intellectual":5,"Social":6},"disabledWork":[],"requiredWork":[],"traits":{"Kind":0}},{"name":"Reporter71","skills":{"Intellectual":2,"Social":4,"Artistic":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ReptileResearcher37","skills":{"Intellectual":7,"Cooking":2,"Medicine":3,"Artistic":3,"Crafting":2},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"Restorer70","skills":{"Construction":5,"Crafting":9,"Social":-2},"disabledWork":[],"requiredWork":[],"traits":{"NaturalMood":1}},{"name":"Roboticist1","skills":{"Construction":3,"Intellectual":7,"Crafting":3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"Roboticist41","skills":{"Construction":3,"Intellectual":4,"Crafting":6},"disabledWork":["Cooking","PlantWork"],"requiredWork":[],"traits":{}},{"name":"RocketEngineer53","skills":{"Construction":4,"Intellectual":5,"Mining":3,"Social":-1,"Cooking":-4,"Medicine":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"RocketPioneer19","skills":{"Construction":8,"Plants":-3,"Intellectual":5},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"RoyalCook18","skills":{"Cooking":7,"Plants":2},"disabledWork":[],"requiredWork":["Cooking","PlantWork"],"traits":{"Gourmand":0}},{"name":"RoyalGuard51","skills":{"Shooting":4,"Melee":3,"Social":3},"disabledWork":[],"requiredWork":["Violent","Social"],"traits":{}},{"name":"RoyalMasseuse43","skills":{"Social":6},"disabledWork":[],"requiredWork":[],"traits":{"Beauty":2}},{"name":"RugbyPlayer71","skills":{"Construction":4,"Mining":3,"Melee":5},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{"Brawler":0}},{"name":"RunawayDancer35","skills":{"Shooting":2,"Social":6,"Artistic":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SanitationCaptain29","skills":{"Construction":5,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Scout59","skills":{"Shooting":2,"Intellectual":2,"Social":2},"disabledWork":[],"requiredWork":["Violent"],"traits":{"SpeedOffset":2}},{"name":"Sculptor63","skills":{"Plants":-4,"Mining":4,"Artistic":9},"disabledWork":["ManualDumb","Crafting","Cooking"],"requiredWork":["Artistic"],"traits":{}},{"name":"SelflessHunter61","skills":{"Shooting":5,"Social":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SerialMurderer47","skills":{"Shooting":4,"Melee":4,"Artistic":4},"disabledWork":["Animals"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"ShadowMarine63","skills":{"Intellectual":4,"Shooting":4,"Melee":2,"Medicine":3,"Animals":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ShamanOfShadows47","skills":{"Construction":-2,"Plants":2,"Intellectual":2,"Social":6,"Medicine":4},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"Sheriff52","skills":{"Shooting":4,"Melee":4,"Social":4},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"Shipcracker37","skills":{"Shooting":3,"Melee":5,"Mining":4},"disabledWork":[],"requiredWork":["Violent"],"traits":{"DrugDesire":1}},{"name":"ShockTrooper15","skills":{"Shooting":7,"Melee":5,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SicklyLawyer49","skills":{"Social":8},"disabledWork":["ManualDumb","Mining"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"Sightseer70","skills":{"Plants":2,"Shooting":2,"Melee":2,"Medicine":2,"Artistic":2,"Animals":2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"Slaughterer58","skills":{"Animals":5},"disabledWork":[],"requiredWork":["Violent","Animals"],"traits":{}},{"name":"SlaveChemist84","skills":{"Construction":-1,"Intellectual":4,"Mining":-2,"Melee":-1,"Medicine":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Smuggler23","skills":{"Intellectual":-2,"Shooting":2,"Melee":2,"Social":5,"Medicine":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"SoftwareDeveloper84","skills":{"Plants":-3,"Intellectual":7,"Social":-3,"Artistic":3,"Crafting":5},"disabledWork":["ManualDumb","Cleaning","Hauling"],"requiredWork":[],"traits":{}},{"name":"SoleSurvivor85","skills":{"Shooting":4,"Melee":5,"Social":-3},"disabledWork":["Animals","Artistic"],"requiredWork":[],"traits":{}},{"name":"SpaceBartender0","skills":{"Plants":4,"Social":4,"Cooking":5,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{"Kind":0}},{"name":"SpaceExplorer53","skills":{"Construction":3,"Plants":3,"Mining":3,"Shooting":4,"Social":4},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"SpaceHumanitarian9","skills":{"Plants":2,"Shooting":-2,"Cooking":4,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SpaceHunter79","skills":{"Shooting":5,"Melee":1,"Cooking":1,"Medicine":2,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SpaceMarine16","skills":{"Melee":5,"Shooting":7},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"SpaceMarine51","skills":{"Shooting":6,"Melee":5,"Medicine":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"SpaceMarine19","skills":{"Shooting":6,"Melee":4,"Artistic":-3,"Crafting":-2},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{}},{"name":"SpaceMarine9","skills":{"Shooting":6,"Melee":5,"Social":-2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"SpaceMarine94","skills":{"Shooting":7,"Melee":5},"disabledWork":["Cooking"],"requiredWork":[],"traits":{}},{"name":"SpaceMarine5","skills":{"Shooting":8,"Melee":6},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{}},{"name":"SpaceMarineMedic10","skills":{"Shooting":6,"Melee":2,"Medicine":6},"disabledWork":[],"requiredWork":[],"traits":{"SpeedOffset":2,"ShootingAccuracy":-1}},{"name":"SpaceMerchant97","skills":{"Construction":4,"Shooting":2,"Social":5,"Crafting":2},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"SpaceNavyDoctor72","skills":{"Construction":-2,"Plants":-2,"Mining":-2,"Shooting":3,"Melee":1,"Social":2,"Medicine":5,"Artistic":-1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SpaceNavyTech37","skills":{"Intellectual":8,"Shooting":4,"Melee":2,"Crafting":3},"disabledWork":["Mining"],"requiredWork":[],"traits":{}},{"name":"SpacePirate55","skills":{"Melee":4,"Shooting":4},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"SpaceRaider71","skills":{"Shooting":8,"Melee":3,"Social":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SpaceResearcher25","skills":{"Plants":2,"Intellectual":6,"Mining":-1,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{"Kind":0}},{"name":"SpaceStationCook63","skills":{"Melee":4,"Cooking":6},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{}},{"name":"SpaceTactician28","skills":{"Shooting":4,"Intellectual":4},"disabledWork":["Social","Artistic"],"requiredWork":["Intellectual"],"traits":{}},{"name":"SpaceTechnician29","skills":{"Construction":5,"Intellectual":1,"Mining":2,"Social":1},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"SpaceTrafficker68","skills":{"Shooting":5,"Melee":5,"Social":5,"Medicine":-2},"disabledWork":["Animals","Artistic","Crafting"],"requiredWork":[],"traits":{}},{"name":"SpaceshipChef41","skills":{"Cooking":7,"Medicine":5},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"SpaceshipSalesman34","skills":{"Construction":2,"Plants":1,"Intellectual":2,"Shooting":2,"Social":8,"Cooking":-1,"Medicine":-1,"Artistic":-2,"Crafting":-1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SpecialForces13","skills":{"Shooting":7,"Melee":6,"Social":2},"disabledWork":["Intellectual","Animals","Artistic"],"requiredWork":[],"traits":{}},{"name":"Spiceminer81","skills":{"Construction":2,"Plants":-2,"Mining":8,"Social":2,"Medicine":-2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"Spy58","skills":{"Shooting":2,"Melee":2,"Social":7},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Spymaster41","skills":{"Social":4,"Shooting":3,"Melee":3},"disabledWork":[],"requiredWork":["Social","Violent"],"traits":{"Psychopath":0}},{"name":"StalwartFarmer21","skills":{"Construction":3,"Plants":3,"Intellectual":-2,"Mining":2,"Shooting":5,"Melee":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"StalwartFarmer90","skills":{"Construction":4,"Shooting":4,"Melee":2,"Crafting":2},"disabledWork":["Animals","Artistic","Cooking"],"requiredWork":[],"traits":{}},{"name":"StarKnight5","skills":{"Shooting":2,"Melee":8,"Social":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"StarfighterPilot79","skills":{"Intellectual":4,"Mining":-3,"Shooting":7,"Melee":3,"Artistic":-3,"Animals":-3},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"StarshipDoctor37","skills":{"Intellectual":5,"Melee":-2,"Social":-3,"Medicine":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"StarshipJanitor33","skills":{"Construction":2,"Crafting":3},"disabledWork":[],"requiredWork":["ManualDumb","ManualSkilled"],"traits":{}},{"name":"StateEngineer60","skills":{"Construction":2,"Intellectual":4,"Crafting":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"StationSecurity38","skills":{"Shooting":4,"Melee":3,"Social":3,"Medicine":3,"Artistic":-3},"disabledWork":["Firefighting"],"requiredWork":[],"traits":{}},{"name":"StellarPirate10","skills":{"Shooting":4,"Social":4,"Crafting":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"StewKeeper95","skills":{"Cooking":6,"Plants":2},"disabledWork":[],"requiredWork":["Cooking"],"traits":{}},{"name":"StilettoAssassin34","skills":{"Construction":-3,"Mining":-3,"Shooting":6,"Melee":8,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Storyteller63","skills":{"Intellectual":2,"Social":4,"Artistic":3,"Crafting":2},"disabledWork":["Cooking","Mining"],"requiredWork":[],"traits":{}},{"name":"SuperSoldier95","skills":{"Shooting":8,"Melee":7,"Crafting":-3},"disabledWork":["Social","Animals","Artistic"],"requiredWork":[],"traits":{}},{"name":"SystemLord77","skills":{"Shooting":6,"Melee":2,"Social":6},"disabledWork":["Caring"],"requiredWork":[],"traits":{"Greedy":0}},{"name":"SystemsEngineer1","skills":{"Construction":5,"Intellectual":7,"Crafting":4},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"Tamer79","skills":{"Animals":6,"Social":2},"disabledWork":[],"requiredWork":["Animals"],"traits":{}},{"name":"Taster16","skills":{"Cooking":7,"Construction":-4,"Crafting":-4},"disabledWork":["ManualDumb"],"requiredWork":["Cooking"],"traits":{}},{"name":"Taxonomist0","skills":{"Animals":5,"Plants":5},"disabledWork":["Violent"],"requiredWork":["Intellectual"],"traits":{}},{"name":"Teacher20","skills":{"Intellectual":3,"Social":4},"disabledWork":[],"requiredWork":["Intellectual","Social"],"traits":{}},{"name":"Technician9","skills":{"Construction":2,"Intellectual":6,"Medicine":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"TechnologyDoctor35","skills":{"Construction":3,"Intellectual":8,"Crafting":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"TestSubject90","skills":{"Shooting":6,"Melee":8,"Social":-4},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{"BodyPurist":0}},{"name":"TestSubject39","skills":{"Shooting":4,"Melee":4},"disabledWork":["Caring","Social","Artistic","Cooking","Cleaning","PlantWork"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"TestSubject92","skills":{"Intellectual":5,"Melee":5,"Cooking":1},"disabledWork":["Caring","Social","PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"TheaterTechnician80","skills":{"Construction":3,"Social":3,"Artistic":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Tinkerer86","skills":{"Construction":4,"Intellectual":4,"Artistic":2,"Crafting":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ToasterRepairman22","skills":{"Construction":7,"Mining":-3,"Crafting":6},"disabledWork":["Intellectual","Artistic"],"requiredWork":[],"traits":{}},{"name":"ToolMechanic77","skills":{"Construction":5,"Artistic":2,"Crafting":8},"disabledWork":["Animals","PlantWork"],"requiredWork":[],"traits":{}},{"name":"Torturer37","skills":{"Melee":6},"disabledWork":["Social","Caring"],"requiredWork":["Violent"],"traits":{"Psychopath":0}},{"name":"TournamentFighter28","skills":{"Intellectual":2,"Melee":8,"Medicine":1},"disabledWork":["ManualSkilled"],"requiredWork":[],"traits":{}},{"name":"TreasureHunter82","skills":{"Shooting":5,"Melee":5,"Social":4,"Cooking":2,"Medicine":2},"disabledWork":["ManualDumb","Animals","Artistic"],"requiredWork":[],"traits":{}},{"name":"TreehouseBuilder86","skills":{"Plants":6,"Melee":3},"disabledWork":[],"requiredWork":["PlantWork"],"traits":{}},{"name":"Undertaker93","skills":{"Intellectual":3,"Social":6,"Medicine":2},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"UnethicalDoctor29","skills":{"Intellectual":6,"Medicine":6},"disabledWork":["ManualDumb","Social"],"requiredWork":[],"traits":{}},{"name":"UnstableButcher31","skills":{"Construction":4,"Intellectual":-4,"Mining":3,"Melee":6,"Social":2,"Medicine":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"UprightDiplomat49","skills":{"Construction":-3,"Shooting":4,"Social":8,"Crafting":-3},"disabledWork":["Hauling"],"requiredWork":[],"traits":{}},{"name":"UrbworldDrone32","skills":{"Construction":5,"Mining":4,"Social":-2},"disabledWork":["Artistic","Intellectual"],"requiredWork":["ManualDumb","ManualSkilled"],"traits":{}},{"name":"UrbworldEnforcer11","skills":{"Shooting":7,"Melee":4,"Social":3,"Medicine":2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{"Tough":0}},{"name":"UrbworldEntrepreneur14","skills":{"Social":6,"Intellectual":3},"disabledWork":[],"requiredWork":["Social"],"traits":{}},{"name":"UrbworldPimp93","skills":{"Melee":6,"Social":4,"Medicine":5},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"UrbworldPolitican92","skills":{"Social":8},"disabledWork":["ManualDumb","Crafting"],"requiredWork":[],"traits":{"Greedy":0}},{"name":"UrbworldRebel56","skills":{"Melee":3,"Construction":3,"Mining":2},"disabledWork":["Intellectual","Crafting"],"requiredWork":["ManualDumb"],"traits":{}},{"name":"UrbworldSergeant50","skills":{"Shooting":4,"Melee":2,"Social":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"UrbworldSexSlave25","skills":{"Social":6,"Cooking":2,"Artistic":-2},"disabledWork":["Violent","Intellectual"],"requiredWork":[],"traits":{"Beauty":2}},{"name":"Vagabond73","skills":{"Construction":4,"Shooting":3,"Cooking":-2,"Crafting":4,"Animals":4},"disabledWork":["Intellectual","Artistic"],"requiredWork":[],"traits":{}},{"name":"VengefulExplorer54","skills":{"Construction":4,"Shooting":6,"Melee":5},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"VengefulHunter32","skills":{"Shooting":4,"Melee":6},"disabledWork":["Animals"],"requiredWork":["Violent"],"traits":{}},{"name":"VengefulNomad67","skills":{"Construction":5,"Mining":1,"Crafting":7},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"VersatileWorker13","skills":{"Construction":1,"Plants":4,"Melee":5,"Medicine":-1,"Crafting":2},"disabledWork":["Social","Intellectual","Firefighting"],"requiredWork":[],"traits":{"FastLearner":0}},{"name":"Veterinarian99","skills":{"Animals":4,"Medicine":4,"Cooking":-4},"disabledWork":[],"requiredWork":["Caring"],"traits":{}},{"name":"VideoProducer83","skills":{"Intellectual":2,"Artistic":7,"Crafting":4},"disabledWork":["ManualDumb","Social"],"requiredWork":[],"traits":{}},{"name":"Villain89","skills":{"Intellectual":2,"Mining":-2,"Shooting":4,"Social":6},"disabledWork":["Hauling"],"requiredWork":[],"traits":{}},{"name":"VinhoKing98","skills":{"Intellectual":3,"Shooting":3,"Social":7},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"VoidRaider74","skills":{"Shooting":6,"Melee":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"VoidspaceRaider94","skills":{"Mining":2,"Shooting":4,"Melee":2,"Medicine":2,"Crafting":3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"WanderingCrafter42","skills":{"Intellectual":2,"Shooting":3,"Crafting":8},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"WanderingHealer52","skills":{"Construction":-1,"Mining":-1,"Social":3,"Cooking":2,"Medicine":7},"disabledWork":["Violent"],"requiredWork":[],"traits":{"Kind":0}},{"name":"WarChief97","skills":{"Shooting":7,"Melee":5,"Social":2},"disabledWork":["Hauling","PlantWork"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"Warlordess56","skills":{"Mining":-2,"Melee":-2,"Social":6,"Cooking":6,"Medicine":5,"Artistic":3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"Warmaster54","skills":{"Shooting":2,"Melee":2,"Social":4,"Intellectual":4},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"Warmonger35","skills":{"Shooting":7,"Melee":4,"Social":-3},"disabledWork":["Caring"],"requiredWork":["Violent"],"traits":{"Bloodlust":0}},{"name":"Warrior94","skills":{"Melee":4,"Shooting":4},"disabledWork":[],"requiredWork":["Violent"],"traits":{}},{"name":"Warrior73","skills":{"Shooting":5,"Melee":4,"Cooking":2,"Medicine":3},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"WarshipCaptain67","skills":{"Construction":3,"Plants":-3,"Intellectual":5,"Shooting":3,"Melee":2,"Social":5,"Animals":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Weaver63","skills":{"Crafting":6,"Plants":2},"disabledWork":[],"requiredWork":["Crafting"],"traits":{}},{"name":"WhiteHatHacker82","skills":{"Intellectual":8,"Social":-2,"Crafting":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"WildlifeRanger99","skills":{"Shooting":2,"Medicine":2,"Animals":8},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}}];
+/** @type { NameIndex } */
+var adulthoodIndex = {"AIProgrammer22":0,"AIResearcher94":1,"AWOLSoldier49":2,"CivilServant25":3,"RimworldExile32":4,"Streamer52":5,"TravelingBard93":6,"VRDesigner87":7,"AceFighterPilot54":8,"AcolyteOfStars6":9,"Actor72":10,"AddictionCounsel60":11,"Adventurer19":12,"AdventurousWeirdo55":13,"AerospaceEngineer44":14,"AlcoholicTrucker93":15,"AnarchistRebel77":16,"AnimalFarmer21":17,"Archaeologist85":18,"Archer25":19,"Architect28":20,"ArchotechSpy75":21,"ArmyCook0":22,"ArmyScientist35":23,"ArmySergeant16":24,"Aromatherapist80":25,"ArtStudent79":26,"ArtifactHunter48":27,"ArtificerRampant95":28,"Artilleryman28":29,"ArtsPatron54":30,"AsceticPriest84":31,"Assassin20":32,"Assassin7":33,"Assembler69":34,"BalletDancer81":35,"BanditLeader74":36,"Banished68":37,"BanishedSoldier85":38,"Bartender62":39,"BattleMechanic27":40,"BattlefieldTech52":41,"BeastSlayer67":42,"Beastmaster67":43,"BehaviourResearch74":44,"BiosphereManager95":45,"Blacksmith72":46,"Blacksmith7":47,"BlacksmithShooter21":48,"BloodgameSurvivor6":49,"BloodyDentist9":50,"BloodyWanderer28":51,"Bodyguard58":52,"BountyHunter93":53,"BountyHunter17":54,"BountyHunter41":55,"Brave88":56,"Brigand68":57,"BrokenSoldier29":58,"Builder96":59,"BushSniper94":60,"BusinessGangster58":61,"Butcher40":62,"Caravaneer53":63,"CargoPilot58":64,"Carver1":65,"CasketBuilder52":66,"Castaway57":67,"Castaway81":68,"CaveBuilder81":69,"CaveExplorer45":70,"CaveworldIlluminator95":71,"CharityWorker36":72,"Chef52":73,"Chemist78":74,"Chemist73":75,"ChiefEngineer62":76,"ChurchPsychic98":77,"CivilEngineer2":78,"CivilServant2":79,"ClanChief14":80,"CloneFarmer58":81,"ColiseumFighter22":82,"ColonialGovernor78":83,"ColonyEngineer7":84,"ColonySettler53":85,"CombatEngineer30":86,"CombatEngineer4":87,"CombatMedic82":88,"CombatMedtech59":89,"CombatNegotiator31":90,"CommonerLord45":91,"ComputerEngineer10":92,"ComputerEngineer36":93,"ConArtist80":94,"ConceptualArtist39":95,"ConstructionEngineer32":96,"ContractMiner86":97,"CoreworldJeweler19":98,"CorpResearcher93":99,"CorpResearcher71":100,"CorporateBuilder58":101,"CorporateDrone10":102,"CorporateFixer36":103,"CorporateManager76":104,"CosmeticReject64":105,"CosmeticSurgeon36":106,"CostumeCrafter41":107,"Counselor26":108,"CraftShaper37":109,"CrimeLord10":110,"CriminalKingpin36":111,"CriminalSurgeon99":112,"CropFarmer17":113,"DeepSpaceMiner3":114,"DeepSpaceSurveyor1":115,"Defector78":116,"Defector95":117,"DefenseLawyer71":118,"Demolitionist39":119,"Deserter65":120,"DestroyerGeneral26":121,"Digger66":122,"Digger31":123,"DischargedSoldier53":124,"DisgracedOfficer19":125,"DoomsdayPariah18":126,"DreadedDude58":127,"Drifter67":128,"DromedaryKnight37":129,"DrugLieutenant98":130,"EnergyResearcher89":131,"Engineer40":132,"EngineeredPilot75":133,"EnvoyOfTheStars19":134,"EscapedConvict90":135,"Evangelist39":136,"Excavator55":137,"ExecutiveOfficer5":138,"ExiledResearcher44":139,"ExoticChef96":140,"ExpertHandyman8":141,"Explorer49":142,"ExplorerWriter10":143,"ExplosivesExpert26":144,"FactionLeader74":145,"FactoryWorker58":146,"FallenOfficial12":147,"FearfulChef49":148,"FelineScientist76":149,"FerventResearcher72":150,"FighterController67":151,"Firebomber51":152,"Flaneur30":153,"ForestProwler15":154,"Forester96":155,"Framer37":156,"FrontierMarshal27":157,"Fugitive4":158,"FurnitureBuilder83":159,"GameDeveloper95":160,"GameTester77":161,"GangBoss49":162,"GangSoldier39":163,"Gardener99":164,"Gatherer70":165,"GeneticEngineer89":166,"GeneticScientist66":167,"Geologist66":168,"Gigolo30":169,"Gigolo68":170,"GlitterworldEmpath26":171,"GlitterworldOfficer60":172,"GlitterworldSurgeon15":173,"Gnomebiologist96":174,"GovernmentAgent61":175,"GraphicDesigner33":176,"Guardian55":177,"GunDealer14":178,"Gunfighter51":179,"HeadButler50":180,"Healer46":181,"Healer35":182,"HearthTender66":183,"HedgeFundManager54":184,"Herbalist54":185,"Herder33":186,"Hermit82":187,"Herpetologist3":188,"HiredAssassin37":189,"HiredGun70":190,"HiredMuscle5":191,"HouseServant63":192,"HouseServant86":193,"Housemate8":194,"HumanComputer83":195,"HumanTrafficker35":196,"Hunter89":197,"Hunter74":198,"Hunter73":199,"HunterOfTheKing53":200,"HypnocultLeader61":201,"IllegalShipwright76":202,"ImperialGeneral27":203,"ImperialInquisitor53":204,"ImperialPriest24":205,"InfantryEngineer46":206,"InfantryMedic6":207,"InfantryOfficer49":208,"InformationBroker77":209,"IntelligenceAgent10":210,"IntelligenceAgent21":211,"IntimateAssassin35":212,"Inventor6":213,"InvoluntaryHermit38":214,"Jailbird40":215,"JoywireArtist8":216,"KingOfPirates25":217,"Landworker98":218,"LanguageAnalyst27":219,"LazyProgrammer3":220,"LineInfanteer20":221,"LivestockFarmer8":222,"Logger95":223,"Logger16":224,"LoneTraveler95":225,"Loner61":226,"LoreKeeper51":227,"LostMarine81":228,"LostSoldier13":229,"LowWageWorker7":230,"LoyalJanissary59":231,"MachineCollector55":232,"MachineFixer31":233,"MadAccountant61":234,"MadScientist22":235,"MadScientist2":236,"MadScientist31":237,"MafiaBoss17":238,"Mailman2":239,"Malingerer28":240,"MarbleDoctor99":241,"MasterChef48":242,"MasterTrader65":243,"Mathematician6":244,"MechWarVeteran77":245,"MechanicsEngineer64":246,"MedicSoldier54":247,"MedicalScientist16":248,"MedievalDoctor40":249,"MedievalFarmOaf58":250,"MedievalKnight26":251,"MedievalLord57":252,"MedievalMinstrel95":253,"MedievalSailor97":254,"MenagerieKeeper1":255,"MentalPatient69":256,"Mercenary55":257,"Mercenary4":258,"Mercenary20":259,"MercenaryCaptain98":260,"MercenaryChef44":261,"MercenaryLeader28":262,"MercenaryLord13":263,"MercenaryPilot63":264,"MessageCarrier77":265,"Microbiologist12":266,"MidworldSailor91":267,"MilitaryChaplain10":268,"MilitaryCommissar71":269,"MilitaryCook18":270,"MilitaryEngineer45":271,"MilitaryGunsmith27":272,"MilitaryInventor35":273,"MilitaryOfficer17":274,"MilitiaSoldier79":275,"MindwipedAssassin50":276,"Minister88":277,"Missionary99":278,"MobHenchman53":279,"ModDesigner85":280,"Model99":281,"MuffaloResearcher67":282,"MuffaloShaman95":283,"MutinousCaptain52":284,"NavyScientist52":285,"NavyTechOfficer0":286,"NetworkEngineer34":287,"NeuroScientist19":288,"NinjaAssassin31":289,"Novelist7":290,"Nurse61":291,"OrbitalReservist22":292,"OrnamentMaker56":293,"Osteologist74":294,"OverwatchSniper42":295,"Paramedic45":296,"ParamilitaryAgent11":297,"ParticlePhysicist44":298,"Philosopher97":299,"PiousSoldier67":300,"Pirate56":301,"PirateCaptain69":302,"PirateDoctor0":303,"PirateKing69":304,"PirateSympathizer24":305,"PirateTrooper73":306,"PitBrawler76":307,"PlagueDoctor31":308,"PlanetaryDiplomat7":309,"PlanetaryMiner64":310,"PlankCutter72":311,"PoisonGardener29":312,"Policeman45":313,"PoliticalActivist20":314,"PoliticalAssassin46":315,"Politician57":316,"PopIdol59":317,"PopIdolPirate39":318,"PrisonerOfWar2":319,"PrivateDetective66":320,"Propagandist86":321,"ProstheticSurgeon0":322,"ProstituteIdol28":323,"PsychiatricPatient94":324,"QuarryWorker29":325,"RaiderKing38":326,"Rancher43":327,"Ranger96":328,"Ranger6":329,"RebelFighter39":330,"ReconSniper89":331,"Recruiter14":332,"Regent9":333,"ReligiousHierarch16":334,"RenegadeEngineer43":335,"RenownedProfessor51":336,"Reporter71":337,"ReptileResearcher37":338,"Restorer70":339,"Roboticist1":340,"Roboticist41":341,"RocketEngineer53":342,"RocketPioneer19":343,"RoyalCook18":344,"RoyalGuard51":345,"RoyalMasseuse43":346,"RugbyPlayer71":347,"RunawayDancer35":348,"SanitationCaptain29":349,"Scout59":350,"Sculptor63":351,"SelflessHunter61":352,"SerialMurderer47":353,"ShadowMarine63":354,"ShamanOfShadows47":355,"Sheriff52":356,"Shipcracker37":357,"ShockTrooper15":358,"SicklyLawyer49":359,"Sightseer70":360,"Slaughterer58":361,"SlaveChemist84":362,"Smuggler23":363,"SoftwareDeveloper84":364,"SoleSurvivor85":365,"SpaceBartender0":366,"SpaceExplorer53":367,"SpaceHumanitarian9":368,"SpaceHunter79":369,"SpaceMarine16":370,"SpaceMarine51":371,"SpaceMarine19":372,"SpaceMarine9":373,"SpaceMarine94":374,"SpaceMarine5":375,"SpaceMarineMedic10":376,"SpaceMerchant97":377,"SpaceNavyDoctor72":378,"SpaceNavyTech37":379,"SpacePirate55":380,"SpaceRaider71":381,"SpaceResearcher25":382,"SpaceStationCook63":383,"SpaceTactician28":384,"SpaceTechnician29":385,"SpaceTrafficker68":386,"SpaceshipChef41":387,"SpaceshipSalesman34":388,"SpecialForces13":389,"Spiceminer81":390,"Spy58":391,"Spymaster41":392,"StalwartFarmer21":393,"StalwartFarmer90":394,"StarKnight5":395,"StarfighterPilot79":396,"StarshipDoctor37":397,"StarshipJanitor33":398,"StateEngineer60":399,"StationSecurity38":400,"StellarPirate10":401,"StewKeeper95":402,"StilettoAssassin34":403,"Storyteller63":404,"SuperSoldier95":405,"SystemLord77":406,"SystemsEngineer1":407,"Tamer79":408,"Taster16":409,"Taxonomist0":410,"Teacher20":411,"Technician9":412,"TechnologyDoctor35":413,"TestSubject90":414,"TestSubject39":415,"TestSubject92":416,"TheaterTechnician80":417,"Tinkerer86":418,"ToasterRepairman22":419,"ToolMechanic77":420,"Torturer37":421,"TournamentFighter28":422,"TreasureHunter82":423,"TreehouseBuilder86":424,"Undertaker93":425,"UnethicalDoctor29":426,"UnstableButcher31":427,"UprightDiplomat49":428,"UrbworldDrone32":429,"UrbworldEnforcer11":430,"UrbworldEntrepreneur14":431,"UrbworldPimp93":432,"UrbworldPolitican92":433,"UrbworldRebel56":434,"UrbworldSergeant50":435,"UrbworldSexSlave25":436,"Vagabond73":437,"VengefulExplorer54":438,"VengefulHunter32":439,"VengefulNomad67":440,"VersatileWorker13":441,"Veterinarian99":442,"VideoProducer83":443,"Villain89":444,"VinhoKing98":445,"VoidRaider74":446,"VoidspaceRaider94":447,"WanderingCrafter42":448,"WanderingHealer52":449,"WarChief97":450,"Warlordess56":451,"Warmaster54":452,"Warmonger35":453,"Warrior94":454,"Warrior73":455,"WarshipCaptain67":456,"Weaver63":457,"WhiteHatHacker82":458,"WildlifeRanger99":459};
\ No newline at end of file
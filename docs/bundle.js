@@ -0,0 +1,119 @@
+// Decodes the binary data bundles written by scripts/bundle.py (e.g. genes.bin)
+// The same format is decoded for the worker by src/bundle.ts
+
+/**
+ * @param {ArrayBuffer} buffer
+ * @returns {Object.<string, Object[]>} each dataset in the bundle, as the same records as the JSON outputs
+ */
+function decodeBundle(buffer) {
+    const bytes = new Uint8Array(buffer);
+    if (String.fromCharCode(...bytes.subarray(0, 4)) != "RWB1")
+        throw new Error("Not a data bundle");
+    const headerLength = new DataView(buffer).getUint32(4, true);
+    const header = JSON.parse(new TextDecoder().decode(bytes.subarray(8, 8 + headerLength)));
+    const body = 8 + headerLength + (8 - (8 + headerLength) % 8) % 8;
+    /** @type {string[]} */
+    const strings = header.strings;
+
+    const arrayTypes = {
+        i: { 1: Int8Array, 2: Int16Array, 4: Int32Array },
+        u: { 1: Uint8Array, 2: Uint16Array, 4: Uint32Array },
+        f: { 4: Float32Array, 8: Float64Array }
+    };
+    function typed(kind, width, offset, count) {
+        return new arrayTypes[kind][width](buffer, body + offset, count);
+    }
+    function sum(lengths) {
+        let total = 0;
+        for (const length of lengths)
+            total += length;
+        return total;
+    }
+
+    /** @returns {any[]} count values, with undefined for records that don't have the key */
+    function column(desc, count) {
+        if (!("p" in desc))
+            return values(desc, count);
+        const present = bytes.subarray(body + desc.p, body + desc.p + Math.ceil(count / 8));
+        let n = 0;
+        for (let i = 0; i < count; i++)
+            n += (present[i >> 3] >> (i & 7)) & 1;
+        const found = values(desc, n);
+        const out = new Array(count);
+        let next = 0;
+        for (let i = 0; i < count; i++)
+            out[i] = (present[i >> 3] >> (i & 7)) & 1 ? found[next++] : undefined;
+        return out;
+    }
+
+    /** @returns {any[]} */
+    function values(desc, count) {
+        switch (desc.t) {
+            case "z":
+                return new Array(count).fill(null);
+            case "b":
+                return Array.from(typed("u", 1, desc.o, count), (v) => v != 0);
+            case "i":
+                return Array.from(typed("i", desc.w, desc.o, count));
+            case "f":
+                return Array.from(typed("f", desc.w, desc.o, count));
+            case "s":
+                return Array.from(typed("u", desc.w, desc.o, count), (v) => strings[v]);
+            case "j":
+                return Array.from(typed("u", desc.w, desc.o, count), (v) => JSON.parse(strings[v]));
+            case "l": {
+                const lengths = typed("u", desc.w, desc.o, count);
+                const items = values(desc.v, sum(lengths));
+                const out = new Array(count);
+                let next = 0;
+                for (let i = 0; i < count; i++) {
+                    out[i] = items.slice(next, next + lengths[i]);
+                    next += lengths[i];
+                }
+                return out;
+            }
+            case "m": {
+                const lengths = typed("u", desc.w, desc.o, count);
+                const total = sum(lengths);
+                const keys = values(desc.k, total);
+                const items = values(desc.v, total);
+                const out = new Array(count);
+                let next = 0;
+                for (let i = 0; i < count; i++) {
+                    const obj = {};
+                    for (let j = 0; j < lengths[i]; j++, next++)
+                        obj[keys[next]] = items[next];
+                    out[i] = obj;
+                }
+                return out;
+            }
+        }
+        throw new Error("Unknown column type " + desc.t);
+    }
+
+    const out = {};
+    for (const name in header.datasets) {
+        const dataset = header.datasets[name];
+        const records = new Array(dataset.n);
+        for (let i = 0; i < dataset.n; i++)
+            records[i] = {};
+        for (const [key, desc] of dataset.c) {
+            const col = column(desc, dataset.n);
+            for (let i = 0; i < dataset.n; i++)
+                if (col[i] !== undefined)
+                    records[i][key] = col[i];
+        }
+        out[name] = records;
+    }
+    return out;
+}
+
+/**
+ * Fetches and decodes a bundle, e.g. `let { genes } = await loadBundle("./genes.bin");`
+ * @param {string} url
+ * @returns {Promise<Object.<string, Object[]>>}
+ */
+async function loadBundle(url) {
+    const response = await fetch(url);
+    return decodeBundle(await response.arrayBuffer());
+}
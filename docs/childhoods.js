@@ -1,2 +1,4 @@
 /** @type { Backstory[] } */
-var childhoods = [{"name":"MonkeyChild67","title":"Monkey child","titleShort":"Monkey kid","desc":"When This pawn was a baby, This pawn's parents traded their child to a troop of monkeys. Little is known of their life among the primates.","skills":{"Plants":6,"Mining":4,"Social":-3,"Animals":6},"disabledWork":["Artistic","Cleaning"],"requiredWork":[],"traits":{}},{"name":"MusicalKid14","title":"Musical kid","titleShort":"Music kid","desc":"This pawn was born with an almost magic voice. This pawn learned to sing as a baby. their voice also had a special timbre to it which calmed down everyone who listened to it.","skills":{"Social":3,"Artistic":3},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"OldMoneyHeir46","title":"Old money heir","titleShort":"Heir","desc":"This pawn grew up a sheltered and spoiled child in one of the many manors of their old-money industrialist family.\nWhile attending an elite private school, This pawn received an extensive education in the arts and sciences, but never saw the horrors of the real world.","skills":{"Intellectual":3,"Social":4,"Artistic":2},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"StewardsAssisant28","title":"Steward's assisant","titleShort":"Steward","desc":"A steward on medieval merchant ships, This pawn was well-travelled on their homeworld by their early teens.\nThe constant orders from their captain, however, fostered a defiant streak, as well as a general disaste for anything This pawn considered to be busywork.","skills":{"Melee":5,"Cooking":5,"Artistic":-2},"disabledWork":["Hauling"],"requiredWork":[],"traits":{}},{"name":"VRAddict29","title":"VR addict","titleShort":"VR addict","desc":"This pawn was a VR head - someone who is permanently jacked into the virtual gaming universe by their spinal plug. This pawn moved through their daily tasks barely aware of the physical reality around him. This left them nearly unable to socialize.","skills":{"Intellectual":2,"Shooting":1,"Melee":1,"Artistic":1,"Crafting":1},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"AbandonedChild23","title":"abandoned child","titleShort":"abandoned","desc":"This pawn was born sickly. Thinking that This pawn would only burden the tribe, their parents exposed them to the elements. Somehow, This pawn survived.","skills":{"Melee":3,"Crafting":3,"Social":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"AbandonedChild30","title":"abandoned child","titleShort":"abandoned","desc":"This pawn was a quick witted, funny child. One day, This pawn wandered off on their wealthy parents, and was ultimately lost in a supposedly unused ore warehouse. Due to cloning technology, their parents decided that the time looking for them was better spent on just cloning a better son.","skills":{"Construction":1,"Shooting":1,"Melee":1,"Social":1},"disabledWork":["Cooking","Cleaning"],"requiredWork":[],"traits":{}},{"name":"AbandonedOrphan61","title":"abandoned orphan","titleShort":"orphan","desc":"Abandoned at birth, young This pawn started their life in an orphanage.\nA rascal and a scoundrel, This pawn became a clever troublemaker.","skills":{"Plants":-3,"Shooting":2,"Melee":3,"Social":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Abductee43","title":"abductee","titleShort":"abductee","desc":"This pawn was abducted at a young age and forced to do menial labor on a pirate ship.","skills":{"Construction":2,"Melee":2,"Cooking":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Abductee7","title":"abductee","titleShort":"abductee","desc":"This pawn was abducted by xenohumans when This pawn was still a baby. They experimented on them to understand their genetic structure.\nAs This pawn grew up, This pawn grew a little bit too big and strong for their captors and escaped.","skills":{"Construction":2,"Mining":4,"Melee":4,"Social":-2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"AcademyStudent58","title":"academy student","titleShort":"student","desc":"This pawn went to school like a good space cadet would. This pawn was very tall and was known for their good looks.\nThough This pawn worried more about their hairstyle than their grades, This pawn still somehow passed the final exams.","skills":{"Social":3,"Crafting":2},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"AccursedChild88","title":"accursed child","titleShort":"cursed","desc":"This pawn was born at the peak of a lunar eclipse. The elders declared them a child of darkness and brought them under their care.\ntheir entire childhood was spent studying the lore and rituals of their people - until the day of calling.","skills":{"Construction":-1,"Intellectual":5,"Medicine":4},"disabledWork":["Firefighting","Cleaning","Hauling","Mining"],"requiredWork":[],"traits":{}},{"name":"AdventuringChild30","title":"adventuring child","titleShort":"adventurer","desc":"This pawn was raised to become an engineer. For years, This pawn planned to stow away on a cargo ship and start a new, more adventuresome life.\nOne night, after their parents fell asleep, This pawn managed to sneak on board a cargo ship just before it left port.","skills":{"Construction":2,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"AdventurousYouth70","title":"adventurous youth","titleShort":"adventurer","desc":"This pawn explored all around their family's large estate, uncovering little natural wonders hidden in nearby catacombs, rivers, and caves.\nDuring their teenage years, This pawn made numerous enemies","skills":{"Melee":2,"Social":2,"Cooking":2},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"AmateurAstronomer77","title":"amateur astronomer","titleShort":"astronomer","desc":"This pawn was fascinated with astronomy. This pawn would spend hours gazing at planets and nebulae through their telescope.\nThis pawn is credited with discovering a small comet that would, years later, strike a nearby moon and disrupt the mining operations there.","skills":{"Intellectual":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"AmateurBotanist79","title":"amateur botanist","titleShort":"botanist","desc":"Spending many summers crawling through dirt, This pawn found This pawn had quite the green thumb. Instead of learning to cook the food This pawn grew, This pawn just grew more and more.","skills":{"Plants":4,"Artistic":2},"disabledWork":["Cooking"],"requiredWork":[],"traits":{}},{"name":"AmateurEngineer3","title":"amateur engineer","titleShort":"engineer","desc":"This pawn grew up in a family with a military and engineering background. This pawn wanted to join the army but their father didn't like the idea, so their interest turned to great flying machines and works of engineering. This pawn secretly hoped that this would one day lead them to a life of galactic exploration.","skills":{"Construction":2,"Intellectual":2,"Mining":1,"Shooting":1},"disabledWork":["Cleaning","PlantWork"],"requiredWork":[],"traits":{}},{"name":"AngryStudent88","title":"angry student","titleShort":"student","desc":"This pawn trained towards their dream of working for their hometown's local council.\nFor reasons This pawn never quite understood, This pawn was bullied relentlessly by their classmates. This pawn chose to repress their rage.","skills":{"Intellectual":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"AnimalCaretaker20","title":"animal caretaker","titleShort":"caretaker","desc":"Born on a medieval farm, This pawn was tasked with caring for domestic animals. This pawn grew to love them.\nWith time, This pawn learned to tame wild animals. This pawn dreamed of one day meeting a thrumbo and taming it.","skills":{"Plants":2,"Animals":4},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"AnimalLabTech39","title":"animal lab tech","titleShort":"lab tech","desc":"This pawn worked as a technician in a lab studying animals.\nThis pawn spent their days taking care of the animals and cleaning up after them. This pawn dreamed of having their own lab one day.","skills":{"Intellectual":1,"Shooting":-2,"Medicine":2,"Animals":3},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"AntisocialChild83","title":"antisocial child","titleShort":"antisocial","desc":"This pawn lacked typical social skills, and avoided social interaction.\nThis pawn gained satisfaction only from steady work. This pawn especially disliked speaking with overly creative or outgoing individuals.","skills":{"Intellectual":3,"Crafting":2},"disabledWork":["Social","Artistic"],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"ApocalypseChild23","title":"apocalypse child","titleShort":"apocalypse","desc":"This pawn spent their childhood on a post-apocalyptic world. This pawn fought for survival from a young age, on a planet where trust did not exist.\nThis pawn told everyone that This pawn had no luck.","skills":{"Shooting":2,"Melee":3,"Crafting":2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"ApocalypseSurvivor23","title":"apocalypse survivor","titleShort":"survivor","desc":"This pawn was born during a time of unrest on their homeworld, as climate change threatened mass starvation and flooding. As This pawn grew up the situation worsened - billions died and peaceful states descended into anarchy. This pawn and their parents did whatever they had to to survive.","skills":{"Shooting":4,"Artistic":-3,"Intellectual":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ApprenticeOracle83","title":"apprentice oracle","titleShort":"oracle","desc":"This pawn was chosen at an early age by the village elders to keep the sacred rituals of the Oracle.\nAn irrepressibly curious child, This pawn caused a religious crisis for their tribe when This pawn accidentally flipped a switch to open the \"tombs\" of the Gods - cryptosleep caskets inhabited by some very confused ancestors.","skills":{"Intellectual":2,"Social":3,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ApprenticeSmith37","title":"apprentice smith","titleShort":"apprentice","desc":"This pawn grew up helping in their father's smithy.\nThey were some of the last smiths on the planet that to use traditional smithing methods. They even collect some materials themselves.\nSometimes, after work, This pawn would practice using the swords This pawn forged.","skills":{"Melee":2,"Crafting":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ArtSlave57","title":"art slave","titleShort":"artist","desc":"This pawn was born on the dark edge of a tidally-locked urbworld. After an argument, their father sold them to a local district lord as a slave artist.\nForced to create art or be punished, This pawn withdrew and became unable to form relations with others.","skills":{"Artistic":4},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"ArtfulDodger78","title":"artful dodger","titleShort":"dodger","desc":"This pawn grew up on one of the urbworlds and had to fend for themself all their life. This pawn never trusted anyone, relying on their persuasiveness and cunning to survive.\nThis pawn soon became skilled with firearms and knives as well as words.","skills":{"Shooting":1,"Melee":2,"Social":3},"disabledWork":["Caring","Artistic","Crafting","Cooking","Cleaning","PlantWork"],"requiredWork":[],"traits":{}},{"name":"ArtisanFarmer23","title":"artisan farmer","titleShort":"farmer","desc":"This pawn grew up on a their family's glitterworld farm. They were one of the last farms on the planet that preferred traditional farming methods to glitterworld technology.","skills":{"Plants":7,"Intellectual":-2,"Cooking":2},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"ArtisticWeirdo56","title":"artistic weirdo","titleShort":"weirdo","desc":"This pawn grew up in a house near a bustling midworld metropolis.\nThis pawn was talented at art and creative work, but often acted strangely, and thus had few friends.","skills":{"Cooking":1,"Artistic":3,"Crafting":2},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{}},{"name":"AspergersRebel13","title":"aspergers rebel","titleShort":"rebel","desc":"This pawn grew up as a rebel on an formerly-advanced rimworld devastated by war.\ntheir Aspergers syndrome meant This pawn struggled with social situations and was incapable of caring, but This pawn learned hard skills like research and shooting very quickly.","skills":{"Intellectual":5,"Shooting":2,"Social":-3},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"AspiringEngineer58","title":"aspiring engineer","titleShort":"tinkerer","desc":"This pawn had a fascination with gadgets and gizmos. This pawn took apart and put together almost anything This pawn could find.\nThis pawn got used to repairing toys brought to them by other children, and even fixed a few devices from their elders.","skills":{"Construction":2,"Intellectual":4,"Mining":2,"Social":-2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"AspiringPhysicist47","title":"aspiring physicist","titleShort":"student","desc":"The daughter of an engineer and doctor, This pawn's early life was intellectually rich. After visiting a physics lab, This pawn decided This pawn wanted to be a quantum physicist.\nBitten by a camel, kicked off a horse, and chased by dogs, This pawn developed a fear of animals.","skills":{"Construction":1,"Intellectual":3,"Crafting":2},"disabledWork":["Caring","Animals","Cooking"],"requiredWork":[],"traits":{}},{"name":"AspiringPopIdol28","title":"aspiring pop idol","titleShort":"pop idol","desc":"This pawn was being trained in song and dance to become the next big pop idol. This pawn grew up being taken care of by company handlers.\nThis pawn never knew manual labor, but learned a lot about music and social etiquette.","skills":{"Shooting":-4,"Melee":-4,"Social":4,"Artistic":4},"disabledWork":["ManualDumb","Cleaning","Hauling","PlantWork","Mining"],"requiredWork":[],"traits":{"Beauty":2}},{"name":"Athlete47","title":"athlete","titleShort":"athlete","desc":"This pawn was professional athlete at early age. Thanks to their skills, This pawn was able to leave their homeworld and enroll in a glitterworld university of science and technology.\nBecause of their demanding schedule and introverted nature, This pawn became socially inept.","skills":{"Intellectual":3,"Melee":4},"disabledWork":["Social","Artistic"],"requiredWork":[],"traits":{}},{"name":"AwkwardNerd48","title":"awkward nerd","titleShort":"nerd","desc":"Always fascinated by machines, This pawn spent their time studying robotics and holography. This pawn preferred the company of their scientific creations to that of other people.","skills":{"Intellectual":5,"Melee":-2,"Social":-2,"Crafting":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BlackjackPlayer76","title":"blackjack player","titleShort":"gambler","desc":"The only useful skill This pawn learned from their tough military school was card-counting. This pawn amassed many enemies by cheating at casinos, becoming ever more edgy and violent as the threat of retaliation grew.\nWhen This pawn was finally caught, they burned half their skin off. This pawn could never face fire or violence again.","skills":{"Intellectual":5,"Social":4},"disabledWork":["Violent","Firefighting"],"requiredWork":[],"traits":{}},{"name":"BlacksmithsSon73","title":"blacksmith's son","titleShort":"blacksmith","desc":"This pawn's father owned the blacksmith shop in an run-down old city district. This pawn would help their father whenever This pawn could.\nLater, their father took them as a blacksmith's apprentice and raised them as a man. This pawn also took on shooting as a hobby.","skills":{"Construction":3,"Shooting":3,"Artistic":-3,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BlessedChild46","title":"blessed child","titleShort":"blessed","desc":"This pawn was born under auspicious circumstances to a midworld spiritual group and held in reverence throughout their childhood.\nThis pawn learned to take care of the poor and give succor to the faithful from an early age.","skills":{"Social":3,"Medicine":2,"Artistic":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BodyguardTrainee54","title":"bodyguard trainee","titleShort":"bodyguard","desc":"This pawn was born into a famously skilled family of bodyguards. their mothers Elena and Victoria forced them into many dangerous situations, training them to put their client's well-being over their own.\nThis pawn was taught about many herbs and natural poisons to help them prevent clients from being poisoned.","skills":{"Plants":2,"Shooting":3,"Melee":2,"Medicine":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"BoneCollector14","title":"bone collector","titleShort":"pupil","desc":"Born to a family of fortune hunters, This pawn always had a passion for ancient history.\nThough never a tough or social boy, This pawn loved to dig through history books as well as dirt piles.","skills":{"Plants":2,"Mining":2,"Shooting":-3,"Melee":-3,"Social":-3,"Medicine":2,"Artistic":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Bookworm19","title":"bookworm","titleShort":"bookworm","desc":"Rather than socialize with the other children, This pawn preferred to get lost in literature. This pawn taught themself to read at an early age with books bought from passing traders.","skills":{"Intellectual":6,"Artistic":2,"Social":-3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"Bookworm3","title":"bookworm","titleShort":"bookworm","desc":"This pawn spent their youth in the library, reading every book This pawn could about the technical marvels of space travel, the engineering ingenuity of the space-faring pioneers, and the horrible yet fascinating tales of mechanoid wars. This pawn vowed that one day, This pawn would see these things for themself.","skills":{"Plants":2,"Intellectual":2,"Social":-2,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BoyScout42","title":"boy scout","titleShort":"scout","desc":"This pawn was in a boy scout troop on a midworld.\nThis pawn learned many survival skills including how to thrive in the outdoors and how to tend to basic wounds.","skills":{"Plants":2,"Shooting":2,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BoySoldier14","title":"boy soldier","titleShort":"soldier","desc":"War may never change - but the cast of characters does.\nBorn on a violent urbworld, This pawn was trained from a young age to fight the wars of others, and became rather good at it.","skills":{"Shooting":4,"Melee":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BrothelGofer84","title":"brothel gofer","titleShort":"gofer","desc":"Born on a steam-powered midworld wracked by a century of economic crises, This pawn went to work at a young age. Scrounging, shoe-polishing, sewing - This pawn did it all. But This pawn was most known as a brothel gofer, delivering all manner of aphrodisiacs and chemicals to the girls' rooms.","skills":{"Social":2,"Cooking":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BrutalThief59","title":"brutal thief","titleShort":"thief","desc":"Growing up in a gang, This pawn learned the brutality of the streets.\nKnowing that showing weakness could be fatal, This pawn closed themself off from others.","skills":{"Plants":-2,"Shooting":2,"Melee":4,"Social":-2},"disabledWork":["Caring","Artistic"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"BuddingArtist44","title":"budding artist","titleShort":"artist","desc":"This pawn had a knack for art. Traders and collectors from many different societies sought to buy their creations.","skills":{"Artistic":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Bully70","title":"bully","titleShort":"bully","desc":"This pawn tormented other children for fun. To keep them busy, an elder assigned them to a hunting party at an early age.","skills":{"Melee":2,"Shooting":3},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"BunkerKid41","title":"bunker kid","titleShort":"bunker kid","desc":"This pawn grew up in an underground shelter, waiting for radioactive fallout to subside. their rich family had gained access to a luxury bunker city, while billions died on the surface.\nDetermined to one day seek revenge against the hated enemy, This pawn spent most of their time practicing shooting in their private training facility.","skills":{"Shooting":4,"Melee":4,"Social":-2},"disabledWork":["Artistic","PlantWork"],"requiredWork":[],"traits":{}},{"name":"Cadet96","title":"cadet","titleShort":"cadet","desc":"Born on the planet New China, This pawn's father was a police chief and kept extremely strict watch over their son.\nThis pawn had to do military-style drill exercises every day and keep their room spotlessly clean, always ready for inspection. This pawn came to abhor violence.","skills":{"Construction":3,"Intellectual":3,"Crafting":3},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"CaravanChild53","title":"caravan child","titleShort":"child","desc":"This pawn was born on a urbworld merchant ship to an entrepreneurial mother and an absent father. Born male, This pawn disliked boy stuff, and got into their mother's things all the time.\nEventually, This pawn traveled with their mother to a glitterworld and spent their savings on a body This pawn was happy with.","skills":{"Social":2,"Artistic":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CaravanTraveler6","title":"caravan traveler","titleShort":"traveler","desc":"Born to a family of traveling merchants, This pawn was mentored by their father in the ways of being a trader. This pawn was often tasked with caring for the pack animals. Due to their nomadic lifestyle, This pawn hunted and bartered for their food.","skills":{"Plants":-3,"Shooting":1,"Social":2,"Animals":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CatHerder4","title":"cat herder","titleShort":"herder","desc":"This pawn helped out in their father's cat breeding business, socializing, herding, and feeding hundreds of cats.\nWhen This pawn refused to clean up after the cats, This pawn was transferred to the breeding science division.","skills":{"Social":2,"Cooking":3},"disabledWork":["Cleaning","Hauling"],"requiredWork":[],"traits":{}},{"name":"CaveChild30","title":"cave child","titleShort":"cave child","desc":"This pawn grew up in a large and intricate cave complex that extended deep into a mountainside. This pawn helped the adults maintain and improve the deep caves.","skills":{"Mining":3,"Construction":3},"disabledWork":[],"requiredWork":[],"traits":{"Undergrounder":0}},{"name":"CaveChild17","title":"cave child","titleShort":"cave kid","desc":"This pawn grew up in a cave on an tundra planet, and was adopted by a traveling group of entertainers known only as the Wizards. Once a starfaring crew, the Wizards told them wondrous stories about the universe.\nOne day, the Wizards did not return from scavenging. After years of waiting, This pawn set off into space to find them.","skills":{"Plants":2,"Mining":2,"Shooting":-2,"Melee":-2,"Cooking":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{"Undergrounder":0}},{"name":"CaveworldTender26","title":"caveworld tender","titleShort":"cave kid","desc":"This pawn grew up in cave complex deep beneath the surface of an inhospitable world. This pawn worked with the other children tending the tribe's fungus crops.","skills":{"Plants":4,"Mining":2,"Shooting":-3},"disabledWork":[],"requiredWork":[],"traits":{"Undergrounder":0}},{"name":"CaveworldTunneler48","title":"caveworld tunneler","titleShort":"tunneler","desc":"This pawn worked as a digger in the massive underground cave complex.\nThis pawn knows rock so well that This pawn can almost navigate caves by smell.","skills":{"Construction":1,"Mining":6,"Shooting":-2},"disabledWork":["Intellectual","Crafting"],"requiredWork":[],"traits":{"Undergrounder":0}},{"name":"ChessMaster67","title":"chess master","titleShort":"chesshead","desc":"This pawn loved to play chess. This pawn even earned the nickname This pawn for some of their craftier moves.\nThis pawn never got into trouble - mostly because This pawn was good at not getting caught.","skills":{"Intellectual":2,"Social":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ChildOfDrifters18","title":"child of drifters","titleShort":"drifter","desc":"Ever since This pawn was very small, This pawn never knew a home beyond their parent's ship. Their nomadic meandering provided a constant change of scenery. their life was often perilous but never dull, and This pawn inherited their parents' wanderlust.","skills":{"Shooting":4,"Melee":-2,"Social":-3,"Crafting":6},"disabledWork":["Firefighting","PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"ChildOfGlass61","title":"child of glass","titleShort":"survivor","desc":"This pawn was raised underground on a \"marble\" planet - a wasteland of radioactive asphalt and toxic fallout.\nTo survive on a planet devoid of life, This pawn had to learn how to farm underground and how to fight without wasting bullets.","skills":{"Plants":3,"Shooting":4,"Artistic":-3},"disabledWork":["Social","Animals"],"requiredWork":[],"traits":{"ShootingAccuracy":1}},{"name":"ChildProdigy76","title":"child prodigy","titleShort":"prodigy","desc":"After graduating college at age twelve, This pawn devoted their life to becoming immortal. However their research crossed the line when This pawn tried to modify their body using gene therapy and mechanical augmentation. This pawn was arrested and condemned to a prison planet.","skills":{"Intellectual":6,"Mining":-3,"Cooking":-3,"Medicine":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ChildResearcher32","title":"child researcher","titleShort":"researcher","desc":"A frightfully intelligent child, This pawn was kidnapped by a glitterworld corporation and forced to research technologies for weaponizing anti-matter.\nThis pawn vowed never to invent anything again.","skills":{"Intellectual":7,"Shooting":-2,"Melee":-2},"disabledWork":["Crafting"],"requiredWork":[],"traits":{}},{"name":"ChildScientist30","title":"child scientist","titleShort":"scientist","desc":"After graduating college very young, This pawn devoted their life to becoming immortal. This pawn was arrested for trying to genetically modify themself.\nThe authorities released them on the condition that This pawn would work in a government lab on spacecraft technology. This pawn was permitted to continue their personal research in their free time.","skills":{"Intellectual":4,"Social":-3,"Cooking":-2,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ChildSlave58","title":"child slave","titleShort":"slave","desc":"This pawn was born to a poor family on a rimworld. their father sold them into slavery at a young age. This pawn was traded many times. A tycoon bought them and sent them down into mines to look after machines and to work alongside them.","skills":{"Construction":2,"Mining":3,"Social":-2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"ChildSpy47","title":"child spy","titleShort":"spy","desc":"Children are presumed innocent, which makes them excellent spies. This pawn was trained in the art of infiltration when This pawn was just a small child.\ntheir years undercover gave them experience with social manipulation and lying, but This pawn never had a normal education.","skills":{"Social":4,"Intellectual":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ChildSpy84","title":"child spy","titleShort":"spy","desc":"Children are often presumed innocent, and so make ideal spies. This pawn was trained in the arts of infiltration and information-gathering when This pawn was very young.\ntheir spent years behind enemy lines, gathering intel in a brutal war. During this time, This pawn had limited opportunity for education.","skills":{"Shooting":3,"Social":3,"Medicine":1},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"ChildStar74","title":"child star","titleShort":"star","desc":"This pawn was well-known throughout their homeworld as a child actor in films and TV shows. their fame put them in contact with many different kinds of people, but also tended to get in the way of their education.","skills":{"Social":3,"Artistic":3,"Intellectual":-2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"ChildKnave69","title":"child-knave","titleShort":"knave","desc":"This pawn was a child-knave of King Loteric. This pawn enjoyed the training with wooden sticks and engaging others in close combat. This pawn adapted quickly to the heat of battle and was good at spreading fire.\nThis pawn served their lord well, until the king died in an unfortunate accident.","skills":{"Shooting":-3,"Melee":4,"Social":3},"disabledWork":["Firefighting"],"requiredWork":[],"traits":{"Brawler":0}},{"name":"CircusPerformer37","title":"circus performer","titleShort":"performer","desc":"Growing up in the circus, This pawn learned a lot of interesting things. More interesting than the balls This pawn juggled were the pockets This pawn picked between shows.\nA mistake with some firesticks made them develop a deathly fear of fire.","skills":{"Social":3,"Artistic":2},"disabledWork":["Firefighting"],"requiredWork":[],"traits":{}},{"name":"ClassClown96","title":"class clown","titleShort":"clowny kid","desc":"In the ultra-competitive environs of their glitterworld school, This pawn always offered to play the class clown to diffuse tension.\nThis pawn developed a sense of social desperation from this, as well as an appreciation for the artistic side of comedy.","skills":{"Social":-3,"Artistic":4},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"CloneFarmed21","title":"clone-farmed","titleShort":"disposable","desc":"Clone children are seeded into nutrient-rich womb-vats and rapidly grown in a simmed universe. They're harvested later, sometimes for food, sometimes for organs, sometimes for workers - but they're always disposable.","skills":{"Intellectual":4,"Shooting":-3,"Artistic":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ColiseumCleaner54","title":"coliseum cleaner","titleShort":"cleaner","desc":"During the 'Inner Destrian War' fallout, their parents were captured and This pawn was born into a life of slavery. Forced to clean coliseums after bloody battles for money. Watching, waiting, and learning. Coliseums were the only thing This pawn ever knew. One night while cleaning the coliseum, their family was murdered.","skills":{"Intellectual":4,"Social":2,"Crafting":1},"disabledWork":["Caring","Firefighting","Mining"],"requiredWork":[],"traits":{}},{"name":"Colonist22","title":"colonist","titleShort":"colonist","desc":"As a child, This pawn was launched into space as part of an interstellar colonization program.","skills":{"Plants":4,"Cooking":3,"Crafting":2},"disabledWork":["Artistic","Firefighting"],"requiredWork":[],"traits":{}},{"name":"ColonyKid47","title":"colony kid","titleShort":"colony kid","desc":"This pawn was born the child of two doctors in a small colony. Because of their parents, This pawn was always interested in science and medicine.\nThis pawn never really got along with other children, and as a result became withdrawn and unsociable.","skills":{"Intellectual":2,"Social":-2,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ComaChild93","title":"coma child","titleShort":"coma child","desc":"A childhood accident put This pawn into a coma. This pawn didn't wake up until This pawn was in their late teens. their body never recovered from the years of inactivity, but people tend to take pity on them when they hear their story.","skills":{"Social":4,"Construction":-2,"Mining":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CommonerHeir5","title":"commoner heir","titleShort":"heir","desc":"This pawn was a street urchin on a feudal steamworld.\n        After This pawn tried to steal food from the palace, the emperor, desperate to secure an heir, took them in and groomed them to be next in line for the throne.","skills":{"Intellectual":1,"Melee":2,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Computer80","title":"computer","titleShort":"computer","desc":"As a child, This pawn crafted complex algorithms. This pawn was used as a \"human computer\" for most of their childhood. This left them socially awkward and rather scrawny.\n        Despite the solitary confinement, This pawn developed a great imagination to occupy their idle time.","skills":{"Construction":-2,"Plants":-3,"Intellectual":4,"Artistic":1,"Crafting":3},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"ComputerGeek62","title":"computer geek","titleShort":"geek","desc":"This pawn spent most of their childhood on their computer, typing away, never knowing when to get up and eat.\nThis pawn had a very narrow interest: hacking cryptosleep safety protocols.","skills":{"Construction":3,"Intellectual":3,"Shooting":-2,"Animals":2},"disabledWork":["Social","Cooking","PlantWork"],"requiredWork":[],"traits":{}},{"name":"ConstructionGrunt84","title":"construction grunt","titleShort":"builder","desc":"Growing up in their father's lab, This pawn was given the life of an intellectual elite. This pawn got everything This pawn desired, and price was never an object.\nHowever This pawn did not partake in the luxury given to him. Instead, This pawn pursued more physical, and - in their father's eyes - lower-class jobs.","skills":{"Construction":4,"Social":1,"Crafting":2},"disabledWork":["Cleaning","PlantWork"],"requiredWork":[],"traits":{}},{"name":"ConventChild16","title":"convent child","titleShort":"illicit","desc":"The child of an illicit affair, This pawn was bought up by nuns in a medieval convent. This pawn learned the value of hard work and submission, but was taught that technology is heretical.","skills":{"Construction":3,"Plants":3},"disabledWork":["Intellectual","Violent"],"requiredWork":[],"traits":{}},{"name":"CoreDilettante33","title":"core dilettante","titleShort":"dilettante","desc":"This pawn spent their formative years on a glitterworld in the core region, where This pawn and their friends pursued lives of idle pleasure.\nAs This pawn grew up, This pawn began to find the life of ease unfulfilling. This pawn decided to look for a more challenging path.","skills":{"Intellectual":2,"Social":2,"Artistic":2},"disabledWork":["ManualDumb","Violent"],"requiredWork":[],"traits":{}},{"name":"CoreworldStudent50","title":"coreworld student","titleShort":"student","desc":"Born a male named Alex, This pawn didn't fit in well with the other boys. When very young, This pawn preferred creative pursuits, such as crafting jewelry, over sports. This pawn felt This pawn had the wrong body. Luckily, their family and friends supported their sex reassignment; as a teen, This pawn underwent surgery to become a female.","skills":{"Construction":2,"Shooting":-1,"Artistic":4,"Crafting":4},"disabledWork":["Cooking","PlantWork"],"requiredWork":[],"traits":{}},{"name":"CorpStudent95","title":"corp student","titleShort":"student","desc":"De Dion was bred to become an executive officer for the large space trading corporation that owned their home planet. their family had been working for that corporation for seven generations.\nAt age six, This pawn started to study at the corporate academy, where This pawn became a loyal follower and a ruthless executive.","skills":{"Intellectual":3,"Social":3,"Medicine":-2,"Artistic":-3},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"CorpBredStudent54","title":"corp-bred student","titleShort":"student","desc":"This pawn was bred to become an executive for the space exploration corporation that owned their home planet. their family had been working for that corporation for four generations.\nAt age five, This pawn enrolled at the corporate academy where This pawn learned loyalty and ruthlessness. This pawn excelled in finding diplomatic solutions where others would need violence.","skills":{"Intellectual":5,"Social":7,"Medicine":3,"Crafting":3},"disabledWork":["Violent","Artistic"],"requiredWork":[],"traits":{}},{"name":"CorporateSlave22","title":"corporate slave","titleShort":"soldier","desc":"This pawn grew up in a colony owned by a large glitterworld corporation. All children had virtual reality devices attached by force, and were raised in a brutal digital world.\nConstantly forced to fight others for the entertainment of the wealthy, gunplay and tactics became the center of This pawn's universe.","skills":{"Plants":-2,"Shooting":4,"Social":4,"Animals":-2},"disabledWork":["Cooking","Cleaning"],"requiredWork":[],"traits":{}},{"name":"CountryChild95","title":"country child","titleShort":"hick kid","desc":"This pawn was raised up to fear God and love their country. This pawn was a genuine backwoods kid. This pawn always worked hard to earn respect rather than demanding it.","skills":{"Cooking":2,"Animals":4},"disabledWork":["Artistic"],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"CountryLordling92","title":"country lordling","titleShort":"field lord","desc":"This pawn grew up in a noble family's manor in the outer country. their early years were full of lessons in horseback riding, politics, and religion.\nThis pawn and their friends found many ways to break the rules and have fun in the fields and forests.","skills":{"Plants":2,"Animals":3,"Social":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CowFarmer39","title":"cow farmer","titleShort":"farmer","desc":"This pawn grew up on a rimworld, under the tyranny of their father, who forced them to work every day on the farm. This pawn dreamed of escaping their father and exploring the universe.\nOne day, when the trade ship was overhead, This pawn stowed away among the goods in the launch pods, and escaped into space.","skills":{"Plants":4,"Animals":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CrashBaby32","title":"crash baby","titleShort":"crashbaby","desc":"As a baby, This pawn was the only survivor of a deadly spacecraft crash. A passing tribe discovered them in the wreckage and adopted them.","skills":{"Social":3,"Intellectual":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CrimeBossChild39","title":"crime boss' child","titleShort":"crime kid","desc":"This pawn was adopted child of a notorious crime boss. This pawn was taught all facets of the family business, from smuggling to inventive ways of killing.\nWhen the family was attacked, their father ordered them to hide in a secret cryptosleep vault.","skills":{"Construction":2,"Shooting":2,"Melee":2},"disabledWork":["Caring","Artistic","Cooking"],"requiredWork":[],"traits":{}},{"name":"CultChild3","title":"cult child","titleShort":"cult kid","desc":"This pawn was born into a powerful cult which shunned advanced technology and believed that all illness could be cured by cleansing the soul through sacred art.\nAfter their first glimpse of the outside world, This pawn decided to run away.","skills":{"Medicine":-3,"Artistic":5},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"CuriousChild33","title":"curious child","titleShort":"curious","desc":"This pawn was more interested in the systems and patterns of the world rather than its inhabitants. their social skills suffered.\nThis pawn came to understand that all things are part of the whole, and to destroy part would be to destroy all.","skills":{"Intellectual":4,"Social":-3,"Mining":-2},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"DataDecoder39","title":"data decoder","titleShort":"decoder","desc":"Born on a glitterworld, This pawn was very interested  in the process of documenting information, and quickly became senior glitterpedia recorder.\nThis pawn was effective at self-study, but This pawn was lacked in social experiences.","skills":{"Construction":2,"Plants":2,"Intellectual":2},"disabledWork":["Social"],"requiredWork":[],"traits":{"FastLearner":0}},{"name":"DedicatedStudent12","title":"dedicated student","titleShort":"student","desc":"The child of a wealthy manufacturer, This pawn was pampered from an early age. This pawn developed an affinity for reading and art, and a distaste for menial chores.\nA revolution brought their father's businesses under state control. Penniless, This pawn worked hard to complete their education.","skills":{"Intellectual":2,"Artistic":2},"disabledWork":["Animals","Cooking","Cleaning"],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"Delinquent13","title":"delinquent","titleShort":"delinquent","desc":"This pawn spent most of their childhood behind bars. Following an unsuccessful escape attempt, This pawn was pressed into the military.","skills":{"Shooting":1,"Melee":4},"disabledWork":["Animals","PlantWork"],"requiredWork":["Violent"],"traits":{}},{"name":"DesertRat47","title":"desert rat","titleShort":"desert rat","desc":"This pawn was born to a tribe of desert ascetics who wandered the endless wastes.\nThey sought a mythical substance they believed could liberate them from ignorance through psychedelic revelation - and usher in a new period of interstellar peace.","skills":{"Intellectual":2,"Melee":2,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{"Ascetic":0}},{"name":"DiplomatsChild97","title":"diplomat's child","titleShort":"diplomat","desc":"This pawn was born in diplomatic family.\nTravelling often, This pawn was home-schooled and saw the world mostly through a computer.","skills":{"Intellectual":1,"Artistic":1},"disabledWork":["Violent","Social"],"requiredWork":[],"traits":{}},{"name":"DisasterSurvivor65","title":"disaster survivor","titleShort":"survivor","desc":"This pawn was uprooted when marauders attacked their family farm, destroying machinery and killing farmhands and beasts alike.\nAfter the death of all This pawn knew, This pawn was left in the ruins to fend for themself.","skills":{"Plants":2,"Melee":3,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"DisasterSurvivor29","title":"disaster survivor","titleShort":"survivor","desc":"This pawn's planet collided with a small moon. Everything This pawn knew as home was destroyed, and their entire family died. This pawn was left in the ruins to fend for themself.","skills":{"Construction":3,"Cooking":2,"Crafting":1},"disabledWork":["Animals"],"requiredWork":[],"traits":{}},{"name":"DiscardedYouth93","title":"discarded youth","titleShort":"discarded","desc":"This pawn grew up isolated on a trash planet. A dumping ground for surrounding glitterworlds, it was a harsh home. As a baby, This pawn sucked on the tap of a discarded nutrient paste dispenser for comfort.\nIn these desperate circumstances, against all odds, This pawn survived - and thrived.","skills":{"Construction":3,"Crafting":3},"disabledWork":["Artistic","Cleaning","PlantWork"],"requiredWork":[],"traits":{}},{"name":"DisciplinedFarmer28","title":"disciplined farmer","titleShort":"farmer","desc":"This pawn was the younger of two sons on the family farm, a frontier plot that struggled to turn a profit. This pawn's father was a strict disciplinarian, constantly at their sons to work harder and keep quiet. This pawn burnt their hand making breakfast once and swore to cook only when their life was in danger.","skills":{"Construction":2,"Plants":3,"Intellectual":-1,"Mining":2},"disabledWork":["Social","Cooking"],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"DisplacedNoble67","title":"displaced noble","titleShort":"noble","desc":"Born on an urbworld to the ruler of three megacities, This pawn's prospects looked good - until a violent insurrection overthrew their family. Exile introduced This pawn to hard work and combat, but some high-born squeamishness remains.","skills":{"Intellectual":1,"Shooting":3,"Crafting":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"DreadedBaby56","title":"dreaded baby","titleShort":"baby dude","desc":"This pawn was found as a baby in a crashed spacecraft. According to the ship's records, This pawn invented the nuclear device that powered their ship. Apparently, This pawn also invented the sky and the hamburger, and is said to have fathered a race of tasty golden kittens.","skills":{"Shooting":1,"Cooking":3,"Artistic":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Dreamer79","title":"dreamer","titleShort":"dreamer","desc":"This pawn was an expressive child. This pawn sang often, and made friends very easily, be they young or old, male or female.\nThis pawn hated fighting, but when made angry, This pawn could be dangerous. their temper was quick.","skills":{"Melee":2,"Social":4,"Artistic":3},"disabledWork":[],"requiredWork":[],"traits":{"Kind":0}},{"name":"Drudge9","title":"drudge","titleShort":"drudge","desc":"This pawn was never sure what This pawn wanted to do with their life. This pawn spent most of their time doing low-wage jobs and wondering what their future would be like.\nThis pawn entertained themself with space sims and survival games, dreaming of one day being somewhere more interesting.","skills":{"Construction":2,"Mining":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"DrugMule80","title":"drug mule","titleShort":"mule","desc":"Raised in an orphanage, This pawn turned towards the gang life at age ten.\nThis pawn was exploited by the local gang as a drug mule to traffic \"substance F\" across rival gang territory. This pawn took a bullet or two.","skills":{"Shooting":2,"Melee":3},"disabledWork":["Caring","Social","Intellectual","Artistic","Cleaning","PlantWork"],"requiredWork":[],"traits":{}},{"name":"DustyFarmHand75","title":"dusty farm hand","titleShort":"farm hand","desc":"From the time This pawn could walk, This pawn helped take care of the animals and crops that their people tended in their arid homeland.\nThe work toughened them, but left little time for intellectual activities.","skills":{"Plants":2,"Medicine":1,"Animals":2},"disabledWork":["Intellectual","Artistic"],"requiredWork":[],"traits":{"Tough":0}},{"name":"Empath47","title":"empath","titleShort":"empath","desc":"This pawn was an incredibly empathetic child, so much that This pawn was totally overwhelmed by simple social interactions. Once, This pawn stepped on a bug and felt so guilty This pawn cried for an hour.\nThis pawn did try to use a gun one time, but it went very poorly, as the loud noise made them flinch uncontrollably.","skills":{"Intellectual":2,"Artistic":2},"disabledWork":["Violent","Social","Animals"],"requiredWork":[],"traits":{}},{"name":"EnergeticPopIdol61","title":"energetic pop idol","titleShort":"pop idol","desc":"This pawn grew up on a glitterworld, training in rapier arts and singing. This pawn spent several years as an energetic teen pop idol.\nHowever, This pawn decided that the music and modeling industries were not paying them enough attention, so This pawn left.","skills":{"Intellectual":-2,"Melee":3,"Social":2,"Medicine":-2,"Artistic":5},"disabledWork":[],"requiredWork":[],"traits":{"Beauty":2,"Greedy":0}},{"name":"ExiledPrince58","title":"exiled prince","titleShort":"prince","desc":"A member of a royal family, This pawn was exiled for shaming their family.\nLiving in a foreign land, mostly alone, This pawn spent most of their time making huts and houses to live in. This pawn found little time in an average day for enjoyment, and lost all their friends and family.","skills":{"Construction":3,"Artistic":-2,"Crafting":2,"Animals":1},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"FactoryDrone58","title":"factory drone","titleShort":"worker","desc":"This pawn grew up in a large factory city on an industrial world.\nSince poverty was rampant and food scarce, This pawn worked for whatever wages This pawn could get. This wasn't an easy life, but This pawn never shied away from a hard day's work.","skills":{"Construction":3,"Intellectual":-2,"Crafting":3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"FallenProdigy40","title":"fallen prodigy","titleShort":"prodigy","desc":"This pawn was born on a glitterworld falling into chaos. their father was killed in action.\nThis pawn struggled for a scholarship at Utmaior Academy and had to prove their right to be there. A child genius, This pawn was bullied as a charity case and couldn't make friends with the other kids.","skills":{"Construction":2,"Plants":2,"Intellectual":5,"Medicine":3,"Crafting":2},"disabledWork":["Social"],"requiredWork":[],"traits":{"TooSmart":0}},{"name":"FarmBoy64","title":"farm boy","titleShort":"farm boy","desc":"This pawn worked on their family's farm, looking after the animals and treating them when they were injured. Preferring hands-on tasks and the outdoors, This pawn avoided softer jobs that might have kept them cooped up inside.\nThis pawn enjoyed this lonely work, and tended to stay out of people's way and do their own thing.","skills":{"Plants":2,"Mining":3,"Melee":4,"Social":-3,"Cooking":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"FarmHand2","title":"farm hand","titleShort":"farm hand","desc":"This pawn was born on a farm on a rimworld.\nEverything was taken care of by the few members of the farm, including This pawn. This helped them build independence, spirit, and a well-rounded character.","skills":{"Construction":2,"Plants":4,"Intellectual":-2,"Melee":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"FarmKid60","title":"farm kid","titleShort":"farm kid","desc":"This pawn grew up on their family's beef farm. This pawn enjoyed working the fields and taking care of the animals.","skills":{"Plants":3,"Medicine":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"FarmMechanic1","title":"farm mechanic","titleShort":"mechanic","desc":"Growing up on a farming planet, This pawn spent their time learning about the automated machinery that grew and harvested the multitude of crops.","skills":{"Construction":4,"Plants":2},"disabledWork":["Intellectual","Artistic"],"requiredWork":[],"traits":{}},{"name":"FarmerBoy88","title":"farmer boy","titleShort":"farmer","desc":"This pawn's parents died in a fire when This pawn was seven. This pawn grew up on their uncle's farm, plowing fields and doing manual labor.\nThis pawn could not bear answering questions about their parents, so This pawn replaced social contact with hard work.","skills":{"Construction":1,"Plants":4,"Mining":1,"Crafting":2},"disabledWork":["Caring","Social","Firefighting"],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"FarmersDaughter81","title":"farmer's daughter","titleShort":"farm girl","desc":"This pawn grew up on their parents' vineyard. This pawn spent their youth exploring the land and making friends with various bugs and insects.\nHaving heard stories about all the fascinating things out there in the universe, This pawn always dreamed of venturing out to see it for themself.","skills":{"Social":-1,"Cooking":2,"Artistic":3,"Crafting":3},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"FarmersSon20","title":"farmer's son","titleShort":"farmer","desc":"This pawn spent much of their childhood learning biome farming. In their biome they kept animals to investigate which would cope best in the alien environment.\nDue to this, the travel restrictions and oxygen rationing system, This pawn rarely got to meet anyone from outside their family.","skills":{"Plants":2,"Social":-3,"Cooking":1,"Animals":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"FeralChild96","title":"feral child","titleShort":"feral","desc":"Abandoned on an animal planet as a small child with nought but a blanket with a name embroidered on it, This pawn made themself one with the wilderness.\nWhen This pawn was 13, This pawn encountered a team of mineral surveyors, who \"offered\" them passage off of the planet.","skills":{"Plants":2,"Melee":4,"Crafting":1},"disabledWork":["Social","Intellectual"],"requiredWork":[],"traits":{}},{"name":"FeralChild85","title":"feral child","titleShort":"survivor","desc":"This pawn and their family lived a hard but prosperous life along with their fellow colonists on an outlying rimworld.\nOne day, a group of mechanoids attacked, killing everyone aside from This pawn. This pawn then lived alone in the desert until a group of raiders found him.","skills":{"Plants":2,"Melee":4,"Crafting":1},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"FeudalFarmBoy0","title":"feudal farm boy","titleShort":"slave","desc":"This pawn was the son of a medieval farmer, and was expected to follow in their footsteps. This pawn was brought up as a kind, well trained farm boy.\nThis pawn lived in an unusual feudal kingdom which co-existed with a midworld society which was itself well-known for genetic manipulation.","skills":{"Plants":4,"Social":2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"FeudalLordling56","title":"feudal lordling","titleShort":"lordling","desc":"This pawn grew up on a feudal world that was part of a multi-planet empire. As the son of a high lord, This pawn enjoyed many privileges.\nThis pawn learned to maneuver in both the political landscape and in close quarters combat.","skills":{"Melee":4,"Social":3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"FireKeeper44","title":"fire keeper","titleShort":"firekeep","desc":"This pawn was responsible for keeping the tribe's fire going. This pawn took this responsibility very seriously.","skills":{"Crafting":2,"Cooking":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"FireScarredChild1","title":"fire-scarred child","titleShort":"scarred","desc":"This pawn was an active child who lived an uneventful childhood until This pawn fell into a fire and suffered horrific burns to their hands and arms. Although the scars have faded, This pawn can't bear to be in close proximity to fire.","skills":{"Mining":1,"Melee":1},"disabledWork":["Cooking","Firefighting"],"requiredWork":[],"traits":{}},{"name":"ForestChild83","title":"forest child","titleShort":"forest kid","desc":"When This pawn was a baby, This pawn's mother went insane and left them in the woods.\nRaised by wild people, This pawn was known for both loving and killing animals.","skills":{"Melee":2,"Animals":2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"FoundryApprentice76","title":"foundry apprentice","titleShort":"foundryman","desc":"This pawn grew up as an apprentice in the foundries of an industrial world. This experience gave them metalworking skills and strong muscles, but stunted their artistic development.","skills":{"Construction":3,"Melee":1,"Artistic":-2,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Freethinker38","title":"freethinker","titleShort":"thinker","desc":"This pawn grew up on a toxic world with tyrannical leaders. While the rest of the population was high on the planet's narcotic exports, This pawn joined a rebel militia.\nAfter a risky operation against the regime failed, This pawn fled the planet, staying alive by threatening mutual annihilation with a planetcracker antimatter bomb.","skills":{"Intellectual":2,"Shooting":3,"Social":2,"Artistic":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"FrightenedChild43","title":"frightened child","titleShort":"scared","desc":"This pawn grew up with a laundry list of phobias and neuroses. This pawn feared, among other things, doctors and foodborne pathogens.\nAs a result, This pawn learned to cook and care for themself, but many of their fears dog them in adulthood.","skills":{"Medicine":3,"Cooking":3},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"FrontierMarshal54","title":"frontier marshal","titleShort":"marshal","desc":"This pawn inherited a sense of duty from their father, and began a law enforcement career on their frontier homeworld.\nThis pawn tried to uphold the law with honor, but the corruption and greed of local government officials often discouraged him.","skills":{"Shooting":4,"Melee":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"GNomeSculptor34","title":"g-nome sculptor","titleShort":"sculptor","desc":"This pawn was engineered in a lab as part of the G-nome Project. This pawn was implanted at birth with encyclopedic knowledge of all aspects of xenobiology.\nThe G-nome scientists nicknamed them This pawn and occupied them with sculpting. This pawn developed a love of sculpting gnomes and gnome accessories.","skills":{"Intellectual":2,"Social":2,"Artistic":4,"Crafting":2},"disabledWork":["Cooking","Cleaning"],"requiredWork":[],"traits":{}},{"name":"GalacticPage37","title":"galactic page","titleShort":"page","desc":"This pawn served the high admiral of a space fleet. This pawn learned the ways of court, including etiquette and speechcraft.\nIn their feudal society, it was considered a great honor to serve a man of such prestige.","skills":{"Social":6,"Artistic":2},"disabledWork":["ManualDumb","ManualSkilled"],"requiredWork":[],"traits":{}},{"name":"GameFanatic86","title":"game fanatic","titleShort":"gamer","desc":"This pawn was a fanatical gamer who learned to survive in virtual reality games.\nOnce, while attempting to prove their skills in the real world, This pawn was abducted by a criminal scientist and experimented on. This pawn escaped, but the experience stayed with him.","skills":{"Intellectual":3,"Shooting":3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"GangMember83","title":"gang member","titleShort":"ganger","desc":"This pawn grew up homeless on an urbworld. This pawn was forced to fight and struggle for everything, making them hard and ruthless long before adulthood.\nThis pawn would have stayed in those streets, had This pawn not been injured in a shootout and had their body confiscated for use by one of the worldwide city's ruling corporations.","skills":{"Plants":-2,"Shooting":2,"Melee":5},"disabledWork":["Social","Intellectual"],"requiredWork":[],"traits":{}},{"name":"GangMember16","title":"gang member","titleShort":"gang kid","desc":"This pawn grew up without parents. their whole life was spent alone, fighting for survival on the streets.\nNo matter how hard it became to survive, This pawn never gave up.","skills":{"Shooting":3,"Melee":4,"Medicine":3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{"Nerves":2}},{"name":"GlitterworldKid85","title":"glitterworld kid","titleShort":"glit kid","desc":"The son of a genetically-engineered \"perfect mate\" on a glitterworld, This pawn was much more shy, withdrawn and nervous than their parents. This pawn kept mostly to themself, studying science and medicine and taking on gardening as a hobby. \nIn their teens, This pawn ran away from home, seeking a quieter life.","skills":{"Plants":4,"Intellectual":2,"Social":-3,"Medicine":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"GlitterworldNerd20","title":"glitterworld nerd","titleShort":"nerd","desc":"This pawn loved technology from the day This pawn was born. This pawn had a mechanoid companion which This pawn tried to modify.\ntheir obsession with technology meant that This pawn never appreciated arts or culture.","skills":{"Intellectual":5,"Crafting":2},"disabledWork":["ManualDumb","Artistic"],"requiredWork":[],"traits":{}},{"name":"GlitterworldRoyal24","title":"glitterworld royal","titleShort":"royalty","desc":"This pawn grew up in a glitterworld royal household. This pawn was groomed from a young age to marry into another planet's royal family.\nUnfortunately, their crooked teeth made them undesirable to suitors, so This pawn became bitter and resentful.","skills":{"Social":2,"Cooking":2,"Artistic":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{"Beauty":-1}},{"name":"GunKid30","title":"gun kid","titleShort":"gun kid","desc":"Growing up in a urbworld, This pawn never had it easy. Every day was a struggle and pollution, hunger, and gangs of older kids.\nIn the little space This pawn had to themself, This pawn studied their passion - guns, combat tactics, and war history.","skills":{"Shooting":3,"Melee":3,"Artistic":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Gymnast48","title":"gymnast","titleShort":"gymnast","desc":"This pawn was a professional gymnast at an early age. Thanks to their skills, This pawn was able to enroll in a glitterworld university.\nBecause of the lack of career opportunities in gymnastics, This pawn left the university unemployed and carrying an enormous debt.","skills":{"Melee":4,"Social":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"HackerKid98","title":"hacker kid","titleShort":"hacker","desc":"Born on a high-tech world, This pawn learned to hack computers at a young age. \nSpending many hours tinkering alone made them very good with machines, but very bad with humans.","skills":{"Construction":3,"Crafting":3},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"HackerProdigy84","title":"hacker prodigy","titleShort":"hacker","desc":"This pawn was raised as the only child of wealthy surgeons. After being pressured into accepting a medical apprenticeship, This pawn snapped. This pawn seized their inheritance and went underground to learn how to exploit computer networks. This pawn quickly became one of the most feared hackers on their home planet.","skills":{"Intellectual":7,"Medicine":4},"disabledWork":["ManualDumb","Cooking"],"requiredWork":[],"traits":{}},{"name":"HeadjackAddict4","title":"headjack addict","titleShort":"headjacker","desc":"Plugged in to the computer via head-jack for days at a time, This pawn found This pawn preferred the company of computers to that of people or pets.","skills":{"Plants":-3,"Intellectual":4,"Shooting":2},"disabledWork":["Social","Animals"],"requiredWork":[],"traits":{}},{"name":"HelpDeskWorker31","title":"help desk worker","titleShort":"help desk","desc":"Due to their affinity for technology and desire to help others, This pawn jumped at the chance to take a job at a help desk.\nUnfortunately, the job's soul-crushing after-effects lasted longer than their enthusiasm.","skills":{"Intellectual":3},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"Herder19","title":"herder","titleShort":"herder","desc":"This pawn tended the muffalo herds, keeping them safe from predators and treating sick animals. It was quiet work, but This pawn enjoyed being away from people.","skills":{"Medicine":3,"Melee":3,"Social":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"HexCellArtist91","title":"hex-cell artist","titleShort":"artist","desc":"This pawn crafted sculptures from spent hex-cells and traded them to a local museum for food.\nAfter their popularity grew, This pawn was approached by a pirate and abducted. The pirate kept them prisoner and forced them to create sculptures for sale.","skills":{"Artistic":3,"Crafting":2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"Hideaway7","title":"hideaway","titleShort":"hideaway","desc":"This pawn's overprotective parents encouraged them to stay at home nearly every day. Though This pawn had a lot of time to read and pursue crafting hobbies, This pawn never developed normal social skills.","skills":{"Intellectual":3,"Crafting":3,"Social":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"HighBaroness37","title":"high baroness","titleShort":"noble","desc":"This pawn was born as low-ranking royalty in a large imperial family.\nThis pawn was placed In charge of running their home planet from an early age, and learned important political and cultural skills in that role.","skills":{"Intellectual":2,"Social":7,"Artistic":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"HillbillyProdigy60","title":"hillbilly prodigy","titleShort":"hillbilly","desc":"Born on a cold rimworld inhabited mainly by furred xenohumans, This pawn grew up to the sound of bar fights and shootouts. Though their childhood was spent playing the banjo and working as a mechanic, their abnormal intelligence made them want something more; This pawn entered medical school at a young age.","skills":{"Intellectual":2,"Melee":2,"Medicine":2},"disabledWork":["Social","Artistic","Cleaning"],"requiredWork":[],"traits":{}},{"name":"HistoryStudent12","title":"history student","titleShort":"student","desc":"As a child, This pawn learned many artistic forms including music and novel writing. As This pawn grew older, This pawn began to study legends from their home world - legends of the lizard-like beings at the center of their culture's folklore.","skills":{"Social":2,"Artistic":4,"Crafting":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"HunterScavenger64","title":"hunter scavenger","titleShort":"scavenger","desc":"Born to a family of raiders in the mudlands of Vinna, This pawn survived by scavenging food and resources from nearby settlements with their gang. This pawn was the most ferocious of the bunch.","skills":{"Social":2,"Cooking":2,"Medicine":2,"Artistic":3},"disabledWork":["Animals"],"requiredWork":[],"traits":{}},{"name":"IcePlanetChild95","title":"ice planet child","titleShort":"ice child","desc":"Growing up on the frozen wastes of an ocean moon, This pawn only had animals and a few hard-bitten sailors as companions.\nThe lack of social interaction made them develop a interest in engineering - but This pawn never developed any great fondness for humans.","skills":{"Construction":2,"Intellectual":4},"disabledWork":["Caring","Social","Artistic"],"requiredWork":[],"traits":{}},{"name":"IceworldSurvivor75","title":"iceworld survivor","titleShort":"iceborn","desc":"This pawn was born on an iceworld. Survival depended on staying together and building with nothing.\nThis pawn got used to the cold. This pawn never got used to dealing with those strange green things called plants.","skills":{"Construction":3,"Social":1,"Crafting":1},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"IdealisticCadet64","title":"idealistic cadet","titleShort":"cadet","desc":"Raised in the military traditions of their forefathers, This pawn was taught from a young age that This pawn would be a great leader and the hero of their family.\nThis pawn excelled at their studies and graduated from the academy with honors.","skills":{"Shooting":4,"Melee":3,"Social":-2},"disabledWork":["Mining"],"requiredWork":[],"traits":{}},{"name":"ImperialStudent49","title":"imperial student","titleShort":"student","desc":"This pawn studied on an imperial midworld where guns were banned and self-defense study was encouraged. The relative safety allowed them to focus on their botanical research.","skills":{"Plants":2,"Intellectual":3,"Shooting":-3,"Melee":2},"disabledWork":["Crafting","Firefighting","Cleaning"],"requiredWork":[],"traits":{}},{"name":"IndustrialOrphan13","title":"industrial orphan","titleShort":"orphan","desc":"This pawn never knew their parents. their earliest memories were of drudgery in the mines and workhouses of their industrial world.\nBecause of this, This pawn never received a proper education.","skills":{"Crafting":3,"Mining":3,"Intellectual":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"IndworldUrchin73","title":"indworld urchin","titleShort":"urchin","desc":"This pawn grew up on the streets of a world in the early stages of its industrial revolution. This pawn passed their days stealing, begging and tinkering with discarded machine scraps, always on the lookout for a way to escape poverty.","skills":{"Construction":1,"Melee":1,"Crafting":2},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"Infantry99","title":"infantry","titleShort":"infantry","desc":"This pawn was raised on a world wracked by war.\nAt an early age, This pawn was shown how to use guns and cruelty to project their will. This pawn later distinguished themself by committing atrocities with more enthusiasm than anyone else.","skills":{"Shooting":2,"Melee":1,"Social":2},"disabledWork":["Caring"],"requiredWork":[],"traits":{"Bloodlust":0}},{"name":"JoywireAddict76","title":"joywire addict","titleShort":"addict","desc":"This pawn's wealthy parents provided everything This pawn ever wanted. After discovering joywires, This pawn became obsessed. Once their parents realized what happened, they cut them off.\nUncaring and often violent, This pawn sought their next joywire fix by any means possible.","skills":{"Shooting":4,"Melee":6,"Social":-3},"disabledWork":["Intellectual","Cleaning"],"requiredWork":[],"traits":{}},{"name":"JungleKid35","title":"jungle kid","titleShort":"jungle kid","desc":"This pawn was abandoned as a newborn, and grew up among the animals of their homeworld's dense jungles.\nWhen This pawn was a teenager, a traveling doctor found them injured near a road, hissing and meowing. This pawn rescued them and took them on as an apprentice.","skills":{"Intellectual":-2,"Melee":2,"Cooking":2,"Animals":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"JunkyardMechanic51","title":"junkyard mechanic","titleShort":"mechanic","desc":"Left for dead at a young age, This pawn was rescued by an old man who ran an urbworld junkyard. The old man forced This pawn to do dangerous, demanding work.\nThis pawn became very familiar with machines, but This pawn grew up with almost no other experiences.","skills":{"Construction":2,"Intellectual":2,"Social":-3,"Crafting":4},"disabledWork":["Animals"],"requiredWork":[],"traits":{}},{"name":"KidScientist53","title":"kid scientist","titleShort":"scientist","desc":"Born into an influential family, This pawn received the best education money could buy. their intellect soon proved to be superior to many. However, their lack of empathy quickly put them at odds with their teachers and their parents.","skills":{"Intellectual":4,"Medicine":4,"Artistic":-3},"disabledWork":["ManualDumb","Social"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"Killer41","title":"killer","titleShort":"killer","desc":"This pawn was a bloodlusting child. Villagers thought them the product of a snake demon and human coupling.\nAfter watching how their human father betrayed and murdered their mother, This pawn longed to see how many more humans This pawn could get to fall into their hands.","skills":{"Melee":4,"Medicine":2},"disabledWork":["Social"],"requiredWork":[],"traits":{"Bloodlust":0}},{"name":"LabGrownChild22","title":"lab-grown child","titleShort":"lab-grown","desc":"This pawn was born in a laboratory as part of a altruistic but failed attempt to create a new class of human.\ntheir childhood was filled with books and one-on-one tutoring. This pawn was awkward, shy, and naive to the true nature of humanity.","skills":{"Plants":2,"Intellectual":2,"Artistic":2},"disabledWork":["Animals"],"requiredWork":[],"traits":{}},{"name":"LaborCampOrphan91","title":"labor camp orphan","titleShort":"orphan","desc":"This pawn lost their parents in an industrial accident and grew up in an orphans' labor camp. The camp overseers worked their charges mercilessly - but at least This pawn was clothed and fed.","skills":{"Construction":4,"Mining":4},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"LogicalChild2","title":"logical child","titleShort":"logic kid","desc":"This pawn preferred logical activities like computers and was completely useless at art.\nBeing awkward in social situations, their friends were few but close.","skills":{"Construction":2,"Intellectual":2,"Social":-2,"Crafting":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{"TooSmart":0}},{"name":"Machinist56","title":"machinist","titleShort":"machinist","desc":"This pawn had a knack for machinery. This pawn supplemented their family's income by repairing and modifying black market weapons.","skills":{"Crafting":3,"Intellectual":2,"Shooting":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MadScientist47","title":"mad scientist","titleShort":"scientist","desc":"This pawn grew up miserable on the plains of a rimworld. This pawn found the strength to fight under the teachings of an old, broken scientist.\nThis pawn quickly learned to play with people's fears, and was nicknamed 'mad scientist'.","skills":{"Intellectual":4,"Melee":1,"Social":2},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"MarineCadet73","title":"marine cadet","titleShort":"cadet","desc":"This pawn was in a planetary marine cadet program.\nThis pawn was kicked out for shooting an officer. It was never established whether this was an accident.","skills":{"Shooting":3,"Melee":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MechanoidHacker93","title":"mechanoid hacker","titleShort":"mechacker","desc":"The only son of a well respected mechanoid inventor, This pawn had access to the materials to subvert and modify their father's creations.\nThis pawn used drugs to increase their productivity. Unfortunately, the side-effects included persistent delusions of being mechanized, which limited their social life.","skills":{"Construction":3,"Intellectual":3,"Social":-3,"Crafting":3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{"DrugDesire":1}},{"name":"MechanoidNerd10","title":"mechanoid nerd","titleShort":"mechanerd","desc":"This pawn grew up in an urbworld as the only child of a pair of mechanoid designers.\nThey encouraged their interest in the machines. Eventually, This pawn became obsessed with building their own.\nUnfortunately this also lead to them being a loner as This pawn prefered technical books to friends.","skills":{"Construction":2,"Intellectual":3,"Social":-2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MedicalAssistant12","title":"medical assistant","titleShort":"medic","desc":"This pawn was born during a catastrophic war in which both sides used incendiary weapons. This pawn grew up helping their parents in an infirmary, treating the cascade of horrific burns from the battlefields. This pawn was left with a lifelong fear of fire.","skills":{"Medicine":5},"disabledWork":["Firefighting"],"requiredWork":[],"traits":{}},{"name":"MedicalHelper27","title":"medical helper","titleShort":"med helper","desc":"This pawn traveled between rimworlds with their family. This pawn's mother, a renowned doctor, often delivered lectures from the hull of their retrofitted cargo/medical ship.\nSometimes, the family took on difficult long-term medical work with especially needy patients, and This pawn helped where This pawn could.","skills":{"Social":2,"Medicine":4},"disabledWork":["Firefighting"],"requiredWork":[],"traits":{}},{"name":"MedicalStudent96","title":"medical student","titleShort":"student","desc":"This pawn grew up on a glitterworld in a family of doctors and chose to maintain the tradition.\nThis pawn had few friends, but got along with their siblings very well.","skills":{"Social":1,"Medicine":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MedicalStudent38","title":"medical student","titleShort":"student","desc":"Born into a long line of doctors, This pawn was tutored in all fields of medicine, from herbal ointments to the modern synthetic drugs. This pawn also picked up a healthy disdain for lower class work.","skills":{"Construction":-2,"Social":3,"Medicine":3},"disabledWork":["Hauling","Mining"],"requiredWork":[],"traits":{}},{"name":"MedievalLordling19","title":"medieval lordling","titleShort":"lordling","desc":"This pawn was a minor noble in an old kingdom on a medieval world. This pawn grew up in a manor made of stone, served by bowing lowerclassmen.\nSuch a life teaches no technical skills and instils a lifelong aversion to manual labor - but This pawn learned early the ways of social manipulation.","skills":{"Social":4,"Construction":-1,"Mining":-1,"Plants":-1},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"MedievalNomad12","title":"medieval nomad","titleShort":"nomad","desc":"Born to a nomadic family in a feudal society, This pawn was instructed in the arts of speechcraft, sleight of hand, horse riding.\n        This pawn was always running around the camp doing odd jobs to help their extended family.","skills":{"Social":2,"Cooking":2,"Animals":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MedievalPlower14","title":"medieval plower","titleShort":"plower","desc":"This pawn lived on a planet where kings and queens ruled with little regard for the peasants beneath them. their family owned a large farm, but the king took most of the food it produced. This left This pawn's family poor, and unable to pay for their education. Instead, This pawn was required to work the fields with their parents, and never had time to practice creativity.","skills":{"Construction":2,"Plants":5,"Intellectual":-1,"Artistic":-2},"disabledWork":[],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"MedievalSlave49","title":"medieval slave","titleShort":"slave","desc":"This pawn grew up pulling carts and digging holes on a medieval world. Simple manual labor is their oldest companion - along with the master's lash.\nThis pawn didn't learn to read until age nine.","skills":{"Plants":2,"Construction":2,"Mining":2,"Intellectual":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MedievalSlave50","title":"medieval slave","titleShort":"slave","desc":"Born into slavery, This pawn never knew their parents. This pawn eventually escaped from their masters and boarded a military cargo ship, where This pawn was pressed into military service.","skills":{"Construction":2,"Plants":3,"Mining":1,"Cooking":2,"Artistic":-2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"MedievalSquire5","title":"medieval squire","titleShort":"squire","desc":"This pawn grew up on a medieval planet as a knight in training. This pawn trained directly under the king's war adviser for most of their youth, and learned to fight with a sword and shield.","skills":{"Construction":-1,"Mining":-1,"Shooting":3,"Melee":5},"disabledWork":["Cooking","PlantWork"],"requiredWork":[],"traits":{}},{"name":"MedievalThief74","title":"medieval thief","titleShort":"thief","desc":"This pawn grew up poor and hungry on a medieval planet, learning to fend for themself.\nAt first, This pawn only took what This pawn needed. Then This pawn learned to take what This pawn wanted.","skills":{"Shooting":-3,"Melee":4,"Social":-2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MercenaryRecruit36","title":"mercenary recruit","titleShort":"mercenary","desc":"Descended from a long line of mercenaries, This pawn grew up in a busy trading hub.\ntheir interest in the foreign goods at the market often distracted them from their chores and training.","skills":{"Shooting":3,"Melee":1,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MercenaryRecruit18","title":"mercenary recruit","titleShort":"recruit","desc":"Born to a long line of off-world mercenaries, This pawn grew up in a busy trading hub. At a young age, This pawn was recruited into one of the mercenary crews.","skills":{"Shooting":3,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MidworldCadet83","title":"midworld cadet","titleShort":"cadet","desc":"Growing up on a high-tech midworld with a flourishing space transit industry, This pawn wished to leave for the stars and live among the growing spacer class.\nThis pawn excelled in their studies, and gained entry to their homeworld's most prestigious naval academy.","skills":{"Intellectual":3,"Social":3,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MidworldGeek18","title":"midworld geek","titleShort":"geek","desc":"This pawn grew up in a quiet suburban neighborhood. This pawn was never a master of social interaction, but their interest in computers blossomed into a true talent at an early age.","skills":{"Intellectual":6,"Social":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MidworldLoner80","title":"midworld loner","titleShort":"loner","desc":"This pawn was born on a peaceful, unimportant midworld.\nWhile This pawn had a few friends, This pawn preferred to spend their time in solitude, tinkering on their autocycle while listening to netcasts, or plinking at plastic soldiers with a new rifle This pawn had just put together.","skills":{"Construction":3,"Shooting":3,"Social":-2,"Crafting":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MidworldSketcher71","title":"midworld sketcher","titleShort":"sketcher","desc":"This pawn was born into a loving but poor family.\nThis pawn discovered This pawn had an artistic talent which This pawn inherited from their father. their mother taught them the benefits of hard work and determination. As This pawn grew older, This pawn developed a fascination with technology and military history.","skills":{"Shooting":2,"Melee":1,"Artistic":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MilitantChild49","title":"militant child","titleShort":"soldier","desc":"This pawn's military family forced them to train in hand-to-hand combat and fighting tactics.\nIn their own time, This pawn built small inventions. This sharpened their mind.","skills":{"Intellectual":2,"Shooting":3,"Melee":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MilitaryCadet16","title":"military cadet","titleShort":"cadet","desc":"Orphaned as a child, This pawn was sent to a secret military school on a harsh deadworld.\nTaking quickly to firearms and survival training, This pawn graduated with honor, transitioning into a leadership position in covert operations.","skills":{"Plants":-2,"Mining":2,"Shooting":3,"Melee":2,"Medicine":2,"Animals":-3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"MilitaryCadet46","title":"military cadet","titleShort":"cadet","desc":"This pawn was levied from their family at a young age to become a soldier. This pawn lived in barracks with other military kids, learning about duty, weapons, pain, and victory.\nThe trainers sometimes let the kids escape the base to enjoy the wider world. They wanted soldiers who can think independently.","skills":{"Shooting":4,"Melee":3},"disabledWork":["Animals","PlantWork"],"requiredWork":[],"traits":{}},{"name":"MilitaryChild82","title":"military child","titleShort":"military","desc":"This pawn grew up in a family with a rich military background. their teenage years were spent traveling system to system wherever their parents were deployed.\nFollowing the tradition of their family, This pawn enlisted at the earliest possible age.","skills":{"Construction":2,"Shooting":3,"Melee":1,"Medicine":2,"Artistic":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MilitaryRecruit49","title":"military recruit","titleShort":"recruit","desc":"This pawn was born on a midworld run by an intensely militaristic dictatorship.\nFrom a young age, This pawn was trained to be a good soldier. They taught them how to use a gun and how to fight with melee weapons.","skills":{"Shooting":4,"Melee":3},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"MilitaryTrainee20","title":"military trainee","titleShort":"trainee","desc":"This pawn was raised on a military base in the Xennoa system. This pawn was exposed to many different strenuous activities and grew strong at an early age. This pawn also learned negotiation, medical, and military tactics.","skills":{"Shooting":3,"Melee":2,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MusicIdol50","title":"music idol","titleShort":"music idol","desc":"This pawn was the only child of a powerful company president. their beautiful appearance led to a career as a music idol.\nWhen their mother died, This pawn could not bear their father's loneliness, and became his sexual companion.","skills":{"Intellectual":2,"Mining":-2,"Melee":-2,"Social":3,"Artistic":2},"disabledWork":[],"requiredWork":[],"traits":{"Beauty":2}},{"name":"MusicalKid86","title":"musical kid","titleShort":"musician","desc":"As a child, This pawn had a talent for playing musical instruments and singing. This pawn was given expert training and loved to perform in recitals and concerts, though the lavish praise This pawn received made them a little self-obsessed.","skills":{"Social":-2,"Artistic":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Mute34","title":"mute","titleShort":"mute","desc":"This pawn was greatly affected by a traumatic event early in their life. For many years This pawn refused to speak to people, preferring instead to play with their household's numerous pets.","skills":{"Animals":5},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"Naturalist14","title":"naturalist","titleShort":"naturalist","desc":"This pawn grew up on a backwater planet with minimal education. This pawn had to hunt and grow food to survive.\ntheir family's home was frequently raided for food by scavengers. This made This pawn very suspicious and slow to trust anyone This pawn doesn't know.","skills":{"Plants":3,"Melee":2,"Cooking":2},"disabledWork":["Social","Intellectual"],"requiredWork":[],"traits":{}},{"name":"NavyPathfinder53","title":"navy pathfinder","titleShort":"pathfinder","desc":"This pawn was raised and trained by a group of military explorers dedicated to charting pathways through deep space and on remote planets.","skills":{"Intellectual":3,"Shooting":2,"Social":3,"Cooking":-2,"Animals":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Nerd92","title":"nerd","titleShort":"nerd","desc":"This pawn was curious about everything. While other kids played tag in the suburbs of their industrial city, This pawn read every book This pawn could find about technology, robots, and weapons - whatever looked coolest.\ntheir strong French accent kept them from making real friends.","skills":{"Construction":1,"Intellectual":4,"Medicine":2,"Crafting":2},"disabledWork":["Social"],"requiredWork":[],"traits":{"AnnoyingVoice":0}},{"name":"NewAgeDuelist27","title":"new age duelist","titleShort":"duelist","desc":"This pawn was fascinated with combat. their parents traveled often, so This pawn was able to sample many different fighting styles, from 76th-wave jujutsu to the infamous 'urbworld-style' karate.\nA polite child, most fighters accepted their requests for training - but moving around often without finishing a tutelage made them lazy.","skills":{"Shooting":-2,"Melee":4,"Animals":-2},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{"Industriousness":-1}},{"name":"NobleWard61","title":"noble ward","titleShort":"ward","desc":"This pawn was adopted by a prominent noble family after being left on their doorstep by their mother.\nThis pawn quickly learned secrets that passed between the nobles like cheap wine - of worlds beyond their own, languages, cultures and technologies both new and old.","skills":{"Intellectual":4,"Shooting":-1,"Melee":-2,"Social":3},"disabledWork":["ManualDumb","Firefighting","PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"OfficerCadet25","title":"officer cadet","titleShort":"cadet","desc":"From a young age, This pawn trained to be a leader of men. This pawn enrolled in the Vanu Defense College when This pawn was a boy and became proficient with a range of weapons and survival techniques.","skills":{"Plants":1,"Shooting":3,"Melee":3,"Social":1,"Medicine":1},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"OffworldRecruit91","title":"offworld recruit","titleShort":"recruit","desc":"This pawn was born an raised in an offworld soldier growth facility. From a very young age, This pawn was taught close-quarters combat tactics, aggression, and how to survive on distant planets.\nOne of the best, This pawn was eventually chose to enter the orbital-deployment shock troop corps.","skills":{"Shooting":2,"Melee":2,"Medicine":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"OptimisticChild30","title":"optimistic child","titleShort":"optimistic","desc":"This pawn was blessed with loving parents and a pleasant midworld life. This pawn was an  optimistic and sociable kid who loved making friends and listening to their stories. their imagination would run wild with ideas and questions.","skills":{"Social":4},"disabledWork":[],"requiredWork":[],"traits":{"NaturalMood":1}},{"name":"OrganFarm67","title":"organ farm","titleShort":"organ farm","desc":"This pawn was raised in an illegal underground organ farm. their body was used to grow organic implants for wounded mercenaries. Though their upbringing has left them haunted, it has also given them a unique understanding of human biology.","skills":{"Medicine":5},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"Orphan15","title":"orphan","titleShort":"orphan","desc":"Born on a deep space station, This pawn was orphaned at a young age. In the orphanage, This pawn stood up for the weaker kids and fought off the bullies.","skills":{"Melee":4,"Medicine":2},"disabledWork":["Crafting"],"requiredWork":[],"traits":{"Kind":0}},{"name":"Orphan25","title":"orphan","titleShort":"orphan","desc":"Left alone in the world without parents, This pawn did the best This pawn could to adapt.\nHaving to take care both of themself and younger kids at the orphanage, This pawn learned a lot about humans and how to interact with them.","skills":{"Social":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Orphan11","title":"orphan","titleShort":"orphan","desc":"Born in a brothel on a harsh world, This pawn never really had a childhood. This pawn did odd jobs to survive, and became distant from others.","skills":{"Construction":2,"Cooking":2,"Crafting":2},"disabledWork":["Social","Animals"],"requiredWork":[],"traits":{}},{"name":"OrphanOfWar60","title":"orphan of war","titleShort":"orphan","desc":"This pawn lost their family and home early in life. their life became emotionally hollow, but their painful memories drove them to survive.\nThis pawn took several jobs, but never achieved more than a basic education.","skills":{"Construction":3,"Intellectual":-3,"Mining":3,"Cooking":3},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"OrphanedAcrobat84","title":"orphaned acrobat","titleShort":"acrobat","desc":"Born a quiet urbworld orphan, This pawn was invited to join a traveling circus. their small size and observant nature helped This pawn become a noted acrobat.\nUnfortunately, their violent tendencies brought their acrobatic career to an early end.","skills":{"Melee":2,"Social":3,"Animals":1},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"Pampered87","title":"pampered","titleShort":"pampered","desc":"Born on a decadent glitterworld, This pawn was given every expensive toy.\nThis pampered lifestyle caused them to miss many basic life lessons. This pawn developed a special aversion to cooking, and always ordered the staff to do the kitchen work.","skills":{"Intellectual":2,"Melee":-3,"Social":3,"Medicine":3},"disabledWork":["Cooking"],"requiredWork":[],"traits":{}},{"name":"PamperedLordling37","title":"pampered lordling","titleShort":"pampered","desc":"This pawn's parents did not want another heir. Fearing a succession fight, they decided to neutralize them early.\nThey pampered This pawn from birth, preventing them from developing the grit or knowledge necessary to be a threat to their favored son. This pawn learned little more than how to manipulate the royal staff to get more food.","skills":{"Social":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"PetKeeper7","title":"pet keeper","titleShort":"pet keeper","desc":"This pawn spent most of their childhood tending the animals This pawn had bought or rescued.\nThis pawn saw beauty in natural things more than fabricated objects, and chose the company of their animals over that of their peers.","skills":{"Medicine":1,"Animals":6},"disabledWork":["Social","Artistic"],"requiredWork":[],"traits":{}},{"name":"Philosopher82","title":"philosopher","titleShort":"thinker","desc":"This pawn was a student on a glitterworld. This pawn had a hard time in school, since the other kids thought them rather strange.\nThis pawn always maintained a distance from these events, being continuously surprised by the many interesting and awkward ways life can go.","skills":{"Intellectual":4,"Social":3},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"Pickpocket82","title":"pickpocket","titleShort":"pickpocket","desc":"Orphaned and abandoned on the tumultuous streets of their polluted, teeming homeworld, This pawn survived by deft hand and fleet foot. A natural born thief and trickster, This pawn rose to prominence early, running the notorious and violent urchin gang 'Doomben Rats'.","skills":{"Melee":2,"Social":2,"Artistic":2},"disabledWork":["Cleaning","PlantWork"],"requiredWork":[],"traits":{"Nimble":0}},{"name":"Pickpocket61","title":"pickpocket","titleShort":"thief","desc":"At a young age, This pawn witnessed their parents' murder. With no guidance, This pawn had to fend for themself. Joining a small group of misfits, This pawn did whatever was necessary to survive.","skills":{"Intellectual":-2,"Melee":3,"Social":-1,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"PilotFan16","title":"pilot fan","titleShort":"pilot fan","desc":"This pawn's father was a starfighter pilot, and This pawn always idolized the old man.\nFrom a young age, This pawn collected pilot memorabilia and studied pilot books, preparing to join the deep space navy and follow in their father's footsteps.","skills":{"Intellectual":3,"Shooting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"PitGladiator19","title":"pit gladiator","titleShort":"gladiator","desc":"This pawn was enslaved as a child and forced to fight creatures and other people in an underground fighting arena.\nThis pawn showed an affinity for the sport, and eventually bought their own freedom. However, their time in the pits never brought them much intellectual stimulation.","skills":{"Shooting":4,"Melee":4},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"PizzaLover94","title":"pizza lover","titleShort":"pizza kid","desc":"This pawn loved boomrat pizza intensely. Rarely eating anything else, This pawn was prone to bad health and low oxygen uptake.\nThis pawn loved bashing in the skulls of random creatures to see what was inside.","skills":{"Melee":5,"Cooking":3},"disabledWork":["Caring"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"PlagueChild44","title":"plague child","titleShort":"child","desc":"Born on a world wracked by plague, both of This pawn's parents were doctors. \nThis pawn was raised in reverse-quarantine, under the Hippocratic oath. This pawn experienced little social interaction. However, This pawn gained a lot of medical experience assisting in treatments.","skills":{"Intellectual":1,"Social":-3,"Medicine":5},"disabledWork":["Violent","Animals","Artistic","Cooking"],"requiredWork":[],"traits":{}},{"name":"PlagueProdigy12","title":"plague prodigy","titleShort":"prodigy","desc":"This pawn's childhood was cut short when a mysterious plague hit their homeworld.\nThis pawn watched their friends die, and their compassion for humanity died with them. In its place a new thirst for knowledge emerged.","skills":{"Construction":2,"Intellectual":4,"Social":-2},"disabledWork":["Caring","Artistic"],"requiredWork":[],"traits":{}},{"name":"PlagueSurvivor39","title":"plague survivor","titleShort":"survivor","desc":"This pawn watched as a mysterious plague spread through their town, killing their family and friends.\nThis pawn learned some medicine from watching the plague doctors, but was mentally scarred by the ordeal.","skills":{"Social":-2,"Cooking":2,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{"Nerves":-1}},{"name":"PoliticalCaptive7","title":"political captive","titleShort":"captive","desc":"This pawn was kidnapped by a rival family and held for ransom. To pass the time in captivity, This pawn read books and practiced martial arts. This pawn had few opportunities to develop their social skills.","skills":{"Melee":3,"Intellectual":3},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"PoorKid18","title":"poor kid","titleShort":"poor kid","desc":"Abandoned by their parents, This pawn learned how to survive by themself before This pawn was ten years old.","skills":{"Melee":4,"Social":1},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"PowerMadScholar30","title":"power-mad scholar","titleShort":"scholar","desc":"\"Knowledge is power.\" These words sparked something within This pawn, and came to form their core drive. When not entombed within libraries, This pawn would take things apart to see first-hand how they worked, with little regard for the border between mechanical and organic.","skills":{"Construction":2,"Intellectual":3,"Social":-3,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{"FastLearner":0}},{"name":"PrivilegedChild86","title":"privileged child","titleShort":"privileged","desc":"Born to an upper-class family, This pawn grew up with all the best things - the best education, the best social contacts, and of course the best technology money could buy.\nUnfortunately, living in such decadence left This pawn rather spoiled when it came to labor.","skills":{"Social":3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"PrivilegedProdigy70","title":"privileged prodigy","titleShort":"prodigy","desc":"This pawn was recognized as gifted early in their glitterworld upbringing. Luckily, their family was in a position to cultivate that genius through advanced education. their training included science, leadership, and the arts.","skills":{"Intellectual":2,"Medicine":1,"Artistic":2},"disabledWork":["ManualDumb","Violent","Hauling","PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"ProdigalStudent67","title":"prodigal student","titleShort":"student","desc":"This pawn was a faithful student, and was dedicated to learning anything and everything This pawn could about humanity and its creations.\nWhile This pawn was shunned as a nerd, This pawn didn't mind. This pawn hoped for a brighter future.","skills":{"Intellectual":3,"Crafting":2},"disabledWork":["Animals"],"requiredWork":[],"traits":{}},{"name":"ProfessionalGamer76","title":"professional gamer","titleShort":"pro gamer","desc":"This pawn was obsessed with video games since their hands were big enough to grip a joystick.\nThis pawn achieved middling finishes in several local tournaments during the 16-bit era. Nobody noticed when This pawn retired early in their teenage years.","skills":{"Shooting":4,"Melee":-3,"Crafting":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"ProjectSubject99","title":"project subject","titleShort":"subject","desc":"This pawn was picked by government agents for the mysterious \"Frame Project\".\nDue to memory blockages, however, This pawn remembers very little about this project or its true agenda - only that there were few survivors.","skills":{"Shooting":4,"Melee":4},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"PsychologyStudent15","title":"psychology student","titleShort":"student","desc":"This pawn researched new religions and traditions and often dreamt of distant stars. \ntheir dreams prompted them to ask what lay beyond the lights in the sky.","skills":{"Social":-3,"Artistic":4},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"Punk30","title":"punk","titleShort":"punk","desc":"This pawn spent their childhood selling knockoff cigarettes to 15-year-olds. The cigarettes were often full of grass clippings.","skills":{"Intellectual":-2,"Social":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"PyroAssistant82","title":"pyro assistant","titleShort":"assistant","desc":"On an industrial world, This pawn learned early that if This pawn wanted to eat, This pawn had to work. So work This pawn did. Kids fit in places adults can't, and where This pawn was from, the safety laws were quite flexible.\nThis pawn was always a bit of a pyromaniac, and was banned from the kitchen after an unfortunate incident.","skills":{"Construction":4,"Medicine":3},"disabledWork":["Cooking","Firefighting"],"requiredWork":[],"traits":{"Pyromaniac":0}},{"name":"Pyromaniac18","title":"pyromaniac","titleShort":"pyro","desc":"From an early age, This pawn had an unhealthy fascination with fire. This pawn would set refuse heaps ablaze and become so entranced by the flames This pawn would absent-mindedly burn themself.\nOne day while playing with matches, This pawn carelessly burned down their home.","skills":{"Social":-3,"Cooking":-2,"Artistic":3},"disabledWork":["Firefighting"],"requiredWork":[],"traits":{"Pyromaniac":0}},{"name":"QuietNerd97","title":"quiet nerd","titleShort":"nerd","desc":"This pawn was raised by doting parents on a midworld. Instead of playing with other children, This pawn read books voraciously.\nThis pawn was not particularly rugged, and struggled with physical labor.","skills":{"Intellectual":2,"Social":-2,"Artistic":1,"Crafting":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"RangerChild57","title":"ranger child","titleShort":"ranger kid","desc":"This pawn was raised in a forest. their father taught them to hunt and live off the land, so that This pawn could live without the need of others when father died.\nAccustomed to manual labor and with an intuitive mind, This pawn could survive weeks alone.","skills":{"Mining":-2,"Shooting":2,"Cooking":2,"Animals":4},"disabledWork":["Firefighting","PlantWork"],"requiredWork":[],"traits":{}},{"name":"ReEducatedYouth23","title":"re-educated youth","titleShort":"reeducated","desc":"This pawn lived on a midworld where the government cared about the youth. \nThis pawn was one of the many children who were taken from their parents and forced into the new education programs.","skills":{"Social":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"RebelChild8","title":"rebel child","titleShort":"rebel","desc":"This pawn was born under authoritarian rule. Despite intense oppression from family and community, This pawn never gave up fighting for their dignity and their freedom.\nThis pawn was often put into hopeless situations where even family would try to terrorize them into propriety. This pawn learned to trust no one.","skills":{"Melee":2,"Social":3},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"RebelSlave14","title":"rebel slave","titleShort":"rebel","desc":"This pawn was born into corporate slavery and raised to perform menial tasks for minimum pay. This pawn was just another cog in the machine. \nThis pawn found their freedom by joining a rebel organization whose goal was to break free from their corporate masters.","skills":{"Construction":1,"Plants":1,"Intellectual":-2,"Shooting":2,"Social":2,"Crafting":2},"disabledWork":["Artistic","Mining"],"requiredWork":[],"traits":{}},{"name":"RebelStudent14","title":"rebel student","titleShort":"student","desc":"This pawn grew up in a modest but privileged family who encouraged them to play chess and shoot skeet at a young age.\nAs a bored student, This pawn found joy in challenging their teachers about the contradictions between their planet's official values and their government's policies.","skills":{"Intellectual":3,"Shooting":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{"Abrasive":0}},{"name":"RebelWriter82","title":"rebel writer","titleShort":"writer","desc":"Early on, This pawn developed a talent for writing. This pawn was soon writing a popular online journal - anonymously, to hide their age - on topics ranging from bioethics to political theory and xenosociology.","skills":{"Intellectual":7},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"RebelliousStudent74","title":"rebellious student","titleShort":"student","desc":"This pawn had a shot at an education, but This pawn rebelled against the injustices This pawn saw and was expelled from three schools. This left them with a sense of integrity, but a lack of social skills.\n        This pawn sought self-actualization. This pawn spent their days meditating and practicing katana and staff fighting techniques.","skills":{"Intellectual":2,"Melee":4,"Social":-3,"Artistic":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ReclusiveChild81","title":"reclusive child","titleShort":"reclusive","desc":"This pawn didn't learn to speak until This pawn was nearly five years old. Even then This pawn preferred to keep to themself.\nTo the chagrin of their caretakers, This pawn made a habit of wandering off to live in the wilderness for weeks at a time.","skills":{"Melee":4,"Crafting":3},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"ReclusiveProdigy96","title":"reclusive prodigy","titleShort":"prodigy","desc":"Growing up on a flourishing glitterworld afforded This pawn the chance to fully devote themself to their studies.\nHaving taken a keen interest in genetic modification and neural augmentation from a young age, This pawn had little time (or desire) for a regular childhood.","skills":{"Intellectual":4,"Medicine":4},"disabledWork":["Social","Artistic"],"requiredWork":[],"traits":{"TooSmart":0}},{"name":"RichBoy9","title":"rich boy","titleShort":"rich boy","desc":"This pawn grew up on a midworld with loving parents, a cute pet and a lot of money - but no friends.\nThis pawn was always told by their father that 'those peasants just want your money'. So, This pawn spent most of their time alone, or fighting other kids.","skills":{"Melee":3,"Artistic":3},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{}},{"name":"RichKid61","title":"rich kid","titleShort":"rich kid","desc":"This pawn came from a wealthy and influential bloodline. their expensive education included lessons on dueling, leadership, and military strategy.","skills":{"Melee":2,"Shooting":2,"Intellectual":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"RitualChild20","title":"ritual child","titleShort":"sacrifice","desc":"Born with a special mark on their neck, This pawn's tribe chose to sacrifice them in a blood ritual. They left them in the forest to die. A pack of arctic wolves found and adopted them.\nOver time, This pawn learned to make tools to hunt with the pack.","skills":{"Intellectual":-3,"Melee":3,"Crafting":3,"Animals":4},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"RoyalBastard64","title":"royal bastard","titleShort":"bastard","desc":"This pawn was the child of a lord and a prostitute.\ntheir father's line was secure and his holdings strong. Nobody ever came to This pawn to endorse a bid for the title. This pawn earned their bread cleaning the brothel, but always felt This pawn deserved much more.","skills":{"Social":2,"Artistic":2},"disabledWork":[],"requiredWork":[],"traits":{"Greedy":0}},{"name":"Scavenger22","title":"scavenger","titleShort":"scavenger","desc":"This pawn spent their childhood escaping grunt work to go digging through wrecks and ruins for treasures. their natural curiosity got them into a lot of trouble, but it also yielded many interesting finds.","skills":{"Mining":3,"Intellectual":3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"Scavenger62","title":"scavenger","titleShort":"scavenger","desc":"This pawn grew up in one of the few remaining cities on a world ravaged by nuclear war.\nThis pawn learned to survive on their own in this post-apocalyptic wasteland by scavenging for technology and supplies.","skills":{"Shooting":2,"Melee":2,"Social":-2,"Cooking":2},"disabledWork":["Intellectual","Artistic"],"requiredWork":[],"traits":{}},{"name":"SchoolyardOutcast11","title":"schoolyard outcast","titleShort":"outcast","desc":"This pawn had a modest but proper upbringing. Despite a good family background and plenty of support, This pawn struggled to make friends and was often bullied. This pawn learned to work or play alone, and avoided socializing to avoid conflict.\nWhen conflict did arise, This pawn would retaliate violently.","skills":{"Intellectual":2,"Melee":2,"Social":-3,"Artistic":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ScienceProdigy65","title":"science prodigy","titleShort":"prodigy","desc":"This pawn was top of their class in chemistry, physics, exobiology, astronomy and opera.\nAn unfortunate lab accident left them with a deathly fear of fire.","skills":{"Intellectual":3,"Medicine":3,"Artistic":2},"disabledWork":["Violent","Firefighting"],"requiredWork":[],"traits":{}},{"name":"Scout44","title":"scout","titleShort":"scout","desc":"Born to the administrators of a rimworld colony, This pawn was enrolled in a youth program that taught military scouting skills.\nThis pawn learned to survive in the wilderness, to obey, and not to ask questions.","skills":{"Shooting":3,"Crafting":2,"Construction":1},"disabledWork":["Artistic","Intellectual"],"requiredWork":[],"traits":{}},{"name":"Scout6","title":"scout","titleShort":"scout","desc":"This pawn loved being outdoors. their parents enrolled them in a program that taught military scouting skills. This pawn thrived when This pawn was left alone in the wilderness.\nUnfortunately, This pawn did not learn the basic technological skills that are taken for granted by many others.","skills":{"Construction":1,"Shooting":3,"Crafting":2},"disabledWork":["Intellectual","Artistic"],"requiredWork":[],"traits":{}},{"name":"Scrounger25","title":"scrounger","titleShort":"scrounger","desc":"This pawn would dive into junk mounds in search for valuables and items of interest.\nThis pawn was never bothered by the stink, or dangers that could leave them wounded for weeks.","skills":{"Mining":2,"Social":-2,"Crafting":2},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"SentimentalChild55","title":"sentimental child","titleShort":"nice kid","desc":"This pawn was a nice child. When anybody had a problem, This pawn tried to fix it. But, being a child, This pawn did not always succeed. This hurt their sensitive soul.\nThis pawn dreamed of being a soldier who fights raiders and aliens.","skills":{"Social":4},"disabledWork":[],"requiredWork":[],"traits":{"PsychicSensitivity":1}},{"name":"ServingBoy97","title":"serving boy","titleShort":"house boy","desc":"This pawn was the child of house servants, and was trained to carry on the family duty.\nThis pawn carried things and polished silverware, but was never allowed into the lords' part of the house.","skills":{"Cooking":2,"Construction":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SewerKid57","title":"sewer kid","titleShort":"sewer boy","desc":"This pawn grew up in the sludge-smeared sewers of a polluted industrial world.\nThis pawn befriended the strange insects in the darkness, and learned to love them.","skills":{"Cooking":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ShelterChild50","title":"shelter child","titleShort":"shelterkid","desc":"This pawn grew up in a shelter deep beneath a toxic world. This pawn received a comprehensive education, but had no opportunity to do physical labour.","skills":{"Intellectual":3,"Medicine":3,"Social":2,"Construction":-2,"Mining":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ShipBoy89","title":"ship boy","titleShort":"ship boy","desc":"This pawn was born to low-ranked servants on an ancient starship. The ship's machine persona was like a third parent to them, and the parts crafting crew This pawn worked for was like a second family.\nThis pawn rarely saw plants or animals, and still finds them unnerving to touch.","skills":{"Crafting":6},"disabledWork":["Animals","PlantWork"],"requiredWork":[],"traits":{}},{"name":"ShipChild46","title":"ship child","titleShort":"ship child","desc":"This pawn's family were space traders. One day, This pawn's cryptosleep pod failed in transit. This pawn had to spend years awake on the ship as the other slept.\nThis pawn filled their days creating beautiful contraptions from the ship's cargo - but This pawn didn't learn a lot of basic planetary living skills.","skills":{"Melee":-3,"Social":-3,"Artistic":4,"Crafting":4},"disabledWork":["Animals","Cooking","PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"ShipTechnician0","title":"ship technician","titleShort":"technician","desc":"This pawn was an apprentice technician on trade ships plying their routes between the stations and planets of their home system. In this job, This pawn learned to fix and improve many machines.\nSometimes, their ship was assigned to short exploratory jaunts into dangerous regions of space.","skills":{"Construction":3,"Plants":-3,"Intellectual":3,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ShipboundLordling12","title":"shipbound lordling","titleShort":"ship lord","desc":"This pawn's family held their power base on a grand, ancient starship. Born and raised on the ship, This pawn learned all about the rigors of shipboard life, and the politics and methods of interstellar battle and orbital invasion.\nThis pawn learned to feel most at home with strong walls close on all sides and the gentle hiss of atmosphere regulators.","skills":{"Shooting":2,"Construction":2},"disabledWork":[],"requiredWork":[],"traits":{"Undergrounder":0}},{"name":"ShootingComa59","title":"shooting coma","titleShort":"coma child","desc":"This pawn fell into a coma at a young age and spent years dreaming about shooting. When This pawn awoke, This pawn was useless at most tasks - but This pawn could aim pretty well.","skills":{"Shooting":8},"disabledWork":["ManualDumb","ManualSkilled","Intellectual","Artistic"],"requiredWork":[],"traits":{}},{"name":"ShopKid36","title":"shop kid","titleShort":"shopkid","desc":"This pawn's mother was often ill, and it fell to them to run the store which was their only source of income. This pawn learned a little about the exotic artifacts which This pawn sold, and a lot about the art of the deal.","skills":{"Social":4,"Intellectual":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ShunnedGirl30","title":"shunned girl","titleShort":"shunned","desc":"Freya was born into a small, poor family. She was bullied relentlessly, beaten and hated. As she grew up she developed an   interest in guns. She usually studied from books, but occasionally managed to get some practice time with the real thing. Freya later   discovered a talent for art and began to teach herself how to draw and paint.","skills":{"Shooting":2,"Social":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SicklyChild55","title":"sickly child","titleShort":"patient","desc":"As a child, This pawn suffered from a rare disease. Quarantined in a hospital, This pawn had minimal human contact and got little physical exercise. In the sterile hospital environment, however, This pawn became very familiar with science and medicine.","skills":{"Intellectual":4,"Medicine":5,"Melee":-2,"Social":-2,"Construction":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SicklyLiar3","title":"sickly liar","titleShort":"liar","desc":"It is not uncommon for a sickly child to be cast away. What is uncommon is for that child to survive and even thrive with such a weak body.\nUsing their quick wit and silver tongue, This pawn was able to get out of almost any situation - most of the time at the cost others around him.","skills":{"Construction":-2,"Shooting":-2,"Melee":-2,"Social":6},"disabledWork":["Caring"],"requiredWork":[],"traits":{"Immunity":-1}},{"name":"SlaveFarmer99","title":"slave farmer","titleShort":"slave","desc":"Abandoned as a little girl, This pawn was found by a farmer. Being infertile themself, the farmer kept them as a slave. The constant beatings left them scarred and unable to handle violence. After many years, This pawn ran away.","skills":{"Plants":4},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"SmallTownKid41","title":"small town kid","titleShort":"town kid","desc":"This pawn grew up in an isolated midworld village, surrounded by opticows and countryside.\ntheir parents taught them a wide range of useful domestic skills, but a peaceful and secure childhood left them with little understanding of the harder parts of life.","skills":{"Construction":-3,"Plants":3,"Mining":-3,"Cooking":3,"Medicine":3,"Animals":3},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"SocialPariah3","title":"social pariah","titleShort":"pariah","desc":"This pawn's family never fit in. They were oddballs who couldn't conform to their regimented society. Because of this, they were forced into cryptosleep and sent to different rimworlds, never to see each other again.","skills":{"Crafting":2,"Animals":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SoldierExperiment50","title":"soldier experiment","titleShort":"experiment","desc":"This pawn grew up believing This pawn was a normal, albeit slightly sheltered child.\nIn truth, This pawn was part of an elaborate experiment. Researchers were conditioning them using social interactions and mechanite injections to try to produce an elite soldier.","skills":{"Shooting":3,"Melee":3,"Social":-3,"Medicine":2},"disabledWork":["Cooking","Cleaning"],"requiredWork":[],"traits":{}},{"name":"SoldiersKid55","title":"soldier's kid","titleShort":"soldier kid","desc":"This pawn was raised on the ancient starship where their parents were stationed. This pawn learned the basics of firearm operations and maintenance from the soldiers on board. This pawn became accustomed to a strict routine and frequent discipline.","skills":{"Shooting":4,"Melee":2},"disabledWork":["Animals","PlantWork"],"requiredWork":["Violent"],"traits":{"Neurotic":1}},{"name":"SoleSurvivor21","title":"sole survivor","titleShort":"survivor","desc":"This pawn's entire tribe was wiped out in a raid. Though This pawn was adopted by another group, This pawn was emotionally scarred, and preferred to stay near home, cooking and tending crops.","skills":{"Plants":3,"Cooking":3},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"SoleSurvivor63","title":"sole survivor","titleShort":"survivor","desc":"This pawn's entire tribe was wiped out by a mysterious disease.\nFound alone and adopted by another band, This pawn never became close with the other tribe members. This pawn preferred to stay away from their new home, wandering the woods and tending the animals.","skills":{"Plants":2,"Shooting":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SonOfAHuntress75","title":"son of a huntress","titleShort":"hunter","desc":"In the mountains of the planet Ticonderoga, This pawn was raised by their tribal mother. She taught them survival skills - trapping, tracking, shooting, skinning, cooking and healing.\ntheir departed father had left behind an old bolt-action rifle, and This pawn practiced with it every chance This pawn got.","skills":{"Shooting":2,"Melee":2,"Cooking":2,"Medicine":1,"Crafting":1},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"SpaceCadet77","title":"space cadet","titleShort":"cadet","desc":"Growing up on a rural farm-world leaves little opportunity for excitement and adventure, so when the Royal Fleet began a recruiting program on their home planet, This pawn threw down their hoe and cattle prod to took up arms for the crown.\nThis pawn served on the interplanetary super-destroyer HMS Thunder-Child.","skills":{"Shooting":4,"Melee":2},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"SpaceFanboy22","title":"space fanboy","titleShort":"fanboy","desc":"This pawn dreamed of space travel. This pawn built their own pretend spaceship from an old police box and went to see the great unknown.","skills":{"Intellectual":2,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SpaceNerd97","title":"space nerd","titleShort":"space nerd","desc":"This pawn just wanted to be cool like their favorite superhero All-Might. This pawn dreamed of going on space adventures and exploring new worlds. This pawn also dreamed of chocolate... space chocolate.","skills":{"Intellectual":4,"Social":-3,"Cooking":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SpaceSmuggler6","title":"space smuggler","titleShort":"smuggler","desc":"This pawn's parents used them to help smuggle contraband between a cluster of rimworlds.\nAided by their small size, This pawn became very adept at carrying out their parents' missions, learning weaponry, negotiations, and most of all smuggling.","skills":{"Plants":-2,"Intellectual":-2,"Shooting":3,"Melee":3,"Social":3,"Medicine":2,"Artistic":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SpacerOrphan77","title":"spacer orphan","titleShort":"orphan","desc":"Born among stars to a spacefaring family, the This pawn was the only survivor when their family's ship was destroyed.\nThis pawn was forced to find a way to survive, and seek the joy of knowing another family.","skills":{"Shooting":2,"Melee":4,"Crafting":2},"disabledWork":["Artistic","Mining"],"requiredWork":[],"traits":{}},{"name":"SpaceyachtPilot89","title":"spaceyacht pilot","titleShort":"pilot","desc":"This pawn ferried wealthy businessmen and politicians to and from their home world.\n        Witnessing the depths of hedonism these people descended to changed them in ways not even This pawn understood.","skills":{"Melee":2,"Social":4},"disabledWork":["Cooking"],"requiredWork":[],"traits":{}},{"name":"SpeederRacer71","title":"speeder racer","titleShort":"racer","desc":"This pawn was the son of a fern farmer in the towering forests of Khalderia.\nThis pawn found their first love in speeder racing, zipping in and out of the massive canopies and gorgeous vistas of their homeworld. The seedy underworld of racing also forced them to learn to defend themself with a quick word or a quicker shot.","skills":{"Shooting":3,"Social":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SpoiledBrat59","title":"spoiled brat","titleShort":"brat","desc":"Born in a rich family, This pawn was given everything, and never developed basic work ethic or the foundations of a non-dependent personality.\nThis pawn was expected to become one of the best doctors in the world.","skills":{"Medicine":2},"disabledWork":["ManualSkilled","Social","Intellectual","Cooking"],"requiredWork":[],"traits":{}},{"name":"SpoiledChild33","title":"spoiled child","titleShort":"spoiled","desc":"This pawn grew up the child of an industrious colony manager. In this position, most manual and dangerous tasks were forbidden by their parents, but on the rim everyone has to dirty their hands.","skills":{"Construction":-2,"Plants":2,"Mining":-2,"Social":2,"Cooking":2,"Artistic":2},"disabledWork":["Firefighting"],"requiredWork":[],"traits":{}},{"name":"SpoiledChild80","title":"spoiled child","titleShort":"spoiled","desc":"This pawn was the child of an industrious space engineer. their parents forbade most manual and dangerous tasks, so This pawn learned art and music instead.\nThis pawn loved animals, but their parents never let them have a pet - though This pawn played with other people's pets a lot.","skills":{"Intellectual":3,"Artistic":2,"Animals":3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"Stableboy49","title":"stableboy","titleShort":"stableboy","desc":"This pawn was a stableboy on a medieval planet, mucking dung almost every day to earn their keep.\nBy the time This pawn was exiting childhood, This pawn had saved up enough money to pay a space trader to take them offworld.","skills":{"Mining":2,"Melee":2,"Artistic":2,"Crafting":1},"disabledWork":["Social"],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"StarSquire9","title":"star squire","titleShort":"squire","desc":"Born on a medieval world, This pawn's first memory is of gazing up into the night's sky. \nEver since, This pawn dreamed of squiring for a knight amidst the star-filled heavens. their focus on that vision left them somewhat single-minded.","skills":{"Shooting":2,"Melee":3},"disabledWork":["Animals","Artistic"],"requiredWork":[],"traits":{}},{"name":"StarforceCadet79","title":"starforce cadet","titleShort":"cadet","desc":"Raised on Amen-Ti, glitterworld capital of the Star Empire, [PAWN_nameFull] had an easy childhood.\nAs a youth, This pawn decided that joining the Starforce would be their way of giving back to the Empire.","skills":{"Intellectual":2,"Mining":-3,"Social":2,"Medicine":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"StationWhelp94","title":"station whelp","titleShort":"whelp","desc":"This pawn spent their childhood as a penniless orphan living on a space station. This pawn managed to scrape by doing filthy jobs and stealing. This pawn became so violent due to poor treatment by their \u201cbetters\u201d that This pawn was banished from the station, just to be picked up by space pirates.","skills":{"Shooting":3,"Melee":5},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{}},{"name":"SteamworldTinker38","title":"steamworld tinker","titleShort":"tinker","desc":"In the slums of a steamworld, This pawn developed a fascination with machines and contraptions. This pawn found This pawn preferred their company to that of other people.\ntheir remarkable dexterity earned them a steady stream of pocket change, and This pawn spent every penny on spare parts and tools to play with.","skills":{"Construction":4,"Social":-3,"Crafting":3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"StoryWriter67","title":"story writer","titleShort":"writer","desc":"As a child, This pawn was addicted to reading. This pawn would spend all day in their local library with their nose in a book. When budget cuts forced the library to close, This pawn was distraught. This pawn decided to fill the gap by writing their own stories instead.","skills":{"Artistic":4,"Intellectual":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Straggler71","title":"straggler","titleShort":"straggler","desc":"Despite being blessed with parental love, This pawn hardly knew their parents.\nThis pawn was frequently left to their own devices which meant more time devoted to exploring their interests\u2026and getting into trouble.","skills":{"Intellectual":-3,"Melee":2,"Artistic":2,"Crafting":2},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{}},{"name":"StreetChild4","title":"street child","titleShort":"street","desc":"This pawn's drug-addicted mother died, leaving them an orphan at a young age. To stay alive, This pawn resorted to theft, and when necessary, prostitution. When This pawn was caught stealing from a church, the priestess saw a wounded but smart child, and took them in to give them a second chance at life.","skills":{"Social":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"StreetKid19","title":"street kid","titleShort":"street kid","desc":"Growing up on the streets and fields of a rimworld, This pawn's their only friend was a dog named Rest. The pair scraped by, finding just enough food to survive.\nWhen This pawn was 13 years old, a criminal group took them under their wing.","skills":{"Melee":3,"Social":3},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"StreetPeddler66","title":"street peddler","titleShort":"peddler","desc":"Growing up on an industrial midworld where robberies and muggings weren't uncommon, This pawn helped support their family by making small trinkets and novelties to sell to passers-by.\nThis pawn learned early on that it wasn't always what This pawn knew, but who This pawn knew that would get them far in life.","skills":{"Melee":2,"Social":3,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"StreetRat81","title":"street rat","titleShort":"street rat","desc":"This pawn belonged to a gang of street thieves. their days were spent picking pockets, settling disputes over territory, or high on whatever drugs This pawn could get their hands on.","skills":{"Melee":5,"Intellectual":-1},"disabledWork":[],"requiredWork":["Violent"],"traits":{"DrugDesire":1}},{"name":"StreetUrchin45","title":"street urchin","titleShort":"street rat","desc":"Born to a poor family, This pawn was a sickly child who never quite developed the strength of their siblings.\ntheir parents, unable to afford to provide for them and certain This pawn couldn't pay their own way, threw them to the streets. This pawn learned hard and fast how to survive by any means necessary.","skills":{"Construction":2,"Intellectual":-2,"Mining":2,"Melee":3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{"Immunity":-1}},{"name":"StreetUrchin53","title":"street urchin","titleShort":"urchin","desc":"Born to a poor family on an urbworld, This pawn was abandoned on the streets at a young age.\nThis pawn learned to steal and kill to survive the ruthless streets, gaining skills in melee and ranged combat. There was little time for talk in their life.","skills":{"Shooting":3,"Melee":3},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"StreetUrchin74","title":"street urchin","titleShort":"grifter","desc":"After running away from home, This pawn had to live on the streets.\nThis pawn grew up fast, and learned early that This pawn had to figure out how to fool people into connecting with them.","skills":{"Construction":2,"Plants":-2,"Shooting":2,"Melee":3,"Social":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"Student65","title":"student","titleShort":"student","desc":"This pawn studied chemistry and quantum mechanics for entertainment.\nThis pawn was very good at convincing others to do their physical work, and made it a goal in life to avoid manual labor.","skills":{"Intellectual":3,"Mining":-2,"Social":2,"Medicine":3},"disabledWork":["Cleaning","Hauling"],"requiredWork":[],"traits":{}},{"name":"StudentEngineer34","title":"student engineer","titleShort":"engineer","desc":"A genius child, This pawn was put in a special training program covering aerospace warfare and engineering.\nOne day, This pawn tried to befriend a squirrel by giving it a bracelet. The squirrel bit them, earning them the nickname \u201cSquirrel {PAWN_gender ? Boy : Girl}\u201d.\nThis pawn came to believe that work involving manual labor is beneath them.","skills":{"Construction":2,"Intellectual":4,"Mining":-2,"Cooking":-2,"Artistic":-2,"Crafting":4},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"StudentSocialite89","title":"student socialite","titleShort":"socialite","desc":"This pawn learned politics in an elite training school for socially gifted students on Kalthas IV.\nWhile This pawn was naturally adept at reading and manipulating people, This pawn found no joy in it. This pawn left the academy several years before graduation.","skills":{"Social":6},"disabledWork":["ManualDumb","ManualSkilled","Caring","Artistic"],"requiredWork":[],"traits":{}},{"name":"SuperSoldier99","title":"super soldier","titleShort":"soldier","desc":"This pawn's government ran an experimental super-soldier development program. They kidnapped thousands of infants, conditioned their minds with drugs and machines, and trained them to fight.\nMost infants died, but This pawn did not. This pawn killed their first man at age six, and was fighting in field operations not long after.","skills":{"Plants":-3,"Shooting":3,"Melee":3,"Medicine":2},"disabledWork":["Social","Animals","Artistic"],"requiredWork":[],"traits":{}},{"name":"TechEnthusiast28","title":"tech enthusiast","titleShort":"tech nerd","desc":"This pawn had all the latest gadgets as a child. This pawn spent all their time playing games with AIs instead of with other children. This pawn always felt awkward around new people.","skills":{"Intellectual":4,"Shooting":4,"Social":-3},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"TechScholar75","title":"tech scholar","titleShort":"scholar","desc":"This pawn was a youth scholar of the world of science and technology.\nThis pawn strived every day to expand their intellectual abilities.","skills":{"Intellectual":5,"Cooking":-2,"Crafting":2},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{}},{"name":"TechHead8","title":"tech-head","titleShort":"tech-head","desc":"Standing on the ship hull with their father in an child-size EVA suit, This pawn loved space from a young age.\nThis pawn was put in a Civil Academics Program. While pretending to be like their father, This pawn spent their time taking care of plants in their messy room. their nickname was given for their love of circles.","skills":{"Plants":2,"Intellectual":6,"Social":-1},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"TechnicalKid1","title":"technical kid","titleShort":"tech kid","desc":"This pawn loved nothing more then to forget the world around them and focus on the task at hand.","skills":{"Construction":2,"Medicine":3,"Crafting":2,"Animals":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"TestSubject15","title":"test subject","titleShort":"testee","desc":"On the most corrupt urbworlds, scientists without a moral compass commit unspeakable atrocities in the name of research. This pawn was kept alone in a sealed facility from birth and subjected to a variety of behavioural experiments in an attempt to turn them into a perfect super-soldier.","skills":{"Shooting":4},"disabledWork":["Social","Caring","Firefighting"],"requiredWork":[],"traits":{}},{"name":"TestSubject82","title":"test subject","titleShort":"subject","desc":"Test subject #11,529,914 of experiment #56,048 spent their childhood in white rooms performing mental and physical tests.\ntheir only companion was a voice that called itself Mother. Mother rewarded success with praise - and failure with harsh punishment.","skills":{"Intellectual":2,"Melee":2,"Cooking":1},"disabledWork":["Social","PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"Tinkerer79","title":"tinkerer","titleShort":"tinkerer","desc":"This pawn grew up on a scrap-heap of a planet - the garbage dump of other planets in the system. This pawn learned to make new machines from the dead parts of old ones. With some friends, This pawn eventually escaped on a salvaged and repaired ship.","skills":{"Construction":2,"Crafting":4},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"Tinkerer11","title":"tinkerer","titleShort":"tinkerer","desc":"This pawn spent their spare time creating things from their imagination out of scrap metal and discarded machinery.\nThis pawn created simple robots and small tools, for both for fun and for utility.","skills":{"Intellectual":3,"Melee":-2,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ToxicChild96","title":"toxic child","titleShort":"toxic","desc":"Growing up on a an industrial planet, This pawn started working in a chemical plant at age of six. Years of exposure to industrial toxins left them mentally scarred.\nThis pawn eventually blew up the facility and escaped the planet in a stolen cargo ship.","skills":{"Construction":3,"Crafting":3},"disabledWork":["Firefighting","PlantWork"],"requiredWork":[],"traits":{"Nerves":-1}},{"name":"TradersChild62","title":"traders' child","titleShort":"trader","desc":"This pawn grew up in a family of nomadic traders, making a living from selling and buying goods on many worlds.\nThis pawn learned the customs and methods of trade of many cultures by participating in their parents' business.","skills":{"Construction":-2,"Plants":-1,"Social":1,"Crafting":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"TragicLoner87","title":"tragic loner","titleShort":"loner","desc":"This pawn was involved in a traumatic accident that resulted in them killing their own family.\nCast out from society, This pawn was left with only their animal companions and several engineering textbooks to keep them company.","skills":{"Intellectual":4,"Artistic":-2,"Animals":2},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"TraineeAlchemist64","title":"trainee alchemist","titleShort":"alchemist","desc":"This pawn grew up on a medieval world. This pawn learned the basics of alchemy and medicine in one the few monastic schools on their planet.","skills":{"Intellectual":3,"Cooking":4,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"TransferStudent10","title":"transfer student","titleShort":"student","desc":"A midworld child, This pawn's wealthy parents sent them to a nearby glitterworld to receive a better education.\nThis pawn was a talented student. However, due to their family's wealth, This pawn never had to do dumb labor.","skills":{"Intellectual":3,"Social":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"TraumatizedYouth87","title":"traumatized youth","titleShort":"trauma","desc":"This pawn lived on a pleasant midworld.\ntheir body purist mother fell sick with heart disease. In desperation, This pawn's father abducted innocent people and harvested their hearts. This pawn's father was arrested, but the child remained scarred from the experience.","skills":{"Melee":2,"Medicine":4},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"TribalThunderer45","title":"tribal thunderer","titleShort":"thunderer","desc":"Years ago, This pawn's tribe stumbled upon an abandoned gun vault. Believing the weapons to be sacred gifts, the shaman would select a child born under superstitious circumstances and assign them the honour of bearing one to defend the village. This pawn is such a child.","skills":{"Shooting":5,"Medicine":2},"disabledWork":["Intellectual","Artistic","Crafting"],"requiredWork":[],"traits":{}},{"name":"TribeChild40","title":"tribe child","titleShort":"tribal","desc":"This pawn grew up in a tribe, running around the village, moving with the muffalo herds, learning essential skills from their parents.\nThis pawn never learned to read and never saw a machine that wasn't an ancient ruin.","skills":{"Plants":2,"Melee":2,"Shooting":2,"Intellectual":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"TurtleHerder41","title":"turtle herder","titleShort":"herder","desc":"Born to settler folk, This pawn's family had a beloved herd of turtles, who protected them by absorbing shots from raiders.\nAt a young age, This pawn was entrusted with the turtles. This pawn bred them, successfully - too successfully. The massive turtle herds consumed every food source and destroyed the local ecosystem.","skills":{"Shooting":2,"Social":1,"Artistic":-2,"Animals":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"UnwantedSurvivor67","title":"unwanted survivor","titleShort":"survivor","desc":"This pawn's noble family did not want them, but could not afford to be seen directly assassinating them either. They attempted to get them killed by assigning them dangerous training without proper protection at too young an age.\nAgainst all odds, This pawn survived the jousting contests, horsewar matches, riverrun competitions and warzones. In the end, it only made them stronger.","skills":{"Melee":3,"Shooting":2,"Cooking":2,"Medicine":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{"Tough":0,"Nerves":2}},{"name":"UpperUrbworlder12","title":"upper urbworlder","titleShort":"high urber","desc":"This pawn had a privileged childhood on a major urbworld. Living in an apartment far above the dense poverty of the city, This pawn spent most of their time reading or drawing the cityscape This pawn saw through their window.","skills":{"Construction":-3,"Intellectual":3,"Artistic":2,"Crafting":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"UrbanLordling82","title":"urban lordling","titleShort":"city lord","desc":"This pawn was born to a royal house with a grand manor in a great city. This pawn spent their youth in lessons on politics.\nWhenever This pawn could, This pawn would escape with their friends to explore the half-built substructure of the metropolis.","skills":{"Construction":3,"Social":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"UrbworldArmyBrat84","title":"urbworld army brat","titleShort":"army brat","desc":"This pawn grew up on an urbworld military base. This pawn was too young to fight, but This pawn learned to make themself useful in other ways.\nThis pawn became familiar with guns and military equipment, but never really got in touch with the natural world.","skills":{"Construction":3,"Plants":-3,"Shooting":3,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"UrbworldChild56","title":"urbworld child","titleShort":"urbkid","desc":"This pawn had an isolated upbringing on an urbworld. their hatred of heights kept them indoors often, and made them an introverted child.\nWhen This pawn did go out onto the catwalks of the city, This pawn enjoyed playing war games, becoming proficient with various simulation weapons.","skills":{"Plants":1,"Intellectual":1,"Shooting":3,"Artistic":1,"Crafting":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"UrbworldCriminal6","title":"urbworld criminal","titleShort":"criminal","desc":"Born into bad circumstance on an overpopulated urbworld, This pawn turned to small-time crime as a way to avoid starvation and hypothermia.\nRobbery and murder were daily activities for them. This pawn learned that surviving was winning.","skills":{"Shooting":2,"Melee":3,"Medicine":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"UrbworldHooligan12","title":"urbworld hooligan","titleShort":"hooligan","desc":"This pawn grew up in a dangerous urbworld. This pawn quickly learned how to get their daily meal - by crime. Such means left little to no space for cooking and growing activities.","skills":{"Shooting":2,"Melee":3,"Cooking":-3},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"UrbworldUrchin61","title":"urbworld urchin","titleShort":"urchin","desc":"The urbworlds - ancient and deep industrial cityscapes bursting with humanity and poison. This pawn grew up in the dark, unwanted reaches of such a place. This pawn had to fight for every scrap of food.","skills":{"Melee":4,"Shooting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"UrbworldUrchin90","title":"urbworld urchin","titleShort":"urchin","desc":"Abandoned among the filthy concrete spires, This pawn never knew their parents. This pawn never received formal education, and often resorted to doing menial labor in exchange for food. Sometimes This pawn lied, cheated, and stole to survive.","skills":{"Mining":4,"Melee":2},"disabledWork":["Artistic","Crafting"],"requiredWork":[],"traits":{}},{"name":"UrbworldUrchin6","title":"urbworld urchin","titleShort":"urchin","desc":"This pawn was born in the darkest slums of their urban homeworld. Neglected by their mother, This pawn learned to survive on their own, battling for every scrap of food This pawn saw.\nEventually, as their talents exceeded their peers, This pawn ascended from the depths to the surface streets and left their mother behind.","skills":{"Melee":4,"Social":-2,"Crafting":2},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"VatgrownAssassin20","title":"vatgrown assassin","titleShort":"clone","desc":"This pawn was not made as a man, but a cold hearted assassin. This pawn was bio-engineered by scientists, and trained as a killer. This pawn was bred to have no emotion, no feelings, and no care for who lives, and who dies.","skills":{"Construction":2,"Shooting":4,"Melee":1},"disabledWork":["Caring","Artistic","Cooking","PlantWork"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"VatgrownMedic53","title":"vatgrown medic","titleShort":"medic","desc":"Raised to be a combat medic, This pawn was trained in firearms as well as medicine. their favorite phrase when coming upon a wounded soldier was, \"Life or death?\" Most chose life.","skills":{"Shooting":3,"Medicine":3},"disabledWork":["Social","Artistic","Crafting","Cooking"],"requiredWork":[],"traits":{}},{"name":"VatgrownScientist91","title":"vatgrown scientist","titleShort":"scientist","desc":"This pawn was grown to be a perfect scientist, with a mind perfectly tuned for physics and chemistry.\ntheir creators used them as a teaching aid on mind design, hoping This pawn would eventually grow to be a great mind and continue their research.","skills":{"Intellectual":5,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"VatgrownSlavegirl8","title":"vatgrown slavegirl","titleShort":"slave girl","desc":"This pawn was vat-grown as a slave in an illegal urbworld laboratory. As a young child, This pawn was taught only to cook, clean and serve their masters. For most of their childhood, This pawn knew nothing else.","skills":{"Cooking":5,"Artistic":-2},"disabledWork":["Violent","Intellectual"],"requiredWork":[],"traits":{}},{"name":"VatgrownSoldier8","title":"vatgrown soldier","titleShort":"vatgrown","desc":"This pawn wasn't made as a person, but as an instrument of destruction. Grown in a bioweapons facility and taught combat during their accelerated growth, This pawn still has a proclivity for combat of all kinds and an aversion to human contact.","skills":{"Melee":4,"Shooting":4},"disabledWork":["Social","Caring"],"requiredWork":[],"traits":{}},{"name":"VengefulChild43","title":"vengeful child","titleShort":"vengeful","desc":"As a child, This pawn returned to their village to find that it had been wiped out by bandits. This pawn swore revenge on the attackers and began a violent rampage across the wilderness.","skills":{"Melee":3,"Shooting":3},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"VideoGamer55","title":"video gamer","titleShort":"gamer","desc":"This pawn was raised in a glitterworld. Everything This pawn wanted came to him. In school This pawn was a social butterfly. At home, This pawn spent their time looking up the newest gadgets and playing their favourite video games.","skills":{"Intellectual":3,"Social":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"VideoGamer16","title":"video gamer","titleShort":"gamer","desc":"This pawn grew up on a midworld, mostly locked in their room, playing video games. This pawn was warm-hearted, with a deep fondness for animals.\nAs This pawn grew up, This pawn turned to drugs to enhance their reality. During these trying times This pawn found passion and refuge in the gym.","skills":{"Intellectual":3,"Shooting":2,"Melee":1},"disabledWork":["Artistic"],"requiredWork":[],"traits":{"DrugDesire":2}},{"name":"VidtubeStar98","title":"vidtube star","titleShort":"vidtuber","desc":"This pawn's hobby was making videos for the popular video sharing service Vidtube. This pawn made everything from video game reviews to pasta cooking guides.\nThis pawn gained a over a million followers.","skills":{"Social":2,"Cooking":2,"Artistic":2,"Crafting":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"VoyagerChild94","title":"voyager child","titleShort":"voyager","desc":"This pawn was raised on an R&D starship, and spent most of their childhood travelling through the void.\nApproaching a mysterious planetoid, the ship was severely damaged. their next memory is of the ship heading out of orbit, fully repaired. This pawn soon developed an unnatural gift for technological research.","skills":{"Intellectual":4},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"WarBastard60","title":"war bastard","titleShort":"bastard","desc":"This pawn was born nine months after their mother's town was conquered by enemy soldiers. The child of violence with no acknowledged father, This pawn grew up at the bottom of the social pyramid.\ntheir mother instilled her bitterness towards men and war into This pawn. their pet rabbit offered more warmth than any human in their life.","skills":{"Animals":3},"disabledWork":["Violent"],"requiredWork":[],"traits":{"DislikesMen":0}},{"name":"WarChild24","title":"war child","titleShort":"war child","desc":"This pawn's parents were drafted into a civil war. Growing up surrounded by fighting and death, This pawn became well-accustomed to tragedy. their expressive side, however, never developed.","skills":{"Shooting":5,"Melee":3},"disabledWork":["Caring","Artistic"],"requiredWork":[],"traits":{}},{"name":"WarRefugee51","title":"war refugee","titleShort":"refugee","desc":"War broke out in This pawn's home when This pawn was a baby. their parents fled with them, seeking safety wherever they could find it. This pawn's earliest memories are of being taught how to defend themself.\nThe violence and destruction This pawn witnessed left them scarred for life.","skills":{"Cooking":2,"Crafting":2},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"WarRefugee96","title":"war refugee","titleShort":"refugee","desc":"A war broke on out This pawn's home planet.\nGathering what little food and belongings they could, This pawn and their father stole a ship and escaped into space.","skills":{"Intellectual":5,"Shooting":6,"Melee":5,"Cooking":-3},"disabledWork":["Social","Artistic","PlantWork"],"requiredWork":[],"traits":{}},{"name":"WastelandWanderer81","title":"wasteland wanderer","titleShort":"wanderer","desc":"Born into a wealthy family on a desert world, This pawn was cast out after a hired attack squad destroyed their ancestral home.\nThe boy managed to hide in a cooling duct beneath their family's villa. Vowing revenge against the killers and whomever had hired them, This pawn struck out into the wasteland, alone.","skills":{"Shooting":3,"Social":3,"Medicine":5,"Crafting":4},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"WealthyStudent59","title":"wealthy student","titleShort":"student","desc":"This pawn was born on a wealthy glitterworld. This pawn studied at the Caspian school of Engineering, and excelled in mathematics and computer programming.\nThis pawn grew up in clean, sterile environments. This pawn never saw a farm or livestock.","skills":{"Construction":2,"Plants":-2,"Intellectual":4,"Mining":-2,"Cooking":-2,"Crafting":3},"disabledWork":["Animals","Cleaning"],"requiredWork":[],"traits":{}},{"name":"WildChild5","title":"wild child","titleShort":"wild child","desc":"This pawn was abandoned on a toxic world overgrown with hostile plant life. This pawn became accustomed early to the cold burn of loneliness.\nThis pawn learned to fight, but ate their food raw and uncooked.","skills":{"Shooting":4,"Melee":6,"Social":-2,"Cooking":-3},"disabledWork":["Caring","Intellectual","Artistic","Cleaning"],"requiredWork":[],"traits":{"Ascetic":0}},{"name":"Winerunner8","title":"winerunner","titleShort":"winerunner","desc":"Abandoned by their parents, This pawn was raised by the monks of the Novo Mosteiro dos Jer\u00f3nimos monastery on Aracena VI.\nThe monks taught them discipline and hard work. In return, This pawn would go into the city and 'acquire' exotic wines for the monks' nightly tastings.","skills":{"Melee":2,"Social":2,"Cooking":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"WolfPackMember26","title":"wolf pack member","titleShort":"feral","desc":"This pawn was discarded by their family. Raised by wolves, This pawn ran, hunted, and defended their pack.\nThis pawn learned to fight efficiently by tooth and claw. This pawn also learned brutally effective primal hunting strategies.","skills":{"Melee":8,"Social":-3},"disabledWork":["Firefighting"],"requiredWork":[],"traits":{}},{"name":"WorkCampSlave37","title":"work camp slave","titleShort":"slave","desc":"This pawn grew up as a slave to a particularly nasty noble family on a medieval world. \nWhile This pawn received no formal education, the harsh labor regimen made their body strong.","skills":{"Construction":2,"Plants":2,"Mining":2,"Social":-2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{"Tough":0}},{"name":"WorldSlider42","title":"world slider","titleShort":"slider","desc":"This pawn was raised by a world-hopping band of criminals. This pawn learned not to leave evidence of their presence in case the group had to leave in a hurry. This pawn also learned about medicine and hand-to-hand combat from their fellow criminals.","skills":{"Construction":-2,"Plants":-2,"Melee":3,"Medicine":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"WreckageExplorer93","title":"wreckage explorer","titleShort":"explorer","desc":"This pawn was tasked with watching their family's herds, but often shirked their duties to go exploring the crashed warships scattered around the planet.","skills":{"Animals":3,"Intellectual":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"YoungMaster23","title":"young master","titleShort":"master","desc":"Born to two medics, This pawn longed for power. their keen intellect and charisma helped them gain the respect of their peers.\nDeciding that the best way to gain power was to climb the ranks of the imperial military, This pawn joined at the youngest possible age.","skills":{"Intellectual":2,"Shooting":1,"Melee":2,"Social":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"YoungPirate71","title":"young pirate","titleShort":"pirate","desc":"This pawn was born to pirates, in a dirty metal room that smelled of motor oil.\nThis pawn was never exactly taught anything, but This pawn still learned the ways of survival, barter, and combat.","skills":{"Shooting":2,"Social":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"YoungPsychologist58","title":"young psychologist","titleShort":"psych","desc":"This pawn was born and raised on a poor midworld, in the front passenger seat of their mother's cab.\nWatching pedestrians and listening to the taxi passengers all day long, This pawn soon became very good at figuring out someone's real purpose.","skills":{"Social":4,"Medicine":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"YouthDelinquent30","title":"youth delinquent","titleShort":"delinquent","desc":"This pawn was the only child of celebrity sommeliers. their parents expected them to take up the family profession, but after their third admission to a youth detention center, this career path became unlikely.\nWhile in detention, This pawn became skilled at making shanks and developed an interest in ornithology.","skills":{"Shooting":3,"Melee":1,"Social":-1,"Crafting":4},"disabledWork":["Caring","Artistic","Cleaning"],"requiredWork":[],"traits":{}},{"name":"YouthSoldier99","title":"youth soldier","titleShort":"soldier","desc":"Born to a long line of soldiers, This pawn joined a military training program.\nThis pawn excelled in physical training, and even passed most of the intellectual exams. While This pawn was never particularly bright or nimble, This pawn learned the value of hard work and suffering.","skills":{"Construction":2,"Shooting":2,"Melee":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{"Industriousness":1}}];
\ No newline at end of file
+var childhoods = [{"name":"MonkeyChild67","skills":{"Plants":6,"Mining":4,"Social":-3,"Animals":6},"disabledWork":["Artistic","Cleaning"],"requiredWork":[],"traits":{}},{"name":"MusicalKid14","skills":{"Social":3,"Artistic":3},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"OldMoneyHeir46","skills":{"Intellectual":3,"Social":4,"Artistic":2},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"StewardsAssisant28","skills":{"Melee":5,"Cooking":5,"Artistic":-2},"disabledWork":["Hauling"],"requiredWork":[],"traits":{}},{"name":"VRAddict29","skills":{"Intellectual":2,"Shooting":1,"Melee":1,"Artistic":1,"Crafting":1},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"AbandonedChild23","skills":{"Melee":3,"Crafting":3,"Social":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"AbandonedChild30","skills":{"Construction":1,"Shooting":1,"Melee":1,"Social":1},"disabledWork":["Cooking","Cleaning"],"requiredWork":[],"traits":{}},{"name":"AbandonedOrphan61","skills":{"Plants":-3,"Shooting":2,"Melee":3,"Social":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Abductee43","skills":{"Construction":2,"Melee":2,"Cooking":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Abductee7","skills":{"Construction":2,"Mining":4,"Melee":4,"Social":-2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"AcademyStudent58","skills":{"Social":3,"Crafting":2},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"AccursedChild88","skills":{"Construction":-1,"Intellectual":5,"Medicine":4},"disabledWork":["Firefighting","Cleaning","Hauling","Mining"],"requiredWork":[],"traits":{}},{"name":"AdventuringChild30","skills":{"Construction":2,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"AdventurousYouth70","skills":{"Melee":2,"Social":2,"Cooking":2},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"AmateurAstronomer77","skills":{"Intellectual":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"AmateurBotanist79","skills":{"Plants":4,"Artistic":2},"disabledWork":["Cooking"],"requiredWork":[],"traits":{}},{"name":"AmateurEngineer3","skills":{"Construction":2,"Intellectual":2,"Mining":1,"Shooting":1},"disabledWork":["Cleaning","PlantWork"],"requiredWork":[],"traits":{}},{"name":"AngryStudent88","skills":{"Intellectual":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"AnimalCaretaker20","skills":{"Plants":2,"Animals":4},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"AnimalLabTech39","skills":{"Intellectual":1,"Shooting":-2,"Medicine":2,"Animals":3},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"AntisocialChild83","skills":{"Intellectual":3,"Crafting":2},"disabledWork":["Social","Artistic"],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"ApocalypseChild23","skills":{"Shooting":2,"Melee":3,"Crafting":2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"ApocalypseSurvivor23","skills":{"Shooting":4,"Artistic":-3,"Intellectual":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ApprenticeOracle83","skills":{"Intellectual":2,"Social":3,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ApprenticeSmith37","skills":{"Melee":2,"Crafting":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ArtSlave57","skills":{"Artistic":4},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"ArtfulDodger78","skills":{"Shooting":1,"Melee":2,"Social":3},"disabledWork":["Caring","Artistic","Crafting","Cooking","Cleaning","PlantWork"],"requiredWork":[],"traits":{}},{"name":"ArtisanFarmer23","skills":{"Plants":7,"Intellectual":-2,"Cooking":2},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"ArtisticWeirdo56","skills":{"Cooking":1,"Artistic":3,"Crafting":2},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{}},{"name":"AspergersRebel13","skills":{"Intellectual":5,"Shooting":2,"Social":-3},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"AspiringEngineer58","skills":{"Construction":2,"Intellectual":4,"Mining":2,"Social":-2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"AspiringPhysicist47","skills":{"Construction":1,"Intellectual":3,"Crafting":2},"disabledWork":["Caring","Animals","Cooking"],"requiredWork":[],"traits":{}},{"name":"AspiringPopIdol28","skills":{"Shooting":-4,"Melee":-4,"Social":4,"Artistic":4},"disabledWork":["ManualDumb","Cleaning","Hauling","PlantWork","Mining"],"requiredWork":[],"traits":{"Beauty":2}},{"name":"Athlete47","skills":{"Intellectual":3,"Melee":4},"disabledWork":["Social","Artistic"],"requiredWork":[],"traits":{}},{"name":"AwkwardNerd48","skills":{"Intellectual":5,"Melee":-2,"Social":-2,"Crafting":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BlackjackPlayer76","skills":{"Intellectual":5,"Social":4},"disabledWork":["Violent","Firefighting"],"requiredWork":[],"traits":{}},{"name":"BlacksmithsSon73","skills":{"Construction":3,"Shooting":3,"Artistic":-3,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BlessedChild46","skills":{"Social":3,"Medicine":2,"Artistic":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BodyguardTrainee54","skills":{"Plants":2,"Shooting":3,"Melee":2,"Medicine":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"BoneCollector14","skills":{"Plants":2,"Mining":2,"Shooting":-3,"Melee":-3,"Social":-3,"Medicine":2,"Artistic":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Bookworm19","skills":{"Intellectual":6,"Artistic":2,"Social":-3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"Bookworm3","skills":{"Plants":2,"Intellectual":2,"Social":-2,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BoyScout42","skills":{"Plants":2,"Shooting":2,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BoySoldier14","skills":{"Shooting":4,"Melee":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BrothelGofer84","skills":{"Social":2,"Cooking":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"BrutalThief59","skills":{"Plants":-2,"Shooting":2,"Melee":4,"Social":-2},"disabledWork":["Caring","Artistic"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"BuddingArtist44","skills":{"Artistic":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Bully70","skills":{"Melee":2,"Shooting":3},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"BunkerKid41","skills":{"Shooting":4,"Melee":4,"Social":-2},"disabledWork":["Artistic","PlantWork"],"requiredWork":[],"traits":{}},{"name":"Cadet96","skills":{"Construction":3,"Intellectual":3,"Crafting":3},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"CaravanChild53","skills":{"Social":2,"Artistic":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CaravanTraveler6","skills":{"Plants":-3,"Shooting":1,"Social":2,"Animals":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CatHerder4","skills":{"Social":2,"Cooking":3},"disabledWork":["Cleaning","Hauling"],"requiredWork":[],"traits":{}},{"name":"CaveChild30","skills":{"Mining":3,"Construction":3},"disabledWork":[],"requiredWork":[],"traits":{"Undergrounder":0}},{"name":"CaveChild17","skills":{"Plants":2,"Mining":2,"Shooting":-2,"Melee":-2,"Cooking":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{"Undergrounder":0}},{"name":"CaveworldTender26","skills":{"Plants":4,"Mining":2,"Shooting":-3},"disabledWork":[],"requiredWork":[],"traits":{"Undergrounder":0}},{"name":"CaveworldTunneler48","skills":{"Construction":1,"Mining":6,"Shooting":-2},"disabledWork":["Intellectual","Crafting"],"requiredWork":[],"traits":{"Undergrounder":0}},{"name":"ChessMaster67","skills":{"Intellectual":2,"Social":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ChildOfDrifters18","skills":{"Shooting":4,"Melee":-2,"Social":-3,"Crafting":6},"disabledWork":["Firefighting","PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"ChildOfGlass61","skills":{"Plants":3,"Shooting":4,"Artistic":-3},"disabledWork":["Social","Animals"],"requiredWork":[],"traits":{"ShootingAccuracy":1}},{"name":"ChildProdigy76","skills":{"Intellectual":6,"Mining":-3,"Cooking":-3,"Medicine":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ChildResearcher32","skills":{"Intellectual":7,"Shooting":-2,"Melee":-2},"disabledWork":["Crafting"],"requiredWork":[],"traits":{}},{"name":"ChildScientist30","skills":{"Intellectual":4,"Social":-3,"Cooking":-2,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ChildSlave58","skills":{"Construction":2,"Mining":3,"Social":-2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"ChildSpy47","skills":{"Social":4,"Intellectual":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ChildSpy84","skills":{"Shooting":3,"Social":3,"Medicine":1},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"ChildStar74","skills":{"Social":3,"Artistic":3,"Intellectual":-2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"ChildKnave69","skills":{"Shooting":-3,"Melee":4,"Social":3},"disabledWork":["Firefighting"],"requiredWork":[],"traits":{"Brawler":0}},{"name":"CircusPerformer37","skills":{"Social":3,"Artistic":2},"disabledWork":["Firefighting"],"requiredWork":[],"traits":{}},{"name":"ClassClown96","skills":{"Social":-3,"Artistic":4},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"CloneFarmed21","skills":{"Intellectual":4,"Shooting":-3,"Artistic":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ColiseumCleaner54","skills":{"Intellectual":4,"Social":2,"Crafting":1},"disabledWork":["Caring","Firefighting","Mining"],"requiredWork":[],"traits":{}},{"name":"Colonist22","skills":{"Plants":4,"Cooking":3,"Crafting":2},"disabledWork":["Artistic","Firefighting"],"requiredWork":[],"traits":{}},{"name":"ColonyKid47","skills":{"Intellectual":2,"Social":-2,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ComaChild93","skills":{"Social":4,"Construction":-2,"Mining":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CommonerHeir5","skills":{"Intellectual":1,"Melee":2,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Computer80","skills":{"Construction":-2,"Plants":-3,"Intellectual":4,"Artistic":1,"Crafting":3},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"ComputerGeek62","skills":{"Construction":3,"Intellectual":3,"Shooting":-2,"Animals":2},"disabledWork":["Social","Cooking","PlantWork"],"requiredWork":[],"traits":{}},{"name":"ConstructionGrunt84","skills":{"Construction":4,"Social":1,"Crafting":2},"disabledWork":["Cleaning","PlantWork"],"requiredWork":[],"traits":{}},{"name":"ConventChild16","skills":{"Construction":3,"Plants":3},"disabledWork":["Intellectual","Violent"],"requiredWork":[],"traits":{}},{"name":"CoreDilettante33","skills":{"Intellectual":2,"Social":2,"Artistic":2},"disabledWork":["ManualDumb","Violent"],"requiredWork":[],"traits":{}},{"name":"CoreworldStudent50","skills":{"Construction":2,"Shooting":-1,"Artistic":4,"Crafting":4},"disabledWork":["Cooking","PlantWork"],"requiredWork":[],"traits":{}},{"name":"CorpStudent95","skills":{"Intellectual":3,"Social":3,"Medicine":-2,"Artistic":-3},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"CorpBredStudent54","skills":{"Intellectual":5,"Social":7,"Medicine":3,"Crafting":3},"disabledWork":["Violent","Artistic"],"requiredWork":[],"traits":{}},{"name":"CorporateSlave22","skills":{"Plants":-2,"Shooting":4,"Social":4,"Animals":-2},"disabledWork":["Cooking","Cleaning"],"requiredWork":[],"traits":{}},{"name":"CountryChild95","skills":{"Cooking":2,"Animals":4},"disabledWork":["Artistic"],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"CountryLordling92","skills":{"Plants":2,"Animals":3,"Social":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CowFarmer39","skills":{"Plants":4,"Animals":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CrashBaby32","skills":{"Social":3,"Intellectual":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"CrimeBossChild39","skills":{"Construction":2,"Shooting":2,"Melee":2},"disabledWork":["Caring","Artistic","Cooking"],"requiredWork":[],"traits":{}},{"name":"CultChild3","skills":{"Medicine":-3,"Artistic":5},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"CuriousChild33","skills":{"Intellectual":4,"Social":-3,"Mining":-2},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"DataDecoder39","skills":{"Construction":2,"Plants":2,"Intellectual":2},"disabledWork":["Social"],"requiredWork":[],"traits":{"FastLearner":0}},{"name":"DedicatedStudent12","skills":{"Intellectual":2,"Artistic":2},"disabledWork":["Animals","Cooking","Cleaning"],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"Delinquent13","skills":{"Shooting":1,"Melee":4},"disabledWork":["Animals","PlantWork"],"requiredWork":["Violent"],"traits":{}},{"name":"DesertRat47","skills":{"Intellectual":2,"Melee":2,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{"Ascetic":0}},{"name":"DiplomatsChild97","skills":{"Intellectual":1,"Artistic":1},"disabledWork":["Violent","Social"],"requiredWork":[],"traits":{}},{"name":"DisasterSurvivor65","skills":{"Plants":2,"Melee":3,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"DisasterSurvivor29","skills":{"Construction":3,"Cooking":2,"Crafting":1},"disabledWork":["Animals"],"requiredWork":[],"traits":{}},{"name":"DiscardedYouth93","skills":{"Construction":3,"Crafting":3},"disabledWork":["Artistic","Cleaning","PlantWork"],"requiredWork":[],"traits":{}},{"name":"DisciplinedFarmer28","skills":{"Construction":2,"Plants":3,"Intellectual":-1,"Mining":2},"disabledWork":["Social","Cooking"],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"DisplacedNoble67","skills":{"Intellectual":1,"Shooting":3,"Crafting":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"DreadedBaby56","skills":{"Shooting":1,"Cooking":3,"Artistic":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Dreamer79","skills":{"Melee":2,"Social":4,"Artistic":3},"disabledWork":[],"requiredWork":[],"traits":{"Kind":0}},{"name":"Drudge9","skills":{"Construction":2,"Mining":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"DrugMule80","skills":{"Shooting":2,"Melee":3},"disabledWork":["Caring","Social","Intellectual","Artistic","Cleaning","PlantWork"],"requiredWork":[],"traits":{}},{"name":"DustyFarmHand75","skills":{"Plants":2,"Medicine":1,"Animals":2},"disabledWork":["Intellectual","Artistic"],"requiredWork":[],"traits":{"Tough":0}},{"name":"Empath47","skills":{"Intellectual":2,"Artistic":2},"disabledWork":["Violent","Social","Animals"],"requiredWork":[],"traits":{}},{"name":"EnergeticPopIdol61","skills":{"Intellectual":-2,"Melee":3,"Social":2,"Medicine":-2,"Artistic":5},"disabledWork":[],"requiredWork":[],"traits":{"Beauty":2,"Greedy":0}},{"name":"ExiledPrince58","skills":{"Construction":3,"Artistic":-2,"Crafting":2,"Animals":1},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"FactoryDrone58","skills":{"Construction":3,"Intellectual":-2,"Crafting":3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"FallenProdigy40","skills":{"Construction":2,"Plants":2,"Intellectual":5,"Medicine":3,"Crafting":2},"disabledWork":["Social"],"requiredWork":[],"traits":{"TooSmart":0}},{"name":"FarmBoy64","skills":{"Plants":2,"Mining":3,"Melee":4,"Social":-3,"Cooking":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"FarmHand2","skills":{"Construction":2,"Plants":4,"Intellectual":-2,"Melee":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"FarmKid60","skills":{"Plants":3,"Medicine":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"FarmMechanic1","skills":{"Construction":4,"Plants":2},"disabledWork":["Intellectual","Artistic"],"requiredWork":[],"traits":{}},{"name":"FarmerBoy88","skills":{"Construction":1,"Plants":4,"Mining":1,"Crafting":2},"disabledWork":["Caring","Social","Firefighting"],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"FarmersDaughter81","skills":{"Social":-1,"Cooking":2,"Artistic":3,"Crafting":3},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"FarmersSon20","skills":{"Plants":2,"Social":-3,"Cooking":1,"Animals":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"FeralChild96","skills":{"Plants":2,"Melee":4,"Crafting":1},"disabledWork":["Social","Intellectual"],"requiredWork":[],"traits":{}},{"name":"FeralChild85","skills":{"Plants":2,"Melee":4,"Crafting":1},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"FeudalFarmBoy0","skills":{"Plants":4,"Social":2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"FeudalLordling56","skills":{"Melee":4,"Social":3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"FireKeeper44","skills":{"Crafting":2,"Cooking":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"FireScarredChild1","skills":{"Mining":1,"Melee":1},"disabledWork":["Cooking","Firefighting"],"requiredWork":[],"traits":{}},{"name":"ForestChild83","skills":{"Melee":2,"Animals":2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"FoundryApprentice76","skills":{"Construction":3,"Melee":1,"Artistic":-2,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Freethinker38","skills":{"Intellectual":2,"Shooting":3,"Social":2,"Artistic":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"FrightenedChild43","skills":{"Medicine":3,"Cooking":3},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"FrontierMarshal54","skills":{"Shooting":4,"Melee":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"GNomeSculptor34","skills":{"Intellectual":2,"Social":2,"Artistic":4,"Crafting":2},"disabledWork":["Cooking","Cleaning"],"requiredWork":[],"traits":{}},{"name":"GalacticPage37","skills":{"Social":6,"Artistic":2},"disabledWork":["ManualDumb","ManualSkilled"],"requiredWork":[],"traits":{}},{"name":"GameFanatic86","skills":{"Intellectual":3,"Shooting":3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"GangMember83","skills":{"Plants":-2,"Shooting":2,"Melee":5},"disabledWork":["Social","Intellectual"],"requiredWork":[],"traits":{}},{"name":"GangMember16","skills":{"Shooting":3,"Melee":4,"Medicine":3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{"Nerves":2}},{"name":"GlitterworldKid85","skills":{"Plants":4,"Intellectual":2,"Social":-3,"Medicine":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"GlitterworldNerd20","skills":{"Intellectual":5,"Crafting":2},"disabledWork":["ManualDumb","Artistic"],"requiredWork":[],"traits":{}},{"name":"GlitterworldRoyal24","skills":{"Social":2,"Cooking":2,"Artistic":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{"Beauty":-1}},{"name":"GunKid30","skills":{"Shooting":3,"Melee":3,"Artistic":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Gymnast48","skills":{"Melee":4,"Social":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"HackerKid98","skills":{"Construction":3,"Crafting":3},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"HackerProdigy84","skills":{"Intellectual":7,"Medicine":4},"disabledWork":["ManualDumb","Cooking"],"requiredWork":[],"traits":{}},{"name":"HeadjackAddict4","skills":{"Plants":-3,"Intellectual":4,"Shooting":2},"disabledWork":["Social","Animals"],"requiredWork":[],"traits":{}},{"name":"HelpDeskWorker31","skills":{"Intellectual":3},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"Herder19","skills":{"Medicine":3,"Melee":3,"Social":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"HexCellArtist91","skills":{"Artistic":3,"Crafting":2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"Hideaway7","skills":{"Intellectual":3,"Crafting":3,"Social":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"HighBaroness37","skills":{"Intellectual":2,"Social":7,"Artistic":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"HillbillyProdigy60","skills":{"Intellectual":2,"Melee":2,"Medicine":2},"disabledWork":["Social","Artistic","Cleaning"],"requiredWork":[],"traits":{}},{"name":"HistoryStudent12","skills":{"Social":2,"Artistic":4,"Crafting":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"HunterScavenger64","skills":{"Social":2,"Cooking":2,"Medicine":2,"Artistic":3},"disabledWork":["Animals"],"requiredWork":[],"traits":{}},{"name":"IcePlanetChild95","skills":{"Construction":2,"Intellectual":4},"disabledWork":["Caring","Social","Artistic"],"requiredWork":[],"traits":{}},{"name":"IceworldSurvivor75","skills":{"Construction":3,"Social":1,"Crafting":1},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"IdealisticCadet64","skills":{"Shooting":4,"Melee":3,"Social":-2},"disabledWork":["Mining"],"requiredWork":[],"traits":{}},{"name":"ImperialStudent49","skills":{"Plants":2,"Intellectual":3,"Shooting":-3,"Melee":2},"disabledWork":["Crafting","Firefighting","Cleaning"],"requiredWork":[],"traits":{}},{"name":"IndustrialOrphan13","skills":{"Crafting":3,"Mining":3,"Intellectual":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"IndworldUrchin73","skills":{"Construction":1,"Melee":1,"Crafting":2},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"Infantry99","skills":{"Shooting":2,"Melee":1,"Social":2},"disabledWork":["Caring"],"requiredWork":[],"traits":{"Bloodlust":0}},{"name":"JoywireAddict76","skills":{"Shooting":4,"Melee":6,"Social":-3},"disabledWork":["Intellectual","Cleaning"],"requiredWork":[],"traits":{}},{"name":"JungleKid35","skills":{"Intellectual":-2,"Melee":2,"Cooking":2,"Animals":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"JunkyardMechanic51","skills":{"Construction":2,"Intellectual":2,"Social":-3,"Crafting":4},"disabledWork":["Animals"],"requiredWork":[],"traits":{}},{"name":"KidScientist53","skills":{"Intellectual":4,"Medicine":4,"Artistic":-3},"disabledWork":["ManualDumb","Social"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"Killer41","skills":{"Melee":4,"Medicine":2},"disabledWork":["Social"],"requiredWork":[],"traits":{"Bloodlust":0}},{"name":"LabGrownChild22","skills":{"Plants":2,"Intellectual":2,"Artistic":2},"disabledWork":["Animals"],"requiredWork":[],"traits":{}},{"name":"LaborCampOrphan91","skills":{"Construction":4,"Mining":4},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"LogicalChild2","skills":{"Construction":2,"Intellectual":2,"Social":-2,"Crafting":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{"TooSmart":0}},{"name":"Machinist56","skills":{"Crafting":3,"Intellectual":2,"Shooting":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MadScientist47","skills":{"Intellectual":4,"Melee":1,"Social":2},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"MarineCadet73","skills":{"Shooting":3,"Melee":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MechanoidHacker93","skills":{"Construction":3,"Intellectual":3,"Social":-3,"Crafting":3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{"DrugDesire":1}},{"name":"MechanoidNerd10","skills":{"Construction":2,"Intellectual":3,"Social":-2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MedicalAssistant12","skills":{"Medicine":5},"disabledWork":["Firefighting"],"requiredWork":[],"traits":{}},{"name":"MedicalHelper27","skills":{"Social":2,"Medicine":4},"disabledWork":["Firefighting"],"requiredWork":[],"traits":{}},{"name":"MedicalStudent96","skills":{"Social":1,"Medicine":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MedicalStudent38","skills":{"Construction":-2,"Social":3,"Medicine":3},"disabledWork":["Hauling","Mining"],"requiredWork":[],"traits":{}},{"name":"MedievalLordling19","skills":{"Social":4,"Construction":-1,"Mining":-1,"Plants":-1},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"MedievalNomad12","skills":{"Social":2,"Cooking":2,"Animals":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MedievalPlower14","skills":{"Construction":2,"Plants":5,"Intellectual":-1,"Artistic":-2},"disabledWork":[],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"MedievalSlave49","skills":{"Plants":2,"Construction":2,"Mining":2,"Intellectual":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MedievalSlave50","skills":{"Construction":2,"Plants":3,"Mining":1,"Cooking":2,"Artistic":-2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"MedievalSquire5","skills":{"Construction":-1,"Mining":-1,"Shooting":3,"Melee":5},"disabledWork":["Cooking","PlantWork"],"requiredWork":[],"traits":{}},{"name":"MedievalThief74","skills":{"Shooting":-3,"Melee":4,"Social":-2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MercenaryRecruit36","skills":{"Shooting":3,"Melee":1,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MercenaryRecruit18","skills":{"Shooting":3,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MidworldCadet83","skills":{"Intellectual":3,"Social":3,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MidworldGeek18","skills":{"Intellectual":6,"Social":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MidworldLoner80","skills":{"Construction":3,"Shooting":3,"Social":-2,"Crafting":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MidworldSketcher71","skills":{"Shooting":2,"Melee":1,"Artistic":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MilitantChild49","skills":{"Intellectual":2,"Shooting":3,"Melee":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MilitaryCadet16","skills":{"Plants":-2,"Mining":2,"Shooting":3,"Melee":2,"Medicine":2,"Animals":-3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"MilitaryCadet46","skills":{"Shooting":4,"Melee":3},"disabledWork":["Animals","PlantWork"],"requiredWork":[],"traits":{}},{"name":"MilitaryChild82","skills":{"Construction":2,"Shooting":3,"Melee":1,"Medicine":2,"Artistic":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MilitaryRecruit49","skills":{"Shooting":4,"Melee":3},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"MilitaryTrainee20","skills":{"Shooting":3,"Melee":2,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"MusicIdol50","skills":{"Intellectual":2,"Mining":-2,"Melee":-2,"Social":3,"Artistic":2},"disabledWork":[],"requiredWork":[],"traits":{"Beauty":2}},{"name":"MusicalKid86","skills":{"Social":-2,"Artistic":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Mute34","skills":{"Animals":5},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"Naturalist14","skills":{"Plants":3,"Melee":2,"Cooking":2},"disabledWork":["Social","Intellectual"],"requiredWork":[],"traits":{}},{"name":"NavyPathfinder53","skills":{"Intellectual":3,"Shooting":2,"Social":3,"Cooking":-2,"Animals":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Nerd92","skills":{"Construction":1,"Intellectual":4,"Medicine":2,"Crafting":2},"disabledWork":["Social"],"requiredWork":[],"traits":{"AnnoyingVoice":0}},{"name":"NewAgeDuelist27","skills":{"Shooting":-2,"Melee":4,"Animals":-2},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{"Industriousness":-1}},{"name":"NobleWard61","skills":{"Intellectual":4,"Shooting":-1,"Melee":-2,"Social":3},"disabledWork":["ManualDumb","Firefighting","PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"OfficerCadet25","skills":{"Plants":1,"Shooting":3,"Melee":3,"Social":1,"Medicine":1},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"OffworldRecruit91","skills":{"Shooting":2,"Melee":2,"Medicine":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"OptimisticChild30","skills":{"Social":4},"disabledWork":[],"requiredWork":[],"traits":{"NaturalMood":1}},{"name":"OrganFarm67","skills":{"Medicine":5},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"Orphan15","skills":{"Melee":4,"Medicine":2},"disabledWork":["Crafting"],"requiredWork":[],"traits":{"Kind":0}},{"name":"Orphan25","skills":{"Social":6},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Orphan11","skills":{"Construction":2,"Cooking":2,"Crafting":2},"disabledWork":["Social","Animals"],"requiredWork":[],"traits":{}},{"name":"OrphanOfWar60","skills":{"Construction":3,"Intellectual":-3,"Mining":3,"Cooking":3},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"OrphanedAcrobat84","skills":{"Melee":2,"Social":3,"Animals":1},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"Pampered87","skills":{"Intellectual":2,"Melee":-3,"Social":3,"Medicine":3},"disabledWork":["Cooking"],"requiredWork":[],"traits":{}},{"name":"PamperedLordling37","skills":{"Social":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"PetKeeper7","skills":{"Medicine":1,"Animals":6},"disabledWork":["Social","Artistic"],"requiredWork":[],"traits":{}},{"name":"Philosopher82","skills":{"Intellectual":4,"Social":3},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"Pickpocket82","skills":{"Melee":2,"Social":2,"Artistic":2},"disabledWork":["Cleaning","PlantWork"],"requiredWork":[],"traits":{"Nimble":0}},{"name":"Pickpocket61","skills":{"Intellectual":-2,"Melee":3,"Social":-1,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"PilotFan16","skills":{"Intellectual":3,"Shooting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"PitGladiator19","skills":{"Shooting":4,"Melee":4},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"PizzaLover94","skills":{"Melee":5,"Cooking":3},"disabledWork":["Caring"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"PlagueChild44","skills":{"Intellectual":1,"Social":-3,"Medicine":5},"disabledWork":["Violent","Animals","Artistic","Cooking"],"requiredWork":[],"traits":{}},{"name":"PlagueProdigy12","skills":{"Construction":2,"Intellectual":4,"Social":-2},"disabledWork":["Caring","Artistic"],"requiredWork":[],"traits":{}},{"name":"PlagueSurvivor39","skills":{"Social":-2,"Cooking":2,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{"Nerves":-1}},{"name":"PoliticalCaptive7","skills":{"Melee":3,"Intellectual":3},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"PoorKid18","skills":{"Melee":4,"Social":1},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"PowerMadScholar30","skills":{"Construction":2,"Intellectual":3,"Social":-3,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{"FastLearner":0}},{"name":"PrivilegedChild86","skills":{"Social":3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"PrivilegedProdigy70","skills":{"Intellectual":2,"Medicine":1,"Artistic":2},"disabledWork":["ManualDumb","Violent","Hauling","PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"ProdigalStudent67","skills":{"Intellectual":3,"Crafting":2},"disabledWork":["Animals"],"requiredWork":[],"traits":{}},{"name":"ProfessionalGamer76","skills":{"Shooting":4,"Melee":-3,"Crafting":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"ProjectSubject99","skills":{"Shooting":4,"Melee":4},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"PsychologyStudent15","skills":{"Social":-3,"Artistic":4},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"Punk30","skills":{"Intellectual":-2,"Social":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"PyroAssistant82","skills":{"Construction":4,"Medicine":3},"disabledWork":["Cooking","Firefighting"],"requiredWork":[],"traits":{"Pyromaniac":0}},{"name":"Pyromaniac18","skills":{"Social":-3,"Cooking":-2,"Artistic":3},"disabledWork":["Firefighting"],"requiredWork":[],"traits":{"Pyromaniac":0}},{"name":"QuietNerd97","skills":{"Intellectual":2,"Social":-2,"Artistic":1,"Crafting":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"RangerChild57","skills":{"Mining":-2,"Shooting":2,"Cooking":2,"Animals":4},"disabledWork":["Firefighting","PlantWork"],"requiredWork":[],"traits":{}},{"name":"ReEducatedYouth23","skills":{"Social":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"RebelChild8","skills":{"Melee":2,"Social":3},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"RebelSlave14","skills":{"Construction":1,"Plants":1,"Intellectual":-2,"Shooting":2,"Social":2,"Crafting":2},"disabledWork":["Artistic","Mining"],"requiredWork":[],"traits":{}},{"name":"RebelStudent14","skills":{"Intellectual":3,"Shooting":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{"Abrasive":0}},{"name":"RebelWriter82","skills":{"Intellectual":7},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"RebelliousStudent74","skills":{"Intellectual":2,"Melee":4,"Social":-3,"Artistic":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ReclusiveChild81","skills":{"Melee":4,"Crafting":3},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"ReclusiveProdigy96","skills":{"Intellectual":4,"Medicine":4},"disabledWork":["Social","Artistic"],"requiredWork":[],"traits":{"TooSmart":0}},{"name":"RichBoy9","skills":{"Melee":3,"Artistic":3},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{}},{"name":"RichKid61","skills":{"Melee":2,"Shooting":2,"Intellectual":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"RitualChild20","skills":{"Intellectual":-3,"Melee":3,"Crafting":3,"Animals":4},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"RoyalBastard64","skills":{"Social":2,"Artistic":2},"disabledWork":[],"requiredWork":[],"traits":{"Greedy":0}},{"name":"Scavenger22","skills":{"Mining":3,"Intellectual":3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"Scavenger62","skills":{"Shooting":2,"Melee":2,"Social":-2,"Cooking":2},"disabledWork":["Intellectual","Artistic"],"requiredWork":[],"traits":{}},{"name":"SchoolyardOutcast11","skills":{"Intellectual":2,"Melee":2,"Social":-3,"Artistic":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ScienceProdigy65","skills":{"Intellectual":3,"Medicine":3,"Artistic":2},"disabledWork":["Violent","Firefighting"],"requiredWork":[],"traits":{}},{"name":"Scout44","skills":{"Shooting":3,"Crafting":2,"Construction":1},"disabledWork":["Artistic","Intellectual"],"requiredWork":[],"traits":{}},{"name":"Scout6","skills":{"Construction":1,"Shooting":3,"Crafting":2},"disabledWork":["Intellectual","Artistic"],"requiredWork":[],"traits":{}},{"name":"Scrounger25","skills":{"Mining":2,"Social":-2,"Crafting":2},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"SentimentalChild55","skills":{"Social":4},"disabledWork":[],"requiredWork":[],"traits":{"PsychicSensitivity":1}},{"name":"ServingBoy97","skills":{"Cooking":2,"Construction":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SewerKid57","skills":{"Cooking":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ShelterChild50","skills":{"Intellectual":3,"Medicine":3,"Social":2,"Construction":-2,"Mining":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ShipBoy89","skills":{"Crafting":6},"disabledWork":["Animals","PlantWork"],"requiredWork":[],"traits":{}},{"name":"ShipChild46","skills":{"Melee":-3,"Social":-3,"Artistic":4,"Crafting":4},"disabledWork":["Animals","Cooking","PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"ShipTechnician0","skills":{"Construction":3,"Plants":-3,"Intellectual":3,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ShipboundLordling12","skills":{"Shooting":2,"Construction":2},"disabledWork":[],"requiredWork":[],"traits":{"Undergrounder":0}},{"name":"ShootingComa59","skills":{"Shooting":8},"disabledWork":["ManualDumb","ManualSkilled","Intellectual","Artistic"],"requiredWork":[],"traits":{}},{"name":"ShopKid36","skills":{"Social":4,"Intellectual":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ShunnedGirl30","skills":{"Shooting":2,"Social":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SicklyChild55","skills":{"Intellectual":4,"Medicine":5,"Melee":-2,"Social":-2,"Construction":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SicklyLiar3","skills":{"Construction":-2,"Shooting":-2,"Melee":-2,"Social":6},"disabledWork":["Caring"],"requiredWork":[],"traits":{"Immunity":-1}},{"name":"SlaveFarmer99","skills":{"Plants":4},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"SmallTownKid41","skills":{"Construction":-3,"Plants":3,"Mining":-3,"Cooking":3,"Medicine":3,"Animals":3},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"SocialPariah3","skills":{"Crafting":2,"Animals":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SoldierExperiment50","skills":{"Shooting":3,"Melee":3,"Social":-3,"Medicine":2},"disabledWork":["Cooking","Cleaning"],"requiredWork":[],"traits":{}},{"name":"SoldiersKid55","skills":{"Shooting":4,"Melee":2},"disabledWork":["Animals","PlantWork"],"requiredWork":["Violent"],"traits":{"Neurotic":1}},{"name":"SoleSurvivor21","skills":{"Plants":3,"Cooking":3},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"SoleSurvivor63","skills":{"Plants":2,"Shooting":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SonOfAHuntress75","skills":{"Shooting":2,"Melee":2,"Cooking":2,"Medicine":1,"Crafting":1},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{}},{"name":"SpaceCadet77","skills":{"Shooting":4,"Melee":2},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"SpaceFanboy22","skills":{"Intellectual":2,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SpaceNerd97","skills":{"Intellectual":4,"Social":-3,"Cooking":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SpaceSmuggler6","skills":{"Plants":-2,"Intellectual":-2,"Shooting":3,"Melee":3,"Social":3,"Medicine":2,"Artistic":-2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SpacerOrphan77","skills":{"Shooting":2,"Melee":4,"Crafting":2},"disabledWork":["Artistic","Mining"],"requiredWork":[],"traits":{}},{"name":"SpaceyachtPilot89","skills":{"Melee":2,"Social":4},"disabledWork":["Cooking"],"requiredWork":[],"traits":{}},{"name":"SpeederRacer71","skills":{"Shooting":3,"Social":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"SpoiledBrat59","skills":{"Medicine":2},"disabledWork":["ManualSkilled","Social","Intellectual","Cooking"],"requiredWork":[],"traits":{}},{"name":"SpoiledChild33","skills":{"Construction":-2,"Plants":2,"Mining":-2,"Social":2,"Cooking":2,"Artistic":2},"disabledWork":["Firefighting"],"requiredWork":[],"traits":{}},{"name":"SpoiledChild80","skills":{"Intellectual":3,"Artistic":2,"Animals":3},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"Stableboy49","skills":{"Mining":2,"Melee":2,"Artistic":2,"Crafting":1},"disabledWork":["Social"],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"StarSquire9","skills":{"Shooting":2,"Melee":3},"disabledWork":["Animals","Artistic"],"requiredWork":[],"traits":{}},{"name":"StarforceCadet79","skills":{"Intellectual":2,"Mining":-3,"Social":2,"Medicine":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"StationWhelp94","skills":{"Shooting":3,"Melee":5},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{}},{"name":"SteamworldTinker38","skills":{"Construction":4,"Social":-3,"Crafting":3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"StoryWriter67","skills":{"Artistic":4,"Intellectual":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"Straggler71","skills":{"Intellectual":-3,"Melee":2,"Artistic":2,"Crafting":2},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{}},{"name":"StreetChild4","skills":{"Social":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"StreetKid19","skills":{"Melee":3,"Social":3},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"StreetPeddler66","skills":{"Melee":2,"Social":3,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"StreetRat81","skills":{"Melee":5,"Intellectual":-1},"disabledWork":[],"requiredWork":["Violent"],"traits":{"DrugDesire":1}},{"name":"StreetUrchin45","skills":{"Construction":2,"Intellectual":-2,"Mining":2,"Melee":3},"disabledWork":["Artistic"],"requiredWork":[],"traits":{"Immunity":-1}},{"name":"StreetUrchin53","skills":{"Shooting":3,"Melee":3},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"StreetUrchin74","skills":{"Construction":2,"Plants":-2,"Shooting":2,"Melee":3,"Social":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"Student65","skills":{"Intellectual":3,"Mining":-2,"Social":2,"Medicine":3},"disabledWork":["Cleaning","Hauling"],"requiredWork":[],"traits":{}},{"name":"StudentEngineer34","skills":{"Construction":2,"Intellectual":4,"Mining":-2,"Cooking":-2,"Artistic":-2,"Crafting":4},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"StudentSocialite89","skills":{"Social":6},"disabledWork":["ManualDumb","ManualSkilled","Caring","Artistic"],"requiredWork":[],"traits":{}},{"name":"SuperSoldier99","skills":{"Plants":-3,"Shooting":3,"Melee":3,"Medicine":2},"disabledWork":["Social","Animals","Artistic"],"requiredWork":[],"traits":{}},{"name":"TechEnthusiast28","skills":{"Intellectual":4,"Shooting":4,"Social":-3},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"TechScholar75","skills":{"Intellectual":5,"Cooking":-2,"Crafting":2},"disabledWork":["Caring","Social"],"requiredWork":[],"traits":{}},{"name":"TechHead8","skills":{"Plants":2,"Intellectual":6,"Social":-1},"disabledWork":["Cleaning"],"requiredWork":[],"traits":{}},{"name":"TechnicalKid1","skills":{"Construction":2,"Medicine":3,"Crafting":2,"Animals":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"TestSubject15","skills":{"Shooting":4},"disabledWork":["Social","Caring","Firefighting"],"requiredWork":[],"traits":{}},{"name":"TestSubject82","skills":{"Intellectual":2,"Melee":2,"Cooking":1},"disabledWork":["Social","PlantWork","Mining"],"requiredWork":[],"traits":{}},{"name":"Tinkerer79","skills":{"Construction":2,"Crafting":4},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"Tinkerer11","skills":{"Intellectual":3,"Melee":-2,"Crafting":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"ToxicChild96","skills":{"Construction":3,"Crafting":3},"disabledWork":["Firefighting","PlantWork"],"requiredWork":[],"traits":{"Nerves":-1}},{"name":"TradersChild62","skills":{"Construction":-2,"Plants":-1,"Social":1,"Crafting":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"TragicLoner87","skills":{"Intellectual":4,"Artistic":-2,"Animals":2},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"TraineeAlchemist64","skills":{"Intellectual":3,"Cooking":4,"Medicine":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"TransferStudent10","skills":{"Intellectual":3,"Social":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"TraumatizedYouth87","skills":{"Melee":2,"Medicine":4},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"TribalThunderer45","skills":{"Shooting":5,"Medicine":2},"disabledWork":["Intellectual","Artistic","Crafting"],"requiredWork":[],"traits":{}},{"name":"TribeChild40","skills":{"Plants":2,"Melee":2,"Shooting":2,"Intellectual":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"TurtleHerder41","skills":{"Shooting":2,"Social":1,"Artistic":-2,"Animals":5},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"UnwantedSurvivor67","skills":{"Melee":3,"Shooting":2,"Cooking":2,"Medicine":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{"Tough":0,"Nerves":2}},{"name":"UpperUrbworlder12","skills":{"Construction":-3,"Intellectual":3,"Artistic":2,"Crafting":-3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"UrbanLordling82","skills":{"Construction":3,"Social":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"UrbworldArmyBrat84","skills":{"Construction":3,"Plants":-3,"Shooting":3,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"UrbworldChild56","skills":{"Plants":1,"Intellectual":1,"Shooting":3,"Artistic":1,"Crafting":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"UrbworldCriminal6","skills":{"Shooting":2,"Melee":3,"Medicine":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"UrbworldHooligan12","skills":{"Shooting":2,"Melee":3,"Cooking":-3},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"UrbworldUrchin61","skills":{"Melee":4,"Shooting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"UrbworldUrchin90","skills":{"Mining":4,"Melee":2},"disabledWork":["Artistic","Crafting"],"requiredWork":[],"traits":{}},{"name":"UrbworldUrchin6","skills":{"Melee":4,"Social":-2,"Crafting":2},"disabledWork":["PlantWork"],"requiredWork":[],"traits":{}},{"name":"VatgrownAssassin20","skills":{"Construction":2,"Shooting":4,"Melee":1},"disabledWork":["Caring","Artistic","Cooking","PlantWork"],"requiredWork":[],"traits":{"Psychopath":0}},{"name":"VatgrownMedic53","skills":{"Shooting":3,"Medicine":3},"disabledWork":["Social","Artistic","Crafting","Cooking"],"requiredWork":[],"traits":{}},{"name":"VatgrownScientist91","skills":{"Intellectual":5,"Medicine":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"VatgrownSlavegirl8","skills":{"Cooking":5,"Artistic":-2},"disabledWork":["Violent","Intellectual"],"requiredWork":[],"traits":{}},{"name":"VatgrownSoldier8","skills":{"Melee":4,"Shooting":4},"disabledWork":["Social","Caring"],"requiredWork":[],"traits":{}},{"name":"VengefulChild43","skills":{"Melee":3,"Shooting":3},"disabledWork":["Caring"],"requiredWork":[],"traits":{}},{"name":"VideoGamer55","skills":{"Intellectual":3,"Social":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"VideoGamer16","skills":{"Intellectual":3,"Shooting":2,"Melee":1},"disabledWork":["Artistic"],"requiredWork":[],"traits":{"DrugDesire":2}},{"name":"VidtubeStar98","skills":{"Social":2,"Cooking":2,"Artistic":2,"Crafting":1},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"VoyagerChild94","skills":{"Intellectual":4},"disabledWork":["Social"],"requiredWork":[],"traits":{}},{"name":"WarBastard60","skills":{"Animals":3},"disabledWork":["Violent"],"requiredWork":[],"traits":{"DislikesMen":0}},{"name":"WarChild24","skills":{"Shooting":5,"Melee":3},"disabledWork":["Caring","Artistic"],"requiredWork":[],"traits":{}},{"name":"WarRefugee51","skills":{"Cooking":2,"Crafting":2},"disabledWork":["Violent"],"requiredWork":[],"traits":{}},{"name":"WarRefugee96","skills":{"Intellectual":5,"Shooting":6,"Melee":5,"Cooking":-3},"disabledWork":["Social","Artistic","PlantWork"],"requiredWork":[],"traits":{}},{"name":"WastelandWanderer81","skills":{"Shooting":3,"Social":3,"Medicine":5,"Crafting":4},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"WealthyStudent59","skills":{"Construction":2,"Plants":-2,"Intellectual":4,"Mining":-2,"Cooking":-2,"Crafting":3},"disabledWork":["Animals","Cleaning"],"requiredWork":[],"traits":{}},{"name":"WildChild5","skills":{"Shooting":4,"Melee":6,"Social":-2,"Cooking":-3},"disabledWork":["Caring","Intellectual","Artistic","Cleaning"],"requiredWork":[],"traits":{"Ascetic":0}},{"name":"Winerunner8","skills":{"Melee":2,"Social":2,"Cooking":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{"Industriousness":1}},{"name":"WolfPackMember26","skills":{"Melee":8,"Social":-3},"disabledWork":["Firefighting"],"requiredWork":[],"traits":{}},{"name":"WorkCampSlave37","skills":{"Construction":2,"Plants":2,"Mining":2,"Social":-2},"disabledWork":["Intellectual"],"requiredWork":[],"traits":{"Tough":0}},{"name":"WorldSlider42","skills":{"Construction":-2,"Plants":-2,"Melee":3,"Medicine":4},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"WreckageExplorer93","skills":{"Animals":3,"Intellectual":3},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"YoungMaster23","skills":{"Intellectual":2,"Shooting":1,"Melee":2,"Social":2},"disabledWork":["ManualDumb"],"requiredWork":[],"traits":{}},{"name":"YoungPirate71","skills":{"Shooting":2,"Social":2,"Crafting":2},"disabledWork":[],"requiredWork":[],"traits":{}},{"name":"YoungPsychologist58","skills":{"Social":4,"Medicine":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{}},{"name":"YouthDelinquent30","skills":{"Shooting":3,"Melee":1,"Social":-1,"Crafting":4},"disabledWork":["Caring","Artistic","Cleaning"],"requiredWork":[],"traits":{}},{"name":"YouthSoldier99","skills":{"Construction":2,"Shooting":2,"Melee":2},"disabledWork":["Artistic"],"requiredWork":[],"traits":{"Industriousness":1}}];
+/** @type { NameIndex } */
+var childhoodIndex = {"MonkeyChild67":0,"MusicalKid14":1,"OldMoneyHeir46":2,"StewardsAssisant28":3,"VRAddict29":4,"AbandonedChild23":5,"AbandonedChild30":6,"AbandonedOrphan61":7,"Abductee43":8,"Abductee7":9,"AcademyStudent58":10,"AccursedChild88":11,"AdventuringChild30":12,"AdventurousYouth70":13,"AmateurAstronomer77":14,"AmateurBotanist79":15,"AmateurEngineer3":16,"AngryStudent88":17,"AnimalCaretaker20":18,"AnimalLabTech39":19,"AntisocialChild83":20,"ApocalypseChild23":21,"ApocalypseSurvivor23":22,"ApprenticeOracle83":23,"ApprenticeSmith37":24,"ArtSlave57":25,"ArtfulDodger78":26,"ArtisanFarmer23":27,"ArtisticWeirdo56":28,"AspergersRebel13":29,"AspiringEngineer58":30,"AspiringPhysicist47":31,"AspiringPopIdol28":32,"Athlete47":33,"AwkwardNerd48":34,"BlackjackPlayer76":35,"BlacksmithsSon73":36,"BlessedChild46":37,"BodyguardTrainee54":38,"BoneCollector14":39,"Bookworm19":40,"Bookworm3":41,"BoyScout42":42,"BoySoldier14":43,"BrothelGofer84":44,"BrutalThief59":45,"BuddingArtist44":46,"Bully70":47,"BunkerKid41":48,"Cadet96":49,"CaravanChild53":50,"CaravanTraveler6":51,"CatHerder4":52,"CaveChild30":53,"CaveChild17":54,"CaveworldTender26":55,"CaveworldTunneler48":56,"ChessMaster67":57,"ChildOfDrifters18":58,"ChildOfGlass61":59,"ChildProdigy76":60,"ChildResearcher32":61,"ChildScientist30":62,"ChildSlave58":63,"ChildSpy47":64,"ChildSpy84":65,"ChildStar74":66,"ChildKnave69":67,"CircusPerformer37":68,"ClassClown96":69,"CloneFarmed21":70,"ColiseumCleaner54":71,"Colonist22":72,"ColonyKid47":73,"ComaChild93":74,"CommonerHeir5":75,"Computer80":76,"ComputerGeek62":77,"ConstructionGrunt84":78,"ConventChild16":79,"CoreDilettante33":80,"CoreworldStudent50":81,"CorpStudent95":82,"CorpBredStudent54":83,"CorporateSlave22":84,"CountryChild95":85,"CountryLordling92":86,"CowFarmer39":87,"CrashBaby32":88,"CrimeBossChild39":89,"CultChild3":90,"CuriousChild33":91,"DataDecoder39":92,"DedicatedStudent12":93,"Delinquent13":94,"DesertRat47":95,"DiplomatsChild97":96,"DisasterSurvivor65":97,"DisasterSurvivor29":98,"DiscardedYouth93":99,"DisciplinedFarmer28":100,"DisplacedNoble67":101,"DreadedBaby56":102,"Dreamer79":103,"Drudge9":104,"DrugMule80":105,"DustyFarmHand75":106,"Empath47":107,"EnergeticPopIdol61":108,"ExiledPrince58":109,"FactoryDrone58":110,"FallenProdigy40":111,"FarmBoy64":112,"FarmHand2":113,"FarmKid60":114,"FarmMechanic1":115,"FarmerBoy88":116,"FarmersDaughter81":117,"FarmersSon20":118,"FeralChild96":119,"FeralChild85":120,"FeudalFarmBoy0":121,"FeudalLordling56":122,"FireKeeper44":123,"FireScarredChild1":124,"ForestChild83":125,"FoundryApprentice76":126,"Freethinker38":127,"FrightenedChild43":128,"FrontierMarshal54":129,"GNomeSculptor34":130,"GalacticPage37":131,"GameFanatic86":132,"GangMember83":133,"GangMember16":134,"GlitterworldKid85":135,"GlitterworldNerd20":136,"GlitterworldRoyal24":137,"GunKid30":138,"Gymnast48":139,"HackerKid98":140,"HackerProdigy84":141,"HeadjackAddict4":142,"HelpDeskWorker31":143,"Herder19":144,"HexCellArtist91":145,"Hideaway7":146,"HighBaroness37":147,"HillbillyProdigy60":148,"HistoryStudent12":149,"HunterScavenger64":150,"IcePlanetChild95":151,"IceworldSurvivor75":152,"IdealisticCadet64":153,"ImperialStudent49":154,"IndustrialOrphan13":155,"IndworldUrchin73":156,"Infantry99":157,"JoywireAddict76":158,"JungleKid35":159,"JunkyardMechanic51":160,"KidScientist53":161,"Killer41":162,"LabGrownChild22":163,"LaborCampOrphan91":164,"LogicalChild2":165,"Machinist56":166,"MadScientist47":167,"MarineCadet73":168,"MechanoidHacker93":169,"MechanoidNerd10":170,"MedicalAssistant12":171,"MedicalHelper27":172,"MedicalStudent96":173,"MedicalStudent38":174,"MedievalLordling19":175,"MedievalNomad12":176,"MedievalPlower14":177,"MedievalSlave49":178,"MedievalSlave50":179,"MedievalSquire5":180,"MedievalThief74":181,"MercenaryRecruit36":182,"MercenaryRecruit18":183,"MidworldCadet83":184,"MidworldGeek18":185,"MidworldLoner80":186,"MidworldSketcher71":187,"MilitantChild49":188,"MilitaryCadet16":189,"MilitaryCadet46":190,"MilitaryChild82":191,"MilitaryRecruit49":192,"MilitaryTrainee20":193,"MusicIdol50":194,"MusicalKid86":195,"Mute34":196,"Naturalist14":197,"NavyPathfinder53":198,"Nerd92":199,"NewAgeDuelist27":200,"NobleWard61":201,"OfficerCadet25":202,"OffworldRecruit91":203,"OptimisticChild30":204,"OrganFarm67":205,"Orphan15":206,"Orphan25":207,"Orphan11":208,"OrphanOfWar60":209,"OrphanedAcrobat84":210,"Pampered87":211,"PamperedLordling37":212,"PetKeeper7":213,"Philosopher82":214,"Pickpocket82":215,"Pickpocket61":216,"PilotFan16":217,"PitGladiator19":218,"PizzaLover94":219,"PlagueChild44":220,"PlagueProdigy12":221,"PlagueSurvivor39":222,"PoliticalCaptive7":223,"PoorKid18":224,"PowerMadScholar30":225,"PrivilegedChild86":226,"PrivilegedProdigy70":227,"ProdigalStudent67":228,"ProfessionalGamer76":229,"ProjectSubject99":230,"PsychologyStudent15":231,"Punk30":232,"PyroAssistant82":233,"Pyromaniac18":234,"QuietNerd97":235,"RangerChild57":236,"ReEducatedYouth23":237,"RebelChild8":238,"RebelSlave14":239,"RebelStudent14":240,"RebelWriter82":241,"RebelliousStudent74":242,"ReclusiveChild81":243,"ReclusiveProdigy96":244,"RichBoy9":245,"RichKid61":246,"RitualChild20":247,"RoyalBastard64":248,"Scavenger22":249,"Scavenger62":250,"SchoolyardOutcast11":251,"ScienceProdigy65":252,"Scout44":253,"Scout6":254,"Scrounger25":255,"SentimentalChild55":256,"ServingBoy97":257,"SewerKid57":258,"ShelterChild50":259,"ShipBoy89":260,"ShipChild46":261,"ShipTechnician0":262,"ShipboundLordling12":263,"ShootingComa59":264,"ShopKid36":265,"ShunnedGirl30":266,"SicklyChild55":267,"SicklyLiar3":268,"SlaveFarmer99":269,"SmallTownKid41":270,"SocialPariah3":271,"SoldierExperiment50":272,"SoldiersKid55":273,"SoleSurvivor21":274,"SoleSurvivor63":275,"SonOfAHuntress75":276,"SpaceCadet77":277,"SpaceFanboy22":278,"SpaceNerd97":279,"SpaceSmuggler6":280,"SpacerOrphan77":281,"SpaceyachtPilot89":282,"SpeederRacer71":283,"SpoiledBrat59":284,"SpoiledChild33":285,"SpoiledChild80":286,"Stableboy49":287,"StarSquire9":288,"StarforceCadet79":289,"StationWhelp94":290,"SteamworldTinker38":291,"StoryWriter67":292,"Straggler71":293,"StreetChild4":294,"StreetKid19":295,"StreetPeddler66":296,"StreetRat81":297,"StreetUrchin45":298,"StreetUrchin53":299,"StreetUrchin74":300,"Student65":301,"StudentEngineer34":302,"StudentSocialite89":303,"SuperSoldier99":304,"TechEnthusiast28":305,"TechScholar75":306,"TechHead8":307,"TechnicalKid1":308,"TestSubject15":309,"TestSubject82":310,"Tinkerer79":311,"Tinkerer11":312,"ToxicChild96":313,"TradersChild62":314,"TragicLoner87":315,"TraineeAlchemist64":316,"TransferStudent10":317,"TraumatizedYouth87":318,"TribalThunderer45":319,"TribeChild40":320,"TurtleHerder41":321,"UnwantedSurvivor67":322,"UpperUrbworlder12":323,"UrbanLordling82":324,"UrbworldArmyBrat84":325,"UrbworldChild56":326,"UrbworldCriminal6":327,"UrbworldHooligan12":328,"UrbworldUrchin61":329,"UrbworldUrchin90":330,"UrbworldUrchin6":331,"VatgrownAssassin20":332,"VatgrownMedic53":333,"VatgrownScientist91":334,"VatgrownSlavegirl8":335,"VatgrownSoldier8":336,"VengefulChild43":337,"VideoGamer55":338,"VideoGamer16":339,"VidtubeStar98":340,"VoyagerChild94":341,"WarBastard60":342,"WarChild24":343,"WarRefugee51":344,"WarRefugee96":345,"WastelandWanderer81":346,"WealthyStudent59":347,"WildChild5":348,"Winerunner8":349,"WolfPackMember26":350,"WorkCampSlave37":351,"WorldSlider42":352,"WreckageExplorer93":353,"YoungMaster23":354,"YoungPirate71":355,"YoungPsychologist58":356,"YouthDelinquent30":357,"YouthSoldier99":358};
\ No newline at end of file
@@ -0,0 +1,80 @@
+// Loads the chunked outputs written with --chunks (scripts/chunks.py): a small manifest per output,
+// then each chunk only when it's asked for, e.g.
+//   await loadChunk("genes", "Misc")                        -> {genes: {defName: gene}}
+//   await loadChunk("strings/English/backstories", "titles") -> {adulthoods: {defName: {title, titleShort}}, ...}
+// Uses mergeStrings from strings.js
+
+/** @type {Object.<string, Promise<{chunks: Object.<string, {file: string, bytes: number, names: Object.<string, string[]>}>}>>} */
+const chunkManifests = {};
+/** @type {Object.<string, Promise<Object.<string, Object.<string, Object>>>>} */
+const loadedChunks = {};
+
+/** @param {string} path */
+function chunkURL(path) {
+    return "./chunks/" + path.split("/").map(encodeURIComponent).join("/");
+}
+
+/**
+ * The manifest of an output (e.g. "genes" or "strings/English/genes"), fetched once
+ * @param {string} path
+ */
+function loadManifest(path) {
+    if (!(path in chunkManifests)) {
+        chunkManifests[path] = fetch(chunkURL(path) + ".json", { cache: "no-cache" }).then((r) => {
+            if (!r.ok)
+                throw new Error(`Couldn't load the ${path} manifest`);
+            return r.json();
+        });
+    }
+    return chunkManifests[path];
+}
+
+/**
+ * A chunk of an output, fetched once
+ * @param {string} path
+ * @param {string} chunk
+ * @returns {Promise<Object.<string, Object.<string, Object>>>} dataset -> name -> record, or the part of it in this chunk
+ */
+function loadChunk(path, chunk) {
+    const key = `${path}/${chunk}`;
+    if (!(key in loadedChunks)) {
+        loadedChunks[key] = loadManifest(path).then(async (manifest) => {
+            if (!(chunk in manifest.chunks))
+                throw new Error(`${path} has no chunk ${chunk}`);
+            const r = await fetch(`${chunkURL(path)}/${encodeURIComponent(manifest.chunks[chunk].file)}`);
+            if (!r.ok)
+                throw new Error(`Couldn't load ${key}`);
+            return r.json();
+        });
+    }
+    return loadedChunks[key];
+}
+
+/**
+ * The chunks of an output holding (part of) a record, e.g. which descriptions chunk has a backstory
+ * @param {string} path
+ * @param {string} dataset
+ * @param {string} name
+ * @returns {Promise<string[]>}
+ */
+async function chunksWith(path, dataset, name) {
+    const manifest = await loadManifest(path);
+    return Object.keys(manifest.chunks).filter((chunk) => (manifest.chunks[chunk].names[dataset] || []).includes(name));
+}
+
+/**
+ * Adds a chunk's records to records and index, merging parts of records that are already there
+ * @param {Object[]} records
+ * @param {NameIndex} index
+ * @param {Object.<string, Object>} [chunkRecords] one dataset of a chunk
+ */
+function mergeChunk(records, index, chunkRecords) {
+    for (const [name, record] of Object.entries(chunkRecords || {})) {
+        if (name in index) {
+            mergeStrings(records[index[name]], record);
+        } else {
+            index[name] = records.length;
+            records.push({ name: name, ...record });
+        }
+    }
+}
@@ -74,7 +74,7 @@ function disabledWorkDesc(disabledWork) {
 function requiredTraitDesc(requiredTraits) {
     let out = "";
     for (const key in requiredTraits) {
-        let label = traits.find((value) => value.name == key).degrees[requiredTraits[key].toString()].label;
+        let label = traits[traitIndex[key]].degrees[requiredTraits[key].toString()].label;
         out += `\nForced trait: ${label}`
     }
     return out;
@@ -147,18 +147,60 @@ function buildTraitDegreeDescription(trait, degree) {
 }
 
 // ==================================
+/**
+ * The file an atlas page is saved as, e.g. genes.png, genes_1.png, ... (as scripts/graphics.py pageName)
+ * @param {string} atlas the first page's file
+ * @param {number} page
+ * @returns {string}
+ */
+function atlasPageName(atlas, page) {
+    if (!page)
+        return atlas;
+    const dot = atlas.lastIndexOf(".");
+    return `${atlas.slice(0, dot)}_${page}${atlas.slice(dot)}`;
+}
+
+/**
+ * Builds the inline CSS style string cropping a sprite out of its atlas page.
+ * A trimmed sprite is padded back to its texture's size, so it lines up as the untrimmed texture would
+ * @param {Sprite} sprite
+ * @param {string} atlas the first page's file, e.g. "genes.png"
+ * @returns {string}
+ */
+function buildSpriteStyle(sprite, atlas) {
+    let style = `width: ${sprite.w}px; height: ${sprite.h}px; background-image: url(./${atlasPageName(atlas, sprite.page)}); background-repeat: no-repeat; background-origin: content-box; background-clip: content-box; background-position: -${sprite.x}px -${sprite.y}px;`;
+    if (sprite.sourceW !== undefined) {
+        const right = sprite.sourceW - sprite.w - sprite.trimX, bottom = sprite.sourceH - sprite.h - sprite.trimY;
+        style += `padding: ${sprite.trimY}px ${right}px ${bottom}px ${sprite.trimX}px;`;
+    }
+    return style;
+}
+
 /**
  * Builds the inline CSS style string for the gene image, including cropping and (if applicable) colorization
  * @param {Gene} gene 
  * @returns {string}
  */
 function buildGeneImageStyle(gene) {
-    let imgStyle = `width: 128px; height: 128px; background-image: url(./genes.png); background-clip: border-box; background-position: -${gene.iconPath.x}px -${gene.iconPath.y}px;`;
+    let imgStyle = buildSpriteStyle(gene.iconPath, "genes.png");
+    // Icons packed with --tint-icons already have their colour
     /** @type {RGBA | {R: number, G: number, B: number, A: number}} */
-    let mixColor = gene.skinColor || gene.skinColorOverride || gene.hairColor;
+    let mixColor = gene.iconPath.tinted ? undefined : gene.iconColor || gene.skinColor || gene.skinColorOverride || gene.hairColor;
     if (mixColor) {
         mixColor = RGBA.fromJSON(mixColor);
         imgStyle += `filter: url(#${colorizer(mixColor).id});`;
     }
     return imgStyle;
-}
\ No newline at end of file
+}
+
+/**
+ * Builds the inline CSS style string for a head, hair or beard's south-facing image,
+ * or an empty string if its texture isn't in bodyparts.png
+ * @param {HeadType | HairBeardType} part
+ * @returns {string}
+ */
+function buildBodyPartImageStyle(part) {
+    if (typeof part.graphicPath !== "object")
+        return "";
+    return buildSpriteStyle(part.graphicPath, "bodyparts.png");
+}
@@ -1,2 +1,6 @@
 /** @type { Gene[] } */
-var genes = [{"name":"FireSpew","label":"fire spew","desc":"Carriers are able to spew flammable bile generated by a special organ in their neck. The bile sticks to anything in a small area and can ignite people, objects, and the ground.","iconPath":{"x":1024,"y":384},"displayCategory":"Ability","displayOrder":0,"metabolism":-2,"complexity":1,"abilities":["FireSpew"]},{"name":"FoamSpray","label":"foam spray","desc":"Carriers grow glands in the neck that generate and store a fire-retardant foam. They can spew this foam over an area to extinguish fires.","iconPath":{"x":1152,"y":384},"displayCategory":"Ability","displayOrder":0,"metabolism":-2,"complexity":1,"abilities":["FoamSpray"]},{"name":"LongjumpLegs","label":"longjump legs","desc":"Carriers have special hemogen-powered muscle fibers in their legs which allow them to jump great distances.","iconPath":{"x":768,"y":640},"displayCategory":"Hemogen","displayOrder":0,"metabolism":-2,"complexity":1,"abilities":["Longjump"]},{"name":"AnimalWarcall","label":"animal warcall","desc":"Carriers of this gene can perform an animal warcall, using a powerful bellow and psychic connection to call an animal to fight for them.","iconPath":{"x":512,"y":128},"displayCategory":"Ability","displayOrder":0,"metabolism":-3,"complexity":1,"abilities":["AnimalWarcall"]},{"name":"Bloodfeeder","label":"bloodfeeder","desc":"Carriers of this gene have small retractable fangs and an organ on the roof of the mouth which can extract hemogen from fresh warm blood. They can bite an unresisting person, suck the blood, and gain hemogen directly.","iconPath":{"x":1152,"y":128},"displayCategory":"Hemogen","displayOrder":0,"metabolism":-1,"complexity":1,"abilities":["Bloodfeed"]},{"name":"Coagulate","label":"coagulate","labelShortAdj":"coagulator","desc":"Carriers of this gene have special glands on their hands and wrists, as well as a unique salivary compound that they can use to rapidly tend wounds.","iconPath":{"x":0,"y":256},"displayCategory":"Hemogen","displayOrder":0,"metabolism":-1,"complexity":1,"abilities":["Coagulate"]},{"name":"XenogermReimplanter","label":"gene implanter","labelShortAdj":"reimplanter","desc":"Carriers of this gene can implant a copy of their xenogerm into another person through a somewhat gross-looking injector organ. Their own genetic material will then regrow very slowly. If they implant while their genes are regrowing, they will die.","iconPath":{"x":128,"y":1280},"displayCategory":"Archite","displayOrder":0,"metabolism":0,"complexity":3,"abilities":["ReimplantXenogerm"]},{"name":"PiercingSpine","label":"piercing spine","desc":"Carriers grow an opening in their upper chest along with a quiver of keratin spines. Using a hemogen-powered chemical reaction, they can fire these spines at high speed at nearby targets with surprising accuracy.","iconPath":{"x":128,"y":896},"displayCategory":"Hemogen","displayOrder":0,"metabolism":-1,"complexity":1,"abilities":["PiercingSpine"]},{"name":"AcidSpray","label":"acid spray","desc":"Carriers grow glands in the neck that generate and store a sticky acid substance, along with acid-tolerant tissues in the mouth. They can spew this acid over an area, where it will stick to enemies and burn them over time.","iconPath":{"x":128,"y":128},"displayCategory":"Ability","displayOrder":0,"metabolism":-2,"complexity":1,"abilities":["AcidSpray"]},{"name":"Hair_BaldOnly","label":"no hair","labelShortAdj":"bald","desc":"Carriers of this gene grow no hair on the head.","iconPath":{"x":128,"y":512},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":50,"metabolism":0,"complexity":0,"exclusionTags":["HairStyle"]},{"name":"Hair_ShortOnly","label":"short-haired","labelShortAdj":"crop","desc":"Carriers of this gene can only grow short hair.","iconPath":{"x":384,"y":512},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":55,"metabolism":0,"complexity":0,"exclusionTags":["HairStyle"]},{"name":"Hair_LongOnly","label":"long-haired","desc":"Carriers of this gene grow hair on the head very quickly.","iconPath":{"x":256,"y":512},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":57,"metabolism":0,"complexity":0,"exclusionTags":["HairStyle"]},{"name":"Hair_Grayless","label":"grayless hair","desc":"Carriers of this gene keep their natural hair color as they age.","iconPath":{"x":1664,"y":384},"displayCategory":"Miscellaneous","displayOrder":195,"metabolism":0,"complexity":1},{"name":"Beard_BushyOnly","label":"only bushy beards","labelShortAdj":"bushy","desc":"Male carriers of this gene experience rapid beard growth and are uncomfortable cutting their beards.","iconPath":{"x":768,"y":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":60,"metabolism":0,"complexity":0,"exclusionTags":["BeardStyle"]},{"name":"Beard_NoBeardOnly","label":"beardless","labelShortAdj":"beardless","desc":"Carriers of this gene grow no facial hair.","iconPath":{"x":896,"y":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":65,"metabolism":0,"complexity":0,"exclusionTags":["BeardStyle"]},{"name":"Beard_Always","label":"unisex beards","labelShortAdj":"bearded","desc":"Carriers of this gene always have thick facial hair, even women.","iconPath":{"x":256,"y":1152},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":66,"metabolism":0,"complexity":0,"exclusionTags":["BeardStyle"]},{"name":"Skin_InkBlack","label":"ink black skin","labelShortAdj":"noir","desc":"Carriers of this gene produce a pigment that turns their skin a pale black color almost as dark as ink.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":99,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":55,"G":55,"B":55,"A":1.0}},{"name":"Skin_SlateGray","label":"slate gray skin","labelShortAdj":"slate","desc":"Carriers of this gene produce a pigment that turns their skin slate gray.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":97,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":90,"G":90,"B":90,"A":1.0}},{"name":"Skin_LightGray","label":"light gray skin","labelShortAdj":"gray","desc":"Carriers of this produce a light-gray pigment in their skin.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":95,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":200,"G":200,"B":200,"A":1.0}},{"name":"Skin_SheerWhite","label":"sheer white skin","labelShortAdj":"pale","desc":"Carriers of this gene have sheer white skin, unlike natural skin tones, due to a special engineered reflective cell covering.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":93,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":250,"G":240,"B":240,"A":1.0}},{"name":"Skin_Blue","label":"blue skin","labelShortAdj":"blue","desc":"Carriers of this gene produce a pigment that turns their skin a blue color.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":88,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":100,"G":165,"B":193,"A":1.0}},{"name":"Skin_Purple","label":"purple skin","labelShortAdj":"purple","desc":"Carriers of this gene produce a pigment that gives their skin a purple color.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":85,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":97,"G":87,"B":195,"A":1.0}},{"name":"Skin_PaleRed","label":"pale red skin","labelShortAdj":"pink","desc":"Carriers of this gene produce a pigment that turns their skin a moderate red color.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":78,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":222,"G":106,"B":106,"A":1.0}},{"name":"Skin_DeepRed","label":"deep red skin","labelShortAdj":"red","desc":"Carriers of this gene produce a deep-red pigment that gives their skin an almost bloody appearance.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":75,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":150,"G":62,"B":62,"A":1.0}},{"name":"Skin_PaleYellow","label":"pale yellow skin","labelShortAdj":"cream","desc":"Carriers of this gene produce a pigment that turns their skin a grayish yellow color.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":68,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":193,"G":165,"B":99,"A":1.0}},{"name":"Skin_DeepYellow","label":"deep yellow skin","labelShortAdj":"yellow","desc":"Carriers of this gene produce a pigment that gives their skin a deep yellow color.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":65,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":204,"G":199,"B":65,"A":1.0}},{"name":"Skin_Orange","label":"orange skin","labelShortAdj":"orange","desc":"Carriers of this gene produce a pigment that gives their skin an orange color.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":69,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":210,"G":114,"B":63,"A":1.0}},{"name":"Skin_Green","label":"green skin","labelShortAdj":"green","desc":"Carriers of this gene produce a pigment that gives their skin a green color.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":0,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":169,"G":182,"B":108,"A":1.0}},{"name":"Furskin","label":"furskin","labelShortAdj":"furskinned","desc":"Carriers of this gene grow thick fur all over their body, which protects them from cold temperatures.","iconPath":{"x":1280,"y":384},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Miscellaneous","displayOrder":400,"metabolism":-1,"complexity":1,"exclusionTags":["HairStyle","Fur","BeardStyle"],"statOffsets":{"ComfyTemperatureMin":-10.0}},{"name":"Eyes_Red","label":"red eyes","labelShortAdj":"red-eyed","desc":"Carriers of this gene have deeply red-pigmented eyes.","iconPath":{"x":1152,"y":896},"displayCategory":"Cosmetic","displayOrder":0,"metabolism":0,"complexity":0,"exclusionTags":["EyeColor"]},{"name":"Eyes_Gray","label":"gray eyes","labelShortAdj":"gray-eyed","desc":"Carriers of this gene have pale white-gray eyes.","iconPath":{"x":1536,"y":384},"displayCategory":"Cosmetic","displayOrder":1,"metabolism":0,"complexity":0,"exclusionTags":["EyeColor"]},{"name":"Brow_Heavy","label":"heavy brow","desc":"Carriers of this gene have a prominent brow.","iconPath":{"x":1152,"y":512},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":100,"metabolism":0,"complexity":0},{"name":"Tail_Furry","label":"furry tail","desc":"Carriers of this gene grow a fluffy tail which partially protects them from cold temperatures.","iconPath":{"x":1152,"y":1024},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Miscellaneous","displayOrder":1000,"metabolism":-1,"complexity":1,"exclusionTags":["Tail"],"statOffsets":{"ComfyTemperatureMin":-10.0}},{"name":"Tail_Smooth","label":"smooth tail","desc":"Carriers of this gene grow a slender tail that can act as a dexterous fifth limb.","iconPath":{"x":1280,"y":1024},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Miscellaneous","displayOrder":1000,"metabolism":-1,"complexity":1,"exclusionTags":["Tail"]},{"name":"FacialRidges","label":"facial ridges","desc":"Carriers of this gene grow raised ridges of skin on their face.","iconPath":{"x":256,"y":384},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":500,"metabolism":0,"complexity":0},{"name":"Body_Fat","label":"fat body","desc":"Carriers can have fat bodies. A person can have more than one body type gene; one body type will be chosen among those that are allowed.","iconPath":{"x":1280,"y":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic_Body","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["BodyType"],"endogeneCategory":"BodyType","bodyType":"Fat"},{"name":"Body_Thin","label":"thin body","desc":"Carriers can have thin bodies. A person can have more than one body type gene; one body type will be chosen among those that are allowed.","iconPath":{"x":1664,"y":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic_Body","displayOrder":10,"metabolism":0,"complexity":0,"exclusionTags":["BodyType"],"endogeneCategory":"BodyType","bodyType":"Thin"},{"name":"Body_Hulk","label":"hulk body","desc":"Carriers can have large bodies. A person can have more than one body type gene; one body type will be chosen among those that are allowed.","iconPath":{"x":1408,"y":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic_Body","displayOrder":30,"metabolism":0,"complexity":0,"exclusionTags":["BodyType"],"endogeneCategory":"BodyType","bodyType":"Hulk"},{"name":"Body_Standard","label":"standard body","desc":"Carriers can have average-shaped bodies. A person can have more than one body type gene; one body type will be chosen among those that are allowed.","iconPath":{"x":1536,"y":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic_Body","displayOrder":0,"metabolism":0,"complexity":0,"exclusionTags":["BodyType"],"endogeneCategory":"BodyType","bodyType":"Standard"},{"name":"Ears_Human","label":"human ears","desc":"Carriers of this gene have regular human ears.","iconPath":{"x":1152,"y":256},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":70,"metabolism":0,"complexity":0,"exclusionTags":["Ears"],"endogeneCategory":"Ears"},{"name":"Ears_Pig","label":"pig ears","desc":"Carriers of this gene will grow pointed pig-like ears.","iconPath":{"x":1280,"y":256},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":70,"metabolism":0,"complexity":0,"exclusionTags":["Ears"],"endogeneCategory":"Ears"},{"name":"Ears_Floppy","label":"floppy ears","desc":"Carriers of this gene grow long, floppy hound-like ears.","iconPath":{"x":1024,"y":256},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":70,"metabolism":0,"complexity":0,"exclusionTags":["Ears"],"endogeneCategory":"Ears"},{"name":"Ears_Cat","label":"cat ears","desc":"Carriers of this gene have cat-like ears.","iconPath":{"x":896,"y":256},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":70,"metabolism":0,"complexity":0,"exclusionTags":["Ears"],"endogeneCategory":"Ears"},{"name":"Ears_Pointed","label":"pointed ears","desc":"Carriers of this gene have pointed ears.","iconPath":{"x":1408,"y":256},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":70,"metabolism":0,"complexity":0,"exclusionTags":["Ears"],"endogeneCategory":"Ears"},{"name":"Nose_Human","label":"human nose","desc":"Carriers of this gene have regular human noses.","iconPath":{"x":896,"y":768},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":80,"metabolism":0,"complexity":0,"exclusionTags":["Nose"],"endogeneCategory":"Nose"},{"name":"Nose_Pig","label":"pig nose","desc":"Carriers of this gene have pig-like snouts.","iconPath":{"x":1024,"y":768},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Miscellaneous","displayOrder":410,"metabolism":0,"complexity":0,"exclusionTags":["Nose"],"endogeneCategory":"Nose"},{"name":"Jaw_Baseline","label":"human jaw","desc":"Carriers of this gene have regularly-shaped jaws.","iconPath":{"x":256,"y":640},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":90,"metabolism":0,"complexity":0,"exclusionTags":["Jaw"],"endogeneCategory":"Jaw"},{"name":"Jaw_Heavy","label":"heavy jaw","desc":"Carriers of this gene have large jaws.","iconPath":{"x":384,"y":640},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":95,"metabolism":0,"complexity":0,"exclusionTags":["Jaw"],"endogeneCategory":"Jaw"},{"name":"Head_Gaunt","label":"gaunt head","desc":"Carriers of this gene have a pinched, gaunt appearance in their face and head.","iconPath":{"x":1408,"y":384},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":97,"metabolism":0,"complexity":0,"exclusionTags":["Jaw"],"endogeneCategory":"Jaw"},{"name":"Hands_Human","label":"human hands","desc":"Carriers of this gene have regular human hands.","iconPath":{"x":512,"y":512},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Miscellaneous","displayOrder":300,"metabolism":0,"complexity":0,"exclusionTags":["Hands"],"endogeneCategory":"Hands"},{"name":"Hands_Pig","label":"trotter hands","desc":"Carriers of this gene have hands that partially resemble pig trotters. This reduces their ability to manipulate objects.","iconPath":{"x":640,"y":512},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Miscellaneous","displayOrder":310,"metabolism":1,"complexity":1,"exclusionTags":["Hands"],"endogeneCategory":"Hands"},{"name":"ElongatedFingers","label":"elongated fingers","desc":"Long, delicate fingers improve the carrier's manipulation capacity. This aids with many tasks, especially crafting and construction.","iconPath":{"x":1536,"y":256},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Miscellaneous","displayOrder":320,"metabolism":-1,"complexity":1,"exclusionTags":["Hands"],"endogeneCategory":"Hands"},{"name":"Headbone_Human","label":"human headbone","desc":"Carriers of this gene have regular human skulls.","iconPath":{"x":896,"y":512},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":110,"metabolism":0,"complexity":0,"exclusionTags":["Headbone"],"endogeneCategory":"Headbone"},{"name":"Headbone_MiniHorns","label":"mini-horns","desc":"Carriers of this gene grow two small horns protruding from the forehead.","iconPath":{"x":1024,"y":512},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":110,"metabolism":0,"complexity":0,"exclusionTags":["Headbone"],"endogeneCategory":"Headbone"},{"name":"Headbone_CenterHorn","label":"center-horn","desc":"Carriers of this gene grow a single horn protruding from the center of the forehead.","iconPath":{"x":768,"y":512},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":110,"metabolism":0,"complexity":0,"exclusionTags":["Headbone"],"endogeneCategory":"Headbone"},{"name":"Voice_Human","label":"human voice","desc":"Carriers of this gene have regular human vocal chords.","iconPath":{"x":896,"y":1152},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":120,"metabolism":0,"complexity":0,"exclusionTags":["Voice"],"endogeneCategory":"Voice"},{"name":"VoicePig","label":"pig voice","desc":"Carriers have a squealing voice like that of a pig.","iconPath":{"x":1024,"y":1152},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":125,"metabolism":0,"complexity":0,"exclusionTags":["Voice"],"endogeneCategory":"Voice"},{"name":"VoiceRoar","label":"roar voice","desc":"Carriers have an animal-like roaring voice.","iconPath":{"x":1152,"y":1152},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":130,"metabolism":0,"complexity":0,"exclusionTags":["Voice"],"endogeneCategory":"Voice"},{"name":"WoundHealing_Slow","label":"slow wound healing","labelShortAdj":"slow-heal","desc":"Carriers of this gene heal from wounds half as fast as normal.","iconPath":{"x":1664,"y":1152},"displayCategory":"Healing","displayOrder":30,"metabolism":2,"complexity":1,"exclusionTags":["WoundHealingRate"],"statFactors":{"InjuryHealingFactor":0.5}},{"name":"WoundHealing_Fast","label":"fast wound healing","labelShortAdj":"fast-heal","desc":"Carriers of this gene heal from wounds twice as fast as normal.","iconPath":{"x":1536,"y":1152},"displayCategory":"Healing","displayOrder":40,"metabolism":-2,"complexity":1,"exclusionTags":["WoundHealingRate"],"statFactors":{"InjuryHealingFactor":2.0}},{"name":"WoundHealing_SuperFast","label":"superfast wound healing","labelShortAdj":"super-heal","desc":"Carriers of this gene heal from wounds four times as fast as normal.","iconPath":{"x":0,"y":1280},"displayCategory":"Healing","displayOrder":50,"metabolism":-3,"complexity":1,"exclusionTags":["WoundHealingRate"],"statFactors":{"InjuryHealingFactor":4.0}},{"name":"Immunity_Weak","label":"weak immunity","labelShortAdj":"susceptible","desc":"Carriers of this gene gain immunity to diseases more slowly than normal. They may die from infections that others would survive.","iconPath":{"x":1280,"y":1152},"displayCategory":"Healing","displayOrder":0,"metabolism":2,"complexity":1,"exclusionTags":["Immunity"],"statFactors":{"ImmunityGainSpeed":0.9}},{"name":"Immunity_Strong","label":"strong immunity","labelShortAdj":"immune","desc":"Carriers of this gene gain immunity to diseases faster than normal.","iconPath":{"x":512,"y":1024},"displayCategory":"Healing","displayOrder":10,"metabolism":-1,"complexity":1,"exclusionTags":["Immunity"],"statFactors":{"ImmunityGainSpeed":1.1}},{"name":"Immunity_SuperStrong","label":"super immunity","labelShortAdj":"super-immune","desc":"Carriers of this gene gain immunity to diseases considerably faster than normal.","iconPath":{"x":896,"y":1024},"displayCategory":"Healing","displayOrder":20,"metabolism":-2,"complexity":2,"exclusionTags":["Immunity"],"statFactors":{"ImmunityGainSpeed":1.5}},{"name":"ToxicEnvironmentResistance_Partial","label":"partial antitoxic lungs","labelShortAdj":"tox-resistant","desc":"Carriers of this gene are resistant to environmental toxins. They get less toxic buildup from tox gas, polluted terrain, and toxic fallout, but are still vulnerable to direct attacks with venom or injected poison. Additionally, they build up rot stink exposure slower.","iconPath":{"x":1408,"y":768},"displayCategory":"ResistanceAndWeakness","displayOrder":20,"metabolism":-1,"complexity":1,"exclusionTags":["ToxicEnvironmentResistance"],"statOffsets":{"ToxicEnvironmentResistance":0.5}},{"name":"ToxicEnvironmentResistance_Total","label":"total antitoxic lungs","labelShortAdj":"tox-immune","desc":"Carriers of this gene are immune to environmental toxins, but not from direct toxic attacks. They get no toxic buildup from tox gas, polluted terrain, or toxic fallout, and they are not bothered by acidic smog. They are still vulnerable to direct attacks like venom and injected poison. Additionally, they are immune to rot stink exposure.","iconPath":{"x":1536,"y":1024},"displayCategory":"ResistanceAndWeakness","displayOrder":30,"metabolism":-3,"complexity":2,"exclusionTags":["ToxicEnvironmentResistance"],"statOffsets":{"ToxicEnvironmentResistance":1.0}},{"name":"Sterile","label":"sterile","desc":"Carriers of this gene cannot reproduce by natural means.","iconPath":{"x":384,"y":1024},"displayCategory":"Reproduction","displayOrder":100,"metabolism":1,"complexity":1,"exclusionTags":["Fertility"],"statFactors":{"Fertility":0.0}},{"name":"Fertile","label":"fertile","desc":"Carriers of this gene have a higher chance of becoming pregnant or impregnating others.","iconPath":{"x":512,"y":384},"displayCategory":"Reproduction","displayOrder":110,"metabolism":0,"complexity":1,"exclusionTags":["Fertility"],"statFactors":{"Fertility":2.0}},{"name":"Superclotting","label":"superclotting","desc":"Carriers of this gene have extra-power coagulating factors in their blood, and will stop bleeding very quickly when wounded.","iconPath":{"x":1024,"y":1024},"displayCategory":"Healing","displayOrder":100,"metabolism":-1,"complexity":1},{"name":"KindInstinct","label":"kind instinct","labelShortAdj":"kind","desc":"Carriers of this gene are high in trait agreeableness and are very conscientious. They rarely insult others and will sometimes offer kind words to brighten the moods of those around them. They also never judge people by their appearance.","iconPath":{"x":640,"y":640},"displayCategory":"Violence","displayOrder":60,"metabolism":-1,"complexity":1,"traits":{"Kind":0}},{"name":"ViolenceDisabled","label":"violence disabled","labelShortAdj":"nonviolent","desc":"Carriers of this gene are emotionally and mentally incapable of engaging in violence. They are overwhelmingly resistant to and horrified by the idea of hurting another.","iconPath":{"x":768,"y":1152},"displayCategory":"Violence","displayOrder":50,"metabolism":3,"complexity":1,"exclusionTags":["MeleeDamage","ShootingAccuracy","Aggressive","KillThirst"],"disabledWork":["Violent"]},{"name":"Nearsighted","label":"nearsighted","desc":"Carriers of this gene have difficulty seeing at a distance. Their shooting accuracy at long ranges is reduced.","iconPath":{"x":512,"y":768},"displayCategory":"Miscellaneous","displayOrder":50,"metabolism":2,"complexity":1,"exclusionTags":["ShootingAccuracy"],"statFactors":{"ShootingAccuracyFactor_Long":0.25,"ShootingAccuracyFactor_Medium":0.5}},{"name":"StrongStomach","label":"strong stomach","desc":"Carriers of this gene have an extra toxin-filtering organ in their stomach and will never suffer from food poisoning even after eating rotten food.","iconPath":{"x":768,"y":1024},"displayCategory":"Miscellaneous","displayOrder":9,"metabolism":-1,"complexity":1},{"name":"DarkVision","label":"dark vision","desc":"Carriers of this gene see well in low light and are unaffected by mood penalties related to darkness. They have a reflective layer behind the retina that amplifies their ability to see in the dark.","iconPath":{"x":128,"y":256},"displayCategory":"Miscellaneous","displayOrder":60,"metabolism":-1,"complexity":1},{"name":"KillThirst","label":"kill thirst","labelShortAdj":"kill-thirsty","desc":"Carriers of this gene lust for the feeling of ending another's life. They will become irritated if they go for too long without killing someone in close combat.","iconPath":{"x":512,"y":640},"displayCategory":"Violence","displayOrder":60,"metabolism":4,"complexity":1,"exclusionTags":["KillThirst"]},{"name":"FireResistant","label":"fire resistant","labelShortAdj":"fireproof","desc":"Carriers of this gene have special fast-acting sweat glands and heat-resistant skin. They only take 25% of the normal damage from fire. The chance of them catching on fire is also drastically reduced.","iconPath":{"x":640,"y":384},"displayCategory":"ResistanceAndWeakness","displayOrder":60,"metabolism":-2,"complexity":1,"exclusionTags":["FireDamage"],"statFactors":{"Flammability":0.1},"damageFactors":{"Flame":0.25}},{"name":"Inbred","label":"inbred","desc":"This genetic condition affects a person's fertility, immunity, and mental capacity.","iconPath":{"x":0,"y":640},"displayCategory":"Miscellaneous","displayOrder":110,"metabolism":-2,"complexity":1,"traits":{"SlowLearner":0},"statFactors":{"Fertility":0.5,"ImmunityGainSpeed":0.85}},{"name":"RobustDigestion","label":"robust digestion","desc":"Carriers of this gene grow a multi-fold stomach, allowing them to digest raw foods more efficiently than baseline humans. In general, they get the same nutrition from raw food as from if it is cooked. They also don't mind the taste of raw food at all.","iconPath":{"x":1280,"y":896},"displayCategory":"Miscellaneous","displayOrder":10,"metabolism":-2,"complexity":2,"statFactors":{"RawNutritionFactor":1.8}},{"name":"Instability_Mild","label":"mild cell instability","desc":"Carriers of this gene need less metabolic energy to stay alive, at the cost of reduced stability in their cell-replication machinery.","iconPath":{"x":1536,"y":640},"displayCategory":"Miscellaneous","displayOrder":130,"metabolism":2,"complexity":1,"exclusionTags":["CellInstability"],"statFactors":{"LifespanFactor":0.8,"CancerRate":3.0,"ImmunityGainSpeed":0.96}},{"name":"Instability_Major","label":"major cell instability","desc":"Carriers of this gene need much less metabolic energy to stay alive, at the cost of greatly-reduced stability in their cell-replication machinery.","iconPath":{"x":1024,"y":640},"displayCategory":"Miscellaneous","displayOrder":135,"metabolism":4,"complexity":1,"exclusionTags":["CellInstability"],"statFactors":{"LifespanFactor":0.6,"CancerRate":5.0,"ImmunityGainSpeed":0.92}},{"name":"PsychicBonding","label":"psychic bonding","desc":"Carriers of this gene have a special neural organ that makes them psychically bond with a lover for life. As long as the lovers are together, they will be happy. If they are physically separated, they will be disturbed by the distance. If one dies, the other's mind will be badly disrupted.","iconPath":{"x":512,"y":896},"displayCategory":"Psychic","displayOrder":100,"metabolism":-1,"complexity":1},{"name":"PollutionRush","label":"pollution stimulus","desc":"Carriers of this gene get a chemical rush from being exposed to pollution. This makes them move faster and helps them think clearer. A similar gene is found in combat-engineered mega-insects.","iconPath":{"x":256,"y":896},"displayCategory":"Miscellaneous","displayOrder":500,"metabolism":-1,"complexity":1},{"name":"Unstoppable","label":"unstoppable","desc":"Carriers of this gene are not slowed down when taking damage.","iconPath":{"x":384,"y":1152},"displayCategory":"Miscellaneous","displayOrder":550,"metabolism":-2,"complexity":1,"statFactors":{"StaggerDurationFactor":0.0}},{"name":"NakedSpeed","label":"naked speed","desc":"Carriers of this gene move slower while clothed, and faster while naked.","iconPath":{"x":384,"y":768},"displayCategory":"Movement","displayOrder":500,"metabolism":2,"complexity":1},{"name":"Hemogenic","label":"hemogenic","desc":"Carriers of this gene have a reserve of biological strength powered by a resource called hemogen. The resource can be gained and spent in various ways, all of which are unlocked by other genes.\n\nCarriers lose 2 hemogen per day from biological entropy.","iconPath":{"x":1408,"y":512},"displayCategory":"Hemogen","displayOrder":-2,"metabolism":1,"complexity":1,"selectionWeight":0.0},{"name":"HemogenDrain","label":"hemogen drain","labelShortAdj":"draining","desc":"Carriers lose an additional 8 hemogen per day from biological entropy.","iconPath":{"x":1280,"y":512},"displayCategory":"Hemogen","displayOrder":-1,"metabolism":6,"complexity":1},{"name":"FireWeakness","label":"tinderskin","labelShortAdj":"tinderskin","desc":"Carriers have dry, thin skin which burns easily from fire, and their immune systems react very poorly to this kind of threat. Damage from fire is multiplied by 4.","iconPath":{"x":896,"y":384},"displayCategory":"ResistanceAndWeakness","displayOrder":70,"metabolism":2,"complexity":1,"exclusionTags":["FireDamage"],"damageFactors":{"Flame":4.0}},{"name":"FireTerror","label":"pyrophobia","labelShortAdj":"pyrophobic","desc":"Carriers of this gene have an intense fear of fire. When fires are close, there is a chance they will have a mental breakdown at any moment.","iconPath":{"x":768,"y":384},"displayCategory":"ResistanceAndWeakness","displayOrder":80,"metabolism":4,"complexity":1},{"name":"PerfectImmunity","label":"perfect immunity","labelShortAdj":"perfect-immune","desc":"Carriers of this gene have archite-enhanced immune systems which intelligently destroy invaders. They are totally immune to most normal illnesses.","iconPath":{"x":1664,"y":768},"displayCategory":"Archite","displayOrder":0,"metabolism":0,"complexity":3,"exclusionTags":["Immunity"]},{"name":"DiseaseFree","label":"non-senescent","desc":"Carriers of this gene do not go through senescence in the normal way. They never get chronic age-related diseases like cancer, bad back, cataracts, or dementia.","iconPath":{"x":768,"y":768},"displayCategory":"Archite","displayOrder":0,"metabolism":0,"complexity":3},{"name":"TotalHealing","label":"scarless","labelShortAdj":"scarless","desc":"Carriers of this gene have a special type of regenerator cell which can heal old wounds and chronic illnesses like bad back.","iconPath":{"x":1408,"y":1024},"displayCategory":"Archite","displayOrder":0,"metabolism":0,"complexity":4},{"name":"Deathrest","label":"deathrest","desc":"Carriers of this gene must periodically regenerate themselves in a special coma called deathrest. Deathrest takes days, but can confer substantial bonuses. Deathrest can be accelerated and its effects enhanced by the use of a variety of special buildings and technologies.\n\nThose who put off deathresting will suffer from deathrest exhaustion.","iconPath":{"x":512,"y":256},"displayCategory":"Hemogen","displayOrder":0,"metabolism":6,"complexity":1},{"name":"Ageless","label":"ageless","desc":"Carriers of this gene have archites in the bloodstream which continuously reverse the process of aging. Starting at the age of 13, carriers begin to biologically age slower. By 18, the aging process stops completely.","iconPath":{"x":256,"y":128},"displayCategory":"Archite","displayOrder":0,"metabolism":0,"complexity":3},{"name":"Deathless","label":"deathless","desc":"Carriers of this gene have archites in the blood which will sustain their life processes no matter what. As long as the brain remains intact, a carrier of this gene will never die.","iconPath":{"x":384,"y":256},"displayCategory":"Archite","displayOrder":0,"metabolism":0,"complexity":7},{"name":"ArchiteMetabolism","label":"archite metabolism","labelShortAdj":"archite-metabolic","desc":"Carriers of this gene have special archites in their cells that facilitate and optimize metabolism. This improves overall genetic and metabolic quality.","iconPath":{"x":640,"y":128},"displayCategory":"Archite","displayOrder":0,"metabolism":6,"complexity":6},{"name":"MinTemp_SmallIncrease","label":"cold weakness","labelShortAdj":"warm","desc":"Carriers of this gene are slightly less comfortable in cold temperatures.","iconPath":{"x":256,"y":768},"displayCategory":"Temperature","displayOrder":0,"metabolism":1,"complexity":1,"exclusionTags":["MinTemperature"],"statOffsets":{"ComfyTemperatureMin":5.0}},{"name":"MinTemp_SmallDecrease","label":"cold tolerant","labelShortAdj":"cool","desc":"Carriers of this gene are slightly more comfortable in cold temperatures.","iconPath":{"x":128,"y":768},"displayCategory":"Temperature","displayOrder":10,"metabolism":-1,"complexity":1,"exclusionTags":["MinTemperature"],"statOffsets":{"ComfyTemperatureMin":-10.0}},{"name":"MinTemp_LargeDecrease","label":"cold super-tolerant","labelShortAdj":"cold","desc":"Carriers of this gene are much more comfortable in cold temperatures.","iconPath":{"x":0,"y":768},"displayCategory":"Temperature","displayOrder":20,"metabolism":-2,"complexity":1,"exclusionTags":["MinTemperature"],"statOffsets":{"ComfyTemperatureMin":-20.0}},{"name":"MaxTemp_LargeIncrease","label":"heat super-tolerant","labelShortAdj":"hot","desc":"Carriers of this gene are more comfortable in warm temperatures.","iconPath":{"x":1152,"y":640},"displayCategory":"Temperature","displayOrder":50,"metabolism":-2,"complexity":1,"exclusionTags":["MaxTemperature"],"statOffsets":{"ComfyTemperatureMax":20.0}},{"name":"MaxTemp_SmallIncrease","label":"heat tolerant","labelShortAdj":"warm","desc":"Carriers of this gene are slightly more comfortable in warm temperatures.","iconPath":{"x":1408,"y":640},"displayCategory":"Temperature","displayOrder":40,"metabolism":-1,"complexity":1,"exclusionTags":["MaxTemperature"],"statOffsets":{"ComfyTemperatureMax":10.0}},{"name":"MaxTemp_SmallDecrease","label":"heat weakness","labelShortAdj":"cool","desc":"Carriers of this gene are slightly less comfortable in warm temperatures.","iconPath":{"x":1280,"y":640},"displayCategory":"Temperature","displayOrder":30,"metabolism":1,"complexity":1,"exclusionTags":["MaxTemperature"],"statOffsets":{"ComfyTemperatureMax":-5.0}},{"name":"PsychicAbility_Deaf","label":"psychically deaf","labelShortAdj":"psy-deaf","desc":"Carriers of this gene are deaf to all psychic energy and influence outside their own minds. They cannot be affected by psychic influence, nor can they ever wield psychic power.","iconPath":{"x":640,"y":896},"displayCategory":"Psychic","displayOrder":0,"metabolism":2,"complexity":1,"exclusionTags":["PsychicAbility"],"traits":{"PsychicSensitivity":-2}},{"name":"PsychicAbility_Dull","label":"psychically dull","labelShortAdj":"psy-dull","desc":"Carriers of this gene are less psychically-sensitive than others.","iconPath":{"x":768,"y":896},"displayCategory":"Psychic","displayOrder":10,"metabolism":1,"complexity":1,"exclusionTags":["PsychicAbility"],"traits":{"PsychicSensitivity":-1}},{"name":"PsychicAbility_Enhanced","label":"psy-sensitive","labelShortAdj":"psy-enhanced","desc":"Carriers of this gene are more psychically-sensitive than average.","iconPath":{"x":1664,"y":256},"displayCategory":"Psychic","displayOrder":20,"metabolism":-2,"complexity":1,"exclusionTags":["PsychicAbility"],"statOffsets":{"PsychicSensitivity":0.2,"MeditationFocusGain":0.1,"PsychicEntropyRecoveryRate":0.1}},{"name":"PsychicAbility_Extreme","label":"super psy-sensitive","labelShortAdj":"psy-extreme","desc":"Carriers of this gene are much more psychically-sensitive than most.","iconPath":{"x":128,"y":384},"displayCategory":"Psychic","displayOrder":30,"metabolism":-5,"complexity":2,"exclusionTags":["PsychicAbility"],"statOffsets":{"PsychicSensitivity":0.4,"MeditationFocusGain":0.2,"PsychicEntropyRecoveryRate":0.2}},{"name":"MoveSpeed_Slow","label":"slow runner","labelShortAdj":"slow","desc":"Carriers of this gene move more slowly than normal.","iconPath":{"x":128,"y":1024},"displayCategory":"Movement","displayOrder":0,"metabolism":3,"complexity":1,"exclusionTags":["MoveSpeed"],"statOffsets":{"MoveSpeed":-0.2}},{"name":"MoveSpeed_Quick","label":"fast runner","labelShortAdj":"quick","desc":"Carriers of this gene move more quickly than normal.","iconPath":{"x":896,"y":896},"displayCategory":"Movement","displayOrder":10,"metabolism":-3,"complexity":1,"exclusionTags":["MoveSpeed"],"statOffsets":{"MoveSpeed":0.2}},{"name":"MoveSpeed_VeryQuick","label":"very fast runner","labelShortAdj":"fast","desc":"Carriers of this gene move much more quickly than normal.","iconPath":{"x":512,"y":1152},"displayCategory":"Movement","displayOrder":20,"metabolism":-5,"complexity":1,"exclusionTags":["MoveSpeed"],"statOffsets":{"MoveSpeed":0.4}},{"name":"Beauty_VeryUgly","label":"very unattractive","labelShortAdj":"hideous","desc":"Carriers of this gene have misshapen, asymmetrical facial structures and blotchy skin. They're hard to look at.","iconPath":{"x":256,"y":1024},"displayCategory":"Beauty","displayOrder":0,"metabolism":2,"complexity":1,"exclusionTags":["Beauty"],"statOffsets":{"PawnBeauty":-2.0}},{"name":"Beauty_Ugly","label":"unattractive","desc":"Carriers of this gene have exaggerated facial features and poor skin that are generally considered ugly.","iconPath":{"x":128,"y":1152},"displayCategory":"Beauty","displayOrder":10,"metabolism":1,"complexity":1,"exclusionTags":["Beauty"],"statOffsets":{"PawnBeauty":-1.0}},{"name":"Beauty_Pretty","label":"attractive","desc":"Carriers of this gene have unusually symmetrical, balanced facial features and extra-clear skin which gives them a pleasing appearance.","iconPath":{"x":384,"y":896},"displayCategory":"Beauty","displayOrder":20,"metabolism":-1,"complexity":1,"exclusionTags":["Beauty"],"statOffsets":{"PawnBeauty":1.0}},{"name":"Beauty_Beautiful","label":"very attractive","desc":"Carriers of this gene have remarkably precise and symmetrical faces. Their features are distinctive and strong without being exaggerated, and their skin is nearly perfect. They are generally seen as beautiful.","iconPath":{"x":1024,"y":128},"displayCategory":"Beauty","displayOrder":30,"metabolism":-2,"complexity":1,"exclusionTags":["Beauty"],"statOffsets":{"PawnBeauty":2.0}},{"name":"Learning_Slow","label":"slow study","desc":"Carriers of this gene have deficient long-term memories and don't understand new ideas quickly. They are slow at learning new skills and knowledge.","iconPath":{"x":0,"y":1024},"displayCategory":"Miscellaneous","displayOrder":30,"metabolism":2,"complexity":1,"exclusionTags":["Learning"],"statFactors":{"GlobalLearningFactor":0.5}},{"name":"Learning_Fast","label":"quick study","desc":"Carriers of this gene have excellent memories and grasp new ideas quickly. They learn faster than others.","iconPath":{"x":384,"y":384},"displayCategory":"Miscellaneous","displayOrder":35,"metabolism":-3,"complexity":2,"exclusionTags":["Learning"],"statOffsets":{"GlobalLearningFactor":0.5}},{"name":"Mood_Depressive","label":"very unhappy","desc":"Carriers of this gene are highly predisposed to negative emotion. They'll see the bad in every situation and have a much lower mood than others.","iconPath":{"x":768,"y":256},"displayCategory":"Mood","displayOrder":0,"metabolism":5,"complexity":1,"exclusionTags":["Mood"]},{"name":"Mood_Pessimist","label":"unhappy","desc":"Carriers of this gene are predisposed to pessimistic perceptions. They'll tend to interpret things negatively and have lower mood than others.","iconPath":{"x":0,"y":896},"displayCategory":"Mood","displayOrder":10,"metabolism":3,"complexity":1,"exclusionTags":["Mood"]},{"name":"Mood_Optimist","label":"happy","desc":"Carriers of this gene are predisposed to optimistic feelings. They'll have higher mood than others.","iconPath":{"x":1152,"y":768},"displayCategory":"Mood","displayOrder":20,"metabolism":-1,"complexity":2,"exclusionTags":["Mood"]},{"name":"Mood_Sanguine","label":"very happy","desc":"Carriers of this gene are highly predisposed to optimism and not at all inclined to think negatively. They'll have much higher mood than others.","iconPath":{"x":1408,"y":896},"displayCategory":"Mood","displayOrder":30,"metabolism":-2,"complexity":3,"exclusionTags":["Mood"]},{"name":"ToxResist_Partial","label":"tox resistance","labelShortAdj":"tox-resistant","desc":"Carriers of this gene are resistant to toxic buildup from any source. This includes pollution, toxic fallout, tox gas, and direct attacks with venom or injected poison. They'll gain half the amount of toxic buildup compared to others.\n\nCellular filters in the lung and skin reduce the dose of toxins entering the bloodstream.","iconPath":{"x":1536,"y":768},"displayCategory":"ResistanceAndWeakness","displayOrder":0,"metabolism":-2,"complexity":1,"exclusionTags":["ToxResistance"],"statOffsets":{"ToxicResistance":0.5}},{"name":"ToxResist_Total","label":"tox immunity","labelShortAdj":"tox-immune","desc":"Carriers of this gene are totally immune to toxic buildup from all sources including polluted terrain, toxic fallout, tox gas, and direct attacks with venom or injected poison. They are also not bothered by acidic smog.\n\nThe carrier's biochemical pathways are modified to route around interference from nearly all known toxins. Along with enhancements to the kidneys and liver, this keeps carriers comfortable in even the most toxic of environments.","iconPath":{"x":1664,"y":1024},"displayCategory":"ResistanceAndWeakness","displayOrder":10,"metabolism":-4,"complexity":2,"exclusionTags":["ToxResistance"],"statOffsets":{"ToxicResistance":1.0}},{"name":"Delicate","label":"delicate","desc":"Carriers of this gene take greater injuries than others from the same damage. They have thin, brittle bones and less binding molecules in joints and flesh.","iconPath":{"x":640,"y":256},"displayCategory":"Pain","displayOrder":0,"metabolism":3,"complexity":1,"exclusionTags":["Toughness"],"traits":{"Delicate":0}},{"name":"Robust","label":"robust","desc":"Carriers of this gene take less injuries than others from the same damage. They have thickened, densified bones, nearly-solid ribcages, and strengthened binding factors in joints and flesh.","iconPath":{"x":0,"y":1152},"displayCategory":"Pain","displayOrder":10,"metabolism":-2,"complexity":1,"exclusionTags":["Toughness"],"statFactors":{"IncomingDamageFactor":0.75}},{"name":"Pain_Reduced","label":"reduced pain","labelShortAdj":"pain-dull","desc":"Carriers of this gene feel half as much pain compared to a baseliner. Reduced neuron activity in the brain's nociception centers makes pain dull and faint. This can be advantageous sometimes, and dangerous other times.","iconPath":{"x":1280,"y":768},"displayCategory":"Pain","displayOrder":30,"metabolism":-1,"complexity":1,"exclusionTags":["Pain"]},{"name":"Pain_Extra","label":"extra pain","labelShortAdj":"wimpy","desc":"Carriers of this gene feel more pain than others given the same injuries. Neuron activity in the brain's nociception center is amplified, so pain feels extra-intense and fiery. This can be protective, but overall it's considered a negative and makes it hard to push through difficult situations.","iconPath":{"x":0,"y":384},"displayCategory":"Pain","displayOrder":20,"metabolism":2,"complexity":1,"exclusionTags":["Pain"],"traits":{"Wimp":0}},{"name":"Aggression_DeadCalm","label":"dead calm","labelShortAdj":"calm","desc":"Carriers of this gene feel calm in every situation and have a very placid demeanor. They will never start social fights or have aggressive mental breaks.","iconPath":{"x":256,"y":256},"displayCategory":"Violence","displayOrder":0,"metabolism":-1,"complexity":1,"exclusionTags":["Aggression"]},{"name":"Aggression_Aggressive","label":"aggressive","desc":"Carriers of this gene are quick to anger. They are twice as likely to start social fights. When they have mental breaks, they are twice as likely to choose an aggressive kind of break.","iconPath":{"x":384,"y":128},"displayCategory":"Violence","displayOrder":10,"metabolism":2,"complexity":1,"exclusionTags":["Aggressive","Aggression"]},{"name":"Aggression_HyperAggressive","label":"hyper-aggressive","desc":"Carriers of this gene are hormonally high-strung and very aggressive. They are three times as likely to start social fights. Any mental break they have will be of an aggressive type.","iconPath":{"x":1664,"y":512},"displayCategory":"Violence","displayOrder":20,"metabolism":3,"complexity":1,"exclusionTags":["Aggressive","Aggression"]},{"name":"VerySleepy","label":"very sleepy","desc":"Carriers of this gene get tired much faster than others.","iconPath":{"x":640,"y":1152},"displayCategory":"Sleep","displayOrder":0,"metabolism":4,"complexity":1,"exclusionTags":["Sleep"],"statFactors":{"RestFallRateFactor":1.8}},{"name":"Sleepy","label":"sleepy","desc":"Carriers of this gene get tired somewhat faster than others.","iconPath":{"x":1664,"y":896},"displayCategory":"Sleep","displayOrder":10,"metabolism":2,"complexity":1,"exclusionTags":["Sleep"],"statFactors":{"RestFallRateFactor":1.4}},{"name":"LowSleep","label":"low sleep","desc":"Carriers of this gene get tired less quickly than others.","iconPath":{"x":1024,"y":896},"displayCategory":"Sleep","displayOrder":20,"metabolism":-4,"complexity":2,"exclusionTags":["Sleep"],"statFactors":{"RestFallRateFactor":0.4}},{"name":"Neversleep","label":"never sleep","desc":"Carriers of this gene have a unique metabolic process which allows clusters of neurons to sleep while the rest of the brain stays awake. They never need to sleep.","iconPath":{"x":640,"y":768},"displayCategory":"Sleep","displayOrder":30,"metabolism":-6,"complexity":3,"exclusionTags":["Sleep"]},{"name":"MeleeDamage_Weak","label":"weak melee damage","labelShortAdj":"weak","desc":"Carriers of this gene do less damage in close-quarters combat. Weak fast-twitch muscle fibers make their strikes shaky and weak.","iconPath":{"x":1408,"y":1152},"displayCategory":"Violence","displayOrder":30,"metabolism":1,"complexity":1,"exclusionTags":["MeleeDamage"],"statFactors":{"MeleeDamageFactor":0.5}},{"name":"MeleeDamage_Strong","label":"strong melee damage","labelShortAdj":"strong","desc":"Carriers of this gene do more damage in close-quarters combat. Extra-strong fast-twitch muscle fibers make their strikes accurate and powerful.","iconPath":{"x":640,"y":1024},"displayCategory":"Violence","displayOrder":40,"metabolism":-2,"complexity":1,"exclusionTags":["MeleeDamage"],"statFactors":{"MeleeDamageFactor":1.5}},{"name":"UVSensitivity_Mild","label":"mild UV sensitivity","labelShortAdj":"UV-sensitive","desc":"Carriers of this gene have biological compounds in their skin that react painfully to UV radiation. They are unusually sensitive to sunlight.","iconPath":{"x":1664,"y":640},"displayCategory":"ResistanceAndWeakness","displayOrder":40,"metabolism":3,"complexity":1,"exclusionTags":["UVSensitivity"]},{"name":"UVSensitivity_Intense","label":"intense UV sensitivity","labelShortAdj":"UV-vulnerable","desc":"Carriers of this gene have biological compounds in their skin that react dangerously to UV radiation. They are intensely sensitive to sunlight.","iconPath":{"x":128,"y":640},"displayCategory":"ResistanceAndWeakness","displayOrder":50,"metabolism":4,"complexity":2,"exclusionTags":["UVSensitivity"]},{"name":"Libido_Low","label":"low libido","desc":"Carriers of this gene are less likely to engage in lovin' with their partner.","iconPath":{"x":896,"y":640},"displayCategory":"Reproduction","displayOrder":0,"metabolism":0,"complexity":1,"exclusionTags":["Libido"]},{"name":"Libido_High","label":"high libido","desc":"Carriers of this gene are more likely to engage in lovin' with their partner.","iconPath":{"x":1536,"y":512},"displayCategory":"Reproduction","displayOrder":10,"metabolism":0,"complexity":1,"exclusionTags":["Libido"]},{"name":"Hair_SnowWhite","label":"snow-white hair","desc":"Carriers of this gene have a particular hair color. With multiple hair color genes, one is randomly selected.","iconPath":{"x":0,"y":512},"displayCategory":"Cosmetic_Hair","displayOrder":0,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.05,"hairColor":{"R":250,"G":250,"B":250,"A":1.0}},{"name":"Hair_InkBlack","label":"ink-black hair","desc":"Carriers of this gene have a particular hair color. With multiple hair color genes, one is randomly selected.","iconPath":{"x":0,"y":512},"displayCategory":"Cosmetic_Hair","displayOrder":130,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.05,"hairColor":{"R":25,"G":25,"B":25,"A":1.0}},{"name":"Hair_Gray","label":"gray hair","desc":"Carriers of this gene have a particular hair color. With multiple hair color genes, one is randomly selected.","iconPath":{"x":0,"y":512},"displayCategory":"Cosmetic_Hair","displayOrder":10,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.02,"hairColor":{"R":165,"G":165,"B":165,"A":1.0}},{"name":"Hair_DarkBlack","label":"dark-black hair","desc":"Carriers of this gene have a particular hair color. With multiple hair color genes, one is randomly selected.","iconPath":{"x":0,"y":512},"displayCategory":"Cosmetic_Hair","displayOrder":120,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":1.5,"hairColor":{"R":51,"G":51,"B":51,"A":1.0}},{"name":"Hair_MidBlack","label":"mid-black hair","desc":"Carriers of this gene have a particular hair color. With multiple hair color genes, one is randomly selected.","iconPath":{"x":0,"y":512},"displayCategory":"Cosmetic_Hair","displayOrder":110,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":1.5,"hairColor":{"R":79,"G":71,"B":66,"A":1.0}},{"name":"Hair_DarkReddish","label":"dark-reddish hair","desc":"Carriers of this gene have a particular hair color. With multiple hair color genes, one is randomly selected.","iconPath":{"x":0,"y":512},"displayCategory":"Cosmetic_Hair","displayOrder":100,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":1.5,"hairColor":{"R":63,"G":51,"B":38,"A":1.0}},{"name":"Hair_DarkSaturatedReddish","label":"dark-brown hair","desc":"Carriers of this gene have a particular hair color. With multiple hair color genes, one is randomly selected.","iconPath":{"x":0,"y":512},"displayCategory":"Cosmetic_Hair","displayOrder":90,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":1.5,"hairColor":{"R":56,"G":36,"B":18,"A":1.0}},{"name":"Hair_DarkBrown","label":"brown hair","desc":"Carriers of this gene have a particular hair color. With multiple hair color genes, one is randomly selected.","iconPath":{"x":0,"y":512},"displayCategory":"Cosmetic_Hair","displayOrder":80,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","hairColor":{"R":90,"G":58,"B":32,"A":1.0}},{"name":"Hair_ReddishBrown","label":"reddish-brown hair","desc":"Carriers of this gene have a particular hair color. With multiple hair color genes, one is randomly selected.","iconPath":{"x":0,"y":512},"displayCategory":"Cosmetic_Hair","displayOrder":75,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","hairColor":{"R":132,"G":83,"B":47,"A":1.0}},{"name":"Hair_SandyBlonde","label":"sandy-blonde hair","desc":"Carriers of this gene have a particular hair color. With multiple hair color genes, one is randomly selected.","iconPath":{"x":0,"y":512},"displayCategory":"Cosmetic_Hair","displayOrder":60,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","hairColor":{"R":193,"G":146,"B":85,"A":1.0}},{"name":"Hair_Blonde","label":"blonde hair","desc":"Carriers of this gene have a particular hair color. With multiple hair color genes, one is randomly selected.","iconPath":{"x":0,"y":512},"displayCategory":"Cosmetic_Hair","displayOrder":50,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","hairColor":{"R":237,"G":202,"B":156,"A":1.0}},{"name":"Hair_Pink","label":"pink hair","desc":"Carriers of this gene have a particular hair color. With multiple hair color genes, one is randomly selected.","iconPath":{"x":0,"y":512},"displayCategory":"Cosmetic_Hair","displayOrder":170,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.05,"hairColor":{"R":191,"G":86,"B":149,"A":1.0}},{"name":"Hair_LightPurple","label":"purple hair","desc":"Carriers of this gene have a particular hair color. With multiple hair color genes, one is randomly selected.","iconPath":{"x":0,"y":512},"displayCategory":"Cosmetic_Hair","displayOrder":180,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.05,"hairColor":{"R":227,"G":115,"B":255,"A":1.0}},{"name":"Hair_LightBlue","label":"blue hair","desc":"Carriers of this gene have a particular hair color. With multiple hair color genes, one is randomly selected.","iconPath":{"x":0,"y":512},"displayCategory":"Cosmetic_Hair","displayOrder":140,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.05,"hairColor":{"R":34,"G":63,"B":227,"A":1.0}},{"name":"Hair_LightTeal","label":"teal hair","desc":"Carriers of this gene have a particular hair color. With multiple hair color genes, one is randomly selected.","iconPath":{"x":0,"y":512},"displayCategory":"Cosmetic_Hair","displayOrder":150,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.05,"hairColor":{"R":52,"G":191,"B":182,"A":1.0}},{"name":"Hair_LightGreen","label":"green hair","desc":"Carriers of this gene have a particular hair color. With multiple hair color genes, one is randomly selected.","iconPath":{"x":0,"y":512},"displayCategory":"Cosmetic_Hair","displayOrder":160,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.05,"hairColor":{"R":72,"G":201,"B":40,"A":1.0}},{"name":"Hair_LightOrange","label":"orange hair","desc":"Carriers of this gene have a particular hair color. With multiple hair color genes, one is randomly selected.","iconPath":{"x":0,"y":512},"displayCategory":"Cosmetic_Hair","displayOrder":70,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.05,"hairColor":{"R":189,"G":133,"B":49,"A":1.0}},{"name":"Hair_BrightRed","label":"red hair","desc":"Carriers of this gene have a particular hair color. With multiple hair color genes, one is randomly selected.","iconPath":{"x":0,"y":512},"displayCategory":"Cosmetic_Hair","displayOrder":190,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.05,"hairColor":{"R":191,"G":86,"B":86,"A":1.0}},{"name":"Skin_Melanin1","label":"skin color","desc":"Carriers of this gene have a particular skin color. With multiple skin color genes, one is randomly selected.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["SkinColor"],"endogeneCategory":"Melanin","selectionWeight":0.2,"skinColor":{"R":242,"G":237,"B":224,"A":1.0},"melanin":0.0},{"name":"Skin_Melanin2","label":"skin color","desc":"Carriers of this gene have a particular skin color. With multiple skin color genes, one is randomly selected.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["SkinColor"],"endogeneCategory":"Melanin","selectionWeight":0.5,"skinColor":{"R":255,"G":239,"B":213,"A":1.0},"melanin":0.1},{"name":"Skin_Melanin3","label":"skin color","desc":"Carriers of this gene have a particular skin color. With multiple skin color genes, one is randomly selected.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["SkinColor"],"endogeneCategory":"Melanin","selectionWeight":0.5,"skinColor":{"R":255,"G":239,"B":201,"A":1.0},"melanin":0.25},{"name":"Skin_Melanin4","label":"skin color","desc":"Carriers of this gene have a particular skin color. With multiple skin color genes, one is randomly selected.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["SkinColor"],"endogeneCategory":"Melanin","selectionWeight":0.5,"skinColor":{"R":255,"G":239,"B":189,"A":1.0},"melanin":0.45},{"name":"Skin_Melanin5","label":"skin color","desc":"Carriers of this gene have a particular skin color. With multiple skin color genes, one is randomly selected.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["SkinColor"],"endogeneCategory":"Melanin","selectionWeight":0.0,"skinColor":{"R":249,"G":219,"B":165,"A":1.0},"melanin":0.58},{"name":"Skin_Melanin6","label":"skin color","desc":"Carriers of this gene have a particular skin color. With multiple skin color genes, one is randomly selected.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["SkinColor"],"endogeneCategory":"Melanin","selectionWeight":0.0,"skinColor":{"R":242,"G":199,"B":140,"A":1.0},"melanin":0.63},{"name":"Skin_Melanin7","label":"skin color","desc":"Carriers of this gene have a particular skin color. With multiple skin color genes, one is randomly selected.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["SkinColor"],"endogeneCategory":"Melanin","selectionWeight":0.0,"skinColor":{"R":228,"G":158,"B":90,"A":1.0},"melanin":0.75},{"name":"Skin_Melanin8","label":"skin color","desc":"Carriers of this gene have a particular skin color. With multiple skin color genes, one is randomly selected.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["SkinColor"],"endogeneCategory":"Melanin","selectionWeight":0.5,"skinColor":{"R":130,"G":91,"B":48,"A":1.0},"melanin":0.83},{"name":"Skin_Melanin9","label":"skin color","desc":"Carriers of this gene have a particular skin color. With multiple skin color genes, one is randomly selected.","iconPath":{"x":1536,"y":896},"displayCategory":"Cosmetic_Skin","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["SkinColor"],"endogeneCategory":"Melanin","selectionWeight":0.2,"skinColor":{"R":99,"G":70,"B":36,"A":1.0},"melanin":0.9},{"name":"AptitudeTerrible_Shooting","label":"Awful Shooting","desc":"The carrier's aptitude in Shooting is reduced by 8. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Shooting.","iconPath":{"x":384,"y":1664},"displayCategory":"Aptitudes","displayOrder":0,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeShooting"],"skills":{"Shooting":-8}},{"name":"AptitudePoor_Shooting","label":"Poor Shooting","desc":"The carrier's aptitude in Shooting is reduced by 4. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Shooting.","iconPath":{"x":0,"y":1664},"displayCategory":"Aptitudes","displayOrder":1,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeShooting"],"skills":{"Shooting":-4}},{"name":"AptitudeStrong_Shooting","label":"Strong Shooting","desc":"The carrier's aptitude in Shooting is increased by 4. Aptitude acts like an offset on skill level.","iconPath":{"x":256,"y":1664},"displayCategory":"Aptitudes","displayOrder":2,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeShooting"],"skills":{"Shooting":4}},{"name":"AptitudeRemarkable_Shooting","label":"Great Shooting","desc":"The carrier's aptitude in Shooting is increased by 8. Aptitude acts like an offset on skill level.","iconPath":{"x":128,"y":1664},"displayCategory":"Aptitudes","displayOrder":3,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeShooting"],"skills":{"Shooting":8}},{"name":"AptitudeTerrible_Melee","label":"Awful Melee","desc":"The carrier's aptitude in Melee is reduced by 8. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Melee.","iconPath":{"x":640,"y":1536},"displayCategory":"Aptitudes","displayOrder":4,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeMelee"],"skills":{"Melee":-8}},{"name":"AptitudePoor_Melee","label":"Poor Melee","desc":"The carrier's aptitude in Melee is reduced by 4. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Melee.","iconPath":{"x":256,"y":1536},"displayCategory":"Aptitudes","displayOrder":5,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeMelee"],"skills":{"Melee":-4}},{"name":"AptitudeStrong_Melee","label":"Strong Melee","desc":"The carrier's aptitude in Melee is increased by 4. Aptitude acts like an offset on skill level.","iconPath":{"x":512,"y":1536},"displayCategory":"Aptitudes","displayOrder":6,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeMelee"],"skills":{"Melee":4}},{"name":"AptitudeRemarkable_Melee","label":"Great Melee","desc":"The carrier's aptitude in Melee is increased by 8. Aptitude acts like an offset on skill level.","iconPath":{"x":384,"y":1536},"displayCategory":"Aptitudes","displayOrder":7,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeMelee"],"skills":{"Melee":8}},{"name":"AptitudeTerrible_Construction","label":"Awful Construction","desc":"The carrier's aptitude in Construction is reduced by 8. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Construction.","iconPath":{"x":1664,"y":1280},"displayCategory":"Aptitudes","displayOrder":8,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeConstruction"],"skills":{"Construction":-8}},{"name":"AptitudePoor_Construction","label":"Poor Construction","desc":"The carrier's aptitude in Construction is reduced by 4. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Construction.","iconPath":{"x":1280,"y":1280},"displayCategory":"Aptitudes","displayOrder":9,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeConstruction"],"skills":{"Construction":-4}},{"name":"AptitudeStrong_Construction","label":"Strong Construction","desc":"The carrier's aptitude in Construction is increased by 4. Aptitude acts like an offset on skill level.","iconPath":{"x":1536,"y":1280},"displayCategory":"Aptitudes","displayOrder":10,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeConstruction"],"skills":{"Construction":4}},{"name":"AptitudeRemarkable_Construction","label":"Great Construction","desc":"The carrier's aptitude in Construction is increased by 8. Aptitude acts like an offset on skill level.","iconPath":{"x":1408,"y":1280},"displayCategory":"Aptitudes","displayOrder":11,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeConstruction"],"skills":{"Construction":8}},{"name":"AptitudeTerrible_Mining","label":"Awful Mining","desc":"The carrier's aptitude in Mining is reduced by 8. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Mining.","iconPath":{"x":1152,"y":1536},"displayCategory":"Aptitudes","displayOrder":12,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeMining"],"skills":{"Mining":-8}},{"name":"AptitudePoor_Mining","label":"Poor Mining","desc":"The carrier's aptitude in Mining is reduced by 4. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Mining.","iconPath":{"x":768,"y":1536},"displayCategory":"Aptitudes","displayOrder":13,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeMining"],"skills":{"Mining":-4}},{"name":"AptitudeStrong_Mining","label":"Strong Mining","desc":"The carrier's aptitude in Mining is increased by 4. Aptitude acts like an offset on skill level.","iconPath":{"x":1024,"y":1536},"displayCategory":"Aptitudes","displayOrder":14,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeMining"],"skills":{"Mining":4}},{"name":"AptitudeRemarkable_Mining","label":"Great Mining","desc":"The carrier's aptitude in Mining is increased by 8. Aptitude acts like an offset on skill level.","iconPath":{"x":896,"y":1536},"displayCategory":"Aptitudes","displayOrder":15,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeMining"],"skills":{"Mining":8}},{"name":"AptitudeTerrible_Cooking","label":"Awful Cooking","desc":"The carrier's aptitude in Cooking is reduced by 8. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Cooking.","iconPath":{"x":384,"y":1408},"displayCategory":"Aptitudes","displayOrder":16,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeCooking"],"skills":{"Cooking":-8}},{"name":"AptitudePoor_Cooking","label":"Poor Cooking","desc":"The carrier's aptitude in Cooking is reduced by 4. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Cooking.","iconPath":{"x":0,"y":1408},"displayCategory":"Aptitudes","displayOrder":17,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeCooking"],"skills":{"Cooking":-4}},{"name":"AptitudeStrong_Cooking","label":"Strong Cooking","desc":"The carrier's aptitude in Cooking is increased by 4. Aptitude acts like an offset on skill level.","iconPath":{"x":256,"y":1408},"displayCategory":"Aptitudes","displayOrder":18,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeCooking"],"skills":{"Cooking":4}},{"name":"AptitudeRemarkable_Cooking","label":"Great Cooking","desc":"The carrier's aptitude in Cooking is increased by 8. Aptitude acts like an offset on skill level.","iconPath":{"x":128,"y":1408},"displayCategory":"Aptitudes","displayOrder":19,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeCooking"],"skills":{"Cooking":8}},{"name":"AptitudeTerrible_Plants","label":"Awful Plants","desc":"The carrier's aptitude in Plants is reduced by 8. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Plants.","iconPath":{"x":1664,"y":1536},"displayCategory":"Aptitudes","displayOrder":20,"metabolism":2,"complexity":1,"exclusionTags":["AptitudePlants"],"skills":{"Plants":-8}},{"name":"AptitudePoor_Plants","label":"Poor Plants","desc":"The carrier's aptitude in Plants is reduced by 4. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Plants.","iconPath":{"x":1280,"y":1536},"displayCategory":"Aptitudes","displayOrder":21,"metabolism":1,"complexity":1,"exclusionTags":["AptitudePlants"],"skills":{"Plants":-4}},{"name":"AptitudeStrong_Plants","label":"Strong Plants","desc":"The carrier's aptitude in Plants is increased by 4. Aptitude acts like an offset on skill level.","iconPath":{"x":1536,"y":1536},"displayCategory":"Aptitudes","displayOrder":22,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudePlants"],"skills":{"Plants":4}},{"name":"AptitudeRemarkable_Plants","label":"Great Plants","desc":"The carrier's aptitude in Plants is increased by 8. Aptitude acts like an offset on skill level.","iconPath":{"x":1408,"y":1536},"displayCategory":"Aptitudes","displayOrder":23,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudePlants"],"skills":{"Plants":8}},{"name":"AptitudeTerrible_Animals","label":"Awful Animals","desc":"The carrier's aptitude in Animals is reduced by 8. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Animals.","iconPath":{"x":640,"y":1280},"displayCategory":"Aptitudes","displayOrder":24,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeAnimals"],"skills":{"Animals":-8}},{"name":"AptitudePoor_Animals","label":"Poor Animals","desc":"The carrier's aptitude in Animals is reduced by 4. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Animals.","iconPath":{"x":256,"y":1280},"displayCategory":"Aptitudes","displayOrder":25,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeAnimals"],"skills":{"Animals":-4}},{"name":"AptitudeStrong_Animals","label":"Strong Animals","desc":"The carrier's aptitude in Animals is increased by 4. Aptitude acts like an offset on skill level.","iconPath":{"x":512,"y":1280},"displayCategory":"Aptitudes","displayOrder":26,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeAnimals"],"skills":{"Animals":4}},{"name":"AptitudeRemarkable_Animals","label":"Great Animals","desc":"The carrier's aptitude in Animals is increased by 8. Aptitude acts like an offset on skill level.","iconPath":{"x":384,"y":1280},"displayCategory":"Aptitudes","displayOrder":27,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeAnimals"],"skills":{"Animals":8}},{"name":"AptitudeTerrible_Crafting","label":"Awful Crafting","desc":"The carrier's aptitude in Crafting is reduced by 8. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Crafting.","iconPath":{"x":896,"y":1408},"displayCategory":"Aptitudes","displayOrder":28,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeCrafting"],"skills":{"Crafting":-8}},{"name":"AptitudePoor_Crafting","label":"Poor Crafting","desc":"The carrier's aptitude in Crafting is reduced by 4. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Crafting.","iconPath":{"x":512,"y":1408},"displayCategory":"Aptitudes","displayOrder":29,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeCrafting"],"skills":{"Crafting":-4}},{"name":"AptitudeStrong_Crafting","label":"Strong Crafting","desc":"The carrier's aptitude in Crafting is increased by 4. Aptitude acts like an offset on skill level.","iconPath":{"x":768,"y":1408},"displayCategory":"Aptitudes","displayOrder":30,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeCrafting"],"skills":{"Crafting":4}},{"name":"AptitudeRemarkable_Crafting","label":"Great Crafting","desc":"The carrier's aptitude in Crafting is increased by 8. Aptitude acts like an offset on skill level.","iconPath":{"x":640,"y":1408},"displayCategory":"Aptitudes","displayOrder":31,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeCrafting"],"skills":{"Crafting":8}},{"name":"AptitudeTerrible_Artistic","label":"Awful Artistic","desc":"The carrier's aptitude in Artistic is reduced by 8. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Artistic.","iconPath":{"x":1152,"y":1280},"displayCategory":"Aptitudes","displayOrder":32,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeArtistic"],"skills":{"Artistic":-8}},{"name":"AptitudePoor_Artistic","label":"Poor Artistic","desc":"The carrier's aptitude in Artistic is reduced by 4. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Artistic.","iconPath":{"x":768,"y":1280},"displayCategory":"Aptitudes","displayOrder":33,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeArtistic"],"skills":{"Artistic":-4}},{"name":"AptitudeStrong_Artistic","label":"Strong Artistic","desc":"The carrier's aptitude in Artistic is increased by 4. Aptitude acts like an offset on skill level.","iconPath":{"x":1024,"y":1280},"displayCategory":"Aptitudes","displayOrder":34,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeArtistic"],"skills":{"Artistic":4}},{"name":"AptitudeRemarkable_Artistic","label":"Great Artistic","desc":"The carrier's aptitude in Artistic is increased by 8. Aptitude acts like an offset on skill level.","iconPath":{"x":896,"y":1280},"displayCategory":"Aptitudes","displayOrder":35,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeArtistic"],"skills":{"Artistic":8}},{"name":"AptitudeTerrible_Medicine","label":"Awful Medicine","desc":"The carrier's aptitude in Medicine is reduced by 8. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Medicine.","iconPath":{"x":128,"y":1536},"displayCategory":"Aptitudes","displayOrder":36,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeMedicine"],"skills":{"Medicine":-8}},{"name":"AptitudePoor_Medicine","label":"Poor Medicine","desc":"The carrier's aptitude in Medicine is reduced by 4. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Medicine.","iconPath":{"x":1536,"y":1408},"displayCategory":"Aptitudes","displayOrder":37,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeMedicine"],"skills":{"Medicine":-4}},{"name":"AptitudeStrong_Medicine","label":"Strong Medicine","desc":"The carrier's aptitude in Medicine is increased by 4. Aptitude acts like an offset on skill level.","iconPath":{"x":0,"y":1536},"displayCategory":"Aptitudes","displayOrder":38,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeMedicine"],"skills":{"Medicine":4}},{"name":"AptitudeRemarkable_Medicine","label":"Great Medicine","desc":"The carrier's aptitude in Medicine is increased by 8. Aptitude acts like an offset on skill level.","iconPath":{"x":1664,"y":1408},"displayCategory":"Aptitudes","displayOrder":39,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeMedicine"],"skills":{"Medicine":8}},{"name":"AptitudeTerrible_Intellectual","label":"Awful Intellectual","desc":"The carrier's aptitude in Intellectual is reduced by 8. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Intellectual.","iconPath":{"x":1408,"y":1408},"displayCategory":"Aptitudes","displayOrder":40,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeIntellectual"],"skills":{"Intellectual":-8}},{"name":"AptitudePoor_Intellectual","label":"Poor Intellectual","desc":"The carrier's aptitude in Intellectual is reduced by 4. Aptitude acts like an offset on skill level. Additionally, all passion is removed from Intellectual.","iconPath":{"x":1024,"y":1408},"displayCategory":"Aptitudes","displayOrder":41,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeIntellectual"],"skills":{"Intellectual":-4}},{"name":"AptitudeStrong_Intellectual","label":"Strong Intellectual","desc":"The carrier's aptitude in Intellectual is increased by 4. Aptitude acts like an offset on skill level.","iconPath":{"x":1280,"y":1408},"displayCategory":"Aptitudes","displayOrder":42,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeIntellectual"],"skills":{"Intellectual":4}},{"name":"AptitudeRemarkable_Intellectual","label":"Great Intellectual","desc":"The carrier's aptitude in Intellectual is increased by 8. Aptitude acts like an offset on skill level.","iconPath":{"x":1152,"y":1408},"displayCategory":"Aptitudes","displayOrder":43,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeIntellectual"],"skills":{"Intellectual":8}},{"name":"ChemicalDependency_Alcohol","label":"Alcohol dependency","desc":"Carriers of this gene need to ingest alcohol on a regular basis to survive. After 5 days without alcohol, carriers will suffer from drug deficiency. After 30 days, they will fall into a coma. After 60 days, they will die.","iconPath":{"x":256,"y":0},"displayCategory":"Drugs","displayOrder":0,"metabolism":3,"complexity":1,"exclusionTags":["DrugAlcohol"]},{"name":"AddictionResistant_Alcohol","label":"Alcohol resistant","desc":"Carriers are only half as likely to become addicted to Alcohol.","iconPath":{"x":128,"y":0},"displayCategory":"Drugs","displayOrder":1,"metabolism":-1,"complexity":1,"exclusionTags":["DrugAlcohol"]},{"name":"AddictionImmune_Alcohol","label":"Alcohol impervious","desc":"Carriers of this gene never get addicted to Alcohol.","iconPath":{"x":0,"y":0},"displayCategory":"Drugs","displayOrder":2,"metabolism":-3,"complexity":2,"exclusionTags":["DrugAlcohol"]},{"name":"ChemicalDependency_Smokeleaf","label":"Smokeleaf dependency","desc":"Carriers of this gene need to ingest smokeleaf on a regular basis to survive. After 5 days without smokeleaf, carriers will suffer from drug deficiency. After 30 days, they will fall into a coma. After 60 days, they will die.","iconPath":{"x":1408,"y":0},"displayCategory":"Drugs","displayOrder":3,"metabolism":3,"complexity":1,"exclusionTags":["DrugSmokeleaf"]},{"name":"AddictionResistant_Smokeleaf","label":"Smokeleaf resistant","desc":"Carriers are only half as likely to become addicted to Smokeleaf.","iconPath":{"x":1280,"y":0},"displayCategory":"Drugs","displayOrder":4,"metabolism":-1,"complexity":1,"exclusionTags":["DrugSmokeleaf"]},{"name":"AddictionImmune_Smokeleaf","label":"Smokeleaf impervious","desc":"Carriers of this gene never get addicted to Smokeleaf.","iconPath":{"x":1152,"y":0},"displayCategory":"Drugs","displayOrder":5,"metabolism":-3,"complexity":2,"exclusionTags":["DrugSmokeleaf"]},{"name":"ChemicalDependency_Psychite","label":"Psychite dependency","desc":"Carriers of this gene need to ingest psychite on a regular basis to survive. After 5 days without psychite, carriers will suffer from drug deficiency. After 30 days, they will fall into a coma. After 60 days, they will die.","iconPath":{"x":1024,"y":0},"displayCategory":"Drugs","displayOrder":6,"metabolism":4,"complexity":1,"exclusionTags":["DrugPsychite"]},{"name":"AddictionResistant_Psychite","label":"Psychite resistant","desc":"Carriers are only half as likely to become addicted to Psychite.","iconPath":{"x":896,"y":0},"displayCategory":"Drugs","displayOrder":7,"metabolism":-2,"complexity":1,"exclusionTags":["DrugPsychite"]},{"name":"AddictionImmune_Psychite","label":"Psychite impervious","desc":"Carriers of this gene never get addicted to Psychite.","iconPath":{"x":768,"y":0},"displayCategory":"Drugs","displayOrder":8,"metabolism":-5,"complexity":2,"exclusionTags":["DrugPsychite"]},{"name":"ChemicalDependency_GoJuice","label":"Go-juice dependency","desc":"Carriers of this gene need to ingest go-juice on a regular basis to survive. After 5 days without go-juice, carriers will suffer from drug deficiency. After 30 days, they will fall into a coma. After 60 days, they will die.","iconPath":{"x":640,"y":0},"displayCategory":"Drugs","displayOrder":9,"metabolism":4,"complexity":1,"exclusionTags":["DrugGoJuice"]},{"name":"AddictionResistant_GoJuice","label":"Go-juice resistant","desc":"Carriers are only half as likely to become addicted to Go-juice.","iconPath":{"x":512,"y":0},"displayCategory":"Drugs","displayOrder":10,"metabolism":-2,"complexity":1,"exclusionTags":["DrugGoJuice"]},{"name":"AddictionImmune_GoJuice","label":"Go-juice impervious","desc":"Carriers of this gene never get addicted to Go-juice.","iconPath":{"x":384,"y":0},"displayCategory":"Drugs","displayOrder":11,"metabolism":-5,"complexity":2,"exclusionTags":["DrugGoJuice"]},{"name":"ChemicalDependency_WakeUp","label":"Wake-up dependency","desc":"Carriers of this gene need to ingest wake-up on a regular basis to survive. After 5 days without wake-up, carriers will suffer from drug deficiency. After 30 days, they will fall into a coma. After 60 days, they will die.","iconPath":{"x":0,"y":128},"displayCategory":"Drugs","displayOrder":12,"metabolism":4,"complexity":1,"exclusionTags":["DrugWakeUp"]},{"name":"AddictionResistant_WakeUp","label":"Wake-up resistant","desc":"Carriers are only half as likely to become addicted to Wake-up.","iconPath":{"x":1664,"y":0},"displayCategory":"Drugs","displayOrder":13,"metabolism":-2,"complexity":1,"exclusionTags":["DrugWakeUp"]},{"name":"AddictionImmune_WakeUp","label":"Wake-up impervious","desc":"Carriers of this gene never get addicted to Wake-up.","iconPath":{"x":1536,"y":0},"displayCategory":"Drugs","displayOrder":14,"metabolism":-5,"complexity":2,"exclusionTags":["DrugWakeUp"]}];
\ No newline at end of file
+var genes = [{"name":"FireSpew","iconPath":{"page":0,"x":1024,"y":384,"w":128,"h":128},"displayCategory":"Ability","displayOrder":0,"metabolism":-2,"complexity":1,"abilities":["FireSpew"]},{"name":"FoamSpray","iconPath":{"page":0,"x":1152,"y":384,"w":128,"h":128},"displayCategory":"Ability","displayOrder":0,"metabolism":-2,"complexity":1,"abilities":["FoamSpray"]},{"name":"LongjumpLegs","iconPath":{"page":0,"x":768,"y":640,"w":128,"h":128},"displayCategory":"Hemogen","displayOrder":0,"metabolism":-2,"complexity":1,"abilities":["Longjump"]},{"name":"AnimalWarcall","iconPath":{"page":0,"x":512,"y":128,"w":128,"h":128},"displayCategory":"Ability","displayOrder":0,"metabolism":-3,"complexity":1,"abilities":["AnimalWarcall"]},{"name":"Bloodfeeder","iconPath":{"page":0,"x":1152,"y":128,"w":128,"h":128},"displayCategory":"Hemogen","displayOrder":0,"metabolism":-1,"complexity":1,"abilities":["Bloodfeed"]},{"name":"Coagulate","iconPath":{"page":0,"x":0,"y":256,"w":128,"h":128},"displayCategory":"Hemogen","displayOrder":0,"metabolism":-1,"complexity":1,"abilities":["Coagulate"]},{"name":"XenogermReimplanter","iconPath":{"page":0,"x":128,"y":1280,"w":128,"h":128},"displayCategory":"Archite","displayOrder":0,"metabolism":0,"complexity":3,"abilities":["ReimplantXenogerm"]},{"name":"PiercingSpine","iconPath":{"page":0,"x":128,"y":896,"w":128,"h":128},"displayCategory":"Hemogen","displayOrder":0,"metabolism":-1,"complexity":1,"abilities":["PiercingSpine"]},{"name":"AcidSpray","iconPath":{"page":0,"x":128,"y":128,"w":128,"h":128},"displayCategory":"Ability","displayOrder":0,"metabolism":-2,"complexity":1,"abilities":["AcidSpray"]},{"name":"Hair_BaldOnly","iconPath":{"page":0,"x":128,"y":512,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":50,"metabolism":0,"complexity":0,"exclusionTags":["HairStyle"]},{"name":"Hair_ShortOnly","iconPath":{"page":0,"x":384,"y":512,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":55,"metabolism":0,"complexity":0,"exclusionTags":["HairStyle"]},{"name":"Hair_LongOnly","iconPath":{"page":0,"x":256,"y":512,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":57,"metabolism":0,"complexity":0,"exclusionTags":["HairStyle"]},{"name":"Hair_Grayless","iconPath":{"page":0,"x":1664,"y":384,"w":128,"h":128},"displayCategory":"Miscellaneous","displayOrder":195,"metabolism":0,"complexity":1},{"name":"Beard_BushyOnly","iconPath":{"page":0,"x":768,"y":128,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":60,"metabolism":0,"complexity":0,"exclusionTags":["BeardStyle"]},{"name":"Beard_NoBeardOnly","iconPath":{"page":0,"x":896,"y":128,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":65,"metabolism":0,"complexity":0,"exclusionTags":["BeardStyle"]},{"name":"Beard_Always","iconPath":{"page":0,"x":256,"y":1152,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":66,"metabolism":0,"complexity":0,"exclusionTags":["BeardStyle"]},{"name":"Skin_InkBlack","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":99,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":55,"G":55,"B":55,"A":1.0}},{"name":"Skin_SlateGray","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":97,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":90,"G":90,"B":90,"A":1.0}},{"name":"Skin_LightGray","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":95,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":200,"G":200,"B":200,"A":1.0}},{"name":"Skin_SheerWhite","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":93,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":250,"G":240,"B":240,"A":1.0}},{"name":"Skin_Blue","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":88,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":100,"G":165,"B":193,"A":1.0}},{"name":"Skin_Purple","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":85,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":97,"G":87,"B":195,"A":1.0}},{"name":"Skin_PaleRed","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":78,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":222,"G":106,"B":106,"A":1.0}},{"name":"Skin_DeepRed","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":75,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":150,"G":62,"B":62,"A":1.0}},{"name":"Skin_PaleYellow","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":68,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":193,"G":165,"B":99,"A":1.0}},{"name":"Skin_DeepYellow","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":65,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":204,"G":199,"B":65,"A":1.0}},{"name":"Skin_Orange","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":69,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":210,"G":114,"B":63,"A":1.0}},{"name":"Skin_Green","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":0,"metabolism":0,"complexity":0,"exclusionTags":["SkinColorOverride"],"skinColorOverride":{"R":169,"G":182,"B":108,"A":1.0}},{"name":"Furskin","iconPath":{"page":0,"x":1280,"y":384,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Miscellaneous","displayOrder":400,"metabolism":-1,"complexity":1,"exclusionTags":["HairStyle","Fur","BeardStyle"],"statOffsets":{"ComfyTemperatureMin":-10.0}},{"name":"Eyes_Red","iconPath":{"page":0,"x":1152,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic","displayOrder":0,"metabolism":0,"complexity":0,"exclusionTags":["EyeColor"]},{"name":"Eyes_Gray","iconPath":{"page":0,"x":1536,"y":384,"w":128,"h":128},"displayCategory":"Cosmetic","displayOrder":1,"metabolism":0,"complexity":0,"exclusionTags":["EyeColor"]},{"name":"Brow_Heavy","iconPath":{"page":0,"x":1152,"y":512,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":100,"metabolism":0,"complexity":0},{"name":"Tail_Furry","iconPath":{"page":0,"x":1152,"y":1024,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Miscellaneous","displayOrder":1000,"metabolism":-1,"complexity":1,"exclusionTags":["Tail"],"statOffsets":{"ComfyTemperatureMin":-10.0}},{"name":"Tail_Smooth","iconPath":{"page":0,"x":1280,"y":1024,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Miscellaneous","displayOrder":1000,"metabolism":-1,"complexity":1,"exclusionTags":["Tail"]},{"name":"FacialRidges","iconPath":{"page":0,"x":256,"y":384,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":500,"metabolism":0,"complexity":0},{"name":"Body_Fat","iconPath":{"page":0,"x":1280,"y":128,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic_Body","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["BodyType"],"endogeneCategory":"BodyType","bodyType":"Fat"},{"name":"Body_Thin","iconPath":{"page":0,"x":1664,"y":128,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic_Body","displayOrder":10,"metabolism":0,"complexity":0,"exclusionTags":["BodyType"],"endogeneCategory":"BodyType","bodyType":"Thin"},{"name":"Body_Hulk","iconPath":{"page":0,"x":1408,"y":128,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic_Body","displayOrder":30,"metabolism":0,"complexity":0,"exclusionTags":["BodyType"],"endogeneCategory":"BodyType","bodyType":"Hulk"},{"name":"Body_Standard","iconPath":{"page":0,"x":1536,"y":128,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic_Body","displayOrder":0,"metabolism":0,"complexity":0,"exclusionTags":["BodyType"],"endogeneCategory":"BodyType","bodyType":"Standard"},{"name":"Ears_Human","iconPath":{"page":0,"x":1152,"y":256,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":70,"metabolism":0,"complexity":0,"exclusionTags":["Ears"],"endogeneCategory":"Ears"},{"name":"Ears_Pig","iconPath":{"page":0,"x":1280,"y":256,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":70,"metabolism":0,"complexity":0,"exclusionTags":["Ears"],"endogeneCategory":"Ears"},{"name":"Ears_Floppy","iconPath":{"page":0,"x":1024,"y":256,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":70,"metabolism":0,"complexity":0,"exclusionTags":["Ears"],"endogeneCategory":"Ears"},{"name":"Ears_Cat","iconPath":{"page":0,"x":896,"y":256,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":70,"metabolism":0,"complexity":0,"exclusionTags":["Ears"],"endogeneCategory":"Ears"},{"name":"Ears_Pointed","iconPath":{"page":0,"x":1408,"y":256,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":70,"metabolism":0,"complexity":0,"exclusionTags":["Ears"],"endogeneCategory":"Ears"},{"name":"Nose_Human","iconPath":{"page":0,"x":896,"y":768,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":80,"metabolism":0,"complexity":0,"exclusionTags":["Nose"],"endogeneCategory":"Nose"},{"name":"Nose_Pig","iconPath":{"page":0,"x":1024,"y":768,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Miscellaneous","displayOrder":410,"metabolism":0,"complexity":0,"exclusionTags":["Nose"],"endogeneCategory":"Nose"},{"name":"Jaw_Baseline","iconPath":{"page":0,"x":256,"y":640,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":90,"metabolism":0,"complexity":0,"exclusionTags":["Jaw"],"endogeneCategory":"Jaw"},{"name":"Jaw_Heavy","iconPath":{"page":0,"x":384,"y":640,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":95,"metabolism":0,"complexity":0,"exclusionTags":["Jaw"],"endogeneCategory":"Jaw"},{"name":"Head_Gaunt","iconPath":{"page":0,"x":1408,"y":384,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":97,"metabolism":0,"complexity":0,"exclusionTags":["Jaw"],"endogeneCategory":"Jaw"},{"name":"Hands_Human","iconPath":{"page":0,"x":512,"y":512,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Miscellaneous","displayOrder":300,"metabolism":0,"complexity":0,"exclusionTags":["Hands"],"endogeneCategory":"Hands"},{"name":"Hands_Pig","iconPath":{"page":0,"x":640,"y":512,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Miscellaneous","displayOrder":310,"metabolism":1,"complexity":1,"exclusionTags":["Hands"],"endogeneCategory":"Hands"},{"name":"ElongatedFingers","iconPath":{"page":0,"x":1536,"y":256,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Miscellaneous","displayOrder":320,"metabolism":-1,"complexity":1,"exclusionTags":["Hands"],"endogeneCategory":"Hands"},{"name":"Headbone_Human","iconPath":{"page":0,"x":896,"y":512,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":110,"metabolism":0,"complexity":0,"exclusionTags":["Headbone"],"endogeneCategory":"Headbone"},{"name":"Headbone_MiniHorns","iconPath":{"page":0,"x":1024,"y":512,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":110,"metabolism":0,"complexity":0,"exclusionTags":["Headbone"],"endogeneCategory":"Headbone"},{"name":"Headbone_CenterHorn","iconPath":{"page":0,"x":768,"y":512,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":110,"metabolism":0,"complexity":0,"exclusionTags":["Headbone"],"endogeneCategory":"Headbone"},{"name":"Voice_Human","iconPath":{"page":0,"x":896,"y":1152,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":120,"metabolism":0,"complexity":0,"exclusionTags":["Voice"],"endogeneCategory":"Voice"},{"name":"VoicePig","iconPath":{"page":0,"x":1024,"y":1152,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":125,"metabolism":0,"complexity":0,"exclusionTags":["Voice"],"endogeneCategory":"Voice"},{"name":"VoiceRoar","iconPath":{"page":0,"x":1152,"y":1152,"w":128,"h":128},"iconColor":{"R":191,"G":191,"B":191,"A":1.0},"displayCategory":"Cosmetic","displayOrder":130,"metabolism":0,"complexity":0,"exclusionTags":["Voice"],"endogeneCategory":"Voice"},{"name":"WoundHealing_Slow","iconPath":{"page":0,"x":1664,"y":1152,"w":128,"h":128},"displayCategory":"Healing","displayOrder":30,"metabolism":2,"complexity":1,"exclusionTags":["WoundHealingRate"],"statFactors":{"InjuryHealingFactor":0.5}},{"name":"WoundHealing_Fast","iconPath":{"page":0,"x":1536,"y":1152,"w":128,"h":128},"displayCategory":"Healing","displayOrder":40,"metabolism":-2,"complexity":1,"exclusionTags":["WoundHealingRate"],"statFactors":{"InjuryHealingFactor":2.0}},{"name":"WoundHealing_SuperFast","iconPath":{"page":0,"x":0,"y":1280,"w":128,"h":128},"displayCategory":"Healing","displayOrder":50,"metabolism":-3,"complexity":1,"exclusionTags":["WoundHealingRate"],"statFactors":{"InjuryHealingFactor":4.0}},{"name":"Immunity_Weak","iconPath":{"page":0,"x":1280,"y":1152,"w":128,"h":128},"displayCategory":"Healing","displayOrder":0,"metabolism":2,"complexity":1,"exclusionTags":["Immunity"],"statFactors":{"ImmunityGainSpeed":0.9}},{"name":"Immunity_Strong","iconPath":{"page":0,"x":512,"y":1024,"w":128,"h":128},"displayCategory":"Healing","displayOrder":10,"metabolism":-1,"complexity":1,"exclusionTags":["Immunity"],"statFactors":{"ImmunityGainSpeed":1.1}},{"name":"Immunity_SuperStrong","iconPath":{"page":0,"x":896,"y":1024,"w":128,"h":128},"displayCategory":"Healing","displayOrder":20,"metabolism":-2,"complexity":2,"exclusionTags":["Immunity"],"statFactors":{"ImmunityGainSpeed":1.5}},{"name":"ToxicEnvironmentResistance_Partial","iconPath":{"page":0,"x":1408,"y":768,"w":128,"h":128},"displayCategory":"ResistanceAndWeakness","displayOrder":20,"metabolism":-1,"complexity":1,"exclusionTags":["ToxicEnvironmentResistance"],"statOffsets":{"ToxicEnvironmentResistance":0.5}},{"name":"ToxicEnvironmentResistance_Total","iconPath":{"page":0,"x":1536,"y":1024,"w":128,"h":128},"displayCategory":"ResistanceAndWeakness","displayOrder":30,"metabolism":-3,"complexity":2,"exclusionTags":["ToxicEnvironmentResistance"],"statOffsets":{"ToxicEnvironmentResistance":1.0}},{"name":"Sterile","iconPath":{"page":0,"x":384,"y":1024,"w":128,"h":128},"displayCategory":"Reproduction","displayOrder":100,"metabolism":1,"complexity":1,"exclusionTags":["Fertility"],"statFactors":{"Fertility":0.0}},{"name":"Fertile","iconPath":{"page":0,"x":512,"y":384,"w":128,"h":128},"displayCategory":"Reproduction","displayOrder":110,"metabolism":0,"complexity":1,"exclusionTags":["Fertility"],"statFactors":{"Fertility":2.0}},{"name":"Superclotting","iconPath":{"page":0,"x":1024,"y":1024,"w":128,"h":128},"displayCategory":"Healing","displayOrder":100,"metabolism":-1,"complexity":1},{"name":"KindInstinct","iconPath":{"page":0,"x":640,"y":640,"w":128,"h":128},"displayCategory":"Violence","displayOrder":60,"metabolism":-1,"complexity":1,"traits":{"Kind":0}},{"name":"ViolenceDisabled","iconPath":{"page":0,"x":768,"y":1152,"w":128,"h":128},"displayCategory":"Violence","displayOrder":50,"metabolism":3,"complexity":1,"exclusionTags":["MeleeDamage","ShootingAccuracy","Aggressive","KillThirst"],"disabledWork":["Violent"]},{"name":"Nearsighted","iconPath":{"page":0,"x":512,"y":768,"w":128,"h":128},"displayCategory":"Miscellaneous","displayOrder":50,"metabolism":2,"complexity":1,"exclusionTags":["ShootingAccuracy"],"statFactors":{"ShootingAccuracyFactor_Long":0.25,"ShootingAccuracyFactor_Medium":0.5}},{"name":"StrongStomach","iconPath":{"page":0,"x":768,"y":1024,"w":128,"h":128},"displayCategory":"Miscellaneous","displayOrder":9,"metabolism":-1,"complexity":1},{"name":"DarkVision","iconPath":{"page":0,"x":128,"y":256,"w":128,"h":128},"displayCategory":"Miscellaneous","displayOrder":60,"metabolism":-1,"complexity":1},{"name":"KillThirst","iconPath":{"page":0,"x":512,"y":640,"w":128,"h":128},"displayCategory":"Violence","displayOrder":60,"metabolism":4,"complexity":1,"exclusionTags":["KillThirst"]},{"name":"FireResistant","iconPath":{"page":0,"x":640,"y":384,"w":128,"h":128},"displayCategory":"ResistanceAndWeakness","displayOrder":60,"metabolism":-2,"complexity":1,"exclusionTags":["FireDamage"],"statFactors":{"Flammability":0.1},"damageFactors":{"Flame":0.25}},{"name":"Inbred","iconPath":{"page":0,"x":0,"y":640,"w":128,"h":128},"displayCategory":"Miscellaneous","displayOrder":110,"metabolism":-2,"complexity":1,"traits":{"SlowLearner":0},"statFactors":{"Fertility":0.5,"ImmunityGainSpeed":0.85}},{"name":"RobustDigestion","iconPath":{"page":0,"x":1280,"y":896,"w":128,"h":128},"displayCategory":"Miscellaneous","displayOrder":10,"metabolism":-2,"complexity":2,"statFactors":{"RawNutritionFactor":1.8}},{"name":"Instability_Mild","iconPath":{"page":0,"x":1536,"y":640,"w":128,"h":128},"displayCategory":"Miscellaneous","displayOrder":130,"metabolism":2,"complexity":1,"exclusionTags":["CellInstability"],"statFactors":{"LifespanFactor":0.8,"CancerRate":3.0,"ImmunityGainSpeed":0.96}},{"name":"Instability_Major","iconPath":{"page":0,"x":1024,"y":640,"w":128,"h":128},"displayCategory":"Miscellaneous","displayOrder":135,"metabolism":4,"complexity":1,"exclusionTags":["CellInstability"],"statFactors":{"LifespanFactor":0.6,"CancerRate":5.0,"ImmunityGainSpeed":0.92}},{"name":"PsychicBonding","iconPath":{"page":0,"x":512,"y":896,"w":128,"h":128},"displayCategory":"Psychic","displayOrder":100,"metabolism":-1,"complexity":1},{"name":"PollutionRush","iconPath":{"page":0,"x":256,"y":896,"w":128,"h":128},"displayCategory":"Miscellaneous","displayOrder":500,"metabolism":-1,"complexity":1},{"name":"Unstoppable","iconPath":{"page":0,"x":384,"y":1152,"w":128,"h":128},"displayCategory":"Miscellaneous","displayOrder":550,"metabolism":-2,"complexity":1,"statFactors":{"StaggerDurationFactor":0.0}},{"name":"NakedSpeed","iconPath":{"page":0,"x":384,"y":768,"w":128,"h":128},"displayCategory":"Movement","displayOrder":500,"metabolism":2,"complexity":1},{"name":"Hemogenic","iconPath":{"page":0,"x":1408,"y":512,"w":128,"h":128},"displayCategory":"Hemogen","displayOrder":-2,"metabolism":1,"complexity":1,"selectionWeight":0.0},{"name":"HemogenDrain","iconPath":{"page":0,"x":1280,"y":512,"w":128,"h":128},"displayCategory":"Hemogen","displayOrder":-1,"metabolism":6,"complexity":1},{"name":"FireWeakness","iconPath":{"page":0,"x":896,"y":384,"w":128,"h":128},"displayCategory":"ResistanceAndWeakness","displayOrder":70,"metabolism":2,"complexity":1,"exclusionTags":["FireDamage"],"damageFactors":{"Flame":4.0}},{"name":"FireTerror","iconPath":{"page":0,"x":768,"y":384,"w":128,"h":128},"displayCategory":"ResistanceAndWeakness","displayOrder":80,"metabolism":4,"complexity":1},{"name":"PerfectImmunity","iconPath":{"page":0,"x":1664,"y":768,"w":128,"h":128},"displayCategory":"Archite","displayOrder":0,"metabolism":0,"complexity":3,"exclusionTags":["Immunity"]},{"name":"DiseaseFree","iconPath":{"page":0,"x":768,"y":768,"w":128,"h":128},"displayCategory":"Archite","displayOrder":0,"metabolism":0,"complexity":3},{"name":"TotalHealing","iconPath":{"page":0,"x":1408,"y":1024,"w":128,"h":128},"displayCategory":"Archite","displayOrder":0,"metabolism":0,"complexity":4},{"name":"Deathrest","iconPath":{"page":0,"x":512,"y":256,"w":128,"h":128},"displayCategory":"Hemogen","displayOrder":0,"metabolism":6,"complexity":1},{"name":"Ageless","iconPath":{"page":0,"x":256,"y":128,"w":128,"h":128},"displayCategory":"Archite","displayOrder":0,"metabolism":0,"complexity":3},{"name":"Deathless","iconPath":{"page":0,"x":384,"y":256,"w":128,"h":128},"displayCategory":"Archite","displayOrder":0,"metabolism":0,"complexity":7},{"name":"ArchiteMetabolism","iconPath":{"page":0,"x":640,"y":128,"w":128,"h":128},"displayCategory":"Archite","displayOrder":0,"metabolism":6,"complexity":6},{"name":"MinTemp_SmallIncrease","iconPath":{"page":0,"x":256,"y":768,"w":128,"h":128},"displayCategory":"Temperature","displayOrder":0,"metabolism":1,"complexity":1,"exclusionTags":["MinTemperature"],"statOffsets":{"ComfyTemperatureMin":5.0}},{"name":"MinTemp_SmallDecrease","iconPath":{"page":0,"x":128,"y":768,"w":128,"h":128},"displayCategory":"Temperature","displayOrder":10,"metabolism":-1,"complexity":1,"exclusionTags":["MinTemperature"],"statOffsets":{"ComfyTemperatureMin":-10.0}},{"name":"MinTemp_LargeDecrease","iconPath":{"page":0,"x":0,"y":768,"w":128,"h":128},"displayCategory":"Temperature","displayOrder":20,"metabolism":-2,"complexity":1,"exclusionTags":["MinTemperature"],"statOffsets":{"ComfyTemperatureMin":-20.0}},{"name":"MaxTemp_LargeIncrease","iconPath":{"page":0,"x":1152,"y":640,"w":128,"h":128},"displayCategory":"Temperature","displayOrder":50,"metabolism":-2,"complexity":1,"exclusionTags":["MaxTemperature"],"statOffsets":{"ComfyTemperatureMax":20.0}},{"name":"MaxTemp_SmallIncrease","iconPath":{"page":0,"x":1408,"y":640,"w":128,"h":128},"displayCategory":"Temperature","displayOrder":40,"metabolism":-1,"complexity":1,"exclusionTags":["MaxTemperature"],"statOffsets":{"ComfyTemperatureMax":10.0}},{"name":"MaxTemp_SmallDecrease","iconPath":{"page":0,"x":1280,"y":640,"w":128,"h":128},"displayCategory":"Temperature","displayOrder":30,"metabolism":1,"complexity":1,"exclusionTags":["MaxTemperature"],"statOffsets":{"ComfyTemperatureMax":-5.0}},{"name":"PsychicAbility_Deaf","iconPath":{"page":0,"x":640,"y":896,"w":128,"h":128},"displayCategory":"Psychic","displayOrder":0,"metabolism":2,"complexity":1,"exclusionTags":["PsychicAbility"],"traits":{"PsychicSensitivity":-2}},{"name":"PsychicAbility_Dull","iconPath":{"page":0,"x":768,"y":896,"w":128,"h":128},"displayCategory":"Psychic","displayOrder":10,"metabolism":1,"complexity":1,"exclusionTags":["PsychicAbility"],"traits":{"PsychicSensitivity":-1}},{"name":"PsychicAbility_Enhanced","iconPath":{"page":0,"x":1664,"y":256,"w":128,"h":128},"displayCategory":"Psychic","displayOrder":20,"metabolism":-2,"complexity":1,"exclusionTags":["PsychicAbility"],"statOffsets":{"PsychicSensitivity":0.2,"MeditationFocusGain":0.1,"PsychicEntropyRecoveryRate":0.1}},{"name":"PsychicAbility_Extreme","iconPath":{"page":0,"x":128,"y":384,"w":128,"h":128},"displayCategory":"Psychic","displayOrder":30,"metabolism":-5,"complexity":2,"exclusionTags":["PsychicAbility"],"statOffsets":{"PsychicSensitivity":0.4,"MeditationFocusGain":0.2,"PsychicEntropyRecoveryRate":0.2}},{"name":"MoveSpeed_Slow","iconPath":{"page":0,"x":128,"y":1024,"w":128,"h":128},"displayCategory":"Movement","displayOrder":0,"metabolism":3,"complexity":1,"exclusionTags":["MoveSpeed"],"statOffsets":{"MoveSpeed":-0.2}},{"name":"MoveSpeed_Quick","iconPath":{"page":0,"x":896,"y":896,"w":128,"h":128},"displayCategory":"Movement","displayOrder":10,"metabolism":-3,"complexity":1,"exclusionTags":["MoveSpeed"],"statOffsets":{"MoveSpeed":0.2}},{"name":"MoveSpeed_VeryQuick","iconPath":{"page":0,"x":512,"y":1152,"w":128,"h":128},"displayCategory":"Movement","displayOrder":20,"metabolism":-5,"complexity":1,"exclusionTags":["MoveSpeed"],"statOffsets":{"MoveSpeed":0.4}},{"name":"Beauty_VeryUgly","iconPath":{"page":0,"x":256,"y":1024,"w":128,"h":128},"displayCategory":"Beauty","displayOrder":0,"metabolism":2,"complexity":1,"exclusionTags":["Beauty"],"statOffsets":{"PawnBeauty":-2.0}},{"name":"Beauty_Ugly","iconPath":{"page":0,"x":128,"y":1152,"w":128,"h":128},"displayCategory":"Beauty","displayOrder":10,"metabolism":1,"complexity":1,"exclusionTags":["Beauty"],"statOffsets":{"PawnBeauty":-1.0}},{"name":"Beauty_Pretty","iconPath":{"page":0,"x":384,"y":896,"w":128,"h":128},"displayCategory":"Beauty","displayOrder":20,"metabolism":-1,"complexity":1,"exclusionTags":["Beauty"],"statOffsets":{"PawnBeauty":1.0}},{"name":"Beauty_Beautiful","iconPath":{"page":0,"x":1024,"y":128,"w":128,"h":128},"displayCategory":"Beauty","displayOrder":30,"metabolism":-2,"complexity":1,"exclusionTags":["Beauty"],"statOffsets":{"PawnBeauty":2.0}},{"name":"Learning_Slow","iconPath":{"page":0,"x":0,"y":1024,"w":128,"h":128},"displayCategory":"Miscellaneous","displayOrder":30,"metabolism":2,"complexity":1,"exclusionTags":["Learning"],"statFactors":{"GlobalLearningFactor":0.5}},{"name":"Learning_Fast","iconPath":{"page":0,"x":384,"y":384,"w":128,"h":128},"displayCategory":"Miscellaneous","displayOrder":35,"metabolism":-3,"complexity":2,"exclusionTags":["Learning"],"statOffsets":{"GlobalLearningFactor":0.5}},{"name":"Mood_Depressive","iconPath":{"page":0,"x":768,"y":256,"w":128,"h":128},"displayCategory":"Mood","displayOrder":0,"metabolism":5,"complexity":1,"exclusionTags":["Mood"]},{"name":"Mood_Pessimist","iconPath":{"page":0,"x":0,"y":896,"w":128,"h":128},"displayCategory":"Mood","displayOrder":10,"metabolism":3,"complexity":1,"exclusionTags":["Mood"]},{"name":"Mood_Optimist","iconPath":{"page":0,"x":1152,"y":768,"w":128,"h":128},"displayCategory":"Mood","displayOrder":20,"metabolism":-1,"complexity":2,"exclusionTags":["Mood"]},{"name":"Mood_Sanguine","iconPath":{"page":0,"x":1408,"y":896,"w":128,"h":128},"displayCategory":"Mood","displayOrder":30,"metabolism":-2,"complexity":3,"exclusionTags":["Mood"]},{"name":"ToxResist_Partial","iconPath":{"page":0,"x":1536,"y":768,"w":128,"h":128},"displayCategory":"ResistanceAndWeakness","displayOrder":0,"metabolism":-2,"complexity":1,"exclusionTags":["ToxResistance"],"statOffsets":{"ToxicResistance":0.5}},{"name":"ToxResist_Total","iconPath":{"page":0,"x":1664,"y":1024,"w":128,"h":128},"displayCategory":"ResistanceAndWeakness","displayOrder":10,"metabolism":-4,"complexity":2,"exclusionTags":["ToxResistance"],"statOffsets":{"ToxicResistance":1.0}},{"name":"Delicate","iconPath":{"page":0,"x":640,"y":256,"w":128,"h":128},"displayCategory":"Pain","displayOrder":0,"metabolism":3,"complexity":1,"exclusionTags":["Toughness"],"traits":{"Delicate":0}},{"name":"Robust","iconPath":{"page":0,"x":0,"y":1152,"w":128,"h":128},"displayCategory":"Pain","displayOrder":10,"metabolism":-2,"complexity":1,"exclusionTags":["Toughness"],"statFactors":{"IncomingDamageFactor":0.75}},{"name":"Pain_Reduced","iconPath":{"page":0,"x":1280,"y":768,"w":128,"h":128},"displayCategory":"Pain","displayOrder":30,"metabolism":-1,"complexity":1,"exclusionTags":["Pain"]},{"name":"Pain_Extra","iconPath":{"page":0,"x":0,"y":384,"w":128,"h":128},"displayCategory":"Pain","displayOrder":20,"metabolism":2,"complexity":1,"exclusionTags":["Pain"],"traits":{"Wimp":0}},{"name":"Aggression_DeadCalm","iconPath":{"page":0,"x":256,"y":256,"w":128,"h":128},"displayCategory":"Violence","displayOrder":0,"metabolism":-1,"complexity":1,"exclusionTags":["Aggression"]},{"name":"Aggression_Aggressive","iconPath":{"page":0,"x":384,"y":128,"w":128,"h":128},"displayCategory":"Violence","displayOrder":10,"metabolism":2,"complexity":1,"exclusionTags":["Aggressive","Aggression"]},{"name":"Aggression_HyperAggressive","iconPath":{"page":0,"x":1664,"y":512,"w":128,"h":128},"displayCategory":"Violence","displayOrder":20,"metabolism":3,"complexity":1,"exclusionTags":["Aggressive","Aggression"]},{"name":"VerySleepy","iconPath":{"page":0,"x":640,"y":1152,"w":128,"h":128},"displayCategory":"Sleep","displayOrder":0,"metabolism":4,"complexity":1,"exclusionTags":["Sleep"],"statFactors":{"RestFallRateFactor":1.8}},{"name":"Sleepy","iconPath":{"page":0,"x":1664,"y":896,"w":128,"h":128},"displayCategory":"Sleep","displayOrder":10,"metabolism":2,"complexity":1,"exclusionTags":["Sleep"],"statFactors":{"RestFallRateFactor":1.4}},{"name":"LowSleep","iconPath":{"page":0,"x":1024,"y":896,"w":128,"h":128},"displayCategory":"Sleep","displayOrder":20,"metabolism":-4,"complexity":2,"exclusionTags":["Sleep"],"statFactors":{"RestFallRateFactor":0.4}},{"name":"Neversleep","iconPath":{"page":0,"x":640,"y":768,"w":128,"h":128},"displayCategory":"Sleep","displayOrder":30,"metabolism":-6,"complexity":3,"exclusionTags":["Sleep"]},{"name":"MeleeDamage_Weak","iconPath":{"page":0,"x":1408,"y":1152,"w":128,"h":128},"displayCategory":"Violence","displayOrder":30,"metabolism":1,"complexity":1,"exclusionTags":["MeleeDamage"],"statFactors":{"MeleeDamageFactor":0.5}},{"name":"MeleeDamage_Strong","iconPath":{"page":0,"x":640,"y":1024,"w":128,"h":128},"displayCategory":"Violence","displayOrder":40,"metabolism":-2,"complexity":1,"exclusionTags":["MeleeDamage"],"statFactors":{"MeleeDamageFactor":1.5}},{"name":"UVSensitivity_Mild","iconPath":{"page":0,"x":1664,"y":640,"w":128,"h":128},"displayCategory":"ResistanceAndWeakness","displayOrder":40,"metabolism":3,"complexity":1,"exclusionTags":["UVSensitivity"]},{"name":"UVSensitivity_Intense","iconPath":{"page":0,"x":128,"y":640,"w":128,"h":128},"displayCategory":"ResistanceAndWeakness","displayOrder":50,"metabolism":4,"complexity":2,"exclusionTags":["UVSensitivity"]},{"name":"Libido_Low","iconPath":{"page":0,"x":896,"y":640,"w":128,"h":128},"displayCategory":"Reproduction","displayOrder":0,"metabolism":0,"complexity":1,"exclusionTags":["Libido"]},{"name":"Libido_High","iconPath":{"page":0,"x":1536,"y":512,"w":128,"h":128},"displayCategory":"Reproduction","displayOrder":10,"metabolism":0,"complexity":1,"exclusionTags":["Libido"]},{"name":"Hair_SnowWhite","iconPath":{"page":0,"x":0,"y":512,"w":128,"h":128},"displayCategory":"Cosmetic_Hair","displayOrder":0,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.05,"hairColor":{"R":250,"G":250,"B":250,"A":1.0}},{"name":"Hair_InkBlack","iconPath":{"page":0,"x":0,"y":512,"w":128,"h":128},"displayCategory":"Cosmetic_Hair","displayOrder":130,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.05,"hairColor":{"R":25,"G":25,"B":25,"A":1.0}},{"name":"Hair_Gray","iconPath":{"page":0,"x":0,"y":512,"w":128,"h":128},"displayCategory":"Cosmetic_Hair","displayOrder":10,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.02,"hairColor":{"R":165,"G":165,"B":165,"A":1.0}},{"name":"Hair_DarkBlack","iconPath":{"page":0,"x":0,"y":512,"w":128,"h":128},"displayCategory":"Cosmetic_Hair","displayOrder":120,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":1.5,"hairColor":{"R":51,"G":51,"B":51,"A":1.0}},{"name":"Hair_MidBlack","iconPath":{"page":0,"x":0,"y":512,"w":128,"h":128},"displayCategory":"Cosmetic_Hair","displayOrder":110,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":1.5,"hairColor":{"R":79,"G":71,"B":66,"A":1.0}},{"name":"Hair_DarkReddish","iconPath":{"page":0,"x":0,"y":512,"w":128,"h":128},"displayCategory":"Cosmetic_Hair","displayOrder":100,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":1.5,"hairColor":{"R":63,"G":51,"B":38,"A":1.0}},{"name":"Hair_DarkSaturatedReddish","iconPath":{"page":0,"x":0,"y":512,"w":128,"h":128},"displayCategory":"Cosmetic_Hair","displayOrder":90,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":1.5,"hairColor":{"R":56,"G":36,"B":18,"A":1.0}},{"name":"Hair_DarkBrown","iconPath":{"page":0,"x":0,"y":512,"w":128,"h":128},"displayCategory":"Cosmetic_Hair","displayOrder":80,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","hairColor":{"R":90,"G":58,"B":32,"A":1.0}},{"name":"Hair_ReddishBrown","iconPath":{"page":0,"x":0,"y":512,"w":128,"h":128},"displayCategory":"Cosmetic_Hair","displayOrder":75,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","hairColor":{"R":132,"G":83,"B":47,"A":1.0}},{"name":"Hair_SandyBlonde","iconPath":{"page":0,"x":0,"y":512,"w":128,"h":128},"displayCategory":"Cosmetic_Hair","displayOrder":60,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","hairColor":{"R":193,"G":146,"B":85,"A":1.0}},{"name":"Hair_Blonde","iconPath":{"page":0,"x":0,"y":512,"w":128,"h":128},"displayCategory":"Cosmetic_Hair","displayOrder":50,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","hairColor":{"R":237,"G":202,"B":156,"A":1.0}},{"name":"Hair_Pink","iconPath":{"page":0,"x":0,"y":512,"w":128,"h":128},"displayCategory":"Cosmetic_Hair","displayOrder":170,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.05,"hairColor":{"R":191,"G":86,"B":149,"A":1.0}},{"name":"Hair_LightPurple","iconPath":{"page":0,"x":0,"y":512,"w":128,"h":128},"displayCategory":"Cosmetic_Hair","displayOrder":180,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.05,"hairColor":{"R":227,"G":115,"B":255,"A":1.0}},{"name":"Hair_LightBlue","iconPath":{"page":0,"x":0,"y":512,"w":128,"h":128},"displayCategory":"Cosmetic_Hair","displayOrder":140,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.05,"hairColor":{"R":34,"G":63,"B":227,"A":1.0}},{"name":"Hair_LightTeal","iconPath":{"page":0,"x":0,"y":512,"w":128,"h":128},"displayCategory":"Cosmetic_Hair","displayOrder":150,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.05,"hairColor":{"R":52,"G":191,"B":182,"A":1.0}},{"name":"Hair_LightGreen","iconPath":{"page":0,"x":0,"y":512,"w":128,"h":128},"displayCategory":"Cosmetic_Hair","displayOrder":160,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.05,"hairColor":{"R":72,"G":201,"B":40,"A":1.0}},{"name":"Hair_LightOrange","iconPath":{"page":0,"x":0,"y":512,"w":128,"h":128},"displayCategory":"Cosmetic_Hair","displayOrder":70,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.05,"hairColor":{"R":189,"G":133,"B":49,"A":1.0}},{"name":"Hair_BrightRed","iconPath":{"page":0,"x":0,"y":512,"w":128,"h":128},"displayCategory":"Cosmetic_Hair","displayOrder":190,"metabolism":0,"complexity":0,"exclusionTags":["HairColor"],"endogeneCategory":"HairColor","selectionWeight":0.05,"hairColor":{"R":191,"G":86,"B":86,"A":1.0}},{"name":"Skin_Melanin1","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["SkinColor"],"endogeneCategory":"Melanin","selectionWeight":0.2,"skinColor":{"R":242,"G":237,"B":224,"A":1.0},"melanin":0.0},{"name":"Skin_Melanin2","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["SkinColor"],"endogeneCategory":"Melanin","selectionWeight":0.5,"skinColor":{"R":255,"G":239,"B":213,"A":1.0},"melanin":0.1},{"name":"Skin_Melanin3","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["SkinColor"],"endogeneCategory":"Melanin","selectionWeight":0.5,"skinColor":{"R":255,"G":239,"B":201,"A":1.0},"melanin":0.25},{"name":"Skin_Melanin4","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["SkinColor"],"endogeneCategory":"Melanin","selectionWeight":0.5,"skinColor":{"R":255,"G":239,"B":189,"A":1.0},"melanin":0.45},{"name":"Skin_Melanin5","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["SkinColor"],"endogeneCategory":"Melanin","selectionWeight":0.0,"skinColor":{"R":249,"G":219,"B":165,"A":1.0},"melanin":0.58},{"name":"Skin_Melanin6","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["SkinColor"],"endogeneCategory":"Melanin","selectionWeight":0.0,"skinColor":{"R":242,"G":199,"B":140,"A":1.0},"melanin":0.63},{"name":"Skin_Melanin7","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["SkinColor"],"endogeneCategory":"Melanin","selectionWeight":0.0,"skinColor":{"R":228,"G":158,"B":90,"A":1.0},"melanin":0.75},{"name":"Skin_Melanin8","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["SkinColor"],"endogeneCategory":"Melanin","selectionWeight":0.5,"skinColor":{"R":130,"G":91,"B":48,"A":1.0},"melanin":0.83},{"name":"Skin_Melanin9","iconPath":{"page":0,"x":1536,"y":896,"w":128,"h":128},"displayCategory":"Cosmetic_Skin","displayOrder":20,"metabolism":0,"complexity":0,"exclusionTags":["SkinColor"],"endogeneCategory":"Melanin","selectionWeight":0.2,"skinColor":{"R":99,"G":70,"B":36,"A":1.0},"melanin":0.9},{"name":"AptitudeTerrible_Shooting","iconPath":{"page":0,"x":384,"y":1664,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":0,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeShooting"],"skills":{"Shooting":-8}},{"name":"AptitudePoor_Shooting","iconPath":{"page":0,"x":0,"y":1664,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":1,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeShooting"],"skills":{"Shooting":-4}},{"name":"AptitudeStrong_Shooting","iconPath":{"page":0,"x":256,"y":1664,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":2,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeShooting"],"skills":{"Shooting":4}},{"name":"AptitudeRemarkable_Shooting","iconPath":{"page":0,"x":128,"y":1664,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":3,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeShooting"],"skills":{"Shooting":8}},{"name":"AptitudeTerrible_Melee","iconPath":{"page":0,"x":640,"y":1536,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":4,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeMelee"],"skills":{"Melee":-8}},{"name":"AptitudePoor_Melee","iconPath":{"page":0,"x":256,"y":1536,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":5,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeMelee"],"skills":{"Melee":-4}},{"name":"AptitudeStrong_Melee","iconPath":{"page":0,"x":512,"y":1536,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":6,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeMelee"],"skills":{"Melee":4}},{"name":"AptitudeRemarkable_Melee","iconPath":{"page":0,"x":384,"y":1536,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":7,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeMelee"],"skills":{"Melee":8}},{"name":"AptitudeTerrible_Construction","iconPath":{"page":0,"x":1664,"y":1280,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":8,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeConstruction"],"skills":{"Construction":-8}},{"name":"AptitudePoor_Construction","iconPath":{"page":0,"x":1280,"y":1280,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":9,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeConstruction"],"skills":{"Construction":-4}},{"name":"AptitudeStrong_Construction","iconPath":{"page":0,"x":1536,"y":1280,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":10,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeConstruction"],"skills":{"Construction":4}},{"name":"AptitudeRemarkable_Construction","iconPath":{"page":0,"x":1408,"y":1280,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":11,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeConstruction"],"skills":{"Construction":8}},{"name":"AptitudeTerrible_Mining","iconPath":{"page":0,"x":1152,"y":1536,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":12,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeMining"],"skills":{"Mining":-8}},{"name":"AptitudePoor_Mining","iconPath":{"page":0,"x":768,"y":1536,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":13,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeMining"],"skills":{"Mining":-4}},{"name":"AptitudeStrong_Mining","iconPath":{"page":0,"x":1024,"y":1536,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":14,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeMining"],"skills":{"Mining":4}},{"name":"AptitudeRemarkable_Mining","iconPath":{"page":0,"x":896,"y":1536,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":15,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeMining"],"skills":{"Mining":8}},{"name":"AptitudeTerrible_Cooking","iconPath":{"page":0,"x":384,"y":1408,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":16,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeCooking"],"skills":{"Cooking":-8}},{"name":"AptitudePoor_Cooking","iconPath":{"page":0,"x":0,"y":1408,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":17,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeCooking"],"skills":{"Cooking":-4}},{"name":"AptitudeStrong_Cooking","iconPath":{"page":0,"x":256,"y":1408,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":18,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeCooking"],"skills":{"Cooking":4}},{"name":"AptitudeRemarkable_Cooking","iconPath":{"page":0,"x":128,"y":1408,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":19,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeCooking"],"skills":{"Cooking":8}},{"name":"AptitudeTerrible_Plants","iconPath":{"page":0,"x":1664,"y":1536,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":20,"metabolism":2,"complexity":1,"exclusionTags":["AptitudePlants"],"skills":{"Plants":-8}},{"name":"AptitudePoor_Plants","iconPath":{"page":0,"x":1280,"y":1536,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":21,"metabolism":1,"complexity":1,"exclusionTags":["AptitudePlants"],"skills":{"Plants":-4}},{"name":"AptitudeStrong_Plants","iconPath":{"page":0,"x":1536,"y":1536,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":22,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudePlants"],"skills":{"Plants":4}},{"name":"AptitudeRemarkable_Plants","iconPath":{"page":0,"x":1408,"y":1536,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":23,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudePlants"],"skills":{"Plants":8}},{"name":"AptitudeTerrible_Animals","iconPath":{"page":0,"x":640,"y":1280,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":24,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeAnimals"],"skills":{"Animals":-8}},{"name":"AptitudePoor_Animals","iconPath":{"page":0,"x":256,"y":1280,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":25,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeAnimals"],"skills":{"Animals":-4}},{"name":"AptitudeStrong_Animals","iconPath":{"page":0,"x":512,"y":1280,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":26,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeAnimals"],"skills":{"Animals":4}},{"name":"AptitudeRemarkable_Animals","iconPath":{"page":0,"x":384,"y":1280,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":27,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeAnimals"],"skills":{"Animals":8}},{"name":"AptitudeTerrible_Crafting","iconPath":{"page":0,"x":896,"y":1408,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":28,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeCrafting"],"skills":{"Crafting":-8}},{"name":"AptitudePoor_Crafting","iconPath":{"page":0,"x":512,"y":1408,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":29,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeCrafting"],"skills":{"Crafting":-4}},{"name":"AptitudeStrong_Crafting","iconPath":{"page":0,"x":768,"y":1408,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":30,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeCrafting"],"skills":{"Crafting":4}},{"name":"AptitudeRemarkable_Crafting","iconPath":{"page":0,"x":640,"y":1408,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":31,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeCrafting"],"skills":{"Crafting":8}},{"name":"AptitudeTerrible_Artistic","iconPath":{"page":0,"x":1152,"y":1280,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":32,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeArtistic"],"skills":{"Artistic":-8}},{"name":"AptitudePoor_Artistic","iconPath":{"page":0,"x":768,"y":1280,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":33,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeArtistic"],"skills":{"Artistic":-4}},{"name":"AptitudeStrong_Artistic","iconPath":{"page":0,"x":1024,"y":1280,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":34,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeArtistic"],"skills":{"Artistic":4}},{"name":"AptitudeRemarkable_Artistic","iconPath":{"page":0,"x":896,"y":1280,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":35,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeArtistic"],"skills":{"Artistic":8}},{"name":"AptitudeTerrible_Medicine","iconPath":{"page":0,"x":128,"y":1536,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":36,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeMedicine"],"skills":{"Medicine":-8}},{"name":"AptitudePoor_Medicine","iconPath":{"page":0,"x":1536,"y":1408,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":37,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeMedicine"],"skills":{"Medicine":-4}},{"name":"AptitudeStrong_Medicine","iconPath":{"page":0,"x":0,"y":1536,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":38,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeMedicine"],"skills":{"Medicine":4}},{"name":"AptitudeRemarkable_Medicine","iconPath":{"page":0,"x":1664,"y":1408,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":39,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeMedicine"],"skills":{"Medicine":8}},{"name":"AptitudeTerrible_Intellectual","iconPath":{"page":0,"x":1408,"y":1408,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":40,"metabolism":2,"complexity":1,"exclusionTags":["AptitudeIntellectual"],"skills":{"Intellectual":-8}},{"name":"AptitudePoor_Intellectual","iconPath":{"page":0,"x":1024,"y":1408,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":41,"metabolism":1,"complexity":1,"exclusionTags":["AptitudeIntellectual"],"skills":{"Intellectual":-4}},{"name":"AptitudeStrong_Intellectual","iconPath":{"page":0,"x":1280,"y":1408,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":42,"metabolism":-1,"complexity":2,"exclusionTags":["AptitudeIntellectual"],"skills":{"Intellectual":4}},{"name":"AptitudeRemarkable_Intellectual","iconPath":{"page":0,"x":1152,"y":1408,"w":128,"h":128},"displayCategory":"Aptitudes","displayOrder":43,"metabolism":-3,"complexity":2,"exclusionTags":["AptitudeIntellectual"],"skills":{"Intellectual":8}},{"name":"ChemicalDependency_Alcohol","iconPath":{"page":0,"x":256,"y":0,"w":128,"h":128},"displayCategory":"Drugs","displayOrder":0,"metabolism":3,"complexity":1,"exclusionTags":["DrugAlcohol"]},{"name":"AddictionResistant_Alcohol","iconPath":{"page":0,"x":128,"y":0,"w":128,"h":128},"displayCategory":"Drugs","displayOrder":1,"metabolism":-1,"complexity":1,"exclusionTags":["DrugAlcohol"]},{"name":"AddictionImmune_Alcohol","iconPath":{"page":0,"x":0,"y":0,"w":128,"h":128},"displayCategory":"Drugs","displayOrder":2,"metabolism":-3,"complexity":2,"exclusionTags":["DrugAlcohol"]},{"name":"ChemicalDependency_Smokeleaf","iconPath":{"page":0,"x":1408,"y":0,"w":128,"h":128},"displayCategory":"Drugs","displayOrder":3,"metabolism":3,"complexity":1,"exclusionTags":["DrugSmokeleaf"]},{"name":"AddictionResistant_Smokeleaf","iconPath":{"page":0,"x":1280,"y":0,"w":128,"h":128},"displayCategory":"Drugs","displayOrder":4,"metabolism":-1,"complexity":1,"exclusionTags":["DrugSmokeleaf"]},{"name":"AddictionImmune_Smokeleaf","iconPath":{"page":0,"x":1152,"y":0,"w":128,"h":128},"displayCategory":"Drugs","displayOrder":5,"metabolism":-3,"complexity":2,"exclusionTags":["DrugSmokeleaf"]},{"name":"ChemicalDependency_Psychite","iconPath":{"page":0,"x":1024,"y":0,"w":128,"h":128},"displayCategory":"Drugs","displayOrder":6,"metabolism":4,"complexity":1,"exclusionTags":["DrugPsychite"]},{"name":"AddictionResistant_Psychite","iconPath":{"page":0,"x":896,"y":0,"w":128,"h":128},"displayCategory":"Drugs","displayOrder":7,"metabolism":-2,"complexity":1,"exclusionTags":["DrugPsychite"]},{"name":"AddictionImmune_Psychite","iconPath":{"page":0,"x":768,"y":0,"w":128,"h":128},"displayCategory":"Drugs","displayOrder":8,"metabolism":-5,"complexity":2,"exclusionTags":["DrugPsychite"]},{"name":"ChemicalDependency_GoJuice","iconPath":{"page":0,"x":640,"y":0,"w":128,"h":128},"displayCategory":"Drugs","displayOrder":9,"metabolism":4,"complexity":1,"exclusionTags":["DrugGoJuice"]},{"name":"AddictionResistant_GoJuice","iconPath":{"page":0,"x":512,"y":0,"w":128,"h":128},"displayCategory":"Drugs","displayOrder":10,"metabolism":-2,"complexity":1,"exclusionTags":["DrugGoJuice"]},{"name":"AddictionImmune_GoJuice","iconPath":{"page":0,"x":384,"y":0,"w":128,"h":128},"displayCategory":"Drugs","displayOrder":11,"metabolism":-5,"complexity":2,"exclusionTags":["DrugGoJuice"]},{"name":"ChemicalDependency_WakeUp","iconPath":{"page":0,"x":0,"y":128,"w":128,"h":128},"displayCategory":"Drugs","displayOrder":12,"metabolism":4,"complexity":1,"exclusionTags":["DrugWakeUp"]},{"name":"AddictionResistant_WakeUp","iconPath":{"page":0,"x":1664,"y":0,"w":128,"h":128},"displayCategory":"Drugs","displayOrder":13,"metabolism":-2,"complexity":1,"exclusionTags":["DrugWakeUp"]},{"name":"AddictionImmune_WakeUp","iconPath":{"page":0,"x":1536,"y":0,"w":128,"h":128},"displayCategory":"Drugs","displayOrder":14,"metabolism":-5,"complexity":2,"exclusionTags":["DrugWakeUp"]}];
+/** @type { GeneIndex } */
+var geneIndex = {"byName":{"FireSpew":0,"FoamSpray":1,"LongjumpLegs":2,"AnimalWarcall":3,"Bloodfeeder":4,"Coagulate":5,"XenogermReimplanter":6,"PiercingSpine":7,"AcidSpray":8,"Hair_BaldOnly":9,"Hair_ShortOnly":10,"Hair_LongOnly":11,"Hair_Grayless":12,"Beard_BushyOnly":13,"Beard_NoBeardOnly":14,"Beard_Always":15,"Skin_InkBlack":16,"Skin_SlateGray":17,"Skin_LightGray":18,"Skin_SheerWhite":19,"Skin_Blue":20,"Skin_Purple":21,"Skin_PaleRed":22,"Skin_DeepRed":23,"Skin_PaleYellow":24,"Skin_DeepYellow":25,"Skin_Orange":26,"Skin_Green":27,"Furskin":28,"Eyes_Red":29,"Eyes_Gray":30,"Brow_Heavy":31,"Tail_Furry":32,"Tail_Smooth":33,"FacialRidges":34,"Body_Fat":35,"Body_Thin":36,"Body_Hulk":37,"Body_Standard":38,"Ears_Human":39,"Ears_Pig":40,"Ears_Floppy":41,"Ears_Cat":42,"Ears_Pointed":43,"Nose_Human":44,"Nose_Pig":45,"Jaw_Baseline":46,"Jaw_Heavy":47,"Head_Gaunt":48,"Hands_Human":49,"Hands_Pig":50,"ElongatedFingers":51,"Headbone_Human":52,"Headbone_MiniHorns":53,"Headbone_CenterHorn":54,"Voice_Human":55,"VoicePig":56,"VoiceRoar":57,"WoundHealing_Slow":58,"WoundHealing_Fast":59,"WoundHealing_SuperFast":60,"Immunity_Weak":61,"Immunity_Strong":62,"Immunity_SuperStrong":63,"ToxicEnvironmentResistance_Partial":64,"ToxicEnvironmentResistance_Total":65,"Sterile":66,"Fertile":67,"Superclotting":68,"KindInstinct":69,"ViolenceDisabled":70,"Nearsighted":71,"StrongStomach":72,"DarkVision":73,"KillThirst":74,"FireResistant":75,"Inbred":76,"RobustDigestion":77,"Instability_Mild":78,"Instability_Major":79,"PsychicBonding":80,"PollutionRush":81,"Unstoppable":82,"NakedSpeed":83,"Hemogenic":84,"HemogenDrain":85,"FireWeakness":86,"FireTerror":87,"PerfectImmunity":88,"DiseaseFree":89,"TotalHealing":90,"Deathrest":91,"Ageless":92,"Deathless":93,"ArchiteMetabolism":94,"MinTemp_SmallIncrease":95,"MinTemp_SmallDecrease":96,"MinTemp_LargeDecrease":97,"MaxTemp_LargeIncrease":98,"MaxTemp_SmallIncrease":99,"MaxTemp_SmallDecrease":100,"PsychicAbility_Deaf":101,"PsychicAbility_Dull":102,"PsychicAbility_Enhanced":103,"PsychicAbility_Extreme":104,"MoveSpeed_Slow":105,"MoveSpeed_Quick":106,"MoveSpeed_VeryQuick":107,"Beauty_VeryUgly":108,"Beauty_Ugly":109,"Beauty_Pretty":110,"Beauty_Beautiful":111,"Learning_Slow":112,"Learning_Fast":113,"Mood_Depressive":114,"Mood_Pessimist":115,"Mood_Optimist":116,"Mood_Sanguine":117,"ToxResist_Partial":118,"ToxResist_Total":119,"Delicate":120,"Robust":121,"Pain_Reduced":122,"Pain_Extra":123,"Aggression_DeadCalm":124,"Aggression_Aggressive":125,"Aggression_HyperAggressive":126,"VerySleepy":127,"Sleepy":128,"LowSleep":129,"Neversleep":130,"MeleeDamage_Weak":131,"MeleeDamage_Strong":132,"UVSensitivity_Mild":133,"UVSensitivity_Intense":134,"Libido_Low":135,"Libido_High":136,"Hair_SnowWhite":137,"Hair_InkBlack":138,"Hair_Gray":139,"Hair_DarkBlack":140,"Hair_MidBlack":141,"Hair_DarkReddish":142,"Hair_DarkSaturatedReddish":143,"Hair_DarkBrown":144,"Hair_ReddishBrown":145,"Hair_SandyBlonde":146,"Hair_Blonde":147,"Hair_Pink":148,"Hair_LightPurple":149,"Hair_LightBlue":150,"Hair_LightTeal":151,"Hair_LightGreen":152,"Hair_LightOrange":153,"Hair_BrightRed":154,"Skin_Melanin1":155,"Skin_Melanin2":156,"Skin_Melanin3":157,"Skin_Melanin4":158,"Skin_Melanin5":159,"Skin_Melanin6":160,"Skin_Melanin7":161,"Skin_Melanin8":162,"Skin_Melanin9":163,"AptitudeTerrible_Shooting":164,"AptitudePoor_Shooting":165,"AptitudeStrong_Shooting":166,"AptitudeRemarkable_Shooting":167,"AptitudeTerrible_Melee":168,"AptitudePoor_Melee":169,"AptitudeStrong_Melee":170,"AptitudeRemarkable_Melee":171,"AptitudeTerrible_Construction":172,"AptitudePoor_Construction":173,"AptitudeStrong_Construction":174,"AptitudeRemarkable_Construction":175,"AptitudeTerrible_Mining":176,"AptitudePoor_Mining":177,"AptitudeStrong_Mining":178,"AptitudeRemarkable_Mining":179,"AptitudeTerrible_Cooking":180,"AptitudePoor_Cooking":181,"AptitudeStrong_Cooking":182,"AptitudeRemarkable_Cooking":183,"AptitudeTerrible_Plants":184,"AptitudePoor_Plants":185,"AptitudeStrong_Plants":186,"AptitudeRemarkable_Plants":187,"AptitudeTerrible_Animals":188,"AptitudePoor_Animals":189,"AptitudeStrong_Animals":190,"AptitudeRemarkable_Animals":191,"AptitudeTerrible_Crafting":192,"AptitudePoor_Crafting":193,"AptitudeStrong_Crafting":194,"AptitudeRemarkable_Crafting":195,"AptitudeTerrible_Artistic":196,"AptitudePoor_Artistic":197,"AptitudeStrong_Artistic":198,"AptitudeRemarkable_Artistic":199,"AptitudeTerrible_Medicine":200,"AptitudePoor_Medicine":201,"AptitudeStrong_Medicine":202,"AptitudeRemarkable_Medicine":203,"AptitudeTerrible_Intellectual":204,"AptitudePoor_Intellectual":205,"AptitudeStrong_Intellectual":206,"AptitudeRemarkable_Intellectual":207,"ChemicalDependency_Alcohol":208,"AddictionResistant_Alcohol":209,"AddictionImmune_Alcohol":210,"ChemicalDependency_Smokeleaf":211,"AddictionResistant_Smokeleaf":212,"AddictionImmune_Smokeleaf":213,"ChemicalDependency_Psychite":214,"AddictionResistant_Psychite":215,"AddictionImmune_Psychite":216,"ChemicalDependency_GoJuice":217,"AddictionResistant_GoJuice":218,"AddictionImmune_GoJuice":219,"ChemicalDependency_WakeUp":220,"AddictionResistant_WakeUp":221,"AddictionImmune_WakeUp":222},"byCategory":{"Ability":[0,1,3,8],"Hemogen":[2,4,5,7,84,85,91],"Archite":[6,88,89,90,92,93,94],"Cosmetic":[9,10,11,13,14,15,29,30,31,34,39,40,41,42,43,44,46,47,48,52,53,54,55,56,57],"Miscellaneous":[12,28,32,33,45,49,50,51,71,72,73,76,77,78,79,81,82,112,113],"Cosmetic_Skin":[16,17,18,19,20,21,22,23,24,25,26,27,155,156,157,158,159,160,161,162,163],"Cosmetic_Body":[35,36,37,38],"Healing":[58,59,60,61,62,63,68],"ResistanceAndWeakness":[64,65,75,86,87,118,119,133,134],"Reproduction":[66,67,135,136],"Violence":[69,70,74,124,125,126,131,132],"Psychic":[80,101,102,103,104],"Movement":[83,105,106,107],"Temperature":[95,96,97,98,99,100],"Beauty":[108,109,110,111],"Mood":[114,115,116,117],"Pain":[120,121,122,123],"Sleep":[127,128,129,130],"Cosmetic_Hair":[137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154],"Aptitudes":[164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207],"Drugs":[208,209,210,211,212,213,214,215,216,217,218,219,220,221,222]},"skinColor":[155,156,157,158,159,160,161,162,163],"hairColor":[137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154],"skinColorOverride":[16,17,18,19,20,21,22,23,24,25,26,27]};
+/** @type { Bitset[] } */
+var geneConflicts = [[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[268438528,0,0,0,0,0,0],[268438016,0,0,0,0,0,0],[268436992,0,0,0,0,0,0],[0,0,0,0,0,0,0],[268484608,0,0,0,0,0,0],[268476416,0,0,0,0,0,0],[268460032,0,0,0,0,0,0],[268304384,0,0,0,0,0,0],[268238848,0,0,0,0,0,0],[268107776,0,0,0,0,0,0],[267845632,0,0,0,0,0,0],[267321344,0,0,0,0,0,0],[266272768,0,0,0,0,0,0],[264175616,0,0,0,0,0,0],[259981312,0,0,0,0,0,0],[251592704,0,0,0,0,0,0],[234815488,0,0,0,0,0,0],[201261056,0,0,0,0,0,0],[134152192,0,0,0,0,0,0],[60928,0,0,0,0,0,0],[1073741824,0,0,0,0,0,0],[536870912,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,2,0,0,0,0,0],[0,1,0,0,0,0,0],[0,0,0,0,0,0,0],[0,112,0,0,0,0,0],[0,104,0,0,0,0,0],[0,88,0,0,0,0,0],[0,56,0,0,0,0,0],[0,3840,0,0,0,0,0],[0,3712,0,0,0,0,0],[0,3456,0,0,0,0,0],[0,2944,0,0,0,0,0],[0,1920,0,0,0,0,0],[0,8192,0,0,0,0,0],[0,4096,0,0,0,0,0],[0,98304,0,0,0,0,0],[0,81920,0,0,0,0,0],[0,49152,0,0,0,0,0],[0,786432,0,0,0,0,0],[0,655360,0,0,0,0,0],[0,393216,0,0,0,0,0],[0,6291456,0,0,0,0,0],[0,5242880,0,0,0,0,0],[0,3145728,0,0,0,0,0],[0,50331648,0,0,0,0,0],[0,41943040,0,0,0,0,0],[0,25165824,0,0,0,0,0],[0,402653184,0,0,0,0,0],[0,335544320,0,0,0,0,0],[0,201326592,0,0,0,0,0],[0,3221225472,16777216,0,0,0,0],[0,2684354560,16777216,0,0,0,0],[0,1610612736,16777216,0,0,0,0],[0,0,2,0,0,0,0],[0,0,1,0,0,0,0],[0,0,8,0,0,0,0],[0,0,4,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,1152,1610612736,24,0,0],[0,0,64,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,64,0,0,0,0],[0,0,4194304,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,32768,0,0,0,0],[0,0,16384,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,2048,0,0,0,0],[0,0,0,0,0,0,0],[0,3758096384,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,0,0,0,0],[0,0,0,3,0,0,0],[0,0,2147483648,2,0,0,0],[0,0,2147483648,1,0,0,0],[0,0,0,24,0,0,0],[0,0,0,20,0,0,0],[0,0,0,12,0,0,0],[0,0,0,448,0,0,0],[0,0,0,416,0,0,0],[0,0,0,352,0,0,0],[0,0,0,224,0,0,0],[0,0,0,3072,0,0,0],[0,0,0,2560,0,0,0],[0,0,0,1536,0,0,0],[0,0,0,57344,0,0,0],[0,0,0,53248,0,0,0],[0,0,0,45056,0,0,0],[0,0,0,28672,0,0,0],[0,0,0,131072,0,0,0],[0,0,0,65536,0,0,0],[0,0,0,3670016,0,0,0],[0,0,0,3407872,0,0,0],[0,0,0,2883584,0,0,0],[0,0,0,1835008,0,0,0],[0,0,0,8388608,0,0,0],[0,0,0,4194304,0,0,0],[0,0,0,33554432,0,0,0],[0,0,0,16777216,0,0,0],[0,0,0,134217728,0,0,0],[0,0,0,67108864,0,0,0],[0,0,0,1610612736,0,0,0],[0,0,64,1342177280,0,0,0],[0,0,64,805306368,0,0,0],[0,0,0,0,7,0,0],[0,0,0,2147483648,6,0,0],[0,0,0,2147483648,5,0,0],[0,0,0,2147483648,3,0,0],[0,0,64,0,16,0,0],[0,0,64,0,8,0,0],[0,0,0,0,64,0,0],[0,0,0,0,32,0,0],[0,0,0,0,256,0,0],[0,0,0,0,128,0,0],[0,0,0,0,134216704,0,0],[0,0,0,0,134216192,0,0],[0,0,0,0,134215168,0,0],[0,0,0,0,134213120,0,0],[0,0,0,0,134209024,0,0],[0,0,0,0,134200832,0,0],[0,0,0,0,134184448,0,0],[0,0,0,0,134151680,0,0],[0,0,0,0,134086144,0,0],[0,0,0,0,133955072,0,0],[0,0,0,0,133692928,0,0],[0,0,0,0,133168640,0,0],[0,0,0,0,132120064,0,0],[0,0,0,0,130022912,0,0],[0,0,0,0,125828608,0,0],[0,0,0,0,117440000,0,0],[0,0,0,0,100662784,0,0],[0,0,0,0,67108352,0,0],[0,0,0,0,4026531840,15,0],[0,0,0,0,3892314112,15,0],[0,0,0,0,3623878656,15,0],[0,0,0,0,3087007744,15,0],[0,0,0,0,2013265920,15,0],[0,0,0,0,4160749568,14,0],[0,0,0,0,4160749568,13,0],[0,0,0,0,4160749568,11,0],[0,0,0,0,4160749568,7,0],[0,0,0,0,0,224,0],[0,0,0,0,0,208,0],[0,0,0,0,0,176,0],[0,0,0,0,0,112,0],[0,0,0,0,0,3584,0],[0,0,0,0,0,3328,0],[0,0,0,0,0,2816,0],[0,0,0,0,0,1792,0],[0,0,0,0,0,57344,0],[0,0,0,0,0,53248,0],[0,0,0,0,0,45056,0],[0,0,0,0,0,28672,0],[0,0,0,0,0,917504,0],[0,0,0,0,0,851968,0],[0,0,0,0,0,720896,0],[0,0,0,0,0,458752,0],[0,0,0,0,0,14680064,0],[0,0,0,0,0,13631488,0],[0,0,0,0,0,11534336,0],[0,0,0,0,0,7340032,0],[0,0,0,0,0,234881024,0],[0,0,0,0,0,218103808,0],[0,0,0,0,0,184549376,0],[0,0,0,0,0,117440512,0],[0,0,0,0,0,3758096384,0],[0,0,0,0,0,3489660928,0],[0,0,0,0,0,2952790016,0],[0,0,0,0,0,1879048192,0],[0,0,0,0,0,0,14],[0,0,0,0,0,0,13],[0,0,0,0,0,0,11],[0,0,0,0,0,0,7],[0,0,0,0,0,0,224],[0,0,0,0,0,0,208],[0,0,0,0,0,0,176],[0,0,0,0,0,0,112],[0,0,0,0,0,0,3584],[0,0,0,0,0,0,3328],[0,0,0,0,0,0,2816],[0,0,0,0,0,0,1792],[0,0,0,0,0,0,57344],[0,0,0,0,0,0,53248],[0,0,0,0,0,0,45056],[0,0,0,0,0,0,28672],[0,0,0,0,0,0,393216],[0,0,0,0,0,0,327680],[0,0,0,0,0,0,196608],[0,0,0,0,0,0,3145728],[0,0,0,0,0,0,2621440],[0,0,0,0,0,0,1572864],[0,0,0,0,0,0,25165824],[0,0,0,0,0,0,20971520],[0,0,0,0,0,0,12582912],[0,0,0,0,0,0,201326592],[0,0,0,0,0,0,167772160],[0,0,0,0,0,0,100663296],[0,0,0,0,0,0,1610612736],[0,0,0,0,0,0,1342177280],[0,0,0,0,0,0,805306368]];
\ No newline at end of file
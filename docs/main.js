@@ -99,6 +99,21 @@ function anyMatch(a, b) {
     return a.some((value) => b.includes(value));
 }
 
+/**
+ * Calls callback with the position of each bit set in row
+ * @param {Bitset} row 
+ * @param {(position: number) => void} callback 
+ */
+function forEachBit(row, callback) {
+    for (let w = 0; w < row.length; w++) {
+        let word = row[w];
+        while (word !== 0) {
+            callback(w * 32 + 31 - Math.clz32(word & -word));
+            word &= word - 1;
+        }
+    }
+}
+
 class Genotype {
     xenotype = "Baseliner";
     /** @type {string[]} */
@@ -124,12 +139,12 @@ class Genotype {
     stats() {
         let out = { complexity: 0, metabolism: 0 };
         for (const geneName of this.endogenes) {
-            let gene = genes.find((value) => value.name == geneName);
+            let gene = genes[geneIndex.byName[geneName]];
             out.complexity += gene.complexity || 0;
             out.metabolism += gene.metabolism || 0;
         }
         for (const geneName of this.xenogenes) {
-            let gene = genes.find((value) => value.name == geneName);
+            let gene = genes[geneIndex.byName[geneName]];
             out.complexity += gene.complexity || 0;
             out.metabolism += gene.metabolism || 0;
         }
@@ -209,11 +224,11 @@ class Pawn {
     constructor(doInit = true) {
         if (!doInit)
             return;
-        let skinColorGene = pickRandom(genes.filter((gene) => "skinColor" in gene && "melanin" in gene));
+        let skinColorGene = pickRandom(geneIndex.skinColor.map((i) => genes[i]).filter((gene) => "melanin" in gene));
         this.skinColor = RGBA.fromJSON(skinColorGene.skinColor);
         this.melanin = skinColorGene.melanin;
 
-        let allHairColorGenes = genes.filter((gene) => "hairColor" in gene);
+        let allHairColorGenes = geneIndex.hairColor.map((i) => genes[i]);
         let hairColorGene = pickRandomWeighted(allHairColorGenes, allHairColorGenes.map((gene) => gene.selectionWeight || 1));
         this.hairColor = RGBA.fromJSON(hairColorGene.hairColor);
 
@@ -277,22 +292,11 @@ function buildBackstorySelect(select, backstoryList) {
  * @param {Trait[]} traitList 
  */
 function buildTraitsDialog(traitList) {
-    /**
-     * @param {Trait} a 
-     * @param {HTMLInputElement} b 
-     * @returns {boolean}
-     */
-    function hasConflict(a, b) {
-        let b_exclusionTags = parseCommaList(b.getAttribute("exclusionTags"));
-        let b_conflictingTraits = parseCommaList(b.getAttribute("conflictingTraits"));
-        let b_name = b.value.substring(0, b.value.lastIndexOf(":"));
-        return anyMatch(a.exclusionTags, b_exclusionTags) ||
-            anyMatch(a.conflictingTraits, b_conflictingTraits) ||
-            b_conflictingTraits.includes(a.name) ||
-            a.conflictingTraits.includes(b_name) ||
-            a.name == b_name;
-    }
     let scrollBox = document.getElementById("traitsScrollBox");
+    /** @type {Map<string, number>} */
+    let conflictRows = new Map(traitConflicts.keys.map((key, i) => [key, i]));
+    /** @type {HTMLInputElement[]} Checkboxes by conflict row */
+    let checkboxes = [];
     /** @type {Function[]} */
     let postBuildCallbacks = [];
     for (const trait of traitList) {
@@ -310,33 +314,31 @@ function buildTraitsDialog(traitList) {
             label.textContent = degree.label;
             label.htmlFor = check.id;
 
-            check.setAttribute("exclusionTags", trait.exclusionTags.join(","));
-            check.setAttribute("conflictingTraits", trait.conflictingTraits.join(","));
             check.setAttribute("conflicts", "0");
+            const row = conflictRows.get(check.value);
+            checkboxes[row] = check;
 
             /** Local function; sets all other applicable trait degrees as conflicted */
             function setConflicts() {
-                scrollBox.querySelectorAll("input").forEach((other) => {
-                    if (other.id === check.id)
+                forEachBit(traitConflicts.rows[row], (i) => {
+                    let other = checkboxes[i];
+                    if (other === undefined)
                         return;
-                    if (hasConflict(trait, other)) {
-                        other.disabled = true;
-                        let prevConflicts = other.getAttribute("conflicts");
-                        other.setAttribute("conflicts", addStrInt(prevConflicts, 1));
-                    }
+                    other.disabled = true;
+                    let prevConflicts = other.getAttribute("conflicts");
+                    other.setAttribute("conflicts", addStrInt(prevConflicts, 1));
                 });
             }
             /** Local function; unsets all other applicable trait degrees conflicts */
             function unsetConflicts() {
-                scrollBox.querySelectorAll("input").forEach((other) => {
-                    if (other.id === check.id)
+                forEachBit(traitConflicts.rows[row], (i) => {
+                    let other = checkboxes[i];
+                    if (other === undefined)
                         return;
-                    if (hasConflict(trait, other)) {
-                        let newConflictCount = addStrInt(other.getAttribute("conflicts"), -1);
-                        other.setAttribute("conflicts", newConflictCount);
-                        if (newConflictCount === "0")
-                            other.disabled = false;
-                    }
+                    let newConflictCount = addStrInt(other.getAttribute("conflicts"), -1);
+                    other.setAttribute("conflicts", newConflictCount);
+                    if (newConflictCount === "0")
+                        other.disabled = false;
                 });
             }
             // Change event
@@ -390,7 +392,6 @@ function buildGeneCheckbox(gene, id) {
     out.value = gene.name;
     out.type = "checkbox";
     out.setAttribute("conflicts", "0");
-    out.setAttribute("exclusionTags", (gene.exclusionTags || []).join(","));
     return out;
 }
 
@@ -422,16 +423,8 @@ function buildGenesList(geneList) {
         }
     });
 
-    /**
-     * @param {Gene} a 
-     * @param {HTMLInputElement} b 
-     * @returns {boolean}
-     */
-    function hasConflict(a, b) {
-        let b_exclusionTags = parseCommaList(b.getAttribute("exclusionTags") || "");
-        return anyMatch(a.exclusionTags || [], b_exclusionTags);
-    }
-
+    /** @type {HTMLInputElement[]} Checkboxes by position in genes, which is also their conflict row */
+    let checkboxes = [];
     /** @type {Function[]} */
     let postBuildCallbacks = [];
     categories.forEach((catEntries, catName) => {
@@ -464,16 +457,17 @@ function buildGenesList(geneList) {
             geneElement.title = desc;
             // v Build gene checkbox v
             let geneCheckbox = buildGeneCheckbox(gene, geneElement.htmlFor);
+            const row = geneIndex.byName[gene.name];
+            checkboxes[row] = geneCheckbox;
 
             categoryGenesDiv.append(geneElement, geneCheckbox);
 
             /** Local to a specific gene; disables all conflicting genes from being selected */
             function setConflicts() {
-                for (const other of geneListDiv.querySelectorAll("input")) {
-                    if (other.id === geneCheckbox.id)
-                        continue;
-                    if (!hasConflict(gene, other))
-                        continue;
+                forEachBit(geneConflicts[row], (i) => {
+                    let other = checkboxes[i];
+                    if (other === undefined)
+                        return;
 
                     let prevConflicts = other.getAttribute("conflicts");
                     other.setAttribute("conflicts", addStrInt(prevConflicts, 1));
@@ -483,15 +477,14 @@ function buildGenesList(geneList) {
                         let otherLabel = geneListDiv.querySelector(`label[for="${other.id}"]`)
                         otherLabel.style = "border-color:red;";
                     }
-                }
+                });
             }
             /** Local to a specific gene; removes this conflict all conflicting genes */
             function unsetConflicts() {
-                for (const other of geneListDiv.querySelectorAll("input")) {
-                    if (other.id === geneCheckbox.id)
-                        continue;
-                    if (!hasConflict(gene, other))
-                        continue;
+                forEachBit(geneConflicts[row], (i) => {
+                    let other = checkboxes[i];
+                    if (other === undefined)
+                        return;
 
                     let newConflictCount = addStrInt(other.getAttribute("conflicts"), -1);
                     other.setAttribute("conflicts", newConflictCount);
@@ -501,7 +494,7 @@ function buildGenesList(geneList) {
                         let otherLabel = geneListDiv.querySelector(`label[for="${other.id}"]`)
                         otherLabel.style = undefined;
                     }
-                }
+                });
             }
             /** Local to a specific gene; Adds a label for the gene to the selectedGenesDiv */
             function addSelected() {
@@ -527,7 +520,7 @@ function buildGenesList(geneList) {
                     geneElement.style = "background-color: #242526;";
                     if ("skinColor" in gene) {
                         // Don't change skin color if there's already an override
-                        let hasOverride = pawn.genotype.xenogenes.some((value) => "skinColorOverride" in genes.find((g) => g.name == value));
+                        let hasOverride = pawn.genotype.xenogenes.some((value) => "skinColorOverride" in genes[geneIndex.byName[value]]);
                         if (!hasOverride) {
                             pawn.skinColor = RGBA.fromJSON(gene.skinColor);
                             skinColorPicker.value = pawn.skinColor.asHex();
@@ -564,7 +557,7 @@ function buildGenesList(geneList) {
                     if ("skinColorOverride" in gene) {
                         hairColorPicker.disabled = false;
                         // If we have a base skin color, set it back to that when disabling override
-                        let base = genes.find((value) => "skinColor" in value && pawn.genotype.endogenes.includes(value.name));
+                        let base = geneIndex.skinColor.map((i) => genes[i]).find((value) => pawn.genotype.endogenes.includes(value.name));
                         if (base !== undefined) {
                             pawn.skinColor = RGBA.fromJSON(base.skinColor);
                             skinColorPicker.value = pawn.skinColor.asHex();
@@ -826,6 +819,8 @@ addEventListener("DOMContentLoaded", async (event) => {
         return;
     }
     ruleset = new Ruleset((await r.json()).rules);
+    // Labels and descriptions aren't in the data files, only in the string table of each language
+    await loadStrings(params.get("lang") || "English");
 
     // if stored, load
     token = window.localStorage.getItem(`${gameID}:TOKEN`);
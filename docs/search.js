@@ -0,0 +1,151 @@
+// Searches backstories, traits and genes with the inverted indexes scripts/search.py writes (search/{language}/{name}.json),
+// looking up only the terms and filters a query names instead of scanning the records, e.g.
+//   await searchRecords("backstories", "adulthoods", "soldier +shooting not disables:violent") -> adulthood positions, best first
+// A query is words, matched as prefixes of the records' words and ranked by where they're found (titles over descriptions),
+// and filters: +skill and -skill for skill gains and losses, disables:work and requires:work for work tags.
+// Every word and filter must match, except those after "not" (or starting with "!"), which must not; "and" is ignored
+
+/** @type {Object.<string, Promise<Object.<string, SearchIndex>>>} */
+const searchIndexes = {};
+
+/**
+ * An output's indexes (dataset -> index) in language, falling back to English; fetched once
+ * @param {string} name
+ * @param {string} [language]
+ */
+function loadSearchIndex(name, language = "English") {
+    const key = `${language}/${name}`;
+    if (!(key in searchIndexes)) {
+        searchIndexes[key] = (async () => {
+            let r = await fetch(`./search/${encodeURIComponent(language)}/${name}.json`);
+            if (!r.ok && language != "English")
+                r = await fetch(`./search/English/${name}.json`);
+            if (!r.ok)
+                throw new Error(`Couldn't load the ${name} search index`);
+            return r.json();
+        })();
+    }
+    return searchIndexes[key];
+}
+
+/**
+ * Splits a query the way scripts/search.py splits the records' strings
+ * @param {string} query
+ * @returns {{words: {word: string, not: boolean}[], filters: {filter: string, not: boolean}[]}}
+ */
+function parseQuery(query) {
+    const words = [], filters = [];
+    let negate = false;
+    for (let part of query.toLowerCase().split(/\s+/)) {
+        if (part == "" || part == "and")
+            continue;
+        if (part == "not") {
+            negate = true;
+            continue;
+        }
+        const not = negate || part.startsWith("!");
+        negate = false;
+        if (part.startsWith("!"))
+            part = part.slice(1);
+        if (/^[+-]\p{L}/u.test(part) || part.includes(":"))
+            filters.push({ filter: part, not: not });
+        else
+            for (const word of part.match(/[\p{L}\p{N}]+/gu) || [])
+                words.push({ word: word, not: not });
+    }
+    return { words: words, filters: filters };
+}
+
+/**
+ * Positions of the first term starting with prefix and of the first one after them
+ * @param {string[]} terms sorted
+ * @param {string} prefix
+ * @returns {[number, number]}
+ */
+function termRange(terms, prefix) {
+    let lo = 0, hi = terms.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (terms[mid] < prefix) lo = mid + 1; else hi = mid;
+    }
+    let end = lo;
+    while (end < terms.length && terms[end].startsWith(prefix))
+        end++;
+    return [lo, end];
+}
+
+/**
+ * The records with a word starting with prefix, and their best weight for it; a whole-word match counts double
+ * @param {SearchIndex} index
+ * @param {string} prefix
+ * @returns {Map<number, number>}
+ */
+function prefixMatches(index, prefix) {
+    const [start, end] = termRange(index.terms, prefix);
+    /** @type {Map<number, number>} */
+    const matches = new Map();
+    for (let t = start; t < end; t++) {
+        const postings = index.postings[t], boost = index.terms[t] == prefix ? 2 : 1;
+        for (let p = 0; p < postings.length; p += 2) {
+            const weight = postings[p + 1] * boost;
+            if (!(matches.get(postings[p]) >= weight))
+                matches.set(postings[p], weight);
+        }
+    }
+    return matches;
+}
+
+/**
+ * The ids of the records matching query, best first (then by id)
+ * @param {SearchIndex} index
+ * @param {string} query
+ * @param {number} [limit]
+ * @returns {number[]}
+ */
+function queryIndex(index, query, limit = Infinity) {
+    const { words, filters } = parseQuery(query);
+    /** @type {Map<number, number> | null} id -> score, of the records matching everything so far */
+    let found = null;
+    const keep = (/** @type {Map<number, number>} */ matches) => {
+        if (found === null) {
+            found = matches;
+            return;
+        }
+        for (const [id, score] of found) {
+            if (matches.has(id))
+                found.set(id, score + matches.get(id));
+            else
+                found.delete(id);
+        }
+    };
+    // Shortest filter lists first, so the sets stay small
+    const include = filters.filter((f) => !f.not).map((f) => index.filters[f.filter] || []).sort((a, b) => a.length - b.length);
+    for (const ids of include)
+        keep(new Map(ids.map((id) => [id, 0])));
+    for (const w of words.filter((w) => !w.not))
+        keep(prefixMatches(index, w.word));
+    if (found === null)
+        found = new Map(Array.from({ length: index.size }, (_, id) => [id, 0]));
+    for (const f of filters.filter((f) => f.not))
+        for (const id of index.filters[f.filter] || [])
+            found.delete(id);
+    for (const w of words.filter((w) => w.not))
+        for (const id of prefixMatches(index, w.word).keys())
+            found.delete(id);
+    return Array.from(found).sort((a, b) => b[1] - a[1] || a[0] - b[0]).slice(0, limit).map(([id]) => id);
+}
+
+/**
+ * Searches one dataset of an output, e.g. searchRecords("genes", "genes", "+shooting")
+ * @param {string} name
+ * @param {string} dataset
+ * @param {string} query
+ * @param {{language?: string, limit?: number}} [options]
+ * @returns {Promise<number[]>} positions in the dataset's array, best first
+ */
+async function searchRecords(name, dataset, query, options = {}) {
+    const indexes = await loadSearchIndex(name, options.language);
+    if (!(dataset in indexes))
+        throw new Error(`${name} has no ${dataset} search index`);
+    return queryIndex(indexes[dataset], query, options.limit);
+}
@@ -0,0 +1,70 @@
+// Fills in the labels, descriptions and titles that scripts/strings.py splits out of the data files,
+// downloading only the string tables (strings/{language}/{name}.json) of the language being shown
+
+/**
+ * Each string table's datasets, with the records they fill in and where each name is in them.
+ * Data files that aren't on the page are skipped
+ * @type {Object.<string, Object.<string, () => [Object[], NameIndex] | null>>}
+ */
+const stringTables = {
+    backstories: {
+        adulthoods: () => typeof adulthoods === "undefined" ? null : [adulthoods, adulthoodIndex],
+        childhoods: () => typeof childhoods === "undefined" ? null : [childhoods, childhoodIndex]
+    },
+    genes: {
+        genes: () => typeof genes === "undefined" ? null : [genes, geneIndex.byName]
+    },
+    traits: {
+        traits: () => typeof traits === "undefined" ? null : [traits, traitIndex]
+    },
+    bodyparts: {
+        hairTypes: () => typeof hairTypes === "undefined" ? null : [hairTypes, hairTypeIndex],
+        beardTypes: () => typeof beardTypes === "undefined" ? null : [beardTypes, beardTypeIndex]
+    }
+};
+
+/** Copies strings into target, going into nested objects (e.g. a trait's degrees) */
+function mergeStrings(target, strings) {
+    for (const [key, value] of Object.entries(strings)) {
+        if (value !== null && typeof value == "object" && typeof target[key] == "object")
+            mergeStrings(target[key], value);
+        else
+            target[key] = value;
+    }
+}
+
+/**
+ * @param {string} name
+ * @param {string} language
+ * @returns {Promise<Object.<string, Object.<string, Object>>>} dataset -> defName -> strings
+ */
+async function fetchStringTable(name, language) {
+    let r = await fetch(`./strings/${encodeURIComponent(language)}/${name}.json`);
+    if (!r.ok && language != "English")
+        r = await fetch(`./strings/English/${name}.json`);
+    if (!r.ok)
+        throw new Error(`Couldn't load the ${name} strings`);
+    return r.json();
+}
+
+/**
+ * Downloads the strings of every data file on the page in language (falling back to English) and fills them in
+ * @param {string} [language]
+ */
+async function loadStrings(language = "English") {
+    const loads = [];
+    for (const [name, datasets] of Object.entries(stringTables)) {
+        const found = Object.entries(datasets).map(([dataset, get]) => [dataset, get()]).filter(([, data]) => data !== null);
+        if (found.length == 0)
+            continue;
+        loads.push(fetchStringTable(name, language).then((table) => {
+            for (const [dataset, [records, index]] of found) {
+                for (const [defName, strings] of Object.entries(table[dataset] || {})) {
+                    if (defName in index)
+                        mergeStrings(records[index[defName]], strings);
+                }
+            }
+        }));
+    }
+    await Promise.all(loads);
+}
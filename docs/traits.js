@@ -1,2 +1,6 @@
 /** @type { Trait[] } */
-var traits = [{"name":"Delicate","commonality":1.0,"conflictingTraits":["Toughness"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"delicate","desc":"This pawn has fragile skin and bones. This pawn takes more damage than other people from the same blows.","degree":0,"statFactors":{"IncomingDamageFactor":1.15}}}},{"name":"Recluse","commonality":0.5,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"recluse","desc":"The fewer people in This pawn's faction, the happier This pawn is. Being alone is best of all.","degree":0}}},{"name":"Nudist","commonality":0.7,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"nudist","desc":"This pawn enjoys the feeling of freedom that comes from being nude. This pawn can handle clothing, but will be happier without it.","degree":0}}},{"name":"Bloodlust","commonality":0.8,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":["Violent"],"degrees":{"0":{"label":"bloodlust","desc":"This pawn gets a rush from hurting people, and never minds the sight of blood or death. This pawn is four times as likely to start a social fight as others.","degree":0,"meditationTypes":["Morbid"]}}},{"name":"Kind","commonality":2.0,"conflictingTraits":["Abrasive","Psychopath"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"kind","desc":"This pawn is an exceptionally agreeable and giving person. This pawn rarely insults others or starts fights, and will sometimes offer kind words to brighten the moods of those around them. This pawn also never judges people by their appearance.","degree":0,"statFactors":{"CertaintyLossFactor":2.0}}}},{"name":"Psychopath","commonality":1.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"psychopath","desc":"This pawn has no empathy. The suffering of others doesn't bother them at all. This pawn doesn't mind if others are butchered, left unburied, imprisoned, or sold to slavery - unless it affects them. This pawn also feels no mood boost from socializing.","degree":0,"statFactors":{"CertaintyLossFactor":0.5},"meditationTypes":["Morbid"]}}},{"name":"Cannibal","commonality":0.6,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"cannibal","desc":"This pawn was taught that eating human meat is wrong and horrible. But one time, long ago, This pawn tried it... and This pawn liked it.","degree":0,"meditationTypes":["Morbid"]}}},{"name":"Abrasive","commonality":1.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":["Social"],"degrees":{"0":{"label":"abrasive","desc":"This pawn always says exactly what's on their mind, especially if it's bugging them. That tends to rub people the wrong way.","degree":0,"statFactors":{"CertaintyLossFactor":0.5}}}},{"name":"TooSmart","commonality":1.0,"conflictingTraits":["Nerves","SlowLearner"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":["Intellectual"],"degrees":{"0":{"label":"too smart","desc":"This pawn is too smart for their own good. This pawn learns everything much faster than everyone, but can be quite eccentric.","degree":0,"statOffsets":{"GlobalLearningFactor":0.75,"MentalBreakThreshold":0.12},"statFactors":{"CertaintyLossFactor":0.5}}}},{"name":"Brawler","commonality":1.0,"conflictingTraits":["ShootingAccuracy","Wimp"],"exclusionTags":[],"forcedFlames":["Shooting"],"conflictingFlames":[],"disabledWork":[],"requiredWork":["Violent"],"degrees":{"0":{"label":"brawler","desc":"This pawn likes to fight up close and personal. their accuracy is greatly increased in melee combat, but This pawn'll be very unhappy if asked to carry a ranged weapon.","degree":0,"skills":{"Melee":4,"Shooting":-4},"statOffsets":{"MeleeHitChance":4.0}}}},{"name":"Masochist","commonality":0.5,"conflictingTraits":["Wimp"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"masochist","desc":"For This pawn, there's something exciting about getting hurt. This pawn doesn't know why, This pawn's just wired differently.","degree":0,"meditationTypes":["Morbid"]}}},{"name":"NightOwl","commonality":1.3,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"night owl","desc":"This pawn likes to be up during the night, and sleep during the day.\nThis pawn gets a mood bonus if awake at night (23h-6h) and mood loss if awake during the day (11h-18h).\nThis pawn doesn't get a mood penalty for being in the dark.","degree":0}}},{"name":"Greedy","commonality":1.0,"conflictingTraits":["Ascetic","Jealous"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"greedy","desc":"This pawn needs a really impressive bedroom. This pawn gets a mood loss if This pawn doesn't get what This pawn wants.","degree":0}}},{"name":"Jealous","commonality":1.0,"conflictingTraits":["Ascetic","Greedy"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"jealous","desc":"For This pawn, it's degrading to have a less impressive bedroom than someone else. This pawn gets a mood loss if any colonist has a more impressive bedroom.","degree":0,"meditationTypes":["Morbid"]}}},{"name":"Ascetic","commonality":0.7,"conflictingTraits":["Greedy","Jealous","Gourmand"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"ascetic","desc":"This pawn has forsaken physical comforts and enjoyments in favor of a simple, pure lifestyle. This pawn will become unhappy if This pawn has a bedroom that's too impressive. This pawn also dislikes fancy food and prefers to eat raw. This pawn never judges others by their appearance.","degree":0,"statFactors":{"CertaintyLossFactor":0.5},"meditationTypes":["Minimal"]}}},{"name":"Gay","commonality":0.3,"conflictingTraits":["SexualOrientation"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"gay","desc":"This pawn is romantically attracted to people of their own gender.","degree":0}}},{"name":"Bisexual","commonality":0.2,"conflictingTraits":["SexualOrientation"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"bisexual","desc":"This pawn is romantically attracted to both men and women.","degree":0}}},{"name":"Asexual","commonality":0.2,"conflictingTraits":["SexualOrientation"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"asexual","desc":"This pawn has no sexual attraction to anyone at all.","degree":0}}},{"name":"AnnoyingVoice","commonality":0.5,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"annoying voice","desc":"This pawn's voice has a particularly grating, nasal quality to it, and This pawn tends to talk in barked, garbled phrases. This predisposes others to dislike them.","degree":0}}},{"name":"CreepyBreathing","commonality":0.5,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"creepy breathing","desc":"This pawn breathes heavily all the time, and sweats constantly. People find it creepy.","degree":0}}},{"name":"Pyromaniac","commonality":0.8,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":["Firefighting"],"requiredWork":[],"degrees":{"0":{"label":"pyromaniac","desc":"This pawn loves fire. This pawn will never extinguish fires, and will occasionally go on random fire starting sprees. This pawn will be happy around flames, and happier when wielding an incendiary weapon.","degree":0,"meditationTypes":["Flame"]}}},{"name":"Wimp","commonality":1.0,"conflictingTraits":["Brawler","Masochist"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"wimp","desc":"This pawn is weak and cowardly. Even a little pain will immobilize them.","degree":0,"statOffsets":{"PainShockThreshold":-0.5},"statFactors":{"CertaintyLossFactor":2.0}}}},{"name":"Nimble","commonality":1.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"nimble","desc":"This pawn has remarkable kinesthetic intelligence. This pawn seems to dance around danger with preternatural grace.","degree":0,"statOffsets":{"MeleeDodgeChance":15.0},"statFactors":{"PawnTrapSpringChance":0.1}}}},{"name":"FastLearner","commonality":1.0,"conflictingTraits":["SlowFastLearner"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"fast learner","desc":"This pawn has a knack for learning. This pawn picks things up much faster than others.","degree":0,"statOffsets":{"GlobalLearningFactor":0.75}}}},{"name":"SlowLearner","commonality":1.0,"conflictingTraits":["TooSmart","SlowFastLearner"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"slow learner","desc":"This pawn is slow on the uptake. This pawn learns much slower than others.","degree":0,"statOffsets":{"GlobalLearningFactor":-0.75},"statFactors":{"CertaintyLossFactor":0.5}}}},{"name":"Undergrounder","commonality":0.2,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"undergrounder","desc":"This pawn has no need to experience the outdoors or light. This pawn will never feel cooped up or get cabin fever, no matter how long This pawn stays inside, and is not bothered by darkness.","degree":0,"meditationTypes":["Morbid"]}}},{"name":"Transhumanist","commonality":0.9,"conflictingTraits":["BodyPurist"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"body modder","desc":"This pawn feels limited in their feeble human body. This pawn often dreams of being enhanced with artificial body parts or xenogenetics.","degree":0}}},{"name":"BodyPurist","commonality":0.7,"conflictingTraits":["Transhumanist"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"body purist","desc":"This pawn believes the human body is limited for a reason. To them, artificial body parts and xenogenes are unethical and disgusting.","degree":0}}},{"name":"DislikesMen","commonality":0.3,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"misandrist","desc":"This pawn really dislikes and distrusts men.","degree":0}}},{"name":"DislikesWomen","commonality":1.7,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"misogynist","desc":"This pawn really dislikes and distrusts women.","degree":0}}},{"name":"GreatMemory","commonality":1.1,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"great memory","desc":"This pawn has a fantastic memory for detail. This pawn will lose unused skills at half the rate of other people.","degree":0}}},{"name":"Tough","commonality":1.1,"conflictingTraits":["Toughness"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"tough","desc":"This pawn has thick skin, dense flesh, and durable bones. This pawn takes much less damage than other people from the same blows. This pawn is extremely hard to kill.","degree":0,"statFactors":{"IncomingDamageFactor":0.5}}}},{"name":"TorturedArtist","commonality":0.6,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":["Artistic"],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"tortured artist","desc":"This pawn feels alienated and misunderstood by other human beings. This pawn will have a constant mood debuff, but gain a chance (50%) to get a creativity inspiration after a mental break.","degree":0,"meditationTypes":["Morbid"]}}},{"name":"Gourmand","commonality":1.0,"conflictingTraits":["Ascetic"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"gourmand","desc":"This pawn's life revolves around food. This pawn gets hungry quickly, and will occasionally be overcome with the urge to eat ravenously, even when not hungry.","degree":0,"skills":{"Cooking":4},"hungerRateFactor":1.5}}},{"name":"QuickSleeper","commonality":1.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"label":"quick sleeper","desc":"This pawn doesn't need as much sleep as the average person. Whether This pawn's sleeping on a bed or on the ground, This pawn will be fully rested in about two thirds the usual time.","degree":0,"statOffsets":{"RestRateMultiplier":0.5}}}},{"name":"SpeedOffset","commonality":2.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"-1":{"label":"slowpoke","desc":"This pawn is always falling behind the group whenever This pawn goes anywhere.","degree":-1,"statOffsets":{"MoveSpeed":-0.2}},"1":{"label":"fast walker","desc":"This pawn likes to be where This pawn's going. This pawn walks quicker than most people.","degree":1,"statOffsets":{"MoveSpeed":0.2}},"2":{"label":"jogger","desc":"This pawn always moves with a sense of urgency - so much so that others often fail to keep up.","degree":2,"statOffsets":{"MoveSpeed":0.4}}}},{"name":"DrugDesire","commonality":3.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"2":{"label":"chemical fascination","desc":"This pawn is utterly fascinated with chemical sources of enjoyment. Consuming recreational drugs will create a good mood, while abstaining will lead to increasing frustration over time and possibly drug binges. This pawn will ignore directives to not use recreational drugs, and will consume more than a normal person.","degree":2},"1":{"label":"chemical interest","desc":"This pawn has an unusual interest in chemical sources of enjoyment. Consuming recreational drugs will create a good mood, while abstaining will lead to increasing frustration over time and possible drug binges. This pawn will ignore directives to not use recreational drugs, and will consume more than a normal person.","degree":1},"-1":{"label":"teetotaler","desc":"This pawn abhors the idea of gaining pleasure from chemicals. This pawn strictly avoids alcohol and recreational drugs.","degree":-1}}},{"name":"NaturalMood","commonality":2.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"2":{"label":"sanguine","desc":"This pawn is just naturally upbeat about their situation, pretty much all the time, no matter what it is.","degree":2},"1":{"label":"optimist","desc":"This pawn is naturally optimistic about life. It's hard to get them down.","degree":1},"-1":{"label":"pessimist","desc":"This pawn tends to look on the bad side of life.","degree":-1},"-2":{"label":"depressive","desc":"This pawn is perenially unhappy. This pawn has trouble sustaining a good mood even when everything is fine.","degree":-2}}},{"name":"Nerves","commonality":2.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"2":{"label":"iron-willed","desc":"This pawn's will is an iron shield. This pawn keeps going through thick and thin, when others broke down long before.","degree":2,"statOffsets":{"MentalBreakThreshold":-0.18},"statFactors":{"CertaintyLossFactor":0.25}},"1":{"label":"steadfast","desc":"This pawn is mentally tough and won't break down under stresses that would crack most people.","degree":1,"statOffsets":{"MentalBreakThreshold":-0.09},"statFactors":{"CertaintyLossFactor":0.5}},"-1":{"label":"nervous","desc":"This pawn tends to crack under pressure.","degree":-1,"statOffsets":{"MentalBreakThreshold":0.08},"statFactors":{"CertaintyLossFactor":2.0}},"-2":{"label":"volatile","desc":"This pawn is on a hair-trigger all the time. This pawn is the first to break in any tough situation.","degree":-2,"statOffsets":{"MentalBreakThreshold":0.15},"statFactors":{"CertaintyLossFactor":3.0}}}},{"name":"Neurotic","commonality":1.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"1":{"label":"neurotic","desc":"This pawn likes to have things squared away. This pawn will work harder than most to attain this state of affairs, but their nerves can get the better of them.","degree":1,"statOffsets":{"WorkSpeedGlobal":0.2,"MentalBreakThreshold":0.08}},"2":{"label":"very neurotic","desc":"This pawn feels constantly nervous about everything that has to get done. This pawn will work extremely hard to attain this state of affairs, but their nerves can easily get the better of them.","degree":2,"statOffsets":{"WorkSpeedGlobal":0.4,"MentalBreakThreshold":0.14}}}},{"name":"Industriousness","commonality":2.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"2":{"label":"industrious","desc":"This pawn has an easy time staying on-task and focused, and gets things done much faster than the average person.","degree":2,"statOffsets":{"WorkSpeedGlobal":0.35}},"1":{"label":"hard worker","desc":"This pawn is a natural hard worker and will finish tasks faster than most.","degree":1,"statOffsets":{"WorkSpeedGlobal":0.2}},"-1":{"label":"lazy","desc":"This pawn is a little bit lazy.","degree":-1,"statOffsets":{"WorkSpeedGlobal":-0.2}},"-2":{"label":"slothful","desc":"This pawn loves idleness and hates anything productive. This pawn moves slowly and rarely stays focused on a task.","degree":-2,"statOffsets":{"WorkSpeedGlobal":-0.35}}}},{"name":"PsychicSensitivity","commonality":2.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"2":{"label":"psychically hypersensitive","desc":"This pawn's mind is like a psychic tuning fork. This pawn is extremely sensitive to psychic phenomena.","degree":2,"statOffsets":{"PsychicSensitivity":0.8}},"1":{"label":"psychically sensitive","desc":"This pawn's mind is unusually sensitive to psychic phenomena.","degree":1,"statOffsets":{"PsychicSensitivity":0.4}},"-1":{"label":"psychically dull","desc":"This pawn's mind is psychically out of tune with others. This pawn isn't as affected by psychic phenomena.","degree":-1,"statOffsets":{"PsychicSensitivity":-0.5}},"-2":{"label":"psychically deaf","desc":"This pawn's mind works on a psychic frequency different from everyone else. This pawn just isn't affected by psychic phenomena.","degree":-2,"statOffsets":{"PsychicSensitivity":-1.0}}}},{"name":"ShootingAccuracy","commonality":2.0,"conflictingTraits":["Brawler"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":["Violent"],"degrees":{"1":{"label":"careful shooter","desc":"This pawn takes more time to aim when shooting. This pawn shoots less often than others, but with more accuracy.","degree":1,"statOffsets":{"AimingDelayFactor":0.25,"ShootingAccuracyPawn":5.0}},"-1":{"label":"trigger-happy","desc":"Pew! Pew! Pew! This pawn just likes pulling the trigger. This pawn shoots faster than others, but less accurately.","degree":-1,"statOffsets":{"AimingDelayFactor":-0.5,"ShootingAccuracyPawn":-5.0}}}},{"name":"Beauty","commonality":2.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"2":{"label":"beautiful","desc":"This pawn is exceptionally beautiful, with an exotic-yet-familiar facial structure and an arresting gaze. People are attracted to them before This pawn even opens their mouth.","degree":2,"statOffsets":{"PawnBeauty":2.0}},"1":{"label":"pretty","desc":"This pawn has a pretty face, which predisposes people to like them.","degree":1,"statOffsets":{"PawnBeauty":1.0}},"-1":{"label":"ugly","desc":"This pawn is somewhat ugly. This subtly repels others during social interactions.","degree":-1,"statOffsets":{"PawnBeauty":-1.0}},"-2":{"label":"staggeringly ugly","desc":"This pawn is staggeringly ugly. their face looks like a cross between a drawing by an untalented child, a malformed fetus in a jar of formaldehyde, and a piece of modern art. Others must exert conscious effort to look at them while conversing.","degree":-2,"statOffsets":{"PawnBeauty":-2.0}}}},{"name":"Immunity","commonality":1.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"1":{"label":"super-immune","desc":"This pawn has a naturally powerful immune system. This pawn will gain immunity much faster than a normal person would, and can survive illnesses that would kill others.","degree":1,"statOffsets":{"ImmunityGainSpeed":0.3}},"-1":{"label":"sickly","desc":"This pawn has an awful immune system. This pawn gets sick more often than usual, frequently with illnesses that nobody in the colony has been afflicted by.","degree":-1,"skills":{"Medicine":4}}}}];
\ No newline at end of file
+var traits = [{"name":"Delicate","commonality":1.0,"conflictingTraits":[],"exclusionTags":["Toughness"],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0,"statFactors":{"IncomingDamageFactor":1.15}}}},{"name":"Recluse","commonality":0.5,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0}}},{"name":"Nudist","commonality":0.7,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0}}},{"name":"Bloodlust","commonality":0.8,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":["Violent"],"degrees":{"0":{"degree":0,"meditationTypes":["Morbid"]}}},{"name":"Kind","commonality":2.0,"conflictingTraits":["Abrasive","Psychopath"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0,"statFactors":{"CertaintyLossFactor":2.0}}}},{"name":"Psychopath","commonality":1.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0,"statFactors":{"CertaintyLossFactor":0.5},"meditationTypes":["Morbid"]}}},{"name":"Cannibal","commonality":0.6,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0,"meditationTypes":["Morbid"]}}},{"name":"Abrasive","commonality":1.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":["Social"],"degrees":{"0":{"degree":0,"statFactors":{"CertaintyLossFactor":0.5}}}},{"name":"TooSmart","commonality":1.0,"conflictingTraits":["Nerves","SlowLearner"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":["Intellectual"],"degrees":{"0":{"degree":0,"statOffsets":{"GlobalLearningFactor":0.75,"MentalBreakThreshold":0.12},"statFactors":{"CertaintyLossFactor":0.5}}}},{"name":"Brawler","commonality":1.0,"conflictingTraits":["ShootingAccuracy","Wimp"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":["Shooting"],"disabledWork":[],"requiredWork":["Violent"],"degrees":{"0":{"degree":0,"skills":{"Melee":4,"Shooting":-4},"statOffsets":{"MeleeHitChance":4.0}}}},{"name":"Masochist","commonality":0.5,"conflictingTraits":["Wimp"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0,"meditationTypes":["Morbid"]}}},{"name":"NightOwl","commonality":1.3,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0}}},{"name":"Greedy","commonality":1.0,"conflictingTraits":["Ascetic","Jealous"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0}}},{"name":"Jealous","commonality":1.0,"conflictingTraits":["Ascetic","Greedy"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0,"meditationTypes":["Morbid"]}}},{"name":"Ascetic","commonality":0.7,"conflictingTraits":["Greedy","Jealous","Gourmand"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0,"statFactors":{"CertaintyLossFactor":0.5},"meditationTypes":["Minimal"]}}},{"name":"Gay","commonality":0.3,"conflictingTraits":[],"exclusionTags":["SexualOrientation"],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0}}},{"name":"Bisexual","commonality":0.2,"conflictingTraits":[],"exclusionTags":["SexualOrientation"],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0}}},{"name":"Asexual","commonality":0.2,"conflictingTraits":[],"exclusionTags":["SexualOrientation"],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0}}},{"name":"AnnoyingVoice","commonality":0.5,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0}}},{"name":"CreepyBreathing","commonality":0.5,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0}}},{"name":"Pyromaniac","commonality":0.8,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":["Firefighting"],"requiredWork":[],"degrees":{"0":{"degree":0,"meditationTypes":["Flame"]}}},{"name":"Wimp","commonality":1.0,"conflictingTraits":["Brawler","Masochist"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0,"statOffsets":{"PainShockThreshold":-0.5},"statFactors":{"CertaintyLossFactor":2.0}}}},{"name":"Nimble","commonality":1.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0,"statOffsets":{"MeleeDodgeChance":15.0},"statFactors":{"PawnTrapSpringChance":0.1}}}},{"name":"FastLearner","commonality":1.0,"conflictingTraits":[],"exclusionTags":["SlowFastLearner"],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0,"statOffsets":{"GlobalLearningFactor":0.75}}}},{"name":"SlowLearner","commonality":1.0,"conflictingTraits":["TooSmart"],"exclusionTags":["SlowFastLearner"],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0,"statOffsets":{"GlobalLearningFactor":-0.75},"statFactors":{"CertaintyLossFactor":0.5}}}},{"name":"Undergrounder","commonality":0.2,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0,"meditationTypes":["Morbid"]}}},{"name":"Transhumanist","commonality":0.9,"conflictingTraits":["BodyPurist"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0}}},{"name":"BodyPurist","commonality":0.7,"conflictingTraits":["Transhumanist"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0}}},{"name":"DislikesMen","commonality":0.3,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0}}},{"name":"DislikesWomen","commonality":1.7,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0}}},{"name":"GreatMemory","commonality":1.1,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0}}},{"name":"Tough","commonality":1.1,"conflictingTraits":[],"exclusionTags":["Toughness"],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0,"statFactors":{"IncomingDamageFactor":0.5}}}},{"name":"TorturedArtist","commonality":0.6,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":["Artistic"],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0,"meditationTypes":["Morbid"]}}},{"name":"Gourmand","commonality":1.0,"conflictingTraits":["Ascetic"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0,"skills":{"Cooking":4},"hungerRateFactor":1.5}}},{"name":"QuickSleeper","commonality":1.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"0":{"degree":0,"statOffsets":{"RestRateMultiplier":0.5}}}},{"name":"SpeedOffset","commonality":2.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"-1":{"degree":-1,"statOffsets":{"MoveSpeed":-0.2}},"1":{"degree":1,"statOffsets":{"MoveSpeed":0.2}},"2":{"degree":2,"statOffsets":{"MoveSpeed":0.4}}}},{"name":"DrugDesire","commonality":3.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"2":{"degree":2},"1":{"degree":1},"-1":{"degree":-1}}},{"name":"NaturalMood","commonality":2.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"2":{"degree":2},"1":{"degree":1},"-1":{"degree":-1},"-2":{"degree":-2}}},{"name":"Nerves","commonality":2.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"2":{"degree":2,"statOffsets":{"MentalBreakThreshold":-0.18},"statFactors":{"CertaintyLossFactor":0.25}},"1":{"degree":1,"statOffsets":{"MentalBreakThreshold":-0.09},"statFactors":{"CertaintyLossFactor":0.5}},"-1":{"degree":-1,"statOffsets":{"MentalBreakThreshold":0.08},"statFactors":{"CertaintyLossFactor":2.0}},"-2":{"degree":-2,"statOffsets":{"MentalBreakThreshold":0.15},"statFactors":{"CertaintyLossFactor":3.0}}}},{"name":"Neurotic","commonality":1.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"1":{"degree":1,"statOffsets":{"WorkSpeedGlobal":0.2,"MentalBreakThreshold":0.08}},"2":{"degree":2,"statOffsets":{"WorkSpeedGlobal":0.4,"MentalBreakThreshold":0.14}}}},{"name":"Industriousness","commonality":2.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"2":{"degree":2,"statOffsets":{"WorkSpeedGlobal":0.35}},"1":{"degree":1,"statOffsets":{"WorkSpeedGlobal":0.2}},"-1":{"degree":-1,"statOffsets":{"WorkSpeedGlobal":-0.2}},"-2":{"degree":-2,"statOffsets":{"WorkSpeedGlobal":-0.35}}}},{"name":"PsychicSensitivity","commonality":2.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"2":{"degree":2,"statOffsets":{"PsychicSensitivity":0.8}},"1":{"degree":1,"statOffsets":{"PsychicSensitivity":0.4}},"-1":{"degree":-1,"statOffsets":{"PsychicSensitivity":-0.5}},"-2":{"degree":-2,"statOffsets":{"PsychicSensitivity":-1.0}}}},{"name":"ShootingAccuracy","commonality":2.0,"conflictingTraits":["Brawler"],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":["Violent"],"degrees":{"1":{"degree":1,"statOffsets":{"AimingDelayFactor":0.25,"ShootingAccuracyPawn":5.0}},"-1":{"degree":-1,"statOffsets":{"AimingDelayFactor":-0.5,"ShootingAccuracyPawn":-5.0}}}},{"name":"Beauty","commonality":2.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"2":{"degree":2,"statOffsets":{"PawnBeauty":2.0}},"1":{"degree":1,"statOffsets":{"PawnBeauty":1.0}},"-1":{"degree":-1,"statOffsets":{"PawnBeauty":-1.0}},"-2":{"degree":-2,"statOffsets":{"PawnBeauty":-2.0}}}},{"name":"Immunity","commonality":1.0,"conflictingTraits":[],"exclusionTags":[],"forcedFlames":[],"conflictingFlames":[],"disabledWork":[],"requiredWork":[],"degrees":{"1":{"degree":1,"statOffsets":{"ImmunityGainSpeed":0.3}},"-1":{"degree":-1,"skills":{"Medicine":4}}}}];
+/** @type { NameIndex } */
+var traitIndex = {"Delicate":0,"Recluse":1,"Nudist":2,"Bloodlust":3,"Kind":4,"Psychopath":5,"Cannibal":6,"Abrasive":7,"TooSmart":8,"Brawler":9,"Masochist":10,"NightOwl":11,"Greedy":12,"Jealous":13,"Ascetic":14,"Gay":15,"Bisexual":16,"Asexual":17,"AnnoyingVoice":18,"CreepyBreathing":19,"Pyromaniac":20,"Wimp":21,"Nimble":22,"FastLearner":23,"SlowLearner":24,"Undergrounder":25,"Transhumanist":26,"BodyPurist":27,"DislikesMen":28,"DislikesWomen":29,"GreatMemory":30,"Tough":31,"TorturedArtist":32,"Gourmand":33,"QuickSleeper":34,"SpeedOffset":35,"DrugDesire":36,"NaturalMood":37,"Nerves":38,"Neurotic":39,"Industriousness":40,"PsychicSensitivity":41,"ShootingAccuracy":42,"Beauty":43,"Immunity":44};
+/** @type { TraitConflicts } */
+var traitConflicts = {"keys":["Delicate:0","Recluse:0","Nudist:0","Bloodlust:0","Kind:0","Psychopath:0","Cannibal:0","Abrasive:0","TooSmart:0","Brawler:0","Masochist:0","NightOwl:0","Greedy:0","Jealous:0","Ascetic:0","Gay:0","Bisexual:0","Asexual:0","AnnoyingVoice:0","CreepyBreathing:0","Pyromaniac:0","Wimp:0","Nimble:0","FastLearner:0","SlowLearner:0","Undergrounder:0","Transhumanist:0","BodyPurist:0","DislikesMen:0","DislikesWomen:0","GreatMemory:0","Tough:0","TorturedArtist:0","Gourmand:0","QuickSleeper:0","SpeedOffset:-1","SpeedOffset:1","SpeedOffset:2","DrugDesire:2","DrugDesire:1","DrugDesire:-1","NaturalMood:2","NaturalMood:1","NaturalMood:-1","NaturalMood:-2","Nerves:2","Nerves:1","Nerves:-1","Nerves:-2","Neurotic:1","Neurotic:2","Industriousness:2","Industriousness:1","Industriousness:-1","Industriousness:-2","PsychicSensitivity:2","PsychicSensitivity:1","PsychicSensitivity:-1","PsychicSensitivity:-2","ShootingAccuracy:1","ShootingAccuracy:-1","Beauty:2","Beauty:1","Beauty:-1","Beauty:-2","Immunity:1","Immunity:-1"],"rows":[[2147483648,0,0],[0,0,0],[0,0,0],[0,0,0],[160,0,0],[16,0,0],[0,0,0],[16,0,0],[16777216,122880,0],[2097152,402653184,0],[2097152,0,0],[0,0,0],[24576,0,0],[20480,0,0],[12288,2,0],[196608,0,0],[163840,0,0],[98304,0,0],[0,0,0],[0,0,0],[0,0,0],[1536,0,0],[0,0,0],[16777216,0,0],[8388864,0,0],[0,0,0],[134217728,0,0],[67108864,0,0],[0,0,0],[0,0,0],[0,0,0],[1,0,0],[0,0,0],[16384,0,0],[0,0,0],[0,48,0],[0,40,0],[0,24,0],[0,384,0],[0,320,0],[0,192,0],[0,7168,0],[0,6656,0],[0,5632,0],[0,3584,0],[256,114688,0],[256,106496,0],[256,90112,0],[256,57344,0],[0,262144,0],[0,131072,0],[0,7340032,0],[0,6815744,0],[0,5767168,0],[0,3670016,0],[0,117440512,0],[0,109051904,0],[0,92274688,0],[0,58720256,0],[512,268435456,0],[512,134217728,0],[0,3221225472,1],[0,2684354560,1],[0,1610612736,1],[0,3758096384,0],[0,0,4],[0,0,2]]};
\ No newline at end of file
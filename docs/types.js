@@ -15,6 +15,25 @@
 |                                                                         |
 +-------------------------------------------------------------------------+
 */
+/**
+ * A texture packed into an atlas page (e.g. genes.png, genes_1.png, ...)
+ * trimX, trimY, sourceW and sourceH are only given when transparent borders were trimmed off
+ * tinted is only given when the texture's colour was baked in
+ * @typedef {Object} Sprite
+ * @property {number} page
+ * @property {number} x
+ * @property {number} y
+ * @property {number} w
+ * @property {number} h
+ * @property {number} [trimX]
+ * @property {number} [trimY]
+ * @property {number} [sourceW]
+ * @property {number} [sourceH]
+ * @property {boolean} [tinted]
+ */
+
+// Labels, descriptions and titles aren't in the data files: docs/strings.js fills them in with loadStrings
+
 /**
  * @typedef {Object} Backstory
  * @property {string} name
@@ -33,7 +52,7 @@
  * @property {string} [label]
  * @property {string} [labelShortAdj]
  * @property {string} [desc]
- * @property {{x: number, y: number}} [iconPath]
+ * @property {Sprite} [iconPath]
  * @property {{R: number, G: number, B: number, A: number}} [iconColor]
  * @property {string} [displayCategory]
  * @property {number} [displayOrder]
@@ -84,7 +103,7 @@
 /**
  * @typedef {Object} HeadType
  * @property {string} name
- * @property {{x: number, y: number}} [iconPath]
+ * @property {Sprite | string} [graphicPath] the texture path if it wasn't packed into bodyparts.png
  * @property {string} [gender]
  * @property {string} [randomChosen]
  * @property {number[]} [hairMeshSize]
@@ -98,7 +117,7 @@
  * @typedef {Object} HairBeardType
  * @property {string} name
  * @property {string} label
- * @property {{x: number, y: number}} [iconPath]
+ * @property {Sprite | string} [graphicPath] the texture path if it wasn't packed into bodyparts.png
  * @property {string} [gender]
  * @property {string} [category]
  * @property {string[]} [styleTags]
@@ -106,6 +125,42 @@
  * @property {number} [offsetNarrowSouth]
  */
 
+/**
+ * Position of each name in its data array (e.g. traits[traitIndex[name]])
+ * @typedef {Object.<string, number>} NameIndex
+ */
+
+/**
+ * Positions in the genes array
+ * @typedef {Object} GeneIndex
+ * @property {NameIndex} byName
+ * @property {Object.<string, number[]>} byCategory genes by displayCategory ("Misc" when there is none), in order
+ * @property {number[]} skinColor genes with a skinColor
+ * @property {number[]} hairColor genes with a hairColor
+ * @property {number[]} skinColorOverride genes with a skinColorOverride
+ */
+
+/**
+ * A set of positions packed into 32-bit words; position i is (row[i >> 5] >>> (i & 31)) & 1
+ * @typedef {number[]} Bitset
+ */
+
+/**
+ * Which trait degrees conflict with each other
+ * @typedef {Object} TraitConflicts
+ * @property {string[]} keys "{trait}:{degree}" for each row
+ * @property {Bitset[]} rows the degrees each degree conflicts with, as positions in keys
+ */
+
+/**
+ * An inverted index of one dataset (scripts/search.py); ids are positions in the dataset's array
+ * @typedef {Object} SearchIndex
+ * @property {number} size number of records
+ * @property {string[]} terms every token of the records' strings, sorted
+ * @property {number[][]} postings for each term, [id, weight, id, weight, ...] of the records with it, by id
+ * @property {Object.<string, number[]>} filters "+{skill}", "-{skill}", "disables:{work}" and "requires:{work}" -> ids, by id
+ */
+
 /*
 +-------------------------------------------------------------------------+
 |                                                                         |
@@ -1,100 +1,86 @@
-# Reads backgrounds from a directory and puts them into ../data/childhoods.json and ../data/adulthoods.json
+# Reads backstories (BackstoryDef) from a Defs directory into data/childhoods.ts, data/adulthoods.ts, docs/childhoods.js and docs/adulthoods.js
+# Their titles and descriptions go to string tables (strings.py) and search indexes (search.py)
+# With --bundle and --chunks, also writes a bundle (bundle.py) and chunks (chunks.py)
 from pathlib import Path
-from typing import List, Dict, Union
+from typing import List, Dict
 from xml.etree import ElementTree as ET
 import json
-
-directory = input("Directory: ").strip('" \n\t')
-
-exclude = ["Special.xml", "TynanCustom.xml"]
-
-files = list(filter(lambda x: x.name not in exclude,
-             Path(directory).rglob("*.[xX][mM][lL]")))
-
-
-class backstory:
-    @staticmethod
-    def cleanDescription(text: str) -> str:
-        return text.replace("\\n", "\n").replace("\n\n", "\n").replace("[PAWN_nameDef]", "This pawn").replace("[PAWN_pronoun]", "This pawn").replace("[PAWN_possessive]", "their").replace("[PAWN_objective]", "them")
-
-    def __init__(self, bdef: ET.Element):
-        # Handles parsing of a <BackstoryDef> element
-        self.defName: str = bdef.findtext("defName")
-        self.title: str = bdef.findtext("title")
-        self.titleShort: str = bdef.findtext("titleShort")
-        self.desc: str = backstory.cleanDescription(bdef.findtext("baseDesc"))
-        self.slot: str = bdef.findtext("slot")
-
-        self.skills: Dict[str, int] = {}
-        for li in bdef.iterfind("./skillGains/li"):
-            key = li.findtext("key")
-            value = li.findtext("value")
-            assert key is not None and value is not None
-            self.skills[key] = int(value)
-
-        self.disabledWork: List[str] = []
-        for li in bdef.iterfind("./workDisables/li"):
-            assert li.text is not None
-            self.disabledWork.append(li.text)
-        disabledWorkText = bdef.findtext("workDisables")
-        if disabledWorkText is not None and disabledWorkText.strip() != "None":
-            self.disabledWork.extend(filter(lambda x: x != "", map(
-                lambda x: x.strip(), disabledWorkText.split(","))))
-
-        self.requiredWork: List[str] = []
-        # Two ways it could be formatted: xml list or simple "a, b, c"/"None"
-        for li in bdef.iterfind("./requiredWorkTags/li"):
-            assert li.text is not None
-            self.requiredWork.append(li.text)
-        requiredWorkText = bdef.findtext("requiredWorkTags")
-        if requiredWorkText is not None and requiredWorkText.strip() != "None":
-            self.requiredWork.extend(filter(lambda x: x != "", map(
-                lambda x: x.strip(), requiredWorkText.split(","))))
-
-        self.forcedTraits: Dict[str, int] = {}
-        for item in bdef.iterfind("./forcedTraits/*"):
-            if item.text is None:
-                self.forcedTraits[item.tag] = 0
-            else:
-                self.forcedTraits[item.tag] = int(item.text)
-
-    def export(self) -> Dict[str, Union[str, int, List[str], Dict[str, int]]]:
-        return {
-            "name": self.defName,
-            "title": self.title,
-            "titleShort": self.titleShort,
-            "desc": self.desc,
-            "skills": self.skills,
-            "disabledWork": self.disabledWork,
-            "requiredWork": self.requiredWork,
-            "traits": self.forcedTraits
-        }
-
-
-adulthoods: List[dict] = []
-childhoods: List[dict] = []
-
-for filePath in files:
-    tree = ET.ElementTree(file=filePath)
-    for bdef in tree.iterfind("./BackstoryDef"):
-        b = backstory(bdef)
-        if b.slot == "Adulthood":
-            adulthoods.append(b.export())
-        elif b.slot == "Childhood":
-            childhoods.append(b.export())
-
-adulthoods.sort(key=lambda x: x["title"])
-childhoods.sort(key=lambda x: x["title"])
-
-adulthoodsFileTS = open(Path("./data/adulthoods.ts").resolve(), "w+")
-childhoodsFileTS = open(Path("./data/childhoods.ts").resolve(), "w+")
-adulthoodsFileJS = open(Path("./docs/adulthoods.js").resolve(), "w+")
-childhoodsFileJS = open(Path("./docs/childhoods.js").resolve(), "w+")
-jsonStringAdulthoods = json.dumps(adulthoods, separators=(',', ':'))
-jsonStringChildhoods = json.dumps(childhoods, separators=(',', ':'))
-adulthoodsFileTS.write(f"export var adulthoods = {jsonStringAdulthoods};")
-childhoodsFileTS.write(f"export var childhoods = {jsonStringChildhoods};")
-adulthoodsFileJS.write("/** @type { Backstory[] } */\n" +
-                       f"var adulthoods = {jsonStringAdulthoods};")
-childhoodsFileJS.write("/** @type { Backstory[] } */\n" +
-                       f"var childhoods = {jsonStringChildhoods};")
+import bundle
+import chunks
+from bundle import writeBundle
+from chunks import whole, writeChunks
+from cache import writeIfChanged
+from indexes import indexJS, indexTS, nameIndex
+from search import writeSearch
+from defs import extractor, parseArgs, runExtractors
+from strings import stringFields, writeStrings
+from schema import descriptionCleaner, dictField, field, listField, liDict, pawnTokens, schema, tagDict, text, workList
+
+
+# Every key is kept, even when empty; slot is only used to sort backstories into adulthoods and childhoods
+backstorySchema = schema(
+    field("name", "defName"),
+    field("title"),
+    field("titleShort"),
+    field("desc", "baseDesc", text(descriptionCleaner(pawnTokens("[]")))),
+    dictField("skills", "skillGains", liDict("key", "value", int)),
+    listField("disabledWork", "workDisables", workList),
+    listField("requiredWork", "requiredWorkTags", workList),
+    dictField("traits", "forcedTraits", tagDict(int, 0)),
+    field("slot"),
+    prune=False
+)
+backstoryStrings = stringFields(backstorySchema, ["title", "titleShort", "desc"])
+# Descriptions per chunk: only the titles are needed to list backstories, descriptions are fetched as they're shown
+descriptionsPerChunk = 100
+
+
+def backstoryStringParts(i: int, s: dict) -> Dict[str, dict]:
+    return {"titles": dict((k, s[k]) for k in ("title", "titleShort") if k in s),
+            f"descriptions{i // descriptionsPerChunk}": dict((k, s[k]) for k in ("desc",) if k in s)}
+
+
+class backstoryExtractor(extractor):
+    name = "backstories"
+    tags = ["BackstoryDef"]
+    exclude = ["Special.xml", "TynanCustom.xml"]
+
+    def extract(self, bdef: ET.Element):
+        b = backstorySchema.read(bdef)
+        slot = b.pop("slot")
+        if slot in ("Adulthood", "Childhood"):
+            return slot, b
+        return None
+
+    def write(self, records: Dict[str, List[dict]]):
+        adulthoods: List[dict] = records.get("Adulthood", [])
+        childhoods: List[dict] = records.get("Childhood", [])
+
+        adulthoods.sort(key=lambda x: x["title"])
+        childhoods.sort(key=lambda x: x["title"])
+        tables = writeStrings("backstories", {"adulthoods": (adulthoods, "BackstoryDef", backstoryStrings),
+                                              "childhoods": (childhoods, "BackstoryDef", backstoryStrings)},
+                              {"adulthoods": backstoryStringParts, "childhoods": backstoryStringParts})
+        writeSearch("backstories", tables, {"adulthoods": adulthoods, "childhoods": childhoods})
+
+        jsonStringAdulthoods = json.dumps(adulthoods, separators=(',', ':'))
+        jsonStringChildhoods = json.dumps(childhoods, separators=(',', ':'))
+        adulthoodIndex = nameIndex(adulthoods)
+        childhoodIndex = nameIndex(childhoods)
+        writeIfChanged(Path("./data/adulthoods.ts").resolve(),
+                       f"export var adulthoods = {jsonStringAdulthoods};\n" + indexTS("adulthoodIndex", adulthoodIndex))
+        writeIfChanged(Path("./data/childhoods.ts").resolve(),
+                       f"export var childhoods = {jsonStringChildhoods};\n" + indexTS("childhoodIndex", childhoodIndex))
+        writeIfChanged(Path("./docs/adulthoods.js").resolve(), "/** @type { Backstory[] } */\n" +
+                       f"var adulthoods = {jsonStringAdulthoods};\n" + indexJS("adulthoodIndex", "NameIndex", adulthoodIndex))
+        writeIfChanged(Path("./docs/childhoods.js").resolve(), "/** @type { Backstory[] } */\n" +
+                       f"var childhoods = {jsonStringChildhoods};\n" + indexJS("childhoodIndex", "NameIndex", childhoodIndex))
+        if bundle.enabled:
+            writeBundle("backstories", {"adulthoods": adulthoods, "childhoods": childhoods},
+                        {"adulthoodIndex": adulthoodIndex, "childhoodIndex": childhoodIndex})
+        if chunks.enabled:
+            writeChunks("backstories", {"adulthoods": (adulthoods, whole("adulthoods")), "childhoods": (childhoods, whole("childhoods"))})
+
+if __name__ == "__main__":
+    args = parseArgs()
+    runExtractors(args.directory, [backstoryExtractor()], jobs=args.jobs)
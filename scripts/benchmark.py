@@ -0,0 +1,185 @@
+# Benchmarks the extractor scripts on synthetic corpora generated by corpus.py
+# Each script runs in its own process with --no-cache and a scratch data/ and docs/ directory,
+# recording wall time, peak RSS and output size, and optionally comparing the outputs byte-for-byte with a baseline:
+#   python scripts/benchmark.py --scales 1 10 --save-baseline ./benchmark/baseline
+#   (change something)
+#   python scripts/benchmark.py --scales 1 10 --baseline ./benchmark/baseline
+from pathlib import Path
+from typing import Dict, List, Optional
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+scriptsDir = Path(__file__).resolve().parent
+
+# Command lines, relative to scripts/; {defs} and {textures} are the corpus directories
+targets: Dict[str, List[str]] = {
+    "genes": ["genes.py", "{defs}", "{textures}"],
+    "traits": ["traits.py", "{defs}"],
+    "backstories": ["backstories.py", "{defs}"],
+    "bodyparts": ["bodyparts.py", "{defs}", "{textures}"],
+    "graphics": ["benchmark.py", "--load-graphics", "{textures}"],
+    "build": ["build.py", "{defs}", "{textures}"]
+}
+
+
+def corpusKey(scale: float, mods: int, depth: int, seed: int) -> str:
+    return f"x{scale:g}-mods{mods}-depth{depth}-seed{seed}"
+
+
+def ensureCorpus(directory: Path, scale: float, mods: int, depth: int, seed: int):
+    """Generates the corpus unless a complete one is already there"""
+    marker = directory / ".complete"
+    if marker.exists():
+        return
+    from corpus import generateCorpus
+    shutil.rmtree(directory, ignore_errors=True)
+    print(f"Generating {directory.name}...", file=sys.stderr)
+    generateCorpus(directory, scale, mods, depth, seed)
+    marker.touch()
+
+
+def outputFiles(runDir: Path) -> Dict[str, Path]:
+    """Every file a run wrote, by path relative to runDir"""
+    files: Dict[str, Path] = {}
+    for sub in ("data", "docs"):
+        for path in sorted((runDir / sub).rglob("*")):
+            if path.is_file():
+                files[path.relative_to(runDir).as_posix()] = path
+    return files
+
+
+def compareOutputs(runDir: Path, baselineDir: Path) -> List[str]:
+    """Paths that differ from the baseline, are missing from it or are missing from the run"""
+    ours = outputFiles(runDir)
+    theirs = outputFiles(baselineDir)
+    diffs: List[str] = []
+    for name in sorted(set(ours) | set(theirs)):
+        if name not in ours:
+            diffs.append(f"{name} (not written)")
+        elif name not in theirs:
+            diffs.append(f"{name} (not in baseline)")
+        elif ours[name].read_bytes() != theirs[name].read_bytes():
+            diffs.append(name)
+    return diffs
+
+
+def runTarget(command: List[str], runDir: Path) -> dict:
+    """Runs one command in a fresh runDir; peak RSS is only known where os.wait4 exists"""
+    shutil.rmtree(runDir, ignore_errors=True)
+    (runDir / "data").mkdir(parents=True)
+    (runDir / "docs").mkdir()
+    with open(runDir / "stderr.txt", "wb") as stderr:
+        start = time.perf_counter()
+        process = subprocess.Popen(command, cwd=runDir, stdin=subprocess.DEVNULL,
+                                   stdout=subprocess.DEVNULL, stderr=stderr)
+        peakRss: Optional[int] = None
+        if hasattr(os, "wait4"):
+            _, status, usage = os.wait4(process.pid, 0)
+            returnCode = os.waitstatus_to_exitcode(status)
+            # ru_maxrss is in bytes on macOS and in KiB elsewhere
+            peakRss = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+        else:
+            returnCode = process.wait()
+        seconds = time.perf_counter() - start
+    return {
+        "seconds": seconds,
+        "peakRss": peakRss,
+        "outputBytes": sum(p.stat().st_size for p in outputFiles(runDir).values()),
+        "returnCode": returnCode
+    }
+
+
+def loadAllGraphics(textures: str):
+    """The graphics target: packs every gene icon in the corpus into one atlas, like genes.py does"""
+    import cache
+    from graphics import loadGraphics
+    cache.enabled = False
+    root = Path(textures)
+    icons: List[str] = []
+    for path in sorted(root.rglob("*.png")):
+        parts = path.relative_to(root).with_suffix("").parts
+        if "Genes" in parts:
+            # Drop the mod folder, as texture paths in Defs don't have it
+            icons.append("/".join(parts[1:]))
+    loadGraphics(textures, (128, 128), icons, "icons.png", downscales=(2,), variants=True)
+
+
+def formatBytes(n: Optional[int]) -> str:
+    if n is None:
+        return "?"
+    return f"{n / (1 << 20):.1f} MiB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Times the extractor scripts on synthetic corpora")
+    parser.add_argument("--scales", type=float, nargs="+", default=[1],
+                        help="corpus sizes, as multiples of vanilla (e.g. 1 10 100)")
+    parser.add_argument("--mods", type=int, default=None,
+                        help="mods the Defs past vanilla's are split between (default: 2 per 1x of scale past 1x)")
+    parser.add_argument("--depth", type=int, default=4, help="length of the ParentName chains")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--targets", nargs="+", choices=list(targets), default=list(targets))
+    parser.add_argument("--repeat", type=int, default=1, help="runs per target; the fastest is reported")
+    parser.add_argument("--jobs", type=int, default=1, help="passed on to the extractor scripts")
+    parser.add_argument("--workdir", default="./benchmark", help="where corpora and run outputs are kept")
+    parser.add_argument("--baseline", help="compare outputs byte-for-byte with a directory written by --save-baseline")
+    parser.add_argument("--save-baseline", help="copy this run's outputs to a directory, to compare later runs with")
+    parser.add_argument("--report", help="also write the results as JSON to this file")
+    parser.add_argument("--load-graphics", metavar="TEXTURES", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.load_graphics is not None:
+        loadAllGraphics(args.load_graphics)
+        return
+
+    workdir = Path(args.workdir).resolve()
+    results: List[dict] = []
+    failed = False
+    for scale in args.scales:
+        mods = args.mods if args.mods is not None else round(2 * max(0, scale - 1))
+        key = corpusKey(scale, mods, args.depth, args.seed)
+        corpusDir = workdir / "corpora" / key
+        ensureCorpus(corpusDir, scale, mods, args.depth, args.seed)
+        for target in args.targets:
+            command = [sys.executable, str(scriptsDir / targets[target][0])] + [
+                a.format(defs=corpusDir / "Defs", textures=corpusDir / "Textures") for a in targets[target][1:]]
+            if target != "graphics":
+                command += ["--no-cache", "--jobs", str(args.jobs)]
+            runDir = workdir / "runs" / key / target
+            runs = [runTarget(command, runDir) for _ in range(args.repeat)]
+            result = {
+                "corpus": key,
+                "target": target,
+                "seconds": min(r["seconds"] for r in runs),
+                "peakRss": max((r["peakRss"] for r in runs if r["peakRss"] is not None), default=None),
+                "outputBytes": runs[-1]["outputBytes"],
+                "returnCode": max((r["returnCode"] for r in runs), key=abs)
+            }
+            status = "ok" if result["returnCode"] == 0 else f"exit {result['returnCode']} (see {runDir / 'stderr.txt'})"
+            failed = failed or result["returnCode"] != 0
+            if args.baseline is not None:
+                diffs = compareOutputs(runDir, Path(args.baseline) / key / target)
+                result["baselineDiffs"] = diffs
+                status += ", same as baseline" if len(diffs) == 0 else f", {len(diffs)} outputs differ from baseline: " + ", ".join(diffs)
+                failed = failed or len(diffs) != 0
+            if args.save_baseline is not None:
+                saveDir = Path(args.save_baseline) / key / target
+                shutil.rmtree(saveDir, ignore_errors=True)
+                for sub in ("data", "docs"):
+                    shutil.copytree(runDir / sub, saveDir / sub)
+            results.append(result)
+            print(f"{key:<28} {target:<12} {result['seconds']:8.2f}s  peak {formatBytes(result['peakRss']):>10}  "
+                  f"output {formatBytes(result['outputBytes']):>10}  {status}")
+
+    if args.report is not None:
+        Path(args.report).write_text(json.dumps({"python": sys.version, "results": results}, indent=2))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
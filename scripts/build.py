@@ -0,0 +1,21 @@
+# Runs every extractor over a single pass of the Defs directory
+# With --watch, keeps running and regenerates the outputs whenever the Defs or textures change
+# With --link, links the outputs' references as integer ids afterwards (link.py)
+from defs import parseArgs, runExtractors
+from backstories import backstoryExtractor
+from traits import traitExtractor
+from genes import geneExtractor
+from bodyparts import bodypartExtractor
+from link import linkOutputs
+from watch import watch
+
+if __name__ == "__main__":
+    args = parseArgs(graphics=True, watch=True, link=True)
+    extractors = [backstoryExtractor(), traitExtractor(),
+                  geneExtractor(args.graphicsDir, args.tint_icons, args.atlas_variants), bodypartExtractor(args.graphicsDir, args.atlas_variants)]
+    if args.watch:
+        watch(args.directory, args.graphicsDir, extractors, args.interval, linkOutputs if args.link else None)
+    else:
+        runExtractors(args.directory, extractors, jobs=args.jobs)
+        if args.link:
+            linkOutputs()
@@ -0,0 +1,129 @@
+# Compact columnar binary bundles of the exported data, as an alternative to the JSON in data/*.ts and docs/*.js
+# Decoded by docs/bundle.js in the browser and src/bundle.ts in the worker
+#
+# File layout: "RWB1", uint32 header length, UTF-8 JSON header, padding to 8 bytes, body.
+# The header holds the string table shared by every dataset in the bundle and a column tree per dataset:
+# {"strings": [...], "datasets": {name: {"n": count, "c": [[key, column], ...]}}}
+# Columns ("o" is an offset into the body; arrays are little-endian and aligned to their item size):
+#   z: all null          b: uint8 booleans          i: signed ints of width "w"     f: floats of width "w"
+#   s: string table indices of width "w"            j: string table indices of JSON text, for mixed values
+#   l: lists, as lengths of width "w" then the column "v" of all their items
+#   m: objects, as lengths of width "w" then the columns "k" and "v" of all their keys and values
+#   "p", if present, is the offset of a bitmap of which values exist; the rest of the column only holds those
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from array import array
+import base64
+import json
+import struct
+import sys
+from cache import writeIfChanged
+from indexes import indexTS
+
+# Turned on by --bundle
+enabled = False
+
+_missing = object()
+
+
+def _fitsFloat32(x: float) -> bool:
+    try:
+        return struct.unpack("<f", struct.pack("<f", x))[0] == x
+    except OverflowError:
+        return False
+
+
+class bundleWriter:
+    def __init__(self):
+        self.strings: List[str] = []
+        self.stringIndex: Dict[str, int] = {}
+        self.body = bytearray()
+
+    def string(self, s: str) -> int:
+        if s not in self.stringIndex:
+            self.stringIndex[s] = len(self.strings)
+            self.strings.append(s)
+        return self.stringIndex[s]
+
+    def array(self, code: str, values: List[Any]) -> int:
+        """Appends a typed array to the body and returns its offset"""
+        a = array(code, values)
+        if sys.byteorder != "little":
+            a.byteswap()
+        self.body.extend(bytes(-len(self.body) % a.itemsize))
+        offset = len(self.body)
+        self.body.extend(a.tobytes())
+        return offset
+
+    def unsigned(self, values: List[int]) -> Dict[str, int]:
+        top = max(values, default=0)
+        width, code = (1, "B") if top < 1 << 8 else (2, "H") if top < 1 << 16 else (4, "I")
+        return {"w": width, "o": self.array(code, values)}
+
+    def column(self, values: List[Any]) -> Dict[str, Any]:
+        """Encodes one value per record; values may hold _missing for records without the key"""
+        present = [v for v in values if v is not _missing]
+        desc: Dict[str, Any] = {}
+        if len(present) < len(values):
+            bits = bytearray((len(values) + 7) // 8)
+            for i, v in enumerate(values):
+                if v is not _missing:
+                    bits[i >> 3] |= 1 << (i & 7)
+            desc["p"] = self.array("B", bits)
+        desc.update(self.values(present))
+        return desc
+
+    def values(self, values: List[Any]) -> Dict[str, Any]:
+        if all(v is None for v in values):
+            return {"t": "z"}
+        if all(isinstance(v, bool) for v in values):
+            return {"t": "b", "o": self.array("B", [int(v) for v in values])}
+        if all(isinstance(v, int) and not isinstance(v, bool) for v in values):
+            low, high = min(values), max(values)
+            for width, code in ((1, "b"), (2, "h"), (4, "i")):
+                if -(1 << (8 * width - 1)) <= low and high < 1 << (8 * width - 1):
+                    return {"t": "i", "w": width, "o": self.array(code, values)}
+        if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+            if all(_fitsFloat32(float(v)) for v in values):
+                return {"t": "f", "w": 4, "o": self.array("f", [float(v) for v in values])}
+            return {"t": "f", "w": 8, "o": self.array("d", [float(v) for v in values])}
+        if all(isinstance(v, str) for v in values):
+            return dict({"t": "s"}, **self.unsigned([self.string(v) for v in values]))
+        if all(isinstance(v, list) for v in values):
+            items = [item for v in values for item in v]
+            return dict({"t": "l", "v": self.values(items)}, **self.unsigned([len(v) for v in values]))
+        if all(isinstance(v, dict) for v in values):
+            keys = [str(k) for v in values for k in v]
+            items = [item for v in values for item in v.values()]
+            return dict({"t": "m", "k": self.values(keys), "v": self.values(items)}, **self.unsigned([len(v) for v in values]))
+        return dict({"t": "j"}, **self.unsigned([self.string(json.dumps(v, separators=(",", ":"))) for v in values]))
+
+    def dataset(self, records: List[dict]) -> Dict[str, Any]:
+        keys: Dict[str, None] = {}
+        for r in records:
+            keys.update(dict.fromkeys(r))
+        return {"n": len(records), "c": [[k, self.column([r.get(k, _missing) for r in records])] for k in keys]}
+
+    def tobytes(self, datasets: Dict[str, List[dict]]) -> bytes:
+        encoded = dict((name, self.dataset(records)) for name, records in datasets.items())
+        header = json.dumps({"strings": self.strings, "datasets": encoded},
+                            separators=(",", ":")).encode("utf-8")
+        out = bytearray(b"RWB1" + struct.pack("<I", len(header)) + header)
+        out.extend(bytes(-len(out) % 8))
+        return bytes(out + self.body)
+
+
+def writeBundle(name: str, datasets: Dict[str, List[dict]], indexes: Optional[Dict[str, Any]] = None):
+    """
+    Writes the datasets (e.g. {"genes": genes}) as docs/{name}.bin, for docs/bundle.js's loadBundle,
+    and as data/{name}.bundle.ts, which exports each dataset under its name like data/{name}.ts does.
+    indexes (e.g. {"geneIndex": geneIndex, "geneConflicts": geneConflicts}) are exported from data/{name}.bundle.ts
+    as they are from data/{name}.ts, so it can replace it in imports; they aren't in the binary bundle
+    """
+    content = bundleWriter().tobytes(datasets)
+    writeIfChanged(Path(f"./docs/{name}.bin").resolve(), content)
+    encoded = base64.b64encode(content).decode("ascii")
+    exports = "".join(f"export var {dataset} = bundle.{dataset};\n" for dataset in datasets)
+    exports += "".join(indexTS(k, v) + "\n" for k, v in (indexes or {}).items())
+    writeIfChanged(Path(f"./data/{name}.bundle.ts").resolve(),
+                   f'import {{ decodeBundle }} from "../src/bundle";\nconst bundle = decodeBundle("{encoded}");\n{exports}')
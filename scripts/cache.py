@@ -0,0 +1,106 @@
+# Persistent build cache so reruns of the scripts only redo work for files that changed
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+import hashlib
+import pickle
+import profiling
+
+# Turned off by --no-cache
+enabled = True
+cacheDir = Path("./.buildcache")
+
+
+def hashFile(filePath: Path) -> str:
+    return hashlib.sha1(filePath.read_bytes()).hexdigest()
+
+
+def codeVersion() -> str:
+    """Hash of the scripts themselves, so changing an extractor throws its cached results away"""
+    h = hashlib.sha1()
+    for p in sorted(Path(__file__).parent.glob("*.py")):
+        h.update(p.read_bytes())
+    return h.hexdigest()
+
+
+class buildCache:
+    """
+    A manifest of file path -> (mtime and size, content hash, value) stored in cacheDir.
+    A file counts as unchanged if its mtime and size match, or failing that if its content hash does.
+    data holds anything else the owner wants to keep between runs.
+    """
+
+    def __init__(self, name: str, version: str = ""):
+        self.path = cacheDir / f"{name}.pickle"
+        self.version = codeVersion() + version
+        self.entries: Dict[str, Tuple[Tuple[int, int], str, Any]] = {}
+        self.data: Dict[str, Any] = {}
+        # Entries seen this run; only these are saved, so deleted files drop out
+        self.fresh: Dict[str, Tuple[Tuple[int, int], str, Any]] = {}
+        try:
+            with open(self.path, "rb") as f:
+                stored = pickle.load(f)
+            if stored["version"] == self.version:
+                self.entries = stored["entries"]
+                self.data = stored["data"]
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError, AttributeError, ImportError):
+            pass
+
+    def lookup(self, filePath: Path) -> Tuple[bool, Any]:
+        """Returns (True, value) if filePath is unchanged since its value was stored, otherwise (False, None)"""
+        key = str(filePath)
+        st = filePath.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        old = self.entries.get(key)
+        if old is not None and old[0] == stamp:
+            self.fresh[key] = old
+            return True, old[2]
+        digest = hashFile(filePath)
+        if old is not None and old[1] == digest:
+            self.fresh[key] = (stamp, digest, old[2])
+            return True, old[2]
+        self.fresh[key] = (stamp, digest, None)
+        return False, None
+
+    def store(self, filePath: Path, value: Any):
+        """Records the value for a file previously passed to lookup"""
+        stamp, digest, _ = self.fresh[str(filePath)]
+        self.fresh[str(filePath)] = (stamp, digest, value)
+
+    def save(self):
+        cacheDir.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump({"version": self.version, "entries": self.fresh,
+                        "data": self.data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(self.path)
+
+
+def writeIfChanged(filePath: Path, content: Union[str, bytes]) -> bool:
+    """Writes content unless the file already holds exactly that. Returns whether it wrote"""
+    mode = "b" if isinstance(content, bytes) else ""
+    with profiling.phase("write"):
+        try:
+            with open(filePath, "r" + mode) as f:
+                if f.read() == content:
+                    profiling.count("filesUnchanged")
+                    return False
+        except (OSError, UnicodeDecodeError):
+            pass
+        with open(filePath, "w" + mode) as f:
+            f.write(content)
+    profiling.count("filesWritten")
+    profiling.count("bytesWritten", len(content.encode("utf-8")) if isinstance(content, str) else len(content))
+    return True
+
+
+def readCached(name: str) -> Optional[bytes]:
+    """Reads a file kept in cacheDir, such as a previous atlas"""
+    try:
+        return (cacheDir / name).read_bytes()
+    except OSError:
+        return None
+
+
+def writeCached(name: str, content: bytes):
+    cacheDir.mkdir(parents=True, exist_ok=True)
+    (cacheDir / name).write_bytes(content)
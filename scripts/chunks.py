@@ -0,0 +1,61 @@
+# Optional chunked outputs, so the frontend can show what it has first and fetch the rest as it's needed (docs/chunks.js)
+# An output is split into docs/chunks/{path}/{chunk}.{hash}.json files, each {dataset: {name: record}},
+# and listed by a small manifest, docs/chunks/{path}.json:
+# {"chunks": {chunk: {"file": file name, "bytes": size, "names": {dataset: [names in the chunk]}}}}
+# A record can be split across chunks (e.g. a backstory's title and its description); the parts merge back by name.
+# Chunk files are named by their content hash, so they can be cached for good and only the manifest needs checking
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+import hashlib
+import json
+import re
+from cache import writeIfChanged
+
+# Turned on by --chunks
+enabled = False
+
+# (position in its dataset, record) -> {chunk: the part of the record that goes in it}
+Parts = Callable[[int, dict], Dict[str, dict]]
+
+
+def whole(chunk: str) -> Parts:
+    """Every record goes in chunk"""
+    return lambda i, r: {chunk: r}
+
+
+def byKey(key: str, default: str) -> Parts:
+    """Records go in a chunk named by their value of key (e.g. genes by displayCategory)"""
+    return lambda i, r: {str(r.get(key, default)): r}
+
+
+def chunkName(chunk: str) -> str:
+    """chunk made safe to use in a file name"""
+    return re.sub(r"[^0-9A-Za-z_-]+", "_", chunk)
+
+
+def writeChunks(path: str, datasets: Dict[str, Tuple[List[dict], Parts]]):
+    """
+    Splits each dataset's records (dataset -> (records, which chunks they go in)) into chunks
+    and writes them with their manifest under docs/chunks, removing chunk files from earlier runs
+    """
+    chunks: Dict[str, Dict[str, Dict[str, dict]]] = {}
+    for dataset, (records, parts) in datasets.items():
+        for i, r in enumerate(records):
+            for chunk, part in parts(i, r).items():
+                chunks.setdefault(chunkName(chunk), {}).setdefault(dataset, {})[r["name"]] = \
+                    dict((k, v) for k, v in part.items() if k != "name")
+
+    directory = Path(f"./docs/chunks/{path}").resolve()
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest: Dict[str, dict] = {}
+    for chunk, content in sorted(chunks.items()):
+        jsonString = json.dumps(content, separators=(",", ":"))
+        fileName = f"{chunk}.{hashlib.sha1(jsonString.encode('utf-8')).hexdigest()[:10]}.json"
+        writeIfChanged(directory / fileName, jsonString)
+        manifest[chunk] = {"file": fileName, "bytes": len(jsonString.encode("utf-8")),
+                           "names": dict((dataset, list(records)) for dataset, records in content.items())}
+    files = set(c["file"] for c in manifest.values())
+    for old in directory.glob("*.json"):
+        if old.name not in files:
+            old.unlink()
+    writeIfChanged(directory.with_suffix(".json"), json.dumps({"chunks": manifest}, separators=(",", ":")))
@@ -0,0 +1,305 @@
+# Generates synthetic RimWorld Defs and Textures trees to benchmark the extractors on, without a game install
+# The same arguments always generate the same files
+from pathlib import Path
+from typing import Dict, List, Tuple
+from xml.sax.saxutils import escape
+import argparse
+import random
+from PIL import Image, ImageDraw
+from genes import additionalGenes
+
+# Roughly how many of each Def vanilla (with every DLC) has
+vanillaCounts = {"GeneDef": 165, "TraitDef": 45, "BackstoryDef": 820,
+                 "HeadTypeDef": 27, "HairDef": 62, "BeardDef": 41, "ThingDef": 1200}
+defsPerFile = 60
+
+skills = ["Shooting", "Melee", "Construction", "Mining", "Cooking",
+          "Plants", "Animals", "Crafting", "Artistic", "Medicine", "Intellectual"]
+workTags = ["Violent", "Caring", "Social", "Intellectual", "ManualDumb",
+            "ManualSkilled", "Cleaning", "Hauling", "Firefighting", "Artistic", "Mining"]
+stats = ["MoveSpeed", "WorkSpeedGlobal", "GlobalLearningFactor", "PainShockThreshold", "MentalBreakThreshold",
+         "ImmunityGainSpeed", "ToxicResistance", "ComfyTemperatureMin", "ComfyTemperatureMax", "MeleeDodgeChance"]
+categories = ["Ability", "Archite", "Cosmetic", "Hair", "Head", "Healing", "Mood",
+              "Movement", "Psychic", "Reproduction", "Sleep", "Temperature", "Violence", "Miscellaneous"]
+words = ["iron", "glitter", "tribal", "urban", "farm", "space", "ship", "noble", "bandit", "monk", "scholar",
+         "soldier", "cook", "miner", "hunter", "vat", "grown", "feral", "street", "medic", "pirate", "artist"]
+tokens = ["[PAWN_nameDef]", "[PAWN_pronoun]", "[PAWN_possessive]", "[PAWN_objective]", "{PAWN_nameDef}", "{PAWN_possessive}"]
+
+
+class corpusWriter:
+    """Writes one mod's Defs, in files of defsPerFile, and its textures"""
+
+    def __init__(self, root: Path, mod: str, rng: random.Random):
+        self.defsDir = root / "Defs" / mod
+        self.texturesDir = root / "Textures" / mod
+        self.mod = mod
+        self.rng = rng
+        self.files: Dict[str, List[str]] = {}
+        self.fileCounts: Dict[str, int] = {}
+
+    def add(self, category: str, xml: str):
+        defs = self.files.setdefault(category, [])
+        defs.append(xml)
+        if len(defs) >= defsPerFile:
+            self.flush(category)
+
+    def flush(self, category: str):
+        defs = self.files.pop(category, [])
+        if len(defs) == 0:
+            return
+        n = self.fileCounts.get(category, 0)
+        self.fileCounts[category] = n + 1
+        path = self.defsDir / category / f"{category}_{n}.xml"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('<?xml version="1.0" encoding="utf-8"?>\n<Defs>\n  ' + "\n  ".join(defs) + "\n</Defs>\n",
+                        encoding="utf-8")
+
+    def close(self):
+        for category in list(self.files):
+            self.flush(category)
+
+    def texture(self, texPath: str, size: Tuple[int, int], margin: int = 0):
+        """A random opaque shape on a transparent background, at least margin pixels from each edge"""
+        path = self.texturesDir / (texPath + ".png")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        img = Image.new("RGBA", size, (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        w, h = size
+        for _ in range(3):
+            x0 = self.rng.randrange(margin, w // 2)
+            y0 = self.rng.randrange(margin, h // 2)
+            x1 = self.rng.randrange(w // 2, w - margin)
+            y1 = self.rng.randrange(h // 2, h - margin)
+            color = tuple(self.rng.randrange(256) for _ in range(3)) + (255,)
+            if self.rng.random() < 0.5:
+                draw.ellipse((x0, y0, x1, y1), fill=color)
+            else:
+                draw.rectangle((x0, y0, x1, y1), fill=color)
+        img.save(path)
+
+
+def sentence(rng: random.Random, n: int) -> str:
+    out = " ".join(rng.choice(words + tokens) for _ in range(n))
+    return out[0].upper() + out[1:] + "."
+
+
+def description(rng: random.Random) -> str:
+    return escape("\\n\\n".join(sentence(rng, rng.randrange(6, 20)) for _ in range(rng.randrange(1, 4))))
+
+
+def element(tag: str, text: str) -> str:
+    return f"<{tag}>{text}</{tag}>"
+
+
+def vec(rng: random.Random, n: int) -> str:
+    return "(" + ", ".join(f"{rng.uniform(-0.2, 0.2):.3f}" for _ in range(n)) + ")"
+
+
+def chainAttrs(name: str, parent: str, abstract: bool) -> str:
+    attrs = ""
+    if name != "":
+        attrs += f' Name="{name}"'
+    if parent != "":
+        attrs += f' ParentName="{parent}"'
+    if abstract:
+        attrs += ' Abstract="True"'
+    return attrs
+
+
+def abstractChain(w: corpusWriter, category: str, tag: str, prefix: str, depth: int, parent: str, body) -> List[str]:
+    """depth abstract Defs, each inheriting from the one before (the first from parent); returns their Names"""
+    names: List[str] = []
+    for level in range(depth):
+        name = f"{prefix}{level}"
+        w.add(category, f"<{tag}{chainAttrs(name, parent, True)}>{body(level)}</{tag}>")
+        names.append(name)
+        parent = name
+    return names
+
+
+def genes(w: corpusWriter, count: int, depth: int, bases: List[str]) -> List[str]:
+    rng = w.rng
+    tagPool = [f"Tag{i}" for i in range(max(8, count // 4))]
+    chains = [abstractChain(w, "Genes", "GeneDef", f"{w.mod}GeneBase{c}_", depth, rng.choice(bases) if bases else "",
+                            lambda level: f"<displayCategory>{rng.choice(categories)}</displayCategory>"
+                            f"<biostatCpx>{rng.randrange(0, 4)}</biostatCpx>"
+                            f"<exclusionTags><li>{rng.choice(tagPool)}</li></exclusionTags>"
+                            f"<statOffsets>{element(rng.choice(stats), f'{rng.uniform(-1, 1):.2f}')}</statOffsets>")
+              for c in range(3)] if depth > 0 else []
+    names: List[str] = []
+    for i in range(count):
+        name = f"{w.mod}Gene{i}"
+        names.append(name)
+        parent = rng.choice(rng.choice(chains)) if chains and rng.random() < 0.7 else ""
+        body = (f"<defName>{name}</defName><label>{rng.choice(words)} {rng.choice(words)}</label>"
+                f"<labelShortAdj>{rng.choice(words)}</labelShortAdj><description>{description(rng)}</description>"
+                f"<iconPath>UI/Icons/Genes/{w.mod}/{name}</iconPath>"
+                f"<displayOrderInCategory>{rng.randrange(1000)}</displayOrderInCategory>"
+                f"<biostatMet>{rng.randrange(-5, 6)}</biostatMet>")
+        if rng.random() < 0.3:
+            body += f"<iconColor>({rng.random():.2f}, {rng.random():.2f}, {rng.random():.2f})</iconColor>"
+        if rng.random() < 0.5:
+            body += "<exclusionTags>" + "".join(f"<li>{rng.choice(tagPool)}</li>" for _ in range(rng.randrange(1, 3))) + "</exclusionTags>"
+        if rng.random() < 0.4:
+            body += "<statFactors>" + "".join(f"<{s}>{rng.uniform(0.5, 2):.2f}</{s}>" for s in rng.sample(stats, 2)) + "</statFactors>"
+        if rng.random() < 0.1:
+            body += f"<damageFactors><Flame>{rng.uniform(0, 4):.1f}</Flame></damageFactors>"
+        if rng.random() < 0.1:
+            body += f"<disabledWorkTags><li>{rng.choice(workTags)}</li></disabledWorkTags>"
+        if rng.random() < 0.05:
+            body += f"<abilities><li>{rng.choice(words).capitalize()}Ability</li></abilities>"
+        if rng.random() < 0.05:
+            body += f"<forcedTraits><li><def>{w.mod}Trait{rng.randrange(count)}</def><degree>{rng.randrange(-1, 2)}</degree></li></forcedTraits>"
+        roll = rng.random()
+        if roll < 0.05:
+            body += (f"<endogeneCategory>Melanin</endogeneCategory><skinColorBase>({rng.random():.2f}, {rng.random():.2f}, {rng.random():.2f})</skinColorBase>"
+                     f"<minMelanin>{rng.random():.2f}</minMelanin>")
+        elif roll < 0.1:
+            body += (f"<endogeneCategory>HairColor</endogeneCategory><hairColorOverride>({rng.randrange(256)}, {rng.randrange(256)}, {rng.randrange(256)})</hairColorOverride>"
+                     f"<selectionWeight>{rng.uniform(0, 2):.2f}</selectionWeight>")
+        elif roll < 0.12:
+            body += f"<skinColorOverride>({rng.random():.2f}, {rng.random():.2f}, {rng.random():.2f})</skinColorOverride>"
+        elif roll < 0.14:
+            body += f"<bodyType>{rng.choice(['Fat', 'Hulk', 'Thin'])}</bodyType>"
+        w.add("Genes", f"<GeneDef{chainAttrs('', parent, False)}>{body}</GeneDef>")
+        w.texture(f"UI/Icons/Genes/{w.mod}/{name}", (128, 128))
+    return names
+
+
+def traits(w: corpusWriter, count: int, depth: int, bases: List[str]) -> List[str]:
+    rng = w.rng
+    chains = abstractChain(w, "Traits", "TraitDef", f"{w.mod}TraitBase", depth, rng.choice(bases) if bases else "",
+                           lambda level: f"<commonality>{rng.uniform(0.2, 2):.2f}</commonality>"
+                           f"<conflictingTraits><li>{w.mod}Trait{rng.randrange(max(count, 1))}</li></conflictingTraits>")
+    names: List[str] = []
+    for i in range(count):
+        name = f"{w.mod}Trait{i}"
+        names.append(name)
+        parent = rng.choice(chains) if chains and rng.random() < 0.5 else ""
+        body = f"<defName>{name}</defName>"
+        if rng.random() < 0.4:
+            body += "<conflictingTraits>" + "".join(f"<li>{w.mod}Trait{rng.randrange(count)}</li>" for _ in range(rng.randrange(1, 3))) + "</conflictingTraits>"
+        if rng.random() < 0.1:
+            body += f"<exclusionTags><li>Exclusion{rng.randrange(5)}</li></exclusionTags>"
+        if rng.random() < 0.1:
+            body += f"<forcedPassions><li>{rng.choice(skills)}</li></forcedPassions>"
+        if rng.random() < 0.1:
+            body += f"<disabledWorkTags>{', '.join(rng.sample(workTags, 2))}</disabledWorkTags>"
+        if rng.random() < 0.05:
+            body += f"<requiredWorkTags><li>{rng.choice(workTags)}</li></requiredWorkTags>"
+        body += "<degreeDatas>"
+        degrees = [0] if rng.random() < 0.6 else rng.choice([[-1, 1], [-2, -1, 1, 2]])
+        for d in degrees:
+            body += (f"<li><label>{rng.choice(words)}</label><description>{description(rng)}</description><degree>{d}</degree>"
+                     f"<skillGains><li><key>{rng.choice(skills)}</key><value>{rng.randrange(-4, 5)}</value></li></skillGains>")
+            if rng.random() < 0.4:
+                body += f"<statOffsets>{element(rng.choice(stats), f'{rng.uniform(-0.5, 0.5):.2f}')}</statOffsets>"
+            if rng.random() < 0.05:
+                body += f"<hungerRateFactor>{rng.uniform(0.5, 2):.1f}</hungerRateFactor>"
+            body += "</li>"
+        body += "</degreeDatas>"
+        w.add("Traits", f"<TraitDef{chainAttrs('', parent, False)}>{body}</TraitDef>")
+    return names
+
+
+def backstories(w: corpusWriter, count: int, depth: int, bases: List[str], traitNames: List[str]) -> List[str]:
+    rng = w.rng
+    chains = abstractChain(w, "Backstories", "BackstoryDef", f"{w.mod}BackstoryBase", depth, rng.choice(bases) if bases else "",
+                           lambda level: f"<skillGains><li><key>{rng.choice(skills)}</key><value>{rng.randrange(1, 4)}</value></li></skillGains>"
+                           + (f"<slot>{rng.choice(['Adulthood', 'Childhood'])}</slot>" if level == 0 else ""))
+    names: List[str] = []
+    for i in range(count):
+        name = f"{w.mod}Backstory{i}"
+        names.append(name)
+        parent = rng.choice(chains) if chains and rng.random() < 0.5 else ""
+        title = f"{rng.choice(words)} {rng.choice(words)}"
+        body = (f"<defName>{name}</defName><title>{title}</title><titleShort>{title.split()[0]}</titleShort>"
+                f"<baseDesc>{description(rng)}</baseDesc><slot>{rng.choice(['Adulthood', 'Childhood'])}</slot>"
+                "<skillGains>" + "".join(f"<li><key>{s}</key><value>{rng.randrange(-3, 6)}</value></li>" for s in rng.sample(skills, rng.randrange(0, 4))) + "</skillGains>")
+        roll = rng.random()
+        if roll < 0.15:
+            body += f"<workDisables>{', '.join(rng.sample(workTags, 2))}</workDisables>"
+        elif roll < 0.25:
+            body += f"<workDisables><li>{rng.choice(workTags)}</li></workDisables>"
+        if rng.random() < 0.1:
+            body += f"<requiredWorkTags>{rng.choice(workTags)}</requiredWorkTags>"
+        if traitNames and rng.random() < 0.05:
+            body += f"<forcedTraits>{element(rng.choice(traitNames), rng.choice(['', '1', '-1']))}</forcedTraits>"
+        w.add("Backstories", f"<BackstoryDef{chainAttrs('', parent, False)}>{body}</BackstoryDef>")
+    return names
+
+
+def bodyparts(w: corpusWriter, counts: Dict[str, int]):
+    rng = w.rng
+    w.add("Bodyparts", f'<HeadTypeDef{chainAttrs(w.mod + "HeadBase", "", True)}><hairMeshSize>(1.5, 1.5)</hairMeshSize><randomChosen>true</randomChosen></HeadTypeDef>')
+    for i in range(counts["HeadTypeDef"]):
+        name = f"{w.mod}Head{i}"
+        w.add("Bodyparts", f'<HeadTypeDef ParentName="{w.mod}HeadBase"><defName>{name}</defName><graphicPath>Things/Pawn/Humanlike/Heads/{w.mod}/{name}</graphicPath>'
+                           f"<gender>{rng.choice(['Male', 'Female'])}</gender><beardOffset>{vec(rng, 3)}</beardOffset>"
+                           f"<beardOffsetXEast>{rng.uniform(-0.1, 0.1):.2f}</beardOffsetXEast><narrow>{rng.choice(['true', 'false'])}</narrow></HeadTypeDef>")
+        w.texture(f"Things/Pawn/Humanlike/Heads/{w.mod}/{name}_south", (128, 128), margin=rng.randrange(0, 30))
+    for tag, folder in (("HairDef", "Hairs"), ("BeardDef", "Beards")):
+        for i in range(counts[tag]):
+            name = f"{w.mod}{folder[:-1]}{i}"
+            body = (f"<defName>{name}</defName><label>{rng.choice(words)}</label><texPath>Things/Pawn/Humanlike/{folder}/{w.mod}/{name}</texPath>"
+                    f"<gender>{rng.choice(['Any', 'MaleUsually', 'FemaleUsually'])}</gender><category>{rng.choice(['Urban', 'Rural', 'Tribal'])}</category>"
+                    "<styleTags>" + "".join(f"<li>{t}</li>" for t in rng.sample(["Urban", "Rural", "Tribal", "Punk", "Soldier"], 2)) + "</styleTags>")
+            if tag == "BeardDef":
+                body += f"<offsetNarrowEast>{vec(rng, 3)}</offsetNarrowEast><offsetNarrowSouth>{vec(rng, 3)}</offsetNarrowSouth>"
+            w.add("Bodyparts", f"<{tag}>{body}</{tag}>")
+            w.texture(f"Things/Pawn/Humanlike/{folder}/{w.mod}/{name}_south", (128, 128), margin=rng.randrange(0, 40))
+
+
+def things(w: corpusWriter, count: int):
+    """Defs no extractor reads, which still have to be parsed past"""
+    rng = w.rng
+    for i in range(count):
+        w.add("Things", f"<ThingDef><defName>{w.mod}Thing{i}</defName><label>{rng.choice(words)}</label><description>{description(rng)}</description>"
+                        "<statBases>" + "".join(f"<{s}>{rng.uniform(0, 10):.1f}</{s}>" for s in rng.sample(stats, 4)) + "</statBases>"
+                        f"<graphicData><texPath>Things/Item/{w.mod}/Thing{i}</texPath><graphicClass>Graphic_Single</graphicClass></graphicData>"
+                        "<comps>" + "".join(f"<li Class=\"CompProperties_{rng.choice(words).capitalize()}\"><value>{rng.randrange(100)}</value></li>" for _ in range(3)) + "</comps>"
+                        "</ThingDef>")
+
+
+def generateCorpus(root: Path, scale: float = 1, mods: int = 0, depth: int = 3, seed: int = 0):
+    """
+    Writes root/Defs and root/Textures with scale times vanilla's Def counts, split between Core and mods mods.
+    Each mod's Defs inherit through chains of depth abstract Defs, whose roots inherit from Core's.
+    """
+    rng = random.Random(seed)
+    total = dict((tag, max(1, round(n * scale))) for tag, n in vanillaCounts.items())
+    packs = ["Core"] + [f"Mod{i:03}" for i in range(mods)]
+    coreBases: Dict[str, List[str]] = {}
+    for p, mod in enumerate(packs):
+        # Core gets the vanilla share, the mods split the rest
+        if mods == 0:
+            share = 1.0
+        elif mod == "Core":
+            share = min(1.0, 1 / scale)
+        else:
+            share = (1 - min(1.0, 1 / scale)) / mods
+        counts = dict((tag, max(1, round(n * share))) for tag, n in total.items())
+        w = corpusWriter(root, mod, rng)
+        genes(w, counts["GeneDef"], depth, coreBases.get("Gene", []))
+        traitNames = traits(w, counts["TraitDef"], depth, coreBases.get("Trait", []))
+        backstories(w, counts["BackstoryDef"], depth, coreBases.get("Backstory", []), traitNames)
+        bodyparts(w, counts)
+        things(w, counts["ThingDef"])
+        if mod == "Core":
+            # The aptitude and drug genes the extractor adds use vanilla's icons
+            for g in additionalGenes():
+                w.texture(g["iconPath"], (128, 128))
+            coreBases = dict((kind, [f"CoreGeneBase{c}_{depth - 1}" for c in range(3)] if kind == "Gene" else [f"Core{kind}Base{depth - 1}"])
+                             for kind in ("Gene", "Trait", "Backstory")) if depth > 0 else {}
+        w.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generates a synthetic Defs/Textures tree")
+    parser.add_argument("directory")
+    parser.add_argument("--scale", type=float, default=1, help="multiple of vanilla's Def counts")
+    parser.add_argument("--mods", type=int, default=0, help="number of mods to split the Defs past vanilla's between")
+    parser.add_argument("--depth", type=int, default=3, help="length of each ParentName chain")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    generateCorpus(Path(args.directory), args.scale, args.mods, args.depth, args.seed)
@@ -0,0 +1,329 @@
+# Shared Def extraction engine used by all the extractor scripts
+# Walks a Defs directory once, parses each file once and hands every top-level Def to the extractors registered for it
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from xml.etree import ElementTree as ET
+import argparse
+import atexit
+import bundle
+import cache
+import chunks
+import patches
+import profiling
+import strings
+from cache import buildCache
+from inheritance import inheritanceResolver
+
+
+class extractor:
+    """
+    Base class for a script's extractor.
+    name: identifies this extractor's records
+    tags: the Def element names (e.g. "GeneDef") this extractor wants
+    exclude: file names whose Defs this extractor ignores
+    """
+    name: str = ""
+    tags: List[str] = []
+    exclude: List[str] = []
+
+    def extract(self, bdef: ET.Element) -> Optional[Tuple[str, dict]]:
+        """Converts a concrete, inheritance-resolved Def into a (group, record) pair, or None to skip it"""
+        raise NotImplementedError
+
+    def write(self, records: Dict[str, List[dict]]):
+        """Writes the output files. records maps each group returned by extract to its records in file order"""
+        raise NotImplementedError
+
+
+def isAbstract(bdef: ET.Element) -> bool:
+    return bdef.get("Abstract", "").strip().lower() == "true"
+
+
+def findXmlFiles(directory: str) -> Tuple[List[Path], List[Path]]:
+    """
+    The Def files and the patch files under directory (translations in Languages folders are neither),
+    leaving out those of mods --load-order doesn't have
+    """
+    defFiles: List[Path] = []
+    patchFiles: List[Path] = []
+    for filePath in Path(directory).rglob("*.[xX][mM][lL]"):
+        if strings.isLanguageFile(directory, filePath):
+            continue
+        (patchFiles if patches.isPatchFile(directory, filePath) else defFiles).append(filePath)
+    if patches.loadOrder is not None:
+        mods = patches.findMods(directory)
+        return patches.activeFiles(directory, defFiles, mods), patches.activeFiles(directory, patchFiles, mods)
+    return defFiles, patchFiles
+
+
+def findDefFiles(directory: str) -> List[Path]:
+    return findXmlFiles(directory)[0]
+
+
+def iterDefs(filePath: Path) -> Iterator[ET.Element]:
+    """
+    Streams the top-level Def elements of a file one at a time.
+    Each Def is detached from the document once the caller asks for the next one,
+    so it is freed as soon as the caller stops referencing it and memory doesn't grow with file size.
+    """
+    root: Optional[ET.Element] = None
+    depth = 0
+    for event, elem in profiling.timed("parse", ET.iterparse(filePath, events=("start", "end"))):
+        if event == "start":
+            if root is None:
+                root = elem
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1:
+            profiling.count("defs")
+            yield elem
+            root.clear()
+
+
+def buildHandlers(extractors: List[extractor]) -> Dict[str, List[extractor]]:
+    handlers: Dict[str, List[extractor]] = {}
+    for e in extractors:
+        for tag in e.tags:
+            handlers.setdefault(tag, []).append(e)
+    return handlers
+
+
+def readDefFile(filePath: Path, handlers: Dict[str, List[extractor]], resolver: inheritanceResolver) -> Iterator[tuple]:
+    """
+    Reads one file as events in document order:
+    ("parent", (tag, Name), bdef): a Def other Defs may inherit from, which is also added to resolver
+    ("pending", extractor names, bdef): a Def with an ancestor resolver doesn't have yet
+    ("record", extractor name, entry): what that extractor's extract returned
+    """
+    for bdef in iterDefs(filePath):
+        if bdef.tag not in handlers:
+            continue
+        if "Name" in bdef.attrib:
+            resolver.add(bdef)
+            yield ("parent", (bdef.tag, bdef.attrib["Name"]), bdef)
+        if isAbstract(bdef):
+            continue
+        wanted = [e for e in handlers[bdef.tag] if filePath.name not in e.exclude]
+        with profiling.phase("inherit"):
+            resolvable = resolver.canResolve(bdef)
+            if resolvable:
+                bdef = resolver.resolve(bdef)
+        if not resolvable:
+            yield ("pending", [e.name for e in wanted], bdef)
+            continue
+        for e in wanted:
+            with profiling.phase("extract"):
+                record = e.extract(bdef)
+            yield ("record", e.name, record)
+
+
+_workerHandlers: Dict[str, List[extractor]] = {}
+
+
+def _initWorker(extractors: List[extractor]):
+    global _workerHandlers
+    _workerHandlers = buildHandlers(extractors)
+    # Forked workers would otherwise keep profiling into their own copy of the report
+    profiling.enabled = False
+
+
+def readDefFileCompact(filePath: Path, handlers: Dict[str, List[extractor]]) -> List[tuple]:
+    """
+    readDefFile on its own, for the process pool and the build cache.
+    Parents only come from the same file, and elements are kept as XML text.
+    """
+    events: List[tuple] = []
+    for kind, key, value in readDefFile(filePath, handlers, inheritanceResolver()):
+        if kind != "record":
+            with profiling.phase("cache"):
+                value = ET.tostring(value)
+        events.append((kind, key, value))
+    return events
+
+
+def _readDefFileWorker(filePath: Path) -> List[tuple]:
+    return readDefFileCompact(filePath, _workerHandlers)
+
+
+def readPatched(directory: str, files: List[Path], patchFiles: List[Path], handlers: Dict[str, List[extractor]]) -> patches.defDocument:
+    """Reads every Def into one document and applies the patches to it"""
+    document = patches.defDocument(handlers, patches.patchedTags(patchFiles))
+    for filePath in files:
+        for bdef in iterDefs(filePath):
+            document.add(bdef, filePath.name)
+    with profiling.phase("patch"):
+        patches.applyPatches(document, directory, patchFiles)
+    return document
+
+
+def runExtractors(directory: str, extractors: List[extractor], jobs: int = 1):
+    """
+    Reads every Def file under directory once and runs each extractor's extract and write.
+    With jobs > 1 files are parsed and extracted across a process pool; the results are merged in file order,
+    so the output is identical to a serial run.
+    Unless the cache is disabled, each file's events are kept in the build cache and only changed files are read again.
+    If there are patch files, every Def is read into one document and patched first instead, without the cache or pool.
+    """
+    handlers = buildHandlers(extractors)
+    byName: Dict[str, extractor] = {e.name: e for e in extractors}
+
+    # Named Defs are the only elements kept for the whole run
+    resolver = inheritanceResolver()
+    # Defs with an ancestor that hasn't been read yet wait here until every file has been read,
+    # so parents may come from any file
+    pending: List[ET.Element] = []
+    entries: Dict[str, List[Union[Tuple[str, dict], ET.Element, None]]] = {
+        e.name: [] for e in extractors}
+
+    def merge(events: Iterable[tuple]):
+        for kind, key, value in events:
+            if kind == "record":
+                entries[key].append(value)
+                continue
+            if isinstance(value, bytes):
+                with profiling.phase("cache"):
+                    value = ET.fromstring(value)
+            if kind == "parent":
+                resolver.add(value)
+                continue
+            with profiling.phase("inherit"):
+                resolvable = resolver.canResolve(value)
+                if resolvable:
+                    value = resolver.resolve(value)
+            if resolvable:
+                for name in key:
+                    with profiling.phase("extract"):
+                        entries[name].append(byName[name].extract(value))
+            else:
+                pending.append(value)
+                for name in key:
+                    entries[name].append(value)
+
+    with profiling.phase("discovery"):
+        files, patchFiles = findXmlFiles(directory)
+    profiling.count("files", len(files))
+    profiling.count("patchFiles", len(patchFiles))
+    defCache: Optional[buildCache] = None
+    if cache.enabled and len(patchFiles) == 0:
+        with profiling.phase("cache"):
+            defCache = buildCache("defs-" + "-".join(sorted(byName)),
+                                  repr([(e.name, e.tags, e.exclude) for e in extractors]))
+    if len(patchFiles) > 0:
+        # A patch can change any Def, so nothing is resolved or extracted until every patch has run
+        document = readPatched(directory, files, patchFiles, handlers)
+        for bdef, fileName in document.defs():
+            if bdef.tag not in handlers:
+                continue
+            if "Name" in bdef.attrib:
+                resolver.add(bdef)
+            if isAbstract(bdef):
+                continue
+            pending.append(bdef)
+            for e in handlers[bdef.tag]:
+                if fileName not in e.exclude:
+                    entries[e.name].append(bdef)
+    elif defCache is None and jobs <= 1:
+        for filePath in files:
+            merge(readDefFile(filePath, handlers, resolver))
+    else:
+        results: Dict[Path, List[tuple]] = {}
+        stale: List[Path] = []
+        with profiling.phase("cache"):
+            for filePath in files:
+                hit, events = defCache.lookup(filePath) if defCache is not None else (False, None)
+                if hit:
+                    results[filePath] = events
+                else:
+                    stale.append(filePath)
+        profiling.count("filesCached", len(files) - len(stale))
+        if jobs > 1 and len(stale) > 1:
+            # Parsing, inheritance and extraction all happen in the workers, so they're timed together
+            with profiling.phase("parse"), ProcessPoolExecutor(jobs, initializer=_initWorker, initargs=(extractors,)) as pool:
+                chunksize = max(1, len(stale) // (jobs * 4))
+                for filePath, events in zip(stale, pool.map(_readDefFileWorker, stale, chunksize=chunksize)):
+                    results[filePath] = events
+        else:
+            for filePath in stale:
+                results[filePath] = readDefFileCompact(filePath, handlers)
+        if defCache is not None:
+            with profiling.phase("cache"):
+                for filePath in stale:
+                    defCache.store(filePath, results[filePath])
+                defCache.save()
+        for filePath in files:
+            merge(results[filePath])
+
+    resolved: Dict[int, ET.Element] = {}
+    with profiling.phase("inherit"):
+        for bdef in pending:
+            resolved[id(bdef)] = resolver.resolve(bdef)
+
+    for e in extractors:
+        records: Dict[str, List[dict]] = {}
+        for entry in entries[e.name]:
+            if isinstance(entry, ET.Element):
+                with profiling.phase("extract"):
+                    entry = e.extract(resolved[id(entry)])
+            if entry is not None:
+                profiling.count("records")
+                records.setdefault(entry[0], []).append(entry[1])
+        # Indexing and serializing the outputs; graphics and file writes are timed as their own phases
+        with profiling.phase("serialize"):
+            e.write(records)
+
+
+def parseArgs(graphics: bool = False, watch: bool = False, link: bool = False) -> argparse.Namespace:
+    """
+    Command line shared by the extractor scripts. Directories not given as arguments are asked for
+    watch: also take --watch and --interval, for scripts that can keep running and regenerate on changes
+    link: also take --link, for scripts that write every output the link stage (link.py) reads
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("directory", nargs="?")
+    if graphics:
+        parser.add_argument("graphicsDir", nargs="?")
+    if watch:
+        parser.add_argument("--watch", action="store_true",
+                            help="keep the Defs and textures in memory and regenerate the outputs whenever they change")
+        parser.add_argument("--interval", type=float, default=0.25,
+                            help="with --watch, seconds between checks for changes")
+    if link:
+        parser.add_argument("--link", action="store_true",
+                            help="also link the outputs' references as integer ids (data/linked.ts, docs/linked.json)")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="number of processes to parse Def files with")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"rebuild everything instead of reusing results in {cache.cacheDir}")
+    parser.add_argument("--load-order", metavar="MODSCONFIG",
+                        help="RimWorld's ModsConfig.xml, to run mods' patches in its order rather than by path")
+    parser.add_argument("--languages", nargs="+", default=[], metavar="DIR",
+                        help="more directories with Languages folders to read translations from (e.g. the game's Data folder)")
+    parser.add_argument("--bundle", action="store_true",
+                        help="also write compact binary bundles (docs/*.bin, data/*.bundle.ts)")
+    parser.add_argument("--chunks", action="store_true",
+                        help="also write the outputs split into chunks with a manifest, to load on demand (docs/chunks/)")
+    if graphics:
+        parser.add_argument("--tint-icons", action="store_true",
+                            help="bake each icon's colour into the atlas instead of leaving it for the frontend to apply")
+        parser.add_argument("--atlas-variants", action="store_true",
+                            help="also save the atlases at half size and as palette png and webp, with a manifest (much slower)")
+    parser.add_argument("--profile", nargs="?", const=str(profiling.reportPath), metavar="REPORT",
+                        help=f"write per-phase timings, counts and peak memory as JSON (default {profiling.reportPath})")
+    parser.add_argument("--profile-dump", metavar="FILE",
+                        help="with --profile, also run each phase under cProfile and dump the slowest one's stats to FILE")
+    args = parser.parse_args()
+    cache.enabled = not args.no_cache
+    bundle.enabled = args.bundle
+    chunks.enabled = args.chunks
+    patches.loadOrder = args.load_order
+    if args.profile is not None:
+        profiling.start(args.profile, args.profile_dump)
+        atexit.register(profiling.writeReport)
+    if args.directory is None:
+        args.directory = input("Directory: ").strip('" \n\t')
+    strings.languageDirs = [args.directory] + args.languages
+    if graphics and args.graphicsDir is None:
+        args.graphicsDir = input("Graphics Directory: ").strip('" \n\t')
+    return args
@@ -2,47 +2,527 @@
 # Use https://www.dropbox.com/sh/mz6zjq3f1d654f3/AAAQq0_J_RtsOYlP0XSgxzqha/Game%20art%20source
 # And un-zip everything
 from pathlib import Path
-from typing import List, Dict, Tuple
-from PIL import Image
+from typing import List, Dict, Optional, Set, Tuple
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageChops
+import hashlib
+import json
 import math
+import cache
+import profiling
+from cache import buildCache, readCached, writeCached, writeIfChanged
+import os
+import sys
 
-def loadGraphics(directory: str, tileSize: Tuple[int, int], fileStrs: List[str], saveFile: str):
+_textureIndexes: Dict[str, Dict[str, Path]] = {}
+
+# Turned on by watch mode: decoded textures and pages are kept in memory between loadGraphics calls
+keepResident = False
+# saveFile -> {"tiles": texture path -> (file, (mtime, size), tile, box), "layout", "pages", "encoded"}
+_resident: Dict[str, dict] = {}
+
+RGBA = Tuple[int, int, int, int]
+
+
+def textureIndex(directory: str) -> Dict[str, Path]:
     """
-    Assumes file format is png
-    fileStrs: a list in the format e.g. "UI/Icons/Genes/Gene_Something"
+    Case-insensitive index of every png under directory, keyed by each trailing part of its path without the extension
+    (e.g. "ui/icons/genes/gene_something"), so a texture path matches whichever folder the art was unpacked into.
+    Built with one walk per directory and shared by every later call in the process.
     """
-    fileStrs.sort()
+    root = Path(directory).resolve()
+    if str(root) not in _textureIndexes:
+        index: Dict[str, Path] = {}
+        for dirPath, _, fileNames in os.walk(root):
+            dirParts = Path(dirPath).relative_to(root).parts
+            for fileName in fileNames:
+                stem, ext = os.path.splitext(fileName)
+                if ext.lower() != ".png":
+                    continue
+                parts = dirParts + (stem,)
+                # Like the old rglob("*/{f}.png"), at least one folder has to come before the texture path
+                for i in range(1, len(parts)):
+                    index.setdefault("/".join(parts[i:]).lower(), Path(dirPath, fileName))
+        _textureIndexes[str(root)] = index
+    return _textureIndexes[str(root)]
+
+
+def forgetTextures():
+    """Drops the texture indexes, so textures added or moved since they were built are found"""
+    _textureIndexes.clear()
+
+
+def findTextures(directory: str, fileStrs: List[str], known: Optional[Dict[str, str]] = None) -> Dict[str, Path]:
+    """
+    Finds the png for each texture path, trying the paths in known (e.g. from a previous run) first.
+    Textures that can't be found are left out and reported together.
+    """
+    if known is None:
+        known = {}
     files: Dict[str, Path] = {}
-    for f in fileStrs:
-        p = next(Path(directory).resolve().rglob(f"*/{f}.[pP][nN][gG]"), None)
-        if p is not None:
-            files[f] = p
-
-    def approxFactor(num: int) -> Tuple[int, int]:
-        """Returns two values that are (badly) minimized but when multiplied together are greater than num"""
-        # Start at about sqrt
-        sqrt = math.sqrt(num)
-        if math.ceil(sqrt) * math.floor(sqrt) >= num:
-            return (math.ceil(sqrt), math.floor(sqrt))
-        else:
-            return (math.ceil(sqrt), math.ceil(sqrt))
+    missing: List[str] = []
+    with profiling.phase("textures"):
+        for f in fileStrs:
+            p = Path(known[f]) if f in known else None
+            if p is None or not p.is_file():
+                p = textureIndex(directory).get(f.lower())
+            if p is not None:
+                files[f] = p
+            else:
+                missing.append(f)
+    profiling.count("textures", len(files))
+    profiling.count("texturesMissing", len(missing))
+    if len(missing) > 0:
+        print(f"{len(missing)} textures not found in {directory}:\n  " +
+              "\n  ".join(missing), file=sys.stderr)
+    return files
+
+
+def _tintColor(color: dict) -> RGBA:
+    return (int(color["R"]), int(color["G"]), int(color["B"]), round(255 * color.get("A", 1.0)))
+
+
+def tintKey(fileStr: str, color: dict) -> str:
+    """
+    The key to ask loadGraphics for a texture multiplied by color ({"R", "G", "B", "A"}, as parseColor reads them),
+    e.g. "UI/Icons/Genes/Gene_HairColor#f2ede0ff". Each texture and colour is only packed once, however many ask for it
+    """
+    return f"{fileStr}#" + "".join(f"{c:02x}" for c in _tintColor(color))
+
+
+def splitTintKey(key: str) -> Tuple[str, Optional[RGBA]]:
+    """The texture path and tint of a key from tintKey (None for a plain texture path)"""
+    fileStr, _, tint = key.partition("#")
+    if tint == "":
+        return fileStr, None
+    return fileStr, tuple(int(tint[i:i + 2], 16) for i in range(0, 8, 2))
+
+
+def pixelDigest(tile: Image.Image) -> str:
+    """A hash of an RGBA image's size and pixels, so identical textures can share one sprite"""
+    return hashlib.sha1(f"{tile.width}x{tile.height}:".encode("ascii") + tile.tobytes()).hexdigest()
+
+
+def tintedDigest(digest: str, tint: Optional[RGBA]) -> str:
+    """The pixelDigest a texture with digest has once tinted (a white tint changes nothing)"""
+    if tint is None or tint == (255, 255, 255, 255):
+        return digest
+    return hashlib.sha1(f"{digest}#{bytes(tint).hex()}".encode("ascii")).hexdigest()
+
+
+def readTile(filePath: Path, tileSize: Optional[Tuple[int, int]], trim: bool, tint: Optional[RGBA] = None) -> Tuple[Image.Image, Tuple[int, int, int, int], str]:
+    """
+    Decodes a texture, tinted if asked, and finds the box of it to keep and the pixelDigest of the untinted texture.
+    Safe to run on several threads at once
+    """
+    tile = Image.open(filePath).convert("RGBA")
+    digest = pixelDigest(tile)
+    if tint is not None:
+        # Every channel times the tint's, over the whole pixel array at once
+        tile = ImageChops.multiply(tile, Image.new("RGBA", tile.size, tint))
+    if tileSize is not None:
+        assert tile.width == tileSize[0], f"{filePath} is not {tileSize[0]} wide"
+        assert tile.height == tileSize[1], f"{filePath} is not {tileSize[1]} high"
+    box = (0, 0, tile.width, tile.height)
+    if trim:
+        # A fully transparent texture still takes a single pixel
+        box = tile.getchannel("A").getbbox() or (0, 0, 1, 1)
+    return tile, box, digest
+
+
+def packRects(rects: List[Tuple[str, int, int]], maxSize: int) -> Tuple[Dict[str, Tuple[int, int, int]], List[Tuple[int, int]]]:
+    """
+    Skyline bottom-left bin packing of (key, width, height) rectangles, tallest first.
+    Pages are at most maxSize on each side, and a new page is only started when a rectangle fits on no earlier one.
+    Returns key -> (page, x, y) and the used (width, height) of each page.
+    """
+    totalArea = sum(w * h for _, w, h in rects)
+    widest = max((w for _, w, _ in rects), default=1)
+    # Aim for square pages
+    pageWidth = min(maxSize, max(widest, math.ceil(math.sqrt(totalArea))))
+
+    def fit(skyline: List[List[int]], i: int, w: int, h: int) -> Optional[int]:
+        """The y a rectangle would sit at with its left edge on segment i, or None if it doesn't fit there"""
+        x = skyline[i][0]
+        if x + w > pageWidth:
+            return None
+        y = 0
+        remaining = w
+        while remaining > 0:
+            y = max(y, skyline[i][1])
+            remaining -= skyline[i][2]
+            i += 1
+        return None if y + h > maxSize else y
+
+    def place(skyline: List[List[int]], x: int, y: int, w: int, h: int) -> List[List[int]]:
+        newSkyline = [[x, y + h, w]]
+        for sx, sy, sw in skyline:
+            if sx + sw <= x or sx >= x + w:
+                newSkyline.append([sx, sy, sw])
+                continue
+            if sx < x:
+                newSkyline.append([sx, sy, x - sx])
+            if sx + sw > x + w:
+                newSkyline.append([x + w, sy, sx + sw - x - w])
+        newSkyline.sort()
+        merged = [newSkyline[0]]
+        for seg in newSkyline[1:]:
+            if seg[1] == merged[-1][1]:
+                merged[-1][2] += seg[2]
+            else:
+                merged.append(seg)
+        return merged
+
+    skylines: List[List[List[int]]] = []
+    pageSizes: List[List[int]] = []
+    placements: Dict[str, Tuple[int, int, int]] = {}
+    for key, w, h in sorted(rects, key=lambda r: (-r[2], -r[1], r[0])):
+        assert w <= maxSize and h <= maxSize, f"{key} is larger than the maximum atlas size {maxSize}"
+        for page in range(len(skylines) + 1):
+            if page == len(skylines):
+                skylines.append([[0, 0, pageWidth]])
+                pageSizes.append([0, 0])
+            best: Optional[Tuple[int, int, int]] = None
+            for i in range(len(skylines[page])):
+                y = fit(skylines[page], i, w, h)
+                if y is not None and (best is None or (y + h, skylines[page][i][0]) < best[:2]):
+                    best = (y + h, skylines[page][i][0], y)
+            if best is not None:
+                _, x, y = best
+                skylines[page] = place(skylines[page], x, y, w, h)
+                pageSizes[page] = [max(pageSizes[page][0], x + w), max(pageSizes[page][1], y + h)]
+                placements[key] = (page, x, y)
+                break
+    return placements, [(w, h) for w, h in pageSizes]
+
+
+def pageName(saveFile: str, page: int) -> str:
+    """The file atlas page number page is saved as, e.g. genes.png, genes_1.png, ..."""
+    if page == 0:
+        return saveFile
+    stem, ext = os.path.splitext(saveFile)
+    return f"{stem}_{page}{ext}"
+
+
+def variantName(fileName: str, scale: int, kind: str) -> str:
+    """
+    The file an encoded variant of an atlas page is saved as, e.g. for genes.png:
+    kind "png" genes.png, "png8" genes.q.png, "webp" genes.webp; scale 2 gives genes@0.5x.png etc.
+    """
+    stem, _ = os.path.splitext(fileName)
+    if scale != 1:
+        stem += f"@{1 / scale:g}x"
+    return stem + {"png": ".png", "png8": ".q.png", "webp": ".webp"}[kind]
+
+
+def scaleSprite(sprite: dict, scale: int) -> dict:
+    """A sprite's coordinates on its page shrunk by scale. Positions are exact since they are aligned; sizes round up"""
+    scaled = dict(sprite)
+    for key in ("x", "y", "trimX", "trimY"):
+        if key in scaled:
+            scaled[key] //= scale
+    for key in ("w", "h", "sourceW", "sourceH"):
+        if key in scaled:
+            scaled[key] = -(-scaled[key] // scale)
+    return scaled
+
 
+def encodePage(img: Image.Image, kind: str, smallest: bool = True) -> bytes:
+    """
+    Encodes an atlas page for its kind: lossless png, 256 colour palette png or lossless webp.
+    smallest: try several png encoder settings and keep the smallest, instead of encoding once with the defaults
+    """
+    with profiling.phase("encode"):
+        return _encodePage(img, kind, smallest)
+
+
+def _encodePage(img: Image.Image, kind: str, smallest: bool) -> bytes:
+    if kind == "webp":
+        buffer = BytesIO()
+        img.save(buffer, "WEBP", lossless=True, quality=100, method=6)
+        return buffer.getvalue()
+    if kind == "png8":
+        img = img.quantize(256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+    # Neither zlib's best level nor Pillow's optimize always wins, so keep whichever is smallest
+    best: Optional[bytes] = None
+    for options in ({}, {"compress_level": 9}, {"optimize": True}) if smallest else ({},):
+        buffer = BytesIO()
+        img.save(buffer, "PNG", **options)
+        if best is None or len(buffer.getvalue()) < len(best):
+            best = buffer.getvalue()
+    return best
+
+
+class textureSet:
+    """
+    The textures an atlas is packed from: the file each is read from and its tint, and once read, its size and the
+    decoded images of those that had to be decoded
+    """
+
+    def __init__(self, directory: str, fileStrs: List[str], tileSize: Optional[Tuple[int, int]], trim: bool, known: Dict[str, str]):
+        self.tileSize = tileSize
+        self.trim = trim
+        # Tinted copies are read from the same file as their texture
+        self.split = dict((s, splitTintKey(s)) for s in fileStrs)
+        found = findTextures(directory, sorted(set(fileStr for fileStr, _ in self.split.values())), known)
+        self.files = dict((s, found[fileStr]) for s, (fileStr, _) in self.split.items() if fileStr in found)
+        # (width, height, box of the part that is kept, pixelDigest untinted) for every texture
+        self.sizes: Dict[str, Tuple[int, int, Tuple[int, int, int, int], str]] = {}
+        # Decoded textures, the box of each that is kept and their pixelDigest untinted
+        self.decoded: Dict[str, Tuple[Image.Image, Tuple[int, int, int, int], str]] = {}
+
+    def decode(self, names: List[str]):
+        """Decodes textures on a thread pool; Pillow releases the GIL while inflating and converting them"""
+        todo = [s for s in names if s not in self.decoded]
+        if len(todo) == 0:
+            return
+        profiling.count("texturesDecoded", len(todo))
+        with profiling.phase("decode"), ThreadPoolExecutor() as pool:
+            for s, result in zip(todo, pool.map(lambda s: readTile(self.files[s], self.tileSize, self.trim, self.split[s][1]), todo)):
+                self.decoded[s] = result
+
+
+def readTiles(tiles: textureSet, textures: Optional[buildCache], resident: Optional[dict]) -> Set[str]:
+    """
+    Finds every texture's size, from the resident tiles or the build cache where its file hasn't changed, and decodes the rest.
+    Returns the textures that changed since the last run
+    """
+    previousPaths: Dict[str, str] = textures.data.get("paths", {}) if textures is not None else {}
+    stale: Set[str] = set()
+    for s, path in tiles.files.items():
+        if resident is not None and s in resident["tiles"]:
+            residentPath, stamp, tile, box, digest = resident["tiles"][s]
+            st = path.stat()
+            if residentPath == str(path) and stamp == (st.st_mtime_ns, st.st_size):
+                tiles.decoded[s] = (tile, box, digest)
+                tiles.sizes[s] = (tile.width, tile.height, box, digest)
+                continue
+        if textures is not None:
+            hit, size = textures.lookup(path)
+            if hit and previousPaths.get(tiles.split[s][0]) == str(path):
+                tiles.sizes[s] = size
+                continue
+        stale.add(s)
+    tiles.decode(sorted(stale))
+    for s in stale:
+        tile, box, digest = tiles.decoded[s]
+        tiles.sizes[s] = (tile.width, tile.height, box, digest)
+        if textures is not None:
+            textures.store(tiles.files[s], tiles.sizes[s])
+    return stale
+
+
+def shareCells(tiles: textureSet) -> Dict[str, str]:
+    """The texture whose cell each texture is drawn from: the first with the same pixels once tinted"""
+    cells: Dict[str, str] = {}
+    firstWith: Dict[str, str] = {}
+    for s in tiles.files:
+        cells[s] = firstWith.setdefault(tintedDigest(tiles.sizes[s][3], tiles.split[s][1]), s)
+    profiling.count("texturesShared", len(tiles.files) - len(firstWith))
+    return cells
+
+
+def packSprites(tiles: textureSet, cells: Dict[str, str], scales: Tuple[int, ...], maxSize: int) -> Tuple[Dict[str, dict], List[Tuple[int, int]], Dict[str, Tuple[int, int, int, int]]]:
+    """
+    Packs each cell into the pages and returns every texture's sprite, the size of each page and the box of each texture
+    that is pasted. Every box and position is a multiple of each scale, so each downscale lines up with whole pixels
+    """
+    align = math.lcm(*scales)
+
+    def alignedBox(s: str) -> Tuple[int, int, int, int]:
+        width, height, (left, top, right, bottom), _ = tiles.sizes[s]
+        return (left - left % align, top - top % align,
+                min(width, -(-right // align) * align), min(height, -(-bottom // align) * align))
+
+    boxes = dict((s, alignedBox(s)) for s in tiles.files)
+    placements, pageSizes = packRects(
+        [(s, -(-(box[2] - box[0]) // align) * align, -(-(box[3] - box[1]) // align) * align)
+         for s, box in boxes.items() if cells[s] == s], maxSize)
     graphicsData: Dict[str, dict] = {}
+    for s in tiles.files:
+        page, x, y = placements[cells[s]]
+        width, height, _, _ = tiles.sizes[s]
+        box = boxes[s]
+        graphicsData[s] = {"page": page, "x": x, "y": y, "w": box[2] - box[0], "h": box[3] - box[1]}
+        if tiles.trim:
+            graphicsData[s].update({"trimX": box[0], "trimY": box[1], "sourceW": width, "sourceH": height})
+        if tiles.split[s][1] is not None:
+            graphicsData[s]["tinted"] = True
+    return graphicsData, pageSizes, boxes
+
+
+def previousPages(saveFile: str, layout: tuple, resident: Optional[dict], textures: Optional[buildCache]) -> Tuple[List[Optional[bytes]], Optional[List[Image.Image]], Set[str]]:
+    """
+    The encoded pages of the previous run if nothing moved since (all None otherwise), its decoded pages if they are
+    resident, and the shrunk files it left out for being bigger than the full size ones
+    """
+    pageCount = len(layout[1])
+    previous: List[Optional[bytes]] = [None] * pageCount
+    residentPages: Optional[List[Image.Image]] = None
+    if resident is not None and resident.get("layout") == layout:
+        previous = resident["encoded"]
+        residentPages = resident["pages"]
+    elif textures is not None and textures.data.get("layout") == layout:
+        previous = [readCached(pageName(saveFile, page)) for page in range(pageCount)]
+    if None in previous:
+        return [None] * pageCount, None, set()
+    if residentPages is not None:
+        return previous, residentPages, set(resident.get("skipped", []))
+    if len(previous) > 0:
+        return previous, None, set(textures.data.get("skipped", []))
+    return previous, None, set()
+
+
+def drawPages(tiles: textureSet, cells: Dict[str, str], boxes: Dict[str, Tuple[int, int, int, int]], graphicsData: Dict[str, dict],
+              pageSizes: List[Tuple[int, int]], previous: List[Optional[bytes]], residentPages: Optional[List[Image.Image]],
+              stale: Set[str]) -> Tuple[List[Image.Image], Set[int]]:
+    """Starts from the previous pages (or blank ones) and pastes the stale cells in. Returns the pages and which changed"""
+    tiles.decode(sorted(stale))
+    pages: List[Image.Image] = []
+    changedPages: Set[int] = set()
+    with profiling.phase("composite"):
+        for page in range(len(pageSizes)):
+            if residentPages is not None:
+                img = residentPages[page]
+            elif previous[page] is not None:
+                img = Image.open(BytesIO(previous[page]))
+                img.load()
+            else:
+                img = Image.new("RGBA", pageSizes[page], (0, 0, 0, 0))
+            pages.append(img)
+        for s in sorted(stale):
+            if cells[s] != s:
+                continue
+            sprite = graphicsData[s]
+            pages[sprite["page"]].paste(tiles.decoded[s][0].crop(boxes[s]), (sprite["x"], sprite["y"]))
+            changedPages.add(sprite["page"])
+    return pages, changedPages
+
+
+def writePages(saveFile: str, pages: List[Image.Image], previous: List[Optional[bytes]], changedPages: Set[int], scales: Tuple[int, ...],
+               kinds: List[str], skipped: Set[str], smallest: bool, cached: bool) -> List[bytes]:
+    """
+    Encodes and saves the changed pages and each of their scales and kinds, updating skipped with the shrunk files that
+    would be bigger than the full size ones. Returns each page encoded as png
+    """
+    encoded: List[bytes] = []
+    for page in range(len(pages)):
+        name = pageName(saveFile, page)
+        content = previous[page]
+        if content is None or page in changedPages:
+            content = encodePage(pages[page], "png", smallest)
+        encoded.append(content)
+        writeIfChanged(Path(f"./docs/{name}").resolve(), content)
+        if cached:
+            writeCached(name, content)
+        unchanged = content is previous[page]
+        for scale in scales:
+            names = [variantName(name, scale, kind) for kind in kinds if (scale, kind) != (1, "png")]
+            if unchanged and all(n in skipped or Path(f"./docs/{n}").resolve().is_file() for n in names):
+                continue
+            # Premultiplied alpha keeps the colour of transparent pixels from bleeding into the edges
+            with profiling.phase("composite"):
+                img = pages[page] if scale == 1 else pages[page].convert(
+                    "RGBa").reduce(scale).convert("RGBA")
+            for kind in kinds:
+                if (scale, kind) == (1, "png"):
+                    continue
+                variant = variantName(name, scale, kind)
+                content = encodePage(img, kind, smallest)
+                skipped.discard(variant)
+                if scale != 1 and len(content) >= Path(f"./docs/{variantName(name, 1, kind)}").resolve().stat().st_size:
+                    skipped.add(variant)
+                    Path(f"./docs/{variant}").resolve().unlink(missing_ok=True)
+                else:
+                    writeIfChanged(Path(f"./docs/{variant}").resolve(), content)
+    return encoded
+
+
+def writeManifest(saveFile: str, layout: tuple, skipped: Set[str]):
+    """Saves e.g. genes.atlas.json, listing every page's files and each scale's sprites"""
+    graphicsData, pageSizes, scales, kinds = layout
+    manifest = {"scales": []}
+    for scale in scales:
+        manifest["scales"].append({
+            "scale": 1 / scale,
+            "pages": [dict([("w", w // scale), ("h", h // scale)] + [(kind, variantName(pageName(saveFile, page), scale, kind)) for kind in kinds
+                                                                     if variantName(pageName(saveFile, page), scale, kind) not in skipped])
+                      for page, (w, h) in enumerate(pageSizes)],
+            "sprites": dict((s, scaleSprite(sprite, scale)) for s, sprite in graphicsData.items())
+        })
+    writeIfChanged(Path(f"./docs/{os.path.splitext(saveFile)[0]}.atlas.json").resolve(),
+                   json.dumps(manifest, separators=(",", ":")))
+
+
+def removeOldFiles(saveFile: str, oldLayout: tuple, layout: tuple):
+    """Removes pages left over from a previous run that needed more of them, or saved more scales and kinds"""
+    _, oldPageSizes, oldScales, oldKinds = oldLayout
+    _, pageSizes, scales, kinds = layout
+    for page in range(len(oldPageSizes)):
+        for scale in oldScales:
+            for kind in oldKinds:
+                if page >= len(pageSizes) or scale not in scales or kind not in kinds:
+                    Path(f"./docs/{variantName(pageName(saveFile, page), scale, kind)}").resolve().unlink(missing_ok=True)
+    if len(scales) == 1 and len(kinds) == 1:
+        Path(f"./docs/{os.path.splitext(saveFile)[0]}.atlas.json").resolve().unlink(missing_ok=True)
+
+
+def loadGraphics(directory: str, tileSize: Optional[Tuple[int, int]], fileStrs: List[str], saveFile: str, trim: bool = False, maxSize: int = 2048, downscales: Tuple[int, ...] = (), variants: bool = False) -> Dict[str, dict]:
+    """
+    Packs the requested textures into atlas pages in docs/ and returns each texture path's sprite:
+    {"page", "x", "y", "w", "h"}, plus "trimX", "trimY", "sourceW" and "sourceH" (the untrimmed size) when trimming.
+    Assumes file format is png
+    fileStrs: a list in the format e.g. "UI/Icons/Genes/Gene_Something", or keys from tintKey for tinted copies,
+        whose sprites have "tinted": true
+    tileSize: if given, every texture must be exactly this size; otherwise sizes may be mixed
+    trim: crop fully transparent borders off each texture before packing
+    maxSize: the largest width and height of a page; pages after the first are saved as e.g. genes_1.png
+    downscales: also save the pages shrunk by each of these factors, e.g. 2 for 64px versions of 128px icons.
+        Sprites are aligned so that dividing their coordinates by the factor gives the shrunk coordinates.
+    variants: also save palette png and lossless webp versions of every page and scale, and encode every png as small as
+        possible, which is much slower
+    When downscales or variants are used, a manifest (e.g. genes.atlas.json) lists every page's files and each scale's sprites.
+    A shrunk file that would be bigger than the full size one of its kind isn't saved, and the manifest leaves it out
+    Found paths, texture sizes and the pages are kept in the build cache, so a rerun only decodes and pastes textures that changed
+    With keepResident, decoded textures and pages are also kept in memory for the next call
+    Textures that aren't found are reported and left out of the returned sprites
+    Textures with the same pixels (e.g. the same icon under several paths) are packed once and share their sprite's cell
+    """
+    fileStrs.sort()
+    textures: Optional[buildCache] = None
+    if cache.enabled:
+        textures = buildCache(f"graphics-{saveFile}",
+                              repr((str(Path(directory).resolve()), tileSize, trim)))
+    resident = _resident.setdefault(saveFile, {"tiles": {}}) if keepResident else None
+    tiles = textureSet(directory, fileStrs, tileSize, trim, textures.data.get("paths", {}) if textures is not None else {})
+
+    stale = readTiles(tiles, textures, resident)
+    cells = shareCells(tiles)
+    scales = (1,) + tuple(downscales)
+    graphicsData, pageSizes, boxes = packSprites(tiles, cells, scales, maxSize)
+    kinds = ["png", "png8", "webp"] if variants else ["png"]
+    layout = (graphicsData, pageSizes, scales, kinds)
+
+    # Start from the previous pages if nothing moved, so only changed textures are pasted again
+    previous, residentPages, skipped = previousPages(saveFile, layout, resident, textures)
+    if None in previous:
+        stale = set(tiles.files)
+    pages, changedPages = drawPages(tiles, cells, boxes, graphicsData, pageSizes, previous, residentPages, stale)
+    encoded = writePages(saveFile, pages, previous, changedPages, scales, kinds, skipped, variants, textures is not None)
+    if len(scales) > 1 or variants:
+        writeManifest(saveFile, layout, skipped)
 
-    numImgs = len(files)
-    # Calculate the total size we'll need
-    tileDimensions = approxFactor(numImgs)
-    totalDimensions = (tileDimensions[0] * tileSize[0], tileDimensions[1] * tileSize[1])
-    img = Image.new("RGBA", totalDimensions, (0, 0, 0, 0))
-    tileNum = 0
-    for s in files:
-        tile = Image.open(files[s])
-        assert tile.width == tileSize[0]
-        assert tile.height == tileSize[1]
-        newX = (tileNum % tileDimensions[0]) * tileSize[0]
-        newY = int(tileNum / tileDimensions[0]) * tileSize[1]
-        img.paste(tile, (newX, newY))
-        graphicsData[s] = {"x": newX, "y": newY}
-        tileNum += 1
-    img.save(Path(f"./docs/{saveFile}").resolve())
-    return graphicsData
\ No newline at end of file
+    if resident is not None:
+        # Only textures still in use are kept
+        resident["tiles"] = {}
+        for s, (tile, box, digest) in tiles.decoded.items():
+            st = tiles.files[s].stat()
+            resident["tiles"][s] = (str(tiles.files[s]), (st.st_mtime_ns, st.st_size), tile, box, digest)
+        resident.update({"layout": layout, "pages": pages, "encoded": encoded, "skipped": sorted(skipped)})
+    if textures is not None:
+        if "layout" in textures.data:
+            removeOldFiles(saveFile, textures.data["layout"], layout)
+        textures.data = {"paths": dict((tiles.split[s][0], str(tiles.files[s])) for s in tiles.files), "layout": layout, "skipped": sorted(skipped)}
+        textures.save()
+    return graphicsData
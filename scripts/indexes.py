@@ -0,0 +1,66 @@
+# Lookup indexes written next to the data arrays, so consumers don't have to scan the arrays for each lookup
+# Every index maps to positions in its array, so they must be built after the array's final sort
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import json
+
+
+def nameIndex(records: List[dict]) -> Dict[str, int]:
+    """name -> position; the first record wins if a name repeats"""
+    index: Dict[str, int] = {}
+    for i, r in enumerate(records):
+        index.setdefault(r["name"], i)
+    return index
+
+
+def groupIndex(records: List[dict], key: str, default: Optional[str] = None) -> Dict[str, List[int]]:
+    """Value of key -> positions of the records with it, in order of first appearance"""
+    index: Dict[str, List[int]] = {}
+    for i, r in enumerate(records):
+        value = r.get(key, default)
+        if value is not None:
+            index.setdefault(value, []).append(i)
+    return index
+
+
+def withKey(records: List[dict], key: str) -> List[int]:
+    """Positions of the records that have key"""
+    return [i for i, r in enumerate(records) if key in r]
+
+
+def indexTS(varName: str, index: dict) -> str:
+    return f"export var {varName} = {json.dumps(index, separators=(',', ':'))};"
+
+
+def readTS(filePath: Path, varName: str) -> Any:
+    """The value of an "export var" (or const) line of a data/*.ts file, e.g. readTS(Path("./data/genes.ts"), "genes")"""
+    for line in filePath.read_text(encoding="utf-8").splitlines():
+        for keyword in ("var", "const"):
+            prefix = f"export {keyword} {varName} = "
+            if line.startswith(prefix):
+                return json.loads(line[len(prefix):].rstrip(";"))
+    raise ValueError(f"{filePath} has no {varName}")
+
+
+def indexJS(varName: str, typeName: str, index: dict) -> str:
+    return f"/** @type {{ {typeName} }} */\nvar {varName} = {json.dumps(index, separators=(',', ':'))};"
+
+
+def conflictRows(has: List[List[str]], conflictsWith: List[List[str]]) -> List[List[int]]:
+    """
+    Bitsets of a conflict relation: row i has bit j set when any label in conflictsWith[i] is in has[j], except bit i.
+    Rows are packed into 32-bit words, least significant bit first, so bit j is (row[j >> 5] >>> (j & 31)) & 1
+    """
+    masks: Dict[str, int] = {}
+    for j, labels in enumerate(has):
+        for label in labels:
+            masks[label] = masks.get(label, 0) | 1 << j
+    words = (len(has) + 31) // 32
+    rows: List[List[int]] = []
+    for i, labels in enumerate(conflictsWith):
+        row = 0
+        for label in labels:
+            row |= masks.get(label, 0)
+        row &= ~(1 << i)
+        rows.append([(row >> (32 * w)) & 0xFFFFFFFF for w in range(words)])
+    return rows
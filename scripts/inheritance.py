@@ -0,0 +1,94 @@
+# Resolves Def ParentName chains the way RimWorld's XmlInheritance does
+from typing import Dict, Optional, Set, Tuple
+from xml.etree import ElementTree as ET
+
+
+def shallowCopy(elem: ET.Element) -> ET.Element:
+    """A new element with the same tag, attributes and text, sharing the original's children"""
+    c = ET.Element(elem.tag, dict(elem.attrib))
+    c.text = elem.text
+    c.tail = elem.tail
+    c.extend(elem)
+    return c
+
+
+def overlay(current: ET.Element, child: ET.Element):
+    """
+    Merges child into current: text replaces, <li> items are appended and other elements merge with the
+    parent's element of the same name, unless the child has Inherit="False" and so replaces it entirely.
+    current must be owned by the caller; subtrees shared with other Defs are copied before they are changed.
+    """
+    if child.get("Inherit", "").strip().lower() == "false":
+        current.clear()
+        current.attrib.update(child.attrib)
+        current.text = child.text
+        current.extend(child)
+        return
+    current.attrib.update(child.attrib)
+    if len(child) == 0:
+        if child.text is not None and child.text.strip() != "":
+            del current[:]
+            current.text = child.text
+        return
+    for node in child:
+        if node.tag == "li":
+            current.append(node)
+            continue
+        for i, existing in enumerate(current):
+            if existing.tag == node.tag:
+                fresh = shallowCopy(existing)
+                current[i] = fresh
+                overlay(fresh, node)
+                break
+        else:
+            current.append(node)
+
+
+class inheritanceResolver:
+    """
+    Index of every Def with a Name, keyed by (Def type, Name).
+    Each named Def is resolved at most once; a child copies its parent's memoized result and overlays
+    its own elements, so resolving every Def costs O(defs) however deep the chains are.
+    Resolved Defs share unchanged subtrees with their parents and must be treated as read-only.
+    """
+
+    def __init__(self):
+        self.named: Dict[Tuple[str, str], ET.Element] = {}
+        self.resolved: Dict[Tuple[str, str], ET.Element] = {}
+
+    def add(self, bdef: ET.Element):
+        key = (bdef.tag, bdef.attrib["Name"])
+        if self.named.get(key) is bdef:
+            return
+        if key in self.named:
+            # A redefinition may change anything resolved through it
+            self.resolved.clear()
+        self.named[key] = bdef
+
+    def canResolve(self, bdef: ET.Element) -> bool:
+        """Whether every ancestor of bdef has been added"""
+        seen: Set[Tuple[str, str]] = set()
+        while "ParentName" in bdef.attrib:
+            key = (bdef.tag, bdef.attrib["ParentName"])
+            if key not in self.named or key in seen:
+                return False
+            seen.add(key)
+            bdef = self.named[key]
+        return True
+
+    def resolve(self, bdef: ET.Element) -> ET.Element:
+        """Returns bdef merged over its resolved parents; bdef itself is left untouched"""
+        if "ParentName" not in bdef.attrib:
+            return bdef
+        parentKey = (bdef.tag, bdef.attrib["ParentName"])
+        parent: Optional[ET.Element] = self.resolved.get(parentKey)
+        if parent is None:
+            if parentKey not in self.named:
+                raise KeyError(
+                    f"{bdef.tag} {bdef.findtext('defName') or bdef.get('Name')} has undefined ParentName {parentKey[1]}")
+            parent = self.resolve(self.named[parentKey])
+            self.resolved[parentKey] = parent
+        merged = shallowCopy(parent)
+        overlay(merged, bdef)
+        merged.attrib = dict(bdef.attrib)
+        return merged
@@ -0,0 +1,178 @@
+# Link stage, run after extraction: rewrites the exported records' references to each other and to shared keys
+# (trait names, exclusion and style tags, skills, stats, work tags...) as integer ids, and writes the id -> name tables once:
+#   python scripts/link.py        (or build.py --link)
+# to data/linked.ts and docs/linked.json, {"names": {table: [name of each id]}, "datasets": {dataset: [records]}}
+# A def's id is its position in its exported array, as in the name indexes, so a record's name is names[dataset][id]
+# and records drop their "name". Key tables (e.g. "skills") are sorted, so their ids only depend on the keys in use.
+# References no def defines (e.g. a backstory forcing a trait, or a degree of one, that no TraitDef has) are reported and left out.
+# Trait and gene exclusion tags and hair and beard style tags are separate namespaces, so each has its own table.
+# Nothing reads the linked output yet: the frontend and the worker still use the named data/*.ts and docs/*.js
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import argparse
+import json
+import sys
+from cache import writeIfChanged
+from indexes import nameIndex, readTS
+
+# Each dataset to link: (file in the data directory, exported variable)
+sources: Dict[str, Tuple[str, str]] = {
+    "adulthoods": ("adulthoods.ts", "adulthoods"),
+    "childhoods": ("childhoods.ts", "childhoods"),
+    "traits": ("traits.ts", "traits"),
+    "genes": ("genes.ts", "genes"),
+    "headTypes": ("bodyparts.ts", "headTypes"),
+    "hairTypes": ("bodyparts.ts", "hairTypes"),
+    "beardTypes": ("bodyparts.ts", "beardTypes")
+}
+
+# (linker, value, where it is for reports) -> the value with its references as ids
+Link = Callable[["linker", Any, str], Any]
+
+
+def refs(table: str) -> Link:
+    """A list of names (e.g. conflictingTraits) -> their ids"""
+    return lambda l, names, where: [i for i in (l.ref(table, n, where) for n in names) if i is not None]
+
+
+def keyed(table: str) -> Link:
+    """An object keyed by name (e.g. skills) -> [[id, value], ...]"""
+    return lambda l, values, where: [[i, v] for i, v in ((l.ref(table, k, where), v) for k, v in values.items()) if i is not None]
+
+
+def forcedTraits(l: "linker", traits: Dict[str, int], where: str) -> List[List[int]]:
+    """{trait: degree} -> [[trait id, degree], ...], leaving out degrees the trait doesn't have"""
+    out: List[List[int]] = []
+    for name, degree in traits.items():
+        i = l.ref("traits", name, where)
+        if i is None:
+            continue
+        if str(degree) not in l.datasets["traits"][i].get("degrees", {}):
+            l.report(where, f"TraitDef {name} has no degree {degree}")
+            continue
+        out.append([i, degree])
+    return out
+
+
+def each(links: Dict[str, Link]) -> Link:
+    """An object of records (e.g. a trait's degrees), each linked by links"""
+    return lambda l, records, where: dict((k, l.record(r, links, f"{where}.{k}")) for k, r in records.items())
+
+
+backstoryLinks: Dict[str, Link] = {
+    "skills": keyed("skills"),
+    "disabledWork": refs("work"),
+    "requiredWork": refs("work"),
+    "traits": forcedTraits
+}
+traitLinks: Dict[str, Link] = {
+    "conflictingTraits": refs("traits"),
+    "exclusionTags": refs("traitTags"),
+    "forcedFlames": refs("skills"),
+    "conflictingFlames": refs("skills"),
+    "disabledWork": refs("work"),
+    "requiredWork": refs("work"),
+    "degrees": each({
+        "skills": keyed("skills"),
+        "statOffsets": keyed("stats"),
+        "statFactors": keyed("stats"),
+        "meditationTypes": refs("meditationTypes")
+    })
+}
+geneLinks: Dict[str, Link] = {
+    "exclusionTags": refs("geneTags"),
+    "skills": keyed("skills"),
+    "statOffsets": keyed("stats"),
+    "statFactors": keyed("stats"),
+    "damageFactors": keyed("damage"),
+    "abilities": refs("abilities"),
+    "traits": forcedTraits,
+    "disabledWork": refs("work")
+}
+styleLinks: Dict[str, Link] = {"styleTags": refs("styleTags")}
+links: Dict[str, Dict[str, Link]] = {
+    "adulthoods": backstoryLinks,
+    "childhoods": backstoryLinks,
+    "traits": traitLinks,
+    "genes": geneLinks,
+    "headTypes": {},
+    "hairTypes": styleLinks,
+    "beardTypes": styleLinks
+}
+
+
+class linker:
+    """
+    Links datasets in two passes: the first only collects the keys in use, to number them in sorted order,
+    the second rewrites the references. Defs are looked up in their datasets' name indexes
+    """
+
+    def __init__(self, datasets: Dict[str, List[dict]]):
+        self.datasets = datasets
+        self.indexes: Dict[str, Dict[str, int]] = dict((name, nameIndex(records)) for name, records in datasets.items())
+        self.keys: Dict[str, Dict[str, int]] = {}
+        self.collecting = False
+        self.dangling: List[str] = []
+        self.references = 0
+
+    def report(self, where: str, problem: str):
+        if not self.collecting:
+            self.dangling.append(f"{where}: {problem}")
+
+    def ref(self, table: str, name: str, where: str) -> Optional[int]:
+        """The id of name in table, or None if table is a dataset without it"""
+        if table in self.indexes:
+            if name not in self.indexes[table]:
+                self.report(where, f"no {table} {name}")
+                return None
+            i = self.indexes[table][name]
+        elif self.collecting:
+            self.keys.setdefault(table, {})[name] = 0
+            return 0
+        else:
+            i = self.keys[table][name]
+        if not self.collecting:
+            self.references += 1
+        return i
+
+    def record(self, r: dict, recordLinks: Dict[str, Link], where: str) -> dict:
+        return dict((k, recordLinks[k](self, v, f"{where} {k}") if k in recordLinks else v) for k, v in r.items() if k != "name")
+
+    def link(self) -> dict:
+        self.collecting = True
+        for name, records in self.datasets.items():
+            for r in records:
+                self.record(r, links.get(name, {}), f"{name} {r['name']}")
+        self.keys = dict((table, dict((k, i) for i, k in enumerate(sorted(keys)))) for table, keys in sorted(self.keys.items()))
+        self.collecting = False
+        linked = dict((name, [self.record(r, links.get(name, {}), f"{name} {r['name']}") for r in records])
+                      for name, records in self.datasets.items())
+        names = dict((name, [r["name"] for r in records]) for name, records in self.datasets.items())
+        names.update((table, list(keys)) for table, keys in self.keys.items())
+        return {"names": names, "datasets": linked}
+
+
+def readDatasets(dataDir: Path = Path("./data")) -> Dict[str, List[dict]]:
+    """Every dataset in sources, as the extractor scripts last wrote them"""
+    return dict((name, readTS(dataDir / fileName, varName)) for name, (fileName, varName) in sources.items())
+
+
+def linkOutputs(dataDir: Path = Path("./data")) -> List[str]:
+    """Links the exported data and writes data/linked.ts and docs/linked.json. Returns the dangling references"""
+    l = linker(readDatasets(dataDir))
+    jsonString = json.dumps(l.link(), separators=(",", ":"))
+    writeIfChanged((dataDir / "linked.ts").resolve(), f"export var linked = {jsonString};\n")
+    writeIfChanged(Path("./docs/linked.json").resolve(), jsonString)
+    for problem in l.dangling:
+        print(f"Dangling reference in {problem}", file=sys.stderr)
+    return l.dangling
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Links the exported data's references as integer ids")
+    parser.add_argument("--data", default="./data", help="the directory the extractor scripts wrote their .ts files to")
+    parser.add_argument("--strict", action="store_true", help="exit with an error if there are dangling references")
+    args = parser.parse_args()
+    dangling = linkOutputs(Path(args.data))
+    if args.strict and len(dangling) > 0:
+        sys.exit(1)
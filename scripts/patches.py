@@ -0,0 +1,407 @@
+# Applies mods' XML patches (the PatchOperations in their Patches folders) to the Defs before anything is extracted
+# Like the game, every Def is put in one <Defs> document and the patches run over it in load order.
+# XPaths are looked up in an index of the Defs by type, defName and Name, so a patch aimed at a few Defs
+# doesn't search all of them
+from copy import deepcopy
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from xml.etree import ElementTree as ET
+import re
+import sys
+import profiling
+import xpath
+from xpath import XPathError, node
+
+# Set by --load-order: RimWorld's ModsConfig.xml, whose activeMods list the order patches run in
+loadOrder: Optional[str] = None
+
+
+class PatchError(ValueError):
+    pass
+
+
+def isPatchFile(directory: str, filePath: Path) -> bool:
+    """Whether a file is in a Patches folder (e.g. SomeMod/Patches/Genes.xml or SomeMod/1.4/Patches/Genes.xml)"""
+    return "Patches" in filePath.relative_to(directory).parts[:-1]
+
+
+class modInfo:
+    def __init__(self, root: Path, name: str, packageId: str):
+        self.root = root
+        self.name = name
+        self.packageId = packageId
+
+
+def findMods(directory: str) -> List[modInfo]:
+    """Every mod under directory, as found by its About/About.xml, in path order"""
+    mods: List[modInfo] = []
+    for about in sorted(Path(directory).rglob("About.xml")):
+        if about.parent.name.lower() != "about":
+            continue
+        try:
+            meta = ET.parse(about).getroot()
+        except ET.ParseError:
+            continue
+        root = about.parent.parent
+        mods.append(modInfo(root, (meta.findtext("name") or root.name).strip(),
+                            (meta.findtext("packageId") or "").strip().lower()))
+    return mods
+
+
+def readLoadOrder(filePath: str) -> List[str]:
+    """The packageIds in a ModsConfig.xml's activeMods, lowercased and without the _steam suffix of workshop copies"""
+    ids = [li.text.strip().lower() for li in ET.parse(filePath).getroot().iterfind("activeMods/li") if li.text]
+    return [i[:-len("_steam")] if i.endswith("_steam") else i for i in ids]
+
+
+def isActive(m: modInfo, active: List[str]) -> bool:
+    """Whether a mod is in a load order (readLoadOrder), by packageId or folder name"""
+    return m.packageId in active or m.root.name.lower() in active
+
+
+def activeFiles(directory: str, files: List[Path], mods: Optional[List[modInfo]] = None) -> List[Path]:
+    """
+    files without those of mods --load-order leaves out, so inactive mods' Defs and patches aren't read.
+    Files outside any mod are kept, and without --load-order every file is
+    """
+    if loadOrder is None:
+        return files
+    active = readLoadOrder(loadOrder)
+    keep = dict((m.root, isActive(m, active)) for m in (mods if mods is not None else findMods(directory)))
+
+    def kept(filePath: Path) -> bool:
+        for parent in filePath.parents:
+            if parent in keep:
+                return keep[parent]
+        return True
+    return [f for f in files if kept(f)]
+
+
+def orderPatchFiles(directory: str, files: List[Path], mods: List[modInfo]) -> List[Path]:
+    """
+    Sorts patch files into load order: files outside any mod first, then each mod's in turn.
+    Mods run in --load-order's order if given (matched by packageId or folder name); the rest follow in path order.
+    applyPatches leaves out the files of mods --load-order doesn't have
+    """
+    order = readLoadOrder(loadOrder) if loadOrder is not None else []
+    rank: Dict[Path, int] = {}
+    for i, m in enumerate(mods):
+        key = m.packageId if m.packageId in order else m.root.name.lower()
+        rank[m.root] = order.index(key) if key in order else len(order) + i
+
+    def sortKey(filePath: Path) -> Tuple[int, str]:
+        for parent in filePath.parents:
+            if parent in rank:
+                return (rank[parent], str(filePath))
+        return (-1, str(filePath))
+    return sorted(files, key=sortKey)
+
+
+def patchedTags(patchFiles: List[Path]) -> Optional[Set[str]]:
+    """
+    Every name the patch files' xpaths mention, so Def types no patch can reach are known,
+    or None if an xpath has a wildcard step (e.g. Defs/*[defName="X"]) that could reach any of them
+    """
+    names: Set[str] = set()
+    for filePath in patchFiles:
+        try:
+            root = ET.parse(filePath).getroot()
+        except ET.ParseError:
+            continue
+        for x in root.iter("xpath"):
+            text = x.text or ""
+            if re.search(r"(?<!@)\*", text):
+                return None
+            names.update(re.findall(r"[A-Za-z_][\w.-]*", text))
+    return names
+
+
+class defDocument:
+    """
+    Every Def read, in file order, as the children of one <Defs> root.
+    A Def no extractor wants is cut down to its attributes and defName, which is enough for patches to find it,
+    unless its type is in patched (the names patchedTags found), or patched is None. Cutting one down whose fields
+    a patch reads (a PatchOperationConditional's xpath) or changes (a step of a PatchOperationSequence) would
+    change whether that patch succeeds, so only types no patch xpath mentions are cut down.
+    Mentions are matched by name anywhere in the xpath, which keeps more Defs whole than needed rather than fewer
+    """
+
+    def __init__(self, tags: Iterable[str], patched: Optional[Set[str]] = None):
+        self.tags = set(tags)
+        self.patched = patched
+        self.root = ET.Element("Defs")
+        self.document = xpath.document(self.root)
+        # The file each Def came from, for extractors' exclude lists
+        self.source: Dict[ET.Element, str] = {}
+        self.dirty = True
+        self.byTag: Dict[str, List[ET.Element]] = {}
+        # ("defName" or "@Name", value) -> Defs, of any type
+        self.byKey: Dict[Tuple[str, str], List[ET.Element]] = {}
+        self.position: Dict[int, int] = {}
+
+    def add(self, bdef: ET.Element, fileName: str):
+        if bdef.tag not in self.tags and self.patched is not None and bdef.tag not in self.patched:
+            stub = ET.Element(bdef.tag, dict(bdef.attrib))
+            for d in bdef.iterfind("defName"):
+                stub.append(d)
+            bdef = stub
+        self.root.append(bdef)
+        self.source[bdef] = fileName
+        self.dirty = True
+
+    def defs(self) -> Iterator[Tuple[ET.Element, str]]:
+        """Each Def and the name of the file it came from ("" for Defs added by patches)"""
+        for bdef in self.root:
+            yield bdef, self.source.get(bdef, "")
+
+    def reindex(self):
+        self.byTag = {}
+        self.byKey = {}
+        self.position = {}
+        for i, bdef in enumerate(self.root):
+            self.position[id(bdef)] = i
+            self.byTag.setdefault(bdef.tag, []).append(bdef)
+            for d in bdef.iterfind("defName"):
+                self.byKey.setdefault(("defName", "".join(d.itertext())), []).append(bdef)
+            if "Name" in bdef.attrib:
+                self.byKey.setdefault(("@Name", bdef.attrib["Name"]), []).append(bdef)
+        self.dirty = False
+
+    def children(self, elem: ET.Element, s: xpath.step) -> Optional[Tuple[List[ET.Element], int]]:
+        """xpath's ChildrenHook: the Defs a step from the root selects, found in the index"""
+        if elem is not self.root or s.test in ("text()", "node()"):
+            return None
+        if self.dirty:
+            self.reindex()
+        keys = xpath.equalityKeys(s.predicates[0]) if len(s.predicates) > 0 else None
+        if keys is not None and all(field in ("defName", "@Name") for field, _ in keys):
+            found: Dict[int, ET.Element] = {}
+            for key in keys:
+                for bdef in self.byKey.get(key, []):
+                    if s.test == "*" or bdef.tag == s.test:
+                        found[id(bdef)] = bdef
+            return sorted(found.values(), key=lambda bdef: self.position[id(bdef)]), 1
+        if s.test == "*":
+            return None
+        return self.byTag.get(s.test, []), 0
+
+    def select(self, path: str) -> List[node]:
+        return xpath.select(path, self.document, self.children)
+
+    def touch(self, n: node, tags: Iterable[str] = ()):
+        """
+        Notes that n's children, text or attributes changed, tags being the names of any children or attributes
+        involved, so the index is rebuilt if a Def, its defName or its Name could have changed
+        """
+        depth = 0
+        p = n.parent
+        while p is not None:
+            depth += 1
+            p = p.parent
+        # The document is depth 0, the root 1, Defs 2 and their fields 3
+        if depth <= 1 or (depth == 2 and any(t in ("defName", "Name") for t in tags)) or (depth == 3 and n.elem.tag == "defName"):
+            self.dirty = True
+
+
+class patchContext:
+    def __init__(self, document: defDocument, modNames: Set[str], packageIds: Set[str]):
+        self.document = document
+        self.modNames = modNames
+        self.packageIds = packageIds
+
+
+def valueNodes(op: ET.Element) -> Tuple[Optional[str], List[ET.Element]]:
+    """Copies of what's inside an operation's <value>: its text if it isn't just whitespace, and its elements"""
+    value = op.find("value")
+    if value is None:
+        return None, []
+    text = value.text if value.text is not None and value.text.strip() != "" else None
+    return text, [deepcopy(c) for c in value]
+
+
+def appendText(elem: ET.Element, text: str):
+    if len(elem) > 0:
+        elem[-1].tail = (elem[-1].tail or "") + text
+    else:
+        elem.text = (elem.text or "") + text
+
+
+def opAdd(op: ET.Element, ctx: patchContext) -> bool:
+    targets = ctx.document.select(op.findtext("xpath", ""))
+    prepend = op.findtext("order", "Append").strip() == "Prepend"
+    for t in targets:
+        if t.attr is not None:
+            continue
+        text, children = valueNodes(op)
+        if prepend:
+            t.elem[0:0] = children
+            if text is not None:
+                t.elem.text = text + (t.elem.text or "")
+        else:
+            if text is not None:
+                appendText(t.elem, text)
+            t.elem.extend(children)
+        ctx.document.touch(t, [c.tag for c in children])
+    return len(targets) > 0
+
+
+def opInsert(op: ET.Element, ctx: patchContext) -> bool:
+    targets = ctx.document.select(op.findtext("xpath", ""))
+    append = op.findtext("order", "Prepend").strip() == "Append"
+    for t in targets:
+        if t.attr is not None or t.parent is None:
+            continue
+        _, children = valueNodes(op)
+        parent = t.parent.elem
+        i = list(parent).index(t.elem) + (1 if append else 0)
+        parent[i:i] = children
+        ctx.document.touch(t.parent, [c.tag for c in children])
+    return len(targets) > 0
+
+
+def opRemove(op: ET.Element, ctx: patchContext) -> bool:
+    targets = ctx.document.select(op.findtext("xpath", ""))
+    for t in targets:
+        if t.attr == "#text":
+            t.elem.text = None
+            ctx.document.touch(t.parent)
+        elif t.attr is not None:
+            del t.elem.attrib[t.attr]
+            ctx.document.touch(t.parent, [t.attr])
+        elif t.parent is not None:
+            t.parent.elem.remove(t.elem)
+            ctx.document.touch(t.parent, [t.elem.tag])
+    return len(targets) > 0
+
+
+def opReplace(op: ET.Element, ctx: patchContext) -> bool:
+    targets = ctx.document.select(op.findtext("xpath", ""))
+    for t in targets:
+        text, children = valueNodes(op)
+        if t.attr == "#text":
+            t.elem.text = text
+            t.elem[0:0] = children
+            ctx.document.touch(t.parent, [c.tag for c in children])
+        elif t.attr is not None:
+            t.elem.set(t.attr, text or "")
+            ctx.document.touch(t.parent, [t.attr])
+        elif t.parent is not None:
+            parent = t.parent.elem
+            i = list(parent).index(t.elem)
+            parent[i:i + 1] = children
+            ctx.document.touch(t.parent, [t.elem.tag] + [c.tag for c in children])
+    return len(targets) > 0
+
+
+def opAttribute(change: Callable[[ET.Element, str, str], None]) -> Callable[[ET.Element, patchContext], bool]:
+    def apply(op: ET.Element, ctx: patchContext) -> bool:
+        targets = [t for t in ctx.document.select(op.findtext("xpath", "")) if t.attr is None]
+        attribute = op.findtext("attribute", "").strip()
+        for t in targets:
+            change(t.elem, attribute, op.findtext("value", ""))
+            ctx.document.touch(t, [attribute])
+        return len(targets) > 0
+    return apply
+
+
+def opAddModExtension(op: ET.Element, ctx: patchContext) -> bool:
+    targets = [t for t in ctx.document.select(op.findtext("xpath", "")) if t.attr is None]
+    for t in targets:
+        extensions = t.elem.find("modExtensions")
+        if extensions is None:
+            extensions = ET.SubElement(t.elem, "modExtensions")
+        extensions.extend(valueNodes(op)[1])
+    return len(targets) > 0
+
+
+def opSetName(op: ET.Element, ctx: patchContext) -> bool:
+    targets = [t for t in ctx.document.select(op.findtext("xpath", "")) if t.attr is None and t.parent is not None]
+    name = op.findtext("name", "").strip()
+    for t in targets:
+        old = t.elem.tag
+        t.elem.tag = name
+        ctx.document.touch(t.parent, [old, name])
+    return len(targets) > 0
+
+
+def opSequence(op: ET.Element, ctx: patchContext) -> bool:
+    operations = op.find("operations")
+    for li in operations.iterfind("li") if operations is not None else ():
+        if not runOperation(li, ctx):
+            return False
+    return True
+
+
+def branch(op: ET.Element, ctx: patchContext, matched: bool) -> bool:
+    chosen = op.find("match" if matched else "nomatch")
+    if chosen is not None:
+        return runOperation(chosen, ctx)
+    return op.find("match") is not None or op.find("nomatch") is not None
+
+
+def opConditional(op: ET.Element, ctx: patchContext) -> bool:
+    return branch(op, ctx, len(ctx.document.select(op.findtext("xpath", ""))) > 0)
+
+
+def opFindMod(op: ET.Element, ctx: patchContext) -> bool:
+    wanted = [li.text.strip() for li in op.iterfind("mods/li") if li.text]
+    return branch(op, ctx, any(name in ctx.modNames for name in wanted))
+
+
+operations: Dict[str, Callable[[ET.Element, patchContext], bool]] = {
+    "PatchOperationAdd": opAdd,
+    "PatchOperationInsert": opInsert,
+    "PatchOperationRemove": opRemove,
+    "PatchOperationReplace": opReplace,
+    "PatchOperationAttributeAdd": opAttribute(lambda elem, a, v: elem.attrib.setdefault(a, v)),
+    "PatchOperationAttributeSet": opAttribute(lambda elem, a, v: elem.set(a, v)),
+    "PatchOperationAttributeRemove": opAttribute(lambda elem, a, v: elem.attrib.pop(a, None)),
+    "PatchOperationAddModExtension": opAddModExtension,
+    "PatchOperationSetName": opSetName,
+    "PatchOperationSequence": opSequence,
+    "PatchOperationConditional": opConditional,
+    "PatchOperationFindMod": opFindMod
+}
+
+
+def runOperation(op: ET.Element, ctx: patchContext) -> bool:
+    """Runs one operation (an <Operation> or an <li>/<match>/<nomatch> with a Class) and returns whether it succeeded"""
+    required = [p.strip().lower() for p in op.get("MayRequire", "").split(",") if p.strip() != ""]
+    anyOf = [p.strip().lower() for p in op.get("MayRequireAnyOf", "").split(",") if p.strip() != ""]
+    if not all(p in ctx.packageIds for p in required) or (len(anyOf) > 0 and not any(p in ctx.packageIds for p in anyOf)):
+        return True
+    className = op.get("Class", "").rsplit(".", 1)[-1]
+    if className not in operations:
+        raise PatchError(f"unsupported operation {className or op.tag}")
+    profiling.count("patchOperations")
+    succeeded = operations[className](op, ctx)
+    success = op.findtext("success", "Normal").strip()
+    if success == "Always":
+        return True
+    if success == "Never":
+        return False
+    return not succeeded if success == "Invert" else succeeded
+
+
+def applyPatches(document: defDocument, directory: str, patchFiles: List[Path]):
+    """Runs every patch file's operations over document in load order; failed operations are reported together"""
+    mods = findMods(directory)
+    active = readLoadOrder(loadOrder) if loadOrder is not None else None
+    activeMods = [m for m in mods if active is None or isActive(m, active)]
+    ctx = patchContext(document, set(m.name for m in activeMods), set(m.packageId for m in activeMods))
+    failed: List[str] = []
+    for filePath in orderPatchFiles(directory, activeFiles(directory, patchFiles, mods), mods):
+        try:
+            root = ET.parse(filePath).getroot()
+        except ET.ParseError as err:
+            failed.append(f"{filePath}: {err}")
+            continue
+        for op in root.iterfind("Operation"):
+            try:
+                if not runOperation(op, ctx):
+                    failed.append(f"{filePath.name}: {op.get('Class')} {(op.findtext('xpath') or '').strip()}")
+            except (PatchError, XPathError) as err:
+                failed.append(f"{filePath.name}: {op.get('Class')}: {err}")
+    profiling.count("patchOperationsFailed", len(failed))
+    if len(failed) > 0:
+        print(f"{len(failed)} patch operations failed:\n  " + "\n  ".join(failed), file=sys.stderr)
@@ -0,0 +1,352 @@
+# Seeded batch sampler of random pawns, for tests and for seeding lobbies with many plausible pawns at once
+# Reads what traits.py, backstories.py and genes.py export (data/*.ts) and draws every pawn of a batch together:
+#   python scripts/pawns.py 10000 --seed 42 --out pawns.json
+# Pawns follow the game's rules: a childhood and adulthood that don't disable work the other (or a forced trait) requires,
+# their forced traits, then traits by commonality up to 2-3 in all, none conflicting with each other or the backstories' work.
+# Weighted picks use alias tables (one uniform index and one coin flip each), and traits are drawn a round at a time
+# for the whole batch against a pawns x trait degrees mask of what each pawn can no longer have.
+# Skin and hair colors are picked like the editor's new pawns (docs/main.js): any melanin skin gene, and hair genes by selectionWeight.
+# Heads are any the game picks at random for the pawn's gender (bodyparts.py), hair any hair, and beards any beard for men.
+# Skills are what the backstories and traits give, with a minor passion for the skills traits force passions for.
+# Pawns are in the Pawn JSON shape the worker accepts (Pawn.validate in src/structures.ts).
+# The same data, count and seed always give the same pawns
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+import argparse
+import json
+import sys
+import time
+import uuid
+import numpy as np
+from indexes import readTS
+
+# Rejection rounds against the alias tables before the pawns still left draw from only what they can have
+attempts = 8
+# Years of biological age, as the editor picks them
+ageRange = (18.0, 40.0)
+ticksPerYear = 3600000
+# The editor's skills, in its order (Skills in src/structures.ts)
+skillNames = ["Shooting", "Melee", "Construction", "Mining", "Cooking", "Plants",
+              "Animals", "Crafting", "Artistic", "Medicine", "Social", "Intellectual"]
+# What no exported data covers, as the editor's new pawns have it (docs/main.js)
+placeholders = {"firstName": "first", "nickName": "nick", "lastName": "last",
+                "faceTattoo": "NoTattoo_Face", "bodyTattoo": "NoTattoo_Body"}
+noHair, noBeard = "Bald", "NoBeard"
+
+
+class aliasTable:
+    """Vose's alias method over fixed weights: constant time per draw, however many items there are"""
+
+    def __init__(self, weights: Sequence[float]):
+        w = np.asarray(weights, dtype=np.float64)
+        if len(w) == 0 or w.sum() <= 0:
+            raise ValueError("An alias table needs a positive weight")
+        scaled = w * len(w) / w.sum()
+        self.prob = np.ones(len(w))
+        self.alias = np.arange(len(w))
+        small = [i for i in range(len(w)) if scaled[i] < 1]
+        large = [i for i in range(len(w)) if scaled[i] >= 1]
+        while len(small) > 0 and len(large) > 0:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] += scaled[s] - 1
+            (small if scaled[l] < 1 else large).append(l)
+        # Whatever is left over is within rounding of 1, and keeps its prob of 1
+
+    def draw(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        i = rng.integers(len(self.prob), size=size)
+        return np.where(rng.random(size) < self.prob[i], i, self.alias[i])
+
+
+def maskedDraw(rng: np.random.Generator, weights: np.ndarray) -> np.ndarray:
+    """One index per row of weights (rows x items) in proportion to that row's weights, or -1 where they're all 0"""
+    cumulative = np.cumsum(weights, axis=1)
+    totals = cumulative[:, -1] if weights.shape[1] > 0 else np.zeros(len(weights))
+    targets = rng.random(len(weights)) * totals
+    return np.where(totals > 0, (cumulative <= targets[:, None]).sum(axis=1), -1)
+
+
+def unpackConflicts(rows: List[List[int]], size: int) -> np.ndarray:
+    """The bool (size x size) matrix of conflict rows packed by indexes.conflictRows"""
+    if size == 0:
+        return np.zeros((0, 0), dtype=bool)
+    words = np.array(rows, dtype=np.uint32).reshape(size, -1)
+    j = np.arange(size)
+    return ((words[:, j >> 5] >> (j & 31).astype(np.uint32)) & 1).astype(bool)
+
+
+class pawnBatch:
+    """Pawns drawn together, as arrays of positions in the sampler's lists"""
+
+    def __init__(self, sampler: "pawnSampler", childhood: np.ndarray, adulthood: np.ndarray, female: np.ndarray,
+                 ageTicks: np.ndarray, traits: np.ndarray, skin: np.ndarray, hair: np.ndarray, favoriteColor: np.ndarray,
+                 ids: bytes, headType: np.ndarray, hairType: np.ndarray, beardType: np.ndarray, skills: np.ndarray, flames: np.ndarray):
+        self.sampler = sampler
+        self.childhood = childhood
+        self.adulthood = adulthood
+        self.female = female
+        self.ageTicks = ageTicks
+        # Trait degree rows (sampler.traitKeys), -1 past each pawn's last trait
+        self.traits = traits
+        self.skin = skin
+        self.hair = hair
+        self.favoriteColor = favoriteColor
+        # 16 random bytes per pawn, for its UUID
+        self.ids = ids
+        # Positions in the sampler's head, hair and beard types, -1 for none
+        self.headType = headType
+        self.hairType = hairType
+        self.beardType = beardType
+        # Levels and passions (0-2), pawns x skillNames
+        self.skills = skills
+        self.flames = flames
+
+    def __len__(self) -> int:
+        return len(self.childhood)
+
+    def toJSON(self, i: int) -> dict:
+        """Pawn i in the editor's Pawn JSON shape (docs/main.js), with every field Pawn.validate requires"""
+        s = self.sampler
+        skin, hair = s.genes[self.skin[i]], s.genes[self.hair[i]]
+        color = self.favoriteColor[i]
+        gender = "Female" if self.female[i] else "Male"
+        skills: Dict[str, int] = {}
+        for j, skill in enumerate(skillNames):
+            skills[skill] = int(self.skills[i, j])
+        for j, skill in enumerate(skillNames):
+            skills[skill + "Flames"] = int(self.flames[i, j])
+        return {
+            "id": str(uuid.UUID(bytes=self.ids[16 * i:16 * (i + 1)], version=4)),
+            "firstName": placeholders["firstName"],
+            "nickName": placeholders["nickName"],
+            "lastName": placeholders["lastName"],
+            "tickAgeBio": int(self.ageTicks[i]),
+            "tickAgeChron": int(self.ageTicks[i]),
+            "childhood": s.childhoods[self.childhood[i]]["name"],
+            "adulthood": s.adulthoods[self.adulthood[i]]["name"],
+            "gender": gender,
+            # The game's standard body for the gender
+            "bodyType": gender,
+            "headType": s.headTypes[self.headType[i]]["name"] if self.headType[i] >= 0 else "",
+            "hair": s.hairTypes[self.hairType[i]]["name"] if self.hairType[i] >= 0 else noHair,
+            "hairColor": hair["hairColor"],
+            "beard": s.beardTypes[self.beardType[i]]["name"] if self.beardType[i] >= 0 else noBeard,
+            "faceTattoo": placeholders["faceTattoo"],
+            "bodyTattoo": placeholders["bodyTattoo"],
+            "skinColor": skin["skinColor"],
+            "melanin": skin["melanin"],
+            "favoriteColor": {"R": int(color[0]), "G": int(color[1]), "B": int(color[2]), "A": 1.0},
+            "genotype": {"xenotype": "Baseliner", "endogenes": [skin["name"], hair["name"]], "xenogenes": []},
+            "skills": skills,
+            "traits": dict((s.traitKeys[row][0], s.traitKeys[row][1]) for row in self.traits[i] if row >= 0)
+        }
+
+    def pawns(self) -> List[dict]:
+        return [self.toJSON(i) for i in range(len(self))]
+
+
+class pawnSampler:
+    """
+    Alias tables and conflict masks over the exported traits, backstories, genes and body parts, built once and drawn from
+    many times. Traits are handled per degree (the rows of traitConflicts); a trait's commonality is shared evenly between its degrees
+    """
+
+    def __init__(self, traits: List[dict], traitConflicts: dict, childhoods: List[dict], adulthoods: List[dict],
+                 genes: List[dict], geneIndex: dict, headTypes: List[dict], hairTypes: List[dict], beardTypes: List[dict]):
+        self.childhoods = childhoods
+        self.adulthoods = adulthoods
+        self.genes = genes
+        self.headTypes = headTypes
+        self.hairTypes = hairTypes
+        self.beardTypes = beardTypes
+        byName = dict((t["name"], t) for t in traits)
+        self.traitKeys: List[Tuple[str, int]] = []
+        for key in traitConflicts["keys"]:
+            name, degree = key.rsplit(":", 1)
+            self.traitKeys.append((name, int(degree)))
+        rowOf = dict((key, i) for i, key in enumerate(self.traitKeys))
+        rowTraits = [byName[name] for name, _ in self.traitKeys]
+        rows = len(self.traitKeys)
+
+        # Work tags as columns, so work clashes are matrix products
+        tags = sorted(set(w for r in rowTraits + childhoods + adulthoods for k in ("disabledWork", "requiredWork") for w in r[k]))
+        tagIndex = dict((t, i) for i, t in enumerate(tags))
+
+        def workMatrix(records: List[dict], key: str) -> np.ndarray:
+            m = np.zeros((len(records), len(tags)), dtype=bool)
+            for i, r in enumerate(records):
+                for w in r[key]:
+                    m[i, tagIndex[w]] = True
+            return m
+
+        rowDisabled, rowRequired = workMatrix(rowTraits, "disabledWork"), workMatrix(rowTraits, "requiredWork")
+        # Trait degrees conflict by the game's rules, or when one disables work the other requires
+        self.conflicts = unpackConflicts(traitConflicts["rows"], rows) | (rowDisabled @ rowRequired.T) | (rowRequired @ rowDisabled.T)
+        np.fill_diagonal(self.conflicts, False)
+        self.rowWeights = np.array([t["commonality"] / max(len(t["degrees"]), 1) for t in rowTraits])
+        self.traitTable = aliasTable(self.rowWeights) if self.rowWeights.sum() > 0 else None
+
+        def backstoryMatrices(backstories: List[dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            """Each backstory's forced trait rows, and the work it and they disable and require"""
+            forced = np.zeros((len(backstories), rows), dtype=bool)
+            for i, b in enumerate(backstories):
+                for name, degree in b["traits"].items():
+                    if (name, degree) in rowOf:
+                        forced[i, rowOf[(name, degree)]] = True
+            return forced, workMatrix(backstories, "disabledWork") | (forced @ rowDisabled), \
+                workMatrix(backstories, "requiredWork") | (forced @ rowRequired)
+
+        self.childForced, self.childDisabled, self.childRequired = backstoryMatrices(childhoods)
+        self.adultForced, self.adultDisabled, self.adultRequired = backstoryMatrices(adulthoods)
+        self.rowDisabled, self.rowRequired = rowDisabled, rowRequired
+        # Which childhood and adulthood can go together: no work clash, and no conflict between their forced traits
+        self.compatible = ~((self.childDisabled @ self.adultRequired.T) | (self.childRequired @ self.adultDisabled.T) |
+                            ((self.childForced @ self.conflicts) @ self.adultForced.T))
+        self.compatible &= ~(self.childDisabled & self.childRequired).any(axis=1)[:, None]
+        self.compatible &= ~(self.adultDisabled & self.adultRequired).any(axis=1)[None, :]
+        self.childhoodTable = aliasTable(self.compatible.any(axis=1)) if self.compatible.any() else None
+
+        self.skinGenes = np.array([i for i in geneIndex.get("skinColor", []) if "melanin" in genes[i]], dtype=np.int64)
+        self.hairGenes = np.array(geneIndex.get("hairColor", []), dtype=np.int64)
+        if len(self.skinGenes) == 0 or len(self.hairGenes) == 0:
+            raise ValueError("The genes have no skin or hair colors")
+        self.hairTable = aliasTable([genes[i].get("selectionWeight", 1) or 1 for i in self.hairGenes])
+
+        # Heads by female: those the game picks at random for the gender, or any of the gender if it picks none
+        self.heads: Dict[bool, np.ndarray] = {}
+        for female, gender in ((False, "Male"), (True, "Female")):
+            fits = [i for i, h in enumerate(headTypes) if h.get("gender", "None") in (gender, "None")]
+            chosen = [i for i in fits if headTypes[i].get("randomChosen") != "false"]
+            self.heads[female] = np.array(chosen if len(chosen) > 0 else fits, dtype=np.int64)
+
+        def skillMatrix(skills: List[Dict[str, int]]) -> np.ndarray:
+            return np.array([[s.get(skill, 0) for skill in skillNames] for s in skills], dtype=np.int64).reshape(-1, len(skillNames))
+
+        def flameMatrix(flames: List[List[str]]) -> np.ndarray:
+            return np.array([[skill in f for skill in skillNames] for f in flames], dtype=bool).reshape(-1, len(skillNames))
+
+        self.childSkills = skillMatrix([b["skills"] for b in childhoods])
+        self.adultSkills = skillMatrix([b["skills"] for b in adulthoods])
+        # Trait degree rows, and a last row of nothing for the -1s past a pawn's last trait
+        degrees = [byName[name]["degrees"].get(str(degree), {}) for name, degree in self.traitKeys]
+        self.rowSkills = skillMatrix([d.get("skills", {}) for d in degrees] + [{}])
+        self.rowForcedFlames = flameMatrix([t["forcedFlames"] for t in rowTraits] + [[]])
+        self.rowConflictingFlames = flameMatrix([t["conflictingFlames"] for t in rowTraits] + [[]])
+
+    @classmethod
+    def fromData(cls, dataDir: Path = Path("./data")) -> "pawnSampler":
+        """Reads the data/*.ts files the extractor scripts wrote"""
+        return cls(readTS(dataDir / "traits.ts", "traits"), readTS(dataDir / "traits.ts", "traitConflicts"),
+                   readTS(dataDir / "childhoods.ts", "childhoods"), readTS(dataDir / "adulthoods.ts", "adulthoods"),
+                   readTS(dataDir / "genes.ts", "genes"), readTS(dataDir / "genes.ts", "geneIndex"),
+                   readTS(dataDir / "bodyparts.ts", "headTypes"), readTS(dataDir / "bodyparts.ts", "hairTypes"),
+                   readTS(dataDir / "bodyparts.ts", "beardTypes"))
+
+    def backstories(self, rng: np.random.Generator, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Compatible (childhood, adulthood) pairs, uniformly over the childhoods that have any and then their adulthoods"""
+        if self.childhoodTable is None:
+            raise ValueError("No childhood and adulthood go together")
+        childhood = self.childhoodTable.draw(rng, n)
+        adulthood = np.zeros(n, dtype=np.int64)
+        pending = np.arange(n)
+        for _ in range(attempts):
+            draw = rng.integers(len(self.adulthoods), size=len(pending))
+            fits = self.compatible[childhood[pending], draw]
+            adulthood[pending[fits]] = draw[fits]
+            pending = pending[~fits]
+            if len(pending) == 0:
+                break
+        if len(pending) > 0:
+            adulthood[pending] = maskedDraw(rng, self.compatible[childhood[pending]].astype(np.float64))
+        return childhood, adulthood
+
+    def sample(self, n: int, seed: Optional[int] = None, traitCounts: Tuple[int, int] = (2, 3)) -> pawnBatch:
+        """n pawns, the same ones every time for the same seed"""
+        rng = np.random.default_rng(seed)
+        childhood, adulthood = self.backstories(rng, n)
+
+        # Forced traits first, in row order
+        forced = self.childForced[childhood] | self.adultForced[adulthood]
+        count = rng.integers(traitCounts[0], traitCounts[1] + 1, size=n)
+        width = max(traitCounts[1], int(forced.sum(axis=1).max()) if n > 0 else 0)
+        traits = np.full((n, width), -1, dtype=np.int64)
+        have = np.zeros(n, dtype=np.int64)
+        pawnRows, rows = np.nonzero(forced)
+        if len(pawnRows) > 0:
+            firsts = np.searchsorted(pawnRows, pawnRows)
+            traits[pawnRows, np.arange(len(pawnRows)) - firsts] = rows
+            have += np.bincount(pawnRows, minlength=n)
+        count = np.maximum(count, have)
+
+        # What each pawn can't have any more: what it has, what conflicts with it, and what clashes with its backstories' work
+        blocked = forced | (forced @ self.conflicts)
+        blocked |= ((self.childDisabled[childhood] | self.adultDisabled[adulthood]) @ self.rowRequired.T)
+        blocked |= ((self.childRequired[childhood] | self.adultRequired[adulthood]) @ self.rowDisabled.T)
+
+        picks = np.full(n, -1, dtype=np.int64)
+        while self.traitTable is not None:
+            active = np.flatnonzero(have < count)
+            if len(active) == 0:
+                break
+            picks[active] = -1
+            pending = active
+            for _ in range(attempts):
+                draw = self.traitTable.draw(rng, len(pending))
+                fits = ~blocked[pending, draw]
+                picks[pending[fits]] = draw[fits]
+                pending = pending[~fits]
+                if len(pending) == 0:
+                    break
+            if len(pending) > 0:
+                picks[pending] = maskedDraw(rng, self.rowWeights * ~blocked[pending])
+            got = active[picks[active] >= 0]
+            traits[got, have[got]] = picks[got]
+            have[got] += 1
+            blocked[got] |= self.conflicts[picks[got]]
+            blocked[got, picks[got]] = True
+            # Pawns with nothing left they can have keep the traits they have
+            stuck = active[picks[active] < 0]
+            count[stuck] = have[stuck]
+
+        female = rng.random(n) < 0.5
+        ageTicks = np.floor(ticksPerYear * rng.uniform(ageRange[0], ageRange[1], size=n)).astype(np.int64)
+        skin = self.skinGenes[rng.integers(len(self.skinGenes), size=n)]
+        hair = self.hairGenes[self.hairTable.draw(rng, n)]
+        favoriteColor = rng.integers(0, 255, size=(n, 3))
+        ids = rng.bytes(16 * n)
+
+        def pick(choices: np.ndarray, size: int) -> np.ndarray:
+            return choices[rng.integers(len(choices), size=size)] if len(choices) > 0 else np.full(size, -1, dtype=np.int64)
+
+        headType = np.where(female, pick(self.heads[True], n), pick(self.heads[False], n))
+        hairType = pick(np.arange(len(self.hairTypes)), n)
+        beardType = np.where(female, -1, pick(np.arange(len(self.beardTypes)), n))
+
+        rows = np.where(traits >= 0, traits, len(self.traitKeys))
+        skills = (self.childSkills[childhood] + self.adultSkills[adulthood] + self.rowSkills[rows].sum(axis=1)).clip(0, 20)
+        flames = (self.rowForcedFlames[rows].any(axis=1) & ~self.rowConflictingFlames[rows].any(axis=1)).astype(np.int64)
+        return pawnBatch(self, childhood, adulthood, female, ageTicks, traits, skin, hair, favoriteColor,
+                         ids, headType, hairType, beardType, skills, flames)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Draws random pawns from the exported traits, backstories and genes")
+    parser.add_argument("count", type=int, help="number of pawns")
+    parser.add_argument("--seed", type=int, help="random seed; the same seed gives the same pawns")
+    parser.add_argument("--traits", type=int, nargs=2, default=[2, 3], metavar=("MIN", "MAX"),
+                        help="range of the number of traits, forced traits included")
+    parser.add_argument("--data", default="./data", help="the directory the extractor scripts wrote their .ts files to")
+    parser.add_argument("--out", help="write the pawns as JSON to this file instead of printing them")
+    args = parser.parse_args()
+
+    sampler = pawnSampler.fromData(Path(args.data))
+    started = time.perf_counter()
+    batch = sampler.sample(args.count, args.seed, (args.traits[0], args.traits[1]))
+    elapsed = time.perf_counter() - started
+    print(f"{len(batch)} pawns in {elapsed:.3f}s", file=sys.stderr)
+    jsonString = json.dumps(batch.pawns(), indent=2)
+    if args.out is None:
+        print(jsonString)
+    else:
+        Path(args.out).write_text(jsonString)
@@ -0,0 +1,150 @@
+# Optional per-phase timings, counts and peak memory for the extractor scripts, turned on by --profile
+# Phases don't overlap: entering a phase pauses the one it's in, so their times add up to the run's
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, Optional, TypeVar
+import cProfile
+import json
+import sys
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Turned on by --profile
+enabled = False
+# Where the JSON report is written
+reportPath = Path("./profile.json")
+# If set, the slowest phase is also run under cProfile and its stats are dumped here
+dumpPath: Optional[Path] = None
+
+_started = 0.0
+_phases: Dict[str, Dict[str, float]] = {}
+_counts: Dict[str, int] = {}
+# [name, start of the phase's current slice] for each phase being run, innermost last
+_stack: List[list] = []
+_profiles: Dict[str, cProfile.Profile] = {}
+
+T = TypeVar("T")
+
+
+def peakRss() -> Optional[int]:
+    """The process's peak resident memory so far in bytes, where the platform reports it"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def start(report: Optional[str] = None, dump: Optional[str] = None):
+    global enabled, reportPath, dumpPath, _started
+    enabled = True
+    if report is not None:
+        reportPath = Path(report)
+    dumpPath = None if dump is None else Path(dump)
+    _started = perf_counter()
+
+
+def _stop(name: str, now: float, begin: float):
+    stats = _phases.setdefault(name, {"seconds": 0.0, "calls": 0, "peakRss": 0, "rssGrowth": 0})
+    stats["seconds"] += now - begin
+    if dumpPath is not None:
+        _profiles[name].disable()
+
+
+def _resume(name: str):
+    if dumpPath is not None:
+        _profiles.setdefault(name, cProfile.Profile()).enable()
+
+
+class _phase:
+    __slots__ = ("name", "rssBefore")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        now = perf_counter()
+        if len(_stack) > 0:
+            _stop(_stack[-1][0], now, _stack[-1][1])
+        self.rssBefore = peakRss()
+        _stack.append([self.name, now])
+        _resume(self.name)
+
+    def __exit__(self, *exc):
+        now = perf_counter()
+        name, begin = _stack.pop()
+        _stop(name, now, begin)
+        stats = _phases[name]
+        stats["calls"] += 1
+        rss = peakRss()
+        if rss is not None:
+            stats["peakRss"] = max(stats["peakRss"], rss)
+            stats["rssGrowth"] += rss - self.rssBefore
+        if len(_stack) > 0:
+            _stack[-1][1] = now
+            _resume(_stack[-1][0])
+        return False
+
+
+class _noPhase:
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc):
+        return False
+
+
+_noop = _noPhase()
+
+
+def phase(name: str):
+    """Context manager timing its body as part of phase name (e.g. "parse"); does nothing unless profiling"""
+    return _phase(name) if enabled else _noop
+
+
+def timed(name: str, iterable: Iterable[T]) -> Iterator[T]:
+    """Iterates iterable, timing only the work of producing each item as phase name"""
+    if not enabled:
+        yield from iterable
+        return
+    it = iter(iterable)
+    while True:
+        with _phase(name):
+            try:
+                item = next(it)
+            except StopIteration:
+                return
+        yield item
+
+
+def count(name: str, n: int = 1):
+    """Adds n to a counter in the report (e.g. "files", "defs", "bytesWritten")"""
+    if enabled:
+        _counts[name] = _counts.get(name, 0) + n
+
+
+def writeReport():
+    """Writes the JSON report, and the cProfile stats of the slowest phase if asked for"""
+    if not enabled:
+        return
+    total = perf_counter() - _started
+    phases = dict(sorted(_phases.items(), key=lambda item: -item[1]["seconds"]))
+    report = {
+        "script": Path(sys.argv[0]).name,
+        "argv": sys.argv[1:],
+        "seconds": total,
+        # Time spent outside every phase, e.g. importing and setting up
+        "otherSeconds": total - sum(p["seconds"] for p in phases.values()),
+        "peakRss": peakRss(),
+        "phases": phases,
+        "counts": dict(sorted(_counts.items()))
+    }
+    if dumpPath is not None and len(phases) > 0:
+        slowest = next(iter(phases))
+        _profiles[slowest].dump_stats(dumpPath)
+        report["cProfile"] = {"phase": slowest, "path": str(dumpPath)}
+    reportPath.write_text(json.dumps(report, indent=2))
+    print(f"Profile written to {reportPath}", file=sys.stderr)
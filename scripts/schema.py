@@ -0,0 +1,173 @@
+# Declarative field schemas for reading Defs
+# A schema is compiled into a table of child tag -> fields, so a Def is read in one pass over its children
+import re
+from typing import Any, Callable, Dict, List, Literal, Optional, Union
+from xml.etree import ElementTree as ET
+
+Reader = Callable[[ET.Element], Any]
+
+_missing = object()
+
+
+# vvv Converters (text -> value) vvv
+
+def parseColor(text: str) -> Dict[Literal["R", "G", "B", "A"], Union[float, int]]:
+    assert text[0] == "(" and text[-1] == ")"
+    r, g, b = text[1:-1].split(",")
+    if "." in r:
+        r = int(float(r) * 255)
+    else:
+        r = int(r)
+    if "." in g:
+        g = int(float(g) * 255)
+    else:
+        g = int(g)
+    if "." in b:
+        b = int(float(b) * 255)
+    else:
+        b = int(b)
+    return {
+        "R": r,
+        "G": g,
+        "B": b,
+        "A": 1.0
+    }
+
+
+def parseFloatList(text: str) -> List[float]:
+    assert text[0] == "(" and text[-1] == ")"
+    items = text[1:-1].split(",")
+    return [float(x) for x in items]
+
+
+def descriptionCleaner(tokens: Dict[str, str], collapseNewlines: bool = True) -> Callable[[str], str]:
+    """
+    Replaces escaped newlines and each token with its text in one regex pass.
+    With collapseNewlines, each pair of newlines (escaped or not) becomes one, as replacing "\\n\\n" with "\\n" would.
+    """
+    newline = r"(?:\\n|\n){1,2}" if collapseNewlines else r"\\n"
+    pattern = re.compile("|".join([newline] + [re.escape(t) for t in tokens]))
+    return lambda text: pattern.sub(lambda m: tokens.get(m.group(0), "\n"), text)
+
+
+def pawnTokens(*brackets: str) -> Dict[str, str]:
+    """The pawn tokens in descriptions and what to show instead, for each bracket pair (e.g. "[]" for [PAWN_nameDef])"""
+    names = {"PAWN_nameDef": "This pawn", "PAWN_pronoun": "This pawn",
+             "PAWN_possessive": "their", "PAWN_objective": "them"}
+    return dict((b[0] + name + b[1], value) for b in brackets for name, value in names.items())
+
+
+# vvv Readers (element -> value) vvv
+
+def text(convert: Optional[Callable[[str], Any]] = None) -> Reader:
+    """The element's text (like findtext), passed through convert"""
+    if convert is None:
+        return lambda elem: elem.text or ""
+    return lambda elem: convert(elem.text or "")
+
+
+def liList(elem: ET.Element) -> List[str]:
+    """The text of each <li>"""
+    return [li.text for li in elem.iterfind("li")]
+
+
+def workList(elem: ET.Element) -> List[str]:
+    """Either an <li> list or a plain "a, b, c" (or "None") list"""
+    out: List[str] = []
+    for li in elem.iterfind("li"):
+        assert li.text is not None
+        out.append(li.text)
+    if elem.text is not None and elem.text.strip() != "None":
+        out.extend(x.strip() for x in elem.text.split(",") if x.strip() != "")
+    return out
+
+
+def tagDict(convert: Callable[[str], Any], empty: Any = None) -> Reader:
+    """Each child's tag -> its converted text, or empty if it has no text (e.g. <statOffsets><MoveSpeed>0.2</MoveSpeed>...)"""
+    return lambda elem: dict((c.tag, empty if c.text is None else convert(c.text)) for c in elem)
+
+
+def liDict(keyTag: str, valueTag: str, convert: Callable[[str], Any], default: Any = _missing) -> Reader:
+    """<li><keyTag/><valueTag/></li> items as a dict; a missing value is default, or an error if there is none"""
+    def read(elem: ET.Element) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for li in elem.iterfind("li"):
+            key = li.findtext(keyTag)
+            value = li.findtext(valueTag)
+            if value is None:
+                assert default is not _missing
+                out[key] = default
+            else:
+                assert key is not None
+                out[key] = convert(value)
+        return out
+    return read
+
+
+def liRecords(itemSchema: "schema", key: str) -> Reader:
+    """Each <li> read with itemSchema, as a dict keyed by its key field"""
+    def read(elem: ET.Element) -> Dict[Any, dict]:
+        out: Dict[Any, dict] = {}
+        for li in elem.iterfind("li"):
+            record = itemSchema.read(li)
+            out[record[key]] = record
+        return out
+    return read
+
+
+class field:
+    """
+    key: the exported name
+    tag: the child element it's read from, if not the same as key
+    read: turns the child element into the value
+    default: the value when there's no such child; lists and dicts default to empty
+    Fields sharing a key are concatenated in schema order
+    """
+
+    def __init__(self, key: str, tag: Optional[str] = None, read: Reader = text(), default: Any = None):
+        self.key = key
+        self.tag = key if tag is None else tag
+        self.read = read
+        self.default = default
+
+
+def listField(key: str, tag: Optional[str] = None, read: Reader = liList) -> field:
+    return field(key, tag, read, list)
+
+
+def dictField(key: str, tag: Optional[str] = None, read: Reader = tagDict(float)) -> field:
+    return field(key, tag, read, dict)
+
+
+class schema:
+    """
+    Reads a Def (or <li>) into a dict with one entry per field key, in field order.
+    With prune, None and empty lists/dicts are left out.
+    """
+
+    def __init__(self, *fields: field, prune: bool = True):
+        self.fields = fields
+        self.prune = prune
+        self.byTag: Dict[str, List[int]] = {}
+        for i, f in enumerate(fields):
+            self.byTag.setdefault(f.tag, []).append(i)
+
+    def read(self, elem: ET.Element) -> Dict[str, Any]:
+        values: List[Any] = [_missing] * len(self.fields)
+        for child in elem:
+            for i in self.byTag.get(child.tag, ()):
+                # Like findtext, the first matching child wins
+                if values[i] is _missing:
+                    values[i] = self.fields[i].read(child)
+        out: Dict[str, Any] = {}
+        for f, value in zip(self.fields, values):
+            if value is _missing:
+                value = f.default() if callable(f.default) else f.default
+            if f.key in out:
+                out[f.key] = out[f.key] + value
+            else:
+                out[f.key] = value
+        if self.prune:
+            return dict((k, v) for k, v in out.items()
+                        if v is not None and not (isinstance(v, (dict, list)) and len(v) == 0))
+        return out
@@ -0,0 +1,69 @@
+# Prebuilt inverted indexes, so the frontend can search backstories, traits and genes without scanning them (docs/search.js)
+# Written per language next to the string tables, as docs/search/{language}/{name}.json:
+# {dataset: {"size": records, "terms": [sorted tokens], "postings": [[id, weight, id, weight, ...] per term],
+#            "filters": {filter: [ids]}}}
+# ids are positions in the dataset's array. Tokens come from the record's strings, weighted by field (titles over descriptions).
+# Filters are "+{skill}" and "-{skill}" for skill gains and losses (any degree's, for traits),
+# and "disables:{work tag}" and "requires:{work tag}", all lowercase
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+import json
+import re
+from cache import writeIfChanged
+
+# Weight of a token by the field it's in; fields not listed weigh 1
+fieldWeights: Dict[str, int] = {"title": 4, "label": 4, "titleShort": 2}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase runs of letters and digits, the same as docs/search.js splits queries"""
+    return re.findall(r"[^\W_]+", text.lower())
+
+
+def _texts(strings: dict) -> Iterator[Tuple[str, str]]:
+    """(field, text) for every string of a record's strings, going into nested ones (e.g. a trait's degrees)"""
+    for key, value in strings.items():
+        if isinstance(value, dict):
+            yield from _texts(value)
+        elif isinstance(value, str):
+            yield key, value
+
+
+def searchFilters(record: dict) -> List[str]:
+    """The filters a record matches"""
+    skills: Dict[str, int] = dict(record.get("skills", {}))
+    for degree in record.get("degrees", {}).values():
+        skills.update(degree.get("skills", {}))
+    out = [("+" if gain > 0 else "-") + skill for skill, gain in skills.items() if gain != 0]
+    out.extend("disables:" + work for work in record.get("disabledWork", []))
+    out.extend("requires:" + work for work in record.get("requiredWork", []))
+    return sorted(set(f.lower() for f in out))
+
+
+def searchIndex(records: List[dict], strings: Dict[str, dict]) -> dict:
+    """The index of one dataset: its records, and their strings by name in one language"""
+    weights: Dict[str, Dict[int, int]] = {}
+    filters: Dict[str, List[int]] = {}
+    for i, r in enumerate(records):
+        for key, text in _texts(strings.get(r["name"], {})):
+            for token in tokenize(text):
+                postings = weights.setdefault(token, {})
+                postings[i] = postings.get(i, 0) + fieldWeights.get(key, 1)
+        for f in searchFilters(r):
+            filters.setdefault(f, []).append(i)
+    terms = sorted(weights)
+    return {"size": len(records), "terms": terms,
+            "postings": [[x for i, w in sorted(weights[t].items()) for x in (i, w)] for t in terms],
+            "filters": dict(sorted(filters.items()))}
+
+
+def writeSearch(name: str, tables: Dict[str, Dict[str, Dict[str, dict]]], datasets: Dict[str, List[dict]]):
+    """
+    Writes each language's index of datasets (dataset -> records), given the string tables writeStrings returned
+    (language -> dataset -> name -> strings)
+    """
+    for language, table in tables.items():
+        index = dict((dataset, searchIndex(records, table.get(dataset, {}))) for dataset, records in datasets.items())
+        directory = Path(f"./docs/search/{language}").resolve()
+        directory.mkdir(parents=True, exist_ok=True)
+        writeIfChanged(directory / f"{name}.json", json.dumps(index, separators=(",", ":")))
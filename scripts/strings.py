@@ -0,0 +1,176 @@
+# Per-language string tables: labels, descriptions and titles are split out of the data files into
+# docs/strings/{language}/{name}.json, keyed by defName, so the frontend only downloads the language it shows (docs/strings.js)
+# English comes from the Defs themselves. Other languages come from the DefInjected translations in Languages folders
+# (or the game's Languages/*.tar archives), falling back to English for anything they don't translate.
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from xml.etree import ElementTree as ET
+import json
+import re
+import sys
+import tarfile
+import chunks
+from cache import writeIfChanged
+from chunks import Parts, writeChunks
+from schema import field, schema
+
+# Set by parseArgs: directories searched for Languages folders
+languageDirs: List[str] = []
+
+_sources: Optional[List[Tuple[str, Path]]] = None
+# defType -> language -> defName -> DefInjected path after the defName (e.g. "degreeDatas.0.label") -> text
+_translations: Dict[str, Dict[str, Dict[str, Dict[str, str]]]] = {}
+
+
+def isLanguageFile(directory: str, filePath: Path) -> bool:
+    """Whether a file is a translation in a Languages folder rather than a Def file"""
+    return "Languages" in filePath.relative_to(directory).parts[:-1]
+
+
+class stringFields:
+    """
+    Which of a schema's fields are display strings.
+    nested: fields holding a list of records keyed by something (e.g. trait degrees), and their own string fields
+    """
+
+    def __init__(self, defSchema: schema, keys: List[str], nested: Optional[Dict[str, "stringFields"]] = None):
+        byKey = dict((f.key, f) for f in defSchema.fields)
+        self.fields: Dict[str, field] = dict((k, byKey[k]) for k in keys)
+        self.nested: Dict[str, Tuple[str, stringFields]] = dict((k, (byKey[k].tag, n)) for k, n in (nested or {}).items())
+
+    def split(self, record: dict) -> dict:
+        """Takes the strings out of record and returns them"""
+        out: Dict[str, Any] = {}
+        for key in self.fields:
+            if key in record:
+                out[key] = record.pop(key)
+        for key, (_, inner) in self.nested.items():
+            items = dict((k, inner.split(v)) for k, v in record.get(key, {}).items())
+            if any(len(v) > 0 for v in items.values()):
+                out[key] = items
+        return out
+
+    def translate(self, strings: dict, injected: Dict[str, str], prefix: str = "") -> dict:
+        """A copy of strings with every field injected has a translation for replaced"""
+        out = dict(strings)
+        for key, f in self.fields.items():
+            text = injected.get(prefix + f.tag)
+            if text is not None:
+                elem = ET.Element(f.tag)
+                elem.text = text
+                out[key] = f.read(elem)
+        for key, (tag, inner) in self.nested.items():
+            if key not in strings:
+                continue
+            out[key] = {}
+            for i, (k, v) in enumerate(strings[key].items()):
+                # List items are found by index, or by a handle made from their English label
+                handle = handleOf(v.get("label", ""))
+                itemPrefix = f"{prefix}{tag}.{i}."
+                if not any(p.startswith(itemPrefix) for p in injected) and handle != "":
+                    itemPrefix = f"{prefix}{tag}.{handle}."
+                out[key][k] = inner.translate(v, injected, itemPrefix)
+        return out
+
+
+def handleOf(label: str) -> str:
+    """The handle DefInjected files may use for a list item instead of its index (e.g. "very neurotic" -> "very_neurotic")"""
+    return re.sub(r"[^0-9A-Za-z]+", "_", label).strip("_")
+
+
+def _languageSources() -> List[Tuple[str, Path]]:
+    """(language, folder or .tar archive) for every language in a Languages folder under languageDirs"""
+    global _sources
+    if _sources is not None:
+        return _sources
+    sources: List[Tuple[str, Path]] = []
+    for directory in languageDirs:
+        for languages in sorted(Path(directory).rglob("Languages")):
+            if not languages.is_dir():
+                continue
+            for entry in sorted(languages.iterdir()):
+                if entry.is_dir():
+                    sources.append((entry.name, entry))
+                elif entry.suffix.lower() == ".tar":
+                    sources.append((entry.stem, entry))
+    _sources = sources
+    return sources
+
+
+def _readInjected(content: bytes, out: Dict[str, Dict[str, str]], where: str):
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError as err:
+        print(f"{where}: {err}", file=sys.stderr)
+        return
+    for elem in root:
+        if "." in elem.tag and elem.text is not None:
+            defName, path = elem.tag.split(".", 1)
+            out.setdefault(defName, {})[path] = elem.text
+
+
+def translations(defType: str) -> Dict[str, Dict[str, Dict[str, str]]]:
+    """language -> defName -> path -> text for one Def type, read once per run"""
+    if defType not in _translations:
+        found: Dict[str, Dict[str, Dict[str, str]]] = {}
+        for language, source in _languageSources():
+            injected = found.setdefault(language, {})
+            if source.is_dir():
+                for filePath in sorted((source / "DefInjected" / defType).rglob("*.[xX][mM][lL]")):
+                    _readInjected(filePath.read_bytes(), injected, str(filePath))
+                continue
+            with tarfile.open(source) as tar:
+                for member in tar.getmembers():
+                    parts = Path(member.name).parts
+                    if member.isfile() and member.name.lower().endswith(".xml") and "DefInjected" in parts and \
+                            parts.index("DefInjected") + 1 < len(parts) and parts[parts.index("DefInjected") + 1] == defType:
+                        _readInjected(tar.extractfile(member).read(), injected, f"{source}:{member.name}")
+        _translations[defType] = found
+    return _translations[defType]
+
+
+def forgetTranslations():
+    """Drops the translations read so far, so edits to them are picked up"""
+    global _sources
+    _sources = None
+    _translations.clear()
+
+
+def languages() -> List[str]:
+    """English and every language with a Languages folder"""
+    return sorted(set(["English"] + [language for language, _ in _languageSources()]))
+
+
+def writeStrings(name: str, datasets: Dict[str, Tuple[List[dict], str, stringFields]],
+                 chunkParts: Optional[Dict[str, Parts]] = None) -> Dict[str, Dict[str, Dict[str, dict]]]:
+    """
+    Splits the strings out of each dataset's records (dataset -> (records, Def type, string fields))
+    and writes a table of them for every language, e.g. docs/strings/English/genes.json:
+    {dataset: {defName: {field: string}}}
+    chunkParts: with --chunks, how to split each dataset's strings into chunks (docs/chunks/strings/{language}/{name})
+    Returns the tables, by language
+    """
+    english: Dict[str, Dict[str, dict]] = {}
+    for dataset, (records, _, fields) in datasets.items():
+        english[dataset] = {}
+        for r in records:
+            strings = fields.split(r)
+            if len(strings) > 0:
+                english[dataset][r["name"]] = strings
+    tables: Dict[str, Dict[str, Dict[str, dict]]] = {}
+    for language in languages():
+        table: Dict[str, Dict[str, dict]] = {}
+        tables[language] = table
+        for dataset, (_, defType, fields) in datasets.items():
+            injected = translations(defType).get(language, {})
+            table[dataset] = dict((defName, fields.translate(s, injected[defName]) if defName in injected else s)
+                                  for defName, s in english[dataset].items())
+        directory = Path(f"./docs/strings/{language}").resolve()
+        directory.mkdir(parents=True, exist_ok=True)
+        writeIfChanged(directory / f"{name}.json", json.dumps(table, separators=(",", ":")))
+        if chunks.enabled and chunkParts:
+            writeChunks(f"strings/{language}/{name}", dict(
+                (dataset, ([dict(name=defName, **s) for defName, s in table[dataset].items()], parts))
+                for dataset, parts in chunkParts.items()))
+    writeIfChanged(Path("./docs/strings/languages.json").resolve(), json.dumps(languages()))
+    return tables
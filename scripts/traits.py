@@ -1,163 +1,103 @@
-# Reads backgrounds from a directory and puts them into ../data/childhoods.json and ../data/adulthoods.json
+# Reads traits (TraitDef) from a Defs directory into data/traits.ts and docs/traits.js, with each degree's conflicts
+# Their labels and descriptions go to string tables (strings.py) and search indexes (search.py). With --bundle, also writes a bundle (bundle.py)
 from pathlib import Path
-from typing import List, Dict, Union
+from typing import List, Dict
 from xml.etree import ElementTree as ET
 import json
-
-directory = input("Directory: ").strip('" \n\t')
-
-exclude = []
-
-files = list(filter(lambda x: x.name not in exclude,
-             Path(directory).rglob("*.[xX][mM][lL]")))
-
-
-class traitDegree:
-    @staticmethod
-    def cleanDescription(text: str) -> str:
-        return text.replace("\\n", "\n").replace("\n\n", "\n").replace("[PAWN_nameDef]", "This pawn").replace("[PAWN_pronoun]", "This pawn").replace("[PAWN_possessive]", "their").replace("[PAWN_objective]", "them").replace("{PAWN_nameDef}", "This pawn").replace("{PAWN_pronoun}", "This pawn").replace("{PAWN_possessive}", "their").replace("{PAWN_objective}", "them")
-
-    def __init__(self, deg: ET.Element):
-        # handles parsing of a <li> element in <degreeDatas>
-        self.label = deg.findtext("label")
-        self.desc: str = traitDegree.cleanDescription(
-            deg.findtext("description"))
-        self.degree: int = deg.findtext("degree")
-        self.degree = 0 if self.degree is None else int(self.degree)
-
-        self.skillGains: Dict[str, int] = {}
-        for li in deg.iterfind("./skillGains/li"):
-            key = li.findtext("key")
-            value = li.findtext("value")
-            assert key is not None and value is not None
-            self.skillGains[key] = int(value)
-        self.statOffsets: Dict[str, float] = {}
-        for item in deg.iterfind("./statOffsets/*"):
-            self.statOffsets[item.tag] = float(item.text)
-        self.statFactors: Dict[str, float] = {}
-        for item in deg.iterfind("./statFactors/*"):
-            self.statFactors[item.tag] = float(item.text)
-        self.meditationTypes: List[str] = []
-        for li in deg.iterfind("./allowedMeditationFocusTypes/li"):
-            self.meditationTypes.append(li.text)
-        self.hungerRateFactor = deg.findtext("./hungerRateFactor")
-        if self.hungerRateFactor is not None:
-            self.hungerRateFactor = float(self.hungerRateFactor)
-
-        """
-        theOnlyAllowedMentalBreaks (e.g. Traits_Singular.xml -> Gourmand, Pyromaniac)
-        randomMentalState (e.g. Traits_Singular.xml -> Gourmand, Pyromaniac)
-        randomMentalStateMtbDaysMoodCurve (e.g. Traits_Singular.xml -> Gourmand, Pyromaniac)
-        mentalBreakInspirationGainSet (e.g. Traits_Singular.xml -> TorturedArtist)
-        mentalBreakInspirationGainReasonText (e.g. Traits_Singular.xml -> TorturedArtist)
-        mentalBreakInspirationGainChance (e.g. Traits_Singular.xml -> TorturedArtist)
-        disallowedInspirations (e.g. Traits_Singular.xml -> Brawler)
-        disallowedMeditationFocusTypes (e.g. Traits_Singular.xml -> Ascetic)
-        marketValueFactorOffset (e.g. Traits_Singular.xml -> Wimp)
-        disallowedThoughtsFromIngestion (e.g. Traits_Singular.xml -> Cannibal)
-        extraThoughtsFromIngestion (e.g. Traits_Singular.xml -> Cannibal)
-        socialFightChanceFactor (e.g. Traits_Singular.xml -> Bloodlust)
-        randomDiseaseMtbDays (e.g. Traits_Spectrum.xml -> Immunity/sickly)
-        """
-
-    def export(self) -> Dict[str, Union[str, int, List[str], Dict[str, int]]]:
-        d = {
-            "label": self.label,
-            "desc": self.desc,
-            "degree": self.degree,
-            "skills": self.skillGains,
-            "statOffsets": self.statOffsets,
-            "statFactors": self.statFactors,
-            "meditationTypes": self.meditationTypes,
-            "hungerRateFactor": self.hungerRateFactor
-        }
-        to_remove: str = []
-        for x in d:
-            if d[x] is None:
-                to_remove.append(x)
-            elif isinstance(d[x], (dict, list)) and len(d[x]) == 0:
-                to_remove.append(x)
-        for x in to_remove:
-            d.pop(x)
-        return d
-
-
-class trait:
-
-    def __init__(self, tdef: ET.Element):
-        # Handles parsing of a <TraitDef> element
-        self.defName: str = tdef.findtext("defName")
-        self.commonality: str = tdef.findtext("commonality")
-        self.commonality = 1.0 if self.commonality is None else float(
-            self.commonality)
-
-        self.conflictingTraits: List[str] = []
-        for li in tdef.iterfind("./conflictingTraits/li"):
-            self.conflictingTraits.append(li.text)
-        self.exclusionTags: List[str] = []
-        for li in tdef.iterfind("./exclusionTags/li"):
-            self.conflictingTraits.append(li.text)
-        self.forcedFlames: List[str] = []
-        for li in tdef.iterfind("./forcedPassions/li"):
-            self.forcedFlames.append(li.text)
-        self.conflictingFlames: List[str] = []
-        for li in tdef.iterfind("./conflictingPassions/li"):
-            self.forcedFlames.append(li.text)
-
-        self.disabledWork: List[str] = []
-        for li in tdef.iterfind("./disabledWorkTags/li"):
-            assert li.text is not None
-            self.disabledWork.append(li.text)
-        disabledWorkText = tdef.findtext("./disabledWorkTags")
-        if disabledWorkText is not None and disabledWorkText.strip() != "None":
-            self.disabledWork.extend(filter(lambda x: x != "", map(
-                lambda x: x.strip(), disabledWorkText.split(","))))
-        self.requiredWork: List[str] = []
-        for li in tdef.iterfind("./requiredWorkTags/li"):
-            assert li.text is not None
-            self.requiredWork.append(li.text)
-        requiredWorkText = tdef.findtext("requiredWorkTags")
-        if requiredWorkText is not None and requiredWorkText.strip() != "None":
-            self.requiredWork.extend(filter(lambda x: x != "", map(
-                lambda x: x.strip(), requiredWorkText.split(","))))
-
-        self.degrees: Dict[int, traitDegree] = {}
-        for li in tdef.iterfind("./degreeDatas/li"):
-            degree: traitDegree = traitDegree(li)
-            self.degrees[degree.degree] = degree
-
-        """
-        commonalityFemale (e.g. Traits_Singular.xml -> DislikesMen, DislikesWomen. Seems to be an override, meaning commonality is the value for males)
-        """
-
-    def export(self) -> Dict[str, Union[str, int, List[str], Dict[str, int]]]:
-        degrees: Dict[int, dict] = {}
-        for degree in self.degrees:
-            degrees[degree] = self.degrees[degree].export()
-        return {
-            "name": self.defName,
-            "commonality": self.commonality,
-            "conflictingTraits": self.conflictingTraits,
-            "exclusionTags": self.exclusionTags,
-            "forcedFlames": self.forcedFlames,
-            "conflictingFlames": self.conflictingFlames,
-            "disabledWork": self.disabledWork,
-            "requiredWork": self.requiredWork,
-            "degrees": degrees
-        }
-
-
-traits: List[dict] = []
-
-for filePath in files:
-    tree = ET.ElementTree(file=filePath)
-    for tdef in tree.iterfind("./TraitDef"):
-        b = trait(tdef)
-        traits.append(b.export())
-
-traitsFileTS = open(Path("./data/traits.ts").resolve(), "w+")
-traitsFileJS = open(Path("./docs/traits.js").resolve(), "w+")
-jsonString = json.dumps(traits, separators=(",", ":"))
-traitsFileTS.write(f"export var traits = {jsonString};")
-traitsFileJS.write("/** @type { Trait[] } */\n" +
-                   f"var traits = {jsonString};")
+import bundle
+from bundle import writeBundle
+from cache import writeIfChanged
+from indexes import conflictRows, indexJS, indexTS, nameIndex
+from search import writeSearch
+from defs import extractor, parseArgs, runExtractors
+from strings import stringFields, writeStrings
+from schema import descriptionCleaner, dictField, field, listField, liDict, liRecords, pawnTokens, schema, text, workList
+
+
+# Each <li> in a TraitDef's <degreeDatas>
+traitDegreeSchema = schema(
+    field("label"),
+    field("desc", "description", text(descriptionCleaner(pawnTokens("[]", "{}")))),
+    field("degree", read=text(int), default=0),
+    dictField("skills", "skillGains", liDict("key", "value", int)),
+    dictField("statOffsets"),
+    dictField("statFactors"),
+    listField("meditationTypes", "allowedMeditationFocusTypes"),
+    field("hungerRateFactor", read=text(float))
+    # theOnlyAllowedMentalBreaks (e.g. Traits_Singular.xml -> Gourmand, Pyromaniac)
+    # randomMentalState (e.g. Traits_Singular.xml -> Gourmand, Pyromaniac)
+    # randomMentalStateMtbDaysMoodCurve (e.g. Traits_Singular.xml -> Gourmand, Pyromaniac)
+    # mentalBreakInspirationGainSet (e.g. Traits_Singular.xml -> TorturedArtist)
+    # mentalBreakInspirationGainReasonText (e.g. Traits_Singular.xml -> TorturedArtist)
+    # mentalBreakInspirationGainChance (e.g. Traits_Singular.xml -> TorturedArtist)
+    # disallowedInspirations (e.g. Traits_Singular.xml -> Brawler)
+    # disallowedMeditationFocusTypes (e.g. Traits_Singular.xml -> Ascetic)
+    # marketValueFactorOffset (e.g. Traits_Singular.xml -> Wimp)
+    # disallowedThoughtsFromIngestion (e.g. Traits_Singular.xml -> Cannibal)
+    # extraThoughtsFromIngestion (e.g. Traits_Singular.xml -> Cannibal)
+    # socialFightChanceFactor (e.g. Traits_Singular.xml -> Bloodlust)
+    # randomDiseaseMtbDays (e.g. Traits_Spectrum.xml -> Immunity/sickly)
+)
+
+# Every key is kept, even when empty
+# Not read: commonalityFemale (e.g. Traits_Singular.xml -> DislikesMen, DislikesWomen. Seems to be an override, meaning commonality is the value for males)
+traitSchema = schema(
+    field("name", "defName"),
+    field("commonality", read=text(float), default=1.0),
+    listField("conflictingTraits"),
+    listField("exclusionTags"),
+    listField("forcedFlames", "forcedPassions"),
+    listField("conflictingFlames", "conflictingPassions"),
+    listField("disabledWork", "disabledWorkTags", workList),
+    listField("requiredWork", "requiredWorkTags", workList),
+    dictField("degrees", "degreeDatas", liRecords(traitDegreeSchema, "degree")),
+    prune=False
+)
+traitStrings = stringFields(traitSchema, [], {"degrees": stringFields(traitDegreeSchema, ["label", "desc"])})
+
+
+def conflictTable(traits: List[dict]) -> dict:
+    """
+    One conflict row per degree, keyed "{trait}:{degree}"; degrees of the same trait always conflict.
+    Traits conflict when they share an exclusion tag or either lists the other in conflictingTraits
+    """
+    keys: List[str] = []
+    has: List[List[str]] = []
+    conflictsWith: List[List[str]] = []
+    for t in traits:
+        tags = ["tag:" + tag for tag in t["exclusionTags"]]
+        for degree in t["degrees"]:
+            keys.append(f"{t['name']}:{degree}")
+            has.append(tags + ["name:" + t["name"]] + ["lists:" + x for x in t["conflictingTraits"]])
+            conflictsWith.append(tags + ["name:" + t["name"], "lists:" + t["name"]] + ["name:" + x for x in t["conflictingTraits"]])
+    return {"keys": keys, "rows": conflictRows(has, conflictsWith)}
+
+
+class traitExtractor(extractor):
+    name = "traits"
+    tags = ["TraitDef"]
+
+    def extract(self, tdef: ET.Element):
+        return "traits", traitSchema.read(tdef)
+
+    def write(self, records: Dict[str, List[dict]]):
+        traits: List[dict] = records.get("traits", [])
+
+        traitConflicts = conflictTable(traits)
+        tables = writeStrings("traits", {"traits": (traits, "TraitDef", traitStrings)})
+        writeSearch("traits", tables, {"traits": traits})
+
+        jsonString = json.dumps(traits, separators=(",", ":"))
+        traitIndex = nameIndex(traits)
+        writeIfChanged(Path("./data/traits.ts").resolve(),
+                       f"export var traits = {jsonString};\n" + indexTS("traitIndex", traitIndex) + "\n" +
+                       indexTS("traitConflicts", traitConflicts))
+        writeIfChanged(Path("./docs/traits.js").resolve(), "/** @type { Trait[] } */\n" +
+                       f"var traits = {jsonString};\n" + indexJS("traitIndex", "NameIndex", traitIndex) + "\n" +
+                       indexJS("traitConflicts", "TraitConflicts", traitConflicts))
+        if bundle.enabled:
+            writeBundle("traits", {"traits": traits}, {"traitIndex": traitIndex, "traitConflicts": traitConflicts})
+
+if __name__ == "__main__":
+    args = parseArgs()
+    runExtractors(args.directory, [traitExtractor()], jobs=args.jobs)
@@ -0,0 +1,234 @@
+# Watch mode for build.py: keeps every Def parsed in memory and regenerates the outputs as the Defs and textures change
+# Only changed files are parsed again, only Defs in them or inheriting from them are extracted again,
+# and only extractors whose records (or, for those with graphics, textures) changed write their outputs
+# Patches can change any Def, so with patch files every change reruns the whole extraction instead
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from xml.etree import ElementTree as ET
+import copy
+import os
+import sys
+import time
+import traceback
+import graphics
+import profiling
+import strings
+from defs import buildHandlers, extractor, findXmlFiles, isAbstract, iterDefs, runExtractors
+from inheritance import inheritanceResolver
+
+Stamp = Tuple[int, int]
+
+
+def stamp(filePath: Path) -> Stamp:
+    st = filePath.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+def scanTextures(directory: str) -> Dict[str, Stamp]:
+    """The stamp of every png under directory"""
+    stamps: Dict[str, Stamp] = {}
+    for dirPath, _, fileNames in os.walk(directory):
+        for fileName in fileNames:
+            if fileName.lower().endswith(".png"):
+                try:
+                    stamps[os.path.join(dirPath, fileName)] = stamp(Path(dirPath, fileName))
+                except OSError:
+                    pass
+    return stamps
+
+
+def ancestors(resolver: inheritanceResolver, bdef: ET.Element) -> List[Optional[ET.Element]]:
+    """The Defs bdef inherits from, nearest first, ending in None if a parent is missing or the chain loops"""
+    chain: List[Optional[ET.Element]] = []
+    seen: Set[Tuple[str, str]] = set()
+    while "ParentName" in bdef.attrib:
+        key = (bdef.tag, bdef.attrib["ParentName"])
+        if key not in resolver.named or key in seen:
+            chain.append(None)
+            break
+        seen.add(key)
+        bdef = resolver.named[key]
+        chain.append(bdef)
+    return chain
+
+
+class watchedDef:
+    """A Def from a file, with what its extractors last returned and the ancestors it was resolved through then"""
+    __slots__ = ("bdef", "wanted", "ancestors", "entries")
+
+    def __init__(self, bdef: ET.Element, wanted: List[str]):
+        self.bdef = bdef
+        self.wanted = wanted
+        self.ancestors: Optional[List[Optional[ET.Element]]] = None
+        self.entries: Dict[str, Optional[Tuple[str, dict]]] = {}
+
+
+class defWatcher:
+    """
+    Every Def the extractors want (and every named Def they may inherit from), by file.
+    Changed files get new elements, so a Def needs extracting again exactly when it or one of its ancestors
+    is not the same element it was last resolved through.
+    """
+
+    def __init__(self, directory: str, graphicsDir: Optional[str], extractors: List[extractor]):
+        self.directory = directory
+        self.graphicsDir = graphicsDir
+        self.extractors = extractors
+        self.handlers = buildHandlers(extractors)
+        self.byName: Dict[str, extractor] = {e.name: e for e in extractors}
+        self.stamps: Dict[Path, Stamp] = {}
+        self.defs: Dict[Path, List[watchedDef]] = {}
+        self.textures: Optional[Dict[str, Stamp]] = None
+        # The records each extractor last wrote, to tell whether its outputs need writing again
+        self.written: Dict[str, Dict[str, List[dict]]] = {}
+
+    def readFile(self, filePath: Path) -> List[watchedDef]:
+        defs: List[watchedDef] = []
+        for bdef in iterDefs(filePath):
+            if bdef.tag not in self.handlers:
+                continue
+            wanted = [] if isAbstract(bdef) else [
+                e.name for e in self.handlers[bdef.tag] if filePath.name not in e.exclude]
+            if "Name" in bdef.attrib or len(wanted) > 0:
+                defs.append(watchedDef(bdef, wanted))
+        return defs
+
+    def update(self) -> bool:
+        """Checks for changes and regenerates whatever they affect. Returns whether anything changed"""
+        started = time.perf_counter()
+        with profiling.phase("discovery"):
+            files, patchFiles = findXmlFiles(self.directory)
+            stamps: Dict[Path, Stamp] = {}
+            for filePath in files + patchFiles:
+                try:
+                    stamps[filePath] = stamp(filePath)
+                except OSError:
+                    # Deleted since it was listed
+                    pass
+            textures = scanTextures(self.graphicsDir) if self.graphicsDir is not None else {}
+        changed = [f for f in stamps if self.stamps.get(f) != stamps[f]]
+        removed = [f for f in self.stamps if f not in stamps]
+        first = self.textures is None
+        changedTextures = 0 if first else sum(
+            1 for t in textures.keys() | self.textures.keys() if textures.get(t) != self.textures.get(t))
+        if not first and len(changed) == 0 and len(removed) == 0 and changedTextures == 0:
+            return False
+        # Translations are only read again when something else changes
+        strings.forgetTranslations()
+
+        if len(patchFiles) > 0:
+            self.stamps = stamps
+            self.textures = textures
+            # Read everything again if the patches are ever taken out
+            self.defs = {}
+            self.written = {}
+            if changedTextures > 0:
+                graphics.forgetTextures()
+            try:
+                runExtractors(self.directory, self.extractors)
+            except Exception:
+                traceback.print_exc()
+            summary = f"Read {len(stamps)} Def and patch files" if first else \
+                f"{len(changed) + len(removed)} Def and patch files and {changedTextures} textures changed"
+            print(f"{summary}: patched and wrote everything in {time.perf_counter() - started:.2f}s")
+            return True
+
+        for filePath in stamps:
+            if filePath in self.defs and filePath not in changed:
+                continue
+            try:
+                self.defs[filePath] = self.readFile(filePath)
+            except ET.ParseError as err:
+                # Most likely saved halfway through an edit; the next save will be read again
+                print(f"{filePath}: {err}; keeping its previous Defs", file=sys.stderr)
+                self.defs.setdefault(filePath, [])
+        for filePath in removed:
+            self.defs.pop(filePath, None)
+        self.stamps = stamps
+        self.textures = textures
+        if changedTextures > 0:
+            graphics.forgetTextures()
+
+        resolver = inheritanceResolver()
+        for filePath in stamps:
+            for d in self.defs[filePath]:
+                if "Name" in d.bdef.attrib:
+                    resolver.add(d.bdef)
+        records: Dict[str, Dict[str, List[dict]]] = {e.name: {} for e in self.extractors}
+        extracted = 0
+        for filePath in stamps:
+            for d in self.defs[filePath]:
+                if len(d.wanted) == 0:
+                    continue
+                chain = ancestors(resolver, d.bdef)
+                if d.ancestors is None or len(chain) != len(d.ancestors) or any(a is not b for a, b in zip(chain, d.ancestors)):
+                    d.ancestors = chain
+                    d.entries = {}
+                    extracted += 1
+                    if len(chain) > 0 and chain[-1] is None:
+                        print(f"{filePath.name}: {d.bdef.tag} {d.bdef.findtext('defName')} has a missing or looping ParentName",
+                              file=sys.stderr)
+                        continue
+                    try:
+                        with profiling.phase("inherit"):
+                            resolved = resolver.resolve(d.bdef)
+                        with profiling.phase("extract"):
+                            for name in d.wanted:
+                                d.entries[name] = self.byName[name].extract(resolved)
+                    except Exception:
+                        print(f"{filePath.name}: couldn't read {d.bdef.tag} {d.bdef.findtext('defName')}", file=sys.stderr)
+                        traceback.print_exc()
+                        d.entries = {}
+                for name, entry in d.entries.items():
+                    if entry is not None:
+                        records[name].setdefault(entry[0], []).append(entry[1])
+
+        rewritten: List[str] = []
+        for e in self.extractors:
+            usesTextures = getattr(e, "graphicsDir", None) is not None
+            if e.name in self.written and records[e.name] == self.written[e.name] and not (usesTextures and changedTextures > 0):
+                continue
+            # write may change the records it's given, and these are kept to compare with next time
+            try:
+                with profiling.phase("serialize"):
+                    e.write(copy.deepcopy(records[e.name]))
+                self.written[e.name] = records[e.name]
+                rewritten.append(e.name)
+            except Exception:
+                print(f"Couldn't write {e.name}", file=sys.stderr)
+                traceback.print_exc()
+                self.written.pop(e.name, None)
+
+        seconds = time.perf_counter() - started
+        if first:
+            print(f"Read {len(stamps)} Def files and wrote {', '.join(rewritten) or 'nothing'} in {seconds:.2f}s")
+        else:
+            print(f"{len(changed) + len(removed)} Def files and {changedTextures} textures changed: "
+                  f"extracted {extracted} Defs and wrote {', '.join(rewritten) or 'nothing'} in {seconds * 1000:.0f}ms")
+        return True
+
+
+def watch(directory: str, graphicsDir: Optional[str], extractors: List[extractor], interval: float = 0.25,
+          after: Optional[Callable[[], object]] = None):
+    """
+    Builds everything once, then polls for changes every interval seconds until interrupted
+    after: called whenever the outputs were regenerated (e.g. the link stage)
+    """
+    graphics.keepResident = True
+    watcher = defWatcher(directory, graphicsDir, extractors)
+
+    def update():
+        if watcher.update() and after is not None:
+            try:
+                after()
+            except Exception:
+                traceback.print_exc()
+
+    update()
+    print(f"Watching {directory}" + (f" and {graphicsDir}" if graphicsDir is not None else "") + " (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(interval)
+            update()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,416 @@
+# Dense gene stat matrices and a xenotype search over them, for precomputing recommended gene sets
+# Reads the genes genes.py exported (data/genes.ts) and finds the best-scoring gene sets within a game's rules
+# (the same minMetabolism, maxComplexity and bannedGenes as the worker's Ruleset), with no two genes sharing an exclusion tag:
+#   python scripts/xenotypes.py builds.json --out xenotypes.json
+# where builds.json names each build to find, e.g.
+#   {"Shooter": {"weights": {"skills:Shooting": 1, "statOffsets:ShootingAccuracyPawn": 2}, "minMetabolism": -5, "maxComplexity": 20}}
+# Stats are "{kind}:{stat}" columns, kind being statOffsets, statFactors, damageFactors or skills.
+# Factors are kept as their logarithms, so a set's column sum is its total offset or the log of its total factor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+import argparse
+import heapq
+import json
+import math
+import sys
+import time
+import numpy as np
+from indexes import readTS
+
+# Kinds of stat columns, and whether they multiply (and so are stored as logarithms)
+statKinds: Dict[str, bool] = {"statOffsets": False, "statFactors": True, "damageFactors": True, "skills": False}
+# Scores closer than this count as a tie
+tolerance = 1e-9
+# Quantiles of the genes' score per cost tried as prices in the search's Lagrangian bounds
+pricePoints = [0.1, 0.25, 0.5, 0.75, 0.9]
+# How far apart the prices around the best pair are, each time zooming in on it
+refineSteps = [2.0, 1.4, 1.2, 1.1, 1.05]
+# Factors of 0 (e.g. Sterile's Fertility) are taken as this, to keep their logarithms finite
+minFactor = 0.01
+
+
+def readGenes(filePath: Path = Path("./data/genes.ts")) -> List[dict]:
+    """The genes array of a data/genes.ts written by genes.py"""
+    return readTS(filePath, "genes")
+
+
+class geneMatrix:
+    """
+    The genes as arrays, a row per gene:
+    stats (genes x columns), metabolism and complexity vectors, and which genes conflict (genes x genes)
+    """
+
+    def __init__(self, genes: List[dict]):
+        self.names: List[str] = [g["name"] for g in genes]
+        self.index: Dict[str, int] = dict((name, i) for i, name in enumerate(self.names))
+        self.columns: List[str] = sorted(set(f"{kind}:{stat}" for g in genes for kind in statKinds for stat in g.get(kind, {})))
+        self.columnIndex: Dict[str, int] = dict((c, i) for i, c in enumerate(self.columns))
+        self.stats = np.zeros((len(genes), len(self.columns)))
+        for i, g in enumerate(genes):
+            for kind, multiplies in statKinds.items():
+                for stat, value in g.get(kind, {}).items():
+                    self.stats[i, self.columnIndex[f"{kind}:{stat}"]] = math.log(max(value, minFactor)) if multiplies else value
+        self.metabolism = np.array([g.get("metabolism", 0) for g in genes], dtype=np.int64)
+        self.complexity = np.array([g.get("complexity", 1) for g in genes], dtype=np.int64)
+        tags = sorted(set(t for g in genes for t in g.get("exclusionTags", [])))
+        tagIndex = dict((t, i) for i, t in enumerate(tags))
+        hasTag = np.zeros((len(genes), len(tags)), dtype=np.int32)
+        for i, g in enumerate(genes):
+            for t in g.get("exclusionTags", []):
+                hasTag[i, tagIndex[t]] = 1
+        self.conflicts: np.ndarray = (hasTag @ hasTag.T) > 0
+        np.fill_diagonal(self.conflicts, False)
+        # A group per gene, at most one of which can be in a set: its most shared tag, or the gene alone if it has none
+        self.groups = len(tags) + np.arange(len(genes))
+        if len(tags) > 0:
+            sizes = hasTag.sum(axis=0)
+            self.groups = np.where(hasTag.any(axis=1), np.argmax(hasTag * sizes, axis=1), self.groups)
+
+    def weightVector(self, weights: Dict[str, float]) -> np.ndarray:
+        """weights ({column: weight}) as a vector over the columns; columns no gene has are ignored"""
+        w = np.zeros(len(self.columns))
+        for column, weight in weights.items():
+            if column in self.columnIndex:
+                w[self.columnIndex[column]] = weight
+        return w
+
+    def scores(self, weights: Dict[str, float]) -> np.ndarray:
+        """Each gene's score alone"""
+        return self.stats @ self.weightVector(weights)
+
+    def mask(self, names: Iterable[str]) -> np.ndarray:
+        """A boolean row per gene, true for names"""
+        m = np.zeros(len(self.names), dtype=bool)
+        for name in names:
+            if name not in self.index:
+                raise KeyError(f"No gene {name}")
+            m[self.index[name]] = True
+        return m
+
+    def scoreSets(self, sets: np.ndarray, weights: Dict[str, float]) -> np.ndarray:
+        """The scores of many gene sets at once, given as a boolean (sets x genes) matrix"""
+        return sets.astype(np.float64) @ self.scores(weights)
+
+    def totals(self, sets: np.ndarray) -> np.ndarray:
+        """Each gene set's summed stat columns (sets x columns); factor columns are logarithms"""
+        return sets.astype(np.float64) @ self.stats
+
+
+class xenotype:
+    __slots__ = ("genes", "score", "metabolism", "complexity")
+
+    def __init__(self, genes: List[str], score: float, metabolism: int, complexity: int):
+        self.genes = genes
+        self.score = score
+        self.metabolism = metabolism
+        self.complexity = complexity
+
+    def toJSON(self) -> dict:
+        return {"genes": self.genes, "score": round(self.score, 6), "metabolism": self.metabolism, "complexity": self.complexity}
+
+
+class xenotypeSearch:
+    """
+    Branch and bound over the genes worth considering, ordered by their scores net of priced complexity and metabolism.
+    Each node decides one gene: with it, then without it. A branch is cut when its remaining genes can't bring metabolism
+    up to the minimum, or when it can't beat the top results so far. Its score is bounded by the least of
+    the fractional knapsacks of its remaining positive genes over the complexity left and over the metabolism left,
+    the best scores of as many genes as may still be added, and Lagrangian relaxations taking one gene per exclusion group
+    for a grid of prices on complexity and metabolism, scored all at once; none is ever below the best set it could reach.
+    gap: also cut branches that could beat the results by no more than this fraction, trading exactness for speed
+    when many genes score almost nothing
+    """
+
+    def __init__(self, matrix: geneMatrix, weights: Dict[str, float], minMetabolism: float = -math.inf,
+                 maxComplexity: float = math.inf, bannedGenes: Sequence[str] = (), requiredGenes: Sequence[str] = (),
+                 maxGenes: Optional[int] = None, top: int = 1, gap: float = 0.0):
+        self.matrix = matrix
+        self.minMetabolism = minMetabolism
+        self.maxComplexity = maxComplexity
+        self.maxGenes = len(matrix.names) if maxGenes is None else maxGenes
+        self.top = top
+        self.gap = gap
+        self.nodes = 0
+        geneScores = matrix.scores(weights)
+        self.geneScores = geneScores
+
+        required = matrix.mask(requiredGenes)
+        banned = matrix.mask(bannedGenes)
+        if (required & banned).any():
+            raise ValueError("A gene is both required and banned")
+        if (matrix.conflicts[required][:, required]).any():
+            raise ValueError("The required genes conflict with each other")
+        self.required = np.flatnonzero(required)
+        # Genes that neither score nor give metabolism back can't improve a set, and so are never added
+        useful = ~banned & ~required & ~matrix.conflicts[required].any(axis=0) & \
+            ((geneScores > 0) | (matrix.metabolism > 0))
+        candidates = np.flatnonzero(useful)
+        score = geneScores[candidates]
+        met = matrix.metabolism[candidates]
+        cpx = matrix.complexity[candidates]
+        self.baseScore = float(geneScores[self.required].sum())
+        self.baseMet = int(matrix.metabolism[self.required].sum())
+        self.baseCpx = int(matrix.complexity[self.required].sum())
+
+        # Prices on complexity and metabolism for the Lagrangian bounds: none, and spread over the genes' score per cost
+        positive = score > 0
+        costly = positive & (met < 0)
+        cpxPrices = [0.0] if maxComplexity == math.inf or not positive.any() else \
+            [0.0] + list(np.quantile(score[positive] / np.maximum(cpx[positive], 1), pricePoints))
+        metPrices = [0.0] if minMetabolism == -math.inf or not costly.any() else \
+            [0.0] + list(np.quantile(score[costly] / -met[costly], pricePoints))
+        grid = np.array([(a, b) for a in cpxPrices for b in metPrices])
+        self.group = matrix.groups[candidates]
+        self.byGroup = np.argsort(self.group, kind="stable")
+
+        def usePrices(prices: np.ndarray) -> np.ndarray:
+            """Sets the pairs of prices bounds are taken at, returning their bounds on the whole search"""
+            self.cpxPrices = prices[:, 0]
+            self.metPrices = prices[:, 1]
+            # Each gene's score less what it costs at each pair of prices
+            self.priced = score[None, :] - self.cpxPrices[:, None] * cpx[None, :] + self.metPrices[:, None] * met[None, :]
+            return self.lagrangian(np.ones(len(candidates), dtype=bool), self.baseMet, self.baseCpx)
+
+        # Zoom in on the best pair of prices for the whole search, and keep the pairs around it too
+        prices = grid
+        best = grid[int(np.argmin(usePrices(grid)))]
+        for step in refineSteps:
+            around = [[best[i] * f for f in (1 / step, 1, step)] if best[i] > 0 else
+                      [0.0] if len(values) == 1 else [0.0, values[1] / step] for i, values in enumerate((cpxPrices, metPrices))]
+            prices = np.array([(a, b) for a in around[0] for b in around[1]])
+            best = prices[int(np.argmin(usePrices(prices)))]
+        rootPrices = int(np.argmin(usePrices(np.concatenate((grid, prices)))))
+        priced = self.priced
+
+        # Genes are tried in order of their priced score at the prices that bound the whole search best,
+        # which balances score against complexity and metabolism and so finds good sets early
+        perm = np.lexsort((-met, -score, -priced[rootPrices]))
+        # Everything below is indexed by position in order
+        self.order = candidates[perm]
+        self.score = score[perm]
+        self.met = met[perm]
+        self.cpx = cpx[perm]
+        self.priced = priced[:, perm]
+        self.group = self.group[perm]
+        self.byGroup = np.argsort(self.group, kind="stable")
+        self.conflicts = matrix.conflicts[np.ix_(self.order, self.order)]
+        # For the other bounds: the positive-scoring candidates by score, and by score per complexity and per metabolism spent.
+        # Genes that cost nothing come first
+        positive = np.flatnonzero(self.score > 0)
+        self.byScore = positive[np.argsort(-self.score[positive], kind="stable")]
+        self.byComplexity = positive[np.argsort(-self.score[positive] / np.maximum(self.cpx[positive], tolerance), kind="stable")]
+        self.byMetabolism = positive[np.argsort(-self.score[positive] / np.maximum(-self.met[positive], tolerance), kind="stable")]
+        # Heap of (score, -genes added, metabolism, -node, positions added), worst first
+        self.results: List[Tuple[float, int, int, int, List[int]]] = []
+        self.recorded: Set[Tuple[int, ...]] = set()
+
+    def threshold(self) -> float:
+        """What a branch's bound must beat to be searched"""
+        if len(self.results) < self.top:
+            return -math.inf
+        return self.results[0][0] + tolerance + self.gap * abs(self.results[0][0])
+
+    def knapsack(self, candidates: np.ndarray, cost: np.ndarray, budget: float) -> float:
+        """
+        The most candidates (best score per cost first) could add within budget, allowing a fraction of one.
+        Candidates costing nothing or less are free: they're all taken first, and what they give back adds to the budget
+        """
+        score = self.score[candidates]
+        if len(candidates) == 0 or budget == math.inf:
+            return float(score.sum())
+        free = cost <= 0
+        total = float(score[free].sum())
+        budget -= float(cost[free].sum())
+        if budget < 0:
+            # Nothing to extrapolate from: only the other genes could make up the shortfall, so bound by everything
+            return float(score.sum())
+        score, cost = score[~free], cost[~free]
+        used = np.cumsum(cost)
+        fits = used <= budget
+        total += float(score[fits].sum())
+        if not fits.all():
+            firstOut = int(np.argmin(fits))
+            total += float(score[firstOut]) * (budget - (used[firstOut] - cost[firstOut])) / cost[firstOut]
+        return total
+
+    def canBeat(self, allowed: np.ndarray, score: float, met: int, cpx: int, genesLeft: int) -> bool:
+        """Whether adding allowed candidates to a set with score, met and cpx might beat the results, cheapest bounds first"""
+        target = self.threshold() - score
+        if target == -math.inf:
+            return True
+        if float(self.score[self.byScore[allowed[self.byScore]]][:genesLeft].sum()) <= target:
+            return False
+        byComplexity = self.byComplexity[allowed[self.byComplexity]]
+        if self.knapsack(byComplexity, self.cpx[byComplexity], self.maxComplexity - cpx) <= target:
+            return False
+        if self.minMetabolism > -math.inf:
+            # Metabolism left, counting every gene that could give some back for free
+            metLeft = met - self.minMetabolism + int(self.met[allowed & (self.score <= 0)].clip(min=0).sum())
+            byMetabolism = self.byMetabolism[allowed[self.byMetabolism]]
+            if self.knapsack(byMetabolism, -self.met[byMetabolism], metLeft) <= target:
+                return False
+        return float(self.lagrangian(allowed, met, cpx).min()) > target
+
+    def lagrangian(self, allowed: np.ndarray, met: int, cpx: int) -> np.ndarray:
+        """
+        For each pair of prices, the most the allowed candidates could add if complexity and metabolism could be bought
+        at those prices and only one gene per exclusion group could be taken
+        """
+        byGroup = self.byGroup[allowed[self.byGroup]]
+        if len(byGroup) == 0:
+            return np.zeros(1)
+        group = self.group[byGroup]
+        starts = np.flatnonzero(np.concatenate(([True], group[1:] != group[:-1])))
+        perGroup = np.maximum.reduceat(self.priced[:, byGroup], starts, axis=1).clip(min=0).sum(axis=1)
+        cpxLeft = 0.0 if self.maxComplexity == math.inf else self.maxComplexity - cpx
+        metLeft = 0.0 if self.minMetabolism == -math.inf else met - self.minMetabolism
+        return perGroup + self.cpxPrices * cpxLeft + self.metPrices * metLeft
+
+    def redundant(self, chosen: List[int], met: int) -> List[int]:
+        """Genes in chosen that add nothing to its score and whose metabolism it doesn't need"""
+        return [p for p in chosen if self.score[p] <= 0 and met - self.met[p] >= self.minMetabolism]
+
+    def record(self, chosen: List[int], score: float, met: int):
+        # Of sets with the same score, fewer genes win, then more metabolism left over
+        # (scores are rounded so sums in a different order still tie)
+        key = tuple(sorted(chosen))
+        if key in self.recorded or len(self.redundant(chosen, met)) > 0:
+            return
+        entry = (round(score / tolerance) * tolerance, -len(chosen), met, -self.nodes, list(key))
+        if len(self.results) < self.top:
+            heapq.heappush(self.results, entry)
+        elif entry[:3] > self.results[0][:3]:
+            self.recorded.discard(tuple(heapq.heapreplace(self.results, entry)[4]))
+        else:
+            return
+        self.recorded.add(key)
+
+    def seed(self, score: float, met: int, cpx: int):
+        """
+        Records a greedy set for each pair of prices, so the search starts with results to beat:
+        the genes that are worth their price, then genes giving metabolism back if that's short,
+        then without the genes costing the most metabolism per score until it's enough, and without any it then doesn't need
+        """
+        for priced in self.priced:
+            chosen: List[int] = []
+            blocked = np.zeros(len(self.order), dtype=bool)
+            total = [score, met, cpx]
+
+            def add(p: int):
+                chosen.append(p)
+                blocked[:] |= self.conflicts[p]
+                total[0] += float(self.score[p])
+                total[1] += int(self.met[p])
+                total[2] += int(self.cpx[p])
+
+            def fits(p: int) -> bool:
+                return not blocked[p] and p not in chosen and total[2] + self.cpx[p] <= self.maxComplexity and \
+                    len(chosen) + len(self.required) < self.maxGenes
+
+            for p in np.argsort(-priced, kind="stable"):
+                if priced[p] > 0 and fits(int(p)):
+                    add(int(p))
+            for p in np.argsort(-self.met / np.maximum(self.cpx, 1), kind="stable"):
+                if total[1] >= self.minMetabolism or self.met[p] <= 0:
+                    break
+                if fits(int(p)):
+                    add(int(p))
+            while total[1] < self.minMetabolism and any(self.met[p] < 0 for p in chosen):
+                worst = max((p for p in chosen if self.met[p] < 0), key=lambda p: -self.met[p] / max(float(self.score[p]), tolerance))
+                chosen.remove(worst)
+                total[0] -= float(self.score[worst])
+                total[1] -= int(self.met[worst])
+            while total[1] >= self.minMetabolism and len(self.redundant(chosen, total[1])) > 0:
+                extra = max(self.redundant(chosen, total[1]), key=lambda p: self.met[p])
+                chosen.remove(extra)
+                total[0] -= float(self.score[extra])
+                total[1] -= int(self.met[extra])
+            if total[1] >= self.minMetabolism and len(chosen) > 0:
+                self.record(chosen, total[0], total[1])
+
+    def search(self) -> List[xenotype]:
+        m = self.matrix
+        if self.baseCpx > self.maxComplexity or len(self.required) > self.maxGenes:
+            return []
+        allowed = (self.cpx <= self.maxComplexity - self.baseCpx)
+        self.seed(self.baseScore, self.baseMet, self.baseCpx)
+        sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * len(self.order) + 100))
+        self.visit(0, allowed, [], self.baseScore, self.baseMet, self.baseCpx)
+
+        builds: List[xenotype] = []
+        for score, _, met, _, chosen in sorted(self.results, key=lambda e: e[:3], reverse=True):
+            genes = sorted(list(self.required) + [int(self.order[p]) for p in chosen])
+            builds.append(xenotype([m.names[g] for g in genes], score, met,
+                                   int(m.complexity[genes].sum()) if len(genes) > 0 else 0))
+        return builds
+
+    def visit(self, start: int, allowed: np.ndarray, chosen: List[int], score: float, met: int, cpx: int):
+        """Sets extending chosen with allowed candidates from start on; allowed excludes conflicts and what doesn't fit"""
+        self.nodes += 1
+        if met >= self.minMetabolism and (len(chosen) > 0 or len(self.required) > 0):
+            self.record(chosen, score, met)
+        if len(chosen) + len(self.required) >= self.maxGenes:
+            return
+        rest = allowed.copy()
+        rest[:start] = False
+        if met + int(self.met[rest & (self.score > 0)].clip(max=0).sum()) >= self.minMetabolism:
+            # Nothing left can make metabolism short, so genes that only give it back aren't needed
+            rest &= self.score > 0
+        position = start
+        while True:
+            candidates = np.flatnonzero(rest)
+            if len(candidates) == 0:
+                return
+            # Metabolism can only go up by the positive genes still allowed
+            if met + int(self.met[candidates].clip(min=0).sum()) < self.minMetabolism:
+                return
+            if not self.canBeat(rest, score, met, cpx, self.maxGenes - len(chosen) - len(self.required)):
+                return
+            position = int(candidates[0])
+            rest[position] = False
+            # With position: drop what conflicts with it or no longer fits
+            cpxWith = cpx + int(self.cpx[position])
+            child = rest & ~self.conflicts[position] & (self.cpx <= self.maxComplexity - cpxWith)
+            chosen.append(position)
+            self.visit(position + 1, child, chosen, score + float(self.score[position]), met + int(self.met[position]), cpxWith)
+            chosen.pop()
+            # Without position: carry on with the rest
+
+
+def bestXenotypes(matrix: geneMatrix, weights: Dict[str, float], top: int = 1, **rules) -> List[xenotype]:
+    """
+    The top best-scoring gene sets, best first. rules are those of xenotypeSearch:
+    minMetabolism, maxComplexity, bannedGenes, requiredGenes and maxGenes
+    """
+    return xenotypeSearch(matrix, weights, top=top, **rules).search()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Finds the best gene sets for each build in a JSON file")
+    parser.add_argument("builds", help='JSON object of build name -> {"weights": {column: weight}, and any of '
+                                       '"minMetabolism", "maxComplexity", "bannedGenes", "requiredGenes", "maxGenes"}')
+    parser.add_argument("--genes", default="./data/genes.ts", help="the genes.ts written by genes.py")
+    parser.add_argument("--top", type=int, default=5, help="number of gene sets to find per build")
+    parser.add_argument("--gap", type=float, default=0.0,
+                        help="accept gene sets within this fraction of the best score, to search faster (e.g. 0.01)")
+    parser.add_argument("--out", help="write the results as JSON to this file instead of printing them")
+    parser.add_argument("--columns", action="store_true", help="list the stat columns that can be weighted and exit")
+    args = parser.parse_args()
+
+    matrix = geneMatrix(readGenes(Path(args.genes)))
+    if args.columns:
+        print("\n".join(matrix.columns))
+        sys.exit()
+    ruleKeys = ("minMetabolism", "maxComplexity", "bannedGenes", "requiredGenes", "maxGenes")
+    results: Dict[str, List[dict]] = {}
+    for name, build in json.loads(Path(args.builds).read_text(encoding="utf-8")).items():
+        started = time.perf_counter()
+        search = xenotypeSearch(matrix, build.get("weights", {}), top=args.top, gap=args.gap,
+                                **dict((k, build[k]) for k in ruleKeys if k in build))
+        results[name] = [x.toJSON() for x in search.search()]
+        print(f"{name}: {search.nodes} nodes in {time.perf_counter() - started:.2f}s", file=sys.stderr)
+    jsonString = json.dumps(results, indent=2)
+    if args.out is None:
+        print(jsonString)
+    else:
+        Path(args.out).write_text(jsonString)
@@ -0,0 +1,451 @@
+# The subset of XPath 1.0 that RimWorld patches use, over ElementTree
+# Location paths (absolute, relative, //, ., .., *, @attr, @*, text(), node()) with predicates, unions,
+# or/and, comparisons and the functions not, true, false, contains, starts-with, string-length, normalize-space,
+# string, number, count, last, position, name and local-name
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple, Union
+from xml.etree import ElementTree as ET
+import math
+import re
+
+
+class node:
+    """An element, or its text (attr "#text") or one of its attributes, with the element node it's in"""
+    __slots__ = ("elem", "parent", "attr")
+
+    def __init__(self, elem: ET.Element, parent: Optional["node"], attr: Optional[str] = None):
+        self.elem = elem
+        self.parent = parent
+        self.attr = attr
+
+    def value(self) -> str:
+        if self.attr is None:
+            return "".join(self.elem.itertext())
+        if self.attr == "#text":
+            return self.elem.text or ""
+        return self.elem.get(self.attr, "")
+
+    def key(self) -> Tuple[int, Optional[str]]:
+        return (id(self.elem), self.attr)
+
+
+def document(root: ET.Element) -> node:
+    """The document node above root, for evaluating absolute paths. root's element is wrapped, not copied"""
+    doc = ET.Element("#document")
+    doc.append(root)
+    return node(doc, None)
+
+
+Value = Union[List[node], str, float, bool]
+# Gets a context element's children for a child step more cheaply than checking them all:
+# returns them and how many of the step's predicates they already satisfy, or None to check them all
+ChildrenHook = Callable[[ET.Element, "step"], Optional[Tuple[List[ET.Element], int]]]
+
+
+class XPathError(ValueError):
+    pass
+
+
+# vvv Expressions vvv
+
+def toString(v: Value) -> str:
+    if isinstance(v, list):
+        return v[0].value() if len(v) > 0 else ""
+    if isinstance(v, bool):
+        return "true" if v else "false"
+    if isinstance(v, float):
+        return str(int(v)) if v.is_integer() else str(v)
+    return v
+
+
+def toNumber(v: Value) -> float:
+    if isinstance(v, (list, str)):
+        try:
+            return float(toString(v).strip())
+        except ValueError:
+            return math.nan
+    return float(v)
+
+
+def toBool(v: Value) -> bool:
+    if isinstance(v, float):
+        return v != 0 and not math.isnan(v)
+    return len(v) > 0 if isinstance(v, (list, str)) else v
+
+
+class literal:
+    def __init__(self, value: Union[str, float]):
+        self.value = value
+
+    def eval(self, ctx: node, pos: int, size: int, hook: Optional[ChildrenHook]) -> Value:
+        return self.value
+
+
+_compare = {
+    "=": lambda a, b: a == b, "!=": lambda a, b: a != b,
+    "<": lambda a, b: a < b, ">": lambda a, b: a > b, "<=": lambda a, b: a <= b, ">=": lambda a, b: a >= b
+}
+
+
+def compare(op: str, a: Value, b: Value) -> bool:
+    """XPath 1.0 comparison: node-sets compare true if any of their nodes does"""
+    if isinstance(a, list) or isinstance(b, list):
+        if isinstance(a, list) and isinstance(b, list):
+            bs = [n.value() for n in b]
+            return any(compare(op, n.value(), v) for n in a for v in bs)
+        if isinstance(b, list):
+            # Swap sides, flipping the relational operators
+            flipped = {"<": ">", ">": "<", "<=": ">=", ">=": "<="}.get(op, op)
+            return compare(flipped, b, a)
+        if isinstance(b, bool):
+            return _compare[op](toBool(a), b)
+        return any(compare(op, n.value(), b) for n in a)
+    if op in ("=", "!="):
+        if isinstance(a, bool) or isinstance(b, bool):
+            return _compare[op](toBool(a), toBool(b))
+        if isinstance(a, float) or isinstance(b, float):
+            return _compare[op](toNumber(a), toNumber(b))
+        return _compare[op](a, b)
+    return _compare[op](toNumber(a), toNumber(b))
+
+
+class binary:
+    def __init__(self, op: str, left, right):
+        self.op = op
+        self.left = left
+        self.right = right
+
+    def eval(self, ctx: node, pos: int, size: int, hook: Optional[ChildrenHook]) -> Value:
+        if self.op == "or":
+            return toBool(self.left.eval(ctx, pos, size, hook)) or toBool(self.right.eval(ctx, pos, size, hook))
+        if self.op == "and":
+            return toBool(self.left.eval(ctx, pos, size, hook)) and toBool(self.right.eval(ctx, pos, size, hook))
+        a = self.left.eval(ctx, pos, size, hook)
+        b = self.right.eval(ctx, pos, size, hook)
+        if self.op == "|":
+            if not isinstance(a, list) or not isinstance(b, list):
+                raise XPathError("| needs node-sets on both sides")
+            return unique(a + b)
+        return compare(self.op, a, b)
+
+
+def _argString(args: List[Value], ctx: node) -> str:
+    return toString(args[0]) if len(args) > 0 else ctx.value()
+
+
+_functions = {
+    "not": lambda args, ctx, pos, size: not toBool(args[0]),
+    "true": lambda args, ctx, pos, size: True,
+    "false": lambda args, ctx, pos, size: False,
+    "contains": lambda args, ctx, pos, size: toString(args[1]) in toString(args[0]),
+    "starts-with": lambda args, ctx, pos, size: toString(args[0]).startswith(toString(args[1])),
+    "string-length": lambda args, ctx, pos, size: float(len(_argString(args, ctx))),
+    "normalize-space": lambda args, ctx, pos, size: " ".join(_argString(args, ctx).split()),
+    "string": lambda args, ctx, pos, size: _argString(args, ctx),
+    "number": lambda args, ctx, pos, size: toNumber(args[0]) if len(args) > 0 else toNumber(ctx.value()),
+    "count": lambda args, ctx, pos, size: float(len(args[0])),
+    "last": lambda args, ctx, pos, size: float(size),
+    "position": lambda args, ctx, pos, size: float(pos),
+    "name": lambda args, ctx, pos, size: (args[0][0] if len(args) > 0 and len(args[0]) > 0 else ctx).elem.tag,
+}
+_functions["local-name"] = _functions["name"]
+
+
+class call:
+    def __init__(self, name: str, args: list):
+        if name not in _functions:
+            raise XPathError(f"unsupported function {name}()")
+        self.name = name
+        self.args = args
+
+    def eval(self, ctx: node, pos: int, size: int, hook: Optional[ChildrenHook]) -> Value:
+        return _functions[self.name]([a.eval(ctx, pos, size, hook) for a in self.args], ctx, pos, size)
+
+
+# vvv Location paths vvv
+
+class step:
+    """
+    axis: "child", "attribute", "self", "parent" or "descendant-or-self" (the // between steps)
+    test: an element name, "*", "text()" or "node()"
+    """
+    __slots__ = ("axis", "test", "predicates")
+
+    def __init__(self, axis: str, test: str, predicates: Optional[list] = None):
+        self.axis = axis
+        self.test = test
+        self.predicates = predicates if predicates is not None else []
+
+    def candidates(self, ctx: node, hook: Optional[ChildrenHook]) -> Tuple[List[node], int]:
+        if self.axis == "self":
+            return [ctx], 0
+        if self.axis == "parent":
+            return ([] if ctx.parent is None else [ctx.parent]), 0
+        if ctx.attr is not None:
+            # Text and attributes have no children
+            return [], 0
+        if self.axis == "attribute":
+            names = list(ctx.elem.attrib) if self.test == "*" else [self.test] if self.test in ctx.elem.attrib else []
+            return [node(ctx.elem, ctx, a) for a in names], 0
+        if self.axis == "descendant-or-self":
+            out = [ctx]
+            i = 0
+            while i < len(out):
+                out.extend(node(c, out[i]) for c in out[i].elem)
+                i += 1
+            return out, 0
+        found = hook(ctx.elem, self) if hook is not None else None
+        if found is not None:
+            return [node(c, ctx) for c in found[0]], found[1]
+        out: List[node] = []
+        if self.test in ("text()", "node()") and ctx.elem.text is not None and ctx.elem.text.strip() != "":
+            out.append(node(ctx.elem, ctx, "#text"))
+        if self.test != "text()":
+            out.extend(node(c, ctx) for c in ctx.elem if self.test in ("*", "node()") or c.tag == self.test)
+        return out, 0
+
+    def select(self, ctx: node, hook: Optional[ChildrenHook]) -> List[node]:
+        nodes, done = self.candidates(ctx, hook)
+        for predicate in self.predicates[done:]:
+            kept: List[node] = []
+            for i, n in enumerate(nodes):
+                v = predicate.eval(n, i + 1, len(nodes), hook)
+                if (toNumber(v) == i + 1) if isinstance(v, float) else toBool(v):
+                    kept.append(n)
+            nodes = kept
+        return nodes
+
+
+def unique(nodes: List[node]) -> List[node]:
+    seen = set()
+    out: List[node] = []
+    for n in nodes:
+        if n.key() not in seen:
+            seen.add(n.key())
+            out.append(n)
+    return out
+
+
+class path:
+    def __init__(self, absolute: bool, steps: List[step]):
+        self.absolute = absolute
+        self.steps = steps
+
+    def eval(self, ctx: node, pos: int, size: int, hook: Optional[ChildrenHook]) -> Value:
+        if self.absolute:
+            while ctx.parent is not None:
+                ctx = ctx.parent
+        nodes = [ctx]
+        for s in self.steps:
+            out: List[node] = []
+            for n in nodes:
+                out.extend(s.select(n, hook))
+            nodes = unique(out) if s.axis in ("parent", "descendant-or-self") or len(nodes) > 1 else out
+        return nodes
+
+
+def equalityKeys(expr) -> Optional[List[Tuple[str, str]]]:
+    """
+    If expr is a comparison of a child's text or an attribute with a string (e.g. defName="Foo" or @Name="Base"),
+    or several of them joined by or, the (child name or "@" + attribute name, string) pairs; otherwise None
+    """
+    if isinstance(expr, binary) and expr.op == "or":
+        left, right = equalityKeys(expr.left), equalityKeys(expr.right)
+        return None if left is None or right is None else left + right
+    if not isinstance(expr, binary) or expr.op != "=":
+        return None
+    side, other = (expr.left, expr.right) if isinstance(expr.right, literal) else (expr.right, expr.left)
+    if not isinstance(other, literal) or not isinstance(other.value, str) or not isinstance(side, path):
+        return None
+    if side.absolute or len(side.steps) != 1 or len(side.steps[0].predicates) > 0:
+        return None
+    s = side.steps[0]
+    if s.axis == "child" and s.test not in ("*", "text()", "node()"):
+        return [(s.test, other.value)]
+    if s.axis == "attribute" and s.test != "*":
+        return [("@" + s.test, other.value)]
+    return None
+
+
+# vvv Parsing vvv
+
+_token = re.compile(r"""\s*(?:(\d+(?:\.\d*)?|\.\d+)|("[^"]*"|'[^']*')|(//|\.\.|!=|<=|>=|::|[/\[\]()@,|=<>.*])|([A-Za-z_][\w.\-]*))""")
+
+
+def tokenize(text: str) -> List[Tuple[str, str]]:
+    tokens: List[Tuple[str, str]] = []
+    i = 0
+    while text[i:].strip() != "":
+        m = _token.match(text, i)
+        if m is None:
+            raise XPathError(f"can't read {text[i:]!r}")
+        number, string, op, name = m.groups()
+        if number is not None:
+            tokens.append(("number", number))
+        elif string is not None:
+            tokens.append(("string", string[1:-1]))
+        elif op == "::":
+            raise XPathError("axes other than the abbreviated ones aren't supported")
+        elif op is not None:
+            tokens.append(("op", op))
+        else:
+            tokens.append(("name", name))
+        i = m.end()
+    return tokens
+
+
+class _parser:
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.i = 0
+
+    def peek(self, offset: int = 0) -> Tuple[str, str]:
+        i = self.i + offset
+        return self.tokens[i] if i < len(self.tokens) else ("end", "")
+
+    def isOp(self, *ops: str) -> bool:
+        kind, value = self.peek()
+        return kind == "op" and value in ops
+
+    def isName(self, *names: str) -> bool:
+        kind, value = self.peek()
+        return kind == "name" and value in names
+
+    def expect(self, op: str):
+        if not self.isOp(op):
+            raise XPathError(f"expected {op} in {self.text!r}")
+        self.i += 1
+
+    def parse(self):
+        expr = self.orExpr()
+        if self.i < len(self.tokens):
+            raise XPathError(f"unexpected {self.peek()[1]!r} in {self.text!r}")
+        return expr
+
+    def orExpr(self):
+        expr = self.andExpr()
+        while self.isName("or"):
+            self.i += 1
+            expr = binary("or", expr, self.andExpr())
+        return expr
+
+    def andExpr(self):
+        expr = self.equality()
+        while self.isName("and"):
+            self.i += 1
+            expr = binary("and", expr, self.equality())
+        return expr
+
+    def equality(self):
+        expr = self.relational()
+        while self.isOp("=", "!="):
+            op = self.peek()[1]
+            self.i += 1
+            expr = binary(op, expr, self.relational())
+        return expr
+
+    def relational(self):
+        expr = self.union()
+        while self.isOp("<", ">", "<=", ">="):
+            op = self.peek()[1]
+            self.i += 1
+            expr = binary(op, expr, self.union())
+        return expr
+
+    def union(self):
+        expr = self.primary()
+        while self.isOp("|"):
+            self.i += 1
+            expr = binary("|", expr, self.primary())
+        return expr
+
+    def primary(self):
+        kind, value = self.peek()
+        if kind == "string":
+            self.i += 1
+            return literal(value)
+        if kind == "number":
+            self.i += 1
+            return literal(float(value))
+        if self.isOp("("):
+            self.i += 1
+            expr = self.orExpr()
+            self.expect(")")
+            return expr
+        if kind == "name" and value not in ("text", "node") and self.peek(1) == ("op", "("):
+            self.i += 2
+            args = []
+            while not self.isOp(")"):
+                if len(args) > 0:
+                    self.expect(",")
+                args.append(self.orExpr())
+            self.i += 1
+            return call(value, args)
+        return self.locationPath()
+
+    def locationPath(self) -> path:
+        steps: List[step] = []
+        absolute = self.isOp("/", "//")
+        if self.isOp("/"):
+            self.i += 1
+            if not self.startsStep():
+                return path(True, [])
+        elif self.isOp("//"):
+            self.i += 1
+            steps.append(step("descendant-or-self", "node()"))
+        steps.append(self.step())
+        while self.isOp("/", "//"):
+            if self.isOp("//"):
+                steps.append(step("descendant-or-self", "node()"))
+            self.i += 1
+            steps.append(self.step())
+        return path(absolute, steps)
+
+    def startsStep(self) -> bool:
+        return self.peek()[0] == "name" or self.isOp(".", "..", "@", "*")
+
+    def step(self) -> step:
+        if self.isOp("."):
+            self.i += 1
+            return step("self", "node()")
+        if self.isOp(".."):
+            self.i += 1
+            return step("parent", "node()")
+        axis = "child"
+        if self.isOp("@"):
+            self.i += 1
+            axis = "attribute"
+        kind, value = self.peek()
+        if self.isOp("*"):
+            test = "*"
+            self.i += 1
+        elif kind == "name" and value in ("text", "node") and self.peek(1) == ("op", "("):
+            self.i += 2
+            self.expect(")")
+            test = value + "()"
+        elif kind == "name":
+            test = value
+            self.i += 1
+        else:
+            raise XPathError(f"expected a step at {value!r} in {self.text!r}")
+        predicates = []
+        while self.isOp("["):
+            self.i += 1
+            predicates.append(self.orExpr())
+            self.expect("]")
+        return step(axis, test, predicates)
+
+
+@lru_cache(maxsize=None)
+def parse(text: str):
+    """Parses an XPath expression once; evaluate it with .eval(context node, 1, 1, hook)"""
+    return _parser(text).parse()
+
+
+def select(text: str, ctx: node, hook: Optional[ChildrenHook] = None) -> List[node]:
+    """The nodes an XPath selects from ctx"""
+    result = parse(text).eval(ctx, 1, 1, hook)
+    if not isinstance(result, list):
+        raise XPathError(f"{text!r} doesn't select nodes")
+    return result
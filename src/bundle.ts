@@ -0,0 +1,128 @@
+// Decodes the binary data bundles written by scripts/bundle.py, for the data/*.bundle.ts modules
+// Mirrors decodeBundle in docs/bundle.js
+
+type Column = {
+    t: "z" | "b" | "i" | "f" | "s" | "j" | "l" | "m";
+    o?: number;
+    w?: 1 | 2 | 4 | 8;
+    p?: number;
+    k?: Column;
+    v?: Column;
+};
+
+type Header = {
+    strings: string[];
+    datasets: { [name: string]: { n: number; c: [string, Column][] } };
+};
+
+function base64ToBuffer(text: string): ArrayBuffer {
+    const binary = atob(text);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++)
+        bytes[i] = binary.charCodeAt(i);
+    return bytes.buffer;
+}
+
+/**
+ * @param data the bundle, or its base64 text
+ * @returns each dataset in the bundle, as the same records as the JSON outputs
+ */
+export function decodeBundle(data: ArrayBuffer | string): { [name: string]: any[] } {
+    const buffer = typeof data == "string" ? base64ToBuffer(data) : data;
+    const bytes = new Uint8Array(buffer);
+    if (String.fromCharCode(...bytes.subarray(0, 4)) != "RWB1")
+        throw new Error("Not a data bundle");
+    const headerLength = new DataView(buffer).getUint32(4, true);
+    const header: Header = JSON.parse(new TextDecoder().decode(bytes.subarray(8, 8 + headerLength)));
+    const body = 8 + headerLength + (8 - (8 + headerLength) % 8) % 8;
+    const strings = header.strings;
+
+    function typed(kind: "i" | "u" | "f", width: number, offset: number, count: number): ArrayLike<number> & Iterable<number> {
+        const start = body + offset;
+        if (kind == "f")
+            return width == 4 ? new Float32Array(buffer, start, count) : new Float64Array(buffer, start, count);
+        if (kind == "i")
+            return width == 1 ? new Int8Array(buffer, start, count) : width == 2 ? new Int16Array(buffer, start, count) : new Int32Array(buffer, start, count);
+        return width == 1 ? new Uint8Array(buffer, start, count) : width == 2 ? new Uint16Array(buffer, start, count) : new Uint32Array(buffer, start, count);
+    }
+    function sum(lengths: ArrayLike<number>): number {
+        let total = 0;
+        for (let i = 0; i < lengths.length; i++)
+            total += lengths[i];
+        return total;
+    }
+
+    function column(desc: Column, count: number): any[] {
+        if (desc.p === undefined)
+            return values(desc, count);
+        const present = bytes.subarray(body + desc.p, body + desc.p + Math.ceil(count / 8));
+        let n = 0;
+        for (let i = 0; i < count; i++)
+            n += (present[i >> 3] >> (i & 7)) & 1;
+        const found = values(desc, n);
+        const out = new Array(count);
+        let next = 0;
+        for (let i = 0; i < count; i++)
+            out[i] = (present[i >> 3] >> (i & 7)) & 1 ? found[next++] : undefined;
+        return out;
+    }
+
+    function values(desc: Column, count: number): any[] {
+        switch (desc.t) {
+            case "z":
+                return new Array(count).fill(null);
+            case "b":
+                return Array.from(typed("u", 1, desc.o!, count), (v) => v != 0);
+            case "i":
+                return Array.from(typed("i", desc.w!, desc.o!, count));
+            case "f":
+                return Array.from(typed("f", desc.w!, desc.o!, count));
+            case "s":
+                return Array.from(typed("u", desc.w!, desc.o!, count), (v) => strings[v]);
+            case "j":
+                return Array.from(typed("u", desc.w!, desc.o!, count), (v) => JSON.parse(strings[v]));
+            case "l": {
+                const lengths = typed("u", desc.w!, desc.o!, count);
+                const items = values(desc.v!, sum(lengths));
+                const out = new Array(count);
+                let next = 0;
+                for (let i = 0; i < count; i++) {
+                    out[i] = items.slice(next, next + lengths[i]);
+                    next += lengths[i];
+                }
+                return out;
+            }
+            case "m": {
+                const lengths = typed("u", desc.w!, desc.o!, count);
+                const total = sum(lengths);
+                const keys = values(desc.k!, total);
+                const items = values(desc.v!, total);
+                const out = new Array(count);
+                let next = 0;
+                for (let i = 0; i < count; i++) {
+                    const obj: { [key: string]: any } = {};
+                    for (let j = 0; j < lengths[i]; j++, next++)
+                        obj[keys[next]] = items[next];
+                    out[i] = obj;
+                }
+                return out;
+            }
+        }
+    }
+
+    const out: { [name: string]: any[] } = {};
+    for (const name in header.datasets) {
+        const dataset = header.datasets[name];
+        const records: { [key: string]: any }[] = [];
+        for (let i = 0; i < dataset.n; i++)
+            records.push({});
+        for (const [key, desc] of dataset.c) {
+            const col = column(desc, dataset.n);
+            for (let i = 0; i < dataset.n; i++)
+                if (col[i] !== undefined)
+                    records[i][key] = col[i];
+        }
+        out[name] = records;
+    }
+    return out;
+}
@@ -1,7 +1,7 @@
-import { adulthoods } from "../data/adulthoods";
-import { childhoods } from "../data/childhoods";
-import { genes } from "../data/genes";
-import { traits } from "../data/traits";
+import { adulthoodIndex } from "../data/adulthoods";
+import { childhoodIndex } from "../data/childhoods";
+import { geneIndex } from "../data/genes";
+import { traits, traitIndex } from "../data/traits";
 import xml from "xml";
 
 function pickRandom<T>(list: T[]): T {
@@ -17,6 +17,11 @@ function inRange(num: number, min: number, max: number): boolean {
     return min <= num && num <= max;
 }
 
+/** Whether name is one of the names in a name -> position index from data/ */
+function hasName(index: { [name: string]: number }, name: string): boolean {
+    return Object.prototype.hasOwnProperty.call(index, name);
+}
+
 export class RGBA {
     R: number;
     G: number;
@@ -44,8 +49,8 @@ export class Genotype {
         let base = new Genotype();
         return Object.keys(gt).every((key) => key in base) &&
             typeof gt.xenotype === "string" &&
-            isStringArray(gt.endogenes) && gt.endogenes.every((geneName: string) => genes.some((gene) => gene.name === geneName)) &&
-            isStringArray(gt.xenogenes) && gt.xenogenes.every((geneName: string) => genes.some((gene) => gene.name === geneName));
+            isStringArray(gt.endogenes) && gt.endogenes.every((geneName: string) => hasName(geneIndex.byName, geneName)) &&
+            isStringArray(gt.xenogenes) && gt.xenogenes.every((geneName: string) => hasName(geneIndex.byName, geneName));
     }
 }
 
@@ -125,8 +130,8 @@ export class Pawn {
             typeof pawn.lastName === "string" &&
             typeof pawn.tickAgeBio === "number" && pawn.tickAgeBio >= 18 * 3600000 &&
             typeof pawn.tickAgeChron === "number" && pawn.tickAgeChron >= pawn.tickAgeBio &&
-            typeof pawn.childhood === "string" && childhoods.some((ch) => ch.name === pawn.childhood) &&
-            typeof pawn.adulthood === "string" && adulthoods.some((ah) => ah.name === pawn.adulthood) &&
+            typeof pawn.childhood === "string" && hasName(childhoodIndex, pawn.childhood) &&
+            typeof pawn.adulthood === "string" && hasName(adulthoodIndex, pawn.adulthood) &&
             (pawn.gender === "Male" || pawn.gender === "Female") &&
             typeof pawn.bodyType === "string" &&
             typeof pawn.headType === "string" &&
@@ -144,7 +149,7 @@ export class Pawn {
             Object.keys(pawn.traits).every((key) => typeof key === "string" &&
                 typeof pawn.traits[key] === "number" &&
                 Number.isInteger(pawn.traits[key]) &&
-                traits.some((trait) => key === trait.name && pawn.traits[key].toString() in trait.degrees)
+                hasName(traitIndex, key) && pawn.traits[key].toString() in traits[traitIndex[key]].degrees
             );
     }
 }
@@ -273,7 +278,7 @@ export class Ruleset {
             typeof rules.maxFlames === "number" &&
             typeof rules.maxSkillAlloc === "number" &&
             rules.maxComplexity >= 0 &&
-            rules.bannedGenes.every((geneName: string) => genes.some((gene) => gene.name === geneName)) &&
+            rules.bannedGenes.every((geneName: string) => hasName(geneIndex.byName, geneName)) &&
             // rules.bannedTraits.every((traitName: string) => traits.some((trait) => trait.name === traitName)) &&
             rules.maxFlames >= 0 &&
             rules.maxSkillAlloc >= 0;
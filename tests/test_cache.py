@@ -0,0 +1,130 @@
+# Checks that builds reusing the build cache give the same output as builds without it:
+#   python -m pytest tests
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List
+from xml.etree import ElementTree as ET
+import pytest
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+import cache  # noqa: E402
+import defs  # noqa: E402
+import graphics  # noqa: E402
+from defs import extractor, runExtractors  # noqa: E402
+
+parentsXml = """<Defs>
+  <ThingDef Name="BaseThing" Abstract="True"><label>base</label><stackLimit>{}</stackLimit></ThingDef>
+</Defs>"""
+thingsXml = """<Defs>
+  <ThingDef ParentName="BaseThing"><defName>Steel</defName></ThingDef>
+  <ThingDef ParentName="BaseThing"><defName>Wood</defName><label>{}</label></ThingDef>
+  <GeneDef><defName>Ignored</defName></GeneDef>
+</Defs>"""
+
+
+class thingExtractor(extractor):
+    name = "things"
+    tags = ["ThingDef"]
+
+    def __init__(self):
+        self.written: List[Dict[str, List[dict]]] = []
+
+    def extract(self, bdef: ET.Element):
+        return "things", {"name": bdef.findtext("defName"), "label": bdef.findtext("label"), "stackLimit": bdef.findtext("stackLimit")}
+
+    def write(self, records: Dict[str, List[dict]]):
+        self.written.append(records)
+
+
+@pytest.fixture
+def build(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Writes the Defs, then builds them without the cache and with it, counting the files read with it"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "Defs").mkdir()
+    reads: List[Path] = []
+    readDefFileCompact = defs.readDefFileCompact
+
+    def counted(filePath, handlers):
+        reads.append(filePath)
+        return readDefFileCompact(filePath, handlers)
+
+    monkeypatch.setattr(defs, "readDefFileCompact", counted)
+
+    def run(stackLimit: str = "75", label: str = "wood"):
+        for name, content in (("Parents.xml", parentsXml.format(stackLimit)), ("Things.xml", thingsXml.format(label))):
+            path = tmp_path / "Defs" / name
+            if not path.is_file() or path.read_text() != content:
+                path.write_text(content)
+                # Coarse filesystem timestamps would otherwise let a rewrite keep its mtime
+                st = path.stat()
+                os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        outputs = []
+        for enabled in (False, True):
+            monkeypatch.setattr(cache, "enabled", enabled)
+            e = thingExtractor()
+            reads.clear()
+            runExtractors("Defs", [e])
+            outputs.append(e.written)
+        assert outputs[0] == outputs[1]
+        return outputs[1][0]["things"], sorted(p.name for p in reads)
+
+    return run
+
+
+def test_warm_and_incremental_builds(build):
+    things, reads = build()
+    assert things == [{"name": "Steel", "label": "base", "stackLimit": "75"}, {"name": "Wood", "label": "wood", "stackLimit": "75"}]
+    assert reads == ["Parents.xml", "Things.xml"]
+    # Warm
+    assert build() == (things, [])
+    # A changed file is the only one read again
+    things, reads = build(label="oak")
+    assert things[1]["label"] == "oak" and reads == ["Things.xml"]
+    # A changed parent reaches the Defs inheriting from it in other files, which weren't read again
+    things, reads = build(stackLimit="150", label="oak")
+    assert [t["stackLimit"] for t in things] == ["150", "150"] and reads == ["Parents.xml"]
+    # Touching a file without changing it keeps its cached results
+    os.utime(Path("Defs/Things.xml"), ns=(0, Path("Defs/Things.xml").stat().st_mtime_ns + 10 ** 9))
+    assert build(stackLimit="150", label="oak")[1] == []
+
+
+def test_script_version_change(build, monkeypatch: pytest.MonkeyPatch):
+    things, _ = build()
+    assert build() == (things, [])
+    # Changing any script throws every cached result away
+    monkeypatch.setattr(cache, "codeVersion", lambda: "changed")
+    assert build() == (things, ["Parents.xml", "Things.xml"])
+    assert build() == (things, [])
+
+
+def test_cached_atlas_matches_uncached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    textures = tmp_path / "Textures" / "Things"
+    textures.mkdir(parents=True)
+    (tmp_path / "docs").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    def draw(name: str, color):
+        Image.new("RGBA", (8, 8), color).save(textures / f"{name}.png")
+        st = (textures / f"{name}.png").stat()
+        os.utime(textures / f"{name}.png", ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+    def atlas(enabled: bool):
+        monkeypatch.setattr(cache, "enabled", enabled)
+        graphics.forgetTextures()
+        sprites = graphics.loadGraphics(str(tmp_path / "Textures"), (8, 8), ["A", "B", "C"], "test.png", downscales=(2,))
+        return sprites, (tmp_path / "docs" / "test.png").read_bytes(), (tmp_path / "docs" / "test.atlas.json").read_text()
+
+    for name, color in (("A", (255, 0, 0, 255)), ("B", (0, 255, 0, 255)), ("C", (0, 0, 255, 255))):
+        draw(name, color)
+    uncached = atlas(False)
+    assert atlas(True) == uncached
+    # Warm
+    assert atlas(True) == uncached
+    # Incremental, with B now sharing A's cell
+    draw("B", (255, 0, 0, 255))
+    incremental = atlas(True)
+    assert incremental == atlas(False) and incremental != uncached
+    monkeypatch.setattr(cache, "codeVersion", lambda: "changed")
+    assert atlas(True) == incremental
@@ -0,0 +1,67 @@
+# Checks the atlas packing and that textures with the same pixels share a sprite:
+#   python -m pytest tests
+import random
+import sys
+from pathlib import Path
+import pytest
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+import cache  # noqa: E402
+import graphics  # noqa: E402
+from graphics import packRects  # noqa: E402
+
+
+def overlaps(a, b) -> bool:
+    (ax, ay, aw, ah), (bx, by, bw, bh) = a, b
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+def checkPacking(rects, maxSize: int):
+    placements, pageSizes = packRects(rects, maxSize)
+    assert set(placements) == set(key for key, _, _ in rects)
+    onPage = {}
+    for key, w, h in rects:
+        page, x, y = placements[key]
+        assert 0 <= x and x + w <= pageSizes[page][0] <= maxSize
+        assert 0 <= y and y + h <= pageSizes[page][1] <= maxSize
+        onPage.setdefault(page, []).append((x, y, w, h))
+    for boxes in onPage.values():
+        assert not any(overlaps(a, b) for i, a in enumerate(boxes) for b in boxes[i + 1:])
+    return placements, pageSizes
+
+
+def test_pack_rects_without_overlaps():
+    rng = random.Random(3)
+    for _ in range(50):
+        rects = [(f"r{i}", rng.randint(1, 40), rng.randint(1, 40)) for i in range(rng.randint(1, 60))]
+        checkPacking(rects, 128)
+
+
+def test_pack_rects_spills_onto_new_pages():
+    placements, pageSizes = checkPacking([(f"r{i}", 64, 64) for i in range(9)], 128)
+    # Four fit on a page
+    assert len(pageSizes) == 3 and sorted(p for p, _, _ in placements.values()) == [0] * 4 + [1] * 4 + [2]
+    # A small rectangle goes back onto an earlier page with room, not a new one
+    placements, pageSizes = checkPacking([("big", 128, 100), ("wide", 128, 50), ("small", 20, 20)], 128)
+    assert len(pageSizes) == 2 and placements["small"][0] == 0
+    with pytest.raises(AssertionError):
+        packRects([("huge", 129, 1)], 128)
+
+
+def test_same_pixels_share_a_sprite(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    textures = tmp_path / "Textures" / "Things"
+    textures.mkdir(parents=True)
+    for name, color in (("A", (255, 0, 0, 255)), ("B", (255, 0, 0, 255)), ("C", (0, 0, 255, 255))):
+        Image.new("RGBA", (8, 8), color).save(textures / f"{name}.png")
+    (tmp_path / "docs").mkdir()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cache, "enabled", False)
+    graphics.forgetTextures()
+    sprites = graphics.loadGraphics(str(tmp_path / "Textures"), (8, 8), ["A", "B", "C", "Missing"], "test.png")
+    assert set(sprites) == {"A", "B", "C"}
+    assert sprites["A"] == sprites["B"] and sprites["A"] != sprites["C"]
+    page = Image.open(tmp_path / "docs" / "test.png")
+    # Two cells, not three
+    assert page.width * page.height == 2 * 8 * 8
+    assert page.getpixel((sprites["C"]["x"], sprites["C"]["y"])) == (0, 0, 255, 255)
@@ -0,0 +1,155 @@
+# Checks the XPath evaluator and the PatchOperations against small Def documents:
+#   python -m pytest tests
+import sys
+from pathlib import Path
+from typing import List
+from xml.etree import ElementTree as ET
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+import patches  # noqa: E402
+import xpath  # noqa: E402
+from patches import defDocument, patchContext, runOperation  # noqa: E402
+
+defsXml = """<Defs>
+  <GeneDef Name="GeneBase" Abstract="True"><displayCategory>Misc</displayCategory></GeneDef>
+  <GeneDef ParentName="GeneBase"><defName>A</defName><label>a</label><statOffsets><Pain>1</Pain></statOffsets></GeneDef>
+  <GeneDef><defName>B</defName><label>b</label><exclusionTags><li>X</li><li>Y</li></exclusionTags></GeneDef>
+  <ThingDef><defName>Steel</defName><label>steel</label><stackLimit>75</stackLimit></ThingDef>
+</Defs>"""
+
+
+def makeDocument(patched=None) -> defDocument:
+    document = defDocument(["GeneDef"], patched)
+    for bdef in ET.fromstring(defsXml):
+        document.add(bdef, "Genes.xml")
+    return document
+
+
+def run(document: defDocument, operation: str, mods=()) -> bool:
+    return runOperation(ET.fromstring(operation), patchContext(document, set(mods), set()))
+
+
+def texts(document: defDocument, path: str) -> List[str]:
+    return [n.value() for n in document.select(path)]
+
+
+def test_xpath_predicates():
+    root = ET.fromstring(defsXml)
+    doc = xpath.document(root)
+    assert [n.elem.findtext("label") for n in xpath.select('/Defs/GeneDef[defName="B"]', doc)] == ["b"]
+    assert [n.elem.get("Name") for n in xpath.select('/Defs/GeneDef[@Name="GeneBase"]', doc)] == ["GeneBase"]
+    assert [n.value() for n in xpath.select("/Defs/*[defName='Steel']/@Name", doc)] == []
+    assert [n.value() for n in xpath.select('//li[text()="Y"]', doc)] == ["Y"]
+    assert [n.value() for n in xpath.select("/Defs/GeneDef[defName='A' or defName='B']/label", doc)] == ["a", "b"]
+    assert len(xpath.select("/Defs/GeneDef[not(defName)]", doc)) == 1
+    with pytest.raises(xpath.XPathError):
+        xpath.select("/Defs/GeneDef[", doc)
+
+
+def test_indexed_lookups_match_plain_evaluation():
+    document = makeDocument()
+    plain = xpath.document(ET.fromstring(defsXml))
+    for path in ['/Defs/GeneDef[defName="A"]/label', 'Defs/*[defName="B"]/label', '/Defs/GeneDef[@Name="GeneBase"]/displayCategory']:
+        assert texts(document, path) == [n.value() for n in xpath.select(path, plain)]
+
+
+def test_add_insert_remove_replace():
+    document = makeDocument()
+    assert run(document, '<Operation Class="PatchOperationAdd"><xpath>/Defs/GeneDef[defName="A"]/statOffsets</xpath>'
+                         '<value><Hunger>2</Hunger></value></Operation>')
+    assert texts(document, '/Defs/GeneDef[defName="A"]/statOffsets/*') == ["1", "2"]
+    assert run(document, '<Operation Class="PatchOperationAdd"><xpath>/Defs/GeneDef[defName="A"]/statOffsets</xpath>'
+                         '<order>Prepend</order><value><Sleep>0</Sleep></value></Operation>')
+    assert [n.elem.tag for n in document.select('/Defs/GeneDef[defName="A"]/statOffsets/*')] == ["Sleep", "Pain", "Hunger"]
+    assert run(document, '<Operation Class="PatchOperationInsert"><xpath>/Defs/GeneDef[defName="B"]/exclusionTags/li[.="Y"]</xpath>'
+                         '<value><li>W</li></value></Operation>')
+    assert texts(document, '/Defs/GeneDef[defName="B"]/exclusionTags/li') == ["X", "W", "Y"]
+    assert run(document, '<Operation Class="PatchOperationRemove"><xpath>/Defs/GeneDef[defName="B"]/exclusionTags/li[.="X"]</xpath></Operation>')
+    assert texts(document, '/Defs/GeneDef[defName="B"]/exclusionTags/li') == ["W", "Y"]
+    assert run(document, '<Operation Class="PatchOperationReplace"><xpath>/Defs/GeneDef[defName="B"]/label</xpath>'
+                         '<value><label>bee</label></value></Operation>')
+    assert texts(document, '/Defs/GeneDef[defName="B"]/label') == ["bee"]
+    # Renaming a Def through its defName is picked up by the index
+    assert run(document, '<Operation Class="PatchOperationReplace"><xpath>/Defs/GeneDef[defName="B"]/defName/text()</xpath>'
+                         '<value>C</value></Operation>')
+    assert texts(document, '/Defs/GeneDef[defName="C"]/label') == ["bee"] and texts(document, '/Defs/GeneDef[defName="B"]') == []
+    assert not run(document, '<Operation Class="PatchOperationRemove"><xpath>/Defs/GeneDef[defName="Missing"]</xpath></Operation>')
+
+
+def test_conditional_and_sequence():
+    document = makeDocument()
+    add = '<{0} Class="PatchOperationAdd"><xpath>/Defs/GeneDef[defName="A"]</xpath><value><{1}/></value></{0}>'
+    assert run(document, '<Operation Class="PatchOperationConditional"><xpath>/Defs/GeneDef[defName="A"]</xpath>'
+                         + add.format("match", "matched") + add.format("nomatch", "unmatched") + '</Operation>')
+    assert document.select('/Defs/GeneDef[defName="A"]/matched') and not document.select('/Defs/GeneDef[defName="A"]/unmatched')
+    # As in the game, a conditional without the branch it would take succeeds, and one without either branch fails
+    assert run(document, '<Operation Class="PatchOperationConditional"><xpath>/Defs/GeneDef[defName="Z"]</xpath>'
+                         + add.format("match", "x") + '</Operation>')
+    assert not run(document, '<Operation Class="PatchOperationConditional"><xpath>/Defs/GeneDef[defName="A"]</xpath></Operation>')
+    # A failing branch fails the conditional
+    assert not run(document, '<Operation Class="PatchOperationConditional"><xpath>/Defs/GeneDef[defName="A"]</xpath>'
+                             '<match Class="PatchOperationRemove"><xpath>/Defs/GeneDef[defName="Z"]</xpath></match></Operation>')
+    # A sequence stops at its first failed step and fails; steps before it stay applied
+    assert not run(document, '<Operation Class="PatchOperationSequence"><operations>' + add.format("li", "first") +
+                   '<li Class="PatchOperationRemove"><xpath>/Defs/GeneDef[defName="Z"]</xpath></li>' + add.format("li", "third") +
+                   '</operations></Operation>')
+    assert document.select('/Defs/GeneDef[defName="A"]/first') and not document.select('/Defs/GeneDef[defName="A"]/third')
+    # success overrides the result
+    assert run(document, '<Operation Class="PatchOperationRemove"><xpath>/Defs/GeneDef[defName="Z"]</xpath><success>Always</success></Operation>')
+    assert run(document, '<Operation Class="PatchOperationRemove"><xpath>/Defs/GeneDef[defName="Z"]</xpath><success>Invert</success></Operation>')
+
+
+def test_find_mod():
+    document = makeDocument()
+    findMod = ('<Operation Class="PatchOperationFindMod"><mods><li>Mod B</li></mods>'
+               '<match Class="PatchOperationAdd"><xpath>/Defs/GeneDef[defName="A"]</xpath><value><withB/></value></match>'
+               '<nomatch Class="PatchOperationAdd"><xpath>/Defs/GeneDef[defName="A"]</xpath><value><withoutB/></value></nomatch></Operation>')
+    assert run(document, findMod, mods=["Mod A"])
+    assert run(document, findMod, mods=["Mod B"])
+    assert len(document.select('/Defs/GeneDef[defName="A"]/withoutB')) == 1
+    assert len(document.select('/Defs/GeneDef[defName="A"]/withB')) == 1
+
+
+def test_unwanted_defs_are_only_cut_down_if_no_patch_reaches_them():
+    assert texts(makeDocument(set()), '/Defs/ThingDef[defName="Steel"]/stackLimit') == []
+    assert texts(makeDocument({"Defs", "ThingDef", "defName", "stackLimit"}), '/Defs/ThingDef[defName="Steel"]/stackLimit') == ["75"]
+    assert texts(makeDocument(None), '/Defs/ThingDef[defName="Steel"]/stackLimit') == ["75"]
+
+
+def writeMod(directory: Path, folder: str, name: str, packageId: str, patch: str):
+    (directory / folder / "About").mkdir(parents=True)
+    (directory / folder / "About" / "About.xml").write_text(
+        f"<ModMetaData><name>{name}</name><packageId>{packageId}</packageId></ModMetaData>")
+    (directory / folder / "Patches").mkdir()
+    (directory / folder / "Patches" / "Patch.xml").write_text(f"<Patch>{patch}</Patch>")
+
+
+def test_apply_patches(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture):
+    label = '<Operation Class="PatchOperationReplace"><xpath>/Defs/GeneDef[defName="A"]/label/text()</xpath><value>{}</value></Operation>'
+    writeMod(tmp_path, "ModA", "Mod A", "test.moda", label.format("from A"))
+    writeMod(tmp_path, "ModB", "Mod B", "test.modb", label.format("from B") +
+             '<Operation Class="PatchOperationRemove"><xpath>/Defs/GeneDef[defName="Missing"]</xpath></Operation>')
+    files = sorted(tmp_path.rglob("Patch.xml"))
+    config = tmp_path / "ModsConfig.xml"
+
+    monkeypatch.setattr(patches, "loadOrder", None)
+    document = makeDocument()
+    patches.applyPatches(document, str(tmp_path), files)
+    assert texts(document, '/Defs/GeneDef[defName="A"]/label') == ["from B"]
+    # Failed operations are reported together
+    assert "1 patch operations failed" in capsys.readouterr().err
+
+    # Mods run in the load order, and mods it doesn't have don't run at all
+    config.write_text("<ModsConfigData><activeMods><li>test.modb</li><li>test.moda</li></activeMods></ModsConfigData>")
+    monkeypatch.setattr(patches, "loadOrder", str(config))
+    document = makeDocument()
+    patches.applyPatches(document, str(tmp_path), files)
+    assert texts(document, '/Defs/GeneDef[defName="A"]/label') == ["from A"]
+    capsys.readouterr()
+    config.write_text("<ModsConfigData><activeMods><li>test.moda</li></activeMods></ModsConfigData>")
+    document = makeDocument()
+    patches.applyPatches(document, str(tmp_path), files)
+    assert texts(document, '/Defs/GeneDef[defName="A"]/label') == ["from A"]
+    assert "failed" not in capsys.readouterr().err
+    assert patches.activeFiles(str(tmp_path), files) == [tmp_path / "ModA" / "Patches" / "Patch.xml"]
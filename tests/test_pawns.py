@@ -0,0 +1,61 @@
+# Checks that sampled pawns pass the worker's checks, Pawn.validate in src/structures.ts, rule for rule:
+#   python -m pytest tests
+import sys
+from pathlib import Path
+import pytest
+
+root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(root / "scripts"))
+from indexes import readTS  # noqa: E402
+from pawns import pawnSampler, skillNames  # noqa: E402
+
+data = root / "data"
+pawnKeys = {"id", "firstName", "nickName", "lastName", "tickAgeBio", "tickAgeChron", "childhood", "adulthood", "gender",
+            "bodyType", "headType", "hair", "hairColor", "beard", "faceTattoo", "bodyTattoo", "skinColor", "melanin",
+            "favoriteColor", "genotype", "skills", "traits"}
+
+
+def isNumber(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def validRGBA(rgba) -> bool:
+    return isinstance(rgba, dict) and all(k in "RGBA" and isNumber(v) for k, v in rgba.items()) and \
+        all(0 <= rgba.get(c, -1) <= 255 for c in "RGB") and 0 <= rgba.get("A", -1) <= 1
+
+
+def validSkills(skills) -> bool:
+    return all(k in skillNames and isNumber(v) and 0 <= v <= 20 or
+               k.endswith("Flames") and k[:-len("Flames")] in skillNames and isNumber(v) and 0 <= v <= 2
+               for k, v in skills.items())
+
+
+def validPawn(pawn: dict, childhoodIndex: dict, adulthoodIndex: dict, geneIndex: dict, traits: list, traitIndex: dict) -> bool:
+    strings = ["id", "firstName", "nickName", "lastName", "bodyType", "headType", "hair", "beard", "faceTattoo", "bodyTattoo"]
+    genotype = pawn.get("genotype")
+    return set(pawn) <= pawnKeys and \
+        all(isinstance(pawn.get(k), str) for k in strings) and \
+        isNumber(pawn.get("tickAgeBio")) and pawn["tickAgeBio"] >= 18 * 3600000 and \
+        isNumber(pawn.get("tickAgeChron")) and pawn["tickAgeChron"] >= pawn["tickAgeBio"] and \
+        pawn.get("childhood") in childhoodIndex and pawn.get("adulthood") in adulthoodIndex and \
+        pawn.get("gender") in ("Male", "Female") and \
+        validRGBA(pawn.get("hairColor")) and validRGBA(pawn.get("skinColor")) and validRGBA(pawn.get("favoriteColor")) and \
+        isNumber(pawn.get("melanin")) and 0 <= pawn["melanin"] <= 1 and \
+        isinstance(genotype, dict) and set(genotype) <= {"xenotype", "endogenes", "xenogenes"} and \
+        isinstance(genotype.get("xenotype"), str) and \
+        all(isinstance(genotype.get(k), list) and all(g in geneIndex["byName"] for g in genotype[k]) for k in ("endogenes", "xenogenes")) and \
+        isinstance(pawn.get("skills"), dict) and validSkills(pawn["skills"]) and \
+        isinstance(pawn.get("traits"), dict) and \
+        all(isinstance(d, int) and t in traitIndex and str(d) in traits[traitIndex[t]]["degrees"] for t, d in pawn["traits"].items())
+
+
+@pytest.mark.skipif(not (data / "bodyparts.ts").is_file(), reason="no exported data")
+def test_sampled_pawns_validate():
+    sampler = pawnSampler.fromData(data)
+    checks = (readTS(data / "childhoods.ts", "childhoodIndex"), readTS(data / "adulthoods.ts", "adulthoodIndex"),
+              readTS(data / "genes.ts", "geneIndex"), readTS(data / "traits.ts", "traits"), readTS(data / "traits.ts", "traitIndex"))
+    pawns = sampler.sample(2000, seed=7).pawns()
+    assert all(validPawn(p, *checks) for p in pawns)
+    # Every field the editor sends, so the worker stores complete pawns
+    assert all(set(p) == pawnKeys for p in pawns)
+    assert any(p["headType"] for p in pawns) and any(any(p["skills"][s] for s in skillNames) for p in pawns)
@@ -0,0 +1,27 @@
+# Checks which trait degrees the exported conflict bitsets mark as conflicting:
+#   python -m pytest tests
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from pawns import unpackConflicts  # noqa: E402
+from traits import conflictTable  # noqa: E402
+
+
+def trait(name: str, conflicting=(), tags=(), degrees=("0",)) -> dict:
+    return {"name": name, "conflictingTraits": list(conflicting), "exclusionTags": list(tags),
+            "degrees": dict((d, {}) for d in degrees)}
+
+
+def conflicting(traits: list) -> set:
+    table = conflictTable(traits)
+    m = unpackConflicts(table["rows"], len(table["keys"]))
+    keys = table["keys"]
+    return set((keys[i], keys[j]) for i in range(len(keys)) for j in range(len(keys)) if m[i, j] and i < j)
+
+
+def test_conflicts():
+    traits = [trait("Brawler", ["Wimp"]), trait("Masochist", ["Wimp"]), trait("Wimp"),
+              trait("Tough", tags=["Toughness"]), trait("Delicate", tags=["Toughness"]), trait("Nerves", degrees=("-1", "1"))]
+    assert conflicting(traits) == {("Brawler:0", "Wimp:0"), ("Masochist:0", "Wimp:0"),
+                                   ("Tough:0", "Delicate:0"), ("Nerves:-1", "Nerves:1")}
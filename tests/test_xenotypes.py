@@ -0,0 +1,51 @@
+# Checks the xenotype search's pruning against brute force on small random gene sets:
+#   python -m pytest tests
+import itertools
+import random
+import sys
+import warnings
+from pathlib import Path
+from typing import List, Optional
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from xenotypes import geneMatrix, xenotypeSearch  # noqa: E402
+
+weights = {"statOffsets:S": 1}
+
+
+def randomGenes(rng: random.Random, tags: List[str]) -> List[dict]:
+    return [{"name": f"G{i}", "metabolism": rng.randint(-3, 3), "complexity": rng.randint(0, 4),
+             "exclusionTags": rng.sample(tags, rng.randint(0, min(1, len(tags)))),
+             "statOffsets": {"S": round(rng.uniform(-1, 2), 3)}} for i in range(rng.randint(3, 9))]
+
+
+def bruteForce(matrix: geneMatrix, minMetabolism: float, maxComplexity: float, maxGenes: Optional[int]) -> Optional[float]:
+    """The best score of any allowed set of genes"""
+    scores = matrix.scores(weights)
+    n = len(scores)
+    best = None
+    for k in range(1, (maxGenes or n) + 1):
+        for c in itertools.combinations(range(n), k):
+            i = list(c)
+            if matrix.conflicts[np.ix_(i, i)].any():
+                continue
+            if matrix.metabolism[i].sum() < minMetabolism or matrix.complexity[i].sum() > maxComplexity:
+                continue
+            best = max(best if best is not None else -np.inf, float(scores[i].sum()))
+    return best
+
+
+@pytest.mark.parametrize("tags", [["A", "B", "C"], []])
+def test_search_matches_brute_force(tags: List[str]):
+    rng = random.Random(1)
+    for _ in range(200):
+        matrix = geneMatrix(randomGenes(rng, tags))
+        rules = dict(minMetabolism=rng.choice([-3, 0, 1]), maxComplexity=rng.choice([2, 4, 6]), maxGenes=rng.choice([None, 2, 3]))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            found = xenotypeSearch(matrix, weights, **rules).search()
+        best = bruteForce(matrix, **rules)
+        if best is not None and best > 0:
+            assert found and found[0].score == pytest.approx(best), rules